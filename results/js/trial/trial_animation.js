@@ -12,22 +12,106 @@
   };
 
 
+  /**
+   * Decodes the compact columnar frames layout of the trial report, which
+   * stores one column of values per field path in the shared key table,
+   * into a typed array for each field
+   *
+   * @param frames
+   * @returns {{count: number, labels: Array, fields: Array, columns: {}}}
+   */
+  function decodeFrames(frames) {
+    var out = {
+      count: frames.count,
+      labels: frames.labels,
+      fields: [],
+      columns: {}
+    };
+
+    frames.keys.forEach(function (key, index) {
+      var i, total, values;
+      var type = frames.types[index];
+      var source = frames.columns[index];
+
+      if (type === 'label') {
+        values = new Uint16Array(source);
+      } else if (type === 'delta') {
+        values = new Float64Array(source.length);
+        total = 0;
+        for (i = 0; i < source.length; i++) {
+          total += source[i];
+          values[i] = total / frames.scale;
+        }
+      } else {
+        values = new Float64Array(source);
+      }
+
+      out.columns[key] = values;
+      out.fields.push({
+        path: key.split('.').map(function (part) {
+          return /^\d+$/.test(part) ? parseInt(part, 10) : part;
+        }),
+        values: values,
+        labeled: type === 'label'
+      });
+    });
+
+    return out;
+  }
+  exports.decodeFrames = decodeFrames;
+
+
+  /**
+   * Assembles the frame object at the specified index from the decoded
+   * frame columns
+   *
+   * @param index
+   * @returns {{}}
+   */
+  function getFrame(index) {
+    var frame = {};
+    var frames = exports.FRAMES;
+
+    frames.fields.forEach(function (field) {
+      var i, part;
+      var target = frame;
+      var value = field.values[index];
+
+      for (i = 0; i < field.path.length - 1; i++) {
+        part = field.path[i];
+        if (!target[part]) {
+          target[part] = typeof field.path[i + 1] === 'number' ? [] : {};
+        }
+        target = target[part];
+      }
+
+      target[field.path[i]] = field.labeled ? frames.labels[value] : value;
+    });
+
+    return frame;
+  }
+  exports.getFrame = getFrame;
+
+
   /**
    *
    */
   function drawMidline() {
+    var x = exports.FRAMES.columns['midpoint.x.2'];
+    var y = exports.FRAMES.columns['midpoint.y.2'];
+
     var lineMaker = d3.svg.line()
-      .x(function (frame) {
-        return exports.DATA.scale * frame.midpoint.x[2];
+      .x(function (index) {
+        return exports.DATA.scale * x[index];
       })
-      .y(function (frame) {
-        return -exports.DATA.scale * frame.midpoint.y[2];
+      .y(function (index) {
+        return -exports.DATA.scale * y[index];
       })
       .interpolate('linear');
 
     d3.select($('.svg-box svg')[0])
       .append('path')
-      .attr('d', lineMaker(exports.DATA.frames))
+      .attr('d', lineMaker(d3.range(exports.FRAMES.count)))
       .style('stroke', 'rgba(0, 0, 0, 0.1)')
       .style('stroke-dasharray', '4,3')
       .style('stroke-width', '2')
@@ -211,7 +295,7 @@
   function onEnterFrame() {
     var i, interpValue;
     var keys = exports.DATA.markerIds;
-    var frame = exports.DATA.frames[exports.animation.frameIndex];
+    var frame = exports.getFrame(exports.animation.frameIndex);
     var progressBar = $('.progress-bar');
 
     var progress = 100.0 * exports.animation.frameIndex / (
@@ -19,7 +19,7 @@
      *
      */
     function updateStatusDisplay() {
-        var frame = exports.DATA.frames[exports.animation.frameIndex];
+        var frame = exports.getFrame(exports.animation.frameIndex);
 
         exports.DATA.markerIds.forEach(function (key, index) {
             var data = frame.positions[index],
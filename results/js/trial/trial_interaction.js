@@ -32,7 +32,7 @@
 
   function saveSvg() {
     var wasPaused = exports.animation.paused;
-    var frame = exports.DATA.frames[exports.animation.frameIndex];
+    var frame = exports.getFrame(exports.animation.frameIndex);
 
     exports.animation.paused = true;
 
@@ -14,6 +14,7 @@
 
         return exports.loadDataFile(filename)
             .then(function (data) {
+              exports.FRAMES = exports.decodeFrames(data.frames);
 
               $('title').html($('.header-title').html());
 
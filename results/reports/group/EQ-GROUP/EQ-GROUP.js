@@ -0,0 +1,5 @@
+(function () {
+
+    window.SIM_DATA = {"data": {}, "body": "<div class=\"top-box\">\n  <div class=\"group-info\">\n    <div class=\"title\">EQ-GROUP</div>\n    <div class=\"date\"><span class=\"label\">Run At:</span> 10-18-2026 11:55</div>\n    <div class=\"summary\">None</div>\n  </div>\n\n  <div class=\"trial-listings-wrapper \">\n    <div class=\"trial-listings\">\n      \n        <div class=\"entry\"\n             style=\"background-color: rgba(31, 119, 180, 1.0)\"\n             onclick=\"window.SIM.onTrialClick('EQ-A')\">\n          <div class=\"entry-inner\">\n            <div class=\"title\">1. EQ-A</div>\n            <div class=\"summary\">A test run to verify that the simulation system works.</div>\n          </div>\n        </div>\n      \n        <div class=\"entry\"\n             style=\"background-color: rgba(255, 127, 14, 1.0)\"\n             onclick=\"window.SIM.onTrialClick('EQ-B')\">\n          <div class=\"entry-inner\">\n            <div class=\"title\">2. EQ-B</div>\n            <div class=\"summary\">other</div>\n          </div>\n        </div>\n      \n        <div class=\"entry\"\n             style=\"background-color: rgba(44, 160, 44, 1.0)\"\n             onclick=\"window.SIM.onTrialClick('EQ-C')\">\n          <div class=\"entry-inner\">\n            <div class=\"title\">3. EQ-C</div>\n            <div class=\"summary\">A test run to verify that the simulation system works.</div>\n          </div>\n        </div>\n      \n        <div class=\"entry\"\n             style=\"background-color: rgba(214, 39, 40, 1.0)\"\n             onclick=\"window.SIM.onTrialClick('EQ-D')\">\n          <div class=\"entry-inner\">\n            <div class=\"title\">4. EQ-D</div>\n            <div class=\"summary\">A test run to verify that the simulation system works.</div>\n          </div>\n        </div>\n      \n    </div>\n  </div>\n\n</div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"63392a7e-7f6a-4ed3-8907-e3d7f971b45e\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"63392a7e-7f6a-4ed3-8907-e3d7f971b45e\")) {\n                    Plotly.newPlot(\n                        '63392a7e-7f6a-4ed3-8907-e3d7f971b45e',\n                        [{\"mode\": \"lines\", \"name\": \"1\", \"type\": \"scatter\", \"uid\": \"6a6e8f88-bff4-423e-8a65-01a4abc472e9\", \"x\": [0.35, 0.350722891566265, 0.35144578313253005, 0.3521686746987951, 0.35289156626506013, 0.35361445783132517, 0.3543373493975902, 0.35506024096385524, 0.3557831325301203, 0.3565060240963853, 0.35722891566265036, 0.3579518072289154, 0.35867469879518044, 0.3593975903614455, 0.3601204819277105, 0.36084337349397555, 0.3615662650602406, 0.3622891566265056, 0.36301204819277066, 0.3637349397590357, 0.36445783132530074, 0.3651807228915658, 0.3659036144578308, 0.36662650602409586, 0.3673493975903609, 0.36807228915662593, 0.36879518072289097, 0.369518072289156, 0.37024096385542105, 0.3709638554216861, 0.3716867469879511, 0.37240963855421616, 0.3731325301204812, 0.37385542168674624, 0.3745783132530113, 0.3753012048192763, 0.37602409638554135, 0.3767469879518064, 0.3774698795180714, 0.37819277108433647, 0.3789156626506015, 0.37963855421686654, 0.3803614457831316, 0.3810843373493966, 0.38180722891566166, 0.3825301204819267, 0.38325301204819173, 0.38397590361445677, 0.3846987951807218, 0.38542168674698685, 0.3861445783132519, 0.3868674698795169, 0.38759036144578196, 0.388313253012047, 0.38903614457831204, 0.3897590361445771, 0.3904819277108421, 0.39120481927710715, 0.3919277108433722, 0.39265060240963723, 0.39337349397590227, 0.3940963855421673, 0.39481927710843234, 0.3955421686746974, 0.3962650602409624, 0.39698795180722746, 0.3977108433734925, 0.39843373493975753, 0.39915662650602257, 0.3998795180722876, 0.40060240963855265, 0.4013253012048177, 0.4020481927710827, 0.40277108433734776, 0.4034939759036128, 0.40421686746987784, 0.4049397590361429, 0.4056626506024079, 0.40638554216867295, 0.407108433734938, 0.40783132530120303, 0.40855421686746807, 0.4092771084337331, 0.40999999999999814, 0.4107228915662632, 0.4114457831325282, 0.41216867469879326, 0.4128915662650583, 0.41361445783132333, 0.4143373493975884, 0.4150602409638534, 0.41578313253011845, 0.4165060240963835, 0.4172289156626485, 0.41795180722891356, 0.4186746987951786, 0.41939759036144364, 0.4201204819277087, 0.4208433734939737, 0.42156626506023875, 0.4222891566265038, 0.42301204819276883, 0.42373493975903387, 0.4244578313252989, 0.42518072289156394, 0.425903614457829, 0.426626506024094, 0.42734939759035906, 0.4280722891566241, 0.42879518072288914, 0.4295180722891542, 0.4302409638554192, 0.43096385542168425, 0.4316867469879493, 0.4324096385542143, 0.43313253012047936, 0.4338554216867444, 0.43457831325300944, 0.4353012048192745, 0.4360240963855395, 0.43674698795180456, 0.4374698795180696, 0.43819277108433463, 0.43891566265059967, 0.4396385542168647, 0.44036144578312975, 0.4410843373493948, 0.4418072289156598, 0.44253012048192486, 0.4432530120481899, 0.44397590361445494, 0.44469879518072, 0.445421686746985, 0.44614457831325005, 0.4468674698795151, 0.4475903614457801, 0.44831325301204517, 0.4490361445783102, 0.44975903614457524, 0.4504819277108403, 0.4512048192771053, 0.45192771084337036, 0.4526506024096354, 0.45337349397590043, 0.45409638554216547, 0.4548192771084305, 0.45554216867469555, 0.4562650602409606, 0.4569879518072256, 0.45771084337349066, 0.4584337349397557, 0.45915662650602074, 0.4598795180722858, 0.4606024096385508, 0.46132530120481585, 0.4620481927710809, 0.46277108433734593, 0.46349397590361097, 0.464216867469876, 0.46493975903614104, 0.4656626506024061, 0.4663855421686711, 0.46710843373493616, 0.4678313253012012, 0.46855421686746623, 0.46927710843373127, 0.4699999999999963, 0.47072289156626135, 0.4714457831325264, 0.4721686746987914, 0.47289156626505646, 0.4736144578313215, 0.47433734939758654, 0.4750602409638516, 0.4757831325301166, 0.47650602409638165, 0.4772289156626467, 0.47795180722891173, 0.47867469879517677, 0.4793975903614418, 0.48012048192770684, 0.4808433734939719, 0.4815662650602369, 0.48228915662650196, 0.483012048192767, 0.48373493975903203, 0.4844578313252971, 0.4851807228915621, 0.48590361445782715, 0.4866265060240922, 0.4873493975903572, 0.48807228915662226, 0.4887951807228873, 0.48951807228915234, 0.4902409638554174, 0.4909638554216824, 0.49168674698794745, 0.4924096385542125, 0.49313253012047753, 0.49385542168674257, 0.4945783132530076, 0.49530120481927264, 0.4960240963855377, 0.4967469879518027, 0.49746987951806776, 0.4981927710843328, 0.49891566265059784, 0.4996385542168629, 0.5003614457831279, 0.501084337349393, 0.501807228915658, 0.502530120481923, 0.5032530120481881, 0.5039759036144531, 0.5046987951807181, 0.5054216867469832, 0.5061445783132482, 0.5068674698795133, 0.5075903614457783, 0.5083132530120433, 0.5090361445783084, 0.5097590361445734, 0.5104819277108384, 0.5112048192771035, 0.5119277108433685, 0.5126506024096336, 0.5133734939758986, 0.5140963855421636, 0.5148192771084287, 0.5155421686746937, 0.5162650602409588, 0.5169879518072238, 0.5177108433734888, 0.5184337349397539, 0.5191566265060189, 0.5198795180722839, 0.520602409638549, 0.521325301204814, 0.5220481927710791, 0.5227710843373441, 0.5234939759036091, 0.5242168674698742, 0.5249397590361392, 0.5256626506024042, 0.5263855421686693, 0.5271084337349343, 0.5278313253011994, 0.5285542168674644, 0.5292771084337294, 0.53], \"y\": [0.12673840992042062, 0.1362115056661605, 0.14630874742766906, 0.15706447996113346, 0.16851443291902232, 0.18069574185172713, 0.19364696709790333, 0.20740811039112222, 0.22202062900975342, 0.23752744729686018, 0.2539729653773142, 0.27140306490027843, 0.2898651116366221, 0.30940795476268007, 0.33008192266396325, 0.3519388150949188, 0.37503189153349104, 0.3994158555720054, 0.425146835188603, 0.45228235874604, 0.4808813265669329, 0.5110039779363891, 0.5427118533842537, 0.5760677520997391, 0.6111356843309207, 0.6479808186202394, 0.686669423724705, 0.7272688050657425, 0.7698472355485105, 0.8144738805839514, 0.8612187171387163, 0.9101524466284562, 0.9613464014587636, 1.014872445005357, 1.0708028648109713, 1.1292102587610977, 1.1901674139842746, 1.2537471782054723, 1.3200223232634514, 1.3890654004852936, 1.4609485875940145, 1.535743526808819, 1.6135211537827934, 1.6943515170102559, 1.7783035873264017, 1.865445057116041, 1.9558421288470267, 2.0495592925482446, 2.1466590918627775, 2.2472018783249923, 2.3512455535367267, 2.4588452989535985, 2.5700532930383844, 2.6849184155955905, 2.803485939170358, 2.925797207476555, 3.051889300913872, 3.1817946893425497, 3.3155408724071473, 3.453150007837959, 3.594638528309987, 3.740016747604629, 3.889288456998064, 4.042450512991587, 4.199492417702288, 4.360395893445747, 4.525134453264469, 4.693672969384619, 4.865967241817009, 5.041963569553816, 5.22159832704733, 5.404797548888198, 5.591476525824902, 5.781539415479983, 5.974878871318479, 6.171375693606062, 6.370898506255026, 6.573303463591281, 6.778433991181602, 6.986120564933198, 7.196180532714161, 7.408417982739958, 7.622623662924549, 7.838574955302765, 8.056035909490394, 8.274757338958446, 8.494476983657114, 8.714919742231926, 8.935797976729898, 9.15681189229748, 9.377649993925942, 9.597989621806201, 9.817497566316009, 10.035830763082075, 10.252637067942079, 10.467556110981702, 10.680220228145476, 10.890255468223897, 11.09728267230923, 11.30091862209706, 11.500777252696611, 11.696470924909221, 11.887611751248926, 12.073812969320416, 12.254690355546314, 12.429863671655708, 12.598958135817735, 12.761605909834701, 12.917447593406825, 13.06613371615089, 13.207326217804248, 13.340699906878744, 13.46594388795002, 13.58276294777958, 13.690878890572167, 13.790031812869886, 13.879981308877188, 13.960507597395862, 14.031412562023691, 14.09252069683093, 14.143679950370302, 14.184762461592596, 14.215665182024456, 14.236310379409732, 14.246646018911722, 14.246646018911761, 14.236310379409854, 14.215665182024651, 14.184762461592872, 14.14367995037066, 14.092520696831361, 14.031412562024196, 13.960507597396445, 13.879981308877843, 13.79003181287061, 13.690878890572963, 13.582762947780447, 13.465943887950951, 13.340699906879738, 13.207326217805303, 13.066133716152004, 12.917447593407998, 12.761605909835923, 12.598958135819013, 12.429863671657031, 12.25469035554768, 12.073812969321827, 11.887611751250375, 11.696470924910708, 11.50077725269813, 11.30091862209861, 11.097282672310808, 10.890255468225496, 10.680220228147101, 10.467556110983342, 10.252637067943738, 10.035830763083748, 9.817497566317693, 9.597989621807892, 9.377649993927635, 9.156811892299178, 8.935797976731596, 8.71491974223362, 8.494476983658805, 8.27475733896013, 8.056035909492067, 7.83857495530443, 7.622623662926202, 7.4084179827415975, 7.196180532715782, 6.986120564934801, 6.7784339911831895, 6.573303463592846, 6.37089850625657, 6.171375693607585, 5.974878871319975, 5.781539415481457, 5.591476525826349, 5.404797548889619, 5.2215983270487225, 5.041963569555181, 4.865967241818346, 4.6936729693859265, 4.52513445326575, 4.360395893446998, 4.1994924177035085, 4.042450512992778, 3.889288456999225, 3.7400167476057606, 3.594638528311087, 3.453150007839031, 3.315540872408189, 3.181794689343562, 3.051889300914856, 2.9257972074775083, 2.8034859391712836, 2.6849184155964863, 2.5700532930392517, 2.458845298954439, 2.351245553537539, 2.247201878325777, 2.1466590918635364, 2.049559292548977, 1.9558421288477337, 1.865445057116722, 1.778303587327059, 1.6943515170108887, 1.6135211537834024, 1.5357435268094046, 1.4609485875945776, 1.389065400485835, 1.3200223232639707, 1.2537471782059704, 1.1901674139847527, 1.1292102587615556, 1.07080286481141, 1.0148724450057771, 0.9613464014591656, 0.9101524466288405, 0.861218717139084, 0.8144738805843021, 0.7698472355488452, 0.7272688050660617, 0.6866694237250096, 0.647980818620529, 0.6111356843311967, 0.576067752100002, 0.5427118533845033, 0.5110039779366263, 0.4808813265671583, 0.452282358746254, 0.42514683518880586, 0.3994158555721978, 0.37503189153367344, 0.35193881509509123, 0.33008192266412656, 0.3094079547628343, 0.2898651116367681, 0.27140306490041605, 0.25397296537744424, 0.23752744729698277, 0.222020629009869, 0.2074081103912311, 0.19364696709800566, 0.18069574185182358, 0.16851443291911303, 0.15706447996121867, 0.14630874742774908, 0.1362115056662356, 0.12673840992042062]}, {\"mode\": \"lines\", \"name\": \"2\", \"type\": \"scatter\", \"uid\": \"affba62d-e538-4018-a88d-2ba22eae614d\", \"x\": [0.35, 0.350722891566265, 0.35144578313253005, 0.3521686746987951, 0.35289156626506013, 0.35361445783132517, 0.3543373493975902, 0.35506024096385524, 0.3557831325301203, 0.3565060240963853, 0.35722891566265036, 0.3579518072289154, 0.35867469879518044, 0.3593975903614455, 0.3601204819277105, 0.36084337349397555, 0.3615662650602406, 0.3622891566265056, 0.36301204819277066, 0.3637349397590357, 0.36445783132530074, 0.3651807228915658, 0.3659036144578308, 0.36662650602409586, 0.3673493975903609, 0.36807228915662593, 0.36879518072289097, 0.369518072289156, 0.37024096385542105, 0.3709638554216861, 0.3716867469879511, 0.37240963855421616, 0.3731325301204812, 0.37385542168674624, 0.3745783132530113, 0.3753012048192763, 0.37602409638554135, 0.3767469879518064, 0.3774698795180714, 0.37819277108433647, 0.3789156626506015, 0.37963855421686654, 0.3803614457831316, 0.3810843373493966, 0.38180722891566166, 0.3825301204819267, 0.38325301204819173, 0.38397590361445677, 0.3846987951807218, 0.38542168674698685, 0.3861445783132519, 0.3868674698795169, 0.38759036144578196, 0.388313253012047, 0.38903614457831204, 0.3897590361445771, 0.3904819277108421, 0.39120481927710715, 0.3919277108433722, 0.39265060240963723, 0.39337349397590227, 0.3940963855421673, 0.39481927710843234, 0.3955421686746974, 0.3962650602409624, 0.39698795180722746, 0.3977108433734925, 0.39843373493975753, 0.39915662650602257, 0.3998795180722876, 0.40060240963855265, 0.4013253012048177, 0.4020481927710827, 0.40277108433734776, 0.4034939759036128, 0.40421686746987784, 0.4049397590361429, 0.4056626506024079, 0.40638554216867295, 0.407108433734938, 0.40783132530120303, 0.40855421686746807, 0.4092771084337331, 0.40999999999999814, 0.4107228915662632, 0.4114457831325282, 0.41216867469879326, 0.4128915662650583, 0.41361445783132333, 0.4143373493975884, 0.4150602409638534, 0.41578313253011845, 0.4165060240963835, 0.4172289156626485, 0.41795180722891356, 0.4186746987951786, 0.41939759036144364, 0.4201204819277087, 0.4208433734939737, 0.42156626506023875, 0.4222891566265038, 0.42301204819276883, 0.42373493975903387, 0.4244578313252989, 0.42518072289156394, 0.425903614457829, 0.426626506024094, 0.42734939759035906, 0.4280722891566241, 0.42879518072288914, 0.4295180722891542, 0.4302409638554192, 0.43096385542168425, 0.4316867469879493, 0.4324096385542143, 0.43313253012047936, 0.4338554216867444, 0.43457831325300944, 0.4353012048192745, 0.4360240963855395, 0.43674698795180456, 0.4374698795180696, 0.43819277108433463, 0.43891566265059967, 0.4396385542168647, 0.44036144578312975, 0.4410843373493948, 0.4418072289156598, 0.44253012048192486, 0.4432530120481899, 0.44397590361445494, 0.44469879518072, 0.445421686746985, 0.44614457831325005, 0.4468674698795151, 0.4475903614457801, 0.44831325301204517, 0.4490361445783102, 0.44975903614457524, 0.4504819277108403, 0.4512048192771053, 0.45192771084337036, 0.4526506024096354, 0.45337349397590043, 0.45409638554216547, 0.4548192771084305, 0.45554216867469555, 0.4562650602409606, 0.4569879518072256, 0.45771084337349066, 0.4584337349397557, 0.45915662650602074, 0.4598795180722858, 0.4606024096385508, 0.46132530120481585, 0.4620481927710809, 0.46277108433734593, 0.46349397590361097, 0.464216867469876, 0.46493975903614104, 0.4656626506024061, 0.4663855421686711, 0.46710843373493616, 0.4678313253012012, 0.46855421686746623, 0.46927710843373127, 0.4699999999999963, 0.47072289156626135, 0.4714457831325264, 0.4721686746987914, 0.47289156626505646, 0.4736144578313215, 0.47433734939758654, 0.4750602409638516, 0.4757831325301166, 0.47650602409638165, 0.4772289156626467, 0.47795180722891173, 0.47867469879517677, 0.4793975903614418, 0.48012048192770684, 0.4808433734939719, 0.4815662650602369, 0.48228915662650196, 0.483012048192767, 0.48373493975903203, 0.4844578313252971, 0.4851807228915621, 0.48590361445782715, 0.4866265060240922, 0.4873493975903572, 0.48807228915662226, 0.4887951807228873, 0.48951807228915234, 0.4902409638554174, 0.4909638554216824, 0.49168674698794745, 0.4924096385542125, 0.49313253012047753, 0.49385542168674257, 0.4945783132530076, 0.49530120481927264, 0.4960240963855377, 0.4967469879518027, 0.49746987951806776, 0.4981927710843328, 0.49891566265059784, 0.4996385542168629, 0.5003614457831279, 0.501084337349393, 0.501807228915658, 0.502530120481923, 0.5032530120481881, 0.5039759036144531, 0.5046987951807181, 0.5054216867469832, 0.5061445783132482, 0.5068674698795133, 0.5075903614457783, 0.5083132530120433, 0.5090361445783084, 0.5097590361445734, 0.5104819277108384, 0.5112048192771035, 0.5119277108433685, 0.5126506024096336, 0.5133734939758986, 0.5140963855421636, 0.5148192771084287, 0.5155421686746937, 0.5162650602409588, 0.5169879518072238, 0.5177108433734888, 0.5184337349397539, 0.5191566265060189, 0.5198795180722839, 0.520602409638549, 0.521325301204814, 0.5220481927710791, 0.5227710843373441, 0.5234939759036091, 0.5242168674698742, 0.5249397590361392, 0.5256626506024042, 0.5263855421686693, 0.5271084337349343, 0.5278313253011994, 0.5285542168674644, 0.5292771084337294, 0.53], \"y\": [0.12673840992042062, 0.1362115056661605, 0.14630874742766906, 0.15706447996113346, 0.16851443291902232, 0.18069574185172713, 0.19364696709790333, 0.20740811039112222, 0.22202062900975342, 0.23752744729686018, 0.2539729653773142, 0.27140306490027843, 0.2898651116366221, 0.30940795476268007, 0.33008192266396325, 0.3519388150949188, 0.37503189153349104, 0.3994158555720054, 0.425146835188603, 0.45228235874604, 0.4808813265669329, 0.5110039779363891, 0.5427118533842537, 0.5760677520997391, 0.6111356843309207, 0.6479808186202394, 0.686669423724705, 0.7272688050657425, 0.7698472355485105, 0.8144738805839514, 0.8612187171387163, 0.9101524466284562, 0.9613464014587636, 1.014872445005357, 1.0708028648109713, 1.1292102587610977, 1.1901674139842746, 1.2537471782054723, 1.3200223232634514, 1.3890654004852936, 1.4609485875940145, 1.535743526808819, 1.6135211537827934, 1.6943515170102559, 1.7783035873264017, 1.865445057116041, 1.9558421288470267, 2.0495592925482446, 2.1466590918627775, 2.2472018783249923, 2.3512455535367267, 2.4588452989535985, 2.5700532930383844, 2.6849184155955905, 2.803485939170358, 2.925797207476555, 3.051889300913872, 3.1817946893425497, 3.3155408724071473, 3.453150007837959, 3.594638528309987, 3.740016747604629, 3.889288456998064, 4.042450512991587, 4.199492417702288, 4.360395893445747, 4.525134453264469, 4.693672969384619, 4.865967241817009, 5.041963569553816, 5.22159832704733, 5.404797548888198, 5.591476525824902, 5.781539415479983, 5.974878871318479, 6.171375693606062, 6.370898506255026, 6.573303463591281, 6.778433991181602, 6.986120564933198, 7.196180532714161, 7.408417982739958, 7.622623662924549, 7.838574955302765, 8.056035909490394, 8.274757338958446, 8.494476983657114, 8.714919742231926, 8.935797976729898, 9.15681189229748, 9.377649993925942, 9.597989621806201, 9.817497566316009, 10.035830763082075, 10.252637067942079, 10.467556110981702, 10.680220228145476, 10.890255468223897, 11.09728267230923, 11.30091862209706, 11.500777252696611, 11.696470924909221, 11.887611751248926, 12.073812969320416, 12.254690355546314, 12.429863671655708, 12.598958135817735, 12.761605909834701, 12.917447593406825, 13.06613371615089, 13.207326217804248, 13.340699906878744, 13.46594388795002, 13.58276294777958, 13.690878890572167, 13.790031812869886, 13.879981308877188, 13.960507597395862, 14.031412562023691, 14.09252069683093, 14.143679950370302, 14.184762461592596, 14.215665182024456, 14.236310379409732, 14.246646018911722, 14.246646018911761, 14.236310379409854, 14.215665182024651, 14.184762461592872, 14.14367995037066, 14.092520696831361, 14.031412562024196, 13.960507597396445, 13.879981308877843, 13.79003181287061, 13.690878890572963, 13.582762947780447, 13.465943887950951, 13.340699906879738, 13.207326217805303, 13.066133716152004, 12.917447593407998, 12.761605909835923, 12.598958135819013, 12.429863671657031, 12.25469035554768, 12.073812969321827, 11.887611751250375, 11.696470924910708, 11.50077725269813, 11.30091862209861, 11.097282672310808, 10.890255468225496, 10.680220228147101, 10.467556110983342, 10.252637067943738, 10.035830763083748, 9.817497566317693, 9.597989621807892, 9.377649993927635, 9.156811892299178, 8.935797976731596, 8.71491974223362, 8.494476983658805, 8.27475733896013, 8.056035909492067, 7.83857495530443, 7.622623662926202, 7.4084179827415975, 7.196180532715782, 6.986120564934801, 6.7784339911831895, 6.573303463592846, 6.37089850625657, 6.171375693607585, 5.974878871319975, 5.781539415481457, 5.591476525826349, 5.404797548889619, 5.2215983270487225, 5.041963569555181, 4.865967241818346, 4.6936729693859265, 4.52513445326575, 4.360395893446998, 4.1994924177035085, 4.042450512992778, 3.889288456999225, 3.7400167476057606, 3.594638528311087, 3.453150007839031, 3.315540872408189, 3.181794689343562, 3.051889300914856, 2.9257972074775083, 2.8034859391712836, 2.6849184155964863, 2.5700532930392517, 2.458845298954439, 2.351245553537539, 2.247201878325777, 2.1466590918635364, 2.049559292548977, 1.9558421288477337, 1.865445057116722, 1.778303587327059, 1.6943515170108887, 1.6135211537834024, 1.5357435268094046, 1.4609485875945776, 1.389065400485835, 1.3200223232639707, 1.2537471782059704, 1.1901674139847527, 1.1292102587615556, 1.07080286481141, 1.0148724450057771, 0.9613464014591656, 0.9101524466288405, 0.861218717139084, 0.8144738805843021, 0.7698472355488452, 0.7272688050660617, 0.6866694237250096, 0.647980818620529, 0.6111356843311967, 0.576067752100002, 0.5427118533845033, 0.5110039779366263, 0.4808813265671583, 0.452282358746254, 0.42514683518880586, 0.3994158555721978, 0.37503189153367344, 0.35193881509509123, 0.33008192266412656, 0.3094079547628343, 0.2898651116367681, 0.27140306490041605, 0.25397296537744424, 0.23752744729698277, 0.222020629009869, 0.2074081103912311, 0.19364696709800566, 0.18069574185182358, 0.16851443291911303, 0.15706447996121867, 0.14630874742774908, 0.1362115056662356, 0.12673840992042062]}, {\"mode\": \"lines\", \"name\": \"3\", \"type\": \"scatter\", \"uid\": \"1516ce71-cad6-4445-b1eb-313841c6f4ed\", \"x\": [0.35, 0.350722891566265, 0.35144578313253005, 0.3521686746987951, 0.35289156626506013, 0.35361445783132517, 0.3543373493975902, 0.35506024096385524, 0.3557831325301203, 0.3565060240963853, 0.35722891566265036, 0.3579518072289154, 0.35867469879518044, 0.3593975903614455, 0.3601204819277105, 0.36084337349397555, 0.3615662650602406, 0.3622891566265056, 0.36301204819277066, 0.3637349397590357, 0.36445783132530074, 0.3651807228915658, 0.3659036144578308, 0.36662650602409586, 0.3673493975903609, 0.36807228915662593, 0.36879518072289097, 0.369518072289156, 0.37024096385542105, 0.3709638554216861, 0.3716867469879511, 0.37240963855421616, 0.3731325301204812, 0.37385542168674624, 0.3745783132530113, 0.3753012048192763, 0.37602409638554135, 0.3767469879518064, 0.3774698795180714, 0.37819277108433647, 0.3789156626506015, 0.37963855421686654, 0.3803614457831316, 0.3810843373493966, 0.38180722891566166, 0.3825301204819267, 0.38325301204819173, 0.38397590361445677, 0.3846987951807218, 0.38542168674698685, 0.3861445783132519, 0.3868674698795169, 0.38759036144578196, 0.388313253012047, 0.38903614457831204, 0.3897590361445771, 0.3904819277108421, 0.39120481927710715, 0.3919277108433722, 0.39265060240963723, 0.39337349397590227, 0.3940963855421673, 0.39481927710843234, 0.3955421686746974, 0.3962650602409624, 0.39698795180722746, 0.3977108433734925, 0.39843373493975753, 0.39915662650602257, 0.3998795180722876, 0.40060240963855265, 0.4013253012048177, 0.4020481927710827, 0.40277108433734776, 0.4034939759036128, 0.40421686746987784, 0.4049397590361429, 0.4056626506024079, 0.40638554216867295, 0.407108433734938, 0.40783132530120303, 0.40855421686746807, 0.4092771084337331, 0.40999999999999814, 0.4107228915662632, 0.4114457831325282, 0.41216867469879326, 0.4128915662650583, 0.41361445783132333, 0.4143373493975884, 0.4150602409638534, 0.41578313253011845, 0.4165060240963835, 0.4172289156626485, 0.41795180722891356, 0.4186746987951786, 0.41939759036144364, 0.4201204819277087, 0.4208433734939737, 0.42156626506023875, 0.4222891566265038, 0.42301204819276883, 0.42373493975903387, 0.4244578313252989, 0.42518072289156394, 0.425903614457829, 0.426626506024094, 0.42734939759035906, 0.4280722891566241, 0.42879518072288914, 0.4295180722891542, 0.4302409638554192, 0.43096385542168425, 0.4316867469879493, 0.4324096385542143, 0.43313253012047936, 0.4338554216867444, 0.43457831325300944, 0.4353012048192745, 0.4360240963855395, 0.43674698795180456, 0.4374698795180696, 0.43819277108433463, 0.43891566265059967, 0.4396385542168647, 0.44036144578312975, 0.4410843373493948, 0.4418072289156598, 0.44253012048192486, 0.4432530120481899, 0.44397590361445494, 0.44469879518072, 0.445421686746985, 0.44614457831325005, 0.4468674698795151, 0.4475903614457801, 0.44831325301204517, 0.4490361445783102, 0.44975903614457524, 0.4504819277108403, 0.4512048192771053, 0.45192771084337036, 0.4526506024096354, 0.45337349397590043, 0.45409638554216547, 0.4548192771084305, 0.45554216867469555, 0.4562650602409606, 0.4569879518072256, 0.45771084337349066, 0.4584337349397557, 0.45915662650602074, 0.4598795180722858, 0.4606024096385508, 0.46132530120481585, 0.4620481927710809, 0.46277108433734593, 0.46349397590361097, 0.464216867469876, 0.46493975903614104, 0.4656626506024061, 0.4663855421686711, 0.46710843373493616, 0.4678313253012012, 0.46855421686746623, 0.46927710843373127, 0.4699999999999963, 0.47072289156626135, 0.4714457831325264, 0.4721686746987914, 0.47289156626505646, 0.4736144578313215, 0.47433734939758654, 0.4750602409638516, 0.4757831325301166, 0.47650602409638165, 0.4772289156626467, 0.47795180722891173, 0.47867469879517677, 0.4793975903614418, 0.48012048192770684, 0.4808433734939719, 0.4815662650602369, 0.48228915662650196, 0.483012048192767, 0.48373493975903203, 0.4844578313252971, 0.4851807228915621, 0.48590361445782715, 0.4866265060240922, 0.4873493975903572, 0.48807228915662226, 0.4887951807228873, 0.48951807228915234, 0.4902409638554174, 0.4909638554216824, 0.49168674698794745, 0.4924096385542125, 0.49313253012047753, 0.49385542168674257, 0.4945783132530076, 0.49530120481927264, 0.4960240963855377, 0.4967469879518027, 0.49746987951806776, 0.4981927710843328, 0.49891566265059784, 0.4996385542168629, 0.5003614457831279, 0.501084337349393, 0.501807228915658, 0.502530120481923, 0.5032530120481881, 0.5039759036144531, 0.5046987951807181, 0.5054216867469832, 0.5061445783132482, 0.5068674698795133, 0.5075903614457783, 0.5083132530120433, 0.5090361445783084, 0.5097590361445734, 0.5104819277108384, 0.5112048192771035, 0.5119277108433685, 0.5126506024096336, 0.5133734939758986, 0.5140963855421636, 0.5148192771084287, 0.5155421686746937, 0.5162650602409588, 0.5169879518072238, 0.5177108433734888, 0.5184337349397539, 0.5191566265060189, 0.5198795180722839, 0.520602409638549, 0.521325301204814, 0.5220481927710791, 0.5227710843373441, 0.5234939759036091, 0.5242168674698742, 0.5249397590361392, 0.5256626506024042, 0.5263855421686693, 0.5271084337349343, 0.5278313253011994, 0.5285542168674644, 0.5292771084337294, 0.53], \"y\": [0.12673840992042062, 0.1362115056661605, 0.14630874742766906, 0.15706447996113346, 0.16851443291902232, 0.18069574185172713, 0.19364696709790333, 0.20740811039112222, 0.22202062900975342, 0.23752744729686018, 0.2539729653773142, 0.27140306490027843, 0.2898651116366221, 0.30940795476268007, 0.33008192266396325, 0.3519388150949188, 0.37503189153349104, 0.3994158555720054, 0.425146835188603, 0.45228235874604, 0.4808813265669329, 0.5110039779363891, 0.5427118533842537, 0.5760677520997391, 0.6111356843309207, 0.6479808186202394, 0.686669423724705, 0.7272688050657425, 0.7698472355485105, 0.8144738805839514, 0.8612187171387163, 0.9101524466284562, 0.9613464014587636, 1.014872445005357, 1.0708028648109713, 1.1292102587610977, 1.1901674139842746, 1.2537471782054723, 1.3200223232634514, 1.3890654004852936, 1.4609485875940145, 1.535743526808819, 1.6135211537827934, 1.6943515170102559, 1.7783035873264017, 1.865445057116041, 1.9558421288470267, 2.0495592925482446, 2.1466590918627775, 2.2472018783249923, 2.3512455535367267, 2.4588452989535985, 2.5700532930383844, 2.6849184155955905, 2.803485939170358, 2.925797207476555, 3.051889300913872, 3.1817946893425497, 3.3155408724071473, 3.453150007837959, 3.594638528309987, 3.740016747604629, 3.889288456998064, 4.042450512991587, 4.199492417702288, 4.360395893445747, 4.525134453264469, 4.693672969384619, 4.865967241817009, 5.041963569553816, 5.22159832704733, 5.404797548888198, 5.591476525824902, 5.781539415479983, 5.974878871318479, 6.171375693606062, 6.370898506255026, 6.573303463591281, 6.778433991181602, 6.986120564933198, 7.196180532714161, 7.408417982739958, 7.622623662924549, 7.838574955302765, 8.056035909490394, 8.274757338958446, 8.494476983657114, 8.714919742231926, 8.935797976729898, 9.15681189229748, 9.377649993925942, 9.597989621806201, 9.817497566316009, 10.035830763082075, 10.252637067942079, 10.467556110981702, 10.680220228145476, 10.890255468223897, 11.09728267230923, 11.30091862209706, 11.500777252696611, 11.696470924909221, 11.887611751248926, 12.073812969320416, 12.254690355546314, 12.429863671655708, 12.598958135817735, 12.761605909834701, 12.917447593406825, 13.06613371615089, 13.207326217804248, 13.340699906878744, 13.46594388795002, 13.58276294777958, 13.690878890572167, 13.790031812869886, 13.879981308877188, 13.960507597395862, 14.031412562023691, 14.09252069683093, 14.143679950370302, 14.184762461592596, 14.215665182024456, 14.236310379409732, 14.246646018911722, 14.246646018911761, 14.236310379409854, 14.215665182024651, 14.184762461592872, 14.14367995037066, 14.092520696831361, 14.031412562024196, 13.960507597396445, 13.879981308877843, 13.79003181287061, 13.690878890572963, 13.582762947780447, 13.465943887950951, 13.340699906879738, 13.207326217805303, 13.066133716152004, 12.917447593407998, 12.761605909835923, 12.598958135819013, 12.429863671657031, 12.25469035554768, 12.073812969321827, 11.887611751250375, 11.696470924910708, 11.50077725269813, 11.30091862209861, 11.097282672310808, 10.890255468225496, 10.680220228147101, 10.467556110983342, 10.252637067943738, 10.035830763083748, 9.817497566317693, 9.597989621807892, 9.377649993927635, 9.156811892299178, 8.935797976731596, 8.71491974223362, 8.494476983658805, 8.27475733896013, 8.056035909492067, 7.83857495530443, 7.622623662926202, 7.4084179827415975, 7.196180532715782, 6.986120564934801, 6.7784339911831895, 6.573303463592846, 6.37089850625657, 6.171375693607585, 5.974878871319975, 5.781539415481457, 5.591476525826349, 5.404797548889619, 5.2215983270487225, 5.041963569555181, 4.865967241818346, 4.6936729693859265, 4.52513445326575, 4.360395893446998, 4.1994924177035085, 4.042450512992778, 3.889288456999225, 3.7400167476057606, 3.594638528311087, 3.453150007839031, 3.315540872408189, 3.181794689343562, 3.051889300914856, 2.9257972074775083, 2.8034859391712836, 2.6849184155964863, 2.5700532930392517, 2.458845298954439, 2.351245553537539, 2.247201878325777, 2.1466590918635364, 2.049559292548977, 1.9558421288477337, 1.865445057116722, 1.778303587327059, 1.6943515170108887, 1.6135211537834024, 1.5357435268094046, 1.4609485875945776, 1.389065400485835, 1.3200223232639707, 1.2537471782059704, 1.1901674139847527, 1.1292102587615556, 1.07080286481141, 1.0148724450057771, 0.9613464014591656, 0.9101524466288405, 0.861218717139084, 0.8144738805843021, 0.7698472355488452, 0.7272688050660617, 0.6866694237250096, 0.647980818620529, 0.6111356843311967, 0.576067752100002, 0.5427118533845033, 0.5110039779366263, 0.4808813265671583, 0.452282358746254, 0.42514683518880586, 0.3994158555721978, 0.37503189153367344, 0.35193881509509123, 0.33008192266412656, 0.3094079547628343, 0.2898651116367681, 0.27140306490041605, 0.25397296537744424, 0.23752744729698277, 0.222020629009869, 0.2074081103912311, 0.19364696709800566, 0.18069574185182358, 0.16851443291911303, 0.15706447996121867, 0.14630874742774908, 0.1362115056662356, 0.12673840992042062]}, {\"mode\": \"lines\", \"name\": \"4\", \"type\": \"scatter\", \"uid\": \"0b2c5db5-bf0e-49f8-97b3-4320635c6559\", \"x\": [0.35, 0.350722891566265, 0.35144578313253005, 0.3521686746987951, 0.35289156626506013, 0.35361445783132517, 0.3543373493975902, 0.35506024096385524, 0.3557831325301203, 0.3565060240963853, 0.35722891566265036, 0.3579518072289154, 0.35867469879518044, 0.3593975903614455, 0.3601204819277105, 0.36084337349397555, 0.3615662650602406, 0.3622891566265056, 0.36301204819277066, 0.3637349397590357, 0.36445783132530074, 0.3651807228915658, 0.3659036144578308, 0.36662650602409586, 0.3673493975903609, 0.36807228915662593, 0.36879518072289097, 0.369518072289156, 0.37024096385542105, 0.3709638554216861, 0.3716867469879511, 0.37240963855421616, 0.3731325301204812, 0.37385542168674624, 0.3745783132530113, 0.3753012048192763, 0.37602409638554135, 0.3767469879518064, 0.3774698795180714, 0.37819277108433647, 0.3789156626506015, 0.37963855421686654, 0.3803614457831316, 0.3810843373493966, 0.38180722891566166, 0.3825301204819267, 0.38325301204819173, 0.38397590361445677, 0.3846987951807218, 0.38542168674698685, 0.3861445783132519, 0.3868674698795169, 0.38759036144578196, 0.388313253012047, 0.38903614457831204, 0.3897590361445771, 0.3904819277108421, 0.39120481927710715, 0.3919277108433722, 0.39265060240963723, 0.39337349397590227, 0.3940963855421673, 0.39481927710843234, 0.3955421686746974, 0.3962650602409624, 0.39698795180722746, 0.3977108433734925, 0.39843373493975753, 0.39915662650602257, 0.3998795180722876, 0.40060240963855265, 0.4013253012048177, 0.4020481927710827, 0.40277108433734776, 0.4034939759036128, 0.40421686746987784, 0.4049397590361429, 0.4056626506024079, 0.40638554216867295, 0.407108433734938, 0.40783132530120303, 0.40855421686746807, 0.4092771084337331, 0.40999999999999814, 0.4107228915662632, 0.4114457831325282, 0.41216867469879326, 0.4128915662650583, 0.41361445783132333, 0.4143373493975884, 0.4150602409638534, 0.41578313253011845, 0.4165060240963835, 0.4172289156626485, 0.41795180722891356, 0.4186746987951786, 0.41939759036144364, 0.4201204819277087, 0.4208433734939737, 0.42156626506023875, 0.4222891566265038, 0.42301204819276883, 0.42373493975903387, 0.4244578313252989, 0.42518072289156394, 0.425903614457829, 0.426626506024094, 0.42734939759035906, 0.4280722891566241, 0.42879518072288914, 0.4295180722891542, 0.4302409638554192, 0.43096385542168425, 0.4316867469879493, 0.4324096385542143, 0.43313253012047936, 0.4338554216867444, 0.43457831325300944, 0.4353012048192745, 0.4360240963855395, 0.43674698795180456, 0.4374698795180696, 0.43819277108433463, 0.43891566265059967, 0.4396385542168647, 0.44036144578312975, 0.4410843373493948, 0.4418072289156598, 0.44253012048192486, 0.4432530120481899, 0.44397590361445494, 0.44469879518072, 0.445421686746985, 0.44614457831325005, 0.4468674698795151, 0.4475903614457801, 0.44831325301204517, 0.4490361445783102, 0.44975903614457524, 0.4504819277108403, 0.4512048192771053, 0.45192771084337036, 0.4526506024096354, 0.45337349397590043, 0.45409638554216547, 0.4548192771084305, 0.45554216867469555, 0.4562650602409606, 0.4569879518072256, 0.45771084337349066, 0.4584337349397557, 0.45915662650602074, 0.4598795180722858, 0.4606024096385508, 0.46132530120481585, 0.4620481927710809, 0.46277108433734593, 0.46349397590361097, 0.464216867469876, 0.46493975903614104, 0.4656626506024061, 0.4663855421686711, 0.46710843373493616, 0.4678313253012012, 0.46855421686746623, 0.46927710843373127, 0.4699999999999963, 0.47072289156626135, 0.4714457831325264, 0.4721686746987914, 0.47289156626505646, 0.4736144578313215, 0.47433734939758654, 0.4750602409638516, 0.4757831325301166, 0.47650602409638165, 0.4772289156626467, 0.47795180722891173, 0.47867469879517677, 0.4793975903614418, 0.48012048192770684, 0.4808433734939719, 0.4815662650602369, 0.48228915662650196, 0.483012048192767, 0.48373493975903203, 0.4844578313252971, 0.4851807228915621, 0.48590361445782715, 0.4866265060240922, 0.4873493975903572, 0.48807228915662226, 0.4887951807228873, 0.48951807228915234, 0.4902409638554174, 0.4909638554216824, 0.49168674698794745, 0.4924096385542125, 0.49313253012047753, 0.49385542168674257, 0.4945783132530076, 0.49530120481927264, 0.4960240963855377, 0.4967469879518027, 0.49746987951806776, 0.4981927710843328, 0.49891566265059784, 0.4996385542168629, 0.5003614457831279, 0.501084337349393, 0.501807228915658, 0.502530120481923, 0.5032530120481881, 0.5039759036144531, 0.5046987951807181, 0.5054216867469832, 0.5061445783132482, 0.5068674698795133, 0.5075903614457783, 0.5083132530120433, 0.5090361445783084, 0.5097590361445734, 0.5104819277108384, 0.5112048192771035, 0.5119277108433685, 0.5126506024096336, 0.5133734939758986, 0.5140963855421636, 0.5148192771084287, 0.5155421686746937, 0.5162650602409588, 0.5169879518072238, 0.5177108433734888, 0.5184337349397539, 0.5191566265060189, 0.5198795180722839, 0.520602409638549, 0.521325301204814, 0.5220481927710791, 0.5227710843373441, 0.5234939759036091, 0.5242168674698742, 0.5249397590361392, 0.5256626506024042, 0.5263855421686693, 0.5271084337349343, 0.5278313253011994, 0.5285542168674644, 0.5292771084337294, 0.53], \"y\": [0.12673840992042062, 0.1362115056661605, 0.14630874742766906, 0.15706447996113346, 0.16851443291902232, 0.18069574185172713, 0.19364696709790333, 0.20740811039112222, 0.22202062900975342, 0.23752744729686018, 0.2539729653773142, 0.27140306490027843, 0.2898651116366221, 0.30940795476268007, 0.33008192266396325, 0.3519388150949188, 0.37503189153349104, 0.3994158555720054, 0.425146835188603, 0.45228235874604, 0.4808813265669329, 0.5110039779363891, 0.5427118533842537, 0.5760677520997391, 0.6111356843309207, 0.6479808186202394, 0.686669423724705, 0.7272688050657425, 0.7698472355485105, 0.8144738805839514, 0.8612187171387163, 0.9101524466284562, 0.9613464014587636, 1.014872445005357, 1.0708028648109713, 1.1292102587610977, 1.1901674139842746, 1.2537471782054723, 1.3200223232634514, 1.3890654004852936, 1.4609485875940145, 1.535743526808819, 1.6135211537827934, 1.6943515170102559, 1.7783035873264017, 1.865445057116041, 1.9558421288470267, 2.0495592925482446, 2.1466590918627775, 2.2472018783249923, 2.3512455535367267, 2.4588452989535985, 2.5700532930383844, 2.6849184155955905, 2.803485939170358, 2.925797207476555, 3.051889300913872, 3.1817946893425497, 3.3155408724071473, 3.453150007837959, 3.594638528309987, 3.740016747604629, 3.889288456998064, 4.042450512991587, 4.199492417702288, 4.360395893445747, 4.525134453264469, 4.693672969384619, 4.865967241817009, 5.041963569553816, 5.22159832704733, 5.404797548888198, 5.591476525824902, 5.781539415479983, 5.974878871318479, 6.171375693606062, 6.370898506255026, 6.573303463591281, 6.778433991181602, 6.986120564933198, 7.196180532714161, 7.408417982739958, 7.622623662924549, 7.838574955302765, 8.056035909490394, 8.274757338958446, 8.494476983657114, 8.714919742231926, 8.935797976729898, 9.15681189229748, 9.377649993925942, 9.597989621806201, 9.817497566316009, 10.035830763082075, 10.252637067942079, 10.467556110981702, 10.680220228145476, 10.890255468223897, 11.09728267230923, 11.30091862209706, 11.500777252696611, 11.696470924909221, 11.887611751248926, 12.073812969320416, 12.254690355546314, 12.429863671655708, 12.598958135817735, 12.761605909834701, 12.917447593406825, 13.06613371615089, 13.207326217804248, 13.340699906878744, 13.46594388795002, 13.58276294777958, 13.690878890572167, 13.790031812869886, 13.879981308877188, 13.960507597395862, 14.031412562023691, 14.09252069683093, 14.143679950370302, 14.184762461592596, 14.215665182024456, 14.236310379409732, 14.246646018911722, 14.246646018911761, 14.236310379409854, 14.215665182024651, 14.184762461592872, 14.14367995037066, 14.092520696831361, 14.031412562024196, 13.960507597396445, 13.879981308877843, 13.79003181287061, 13.690878890572963, 13.582762947780447, 13.465943887950951, 13.340699906879738, 13.207326217805303, 13.066133716152004, 12.917447593407998, 12.761605909835923, 12.598958135819013, 12.429863671657031, 12.25469035554768, 12.073812969321827, 11.887611751250375, 11.696470924910708, 11.50077725269813, 11.30091862209861, 11.097282672310808, 10.890255468225496, 10.680220228147101, 10.467556110983342, 10.252637067943738, 10.035830763083748, 9.817497566317693, 9.597989621807892, 9.377649993927635, 9.156811892299178, 8.935797976731596, 8.71491974223362, 8.494476983658805, 8.27475733896013, 8.056035909492067, 7.83857495530443, 7.622623662926202, 7.4084179827415975, 7.196180532715782, 6.986120564934801, 6.7784339911831895, 6.573303463592846, 6.37089850625657, 6.171375693607585, 5.974878871319975, 5.781539415481457, 5.591476525826349, 5.404797548889619, 5.2215983270487225, 5.041963569555181, 4.865967241818346, 4.6936729693859265, 4.52513445326575, 4.360395893446998, 4.1994924177035085, 4.042450512992778, 3.889288456999225, 3.7400167476057606, 3.594638528311087, 3.453150007839031, 3.315540872408189, 3.181794689343562, 3.051889300914856, 2.9257972074775083, 2.8034859391712836, 2.6849184155964863, 2.5700532930392517, 2.458845298954439, 2.351245553537539, 2.247201878325777, 2.1466590918635364, 2.049559292548977, 1.9558421288477337, 1.865445057116722, 1.778303587327059, 1.6943515170108887, 1.6135211537834024, 1.5357435268094046, 1.4609485875945776, 1.389065400485835, 1.3200223232639707, 1.2537471782059704, 1.1901674139847527, 1.1292102587615556, 1.07080286481141, 1.0148724450057771, 0.9613464014591656, 0.9101524466288405, 0.861218717139084, 0.8144738805843021, 0.7698472355488452, 0.7272688050660617, 0.6866694237250096, 0.647980818620529, 0.6111356843311967, 0.576067752100002, 0.5427118533845033, 0.5110039779366263, 0.4808813265671583, 0.452282358746254, 0.42514683518880586, 0.3994158555721978, 0.37503189153367344, 0.35193881509509123, 0.33008192266412656, 0.3094079547628343, 0.2898651116367681, 0.27140306490041605, 0.25397296537744424, 0.23752744729698277, 0.222020629009869, 0.2074081103912311, 0.19364696709800566, 0.18069574185182358, 0.16851443291911303, 0.15706447996121867, 0.14630874742774908, 0.1362115056662356, 0.12673840992042062]}],\n                        {\"title\": {\"text\": \"Coupling Length Trial Distributions\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Expectation Value (au)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Coupling Length (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"9196136f-d09f-428b-af3c-6371077f5a35\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"9196136f-d09f-428b-af3c-6371077f5a35\")) {\n                    Plotly.newPlot(\n                        '9196136f-d09f-428b-af3c-6371077f5a35',\n                        [{\"boxpoints\": false, \"name\": \"1\", \"type\": \"box\", \"uid\": \"08c03fb3-75aa-439b-ac6d-bae5d6f48293\", \"x\": [0.3815682473431459, 0.3828398358350465, 0.3843289543681484, 0.3848989237414859, 0.38652870997560357, 0.38756626998251653, 0.38884263542225894, 0.3895834908539808, 0.391227552265853, 0.3918420113241708, 0.392642545594262, 0.3937364804239176, 0.3959804219692497, 0.3968197210228221, 0.39833552214545975, 0.3993564350078862, 0.4002250567187237, 0.40021363900919, 0.400904587764684, 0.4011327153541746, 0.402967481942588, 0.40199249053560226, 0.4041963947138447, 0.4041228341576944, 0.4054165785350168, 0.4043686514053625, 0.4054786075504893, 0.40601658304354776, 0.40747914417280273, 0.4068848171879983, 0.40811825854764194, 0.40835116648493114, 0.40916169321079254, 0.4093525455042807, 0.4111672846185816, 0.4101747740608069, 0.41171704880402504, 0.4123480550631451, 0.4116770289103074, 0.4130447117500438, 0.4135752692531519, 0.4134993191956249, 0.4139662137152474, 0.4147533819248262, 0.4147145386510688, 0.414820639505913, 0.41566954189107425, 0.4152731831440925, 0.41604124217951294, 0.4165334170318554, 0.4168722937533455, 0.4181705434529757, 0.41800437540507485, 0.41776684170498535, 0.41889974630466537, 0.4191282728722146, 0.41949196869132804, 0.42062611524247834, 0.4204995446574544, 0.4198431241020618, 0.42109232949724534, 0.4213321193219073, 0.4212136670685901, 0.42281251259506547, 0.42292989078215004, 0.4222739672459136, 0.423456037306955, 0.4233067606301643, 0.42382539512329204, 0.4236415981287056, 0.42506701247338213, 0.4243276788774, 0.4247727455865444, 0.42531294687489635, 0.42589129204091836, 0.42640618013119275, 0.4262185371715043, 0.42596623620037766, 0.4275671290758911, 0.4269319582254186, 0.426546600647333, 0.4273142000508785, 0.4282856990713316, 0.42781423368275207, 0.42772748286425666, 0.42831724631017637, 0.4296147711568093, 0.429488772204019, 0.4294523362305786, 0.4299445499102516, 0.4305852537807945, 0.4300752576063399, 0.43073019210178576, 0.4304980905331442, 0.4323119460134349, 0.43140157396477974, 0.4316818544068298, 0.43234453354246916, 0.43307115226871296, 0.4326216269138742, 0.4334670116665458, 0.4334189558989917, 0.43442256465963425, 0.4341029056284813, 0.43435720997804766, 0.43430536572216916, 0.4354816628541183, 0.43480602857027095, 0.4348821369899786, 0.4355815777767678, 0.43591626246709403, 0.4366019014709696, 0.4369908191961163, 0.4365968006466232, 0.43721137591465264, 0.43715530107184414, 0.43771622337785226, 0.4379706230208981, 0.43852108523411903, 0.43896638028487256, 0.43826320310512856, 0.43941248819716566, 0.43999781556764156, 0.440118593965136, 0.4399641634320856, 0.44052462835582396, 0.44108894401885773, 0.4411386571461856, 0.4409335463767023, 0.44102529230189663, 0.4421243970843196, 0.4425404049691119, 0.44182534138621926, 0.4423798047380733, 0.44314426718799577, 0.44351500518300524, 0.44335494284509436, 0.44317968250519973, 0.44499982031643764, 0.44424275397663904, 0.44508489640509163, 0.44488725856115735, 0.4456894563549657, 0.44556941423721086, 0.4456475930397815, 0.44606578694417814, 0.44678649719456576, 0.44680047628291925, 0.4469890703032872, 0.44688910657580455, 0.44799110045056206, 0.4485200879913853, 0.4480172293229916, 0.4480539333751338, 0.44880161670031354, 0.4499396878945392, 0.44915770913217473, 0.44980915582341935, 0.4506649055695108, 0.45048607990679607, 0.45089000013870445, 0.4510748945316872, 0.4511702422959057, 0.451367439747749, 0.4514635773671336, 0.4520689907803998, 0.4528238588414564, 0.45279023207300206, 0.4524939746867787, 0.45239562680599155, 0.4541697689652581, 0.4545665681723203, 0.45365174564700006, 0.4539391121430576, 0.45576073698073505, 0.454926348397182, 0.45538027347437593, 0.45492437142032816, 0.45603762076687115, 0.45603926098468317, 0.4564095750023587, 0.4561378465667059, 0.4572523628115787, 0.45771532255569636, 0.45750436029752317, 0.4586073684095942, 0.4586408497466266, 0.459084674664568, 0.4596385427767675, 0.4600179932228207, 0.4601686247638114, 0.4613344360328056, 0.46147234383513724, 0.46157778853635834, 0.46185533389700484, 0.46189793789745465, 0.4626666243388023, 0.46301237878752766, 0.4640203894117352, 0.4628576402743113, 0.46415378568468696, 0.464575649994354, 0.4645936995794306, 0.4654020814979044, 0.46562370670138553, 0.4660507185415782, 0.4665642046934284, 0.46667923590871796, 0.4669075969887077, 0.46789487164077853, 0.46775017259897633, 0.46841567313508653, 0.46910754052384146, 0.46898804789202425, 0.470785973860858, 0.4708802454329765, 0.47126604714806547, 0.47177065433419685, 0.47232510909765585, 0.4725580672589071, 0.4734999526823454, 0.47433400920768376, 0.4754713199170227, 0.47465179717753453, 0.4768173115483623, 0.4758785017129898, 0.4769437447096709, 0.4773407106932082, 0.4783604468126452, 0.47896016156017707, 0.4803081901298314, 0.47957528604934013, 0.4814393853598739, 0.48210475791224494, 0.48346575202937636, 0.4845449780293014, 0.48542219225691946, 0.4865240722617575, 0.4879237114364128, 0.48970697415161135, 0.4903248317285501, 0.49177562261561214, 0.49238937530881677, 0.49420477685572967, 0.4945994474193508, 0.4957490724679917, 0.49736192982685296, 0.49898355212277856]}, {\"boxpoints\": false, \"name\": \"2\", \"type\": \"box\", \"uid\": \"71fec680-3e77-4132-ac40-c6f34a1059ff\", \"x\": [0.3815682473431459, 0.3828398358350465, 0.3843289543681484, 0.3848989237414859, 0.38652870997560357, 0.38756626998251653, 0.38884263542225894, 0.3895834908539808, 0.391227552265853, 0.3918420113241708, 0.392642545594262, 0.3937364804239176, 0.3959804219692497, 0.3968197210228221, 0.39833552214545975, 0.3993564350078862, 0.4002250567187237, 0.40021363900919, 0.400904587764684, 0.4011327153541746, 0.402967481942588, 0.40199249053560226, 0.4041963947138447, 0.4041228341576944, 0.4054165785350168, 0.4043686514053625, 0.4054786075504893, 0.40601658304354776, 0.40747914417280273, 0.4068848171879983, 0.40811825854764194, 0.40835116648493114, 0.40916169321079254, 0.4093525455042807, 0.4111672846185816, 0.4101747740608069, 0.41171704880402504, 0.4123480550631451, 0.4116770289103074, 0.4130447117500438, 0.4135752692531519, 0.4134993191956249, 0.4139662137152474, 0.4147533819248262, 0.4147145386510688, 0.414820639505913, 0.41566954189107425, 0.4152731831440925, 0.41604124217951294, 0.4165334170318554, 0.4168722937533455, 0.4181705434529757, 0.41800437540507485, 0.41776684170498535, 0.41889974630466537, 0.4191282728722146, 0.41949196869132804, 0.42062611524247834, 0.4204995446574544, 0.4198431241020618, 0.42109232949724534, 0.4213321193219073, 0.4212136670685901, 0.42281251259506547, 0.42292989078215004, 0.4222739672459136, 0.423456037306955, 0.4233067606301643, 0.42382539512329204, 0.4236415981287056, 0.42506701247338213, 0.4243276788774, 0.4247727455865444, 0.42531294687489635, 0.42589129204091836, 0.42640618013119275, 0.4262185371715043, 0.42596623620037766, 0.4275671290758911, 0.4269319582254186, 0.426546600647333, 0.4273142000508785, 0.4282856990713316, 0.42781423368275207, 0.42772748286425666, 0.42831724631017637, 0.4296147711568093, 0.429488772204019, 0.4294523362305786, 0.4299445499102516, 0.4305852537807945, 0.4300752576063399, 0.43073019210178576, 0.4304980905331442, 0.4323119460134349, 0.43140157396477974, 0.4316818544068298, 0.43234453354246916, 0.43307115226871296, 0.4326216269138742, 0.4334670116665458, 0.4334189558989917, 0.43442256465963425, 0.4341029056284813, 0.43435720997804766, 0.43430536572216916, 0.4354816628541183, 0.43480602857027095, 0.4348821369899786, 0.4355815777767678, 0.43591626246709403, 0.4366019014709696, 0.4369908191961163, 0.4365968006466232, 0.43721137591465264, 0.43715530107184414, 0.43771622337785226, 0.4379706230208981, 0.43852108523411903, 0.43896638028487256, 0.43826320310512856, 0.43941248819716566, 0.43999781556764156, 0.440118593965136, 0.4399641634320856, 0.44052462835582396, 0.44108894401885773, 0.4411386571461856, 0.4409335463767023, 0.44102529230189663, 0.4421243970843196, 0.4425404049691119, 0.44182534138621926, 0.4423798047380733, 0.44314426718799577, 0.44351500518300524, 0.44335494284509436, 0.44317968250519973, 0.44499982031643764, 0.44424275397663904, 0.44508489640509163, 0.44488725856115735, 0.4456894563549657, 0.44556941423721086, 0.4456475930397815, 0.44606578694417814, 0.44678649719456576, 0.44680047628291925, 0.4469890703032872, 0.44688910657580455, 0.44799110045056206, 0.4485200879913853, 0.4480172293229916, 0.4480539333751338, 0.44880161670031354, 0.4499396878945392, 0.44915770913217473, 0.44980915582341935, 0.4506649055695108, 0.45048607990679607, 0.45089000013870445, 0.4510748945316872, 0.4511702422959057, 0.451367439747749, 0.4514635773671336, 0.4520689907803998, 0.4528238588414564, 0.45279023207300206, 0.4524939746867787, 0.45239562680599155, 0.4541697689652581, 0.4545665681723203, 0.45365174564700006, 0.4539391121430576, 0.45576073698073505, 0.454926348397182, 0.45538027347437593, 0.45492437142032816, 0.45603762076687115, 0.45603926098468317, 0.4564095750023587, 0.4561378465667059, 0.4572523628115787, 0.45771532255569636, 0.45750436029752317, 0.4586073684095942, 0.4586408497466266, 0.459084674664568, 0.4596385427767675, 0.4600179932228207, 0.4601686247638114, 0.4613344360328056, 0.46147234383513724, 0.46157778853635834, 0.46185533389700484, 0.46189793789745465, 0.4626666243388023, 0.46301237878752766, 0.4640203894117352, 0.4628576402743113, 0.46415378568468696, 0.464575649994354, 0.4645936995794306, 0.4654020814979044, 0.46562370670138553, 0.4660507185415782, 0.4665642046934284, 0.46667923590871796, 0.4669075969887077, 0.46789487164077853, 0.46775017259897633, 0.46841567313508653, 0.46910754052384146, 0.46898804789202425, 0.470785973860858, 0.4708802454329765, 0.47126604714806547, 0.47177065433419685, 0.47232510909765585, 0.4725580672589071, 0.4734999526823454, 0.47433400920768376, 0.4754713199170227, 0.47465179717753453, 0.4768173115483623, 0.4758785017129898, 0.4769437447096709, 0.4773407106932082, 0.4783604468126452, 0.47896016156017707, 0.4803081901298314, 0.47957528604934013, 0.4814393853598739, 0.48210475791224494, 0.48346575202937636, 0.4845449780293014, 0.48542219225691946, 0.4865240722617575, 0.4879237114364128, 0.48970697415161135, 0.4903248317285501, 0.49177562261561214, 0.49238937530881677, 0.49420477685572967, 0.4945994474193508, 0.4957490724679917, 0.49736192982685296, 0.49898355212277856]}, {\"boxpoints\": false, \"name\": \"3\", \"type\": \"box\", \"uid\": \"0dc7005e-ec8b-419e-a9ee-8939b47d4d7e\", \"x\": [0.3815682473431459, 0.3828398358350465, 0.3843289543681484, 0.3848989237414859, 0.38652870997560357, 0.38756626998251653, 0.38884263542225894, 0.3895834908539808, 0.391227552265853, 0.3918420113241708, 0.392642545594262, 0.3937364804239176, 0.3959804219692497, 0.3968197210228221, 0.39833552214545975, 0.3993564350078862, 0.4002250567187237, 0.40021363900919, 0.400904587764684, 0.4011327153541746, 0.402967481942588, 0.40199249053560226, 0.4041963947138447, 0.4041228341576944, 0.4054165785350168, 0.4043686514053625, 0.4054786075504893, 0.40601658304354776, 0.40747914417280273, 0.4068848171879983, 0.40811825854764194, 0.40835116648493114, 0.40916169321079254, 0.4093525455042807, 0.4111672846185816, 0.4101747740608069, 0.41171704880402504, 0.4123480550631451, 0.4116770289103074, 0.4130447117500438, 0.4135752692531519, 0.4134993191956249, 0.4139662137152474, 0.4147533819248262, 0.4147145386510688, 0.414820639505913, 0.41566954189107425, 0.4152731831440925, 0.41604124217951294, 0.4165334170318554, 0.4168722937533455, 0.4181705434529757, 0.41800437540507485, 0.41776684170498535, 0.41889974630466537, 0.4191282728722146, 0.41949196869132804, 0.42062611524247834, 0.4204995446574544, 0.4198431241020618, 0.42109232949724534, 0.4213321193219073, 0.4212136670685901, 0.42281251259506547, 0.42292989078215004, 0.4222739672459136, 0.423456037306955, 0.4233067606301643, 0.42382539512329204, 0.4236415981287056, 0.42506701247338213, 0.4243276788774, 0.4247727455865444, 0.42531294687489635, 0.42589129204091836, 0.42640618013119275, 0.4262185371715043, 0.42596623620037766, 0.4275671290758911, 0.4269319582254186, 0.426546600647333, 0.4273142000508785, 0.4282856990713316, 0.42781423368275207, 0.42772748286425666, 0.42831724631017637, 0.4296147711568093, 0.429488772204019, 0.4294523362305786, 0.4299445499102516, 0.4305852537807945, 0.4300752576063399, 0.43073019210178576, 0.4304980905331442, 0.4323119460134349, 0.43140157396477974, 0.4316818544068298, 0.43234453354246916, 0.43307115226871296, 0.4326216269138742, 0.4334670116665458, 0.4334189558989917, 0.43442256465963425, 0.4341029056284813, 0.43435720997804766, 0.43430536572216916, 0.4354816628541183, 0.43480602857027095, 0.4348821369899786, 0.4355815777767678, 0.43591626246709403, 0.4366019014709696, 0.4369908191961163, 0.4365968006466232, 0.43721137591465264, 0.43715530107184414, 0.43771622337785226, 0.4379706230208981, 0.43852108523411903, 0.43896638028487256, 0.43826320310512856, 0.43941248819716566, 0.43999781556764156, 0.440118593965136, 0.4399641634320856, 0.44052462835582396, 0.44108894401885773, 0.4411386571461856, 0.4409335463767023, 0.44102529230189663, 0.4421243970843196, 0.4425404049691119, 0.44182534138621926, 0.4423798047380733, 0.44314426718799577, 0.44351500518300524, 0.44335494284509436, 0.44317968250519973, 0.44499982031643764, 0.44424275397663904, 0.44508489640509163, 0.44488725856115735, 0.4456894563549657, 0.44556941423721086, 0.4456475930397815, 0.44606578694417814, 0.44678649719456576, 0.44680047628291925, 0.4469890703032872, 0.44688910657580455, 0.44799110045056206, 0.4485200879913853, 0.4480172293229916, 0.4480539333751338, 0.44880161670031354, 0.4499396878945392, 0.44915770913217473, 0.44980915582341935, 0.4506649055695108, 0.45048607990679607, 0.45089000013870445, 0.4510748945316872, 0.4511702422959057, 0.451367439747749, 0.4514635773671336, 0.4520689907803998, 0.4528238588414564, 0.45279023207300206, 0.4524939746867787, 0.45239562680599155, 0.4541697689652581, 0.4545665681723203, 0.45365174564700006, 0.4539391121430576, 0.45576073698073505, 0.454926348397182, 0.45538027347437593, 0.45492437142032816, 0.45603762076687115, 0.45603926098468317, 0.4564095750023587, 0.4561378465667059, 0.4572523628115787, 0.45771532255569636, 0.45750436029752317, 0.4586073684095942, 0.4586408497466266, 0.459084674664568, 0.4596385427767675, 0.4600179932228207, 0.4601686247638114, 0.4613344360328056, 0.46147234383513724, 0.46157778853635834, 0.46185533389700484, 0.46189793789745465, 0.4626666243388023, 0.46301237878752766, 0.4640203894117352, 0.4628576402743113, 0.46415378568468696, 0.464575649994354, 0.4645936995794306, 0.4654020814979044, 0.46562370670138553, 0.4660507185415782, 0.4665642046934284, 0.46667923590871796, 0.4669075969887077, 0.46789487164077853, 0.46775017259897633, 0.46841567313508653, 0.46910754052384146, 0.46898804789202425, 0.470785973860858, 0.4708802454329765, 0.47126604714806547, 0.47177065433419685, 0.47232510909765585, 0.4725580672589071, 0.4734999526823454, 0.47433400920768376, 0.4754713199170227, 0.47465179717753453, 0.4768173115483623, 0.4758785017129898, 0.4769437447096709, 0.4773407106932082, 0.4783604468126452, 0.47896016156017707, 0.4803081901298314, 0.47957528604934013, 0.4814393853598739, 0.48210475791224494, 0.48346575202937636, 0.4845449780293014, 0.48542219225691946, 0.4865240722617575, 0.4879237114364128, 0.48970697415161135, 0.4903248317285501, 0.49177562261561214, 0.49238937530881677, 0.49420477685572967, 0.4945994474193508, 0.4957490724679917, 0.49736192982685296, 0.49898355212277856]}, {\"boxpoints\": false, \"name\": \"4\", \"type\": \"box\", \"uid\": \"cb27e5b9-3b57-49f2-80e6-91a4c293dc22\", \"x\": [0.3814286142086773, 0.3824985379580554, 0.3835049728986005, 0.3854702376942734, 0.38635422924653035, 0.3872171903974426, 0.3884123000857442, 0.3900839280516775, 0.3901970844682212, 0.3920809417604051, 0.3932282992136514, 0.3942412187738948, 0.395271045668485, 0.396122045542238, 0.3982287776299499, 0.3989462453669503, 0.4003243241043103, 0.40053788733852264, 0.40145713112861503, 0.4019101556479762, 0.40260341195867805, 0.4019345162252932, 0.4037350439208218, 0.40371993796078925, 0.40502922427922305, 0.40467056079969077, 0.4060865398692117, 0.4063786765266161, 0.4071480211324497, 0.4076464109982396, 0.40880931958517497, 0.4082034257597907, 0.4092984860029897, 0.4093467250668218, 0.4112876489497092, 0.41022263525602826, 0.4119818763525615, 0.4114972069645707, 0.41144447529134803, 0.4124809092071462, 0.4126721249617019, 0.41260895606624376, 0.414370429733643, 0.4138497641992454, 0.41479073993779764, 0.4149299268106702, 0.4153647509082891, 0.41538774484429786, 0.4167885273598609, 0.4165319057331992, 0.4168177319028755, 0.41771185565931584, 0.4176945017885105, 0.4175541297152107, 0.41912206741123104, 0.4187639411995033, 0.4191661866738579, 0.41968321354220633, 0.4201725516863846, 0.41974264108239817, 0.42097845033626974, 0.4212141800939409, 0.42077065332680885, 0.42263493635529076, 0.4223573947877764, 0.4227533504866789, 0.4238089634935144, 0.4236020185169807, 0.42312895881911544, 0.42385424400020005, 0.42486328407476054, 0.42509291213303957, 0.42452772051314647, 0.4245156118077834, 0.4265116407385168, 0.4253648750377085, 0.4259190226531472, 0.426190866807751, 0.42748536940423343, 0.4269014035537716, 0.42760897959784244, 0.4271673541787766, 0.42771782461713126, 0.4279885798123698, 0.42865384496200115, 0.4284267722843127, 0.42940091699618005, 0.42937526651950064, 0.42985314073902753, 0.42983480399227114, 0.4303819427212447, 0.43098262263301496, 0.4303531435250956, 0.430286578082909, 0.43152954412983674, 0.43137770527748226, 0.43159732835961867, 0.43146690613468913, 0.43354795608017005, 0.4334319226206718, 0.4334154751388592, 0.4333012101309754, 0.43468300715077407, 0.4338819399313077, 0.43471141563854154, 0.4342778447866842, 0.4353811929298944, 0.43492801393398656, 0.4352310120691987, 0.43509206289819685, 0.4359775526208087, 0.4369702955536087, 0.4362200736815549, 0.4359529123711902, 0.4380818981209202, 0.4371629960350601, 0.43809789620179074, 0.43715803899610467, 0.43905872622209263, 0.43936390920220786, 0.4392070546568417, 0.43867083279543145, 0.43942738486406796, 0.4395606439493083, 0.4400442885218249, 0.439786006421986, 0.4412360947198671, 0.44148884666113863, 0.4409991043432676, 0.44141564945071043, 0.4427644552399013, 0.44240196156470396, 0.44275429309230313, 0.44269861335997257, 0.44329306349046, 0.44330895751043675, 0.4432892064944346, 0.44408674576890056, 0.44420189568498725, 0.44433389144142216, 0.4444681851841243, 0.44483179520526916, 0.4454599489560623, 0.4462806920551366, 0.4455672003731508, 0.4455560088595205, 0.4469939466955116, 0.44742405472182667, 0.44685501080739326, 0.44693167683868973, 0.44838757328368306, 0.44833106789876553, 0.44870628256668066, 0.44853447920668105, 0.4496913014768821, 0.4490713515776086, 0.44912305939813174, 0.4491903990026187, 0.45021130624293393, 0.45013694336968885, 0.4501367132559767, 0.45063293197148657, 0.452134037112607, 0.45169625687502424, 0.4517198061491582, 0.4520907873270367, 0.45238011145629586, 0.45301904439127855, 0.4531059152213476, 0.45335321530024525, 0.4535568350269619, 0.4540852615328682, 0.4537826888176035, 0.4538413315172852, 0.455730831685318, 0.455691599865571, 0.4556663904102406, 0.4553812311717514, 0.4569121464685567, 0.456034147022924, 0.45649263951485325, 0.4563937968777924, 0.45726057687801885, 0.4579751750350577, 0.4571263004277641, 0.45851292350145845, 0.45838506516052263, 0.45851357071527793, 0.4594310679585057, 0.45943901296679135, 0.46013493154179486, 0.4616491730723979, 0.46087901047642044, 0.4615244256431728, 0.461751837703404, 0.46192804728641645, 0.4621149822777729, 0.4629326294941192, 0.4636521072392484, 0.4639153037897186, 0.46418526316344666, 0.46430713683742536, 0.46417143768136737, 0.4659719655053426, 0.4654686554426843, 0.46528438147113016, 0.4668592124794701, 0.4669205017384112, 0.46636911844207046, 0.4686239412002527, 0.4681106159242145, 0.46867328964623284, 0.4690171809668617, 0.46883532359070623, 0.470538974446214, 0.46995665494684696, 0.4718063028897429, 0.47115617802656923, 0.4725573087251687, 0.4722596738840927, 0.47350963643970506, 0.47451392410101073, 0.4746992006674414, 0.4747523875992382, 0.4765606929836776, 0.47675869483478156, 0.47691832703167697, 0.4770922566584664, 0.4781973811996383, 0.47828403076704573, 0.47974824048354064, 0.4793915305375943, 0.48082879809867995, 0.48232230438784557, 0.48305201348272686, 0.4846358032423898, 0.4858349900998198, 0.48713284162316545, 0.48860085085343413, 0.48917964560285404, 0.4903058379644453, 0.491022927912089, 0.49237641665988946, 0.49367809484500724, 0.4953327778846491, 0.49577581235359397, 0.49781984420058606, 0.4986666142489075]}],\n                        {\"title\": {\"text\": \"Coupling Length Trials\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Coupling Length (m)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Trial Index (#)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div style=\"height:120px\"> </div>"};
+
+}());
\ No newline at end of file
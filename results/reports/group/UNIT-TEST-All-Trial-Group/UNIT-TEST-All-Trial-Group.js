@@ -0,0 +1,5 @@
+(function () {
+
+    window.SIM_DATA = {"data": {}, "body": "<div class=\"top-box\">\n  <div class=\"group-info\">\n    <div class=\"title\">UNIT-TEST All Trial Group</div>\n    <div class=\"date\"><span class=\"label\">Run At:</span> 10-18-2026 11:49</div>\n    <div class=\"summary\">A run of unit tests within a group to compare</div>\n  </div>\n\n  <div class=\"trial-listings-wrapper \">\n    <div class=\"trial-listings\">\n      \n        <div class=\"entry\"\n             style=\"background-color: rgba(31, 119, 180, 1.0)\"\n             onclick=\"window.SIM.onTrialClick('UNIT-TEST-Walk')\">\n          <div class=\"entry-inner\">\n            <div class=\"title\">1. UNIT-TEST Walk</div>\n            <div class=\"summary\">A test run to verify that the simulation system works.</div>\n          </div>\n        </div>\n      \n        <div class=\"entry\"\n             style=\"background-color: rgba(255, 127, 14, 1.0)\"\n             onclick=\"window.SIM.onTrialClick('UNIT-TEST-Amble')\">\n          <div class=\"entry-inner\">\n            <div class=\"title\">2. UNIT-TEST Amble</div>\n            <div class=\"summary\">A test run to verify that the simulation system works.</div>\n          </div>\n        </div>\n      \n        <div class=\"entry\"\n             style=\"background-color: rgba(44, 160, 44, 1.0)\"\n             onclick=\"window.SIM.onTrialClick('UNIT-TEST-Data-File-Trot-Test')\">\n          <div class=\"entry-inner\">\n            <div class=\"title\">3. UNIT-TEST Data File Trot Test</div>\n            <div class=\"summary\">A test run to verify that the simulation system works with data loaded from file</div>\n          </div>\n        </div>\n      \n        <div class=\"entry\"\n             style=\"background-color: rgba(214, 39, 40, 1.0)\"\n             onclick=\"window.SIM.onTrialClick('UNIT-TEST-Longer-Pace')\">\n          <div class=\"entry-inner\">\n            <div class=\"title\">4. UNIT-TEST Longer Pace</div>\n            <div class=\"summary\">A test run to verify that the simulation system works.</div>\n          </div>\n        </div>\n      \n        <div class=\"entry\"\n             style=\"background-color: rgba(148, 103, 189, 1.0)\"\n             onclick=\"window.SIM.onTrialClick('UNIT-TEST-Trot')\">\n          <div class=\"entry-inner\">\n            <div class=\"title\">5. UNIT-TEST Trot</div>\n            <div class=\"summary\">A test run to verify that the simulation system works.</div>\n          </div>\n        </div>\n      \n        <div class=\"entry\"\n             style=\"background-color: rgba(140, 86, 75, 1.0)\"\n             onclick=\"window.SIM.onTrialClick('UNIT-TEST-Phase-Validation')\">\n          <div class=\"entry-inner\">\n            <div class=\"title\">6. UNIT-TEST Phase Validation</div>\n            <div class=\"summary\">Validates the phase relationships.</div>\n          </div>\n        </div>\n      \n    </div>\n  </div>\n\n</div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"769f2846-3d3f-49fb-a45d-d308c5bb2b32\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"769f2846-3d3f-49fb-a45d-d308c5bb2b32\")) {\n                    Plotly.newPlot(\n                        '769f2846-3d3f-49fb-a45d-d308c5bb2b32',\n                        [{\"mode\": \"lines\", \"name\": \"1\", \"type\": \"scatter\", \"uid\": \"b6470284-6915-45ca-85b6-28dae091e91e\", \"x\": [0.4700000000000001, 0.4707228915662651, 0.47144578313253016, 0.4721686746987952, 0.47289156626506024, 0.4736144578313253, 0.4743373493975903, 0.47506024096385535, 0.4757831325301204, 0.4765060240963854, 0.47722891566265047, 0.4779518072289155, 0.47867469879518054, 0.4793975903614456, 0.4801204819277106, 0.48084337349397566, 0.4815662650602407, 0.48228915662650573, 0.48301204819277077, 0.4837349397590358, 0.48445783132530085, 0.4851807228915659, 0.4859036144578309, 0.48662650602409596, 0.487349397590361, 0.48807228915662604, 0.4887951807228911, 0.4895180722891561, 0.49024096385542115, 0.4909638554216862, 0.49168674698795123, 0.49240963855421627, 0.4931325301204813, 0.49385542168674634, 0.4945783132530114, 0.4953012048192764, 0.49602409638554146, 0.4967469879518065, 0.49746987951807153, 0.49819277108433657, 0.4989156626506016, 0.49963855421686665, 0.5003614457831317, 0.5010843373493967, 0.5018072289156618, 0.5025301204819268, 0.5032530120481918, 0.5039759036144569, 0.5046987951807219, 0.505421686746987, 0.506144578313252, 0.506867469879517, 0.5075903614457821, 0.5083132530120471, 0.5090361445783121, 0.5097590361445772, 0.5104819277108422, 0.5112048192771073, 0.5119277108433723, 0.5126506024096373, 0.5133734939759024, 0.5140963855421674, 0.5148192771084324, 0.5155421686746975, 0.5162650602409625, 0.5169879518072276, 0.5177108433734926, 0.5184337349397576, 0.5191566265060227, 0.5198795180722877, 0.5206024096385528, 0.5213253012048178, 0.5220481927710828, 0.5227710843373479, 0.5234939759036129, 0.524216867469878, 0.524939759036143, 0.525662650602408, 0.5263855421686731, 0.5271084337349381, 0.5278313253012031, 0.5285542168674682, 0.5292771084337332, 0.5299999999999983, 0.5307228915662633, 0.5314457831325283, 0.5321686746987934, 0.5328915662650584, 0.5336144578313234, 0.5343373493975885, 0.5350602409638535, 0.5357831325301186, 0.5365060240963836, 0.5372289156626486, 0.5379518072289137, 0.5386746987951787, 0.5393975903614437, 0.5401204819277088, 0.5408433734939738, 0.5415662650602389, 0.5422891566265039, 0.5430120481927689, 0.543734939759034, 0.544457831325299, 0.545180722891564, 0.5459036144578291, 0.5466265060240941, 0.5473493975903592, 0.5480722891566242, 0.5487951807228892, 0.5495180722891543, 0.5502409638554193, 0.5509638554216844, 0.5516867469879494, 0.5524096385542144, 0.5531325301204795, 0.5538554216867445, 0.5545783132530095, 0.5553012048192746, 0.5560240963855396, 0.5567469879518047, 0.5574698795180697, 0.5581927710843347, 0.5589156626505998, 0.5596385542168648, 0.5603614457831299, 0.5610843373493949, 0.5618072289156599, 0.562530120481925, 0.56325301204819, 0.563975903614455, 0.5646987951807201, 0.5654216867469851, 0.5661445783132502, 0.5668674698795152, 0.5675903614457802, 0.5683132530120453, 0.5690361445783103, 0.5697590361445753, 0.5704819277108404, 0.5712048192771054, 0.5719277108433705, 0.5726506024096355, 0.5733734939759005, 0.5740963855421656, 0.5748192771084306, 0.5755421686746957, 0.5762650602409607, 0.5769879518072257, 0.5777108433734908, 0.5784337349397558, 0.5791566265060208, 0.5798795180722859, 0.5806024096385509, 0.581325301204816, 0.582048192771081, 0.582771084337346, 0.5834939759036111, 0.5842168674698761, 0.5849397590361411, 0.5856626506024062, 0.5863855421686712, 0.5871084337349363, 0.5878313253012013, 0.5885542168674663, 0.5892771084337314, 0.5899999999999964, 0.5907228915662615, 0.5914457831325265, 0.5921686746987915, 0.5928915662650566, 0.5936144578313216, 0.5943373493975866, 0.5950602409638517, 0.5957831325301167, 0.5965060240963818, 0.5972289156626468, 0.5979518072289118, 0.5986746987951769, 0.5993975903614419, 0.600120481927707, 0.600843373493972, 0.601566265060237, 0.6022891566265021, 0.6030120481927671, 0.6037349397590321, 0.6044578313252972, 0.6051807228915622, 0.6059036144578273, 0.6066265060240923, 0.6073493975903573, 0.6080722891566224, 0.6087951807228874, 0.6095180722891524, 0.6102409638554175, 0.6109638554216825, 0.6116867469879476, 0.6124096385542126, 0.6131325301204776, 0.6138554216867427, 0.6145783132530077, 0.6153012048192728, 0.6160240963855378, 0.6167469879518028, 0.6174698795180679, 0.6181927710843329, 0.6189156626505979, 0.619638554216863, 0.620361445783128, 0.6210843373493931, 0.6218072289156581, 0.6225301204819231, 0.6232530120481882, 0.6239759036144532, 0.6246987951807182, 0.6254216867469833, 0.6261445783132483, 0.6268674698795134, 0.6275903614457784, 0.6283132530120434, 0.6290361445783085, 0.6297590361445735, 0.6304819277108386, 0.6312048192771036, 0.6319277108433686, 0.6326506024096337, 0.6333734939758987, 0.6340963855421637, 0.6348192771084288, 0.6355421686746938, 0.6362650602409589, 0.6369879518072239, 0.6377108433734889, 0.638433734939754, 0.639156626506019, 0.639879518072284, 0.6406024096385491, 0.6413253012048141, 0.6420481927710792, 0.6427710843373442, 0.6434939759036092, 0.6442168674698743, 0.6449397590361393, 0.6456626506024044, 0.6463855421686694, 0.6471084337349344, 0.6478313253011995, 0.6485542168674645, 0.6492771084337295, 0.65], \"y\": [0.14772828039793398, 0.15875680163912606, 0.17050961443094761, 0.1830261890004015, 0.19634752643948902, 0.21051617242161305, 0.22557622727669127, 0.2415733521236886, 0.25855477075404765, 0.2765692669553394, 0.29566717696151174, 0.31590037671446364, 0.3373222636214135, 0.3599877324937775, 0.3839531453561109, 0.4092762948181872, 0.43601636070960487, 0.46423385968446723, 0.4939905875138125, 0.5253495537955929, 0.558374908826238, 0.5931318623941929, 0.6296865942744, 0.6681061562234875, 0.7084583652984934, 0.750811688347312, 0.7952351175466753, 0.8417980368934136, 0.8905700795868957, 0.9416209762749578, 0.9950203941721859, 1.0508377670980662, 1.1091421165231894, 1.1700018637542884, 1.233484633433234, 1.299657048571146, 1.368584517386296, 1.4403310122633235, 1.5149588412012578, 1.592528412168752, 1.6730979908365564, 1.7567234522093294, 1.8434580267311838, 1.933352041491603, 2.02645265721025, 2.1228036017304728, 2.2224449008016047, 2.3254126069792527, 2.4317385275202383, 2.5414499521944403, 2.6545693819791256, 2.7711142596421277, 2.8910967032580603, 3.0145232437363707, 3.1413945674710604, 3.2717052652489964, 3.405443588576677, 3.542591214603673, 3.6831230208345427, 3.8270068708295226, 3.9742034120974545, 4.1246658873819575, 4.278339960533715, 4.4351635581475515, 4.595066728122688, 4.757971516278065, 4.923791862121795, 5.092433514834414, 5.263793970480108, 5.4377624314078545, 5.6142197887460155, 5.793038628829257, 5.9740832643257455, 6.157209790755805, 6.342266169010663, 6.529092334391806, 6.717520332598277, 6.907374482991034, 7.098471569360885, 7.290621058319842, 7.483625345325245, 7.677280028232647, 7.871374208157093, 8.065690817304295, 8.260006973313281, 8.45409435953138, 8.647719630521253, 8.840644841978985, 9.032627904122235, 9.2234230574894, 9.412781369974612, 9.600451253810348, 9.786179001100075, 9.969709336398013, 10.15078598473285, 10.329152253377314, 10.504551625576978, 10.67672836436954, 10.845428124551171, 11.010398570779516, 11.171389999744413, 11.328155964287234, 11.48045389730918, 11.628045733277276, 11.770698525115442, 11.908185054256421, 12.040284431629049, 12.16678268736449, 12.287473347024642, 12.40215799218584, 12.510646803251701, 12.6127590824195, 12.708323754785773, 12.79717984564762, 12.879176932136927, 12.954175567414751, 13.022047675752, 13.082676916929993, 13.135959018509908, 13.181802074642968, 13.220126810222817, 13.250866809317495, 13.273968706959602, 13.289392343519543, 13.297110881036659, 13.297110881036687, 13.289392343519632, 13.273968706959748, 13.250866809317698, 13.220126810223077, 13.181802074643285, 13.135959018510283, 13.082676916930422, 13.02204767575248, 12.95417556741529, 12.879176932137517, 12.79717984564826, 12.708323754786468, 12.612759082420242, 12.510646803252493, 12.40215799218668, 12.287473347025527, 12.166782687365425, 12.040284431630022, 11.908185054257437, 11.770698525116499, 11.628045733278368, 11.48045389731031, 11.328155964288397, 11.171389999745609, 11.010398570780746, 10.845428124552425, 10.676728364370824, 10.504551625578285, 10.329152253378645, 10.150785984734206, 9.969709336399388, 9.786179001101464, 9.600451253811753, 9.412781369976033, 9.223423057490832, 9.032627904123673, 8.840644841980433, 8.64771963052271, 8.454094359532839, 8.260006973314743, 8.065690817305756, 7.871374208158554, 7.677280028234107, 7.483625345326701, 7.2906210583212925, 7.098471569362329, 6.907374482992467, 6.717520332599702, 6.529092334393218, 6.3422661690120625, 6.157209790757192, 5.974083264327116, 5.793038628830612, 5.614219788747352, 5.437762431409175, 5.263793970481409, 5.092433514835693, 4.923791862123053, 4.757971516279302, 4.595066728123901, 4.435163558148743, 4.278339960534885, 4.1246658873831015, 3.9742034120985736, 3.8270068708306186, 3.6831230208356125, 3.5425912146047174, 3.4054435885776964, 3.2717052652499894, 3.141394567472028, 3.014523243737313, 2.8910967032589756, 2.771114259643017, 2.65456938197999, 2.5414499521952787, 2.4317385275210506, 2.3254126069800396, 2.2224449008023672, 2.1228036017312104, 2.0264526572109633, 1.9333520414922916, 1.843458026731848, 1.75672345220997, 1.6730979908371741, 1.592528412169347, 1.5149588412018302, 1.4403310122638748, 1.368584517386825, 1.2996570485716539, 1.2334846334337224, 1.1700018637547567, 1.1091421165236375, 1.0508377670984952, 0.995020394172597, 0.9416209762753504, 0.8905700795872714, 0.8417980368937723, 0.7952351175470179, 0.750811688347638, 0.7084583652988047, 0.6681061562237836, 0.6296865942746822, 0.5931318623944613, 0.558374908826493, 0.5253495537958354, 0.4939905875140422, 0.46423385968468533, 0.4360163607098115, 0.40927629481838296, 0.3839531453562964, 0.35998773249395294, 0.3373222636215793, 0.3159003767146204, 0.2956671769616597, 0.2765692669554789, 0.2585547707541794, 0.24157335212381262, 0.22557622727680807, 0.21051617242172302, 0.19634752643959244, 0.18302618900049872, 0.1705096144310391, 0.1587568016392118, 0.14772828039793398]}, {\"mode\": \"lines\", \"name\": \"2\", \"type\": \"scatter\", \"uid\": \"c3768c61-df52-4899-8f5f-74b711c54dcc\", \"x\": [0.24000000000000002, 0.24072289156626508, 0.24144578313253015, 0.24216867469879522, 0.24289156626506028, 0.24361445783132535, 0.24433734939759041, 0.24506024096385548, 0.24578313253012055, 0.2465060240963856, 0.24722891566265068, 0.24795180722891574, 0.2486746987951808, 0.24939759036144588, 0.2501204819277109, 0.25084337349397595, 0.251566265060241, 0.25228915662650603, 0.25301204819277107, 0.2537349397590361, 0.25445783132530114, 0.2551807228915662, 0.2559036144578312, 0.25662650602409626, 0.2573493975903613, 0.25807228915662633, 0.25879518072289137, 0.2595180722891564, 0.26024096385542145, 0.2609638554216865, 0.2616867469879515, 0.26240963855421656, 0.2631325301204816, 0.26385542168674664, 0.2645783132530117, 0.2653012048192767, 0.26602409638554175, 0.2667469879518068, 0.26746987951807183, 0.26819277108433687, 0.2689156626506019, 0.26963855421686694, 0.270361445783132, 0.271084337349397, 0.27180722891566206, 0.2725301204819271, 0.27325301204819213, 0.2739759036144572, 0.2746987951807222, 0.27542168674698725, 0.2761445783132523, 0.2768674698795173, 0.27759036144578236, 0.2783132530120474, 0.27903614457831244, 0.2797590361445775, 0.2804819277108425, 0.28120481927710755, 0.2819277108433726, 0.28265060240963763, 0.28337349397590267, 0.2840963855421677, 0.28481927710843274, 0.2855421686746978, 0.2862650602409628, 0.28698795180722786, 0.2877108433734929, 0.28843373493975794, 0.289156626506023, 0.289879518072288, 0.29060240963855305, 0.2913253012048181, 0.2920481927710831, 0.29277108433734816, 0.2934939759036132, 0.29421686746987824, 0.2949397590361433, 0.2956626506024083, 0.29638554216867335, 0.2971084337349384, 0.29783132530120343, 0.29855421686746847, 0.2992771084337335, 0.29999999999999855, 0.3007228915662636, 0.3014457831325286, 0.30216867469879366, 0.3028915662650587, 0.30361445783132374, 0.3043373493975888, 0.3050602409638538, 0.30578313253011885, 0.3065060240963839, 0.3072289156626489, 0.30795180722891397, 0.308674698795179, 0.30939759036144404, 0.3101204819277091, 0.3108433734939741, 0.31156626506023916, 0.3122891566265042, 0.31301204819276923, 0.31373493975903427, 0.3144578313252993, 0.31518072289156435, 0.3159036144578294, 0.3166265060240944, 0.31734939759035946, 0.3180722891566245, 0.31879518072288954, 0.3195180722891546, 0.3202409638554196, 0.32096385542168465, 0.3216867469879497, 0.32240963855421473, 0.32313253012047977, 0.3238554216867448, 0.32457831325300984, 0.3253012048192749, 0.3260240963855399, 0.32674698795180496, 0.32746987951807, 0.32819277108433503, 0.32891566265060007, 0.3296385542168651, 0.33036144578313015, 0.3310843373493952, 0.3318072289156602, 0.33253012048192526, 0.3332530120481903, 0.33397590361445534, 0.3346987951807204, 0.3354216867469854, 0.33614457831325045, 0.3368674698795155, 0.33759036144578053, 0.33831325301204557, 0.3390361445783106, 0.33975903614457564, 0.3404819277108407, 0.3412048192771057, 0.34192771084337076, 0.3426506024096358, 0.34337349397590083, 0.3440963855421659, 0.3448192771084309, 0.34554216867469595, 0.346265060240961, 0.346987951807226, 0.34771084337349106, 0.3484337349397561, 0.34915662650602114, 0.3498795180722862, 0.3506024096385512, 0.35132530120481625, 0.3520481927710813, 0.35277108433734633, 0.35349397590361137, 0.3542168674698764, 0.35493975903614144, 0.3556626506024065, 0.3563855421686715, 0.35710843373493656, 0.3578313253012016, 0.35855421686746664, 0.3592771084337317, 0.3599999999999967, 0.36072289156626175, 0.3614457831325268, 0.3621686746987918, 0.36289156626505686, 0.3636144578313219, 0.36433734939758694, 0.365060240963852, 0.365783132530117, 0.36650602409638205, 0.3672289156626471, 0.36795180722891213, 0.36867469879517717, 0.3693975903614422, 0.37012048192770725, 0.3708433734939723, 0.3715662650602373, 0.37228915662650236, 0.3730120481927674, 0.37373493975903244, 0.3744578313252975, 0.3751807228915625, 0.37590361445782755, 0.3766265060240926, 0.3773493975903576, 0.37807228915662267, 0.3787951807228877, 0.37951807228915274, 0.3802409638554178, 0.3809638554216828, 0.38168674698794786, 0.3824096385542129, 0.38313253012047793, 0.38385542168674297, 0.384578313253008, 0.38530120481927305, 0.3860240963855381, 0.3867469879518031, 0.38746987951806816, 0.3881927710843332, 0.38891566265059824, 0.3896385542168633, 0.3903614457831283, 0.39108433734939335, 0.3918072289156584, 0.39253012048192343, 0.39325301204818847, 0.3939759036144535, 0.39469879518071854, 0.3954216867469836, 0.3961445783132486, 0.39686746987951366, 0.3975903614457787, 0.39831325301204373, 0.39903614457830877, 0.3997590361445738, 0.40048192771083885, 0.4012048192771039, 0.4019277108433689, 0.40265060240963396, 0.403373493975899, 0.40409638554216404, 0.4048192771084291, 0.4055421686746941, 0.40626506024095915, 0.4069879518072242, 0.40771084337348923, 0.40843373493975427, 0.4091566265060193, 0.40987951807228434, 0.4106024096385494, 0.4113253012048144, 0.41204819277107946, 0.4127710843373445, 0.41349397590360953, 0.4142168674698746, 0.4149397590361396, 0.41566265060240465, 0.4163855421686697, 0.4171084337349347, 0.41783132530119976, 0.4185542168674648, 0.41927710843372984, 0.42000000000000004], \"y\": [0.1477282803979336, 0.15875680163912606, 0.17050961443094825, 0.1830261890004025, 0.19634752643949058, 0.21051617242161533, 0.2255762272766941, 0.24157335212369224, 0.25855477075405237, 0.27656926695534517, 0.2956671769615186, 0.31590037671447163, 0.33732226362142276, 0.3599877324937885, 0.3839531453561222, 0.4092762948181992, 0.4360163607096175, 0.46423385968448067, 0.4939905875138266, 0.5253495537956078, 0.5583749088262535, 0.5931318623942095, 0.6296865942744175, 0.6681061562235056, 0.7084583652985126, 0.7508116883473316, 0.7952351175466966, 0.8417980368934362, 0.8905700795869187, 0.9416209762749815, 0.9950203941722117, 1.050837767098092, 1.1091421165232163, 1.1700018637543177, 1.233484633433264, 1.2996570485711778, 1.368584517386328, 1.4403310122633572, 1.5149588412012929, 1.5925284121687893, 1.6730979908365946, 1.7567234522093689, 1.8434580267312242, 1.9333520414916447, 2.026452657210294, 2.1228036017305176, 2.2224449008016514, 2.3254126069793006, 2.431738527520288, 2.541449952194491, 2.654569381979179, 2.7711142596421823, 2.8910967032581163, 3.0145232437364275, 3.141394567471119, 3.271705265249057, 3.405443588576739, 3.5425912146037377, 3.6831230208346075, 3.82700687082959, 3.974203412097523, 4.124665887382027, 4.278339960533786, 4.435163558147625, 4.59506672812276, 4.757971516278141, 4.923791862121871, 5.09243351483449, 5.2637939704801875, 5.437762431407936, 5.614219788746098, 5.79303862882934, 5.974083264325828, 6.157209790755892, 6.342266169010748, 6.529092334391891, 6.717520332598366, 6.9073744829911226, 7.098471569360974, 7.290621058319929, 7.483625345325335, 7.677280028232737, 7.8713742081571825, 8.065690817304384, 8.260006973313372, 8.454094359531469, 8.647719630521344, 8.840644841979072, 9.03262790412232, 9.223423057489489, 9.4127813699747, 9.600451253810434, 9.78617900110016, 9.969709336398099, 10.150785984732936, 10.329152253377394, 10.504551625577053, 10.676728364369621, 10.845428124551248, 11.010398570779595, 11.17138999974449, 11.328155964287307, 11.480453897309248, 11.628045733277345, 11.770698525115506, 11.908185054256483, 12.040284431629106, 12.166782687364547, 12.287473347024694, 12.402157992185892, 12.510646803251747, 12.612759082419544, 12.708323754785814, 12.79717984564766, 12.879176932136962, 12.954175567414781, 13.02204767575203, 13.082676916930017, 13.135959018509931, 13.181802074642986, 13.220126810222835, 13.250866809317502, 13.273968706959609, 13.289392343519546, 13.29711088103666, 13.297110881036687, 13.289392343519623, 13.273968706959737, 13.250866809317683, 13.220126810223062, 13.181802074643263, 13.135959018510258, 13.082676916930394, 13.022047675752452, 12.954175567415257, 12.879176932137481, 12.797179845648223, 12.708323754786422, 12.612759082420196, 12.510646803252444, 12.402157992186629, 12.28747334702547, 12.166782687365368, 12.040284431629962, 11.908185054257373, 11.770698525116432, 11.6280457332783, 11.480453897310241, 11.328155964288326, 11.171389999745536, 11.010398570780671, 10.845428124552349, 10.676728364370744, 10.504551625578202, 10.329152253378565, 10.150785984734123, 9.969709336399305, 9.78617900110138, 9.600451253811668, 9.412781369975946, 9.223423057490747, 9.032627904123585, 8.840644841980344, 8.647719630522621, 8.454094359532748, 8.260006973314654, 8.065690817305667, 7.871374208158464, 7.677280028234018, 7.483625345326613, 7.290621058321201, 7.09847156936224, 6.90737448299238, 6.717520332599615, 6.529092334393131, 6.342266169011977, 6.157209790757107, 5.974083264327032, 5.793038628830529, 5.6142197887472705, 5.437762431409092, 5.26379397048133, 5.092433514835613, 4.923791862122975, 4.757971516279226, 4.595066728123826, 4.435163558148672, 4.278339960534814, 4.124665887383031, 3.9742034120985053, 3.827006870830551, 3.683123020835548, 3.5425912146046543, 3.4054435885776333, 3.271705265249928, 3.1413945674719685, 3.014523243737255, 2.89109670325892, 2.7711142596429634, 2.6545693819799365, 2.5414499521952263, 2.4317385275210017, 2.3254126069799916, 2.2224449008023197, 2.122803601731165, 2.02645265721092, 1.933352041492249, 1.8434580267318077, 1.7567234522099309, 1.673097990837136, 1.5925284121693102, 1.5149588412017954, 1.4403310122638409, 1.3685845173867925, 1.2996570485716232, 1.2334846334336929, 1.170001863754728, 1.10914211652361, 1.050837767098469, 0.9950203941725723, 0.9416209762753266, 0.8905700795872481, 0.8417980368937507, 0.795235117546997, 0.7508116883476182, 0.7084583652987854, 0.6681061562237657, 0.6296865942746649, 0.5931318623944445, 0.5583749088264774, 0.5253495537958203, 0.4939905875140282, 0.46423385968467196, 0.43601636070979893, 0.4092762948183712, 0.38395314535628483, 0.3599877324939423, 0.3373222636215693, 0.31590037671461074, 0.2956671769616506, 0.2765692669554704, 0.25855477075417127, 0.24157335212380485, 0.22557622727680085, 0.21051617242171625, 0.196347526439586, 0.1830261890004927, 0.17050961443103352, 0.15875680163920658, 0.14772828039793318]}, {\"mode\": \"lines\", \"name\": \"3\", \"type\": \"scatter\", \"uid\": \"335585c8-7f98-4332-a25f-a8c0c17c52b7\", \"x\": [-0.4999999999999999, -0.4787148594377509, -0.4574297188755019, -0.4361445783132529, -0.41485943775100387, -0.39357429718875486, -0.37228915662650586, -0.35100401606425685, -0.32971887550200785, -0.30843373493975884, -0.28714859437750984, -0.26586345381526083, -0.24457831325301183, -0.22329317269076282, -0.20200803212851381, -0.1807228915662648, -0.1594377510040158, -0.1381526104417668, -0.1168674698795178, -0.09558232931726879, -0.07429718875501978, -0.053012048192770785, -0.031726907630521786, -0.010441767068272788, 0.01084337349397621, 0.03212851405622521, 0.05341365461847421, 0.0746987951807232, 0.0959839357429722, 0.11726907630522121, 0.13855421686747021, 0.15983935742971922, 0.18112449799196823, 0.20240963855421723, 0.22369477911646624, 0.24497991967871524, 0.26626506024096425, 0.28755020080321325, 0.30883534136546226, 0.33012048192771126, 0.35140562248996027, 0.3726907630522093, 0.3939759036144583, 0.4152610441767073, 0.4365461847389563, 0.4578313253012053, 0.4791164658634543, 0.5004016064257033, 0.5216867469879523, 0.5429718875502012, 0.5642570281124502, 0.5855421686746991, 0.606827309236948, 0.628112449799197, 0.649397590361446, 0.6706827309236949, 0.6919678714859439, 0.7132530120481928, 0.7345381526104418, 0.7558232931726907, 0.7771084337349397, 0.7983935742971886, 0.8196787148594376, 0.8409638554216865, 0.8622489959839355, 0.8835341365461844, 0.9048192771084334, 0.9261044176706823, 0.9473895582329313, 0.9686746987951802, 0.9899598393574291, 1.011244979919678, 1.032530120481927, 1.053815261044176, 1.075100401606425, 1.096385542168674, 1.1176706827309228, 1.1389558232931718, 1.1602409638554207, 1.1815261044176697, 1.2028112449799186, 1.2240963855421676, 1.2453815261044165, 1.2666666666666655, 1.2879518072289144, 1.3092369477911634, 1.3305220883534123, 1.3518072289156613, 1.3730923694779102, 1.3943775100401592, 1.4156626506024081, 1.436947791164657, 1.458232931726906, 1.479518072289155, 1.500803212851404, 1.522088353413653, 1.5433734939759018, 1.5646586345381508, 1.5859437751003997, 1.6072289156626487, 1.6285140562248976, 1.6497991967871466, 1.6710843373493955, 1.6923694779116445, 1.7136546184738934, 1.7349397590361424, 1.7562248995983913, 1.7775100401606403, 1.7987951807228892, 1.8200803212851382, 1.8413654618473871, 1.862650602409636, 1.883935742971885, 1.905220883534134, 1.926506024096383, 1.947791164658632, 1.9690763052208808, 1.9903614457831298, 2.0116465863453787, 2.032931726907628, 2.054216867469877, 2.0755020080321263, 2.0967871485943754, 2.1180722891566246, 2.1393574297188738, 2.160642570281123, 2.181927710843372, 2.2032128514056213, 2.2244979919678705, 2.2457831325301196, 2.267068273092369, 2.288353413654618, 2.309638554216867, 2.3309236947791163, 2.3522088353413655, 2.3734939759036147, 2.394779116465864, 2.416064257028113, 2.437349397590362, 2.4586345381526113, 2.4799196787148605, 2.5012048192771097, 2.522489959839359, 2.543775100401608, 2.565060240963857, 2.5863453815261064, 2.6076305220883556, 2.6289156626506047, 2.650200803212854, 2.671485943775103, 2.6927710843373522, 2.7140562248996014, 2.7353413654618506, 2.7566265060240998, 2.777911646586349, 2.799196787148598, 2.8204819277108473, 2.8417670682730964, 2.8630522088353456, 2.884337349397595, 2.905622489959844, 2.926907630522093, 2.9481927710843423, 2.9694779116465915, 2.9907630522088406, 3.01204819277109, 3.033333333333339, 3.054618473895588, 3.0759036144578373, 3.0971887550200865, 3.1184738955823357, 3.139759036144585, 3.161044176706834, 3.182329317269083, 3.2036144578313324, 3.2248995983935815, 3.2461847389558307, 3.26746987951808, 3.288755020080329, 3.310040160642578, 3.3313253012048274, 3.3526104417670766, 3.3738955823293257, 3.395180722891575, 3.416465863453824, 3.4377510040160733, 3.4590361445783224, 3.4803212851405716, 3.5016064257028208, 3.52289156626507, 3.544176706827319, 3.5654618473895683, 3.5867469879518175, 3.6080321285140666, 3.629317269076316, 3.650602409638565, 3.671887550200814, 3.6931726907630633, 3.7144578313253125, 3.7357429718875617, 3.757028112449811, 3.77831325301206, 3.799598393574309, 3.8208835341365583, 3.8421686746988075, 3.8634538152610567, 3.884738955823306, 3.906024096385555, 3.927309236947804, 3.9485943775100534, 3.9698795180723025, 3.9911646586345517, 4.0124497991968004, 4.033734939759049, 4.055020080321298, 4.076305220883547, 4.097590361445795, 4.118875502008044, 4.140160642570293, 4.1614457831325415, 4.18273092369479, 4.204016064257039, 4.225301204819288, 4.2465863453815365, 4.267871485943785, 4.289156626506034, 4.310441767068283, 4.331726907630531, 4.35301204819278, 4.374297188755029, 4.3955823293172775, 4.416867469879526, 4.438152610441775, 4.459437751004024, 4.4807228915662725, 4.502008032128521, 4.52329317269077, 4.544578313253019, 4.565863453815267, 4.587148594377516, 4.608433734939765, 4.6297188755020136, 4.651004016064262, 4.672289156626511, 4.69357429718876, 4.7148594377510085, 4.736144578313257, 4.757429718875506, 4.778714859437755, 4.800000000000001], \"y\": [0.0013509254857183254, 0.0016701709363448351, 0.0020554925002942122, 0.0025185156424963437, 0.003072584260718679, 0.003733007077225622, 0.004517356442969028, 0.005445832973141547, 0.006541710249032035, 0.007831873147676251, 0.009347460455761356, 0.011124616477550062, 0.013205346573551236, 0.015638457355962445, 0.01848054340660966, 0.02179695941569436, 0.025662691456642704, 0.03016301800045558, 0.03539383874203149, 0.041461563041583945, 0.04848251660524039, 0.056581986396417934, 0.06589333414646381, 0.07655811973082183, 0.08872889218752737, 0.10257710560851127, 0.11830913858554752, 0.1361929518249112, 0.1565955389144689, 0.18002608099062326, 0.20717141525893903, 0.23890056551910402, 0.2762075760948235, 0.3200628027053249, 0.3711583459011793, 0.42956605874935294, 0.4943713871427591, 0.5633884892757162, 0.6330804258119436, 0.6987837700196609, 0.755264507318212, 0.7975279607212987, 0.8217058923422349, 0.825791400660879, 0.8100154838505248, 0.7767568659976049, 0.7300150454171757, 0.6746032105898713, 0.6152857570916459, 0.556074069942254, 0.49981697637175765, 0.44811596785429103, 0.4015019362217212, 0.3597583258361638, 0.32227176647849964, 0.28832285846415645, 0.25727553793224844, 0.2286642079926733, 0.2022030013641718, 0.17774982408630532, 0.15525394615716806, 0.13470640343498744, 0.11610265325894499, 0.09941962962522824, 0.0846052343593543, 0.07157676617018335, 0.06022481881854908, 0.05041989744075841, 0.042019855127609036, 0.034876981062645335, 0.02884410614566618, 0.02377945045322982, 0.01955016352039383, 0.01603464453679299, 0.013123805123058758, 0.010721472220529833, 0.00874413589129819, 0.007120235706274985, 0.005789156883451737, 0.004700078923708276, 0.0038107894422404216, 0.0030865473272676134, 0.0024990543145573052, 0.002025573622776657, 0.0016482187185829446, 0.0013534242091223277, 0.0011316034781921674, 0.0009769928849988577, 0.0008876788734898428, 0.0008658009032519217, 0.000917918486337238, 0.001055523743103624, 0.0012956709931517256, 0.0016616815830162888, 0.002183865541299392, 0.002900182497605366, 0.003856744086591746, 0.005108041046154056, 0.0067167634416171965, 0.008753075639306449, 0.011293213188699901, 0.01441729179033085, 0.018206265545747283, 0.02273805217724987, 0.028082972173338452, 0.03429885178560658, 0.04142645321825912, 0.04948636201544003, 0.058479105471912735, 0.06839104440638072, 0.07920925019032717, 0.09094864649942372, 0.10369333288543112, 0.11765021103633896, 0.13320610733381277, 0.1509699754779041, 0.17177199917870806, 0.19658650557424284, 0.22635206612915348, 0.2616851988203215, 0.3025233957690246, 0.3477794818475778, 0.39512428247572673, 0.4410166440958998, 0.48105459901648634, 0.510632461774371, 0.5257817505290329, 0.5239901683374355, 0.5047714477144397, 0.4698166847575534, 0.42267872364458087, 0.3680807996770326, 0.3110459969158614, 0.2560777484322094, 0.20657779569933687, 0.16459221705482488, 0.13087021326943205, 0.10514232879570096, 0.08649404529656089, 0.07372450319518895, 0.06562068702400078, 0.06112323596592983, 0.05939524901540032, 0.05982371863129285, 0.06198642325916226, 0.06561129911919737, 0.07054676209805553, 0.0767542191104074, 0.08432925868361893, 0.09355446721792314, 0.10498175136901312, 0.11953256208025324, 0.13858909676763845, 0.16403040347212958, 0.19815128028819895, 0.2434006186912299, 0.30190221815705315, 0.3747819974846372, 0.46141346031766906, 0.5587815836278777, 0.661212635653109, 0.760683721674532, 0.8477950538168184, 0.9132858649385139, 0.9497690958515502, 0.9532360051612714, 0.9239038042375245, 0.8661549158116741, 0.7875866088365235, 0.6974527381313194, 0.6049365777512846, 0.517694529094483, 0.44097115987549035, 0.3773758773029801, 0.32721579446405485, 0.2891609264295133, 0.26099655143326134, 0.2402728954461022, 0.22475274435616932, 0.2126430495005696, 0.2026529092649777, 0.19394226786659613, 0.18602139446305008, 0.17864367011387525, 0.1717145970033877, 0.16522468485410974, 0.15920484035842783, 0.15369913450724637, 0.14874938494583712, 0.14438706725911024, 0.14062948793558838, 0.13747835157343025, 0.13491968084216382, 0.13292454251112834, 0.13145029788416454, 0.1304422242482355, 0.1298354099838577, 0.1295568478250439, 0.12952765827159718, 0.1296653777543324, 0.12988624790151176, 0.13010744474697236, 0.13024919049028152, 0.13023669556546233, 0.1300018852161194, 0.12948487234571304, 0.12863514689716388, 0.12741246116490998, 0.12578739997639857, 0.12374163430090857, 0.12126786624422273, 0.1183694822626113, 0.11505993948804338, 0.11136191703528313, 0.10730626983746779, 0.10293082675805203, 0.09827907734188958, 0.093398792550895, 0.08834062420266611, 0.0831567256830294, 0.07789943298685048, 0.0726200404600622, 0.0673677000160426, 0.06218846635604321, 0.057124504124983884, 0.05221346626824082, 0.047488046394512366, 0.042975701939117206, 0.03869853956766036, 0.03467334972264718, 0.03091177360578575, 0.027420583265140408, 0.02420205382756595, 0.0212544062455782, 0.01857229913698966, 0.016147349276531057, 0.013968661919698694, 0.012023354254916572, 0.010297057740664093, 0.008774387742661626, 0.00743937160591723, 0.006275828956527202, 0.005267700527328011, 0.004399324060494204, 0.0036556578023633334, 0.003022453736697132, 0.00248638398827809, 0.00203512477314122, 0.0016574028936238263, 0.001343010105973612]}, {\"mode\": \"lines\", \"name\": \"4\", \"type\": \"scatter\", \"uid\": \"7ec8ea1c-d1a4-4ade-82c5-4aff3d947927\", \"x\": [0.52, 0.5207228915662651, 0.5214457831325301, 0.5221686746987951, 0.5228915662650602, 0.5236144578313252, 0.5243373493975902, 0.5250602409638553, 0.5257831325301203, 0.5265060240963854, 0.5272289156626504, 0.5279518072289154, 0.5286746987951805, 0.5293975903614455, 0.5301204819277106, 0.5308433734939756, 0.5315662650602406, 0.5322891566265057, 0.5330120481927707, 0.5337349397590357, 0.5344578313253008, 0.5351807228915658, 0.5359036144578309, 0.5366265060240959, 0.5373493975903609, 0.538072289156626, 0.538795180722891, 0.539518072289156, 0.5402409638554211, 0.5409638554216861, 0.5416867469879512, 0.5424096385542162, 0.5431325301204812, 0.5438554216867463, 0.5445783132530113, 0.5453012048192764, 0.5460240963855414, 0.5467469879518064, 0.5474698795180715, 0.5481927710843365, 0.5489156626506015, 0.5496385542168666, 0.5503614457831316, 0.5510843373493967, 0.5518072289156617, 0.5525301204819267, 0.5532530120481918, 0.5539759036144568, 0.5546987951807218, 0.5554216867469869, 0.5561445783132519, 0.556867469879517, 0.557590361445782, 0.558313253012047, 0.5590361445783121, 0.5597590361445771, 0.5604819277108422, 0.5612048192771072, 0.5619277108433722, 0.5626506024096373, 0.5633734939759023, 0.5640963855421673, 0.5648192771084324, 0.5655421686746974, 0.5662650602409625, 0.5669879518072275, 0.5677108433734925, 0.5684337349397576, 0.5691566265060226, 0.5698795180722876, 0.5706024096385527, 0.5713253012048177, 0.5720481927710828, 0.5727710843373478, 0.5734939759036128, 0.5742168674698779, 0.5749397590361429, 0.575662650602408, 0.576385542168673, 0.577108433734938, 0.5778313253012031, 0.5785542168674681, 0.5792771084337331, 0.5799999999999982, 0.5807228915662632, 0.5814457831325283, 0.5821686746987933, 0.5828915662650583, 0.5836144578313234, 0.5843373493975884, 0.5850602409638535, 0.5857831325301185, 0.5865060240963835, 0.5872289156626486, 0.5879518072289136, 0.5886746987951786, 0.5893975903614437, 0.5901204819277087, 0.5908433734939738, 0.5915662650602388, 0.5922891566265038, 0.5930120481927689, 0.5937349397590339, 0.594457831325299, 0.595180722891564, 0.595903614457829, 0.5966265060240941, 0.5973493975903591, 0.5980722891566241, 0.5987951807228892, 0.5995180722891542, 0.6002409638554193, 0.6009638554216843, 0.6016867469879493, 0.6024096385542144, 0.6031325301204794, 0.6038554216867444, 0.6045783132530095, 0.6053012048192745, 0.6060240963855396, 0.6067469879518046, 0.6074698795180696, 0.6081927710843347, 0.6089156626505997, 0.6096385542168647, 0.6103614457831298, 0.6110843373493948, 0.6118072289156599, 0.6125301204819249, 0.6132530120481899, 0.613975903614455, 0.61469879518072, 0.615421686746985, 0.6161445783132501, 0.6168674698795151, 0.6175903614457802, 0.6183132530120452, 0.6190361445783102, 0.6197590361445753, 0.6204819277108403, 0.6212048192771054, 0.6219277108433704, 0.6226506024096354, 0.6233734939759005, 0.6240963855421655, 0.6248192771084305, 0.6255421686746956, 0.6262650602409606, 0.6269879518072257, 0.6277108433734907, 0.6284337349397557, 0.6291566265060208, 0.6298795180722858, 0.6306024096385509, 0.6313253012048159, 0.6320481927710809, 0.632771084337346, 0.633493975903611, 0.634216867469876, 0.6349397590361411, 0.6356626506024061, 0.6363855421686712, 0.6371084337349362, 0.6378313253012012, 0.6385542168674663, 0.6392771084337313, 0.6399999999999963, 0.6407228915662614, 0.6414457831325264, 0.6421686746987915, 0.6428915662650565, 0.6436144578313215, 0.6443373493975866, 0.6450602409638516, 0.6457831325301167, 0.6465060240963817, 0.6472289156626467, 0.6479518072289118, 0.6486746987951768, 0.6493975903614418, 0.6501204819277069, 0.6508433734939719, 0.651566265060237, 0.652289156626502, 0.653012048192767, 0.6537349397590321, 0.6544578313252971, 0.6551807228915622, 0.6559036144578272, 0.6566265060240922, 0.6573493975903573, 0.6580722891566223, 0.6587951807228873, 0.6595180722891524, 0.6602409638554174, 0.6609638554216825, 0.6616867469879475, 0.6624096385542125, 0.6631325301204776, 0.6638554216867426, 0.6645783132530076, 0.6653012048192727, 0.6660240963855377, 0.6667469879518028, 0.6674698795180678, 0.6681927710843328, 0.6689156626505979, 0.6696385542168629, 0.670361445783128, 0.671084337349393, 0.671807228915658, 0.6725301204819231, 0.6732530120481881, 0.6739759036144531, 0.6746987951807182, 0.6754216867469832, 0.6761445783132483, 0.6768674698795133, 0.6775903614457783, 0.6783132530120434, 0.6790361445783084, 0.6797590361445734, 0.6804819277108385, 0.6812048192771035, 0.6819277108433686, 0.6826506024096336, 0.6833734939758986, 0.6840963855421637, 0.6848192771084287, 0.6855421686746938, 0.6862650602409588, 0.6869879518072238, 0.6877108433734889, 0.6884337349397539, 0.6891566265060189, 0.689879518072284, 0.690602409638549, 0.6913253012048141, 0.6920481927710791, 0.6927710843373441, 0.6934939759036092, 0.6942168674698742, 0.6949397590361392, 0.6956626506024043, 0.6963855421686693, 0.6971084337349344, 0.6978313253011994, 0.6985542168674644, 0.6992771084337295, 0.7], \"y\": [0.1232400981741692, 0.13245395633733376, 0.1422752695937902, 0.15273752845458977, 0.1638755839989456, 0.17572567009008055, 0.1883254237347732, 0.20171390343569576, 0.21593160538570574, 0.2310204773537818, 0.24702393011328283, 0.2639868462645824, 0.28195558630582523, 0.3009779918074987, 0.32110338554860735, 0.34238256847437604, 0.36486781333747453, 0.38861285488659725, 0.41367287646773726, 0.4401044929044506, 0.4679657295237177, 0.49731599719342445, 0.5282160632358988, 0.5607280180791179, 0.5949152375029954, 0.6308423403323974, 0.6685751414210466, 0.7081805997611338, 0.7497267615421168, 0.793282697968788, 0.8389184376331426, 0.886704893216859, 0.9367137822813644, 0.9890175418805396, 1.0436892367072652, 1.1008024604594278, 1.1604312300839432, 1.2226498725291692, 1.287532903607156, 1.355154898538057, 1.4255903537202645, 1.4989135392420743, 1.5751983416247353, 1.6545180962633725, 1.7369454090124343, 1.8225519663469765, 1.9114083335212724, 2.003583740143085, 2.0991458525865436, 2.198160532680093, 2.300691582129669, 2.4068004721721867, 2.5165460580017815, 2.6299842775721367, 2.747167834453586, 2.868145864514492, 2.9929635863034165, 3.121661935132374, 3.254277181002593, 3.390840530672712, 3.531377714345421, 3.675908557641755, 3.824446539742134, 3.9769983387989387, 4.1335633659655695, 4.294133289640375, 4.458691551788264, 4.627212878476335, 4.79966278703984, 4.975997092578159, 5.156161416764231, 5.340090702231373, 5.527708736074779, 5.718927686267364, 5.913647655036464, 6.111756253475125, 6.313128201864502, 6.517624960358009, 6.725094394818407, 6.935370482702108, 7.148273063945666, 7.36360764182453, 7.581165238719144, 7.800722311635865, 8.022040732186596, 8.244867835529643, 8.468936542513111, 8.693965558940768, 8.919659655497865, 9.14571003143218, 9.371794764584516, 9.59757934980553, 9.822717327185352, 10.046851000862768, 10.26961224847697, 10.49062342058245, 10.709498328573583, 10.925843318866308, 11.139258430268924, 11.349338630650003, 11.555675128188662, 11.757856751679569, 11.955471393572232, 12.148107508660956, 12.33535566061814, 12.516810107888938, 12.6920704198492, 12.86074311357975, 13.022443301137207, 13.176796336811746, 13.323439453563017, 13.462023377621966, 13.592213910144075, 13.713693464801585, 13.826162550311386, 13.929341187112415, 14.022970247731394, 14.10681271080685, 14.180654819275993, 14.244307133862263, 14.297605473728224, 14.340411736971786, 14.372614594535264, 14.3941300520581, 14.404901875224233, 14.404901875224274, 14.394130052058223, 14.372614594535468, 14.340411736972067, 14.297605473728582, 14.2443071338627, 14.180654819276512, 14.106812710807445, 14.02297024773206, 13.929341187113158, 13.826162550312196, 13.713693464802462, 13.592213910145022, 13.462023377622977, 13.323439453564092, 13.176796336812878, 13.022443301138393, 12.860743113580995, 12.692070419850493, 12.516810107890285, 12.335355660619529, 12.148107508662386, 11.955471393573703, 11.757856751681075, 11.555675128190197, 11.349338630651571, 11.139258430270518, 10.925843318867928, 10.70949832857522, 10.490623420584106, 10.269612248478643, 10.046851000864452, 9.822717327187041, 9.597579349807228, 9.371794764586218, 9.145710031433882, 8.919659655499563, 8.693965558942464, 8.468936542514802, 8.244867835531325, 8.022040732188268, 7.800722311637522, 7.581165238720789, 7.36360764182616, 7.148273063947279, 6.935370482703703, 6.725094394819981, 6.517624960359559, 6.3131282018660295, 6.111756253476628, 5.913647655037944, 5.718927686268817, 5.527708736076206, 5.340090702232771, 5.156161416765602, 4.975997092579501, 4.799662787041153, 4.627212878477618, 4.458691551789517, 4.294133289641599, 4.133563365966762, 3.9769983388001013, 3.824446539743269, 3.6759085576428574, 3.5313777143464935, 3.3908405306737546, 3.2542771810036055, 3.1216619351333574, 2.9929635863043704, 2.868145864515417, 2.7471678344544816, 2.629984277573005, 2.516546058002621, 2.4068004721729985, 2.300691582130454, 2.198160532680851, 2.099145852587275, 2.003583740143791, 1.9114083335219536, 1.8225519663476335, 1.7369454090130665, 1.6545180962639812, 1.5751983416253206, 1.498913539242637, 1.4255903537208052, 1.3551548985385764, 1.2875329036076544, 1.222649872529648, 1.160431230084401, 1.1008024604598665, 1.0436892367076862, 0.9890175418809424, 0.9367137822817492, 0.8867048932172267, 0.838918437633494, 0.7932826979691233, 0.7497267615424371, 0.7081805997614391, 0.6685751414213379, 0.6308423403326742, 0.5949152375032591, 0.5607280180793686, 0.5282160632361375, 0.49731599719365116, 0.467965729523933, 0.440104492904655, 0.4136728764679307, 0.3886128548867809, 0.36486781333764823, 0.3423825684745407, 0.32110338554876316, 0.30097799180764595, 0.28195558630596435, 0.26398684626471386, 0.24702393011340684, 0.23102047735389866, 0.21593160538581602, 0.20171390343579956, 0.18832542373487093, 0.17572567009017256, 0.1638755839990321, 0.15273752845467103, 0.14227526959386663, 0.1324539563374054, 0.1232400981741692]}, {\"mode\": \"lines\", \"name\": \"5\", \"type\": \"scatter\", \"uid\": \"e05f86c5-7e7b-4f48-be39-0066a67fd5fa\", \"x\": [0.35, 0.350722891566265, 0.35144578313253005, 0.3521686746987951, 0.35289156626506013, 0.35361445783132517, 0.3543373493975902, 0.35506024096385524, 0.3557831325301203, 0.3565060240963853, 0.35722891566265036, 0.3579518072289154, 0.35867469879518044, 0.3593975903614455, 0.3601204819277105, 0.36084337349397555, 0.3615662650602406, 0.3622891566265056, 0.36301204819277066, 0.3637349397590357, 0.36445783132530074, 0.3651807228915658, 0.3659036144578308, 0.36662650602409586, 0.3673493975903609, 0.36807228915662593, 0.36879518072289097, 0.369518072289156, 0.37024096385542105, 0.3709638554216861, 0.3716867469879511, 0.37240963855421616, 0.3731325301204812, 0.37385542168674624, 0.3745783132530113, 0.3753012048192763, 0.37602409638554135, 0.3767469879518064, 0.3774698795180714, 0.37819277108433647, 0.3789156626506015, 0.37963855421686654, 0.3803614457831316, 0.3810843373493966, 0.38180722891566166, 0.3825301204819267, 0.38325301204819173, 0.38397590361445677, 0.3846987951807218, 0.38542168674698685, 0.3861445783132519, 0.3868674698795169, 0.38759036144578196, 0.388313253012047, 0.38903614457831204, 0.3897590361445771, 0.3904819277108421, 0.39120481927710715, 0.3919277108433722, 0.39265060240963723, 0.39337349397590227, 0.3940963855421673, 0.39481927710843234, 0.3955421686746974, 0.3962650602409624, 0.39698795180722746, 0.3977108433734925, 0.39843373493975753, 0.39915662650602257, 0.3998795180722876, 0.40060240963855265, 0.4013253012048177, 0.4020481927710827, 0.40277108433734776, 0.4034939759036128, 0.40421686746987784, 0.4049397590361429, 0.4056626506024079, 0.40638554216867295, 0.407108433734938, 0.40783132530120303, 0.40855421686746807, 0.4092771084337331, 0.40999999999999814, 0.4107228915662632, 0.4114457831325282, 0.41216867469879326, 0.4128915662650583, 0.41361445783132333, 0.4143373493975884, 0.4150602409638534, 0.41578313253011845, 0.4165060240963835, 0.4172289156626485, 0.41795180722891356, 0.4186746987951786, 0.41939759036144364, 0.4201204819277087, 0.4208433734939737, 0.42156626506023875, 0.4222891566265038, 0.42301204819276883, 0.42373493975903387, 0.4244578313252989, 0.42518072289156394, 0.425903614457829, 0.426626506024094, 0.42734939759035906, 0.4280722891566241, 0.42879518072288914, 0.4295180722891542, 0.4302409638554192, 0.43096385542168425, 0.4316867469879493, 0.4324096385542143, 0.43313253012047936, 0.4338554216867444, 0.43457831325300944, 0.4353012048192745, 0.4360240963855395, 0.43674698795180456, 0.4374698795180696, 0.43819277108433463, 0.43891566265059967, 0.4396385542168647, 0.44036144578312975, 0.4410843373493948, 0.4418072289156598, 0.44253012048192486, 0.4432530120481899, 0.44397590361445494, 0.44469879518072, 0.445421686746985, 0.44614457831325005, 0.4468674698795151, 0.4475903614457801, 0.44831325301204517, 0.4490361445783102, 0.44975903614457524, 0.4504819277108403, 0.4512048192771053, 0.45192771084337036, 0.4526506024096354, 0.45337349397590043, 0.45409638554216547, 0.4548192771084305, 0.45554216867469555, 0.4562650602409606, 0.4569879518072256, 0.45771084337349066, 0.4584337349397557, 0.45915662650602074, 0.4598795180722858, 0.4606024096385508, 0.46132530120481585, 0.4620481927710809, 0.46277108433734593, 0.46349397590361097, 0.464216867469876, 0.46493975903614104, 0.4656626506024061, 0.4663855421686711, 0.46710843373493616, 0.4678313253012012, 0.46855421686746623, 0.46927710843373127, 0.4699999999999963, 0.47072289156626135, 0.4714457831325264, 0.4721686746987914, 0.47289156626505646, 0.4736144578313215, 0.47433734939758654, 0.4750602409638516, 0.4757831325301166, 0.47650602409638165, 0.4772289156626467, 0.47795180722891173, 0.47867469879517677, 0.4793975903614418, 0.48012048192770684, 0.4808433734939719, 0.4815662650602369, 0.48228915662650196, 0.483012048192767, 0.48373493975903203, 0.4844578313252971, 0.4851807228915621, 0.48590361445782715, 0.4866265060240922, 0.4873493975903572, 0.48807228915662226, 0.4887951807228873, 0.48951807228915234, 0.4902409638554174, 0.4909638554216824, 0.49168674698794745, 0.4924096385542125, 0.49313253012047753, 0.49385542168674257, 0.4945783132530076, 0.49530120481927264, 0.4960240963855377, 0.4967469879518027, 0.49746987951806776, 0.4981927710843328, 0.49891566265059784, 0.4996385542168629, 0.5003614457831279, 0.501084337349393, 0.501807228915658, 0.502530120481923, 0.5032530120481881, 0.5039759036144531, 0.5046987951807181, 0.5054216867469832, 0.5061445783132482, 0.5068674698795133, 0.5075903614457783, 0.5083132530120433, 0.5090361445783084, 0.5097590361445734, 0.5104819277108384, 0.5112048192771035, 0.5119277108433685, 0.5126506024096336, 0.5133734939758986, 0.5140963855421636, 0.5148192771084287, 0.5155421686746937, 0.5162650602409588, 0.5169879518072238, 0.5177108433734888, 0.5184337349397539, 0.5191566265060189, 0.5198795180722839, 0.520602409638549, 0.521325301204814, 0.5220481927710791, 0.5227710843373441, 0.5234939759036091, 0.5242168674698742, 0.5249397590361392, 0.5256626506024042, 0.5263855421686693, 0.5271084337349343, 0.5278313253011994, 0.5285542168674644, 0.5292771084337294, 0.53], \"y\": [0.12673840992042062, 0.1362115056661605, 0.14630874742766906, 0.15706447996113346, 0.16851443291902232, 0.18069574185172713, 0.19364696709790333, 0.20740811039112222, 0.22202062900975342, 0.23752744729686018, 0.2539729653773142, 0.27140306490027843, 0.2898651116366221, 0.30940795476268007, 0.33008192266396325, 0.3519388150949188, 0.37503189153349104, 0.3994158555720054, 0.425146835188603, 0.45228235874604, 0.4808813265669329, 0.5110039779363891, 0.5427118533842537, 0.5760677520997391, 0.6111356843309207, 0.6479808186202394, 0.686669423724705, 0.7272688050657425, 0.7698472355485105, 0.8144738805839514, 0.8612187171387163, 0.9101524466284562, 0.9613464014587636, 1.014872445005357, 1.0708028648109713, 1.1292102587610977, 1.1901674139842746, 1.2537471782054723, 1.3200223232634514, 1.3890654004852936, 1.4609485875940145, 1.535743526808819, 1.6135211537827934, 1.6943515170102559, 1.7783035873264017, 1.865445057116041, 1.9558421288470267, 2.0495592925482446, 2.1466590918627775, 2.2472018783249923, 2.3512455535367267, 2.4588452989535985, 2.5700532930383844, 2.6849184155955905, 2.803485939170358, 2.925797207476555, 3.051889300913872, 3.1817946893425497, 3.3155408724071473, 3.453150007837959, 3.594638528309987, 3.740016747604629, 3.889288456998064, 4.042450512991587, 4.199492417702288, 4.360395893445747, 4.525134453264469, 4.693672969384619, 4.865967241817009, 5.041963569553816, 5.22159832704733, 5.404797548888198, 5.591476525824902, 5.781539415479983, 5.974878871318479, 6.171375693606062, 6.370898506255026, 6.573303463591281, 6.778433991181602, 6.986120564933198, 7.196180532714161, 7.408417982739958, 7.622623662924549, 7.838574955302765, 8.056035909490394, 8.274757338958446, 8.494476983657114, 8.714919742231926, 8.935797976729898, 9.15681189229748, 9.377649993925942, 9.597989621806201, 9.817497566316009, 10.035830763082075, 10.252637067942079, 10.467556110981702, 10.680220228145476, 10.890255468223897, 11.09728267230923, 11.30091862209706, 11.500777252696611, 11.696470924909221, 11.887611751248926, 12.073812969320416, 12.254690355546314, 12.429863671655708, 12.598958135817735, 12.761605909834701, 12.917447593406825, 13.06613371615089, 13.207326217804248, 13.340699906878744, 13.46594388795002, 13.58276294777958, 13.690878890572167, 13.790031812869886, 13.879981308877188, 13.960507597395862, 14.031412562023691, 14.09252069683093, 14.143679950370302, 14.184762461592596, 14.215665182024456, 14.236310379409732, 14.246646018911722, 14.246646018911761, 14.236310379409854, 14.215665182024651, 14.184762461592872, 14.14367995037066, 14.092520696831361, 14.031412562024196, 13.960507597396445, 13.879981308877843, 13.79003181287061, 13.690878890572963, 13.582762947780447, 13.465943887950951, 13.340699906879738, 13.207326217805303, 13.066133716152004, 12.917447593407998, 12.761605909835923, 12.598958135819013, 12.429863671657031, 12.25469035554768, 12.073812969321827, 11.887611751250375, 11.696470924910708, 11.50077725269813, 11.30091862209861, 11.097282672310808, 10.890255468225496, 10.680220228147101, 10.467556110983342, 10.252637067943738, 10.035830763083748, 9.817497566317693, 9.597989621807892, 9.377649993927635, 9.156811892299178, 8.935797976731596, 8.71491974223362, 8.494476983658805, 8.27475733896013, 8.056035909492067, 7.83857495530443, 7.622623662926202, 7.4084179827415975, 7.196180532715782, 6.986120564934801, 6.7784339911831895, 6.573303463592846, 6.37089850625657, 6.171375693607585, 5.974878871319975, 5.781539415481457, 5.591476525826349, 5.404797548889619, 5.2215983270487225, 5.041963569555181, 4.865967241818346, 4.6936729693859265, 4.52513445326575, 4.360395893446998, 4.1994924177035085, 4.042450512992778, 3.889288456999225, 3.7400167476057606, 3.594638528311087, 3.453150007839031, 3.315540872408189, 3.181794689343562, 3.051889300914856, 2.9257972074775083, 2.8034859391712836, 2.6849184155964863, 2.5700532930392517, 2.458845298954439, 2.351245553537539, 2.247201878325777, 2.1466590918635364, 2.049559292548977, 1.9558421288477337, 1.865445057116722, 1.778303587327059, 1.6943515170108887, 1.6135211537834024, 1.5357435268094046, 1.4609485875945776, 1.389065400485835, 1.3200223232639707, 1.2537471782059704, 1.1901674139847527, 1.1292102587615556, 1.07080286481141, 1.0148724450057771, 0.9613464014591656, 0.9101524466288405, 0.861218717139084, 0.8144738805843021, 0.7698472355488452, 0.7272688050660617, 0.6866694237250096, 0.647980818620529, 0.6111356843311967, 0.576067752100002, 0.5427118533845033, 0.5110039779366263, 0.4808813265671583, 0.452282358746254, 0.42514683518880586, 0.3994158555721978, 0.37503189153367344, 0.35193881509509123, 0.33008192266412656, 0.3094079547628343, 0.2898651116367681, 0.27140306490041605, 0.25397296537744424, 0.23752744729698277, 0.222020629009869, 0.2074081103912311, 0.19364696709800566, 0.18069574185182358, 0.16851443291911303, 0.15706447996121867, 0.14630874742774908, 0.1362115056662356, 0.12673840992042062]}, {\"mode\": \"lines\", \"name\": \"6\", \"type\": \"scatter\", \"uid\": \"92f74c7c-09c0-4a86-af2c-63192101521c\", \"x\": [-0.03, -0.02903614457831325, -0.028072289156626504, -0.027108433734939756, -0.02614457831325301, -0.02518072289156626, -0.024216867469879513, -0.023253012048192766, -0.022289156626506018, -0.02132530120481927, -0.020361445783132523, -0.019397590361445775, -0.018433734939759028, -0.01746987951807228, -0.016506024096385533, -0.015542168674698785, -0.014578313253012037, -0.01361445783132529, -0.012650602409638542, -0.011686746987951795, -0.010722891566265047, -0.0097590361445783, -0.008795180722891552, -0.007831325301204804, -0.0068674698795180575, -0.005903614457831311, -0.004939759036144564, -0.003975903614457817, -0.0030120481927710706, -0.002048192771084324, -0.001084337349397577, -0.00012048192771083, 0.0008433734939759169, 0.0018072289156626639, 0.0027710843373494106, 0.0037349397590361573, 0.004698795180722904, 0.005662650602409651, 0.0066265060240963975, 0.007590361445783144, 0.008554216867469891, 0.009518072289156639, 0.010481927710843386, 0.011445783132530134, 0.012409638554216881, 0.013373493975903629, 0.014337349397590377, 0.015301204819277124, 0.01626506024096387, 0.01722891566265062, 0.018192771084337367, 0.019156626506024114, 0.020120481927710862, 0.02108433734939761, 0.022048192771084357, 0.023012048192771105, 0.023975903614457852, 0.0249397590361446, 0.025903614457831348, 0.026867469879518095, 0.027831325301204843, 0.02879518072289159, 0.029759036144578338, 0.030722891566265086, 0.03168674698795183, 0.03265060240963858, 0.03361445783132533, 0.034578313253012076, 0.035542168674698824, 0.03650602409638557, 0.03746987951807232, 0.038433734939759066, 0.039397590361445814, 0.04036144578313256, 0.04132530120481931, 0.04228915662650606, 0.043253012048192804, 0.04421686746987955, 0.0451807228915663, 0.04614457831325305, 0.047108433734939795, 0.04807228915662654, 0.04903614457831329, 0.05000000000000004, 0.050963855421686785, 0.05192771084337353, 0.05289156626506028, 0.05385542168674703, 0.054819277108433775, 0.05578313253012052, 0.05674698795180727, 0.05771084337349402, 0.058674698795180766, 0.05963855421686751, 0.06060240963855426, 0.06156626506024101, 0.06253012048192776, 0.0634939759036145, 0.06445783132530124, 0.06542168674698798, 0.06638554216867472, 0.06734939759036146, 0.0683132530120482, 0.06927710843373494, 0.07024096385542168, 0.07120481927710842, 0.07216867469879516, 0.0731325301204819, 0.07409638554216864, 0.07506024096385538, 0.07602409638554213, 0.07698795180722887, 0.0779518072289156, 0.07891566265060235, 0.07987951807228909, 0.08084337349397583, 0.08180722891566257, 0.08277108433734931, 0.08373493975903605, 0.08469879518072279, 0.08566265060240953, 0.08662650602409627, 0.08759036144578301, 0.08855421686746975, 0.0895180722891565, 0.09048192771084324, 0.09144578313252998, 0.09240963855421672, 0.09337349397590346, 0.0943373493975902, 0.09530120481927694, 0.09626506024096368, 0.09722891566265042, 0.09819277108433716, 0.0991566265060239, 0.10012048192771064, 0.10108433734939738, 0.10204819277108412, 0.10301204819277086, 0.1039759036144576, 0.10493975903614434, 0.10590361445783109, 0.10686746987951783, 0.10783132530120457, 0.10879518072289131, 0.10975903614457805, 0.11072289156626479, 0.11168674698795153, 0.11265060240963827, 0.11361445783132501, 0.11457831325301175, 0.11554216867469849, 0.11650602409638523, 0.11746987951807197, 0.11843373493975871, 0.11939759036144545, 0.1203614457831322, 0.12132530120481894, 0.12228915662650568, 0.12325301204819242, 0.12421686746987916, 0.1251807228915659, 0.12614457831325265, 0.1271084337349394, 0.12807228915662616, 0.12903614457831292, 0.12999999999999967, 0.13096385542168643, 0.13192771084337318, 0.13289156626505993, 0.1338554216867467, 0.13481927710843344, 0.1357831325301202, 0.13674698795180695, 0.1377108433734937, 0.13867469879518046, 0.13963855421686722, 0.14060240963855397, 0.14156626506024073, 0.14253012048192748, 0.14349397590361423, 0.144457831325301, 0.14542168674698774, 0.1463855421686745, 0.14734939759036125, 0.148313253012048, 0.14927710843373476, 0.15024096385542152, 0.15120481927710827, 0.15216867469879503, 0.15313253012048178, 0.15409638554216853, 0.1550602409638553, 0.15602409638554204, 0.1569879518072288, 0.15795180722891555, 0.1589156626506023, 0.15987951807228906, 0.16084337349397582, 0.16180722891566257, 0.16277108433734933, 0.16373493975903608, 0.16469879518072283, 0.1656626506024096, 0.16662650602409634, 0.1675903614457831, 0.16855421686746985, 0.1695180722891566, 0.17048192771084336, 0.17144578313253012, 0.17240963855421687, 0.17337349397590363, 0.17433734939759038, 0.17530120481927713, 0.1762650602409639, 0.17722891566265064, 0.1781927710843374, 0.17915662650602415, 0.1801204819277109, 0.18108433734939766, 0.18204819277108442, 0.18301204819277117, 0.18397590361445793, 0.18493975903614468, 0.18590361445783143, 0.1868674698795182, 0.18783132530120494, 0.1887951807228917, 0.18975903614457845, 0.1907228915662652, 0.19168674698795196, 0.19265060240963872, 0.19361445783132547, 0.19457831325301223, 0.19554216867469898, 0.19650602409638573, 0.1974698795180725, 0.19843373493975924, 0.199397590361446, 0.20036144578313275, 0.2013253012048195, 0.20228915662650626, 0.20325301204819302, 0.20421686746987977, 0.20518072289156652, 0.20614457831325328, 0.20710843373494003, 0.2080722891566268, 0.20903614457831354, 0.21], \"y\": [0.08421240960521167, 0.09056824117972989, 0.09735079552499983, 0.10458451058445123, 0.11229491564187773, 0.1205086590807954, 0.12925353539777637, 0.13855851133277095, 0.14845375097053598, 0.15897063965797273, 0.17014180657247277, 0.18200114576623463, 0.19458383550097666, 0.2079263556765191, 0.22206650314536025, 0.2370434046936461, 0.2528975274568474, 0.2696706865260622, 0.2874060494881934, 0.306148137630361, 0.32594282352587917, 0.3468373247060398, 0.3688801931088881, 0.3921212999832673, 0.41661181591378604, 0.44240418562017175, 0.4695520971728619, 0.4981104452558592, 0.5281352880980374, 0.5596837976854212, 0.592814202859764, 0.6275857249032203, 0.664058505205364, 0.7022935246074871, 0.7423525140203843, 0.7842978559159348, 0.8281924763000933, 0.8740997267857322, 0.922083256398414, 0.9722068727670369, 1.0245343923745658, 1.0791294795722528, 1.1360554740939193, 1.19537520684552, 1.2571508037894312, 1.3214434777929964, 1.388313308366964, 1.4578190092817436, 1.5300176841179307, 1.6049645698823483, 1.682712768901899, 1.7633129692947116, 1.8468131544112238, 1.9332583017366645, 2.0226900718506364, 2.115146488148628, 2.2106616081438513, 2.3092651872851615, 2.41098233634722, 2.5158331735718535, 2.6238324728636573, 2.734989309467437, 2.8493067046789373, 2.966781271262416, 3.08740286136759, 3.2111542188531628, 3.3380106380331758, 3.4679396309642656, 3.6009006054853736, 3.736844556304812, 3.875713771501676, 4.017441556867722, 4.161951980560737, 4.309159640569725, 4.458969457504593, 4.611276495217247, 4.765965811736018, 4.92291234295014, 5.081980821414692, 5.243025732558494, 5.4058913104671, 5.57041157528039, 5.736410414088742, 5.903701707033892, 6.072089500120461, 6.241368226022498, 6.411322973926936, 6.581729809193849, 6.752356143333017, 6.922961154499214, 7.0932962583966646, 7.2631056291582095, 7.432126769429351, 7.600091128543752, 7.766724767327778, 7.931749067720043, 8.094881485040583, 8.255836340396378, 8.414325650368513, 8.570059990794583, 8.72274939114125, 8.872104255659165, 9.017836307229128, 9.159659549547268, 9.297291243061132, 9.430452889860664, 9.558871222550561, 9.682279191986007, 9.800416948643917, 9.91303281232884, 10.0198842248776, 10.120738680530982, 10.215374628684884, 10.303582343817776, 10.385164757516069, 10.459938247683564, 10.527733380224896, 10.588395598734424, 10.641785857999928, 10.68778119744271, 10.726275250959997, 10.757178690009185, 10.780419597173694, 10.795943767873508, 10.803714938326596, 10.803714938326596, 10.79594376787351, 10.7804195971737, 10.75717869000919, 10.726275250960008, 10.687781197442723, 10.641785857999942, 10.58839559873444, 10.527733380224912, 10.459938247683583, 10.38516475751609, 10.3035823438178, 10.21537462868491, 10.120738680531009, 10.019884224877629, 9.913032812328872, 9.800416948643951, 9.68227919198604, 9.558871222550595, 9.4304528898607, 9.29729124306117, 9.159659549547303, 9.017836307229167, 8.872104255659206, 8.722749391141292, 8.570059990794626, 8.414325650368555, 8.255836340396423, 8.094881485040627, 7.93174906772009, 7.766724767327826, 7.600091128543801, 7.432126769429402, 7.263105629158262, 7.09329625839672, 6.922961154499271, 6.752356143333074, 6.581729809193905, 6.411322973926991, 6.241368226022551, 6.072089500120512, 5.9037017070339415, 5.73641041408879, 5.570411575280436, 5.405891310467144, 5.243025732558537, 5.081980821414733, 4.922912342950179, 4.765965811736056, 4.611276495217284, 4.458969457504628, 4.309159640569758, 4.161951980560769, 4.017441556867753, 3.8757137715017045, 3.7368445563048387, 3.6009006054853994, 3.46793963096429, 3.338010638033197, 3.2111542188531828, 3.0874028613676097, 2.966781271262434, 2.8493067046789533, 2.7349893094674527, 2.623832472863672, 2.515833173571865, 2.4109823363472316, 2.3092651872851735, 2.210661608143861, 2.1151464881486355, 2.0226900718506444, 1.933258301736672, 1.8468131544112296, 1.7633129692947167, 1.6827127689019035, 1.6049645698823525, 1.530017684117934, 1.4578190092817458, 1.3883133083669663, 1.3214434777929984, 1.2571508037894323, 1.19537520684552, 1.1360554740939193, 1.0791294795722528, 1.0245343923745653, 0.9722068727670354, 0.9220832563984128, 0.8740997267857302, 0.8281924763000915, 0.7842978559159323, 0.7423525140203817, 0.7022935246074842, 0.664058505205361, 0.6275857249032173, 0.5928142028597608, 0.559683797685418, 0.5281352880980343, 0.4981104452558558, 0.469552097172858, 0.44240418562016826, 0.41661181591378227, 0.39212129998326367, 0.3688801931088845, 0.3468373247060362, 0.3259428235258754, 0.30614813763035775, 0.2874060494881901, 0.2696706865260586, 0.2528975274568441, 0.23704340469364296, 0.22206650314535703, 0.20792635567651596, 0.19458383550097377, 0.18200114576623175, 0.17014180657247, 0.15897063965796993, 0.14845375097053337, 0.13855851133276845, 0.12925353539777382, 0.12050865908079303, 0.1122949156418754, 0.10458451058444916, 0.09735079552499783, 0.0905682411797278, 0.08421240960521167]}],\n                        {\"title\": {\"text\": \"Coupling Length Trial Distributions\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Expectation Value (au)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Coupling Length (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"1e4e87d8-9073-40c7-b73d-bb5cfef19f1c\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"1e4e87d8-9073-40c7-b73d-bb5cfef19f1c\")) {\n                    Plotly.newPlot(\n                        '1e4e87d8-9073-40c7-b73d-bb5cfef19f1c',\n                        [{\"boxpoints\": false, \"name\": \"1\", \"type\": \"box\", \"uid\": \"b3dfda7a-9ce4-47be-a071-a43a7f4e38dc\", \"x\": [0.4989686690839067, 0.4998728714509605, 0.500877806068925, 0.5024521462112373, 0.5041517653689929, 0.5048341101087783, 0.50611426968756, 0.5076530231013583, 0.5088484332611001, 0.509954835668696, 0.5111899388326866, 0.5125312820438827, 0.5133595349689196, 0.5147046081021511, 0.5157006509962028, 0.5165645084708059, 0.5178319770893024, 0.5194051338990269, 0.5193816748659545, 0.5196358505587473, 0.5206743274762269, 0.5215046895399366, 0.5212211109846618, 0.5228242651765049, 0.5227052920586818, 0.5240096723746749, 0.5239264666690506, 0.525155525078525, 0.5242999384608016, 0.5260310159136508, 0.5264388976692046, 0.5272678840583886, 0.5268795738131888, 0.5289348977614489, 0.528929387964271, 0.5291681253434339, 0.5298698607187164, 0.5312866922892086, 0.5312879803436152, 0.531669689632977, 0.5315530967600268, 0.5320769614199853, 0.5336183026357749, 0.5334259998077505, 0.533235502340107, 0.5341979583175193, 0.5340769926284138, 0.5342130799954714, 0.5348689391475124, 0.5348399029492198, 0.5348457769783721, 0.5371232535967891, 0.5361810641455808, 0.5365985100752828, 0.5376160301990784, 0.5374449564494248, 0.5378318132646887, 0.5384818858092525, 0.5394110861200926, 0.5389660166041322, 0.5399777844896675, 0.5399700771934133, 0.5399964800315498, 0.5414605475169477, 0.5411195455463526, 0.5410555229218272, 0.5426603987970056, 0.5424029681450591, 0.5429034509579452, 0.5433914732316476, 0.5439514234681508, 0.5440013397017899, 0.5451388031283257, 0.5449061339285537, 0.5448888521984084, 0.5451125447996138, 0.5460872507029709, 0.5454314197864042, 0.545757092775817, 0.5462085871567429, 0.5475706716193216, 0.5467452051865851, 0.5474076302660323, 0.5469614310845589, 0.5487872783503962, 0.5487149494040676, 0.5485417327463588, 0.5486781034965039, 0.549383929149139, 0.548968694050586, 0.5499289863128269, 0.5498231317383944, 0.5508264346097858, 0.5505284972591727, 0.5509540507543221, 0.5502294006358847, 0.5512300898746767, 0.5512670319868751, 0.5521675694075251, 0.5518158798931776, 0.5534383136258184, 0.5524597326625645, 0.5532372268272118, 0.552919270956704, 0.5540588885809943, 0.5543719502995547, 0.5537051120702503, 0.5545703214006833, 0.5558321995774724, 0.5556596840100836, 0.5552615119815015, 0.5558401904862761, 0.5566375649832503, 0.55697132049132, 0.5564342919003509, 0.5568398382808069, 0.5574135863272064, 0.5578450072403437, 0.5573491631894176, 0.5576534550636446, 0.5592898427328112, 0.5593392776729801, 0.5586879184561866, 0.5585530020793119, 0.5604266288076957, 0.5603520718832096, 0.560339940906247, 0.5599777248304103, 0.5605942340343837, 0.5615410039515896, 0.5615598598383054, 0.5607524581892458, 0.5622225189240744, 0.5620577848534766, 0.5628074879921066, 0.5620976411318455, 0.5638250283710688, 0.5630155150333265, 0.5636416722899096, 0.5629481855373759, 0.5645881241081913, 0.5643636979128854, 0.5641727864068303, 0.5652097587927426, 0.5656138868578721, 0.5662841474194203, 0.5662382347806648, 0.5661523528937347, 0.5675969396035319, 0.5669649229815678, 0.5673131569307942, 0.5672939024540654, 0.5679480353244653, 0.5683851538240937, 0.5682667264459007, 0.5677021233244041, 0.5691599811358548, 0.5688067264646454, 0.5691325592528695, 0.5698486981805818, 0.5705275396745805, 0.5701003590379069, 0.5709854303010053, 0.5702536554171044, 0.5720366451151784, 0.5715285055820827, 0.571256015914931, 0.5722881435082594, 0.5728572265273513, 0.5728054652255079, 0.5733035328367134, 0.5731058740477196, 0.573952814306588, 0.5741705657344469, 0.5736856279247695, 0.5739957606669867, 0.5758170570081445, 0.5755706755384981, 0.5754924930480486, 0.5755152558372542, 0.576287642092619, 0.5758531641384957, 0.5765895057327045, 0.577292865048785, 0.5779604141722398, 0.5775213884410594, 0.5789386849324364, 0.5788421925386253, 0.5786183936670589, 0.579942599773434, 0.5794528403294845, 0.5804481213139155, 0.5814069056482193, 0.5809967912445776, 0.581012911540099, 0.58237723545607, 0.5828408960803348, 0.5820553328254401, 0.5829083067655063, 0.5833129514930693, 0.5832650522604169, 0.5840815328520085, 0.5840833753337663, 0.5843170455212727, 0.5863632749234229, 0.5854886031025196, 0.5860429131685747, 0.5874879885048926, 0.5875237061035303, 0.5866564003936859, 0.5885522104607265, 0.5879393345551396, 0.5875582236532324, 0.5889504692006003, 0.5898448403406048, 0.5906674303814762, 0.5908072043411122, 0.5911057204356861, 0.5917699725014333, 0.5931548356261526, 0.5922532455945579, 0.5940060557354623, 0.5938051146567463, 0.5948526130523414, 0.5956005058526865, 0.5962290338721041, 0.5965923572284515, 0.5980245834264265, 0.5977770384655646, 0.5985558587008553, 0.5981467785214878, 0.6001299784166103, 0.6002211848607004, 0.6008381326441238, 0.601177140992511, 0.6021178009120203, 0.6033818713095973, 0.6045386860885188, 0.6061642611916718, 0.6073252937889239, 0.6082869559471589, 0.6095402100352105, 0.6107668993481065, 0.6117171489144796, 0.6125600635652715, 0.6135710027593403, 0.6156156919677761, 0.616168698566194, 0.6171187297059388, 0.6187706391644651, 0.6197452449525656, 0.620566049039164]}, {\"boxpoints\": false, \"name\": \"2\", \"type\": \"box\", \"uid\": \"a3b87711-9f95-43cb-8ee1-540d4917c9a7\", \"x\": [0.2695693642184228, 0.26971690716191066, 0.27150481140669597, 0.2725772178679905, 0.27412233472569925, 0.2746338447525333, 0.2761588779092465, 0.2768074296709483, 0.27821358921877126, 0.2801333297537614, 0.2803482422153431, 0.2820683671365894, 0.28350673346314514, 0.2837333321371708, 0.2848924477572038, 0.2865234063425947, 0.2873057167299855, 0.28919481878776904, 0.2888233994250384, 0.29031933128007603, 0.2901139511841792, 0.2908408250967105, 0.29190835782336455, 0.2927851490854019, 0.29211076231295097, 0.2933143373394062, 0.29370346582681517, 0.2943636560076342, 0.294571155186022, 0.29546903270117714, 0.29596315557153924, 0.2970544748468898, 0.29774054314593357, 0.29884335801933953, 0.29787392750124553, 0.2995841354655199, 0.29986918689517655, 0.3001417154801096, 0.30090797359639343, 0.30192271433486556, 0.30214208343697446, 0.30183362712258105, 0.30328417444195843, 0.30259584005351203, 0.30290323838679895, 0.3041345260765762, 0.30443050670238797, 0.30444900681884485, 0.30531726603003434, 0.3051222009161647, 0.3054028562883596, 0.30671962269702147, 0.30622047203032676, 0.30705689702969957, 0.3078489621681693, 0.3078918141135454, 0.308000183171015, 0.3089273546220009, 0.30857076062818856, 0.30845627459015384, 0.3102127421218959, 0.3098730857405259, 0.30950814143204664, 0.311643553944252, 0.31085922146707307, 0.31148050833551233, 0.3120327067116081, 0.31231681136391115, 0.3124201023390387, 0.313223271381088, 0.31317648125603326, 0.3136463741845438, 0.3151993243363865, 0.31450072747515834, 0.3150576501977334, 0.3150273414592949, 0.3162694888434488, 0.3165214353652843, 0.31561078034280515, 0.3156803944659042, 0.31744966826623294, 0.3176118361532854, 0.3170018891966857, 0.317612029190078, 0.3181473132109845, 0.3177823135632929, 0.31860172830198813, 0.3187716434930616, 0.31903125611456745, 0.3194831563805224, 0.31901977230368156, 0.31995313566467515, 0.32050585580545216, 0.32053595453637107, 0.32107776287737116, 0.3205098253960982, 0.3215825406265706, 0.3214043692995738, 0.3220405292623392, 0.322187961148387, 0.323363215208148, 0.3228631987431686, 0.32263778116861425, 0.3232786738190918, 0.32468326681327886, 0.3237775523023491, 0.32388167869002865, 0.32454866679280986, 0.3255289599465643, 0.3252241347143015, 0.3249028766187481, 0.3248561594883059, 0.32704584283429955, 0.326848086048205, 0.32628469199326426, 0.32613740524079304, 0.3273526986402013, 0.32772599291082644, 0.32772654371725624, 0.32805633207061213, 0.32909738264938193, 0.32884622362407784, 0.3286458599031449, 0.328477233828486, 0.33033805838422126, 0.3303977932773366, 0.3297435608890972, 0.33040986960945457, 0.3313739491706913, 0.3305929565503505, 0.3316803838640334, 0.33113777832081026, 0.33196043173033857, 0.33233297867074174, 0.33275167389574434, 0.3318642370896604, 0.3337430099930258, 0.33378843080422976, 0.3338355751614954, 0.33402564903739923, 0.3341508475763829, 0.33470161212125027, 0.33458791282217026, 0.3347214898475377, 0.33624040659254445, 0.33594156576485185, 0.3362676650141087, 0.3364352852288288, 0.3370770333292477, 0.33734545022710194, 0.33723235781079, 0.3371565055534004, 0.33785912724555467, 0.33858127214925965, 0.33877047080980266, 0.338059321860968, 0.33946185487477465, 0.33995465623546267, 0.33889557540870013, 0.3388843685843388, 0.3410159721895155, 0.34100276973908217, 0.34032237616997674, 0.341007400173372, 0.34212724944799894, 0.34122604065635315, 0.34138033606879375, 0.34204711496692014, 0.34264676234735375, 0.34294418943134364, 0.3433595668218799, 0.3426875306545821, 0.34429598557129815, 0.34401931570516264, 0.34431620358959575, 0.3442497163819513, 0.3454657545433148, 0.345495971899017, 0.3449123667390388, 0.3457074778738001, 0.3460556194363317, 0.34657133745526797, 0.34682864173948097, 0.34741065101995483, 0.347328541268575, 0.34761819958732626, 0.3485180449926237, 0.3487269778578949, 0.3484100191638258, 0.3503728181483241, 0.34973465107481155, 0.3496185673407331, 0.3515643324498932, 0.35054402889616043, 0.35079116727035614, 0.35243722115382176, 0.3523071696037143, 0.35234345864317296, 0.3529011386503151, 0.3530033311123669, 0.35314794344538597, 0.3550853576936178, 0.3541488787970915, 0.35495605027622573, 0.3555616576895666, 0.3553652185710148, 0.35601112918116784, 0.3568525602718685, 0.3567601313821928, 0.35673874731561145, 0.3587030912761337, 0.35756299976788086, 0.35805687240906986, 0.35887650845180286, 0.3593569377281945, 0.36057296102419883, 0.3601520882228358, 0.36173504976354776, 0.3615472627263971, 0.3627724871222136, 0.3622384887398656, 0.36410856053566926, 0.3642061037408067, 0.36536329192713435, 0.3646300542334413, 0.3667111826238406, 0.3662767784762927, 0.3669312704164382, 0.3673714759514061, 0.36815140340359226, 0.3684123852987116, 0.3694527621616841, 0.3700723024837733, 0.37157313183907414, 0.370614457080136, 0.37266512883049147, 0.37369203807860435, 0.37438860577818744, 0.3752132015496179, 0.3769389359346109, 0.3785348758891079, 0.3793627613401754, 0.379984820424776, 0.3812593540522513, 0.3821691264744049, 0.38360509617254757, 0.38459925090608466, 0.38605769815718516, 0.38706846119979377, 0.38902412055496954, 0.38970036131312746, 0.3903905617974734]}, {\"boxpoints\": false, \"name\": \"3\", \"type\": \"box\", \"uid\": \"21d66e2d-4e9c-4c8a-8251-d2f970d33aad\", \"x\": [0.056732060931847975, 0.0656510600031986, 0.09852447757323662, 0.10811353245174328, 0.13101677743426007, 0.15531187248133224, 0.1629843263874398, 0.17823092105991276, 0.19422377445245287, 0.19543064855435166, 0.2174323208015806, 0.21659786744126397, 0.24276531832008014, 0.24687770118485722, 0.26158973073375447, 0.24961953479664803, 0.27596073534065346, 0.27863658031645727, 0.2971439370653802, 0.2952218813338774, 0.30270439625227674, 0.3084392607757786, 0.3196090669104558, 0.3064227491742448, 0.338956537588681, 0.3406017399870213, 0.32324875177282786, 0.3513133255761812, 0.3490778445062051, 0.3515949674683455, 0.3565938739572668, 0.3773089582628158, 0.3595016036875726, 0.37366492783158234, 0.3657629092375862, 0.39596628489739266, 0.38443144708422305, 0.38621248547929193, 0.38092402703785133, 0.41314187775263816, 0.41352547204973744, 0.41196744394428675, 0.40631068268145304, 0.41924962930235804, 0.4278070558380805, 0.41623662820948654, 0.42718398749524256, 0.4486124520744663, 0.44333791055176364, 0.4409200343632408, 0.44125750270800335, 0.46902249829944254, 0.4614525273947404, 0.45482140585043446, 0.46904283512856043, 0.4754979298091283, 0.4778712769951988, 0.47603691140124804, 0.5011431415999896, 0.4948896459746949, 0.48944319134054065, 0.5121068566817957, 0.5214579917894782, 0.5095422592999739, 0.5403213959766442, 0.5370852062399611, 0.5271370298415669, 0.556030726085737, 0.5544446823743695, 0.5667742012963763, 0.5761102647225693, 0.5993977641892978, 0.596155464140613, 0.6159151401369402, 0.6121194827154997, 0.6367168115523931, 0.6307910041947805, 0.6458799747058889, 0.6541593979502592, 0.6625161358750612, 0.6856322011521786, 0.7069745248265572, 0.7131408471930093, 0.7468671603251648, 0.7619341833329919, 0.7853497105193312, 0.7892483485041881, 0.8127970100695004, 0.8241060053746022, 1.8982629070927148, 1.903781154206546, 1.9309827027638584, 1.9521302653272614, 1.9599899856755112, 1.9810730496590163, 1.9961961862806135, 2.0249889896469635, 2.0298534109151856, 2.0525448675986553, 2.069983227645324, 2.083502923194874, 2.096567865774711, 2.102280817315977, 2.1117267197384586, 2.1166445226948647, 2.1356743693241973, 2.1246790456401796, 2.1423371600119, 2.1587064685205304, 2.172676614075074, 2.1761773434504663, 2.193465437124214, 2.1947954177686535, 2.1797778397486542, 2.1963934844593624, 2.208207580570622, 2.2213035922015045, 2.216190421815022, 2.2351384262781187, 2.237048336129242, 2.252352716211355, 2.2572931988298666, 2.2784679010625633, 2.2715316555791167, 2.3022487037027126, 2.291604741205669, 2.3194140644521584, 2.3433431627765975, 2.34495475817515, 2.3746985043293707, 2.392707243261002, 2.4138603662349585, 2.7132974939607033, 2.722082583752517, 2.74739670600089, 2.7642766467780757, 2.7826214377117937, 2.7930546130746596, 2.8216069110842623, 2.83897561140268, 2.8416259554669723, 2.848937828920102, 2.8610938061396354, 2.8690852325293723, 2.870771810206367, 2.898433425441822, 2.8979196165467327, 2.8918580333196657, 2.903907901177541, 2.915262316958459, 2.9095804129441403, 2.9253827894331033, 2.9358354878386344, 2.9360860522207046, 2.9336054676347914, 2.9434937912941965, 2.9469898157876147, 2.9425998996607765, 2.9434957566537787, 2.96754629417867, 2.974362130422542, 2.9709406925659176, 2.965621248430662, 2.9834914820296072, 2.981026368838623, 2.993084139273711, 2.9866849615193813, 2.9969125591186208, 2.9998205688790534, 3.0040032898228537, 2.995843723054566, 3.0114063800974225, 3.0206443998449597, 3.0173199683386724, 3.0167067295041794, 3.0174650068407516, 3.0356057382139974, 3.0464084869823296, 3.0361195981041167, 3.03353894051395, 3.057228030073179, 3.050921074920302, 3.0568416153494704, 3.051341871238804, 3.085336854326453, 3.0751746958339083, 3.083082349019538, 3.0835340529795308, 3.0880686283497587, 3.098740576500773, 3.093903901690804, 3.122659005888548, 3.1071524412053404, 3.11345995177175, 3.13111874525544, 3.125060143356978, 3.131053650063301, 3.1570880292823458, 3.155321614400198, 3.170083271044771, 3.1653971222474544, 3.1921282388778875, 3.1922589106805046, 3.199016077926028, 3.2043397604044346, 3.2320782655390246, 3.246591745652538, 3.2647536191908997, 3.2823504494202584, 3.2919375698985145, 3.325315893208313, 3.340373028103177, 3.3477995063605244, 3.3673826804157434, 3.3918325035526884, 3.402985714650837, 3.4265980712624544, 3.440199338004102, 3.468937565042035, 3.4888049019404344, 3.5104512908307415, 3.5265504147358144, 3.5486632194527044, 3.555390749478464, 3.583988721342611, 3.5994158210841074, 3.61436997932259, 3.632307827172743, 3.6511966420883524, 3.6701111991264077, 3.6886077740143075, 3.709598256897833, 3.7188805553829822, 3.7494003564344602, 3.772159310375309, 3.7798642409365355, 3.800683274778762, 3.825166517974994, 3.834135660929476, 3.8625256578688663, 3.8735308350051127, 3.902904906450143, 3.9052352744796077, 3.9344396286006806, 3.957777242184861, 3.959157928493709, 3.993994042663897, 4.011398083212283, 4.028343916026912, 4.04934955299698, 4.058881834858758]}, {\"boxpoints\": false, \"name\": \"4\", \"type\": \"box\", \"uid\": \"07ff04cc-ce07-4d08-8ba1-ebf220eede86\", \"x\": [0.5511750010841322, 0.5523374837603873, 0.5542532194597061, 0.5545013420634423, 0.5564704371284716, 0.5573946591561997, 0.5585213123219269, 0.5598508135683867, 0.5602407108638323, 0.5614703609835116, 0.5636577103471974, 0.5638728154574129, 0.5652158268776075, 0.566949999896331, 0.5678661608480167, 0.5691739762597365, 0.5696360064635525, 0.5707208808967649, 0.5708443468520992, 0.5708734896931932, 0.5728356652243429, 0.5720509790566061, 0.5731572743315325, 0.5740426509982633, 0.5744023431930536, 0.5749836529816499, 0.5761614426495234, 0.5756352968195809, 0.5768083932499221, 0.5768348325369993, 0.5788028814744934, 0.5786049121233539, 0.579178392063279, 0.579596053610861, 0.5812013821432567, 0.5803481546548322, 0.582237863570978, 0.5819987791335102, 0.5818415331284226, 0.5836137924943207, 0.5828877797666727, 0.5824817115036753, 0.5847048519880669, 0.5840579064333953, 0.5841590160118422, 0.5856734371475711, 0.584866888319023, 0.5853817051762668, 0.5859771322995532, 0.587095022595556, 0.5867568131374702, 0.5876625658990066, 0.5879311302811827, 0.5879638285943409, 0.5890562546751782, 0.5890033119916119, 0.5887864570190458, 0.5900242282746333, 0.5902042032745172, 0.5899209358571952, 0.5908129665530569, 0.5913618983128373, 0.5907924906299156, 0.5930044147697556, 0.592606945756998, 0.5918812119088429, 0.5938391396018993, 0.593346685253513, 0.593111203245362, 0.5937041219784752, 0.5948285928009972, 0.5946166617207621, 0.5947053774507032, 0.5947358455727861, 0.596339704018014, 0.5965022700104449, 0.5957623132365338, 0.5960429415076102, 0.5974921064838694, 0.5967251185619187, 0.596925656044169, 0.5966019279860082, 0.598075791312548, 0.5977819361482355, 0.5982978460904416, 0.5988280371674193, 0.599508543026863, 0.599037080893175, 0.5996943497421188, 0.5993649961492561, 0.6005253733484183, 0.6010592136509061, 0.6010038202153148, 0.6010163128759325, 0.60124307153291, 0.6012220455441847, 0.602044657933043, 0.6013986540240901, 0.6026260290302328, 0.6025004055843606, 0.6024419164578212, 0.6025899158044178, 0.6038555271082915, 0.6045372137080881, 0.6039788910141126, 0.6047141620519099, 0.605370997446897, 0.6057458134594772, 0.6051243151687201, 0.6048262249414522, 0.6068260057690095, 0.6062127852917132, 0.6063918847344705, 0.6068743810725201, 0.6082227057033621, 0.607621699576455, 0.6080391680602385, 0.6079999840046696, 0.6083723454903922, 0.6086124360373512, 0.6089210786360302, 0.6092547013069602, 0.6105784950319857, 0.6094271325386692, 0.6105841236038753, 0.6104880219527257, 0.6117202656957165, 0.6111558337452228, 0.6112079722012982, 0.6117129450187245, 0.6123213252602925, 0.6119140671295703, 0.6125463047595117, 0.6127003532815781, 0.613506666011988, 0.6138472356998679, 0.6139441155040418, 0.6139099318598895, 0.6146794819488682, 0.6141042157302747, 0.6141652580187077, 0.6150233877974626, 0.6159229150670341, 0.6164096611885185, 0.6161637949436725, 0.6160303085735115, 0.6173083102216165, 0.6171598066227473, 0.617370518677717, 0.6169458369483998, 0.6186905828444321, 0.6179683388708944, 0.618123368417872, 0.6186086477275411, 0.6189955177606231, 0.6196234172161713, 0.6194532675044084, 0.6196695530128151, 0.6203216001129093, 0.6203058596753478, 0.6210343456203045, 0.6210872837733423, 0.6213335756495386, 0.6215834666320983, 0.6216423498372148, 0.6211489083196009, 0.6224343445080348, 0.6224432094679615, 0.6226339571348499, 0.622727336354994, 0.624253094433314, 0.6243715263486458, 0.6238782070440788, 0.624287502885664, 0.6250127726339961, 0.6252826282330358, 0.6249459551012727, 0.6257561539659731, 0.6264420793366561, 0.6259502727899813, 0.6264805021628528, 0.6262472251061965, 0.6275452538431576, 0.6275227288075753, 0.6278419802151677, 0.6293146102294827, 0.6291789108401727, 0.6288797744112257, 0.6304327834840444, 0.6302668157195861, 0.6293701916990385, 0.631378980290753, 0.6316566987819624, 0.6309555115034343, 0.6324037526073916, 0.6319199627089807, 0.6324897970346967, 0.6332853497730139, 0.6336333193846194, 0.6339557995172921, 0.6341036457444621, 0.6345761667993366, 0.6348760108514979, 0.6360010310860674, 0.6361683604670832, 0.6358093034097331, 0.6368978357199355, 0.6370789035584449, 0.6369477607398463, 0.6387042575129915, 0.6383823173079411, 0.6385207381296587, 0.6393796278444446, 0.6387494188182352, 0.6399066364970815, 0.6405160330302874, 0.641217913264358, 0.6412914381119467, 0.6430678690160264, 0.6425322521339952, 0.6445539242700452, 0.6441985493971937, 0.6456343533946394, 0.6451659663125036, 0.6459444781834558, 0.646301110986265, 0.6471442942558414, 0.6472635027001702, 0.6481320903868176, 0.6481896049744592, 0.649939097449496, 0.6497873935247468, 0.6511526697863298, 0.652611676876266, 0.6535981060562001, 0.65500752552878, 0.6558190651289311, 0.6568626597415839, 0.658552111819021, 0.6594142264058972, 0.6601581661202062, 0.6615295867983075, 0.6630329953659332, 0.6640959465078234, 0.6653050928254517, 0.6665111507785195, 0.6672520909532615, 0.6689768940237315]}, {\"boxpoints\": false, \"name\": \"5\", \"type\": \"box\", \"uid\": \"cdea72d4-7ea8-4c7c-8210-d3c65e644356\", \"x\": [0.3817516682005389, 0.38206731517512565, 0.3832092111072066, 0.38460279772097, 0.38562316543948094, 0.38676664404755606, 0.38854012931970827, 0.38934078181030496, 0.3908657650606907, 0.39241633848046636, 0.3936244441213693, 0.3947413332230335, 0.3954636785548774, 0.3962272567069899, 0.3977857540424591, 0.39861304699150857, 0.39966310162770136, 0.39987147529398764, 0.40162814303012295, 0.40120671709014916, 0.4025878154096651, 0.40248917106171084, 0.4036271722459493, 0.4037880302095448, 0.40439564540035683, 0.40533092685350697, 0.4057674069888654, 0.40554981334851264, 0.4074955764234772, 0.40691796263267793, 0.4080304044417646, 0.40861119428844334, 0.40957301747667374, 0.40986388167110344, 0.41063084630708285, 0.41119392080255757, 0.41229928496415624, 0.41232608959085937, 0.41189594763368936, 0.41281196498890993, 0.4131921128313606, 0.41311438737382583, 0.41383791562969746, 0.41476610507443573, 0.41368148495981877, 0.4153806949951193, 0.4154920232819692, 0.41558289798597686, 0.41650851936106437, 0.41607353944265485, 0.4164713038575606, 0.41716027903484365, 0.4171869900275834, 0.4182261861381095, 0.4193510533942598, 0.4191142709371536, 0.41852448016630156, 0.420370600692846, 0.42009328569782617, 0.42008098487800066, 0.4210660304060492, 0.42074402830021823, 0.42133435140943426, 0.4223540353358669, 0.4224156011033393, 0.42248742047818716, 0.4234738765188248, 0.42330954624140205, 0.4233367566117703, 0.4235642541968098, 0.4245304906307992, 0.4243159397567945, 0.42520412272540004, 0.4248918767284316, 0.4264560326851183, 0.42589433643511965, 0.42604445068534275, 0.4264221895819463, 0.42715767890552003, 0.42745813776094327, 0.42676448717460036, 0.4273810263931747, 0.42875677459853695, 0.4285521898257196, 0.4279014970343252, 0.4283771925116293, 0.42943341470730645, 0.4290577646520463, 0.42971447454363443, 0.42915963972321686, 0.4305145942887203, 0.4304943843136665, 0.43017849746818076, 0.4302624903365907, 0.4313000060756024, 0.4316675395013275, 0.4323699752445449, 0.4323422872473507, 0.433251125436918, 0.4325035557064137, 0.4329815147749872, 0.4333772996360289, 0.43452515675829684, 0.4345711655130947, 0.4337732785074513, 0.4336213344738171, 0.43507483513715245, 0.43583107313841174, 0.4357504367228948, 0.43521104747697653, 0.43622301290478865, 0.4363245183160729, 0.4365339831540047, 0.43631563791695577, 0.4372139802145912, 0.4376634679290103, 0.4372232356761243, 0.43793667881430415, 0.4385544245265647, 0.4385236598462328, 0.43832181414553, 0.4389987615391828, 0.44029916924135915, 0.43984673933202567, 0.4403005094965391, 0.4396884699983284, 0.4412242199172793, 0.441233074437816, 0.4417424821625011, 0.4406397143119435, 0.44254285660296927, 0.4427924406437563, 0.4428750114443087, 0.4425181479646075, 0.4439319407511138, 0.4439364722330169, 0.4432151546808575, 0.4440647513936859, 0.44473827320969445, 0.44510833695971264, 0.44501466339798645, 0.44435474659273516, 0.44601441932137986, 0.44614115756780764, 0.4463238461448472, 0.4463031169516921, 0.4475599643338126, 0.44725897281964255, 0.4464889686494897, 0.446767197628111, 0.4479784489859369, 0.4477693119719419, 0.4477919123247648, 0.44876588462316436, 0.4488122222590232, 0.4494419354998095, 0.44953916612614514, 0.44882897835022717, 0.4505953480066985, 0.4505789319298572, 0.45097926736270905, 0.4507856186979006, 0.4514740427574375, 0.4514559416930666, 0.45114997425603065, 0.45165214350766236, 0.45324966014714013, 0.4523438778763817, 0.45231027031488985, 0.45247458847381894, 0.4534885644000946, 0.4536094855167673, 0.45436794330609687, 0.4539826225808473, 0.4550033651214745, 0.4548751106237576, 0.4549964706440354, 0.4550069565291107, 0.4563705486366279, 0.45626081902336135, 0.45664241236862346, 0.45588997548535337, 0.45765678409420835, 0.4580461254420062, 0.45701933674122364, 0.4590370735319036, 0.4583625913726801, 0.4590297941150816, 0.4602254550977292, 0.4604447415182044, 0.4602962495920038, 0.46080719952901444, 0.4608620668290362, 0.46121393590972637, 0.46209452570999016, 0.46258572564746503, 0.46187349365037345, 0.4631024179918994, 0.4630225765972062, 0.46370171251297515, 0.46480186578827837, 0.464112586665854, 0.46491712531446666, 0.466112881182754, 0.46524034970348516, 0.4655560996034767, 0.4672889380395536, 0.46647506438551123, 0.46660296784572686, 0.4682196511970804, 0.46773323930886457, 0.46858926523756417, 0.4688763085811459, 0.4690361219156698, 0.470570464031573, 0.4703207412185082, 0.4710943977822053, 0.4718996382134061, 0.47280959298737135, 0.4733403259785434, 0.47352903930238865, 0.47365838617609485, 0.4745724707894055, 0.47553064837360737, 0.4761615777065374, 0.4761319295358648, 0.47801329866752884, 0.4769838266407178, 0.4791827598713657, 0.4784641161106493, 0.4802853489752721, 0.4802064527083099, 0.48146130675498605, 0.4818928162429366, 0.4830738352513654, 0.48442750009426977, 0.48554908788818796, 0.48699137893002437, 0.48751140854630803, 0.4886793675698406, 0.49014584145174367, 0.4913081862900442, 0.49297170211055286, 0.49375499805539547, 0.49524595460496856, 0.49646941566192315, 0.49755921384335833, 0.4989559480260625]}, {\"boxpoints\": false, \"name\": \"6\", \"type\": \"box\", \"uid\": \"cde8f073-f104-48e6-a8cb-9c1fdc27e296\", \"x\": [0.014142317634933874, 0.014537240174504328, 0.017107011406836927, 0.017769524039221374, 0.019675677697775618, 0.02135146187467088, 0.023122712580851232, 0.023716668406575457, 0.025795830257480577, 0.02716296860390752, 0.029447685414350153, 0.03017451888763199, 0.031428892657430034, 0.03333413344436101, 0.03534895694740663, 0.03738352431149448, 0.03661964443836015, 0.03818923409300352, 0.0385465495019791, 0.03974974616175574, 0.039357207623494116, 0.042063599546199065, 0.041472001931328856, 0.043152028075948305, 0.04302758699340817, 0.04391430778928293, 0.044600964967265136, 0.045918140268053416, 0.046133526880352355, 0.04838888992736326, 0.04811296996807236, 0.049852085573264815, 0.05009534968182575, 0.0506220021794473, 0.050637932650363586, 0.05290000436789972, 0.05322520422194157, 0.05184619513464899, 0.05430482761237556, 0.05384432935445729, 0.05458358961621358, 0.05585138178966523, 0.055167217614055214, 0.05546451938701858, 0.05693952359864728, 0.0570909286954209, 0.05719385980757299, 0.05921448027023311, 0.05921024821442904, 0.05856215120711756, 0.0604876519738601, 0.06014534282533722, 0.060237332042457147, 0.062134009602635036, 0.06230631190009152, 0.062410888493826026, 0.06390651282072758, 0.0639592545123466, 0.06278837346053144, 0.06527630112915282, 0.06424309595082528, 0.06511445144213901, 0.06613831071501414, 0.06607303579271853, 0.06610037198954295, 0.06644775140894235, 0.06809795381475672, 0.06879932060806014, 0.0677343377119266, 0.06761339866778016, 0.0695180523128271, 0.06897306423214093, 0.06957138988055418, 0.06954665465536358, 0.07136855496642185, 0.07172836420574429, 0.07111244091050939, 0.07076320984924346, 0.0727234587130886, 0.0733974413047325, 0.07276857443768098, 0.07254589887270053, 0.07467061316893857, 0.07503175355317161, 0.07429965680353842, 0.07483888278867032, 0.07564619207280422, 0.07602763447221146, 0.07558438785123883, 0.0766101885785953, 0.0780889438195969, 0.0778580253641206, 0.07794475856704705, 0.0777136834333896, 0.0794426584778099, 0.07869932723241908, 0.0791929304144998, 0.07910062526970044, 0.0800352409541133, 0.08133174398392003, 0.0809753197533354, 0.08007897652376673, 0.08261824747760917, 0.08237505536569155, 0.08147131040503089, 0.0820445792055831, 0.08363543080925546, 0.08445639417056514, 0.08382893713195227, 0.08357418583655445, 0.08529329722600634, 0.08461417594576322, 0.08478865834252079, 0.08505676406640786, 0.08613654924908518, 0.08633718103149907, 0.08674060351488837, 0.08623283978377284, 0.08793024977211794, 0.08830020572138114, 0.08849874652909932, 0.08869714945794123, 0.09045550116181207, 0.09046493225617477, 0.09034261128788308, 0.09013627170538714, 0.09134529037254836, 0.09197576733260886, 0.09096202916169176, 0.09167430235035719, 0.0937178932472432, 0.09329540212524523, 0.09320395780033615, 0.09305034860721856, 0.09452907394240004, 0.0948712140648509, 0.09486284838312968, 0.09430226591381227, 0.09644342159344232, 0.09626339596405566, 0.0968209718499214, 0.09668535249375293, 0.09713016433378538, 0.09783507858604787, 0.09740778462670974, 0.09736162229424276, 0.09983256606513469, 0.09968568104409509, 0.09976305343014495, 0.09894274824976448, 0.10130337924440277, 0.1009354073921847, 0.10049441369355346, 0.10072714196406465, 0.10232492578598432, 0.10303578633608743, 0.10226129201224043, 0.10255523556496275, 0.1042381684346611, 0.1047731256170396, 0.10423704620229504, 0.10371204420062019, 0.10592331327151923, 0.10513432765162907, 0.10519484508771147, 0.10562357586574897, 0.1070319086952524, 0.10708395261297023, 0.1073844941492939, 0.1073946552041851, 0.10847327473668375, 0.10911125264392461, 0.10925853991224166, 0.10923429013875981, 0.11055761940997323, 0.11101208090215053, 0.11024577930482746, 0.11023134742350751, 0.11132444162835191, 0.11191276194430246, 0.1117620235651282, 0.11227873689270702, 0.1133371922962024, 0.11359626854362206, 0.1132051803500757, 0.11379674088936059, 0.11495734471988313, 0.11564755956182418, 0.1149348091802023, 0.11622816712887593, 0.11721268629545586, 0.11632423041422112, 0.11881177344240225, 0.11860807208784975, 0.11756159911885758, 0.11896717255630188, 0.11952718496369535, 0.11970763318467506, 0.12073520292636311, 0.1216217232311956, 0.12162931259978742, 0.12203128764310343, 0.12296614105148526, 0.1231104015891841, 0.12381849684833715, 0.1251433840738554, 0.12453035806847094, 0.12547415071090634, 0.12519413752327382, 0.12601822994290163, 0.1272600551916528, 0.12788298788629476, 0.1278147914519442, 0.12920577755428517, 0.12868569494600782, 0.13100441072084057, 0.13054815874280903, 0.13261782075119466, 0.13220701629613105, 0.13362155868780598, 0.13299964832850794, 0.13583485177794652, 0.13460437269060482, 0.1364491466597192, 0.13753928893983297, 0.13792916631708352, 0.13913203512199177, 0.1393177420373466, 0.14051522455309856, 0.14087489048291554, 0.14141759716086183, 0.1426362418420787, 0.14314259421338363, 0.14401129228746892, 0.1469228698165867, 0.14761300095778418, 0.1494911053486411, 0.15030253655346204, 0.15238811398088664, 0.15439401731141741, 0.15558555014580752, 0.15795572050260867, 0.15947442008147478, 0.1606011342128387, 0.1616995720859722, 0.16378213467896305, 0.16543335654566985, 0.16702000157151392]}],\n                        {\"title\": {\"text\": \"Coupling Length Trials\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Coupling Length (m)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Trial Index (#)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div style=\"height:120px\"> </div>"};
+
+}());
\ No newline at end of file
@@ -0,0 +1,5 @@
+(function () {
+
+    window.SIM_DATA = {"data": {}, "body": "<div class=\"top-box\">\n  <div class=\"group-info\">\n    <div class=\"title\">UNIT-TEST Trial Group</div>\n    <div class=\"date\"><span class=\"label\">Run At:</span> 10-18-2026 12:28</div>\n    <div class=\"summary\">A run of unit tests within a group to compare</div>\n  </div>\n\n  <div class=\"trial-listings-wrapper \">\n    <div class=\"trial-listings\">\n      \n        <div class=\"entry\"\n             style=\"background-color: rgba(31, 119, 180, 1.0)\"\n             onclick=\"window.SIM.onTrialClick('UNIT-TEST-Trot')\">\n          <div class=\"entry-inner\">\n            <div class=\"title\">1. UNIT-TEST Trot</div>\n            <div class=\"summary\">A test run to verify that the simulation system works.</div>\n          </div>\n        </div>\n      \n        <div class=\"entry\"\n             style=\"background-color: rgba(255, 127, 14, 1.0)\"\n             onclick=\"window.SIM.onTrialClick('UNIT-TEST-Data-File-Trot-Test')\">\n          <div class=\"entry-inner\">\n            <div class=\"title\">2. UNIT-TEST Data File Trot Test</div>\n            <div class=\"summary\">A test run to verify that the simulation system works with data loaded from file</div>\n          </div>\n        </div>\n      \n    </div>\n  </div>\n\n</div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"29c87439-a271-45f3-99b5-d950ce8fc856\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"29c87439-a271-45f3-99b5-d950ce8fc856\")) {\n                    Plotly.newPlot(\n                        '29c87439-a271-45f3-99b5-d950ce8fc856',\n                        [{\"mode\": \"lines\", \"name\": \"1\", \"type\": \"scatter\", \"uid\": \"971f0870-ddf4-436d-8036-5a61536b696d\", \"x\": [0.35, 0.350722891566265, 0.35144578313253005, 0.3521686746987951, 0.35289156626506013, 0.35361445783132517, 0.3543373493975902, 0.35506024096385524, 0.3557831325301203, 0.3565060240963853, 0.35722891566265036, 0.3579518072289154, 0.35867469879518044, 0.3593975903614455, 0.3601204819277105, 0.36084337349397555, 0.3615662650602406, 0.3622891566265056, 0.36301204819277066, 0.3637349397590357, 0.36445783132530074, 0.3651807228915658, 0.3659036144578308, 0.36662650602409586, 0.3673493975903609, 0.36807228915662593, 0.36879518072289097, 0.369518072289156, 0.37024096385542105, 0.3709638554216861, 0.3716867469879511, 0.37240963855421616, 0.3731325301204812, 0.37385542168674624, 0.3745783132530113, 0.3753012048192763, 0.37602409638554135, 0.3767469879518064, 0.3774698795180714, 0.37819277108433647, 0.3789156626506015, 0.37963855421686654, 0.3803614457831316, 0.3810843373493966, 0.38180722891566166, 0.3825301204819267, 0.38325301204819173, 0.38397590361445677, 0.3846987951807218, 0.38542168674698685, 0.3861445783132519, 0.3868674698795169, 0.38759036144578196, 0.388313253012047, 0.38903614457831204, 0.3897590361445771, 0.3904819277108421, 0.39120481927710715, 0.3919277108433722, 0.39265060240963723, 0.39337349397590227, 0.3940963855421673, 0.39481927710843234, 0.3955421686746974, 0.3962650602409624, 0.39698795180722746, 0.3977108433734925, 0.39843373493975753, 0.39915662650602257, 0.3998795180722876, 0.40060240963855265, 0.4013253012048177, 0.4020481927710827, 0.40277108433734776, 0.4034939759036128, 0.40421686746987784, 0.4049397590361429, 0.4056626506024079, 0.40638554216867295, 0.407108433734938, 0.40783132530120303, 0.40855421686746807, 0.4092771084337331, 0.40999999999999814, 0.4107228915662632, 0.4114457831325282, 0.41216867469879326, 0.4128915662650583, 0.41361445783132333, 0.4143373493975884, 0.4150602409638534, 0.41578313253011845, 0.4165060240963835, 0.4172289156626485, 0.41795180722891356, 0.4186746987951786, 0.41939759036144364, 0.4201204819277087, 0.4208433734939737, 0.42156626506023875, 0.4222891566265038, 0.42301204819276883, 0.42373493975903387, 0.4244578313252989, 0.42518072289156394, 0.425903614457829, 0.426626506024094, 0.42734939759035906, 0.4280722891566241, 0.42879518072288914, 0.4295180722891542, 0.4302409638554192, 0.43096385542168425, 0.4316867469879493, 0.4324096385542143, 0.43313253012047936, 0.4338554216867444, 0.43457831325300944, 0.4353012048192745, 0.4360240963855395, 0.43674698795180456, 0.4374698795180696, 0.43819277108433463, 0.43891566265059967, 0.4396385542168647, 0.44036144578312975, 0.4410843373493948, 0.4418072289156598, 0.44253012048192486, 0.4432530120481899, 0.44397590361445494, 0.44469879518072, 0.445421686746985, 0.44614457831325005, 0.4468674698795151, 0.4475903614457801, 0.44831325301204517, 0.4490361445783102, 0.44975903614457524, 0.4504819277108403, 0.4512048192771053, 0.45192771084337036, 0.4526506024096354, 0.45337349397590043, 0.45409638554216547, 0.4548192771084305, 0.45554216867469555, 0.4562650602409606, 0.4569879518072256, 0.45771084337349066, 0.4584337349397557, 0.45915662650602074, 0.4598795180722858, 0.4606024096385508, 0.46132530120481585, 0.4620481927710809, 0.46277108433734593, 0.46349397590361097, 0.464216867469876, 0.46493975903614104, 0.4656626506024061, 0.4663855421686711, 0.46710843373493616, 0.4678313253012012, 0.46855421686746623, 0.46927710843373127, 0.4699999999999963, 0.47072289156626135, 0.4714457831325264, 0.4721686746987914, 0.47289156626505646, 0.4736144578313215, 0.47433734939758654, 0.4750602409638516, 0.4757831325301166, 0.47650602409638165, 0.4772289156626467, 0.47795180722891173, 0.47867469879517677, 0.4793975903614418, 0.48012048192770684, 0.4808433734939719, 0.4815662650602369, 0.48228915662650196, 0.483012048192767, 0.48373493975903203, 0.4844578313252971, 0.4851807228915621, 0.48590361445782715, 0.4866265060240922, 0.4873493975903572, 0.48807228915662226, 0.4887951807228873, 0.48951807228915234, 0.4902409638554174, 0.4909638554216824, 0.49168674698794745, 0.4924096385542125, 0.49313253012047753, 0.49385542168674257, 0.4945783132530076, 0.49530120481927264, 0.4960240963855377, 0.4967469879518027, 0.49746987951806776, 0.4981927710843328, 0.49891566265059784, 0.4996385542168629, 0.5003614457831279, 0.501084337349393, 0.501807228915658, 0.502530120481923, 0.5032530120481881, 0.5039759036144531, 0.5046987951807181, 0.5054216867469832, 0.5061445783132482, 0.5068674698795133, 0.5075903614457783, 0.5083132530120433, 0.5090361445783084, 0.5097590361445734, 0.5104819277108384, 0.5112048192771035, 0.5119277108433685, 0.5126506024096336, 0.5133734939758986, 0.5140963855421636, 0.5148192771084287, 0.5155421686746937, 0.5162650602409588, 0.5169879518072238, 0.5177108433734888, 0.5184337349397539, 0.5191566265060189, 0.5198795180722839, 0.520602409638549, 0.521325301204814, 0.5220481927710791, 0.5227710843373441, 0.5234939759036091, 0.5242168674698742, 0.5249397590361392, 0.5256626506024042, 0.5263855421686693, 0.5271084337349343, 0.5278313253011994, 0.5285542168674644, 0.5292771084337294, 0.53], \"y\": [0.12673840992042062, 0.1362115056661605, 0.14630874742766906, 0.15706447996113346, 0.16851443291902232, 0.18069574185172713, 0.19364696709790333, 0.20740811039112222, 0.22202062900975342, 0.23752744729686018, 0.2539729653773142, 0.27140306490027843, 0.2898651116366221, 0.30940795476268007, 0.33008192266396325, 0.3519388150949188, 0.37503189153349104, 0.3994158555720054, 0.425146835188603, 0.45228235874604, 0.4808813265669329, 0.5110039779363891, 0.5427118533842537, 0.5760677520997391, 0.6111356843309207, 0.6479808186202394, 0.686669423724705, 0.7272688050657425, 0.7698472355485105, 0.8144738805839514, 0.8612187171387163, 0.9101524466284562, 0.9613464014587636, 1.014872445005357, 1.0708028648109713, 1.1292102587610977, 1.1901674139842746, 1.2537471782054723, 1.3200223232634514, 1.3890654004852936, 1.4609485875940145, 1.535743526808819, 1.6135211537827934, 1.6943515170102559, 1.7783035873264017, 1.865445057116041, 1.9558421288470267, 2.0495592925482446, 2.1466590918627775, 2.2472018783249923, 2.3512455535367267, 2.4588452989535985, 2.5700532930383844, 2.6849184155955905, 2.803485939170358, 2.925797207476555, 3.051889300913872, 3.1817946893425497, 3.3155408724071473, 3.453150007837959, 3.594638528309987, 3.740016747604629, 3.889288456998064, 4.042450512991587, 4.199492417702288, 4.360395893445747, 4.525134453264469, 4.693672969384619, 4.865967241817009, 5.041963569553816, 5.22159832704733, 5.404797548888198, 5.591476525824902, 5.781539415479983, 5.974878871318479, 6.171375693606062, 6.370898506255026, 6.573303463591281, 6.778433991181602, 6.986120564933198, 7.196180532714161, 7.408417982739958, 7.622623662924549, 7.838574955302765, 8.056035909490394, 8.274757338958446, 8.494476983657114, 8.714919742231926, 8.935797976729898, 9.15681189229748, 9.377649993925942, 9.597989621806201, 9.817497566316009, 10.035830763082075, 10.252637067942079, 10.467556110981702, 10.680220228145476, 10.890255468223897, 11.09728267230923, 11.30091862209706, 11.500777252696611, 11.696470924909221, 11.887611751248926, 12.073812969320416, 12.254690355546314, 12.429863671655708, 12.598958135817735, 12.761605909834701, 12.917447593406825, 13.06613371615089, 13.207326217804248, 13.340699906878744, 13.46594388795002, 13.58276294777958, 13.690878890572167, 13.790031812869886, 13.879981308877188, 13.960507597395862, 14.031412562023691, 14.09252069683093, 14.143679950370302, 14.184762461592596, 14.215665182024456, 14.236310379409732, 14.246646018911722, 14.246646018911761, 14.236310379409854, 14.215665182024651, 14.184762461592872, 14.14367995037066, 14.092520696831361, 14.031412562024196, 13.960507597396445, 13.879981308877843, 13.79003181287061, 13.690878890572963, 13.582762947780447, 13.465943887950951, 13.340699906879738, 13.207326217805303, 13.066133716152004, 12.917447593407998, 12.761605909835923, 12.598958135819013, 12.429863671657031, 12.25469035554768, 12.073812969321827, 11.887611751250375, 11.696470924910708, 11.50077725269813, 11.30091862209861, 11.097282672310808, 10.890255468225496, 10.680220228147101, 10.467556110983342, 10.252637067943738, 10.035830763083748, 9.817497566317693, 9.597989621807892, 9.377649993927635, 9.156811892299178, 8.935797976731596, 8.71491974223362, 8.494476983658805, 8.27475733896013, 8.056035909492067, 7.83857495530443, 7.622623662926202, 7.4084179827415975, 7.196180532715782, 6.986120564934801, 6.7784339911831895, 6.573303463592846, 6.37089850625657, 6.171375693607585, 5.974878871319975, 5.781539415481457, 5.591476525826349, 5.404797548889619, 5.2215983270487225, 5.041963569555181, 4.865967241818346, 4.6936729693859265, 4.52513445326575, 4.360395893446998, 4.1994924177035085, 4.042450512992778, 3.889288456999225, 3.7400167476057606, 3.594638528311087, 3.453150007839031, 3.315540872408189, 3.181794689343562, 3.051889300914856, 2.9257972074775083, 2.8034859391712836, 2.6849184155964863, 2.5700532930392517, 2.458845298954439, 2.351245553537539, 2.247201878325777, 2.1466590918635364, 2.049559292548977, 1.9558421288477337, 1.865445057116722, 1.778303587327059, 1.6943515170108887, 1.6135211537834024, 1.5357435268094046, 1.4609485875945776, 1.389065400485835, 1.3200223232639707, 1.2537471782059704, 1.1901674139847527, 1.1292102587615556, 1.07080286481141, 1.0148724450057771, 0.9613464014591656, 0.9101524466288405, 0.861218717139084, 0.8144738805843021, 0.7698472355488452, 0.7272688050660617, 0.6866694237250096, 0.647980818620529, 0.6111356843311967, 0.576067752100002, 0.5427118533845033, 0.5110039779366263, 0.4808813265671583, 0.452282358746254, 0.42514683518880586, 0.3994158555721978, 0.37503189153367344, 0.35193881509509123, 0.33008192266412656, 0.3094079547628343, 0.2898651116367681, 0.27140306490041605, 0.25397296537744424, 0.23752744729698277, 0.222020629009869, 0.2074081103912311, 0.19364696709800566, 0.18069574185182358, 0.16851443291911303, 0.15706447996121867, 0.14630874742774908, 0.1362115056662356, 0.12673840992042062]}, {\"mode\": \"lines\", \"name\": \"2\", \"type\": \"scatter\", \"uid\": \"929b563f-8abe-4a66-bf0f-d04918207431\", \"x\": [-0.4999999999999999, -0.4787148594377509, -0.4574297188755019, -0.4361445783132529, -0.41485943775100387, -0.39357429718875486, -0.37228915662650586, -0.35100401606425685, -0.32971887550200785, -0.30843373493975884, -0.28714859437750984, -0.26586345381526083, -0.24457831325301183, -0.22329317269076282, -0.20200803212851381, -0.1807228915662648, -0.1594377510040158, -0.1381526104417668, -0.1168674698795178, -0.09558232931726879, -0.07429718875501978, -0.053012048192770785, -0.031726907630521786, -0.010441767068272788, 0.01084337349397621, 0.03212851405622521, 0.05341365461847421, 0.0746987951807232, 0.0959839357429722, 0.11726907630522121, 0.13855421686747021, 0.15983935742971922, 0.18112449799196823, 0.20240963855421723, 0.22369477911646624, 0.24497991967871524, 0.26626506024096425, 0.28755020080321325, 0.30883534136546226, 0.33012048192771126, 0.35140562248996027, 0.3726907630522093, 0.3939759036144583, 0.4152610441767073, 0.4365461847389563, 0.4578313253012053, 0.4791164658634543, 0.5004016064257033, 0.5216867469879523, 0.5429718875502012, 0.5642570281124502, 0.5855421686746991, 0.606827309236948, 0.628112449799197, 0.649397590361446, 0.6706827309236949, 0.6919678714859439, 0.7132530120481928, 0.7345381526104418, 0.7558232931726907, 0.7771084337349397, 0.7983935742971886, 0.8196787148594376, 0.8409638554216865, 0.8622489959839355, 0.8835341365461844, 0.9048192771084334, 0.9261044176706823, 0.9473895582329313, 0.9686746987951802, 0.9899598393574291, 1.011244979919678, 1.032530120481927, 1.053815261044176, 1.075100401606425, 1.096385542168674, 1.1176706827309228, 1.1389558232931718, 1.1602409638554207, 1.1815261044176697, 1.2028112449799186, 1.2240963855421676, 1.2453815261044165, 1.2666666666666655, 1.2879518072289144, 1.3092369477911634, 1.3305220883534123, 1.3518072289156613, 1.3730923694779102, 1.3943775100401592, 1.4156626506024081, 1.436947791164657, 1.458232931726906, 1.479518072289155, 1.500803212851404, 1.522088353413653, 1.5433734939759018, 1.5646586345381508, 1.5859437751003997, 1.6072289156626487, 1.6285140562248976, 1.6497991967871466, 1.6710843373493955, 1.6923694779116445, 1.7136546184738934, 1.7349397590361424, 1.7562248995983913, 1.7775100401606403, 1.7987951807228892, 1.8200803212851382, 1.8413654618473871, 1.862650602409636, 1.883935742971885, 1.905220883534134, 1.926506024096383, 1.947791164658632, 1.9690763052208808, 1.9903614457831298, 2.0116465863453787, 2.032931726907628, 2.054216867469877, 2.0755020080321263, 2.0967871485943754, 2.1180722891566246, 2.1393574297188738, 2.160642570281123, 2.181927710843372, 2.2032128514056213, 2.2244979919678705, 2.2457831325301196, 2.267068273092369, 2.288353413654618, 2.309638554216867, 2.3309236947791163, 2.3522088353413655, 2.3734939759036147, 2.394779116465864, 2.416064257028113, 2.437349397590362, 2.4586345381526113, 2.4799196787148605, 2.5012048192771097, 2.522489959839359, 2.543775100401608, 2.565060240963857, 2.5863453815261064, 2.6076305220883556, 2.6289156626506047, 2.650200803212854, 2.671485943775103, 2.6927710843373522, 2.7140562248996014, 2.7353413654618506, 2.7566265060240998, 2.777911646586349, 2.799196787148598, 2.8204819277108473, 2.8417670682730964, 2.8630522088353456, 2.884337349397595, 2.905622489959844, 2.926907630522093, 2.9481927710843423, 2.9694779116465915, 2.9907630522088406, 3.01204819277109, 3.033333333333339, 3.054618473895588, 3.0759036144578373, 3.0971887550200865, 3.1184738955823357, 3.139759036144585, 3.161044176706834, 3.182329317269083, 3.2036144578313324, 3.2248995983935815, 3.2461847389558307, 3.26746987951808, 3.288755020080329, 3.310040160642578, 3.3313253012048274, 3.3526104417670766, 3.3738955823293257, 3.395180722891575, 3.416465863453824, 3.4377510040160733, 3.4590361445783224, 3.4803212851405716, 3.5016064257028208, 3.52289156626507, 3.544176706827319, 3.5654618473895683, 3.5867469879518175, 3.6080321285140666, 3.629317269076316, 3.650602409638565, 3.671887550200814, 3.6931726907630633, 3.7144578313253125, 3.7357429718875617, 3.757028112449811, 3.77831325301206, 3.799598393574309, 3.8208835341365583, 3.8421686746988075, 3.8634538152610567, 3.884738955823306, 3.906024096385555, 3.927309236947804, 3.9485943775100534, 3.9698795180723025, 3.9911646586345517, 4.0124497991968004, 4.033734939759049, 4.055020080321298, 4.076305220883547, 4.097590361445795, 4.118875502008044, 4.140160642570293, 4.1614457831325415, 4.18273092369479, 4.204016064257039, 4.225301204819288, 4.2465863453815365, 4.267871485943785, 4.289156626506034, 4.310441767068283, 4.331726907630531, 4.35301204819278, 4.374297188755029, 4.3955823293172775, 4.416867469879526, 4.438152610441775, 4.459437751004024, 4.4807228915662725, 4.502008032128521, 4.52329317269077, 4.544578313253019, 4.565863453815267, 4.587148594377516, 4.608433734939765, 4.6297188755020136, 4.651004016064262, 4.672289156626511, 4.69357429718876, 4.7148594377510085, 4.736144578313257, 4.757429718875506, 4.778714859437755, 4.800000000000001], \"y\": [0.0013509254857183254, 0.0016701709363448351, 0.0020554925002942122, 0.0025185156424963437, 0.003072584260718679, 0.003733007077225622, 0.004517356442969028, 0.005445832973141547, 0.006541710249032035, 0.007831873147676251, 0.009347460455761356, 0.011124616477550062, 0.013205346573551236, 0.015638457355962445, 0.01848054340660966, 0.02179695941569436, 0.025662691456642704, 0.03016301800045558, 0.03539383874203149, 0.041461563041583945, 0.04848251660524039, 0.056581986396417934, 0.06589333414646381, 0.07655811973082183, 0.08872889218752737, 0.10257710560851127, 0.11830913858554752, 0.1361929518249112, 0.1565955389144689, 0.18002608099062326, 0.20717141525893903, 0.23890056551910402, 0.2762075760948235, 0.3200628027053249, 0.3711583459011793, 0.42956605874935294, 0.4943713871427591, 0.5633884892757162, 0.6330804258119436, 0.6987837700196609, 0.755264507318212, 0.7975279607212987, 0.8217058923422349, 0.825791400660879, 0.8100154838505248, 0.7767568659976049, 0.7300150454171757, 0.6746032105898713, 0.6152857570916459, 0.556074069942254, 0.49981697637175765, 0.44811596785429103, 0.4015019362217212, 0.3597583258361638, 0.32227176647849964, 0.28832285846415645, 0.25727553793224844, 0.2286642079926733, 0.2022030013641718, 0.17774982408630532, 0.15525394615716806, 0.13470640343498744, 0.11610265325894499, 0.09941962962522824, 0.0846052343593543, 0.07157676617018335, 0.06022481881854908, 0.05041989744075841, 0.042019855127609036, 0.034876981062645335, 0.02884410614566618, 0.02377945045322982, 0.01955016352039383, 0.01603464453679299, 0.013123805123058758, 0.010721472220529833, 0.00874413589129819, 0.007120235706274985, 0.005789156883451737, 0.004700078923708276, 0.0038107894422404216, 0.0030865473272676134, 0.0024990543145573052, 0.002025573622776657, 0.0016482187185829446, 0.0013534242091223277, 0.0011316034781921674, 0.0009769928849988577, 0.0008876788734898428, 0.0008658009032519217, 0.000917918486337238, 0.001055523743103624, 0.0012956709931517256, 0.0016616815830162888, 0.002183865541299392, 0.002900182497605366, 0.003856744086591746, 0.005108041046154056, 0.0067167634416171965, 0.008753075639306449, 0.011293213188699901, 0.01441729179033085, 0.018206265545747283, 0.02273805217724987, 0.028082972173338452, 0.03429885178560658, 0.04142645321825912, 0.04948636201544003, 0.058479105471912735, 0.06839104440638072, 0.07920925019032717, 0.09094864649942372, 0.10369333288543112, 0.11765021103633896, 0.13320610733381277, 0.1509699754779041, 0.17177199917870806, 0.19658650557424284, 0.22635206612915348, 0.2616851988203215, 0.3025233957690246, 0.3477794818475778, 0.39512428247572673, 0.4410166440958998, 0.48105459901648634, 0.510632461774371, 0.5257817505290329, 0.5239901683374355, 0.5047714477144397, 0.4698166847575534, 0.42267872364458087, 0.3680807996770326, 0.3110459969158614, 0.2560777484322094, 0.20657779569933687, 0.16459221705482488, 0.13087021326943205, 0.10514232879570096, 0.08649404529656089, 0.07372450319518895, 0.06562068702400078, 0.06112323596592983, 0.05939524901540032, 0.05982371863129285, 0.06198642325916226, 0.06561129911919737, 0.07054676209805553, 0.0767542191104074, 0.08432925868361893, 0.09355446721792314, 0.10498175136901312, 0.11953256208025324, 0.13858909676763845, 0.16403040347212958, 0.19815128028819895, 0.2434006186912299, 0.30190221815705315, 0.3747819974846372, 0.46141346031766906, 0.5587815836278777, 0.661212635653109, 0.760683721674532, 0.8477950538168184, 0.9132858649385139, 0.9497690958515502, 0.9532360051612714, 0.9239038042375245, 0.8661549158116741, 0.7875866088365235, 0.6974527381313194, 0.6049365777512846, 0.517694529094483, 0.44097115987549035, 0.3773758773029801, 0.32721579446405485, 0.2891609264295133, 0.26099655143326134, 0.2402728954461022, 0.22475274435616932, 0.2126430495005696, 0.2026529092649777, 0.19394226786659613, 0.18602139446305008, 0.17864367011387525, 0.1717145970033877, 0.16522468485410974, 0.15920484035842783, 0.15369913450724637, 0.14874938494583712, 0.14438706725911024, 0.14062948793558838, 0.13747835157343025, 0.13491968084216382, 0.13292454251112834, 0.13145029788416454, 0.1304422242482355, 0.1298354099838577, 0.1295568478250439, 0.12952765827159718, 0.1296653777543324, 0.12988624790151176, 0.13010744474697236, 0.13024919049028152, 0.13023669556546233, 0.1300018852161194, 0.12948487234571304, 0.12863514689716388, 0.12741246116490998, 0.12578739997639857, 0.12374163430090857, 0.12126786624422273, 0.1183694822626113, 0.11505993948804338, 0.11136191703528313, 0.10730626983746779, 0.10293082675805203, 0.09827907734188958, 0.093398792550895, 0.08834062420266611, 0.0831567256830294, 0.07789943298685048, 0.0726200404600622, 0.0673677000160426, 0.06218846635604321, 0.057124504124983884, 0.05221346626824082, 0.047488046394512366, 0.042975701939117206, 0.03869853956766036, 0.03467334972264718, 0.03091177360578575, 0.027420583265140408, 0.02420205382756595, 0.0212544062455782, 0.01857229913698966, 0.016147349276531057, 0.013968661919698694, 0.012023354254916572, 0.010297057740664093, 0.008774387742661626, 0.00743937160591723, 0.006275828956527202, 0.005267700527328011, 0.004399324060494204, 0.0036556578023633334, 0.003022453736697132, 0.00248638398827809, 0.00203512477314122, 0.0016574028936238263, 0.001343010105973612]}],\n                        {\"title\": {\"text\": \"Coupling Length Trial Distributions\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Expectation Value (au)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Coupling Length (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"3da56713-4388-40d9-91c3-db8f77bd9374\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"3da56713-4388-40d9-91c3-db8f77bd9374\")) {\n                    Plotly.newPlot(\n                        '3da56713-4388-40d9-91c3-db8f77bd9374',\n                        [{\"boxpoints\": false, \"name\": \"1\", \"type\": \"box\", \"uid\": \"2dc2f5fc-6d6b-4f40-86f9-04c91f1795cf\", \"x\": [0.38162692436299184, 0.3828274103355956, 0.3832186985132817, 0.38514300979690996, 0.3857878506343191, 0.3868011641889853, 0.3887868985262412, 0.389899089547034, 0.39083357367006794, 0.39192422699069074, 0.3929952117508551, 0.39388044585595977, 0.39523241214499044, 0.39615445840038344, 0.39732526967336274, 0.39854220903444487, 0.3997851707043006, 0.39968636764640614, 0.4018260020281452, 0.4014008428233152, 0.40231848024812644, 0.4030803440597622, 0.4036824521975252, 0.4033595857845004, 0.4048795214886206, 0.4051944718835149, 0.406458686664579, 0.40638879271145856, 0.4070030454001909, 0.40678432321252556, 0.4086113498873135, 0.4086357700618793, 0.40964384940518034, 0.40972749217998855, 0.4108501607506618, 0.41070270295075156, 0.4114754573931567, 0.41243431343635945, 0.4116649401190883, 0.4127027505743994, 0.41325105859918937, 0.41254445987897315, 0.4137296111746255, 0.4140234288133495, 0.4147505690468773, 0.4152589988922796, 0.4150853878220272, 0.41509729402385703, 0.4164877886210725, 0.41604359303972727, 0.41669774376594876, 0.4171535037022649, 0.41725501585225583, 0.417829670342864, 0.41948826253771526, 0.4188176808230794, 0.4188504838118024, 0.42060783920946443, 0.42028197532620365, 0.42060551647007194, 0.4208437036655369, 0.4211761123344867, 0.4213271293812903, 0.4221614745636772, 0.4219637377977096, 0.42274838494393346, 0.4235696371124267, 0.42374853910799526, 0.42312733448318396, 0.4230400481968883, 0.4252383741651509, 0.4253062722321079, 0.4252336480705695, 0.4251181944533374, 0.42581064570560656, 0.42617646797727116, 0.4261604700532435, 0.42561262558032276, 0.42721946916417125, 0.42698839441021225, 0.4273207089315638, 0.42757179269421075, 0.42784633084252227, 0.42841099611805605, 0.4283162364196678, 0.42791464820141134, 0.429521875143951, 0.4289410711561701, 0.429773819248157, 0.4290636105734924, 0.4304954062317417, 0.43101521934051557, 0.43039613112301506, 0.4308408002949999, 0.4313588342019348, 0.43167804069078997, 0.4318669514791264, 0.43216928626931456, 0.4328230781237153, 0.4325073085505612, 0.43334627206106235, 0.43241708154509695, 0.4342158690597116, 0.43420599220410494, 0.4339516610266821, 0.4340628929557919, 0.4354300878996591, 0.4356085493979117, 0.43532172984504003, 0.4349629444526152, 0.43590629915742907, 0.4359332786590353, 0.4366179296890269, 0.43705594263546277, 0.4375679225139586, 0.4377905907119489, 0.43774475704958826, 0.4373064983521103, 0.4382734442272553, 0.43839892497407557, 0.4383821782345127, 0.4385262766312115, 0.4404343606324406, 0.4400348150284247, 0.44023744573830637, 0.43949242554158957, 0.44169810365475626, 0.44061955055669916, 0.4416303368644846, 0.4406111782254086, 0.44239076882516803, 0.44238445822785216, 0.44176896880083855, 0.4421000256876681, 0.44393815821062305, 0.4432653040597613, 0.44321725383528904, 0.44353778376870295, 0.44434602197219986, 0.44516438595489644, 0.44436325728856463, 0.44508657225287773, 0.4456304868889302, 0.4459981044433755, 0.4454150611093668, 0.44572755014587373, 0.4471977526441748, 0.44656648449087927, 0.44728995183229425, 0.44668787247890623, 0.44834280396947934, 0.4478380403656131, 0.44865189538983424, 0.4484788070365915, 0.4491186312342617, 0.44971240418055614, 0.44984602668318463, 0.44965750120807474, 0.4506756867913724, 0.4509192563742563, 0.45065125163274367, 0.45113068040641235, 0.4516565488117726, 0.45116712397103653, 0.45209781687968087, 0.451680142471722, 0.45337077248297136, 0.4524872427902453, 0.45341022427797323, 0.45274050821865497, 0.45434966408072813, 0.45402011237672035, 0.45352446556916975, 0.45452811999033643, 0.4554884589016248, 0.45536986015524533, 0.4552722793733611, 0.4557998922868967, 0.4561431766101771, 0.4561874798022197, 0.45680981111459795, 0.4566144559642499, 0.45790028845436903, 0.4575705970278287, 0.4571195049128626, 0.45841795520731177, 0.4585228752259613, 0.45852750724205205, 0.459558989127951, 0.45986159172811464, 0.4593785150625941, 0.4609160715071497, 0.46154834201442846, 0.46096117579848556, 0.462839319654133, 0.46285013697564586, 0.4626729342171752, 0.4628815442510527, 0.46355385205299554, 0.46368678799786583, 0.4642104595099303, 0.46461107159937676, 0.4641021767883454, 0.46582372729803806, 0.4653002543270137, 0.46619133043647526, 0.4664673926658898, 0.4675021186417152, 0.4665208802969122, 0.46816192237183574, 0.4676085614599986, 0.4678504241379591, 0.4696960597864016, 0.4688961703386574, 0.4701584675091806, 0.4709669930646479, 0.4720131004739907, 0.4713448967160603, 0.4723866898607463, 0.4733017131629672, 0.4738057807678432, 0.4737861700080956, 0.4754337801682387, 0.475138343023759, 0.47666196780314335, 0.47601839329695533, 0.4779673662739773, 0.4775116339549803, 0.4782854407173887, 0.4783293396299466, 0.4792716835284209, 0.4800405161683702, 0.481404865349593, 0.48167232668477583, 0.4838117406952853, 0.484855155588732, 0.485989487190277, 0.4865127586148871, 0.48831732220660645, 0.4890649341662101, 0.49016850921426736, 0.49202200112460054, 0.49312525097496845, 0.49333485399122234, 0.49555063369691177, 0.49626498996633817, 0.4971062403411453, 0.49847655604461094]}, {\"boxpoints\": false, \"name\": \"2\", \"type\": \"box\", \"uid\": \"157907b6-5250-4636-8c29-9e08d1ba7550\", \"x\": [0.046189483127095914, 0.06802592779730068, 0.08245564803806452, 0.11620228628850372, 0.12270394364082932, 0.14406113131588755, 0.1571797245315873, 0.18141946453992608, 0.19819926476673466, 0.20970128760125709, 0.21633257181392765, 0.22579669155768958, 0.24084529451791187, 0.2339901239152165, 0.26571924863964486, 0.2639168071970217, 0.2790582829963843, 0.2829487531976947, 0.28837337838745386, 0.29605306391632846, 0.29027434433747057, 0.3086703180290937, 0.3105166299640868, 0.3206749449037348, 0.3359236734481228, 0.33086313482743107, 0.3363130764169723, 0.3432346530030336, 0.3500119907476209, 0.3476494380542645, 0.34830745295115234, 0.3606641217611649, 0.37703565531762856, 0.3664489026281785, 0.36024416313501123, 0.3952756549061284, 0.3963640813241307, 0.37924845381966493, 0.39313949570129325, 0.39751519599974805, 0.4060172544587975, 0.4069179953477655, 0.39948177746329533, 0.4312701118130315, 0.4223406818805524, 0.425575739887568, 0.4316687873988949, 0.4490862703667848, 0.45168652313733176, 0.4383959694988294, 0.44107593317689414, 0.46511938661456464, 0.4585191825732413, 0.45488155948527703, 0.4622113908826946, 0.4783977027464126, 0.48636815595263777, 0.4742179674091125, 0.50656687002005, 0.49037767235204865, 0.5012239934391245, 0.5262945447137249, 0.5096398858425559, 0.5115006602960926, 0.5307276116947514, 0.5346161076299342, 0.5313487564822317, 0.551117185521901, 0.5568163027893476, 0.5655914729015223, 0.5763948330662383, 0.5880923789844665, 0.5894662232535754, 0.6079607615905597, 0.606645657079664, 0.6246221659499558, 0.6219560098120624, 0.6421465257441034, 0.6404818573868366, 0.6706119800535659, 0.6932294580492006, 0.7074969073284512, 0.7180539770897297, 0.7345211525806318, 0.7509996634403874, 0.7803008765026228, 0.7979696810852592, 0.8059262653923, 0.8406190652292719, 1.8822539384644443, 1.8998478116001738, 1.9233281638403705, 1.9371294759274977, 1.957224262927748, 1.974488897688563, 2.0033296130478773, 2.011944992387775, 2.0453706380621726, 2.0534954253048188, 2.0670846071096163, 2.0811773777402243, 2.0888169328297925, 2.097476995990328, 2.108846573292082, 2.117527888803225, 2.1248982305987445, 2.1393479528342776, 2.154165790307249, 2.159066111446329, 2.1715612739866246, 2.1666674983798466, 2.1939515249451462, 2.17814095515441, 2.190725271912054, 2.204429098155804, 2.2102690138088916, 2.2245701180805755, 2.227494310705444, 2.2491380003039767, 2.2487771551146873, 2.2695931110383465, 2.258340765254356, 2.2750856355830824, 2.274025674292303, 2.300291808292795, 2.3001341424896764, 2.326202333349236, 2.3348214409288386, 2.3501209822014313, 2.367280895602107, 2.387856078602939, 2.405110972335959, 2.697739438115515, 2.7167270161819213, 2.7438737575823087, 2.771129604350293, 2.7830242505219265, 2.79113302532824, 2.8196915111218592, 2.8353988640451613, 2.8314464680094478, 2.863629848086072, 2.846371243451873, 2.870781540514364, 2.875478463859028, 2.8911902938856016, 2.88562229180233, 2.886845344782897, 2.9107566937877194, 2.905806701951383, 2.915749507073789, 2.9292073753896593, 2.9226979695325648, 2.937627884282469, 2.9314240829164846, 2.955210478558639, 2.947216766766452, 2.9508350562036427, 2.941476183548247, 2.966729912496623, 2.957533682292554, 2.9695279467887534, 2.9599357554015797, 2.978206779299785, 2.99045253081284, 2.9881807646168386, 2.9765671931988313, 3.002459060984316, 3.008151958821616, 2.99683127609212, 3.0023279103004534, 3.012436468257105, 3.0189878605713396, 3.022345871947203, 3.02996332849426, 3.021832382574207, 3.0468434058500256, 3.041896984864141, 3.0483204958576864, 3.0429918524346236, 3.059673884759828, 3.0585172499345843, 3.0601795334582795, 3.062285344129449, 3.085082125692922, 3.0753513961251846, 3.0835803407659172, 3.0801948380151094, 3.0963202084461035, 3.101849088897155, 3.0943090722633526, 3.1106168580221643, 3.112460859279566, 3.1240156637519183, 3.1308604750543934, 3.138699488474819, 3.1355492977675556, 3.1440086074952847, 3.151453118653478, 3.1654492525562117, 3.179554935220517, 3.1847569168025895, 3.1799626421947136, 3.2089816744312722, 3.202357637355771, 3.2313336282353964, 3.240237716194779, 3.265292238391621, 3.2759200104575985, 3.2989485990412137, 3.3173294473256982, 3.3401133756395276, 3.355508827461918, 3.3677279990309392, 3.3943259470647185, 3.4064051031186167, 3.43476464128343, 3.4504399594509088, 3.476480377573316, 3.4822590464464103, 3.506802731433414, 3.519703924627289, 3.5442509459112355, 3.5672544319239226, 3.5804091505102833, 3.604408255587964, 3.623499014849674, 3.6414133456858533, 3.6618048374996226, 3.662927912976819, 3.6870265425392184, 3.713027868895413, 3.722619322928921, 3.749221019771259, 3.757264370905972, 3.7808739092414467, 3.7963940367193203, 3.8243865758165168, 3.8306797604597174, 3.8648709888124593, 3.87944624994746, 3.892184503350873, 3.9211952322894046, 3.9317653036298146, 3.954121403062489, 3.974758321276909, 3.992048844390334, 4.01131188697638, 4.023238456062986, 4.046412811697181, 4.058770318409127]}],\n                        {\"title\": {\"text\": \"Coupling Length Trials\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Coupling Length (m)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Trial Index (#)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div style=\"height:120px\"> </div>"};
+
+}());
\ No newline at end of file
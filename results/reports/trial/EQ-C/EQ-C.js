@@ -0,0 +1,5 @@
+(function () {
+
+    window.SIM_DATA = {"data": {"time": {"count": 61, "cycles": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0], "support_cycles": [-0.4, -0.35, -0.29999999999999993, -0.2499999999999999, -0.19999999999999984, -0.15000000000000002, -0.09999999999999998, -0.04999999999999993, 1.1102230246251565e-16, 0.050000000000000155, 0.09999999999999998, 0.15000000000000002, 0.20000000000000007, 0.2500000000000001, 0.30000000000000016, 0.35, 0.4, 0.45000000000000007, 0.5000000000000001, 0.5500000000000002, 0.6, 0.6500000000000002, 0.7000000000000001, 0.7499999999999999, 0.8000000000000002, 0.85, 0.9000000000000002, 0.9500000000000001, 1.0000000000000004, 1.0500000000000003, 1.1, 1.1500000000000004, 1.2000000000000002, 1.2500000000000004, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5000000000000004, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.7500000000000004, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0000000000000004, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.2500000000000004, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5000000000000004, 2.5500000000000003, 2.6], "steps_per_cycle": 20, "progress": [0, 1.6666666666666667, 3.3333333333333335, 5.0, 6.666666666666667, 8.333333333333334, 10.0, 11.666666666666666, 13.333333333333332, 14.999999999999998, 16.666666666666664, 18.333333333333332, 20.0, 21.666666666666668, 23.333333333333336, 25.000000000000004, 26.66666666666667, 28.33333333333334, 30.000000000000007, 31.666666666666675, 33.33333333333334, 35.00000000000001, 36.66666666666667, 38.333333333333336, 40.0, 41.666666666666664, 43.33333333333333, 44.99999999999999, 46.66666666666666, 48.33333333333332, 49.999999999999986, 51.66666666666665, 53.333333333333314, 54.99999999999998, 56.66666666666664, 58.33333333333331, 59.99999999999997, 61.666666666666636, 63.3333333333333, 64.99999999999997, 66.66666666666664, 68.33333333333331, 69.99999999999999, 71.66666666666666, 73.33333333333333, 75.0, 76.66666666666667, 78.33333333333334, 80.00000000000001, 81.66666666666669, 83.33333333333336, 85.00000000000003, 86.6666666666667, 88.33333333333337, 90.00000000000004, 91.66666666666671, 93.33333333333339, 95.00000000000006, 96.66666666666673, 98.3333333333334, 100.0]}, "cycles": {"left_pes": [[8, "M"], [12, "F"], [8, "M"], [12, "F"], [8, "M"], [12, "F"], [1, "M"]], "right_pes": [[10, "F"], [8, "M"], [12, "F"], [8, "M"], [12, "F"], [8, "M"], [3, "F"]], "left_manus": [[10, "F"], [8, "M"], [12, "F"], [8, "M"], [12, "F"], [8, "M"], [3, "F"]], "right_manus": [[8, "M"], [12, "F"], [8, "M"], [12, "F"], [8, "M"], [13, "F"]]}, "scale": 1231.8796992481205, "offset": [0, 0], "markerIds": ["left_pes", "right_pes", "left_manus", "right_manus"], "frames": [{"time": 0.0, "support_time": -0.4, "positions": [{"x": [0.0, 0.04, 0.0], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-4.0, 0.04], "ty0": [0.2, 0.01], "tx1": [4.1312500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.44, 0.04, 0.4375], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.5625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.56875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.09, 0.02, 0.0875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.52, 0.02, 0.5249999999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.31, 0.01, 0.30624999999999997], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.0, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.0, "y": 0.0}], "forward_support_box": [{"x": 0.4375, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.4375, "y": 0.0}]}, {"time": 0.050000000000000044, "support_time": -0.35, "positions": [{"x": [0.04, 0.04, 0.04375000000000004], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.95625, 0.04], "ty0": [0.2, 0.01], "tx1": [4.175, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.48, 0.04, 0.48125000000000007], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.51875, 0.04], "ty0": [0.0, 0.01], "tx1": [4.6125, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.11, 0.02, 0.10937500000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.55, 0.02, 0.546875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.33, 0.01, 0.328125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.04375000000000004, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.04375000000000004, "y": 0.0}], "forward_support_box": [{"x": 0.48125000000000007, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.48125000000000007, "y": 0.0}]}, {"time": 0.10000000000000009, "support_time": -0.29999999999999993, "positions": [{"x": [0.09, 0.04, 0.08750000000000008], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.9125, 0.04], "ty0": [0.2, 0.01], "tx1": [4.21875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.53, 0.04, 0.5250000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.4749999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.13, 0.02, 0.13125000000000003], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.5700000000000001, 0.02, 0.5687500000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.35000000000000003, 0.01, 0.3500000000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.08750000000000008, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.08750000000000008, "y": 0.0}], "forward_support_box": [{"x": 0.5250000000000001, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.5250000000000001, "y": 0.0}]}, {"time": 0.15000000000000013, "support_time": -0.2499999999999999, "positions": [{"x": [0.13, 0.04, 0.13125000000000012], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.86875, 0.04], "ty0": [0.2, 0.01], "tx1": [4.2625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.5700000000000001, 0.04, 0.5687500000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.43125, 0.04], "ty0": [0.0, 0.01], "tx1": [4.7, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.15, 0.02, 0.15312500000000007], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.59, 0.02, 0.590625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.37, 0.01, 0.371875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.13125000000000012, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.13125000000000012, "y": 0.0}], "forward_support_box": [{"x": 0.5687500000000001, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.5687500000000001, "y": 0.0}]}, {"time": 0.20000000000000018, "support_time": -0.19999999999999984, "positions": [{"x": [0.18, 0.04, 0.17500000000000016], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.8249999999999997, 0.04], "ty0": [0.2, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.61, 0.04, 0.6125000000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.3874999999999997, 0.04], "ty0": [0.0, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.18, 0.02, 0.17500000000000007], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.61, 0.02, 0.6125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.39, 0.01, 0.39375000000000004], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.17500000000000016, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.17500000000000016, "y": 0.0}], "forward_support_box": [{"x": 0.6125000000000002, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.6125000000000002, "y": 0.0}]}, {"time": 0.25, "support_time": -0.15000000000000002, "positions": [{"x": [0.22, 0.04, 0.21875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.78125, 0.04], "ty0": [0.2, 0.01], "tx1": [4.35, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.66, 0.04, 0.65625], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.34375, 0.04], "ty0": [0.0, 0.01], "tx1": [4.7875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.2, 0.02, 0.196875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.63, 0.02, 0.6343749999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.42, 0.01, 0.41562499999999997], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.21875, "y": 0.2}, {"x": 0.21875, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.65625, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.65625, "y": 0.0}]}, {"time": 0.30000000000000004, "support_time": -0.09999999999999998, "positions": [{"x": [0.26, 0.04, 0.2625], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.7375, 0.04], "ty0": [0.2, 0.01], "tx1": [4.39375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.7000000000000001, 0.04, 0.7], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.3, 0.04], "ty0": [0.0, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.22, 0.02, 0.21875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.66, 0.02, 0.65625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.44, 0.01, 0.4375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.2625, "y": 0.2}, {"x": 0.2625, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.7, "y": 0.0}]}, {"time": 0.3500000000000001, "support_time": -0.04999999999999993, "positions": [{"x": [0.31, 0.04, 0.3062500000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.69375, 0.04], "ty0": [0.2, 0.01], "tx1": [4.4375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.74, 0.04, 0.7437500000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.2562499999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.24, 0.02, 0.24062500000000003], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.68, 0.02, 0.6781250000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.46, 0.01, 0.4593750000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.3062500000000001, "y": 0.2}, {"x": 0.3062500000000001, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7437500000000001, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.7437500000000001, "y": 0.0}]}, {"time": 0.40000000000000013, "support_time": 1.1102230246251565e-16, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.262, 0.007, 0.26249999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.7000000000000001, 0.007, 0.7], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.481, 0.005, 0.48124999999999996], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.4500000000000002, "support_time": 0.050000000000000155, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.262, 0.007, 0.26249999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.7000000000000001, 0.007, 0.7], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.481, 0.005, 0.48124999999999996], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.5, "support_time": 0.09999999999999998, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.04, 0.175], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.825, 0.04], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.04, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3875, 0.04], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.26, 0.02, 0.26249999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.7000000000000001, 0.02, 0.7], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.48, 0.01, 0.48124999999999996], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.55, "support_time": 0.15000000000000002, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.22, 0.04, 0.21875000000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.78125, 0.04], "ty0": [0.0, 0.01], "tx1": [4.35, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.66, 0.04, 0.65625], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.34375, 0.04], "ty0": [0.2, 0.01], "tx1": [4.7875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.28, 0.02, 0.284375], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.72, 0.02, 0.721875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.5, 0.01, 0.503125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.21875000000000003, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.21875000000000003, "y": 0.0}], "forward_support_box": [{"x": 0.65625, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.65625, "y": 0.0}]}, {"time": 0.6000000000000001, "support_time": 0.20000000000000007, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.26, 0.04, 0.26250000000000007], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.7375, 0.04], "ty0": [0.0, 0.01], "tx1": [4.39375, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.7000000000000001, 0.04, 0.7], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3, 0.04], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.31, 0.02, 0.30625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.74, 0.02, 0.7437499999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.26250000000000007, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.26250000000000007, "y": 0.0}], "forward_support_box": [{"x": 0.7, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.7, "y": 0.0}]}, {"time": 0.6500000000000001, "support_time": 0.2500000000000001, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.31, 0.04, 0.3062500000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.69375, 0.04], "ty0": [0.0, 0.01], "tx1": [4.4375, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.74, 0.04, 0.74375], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.25625, 0.04], "ty0": [0.2, 0.01], "tx1": [4.875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.33, 0.02, 0.328125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.77, 0.02, 0.765625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.55, 0.01, 0.546875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.3062500000000001, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.3062500000000001, "y": 0.0}], "forward_support_box": [{"x": 0.74375, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.74375, "y": 0.0}]}, {"time": 0.7000000000000002, "support_time": 0.30000000000000016, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.35000000000000003, 0.04, 0.3500000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.65, 0.04], "ty0": [0.0, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.79, 0.04, 0.7875000000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.2125, 0.04], "ty0": [0.2, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.35000000000000003, 0.02, 0.35000000000000003], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.79, 0.02, 0.7875000000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.5700000000000001, 0.01, 0.5687500000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.3500000000000001, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.3500000000000001, "y": 0.0}], "forward_support_box": [{"x": 0.7875000000000001, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.7875000000000001, "y": 0.0}]}, {"time": 0.75, "support_time": 0.35, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.39, 0.04, 0.39374999999999993], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.60625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.525, 0.01], "ty1": [0.0, 0.01]}, {"x": [0.8300000000000001, 0.04, 0.8312499999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.16875, 0.04], "ty0": [0.2, 0.01], "tx1": [4.9625, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.37, 0.02, 0.37187499999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.81, 0.02, 0.809375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.59, 0.01, 0.590625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.39374999999999993, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.39374999999999993, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.8312499999999999, "y": 0.2}, {"x": 0.8312499999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.8, "support_time": 0.4, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.44, 0.04, 0.43749999999999994], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.5625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.5687500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.88, 0.04, 0.875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.125, 0.04], "ty0": [0.2, 0.01], "tx1": [5.00625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.39, 0.02, 0.39374999999999993], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.8300000000000001, 0.02, 0.83125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.61, 0.01, 0.6125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.43749999999999994, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.43749999999999994, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.8500000000000001, "support_time": 0.45000000000000007, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.48, 0.04, 0.48125], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.51875, 0.04], "ty0": [0.0, 0.01], "tx1": [4.6125, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.92, 0.04, 0.91875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.08125, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.42, 0.02, 0.415625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.85, 0.02, 0.8531249999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.63, 0.01, 0.6343749999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.48125, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.48125, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.91875, "y": 0.2}, {"x": 0.91875, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.9000000000000001, "support_time": 0.5000000000000001, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.437, 0.007, 0.43749999999999994], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.875, 0.007, 0.875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.656, 0.005, 0.65625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.9500000000000002, "support_time": 0.5500000000000002, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.437, 0.007, 0.43749999999999994], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.875, 0.007, 0.875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.656, 0.005, 0.65625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 1.0, "support_time": 0.6, "positions": [{"x": [0.35000000000000003, 0.04, 0.35], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.65, 0.04], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.04, 0.7875], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.2125, 0.04], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.44, 0.02, 0.43749999999999994], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.88, 0.02, 0.875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.66, 0.01, 0.65625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 1.0500000000000003, "support_time": 0.6500000000000002, "positions": [{"x": [0.39, 0.04, 0.3937500000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.6062499999999997, 0.04], "ty0": [0.2, 0.01], "tx1": [4.525, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.8300000000000001, 0.04, 0.8312500000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.1687499999999997, 0.04], "ty0": [0.0, 0.01], "tx1": [4.9625, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.46, 0.02, 0.4593750000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.9, 0.02, 0.8968750000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.68, 0.01, 0.6781250000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.3937500000000002, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.3937500000000002, "y": 0.0}], "forward_support_box": [{"x": 0.8312500000000003, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.8312500000000003, "y": 0.0}]}, {"time": 1.1, "support_time": 0.7000000000000001, "positions": [{"x": [0.44, 0.04, 0.43750000000000006], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.5625, 0.04], "ty0": [0.2, 0.01], "tx1": [4.56875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.04, 0.875], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.125, 0.04], "ty0": [0.0, 0.01], "tx1": [5.00625, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.48, 0.02, 0.48124999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.92, 0.02, 0.91875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.7000000000000001, 0.01, 0.7], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.43750000000000006, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.43750000000000006, "y": 0.0}], "forward_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.875, "y": 0.0}]}, {"time": 1.15, "support_time": 0.7499999999999999, "positions": [{"x": [0.48, 0.04, 0.4812499999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.5187500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [4.612500000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.92, 0.04, 0.91875], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.08125, 0.04], "ty0": [0.0, 0.01], "tx1": [5.050000000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.5, 0.02, 0.5031249999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.9400000000000001, 0.02, 0.9406249999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.72, 0.01, 0.7218749999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.4812499999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.4812499999999999, "y": 0.0}], "forward_support_box": [{"x": 0.91875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.91875, "y": 0.0}]}, {"time": 1.2000000000000002, "support_time": 0.8000000000000002, "positions": [{"x": [0.53, 0.04, 0.5250000000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.4749999999999996, 0.04], "ty0": [0.2, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.96, 0.04, 0.9625000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.0374999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.52, 0.02, 0.525], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.96, 0.02, 0.9625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.74, 0.01, 0.74375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5250000000000001, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.5250000000000001, "y": 0.0}], "forward_support_box": [{"x": 0.9625000000000001, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.9625000000000001, "y": 0.0}]}, {"time": 1.25, "support_time": 0.85, "positions": [{"x": [0.5700000000000001, 0.04, 0.56875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.43125, 0.04], "ty0": [0.2, 0.01], "tx1": [4.7, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.01, 0.04, 1.00625], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.99375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.1375, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.55, 0.02, 0.546875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.98, 0.02, 0.984375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.77, 0.01, 0.765625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.56875, "y": 0.2}, {"x": 0.56875, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.00625, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.00625, "y": 0.0}]}, {"time": 1.3000000000000003, "support_time": 0.9000000000000002, "positions": [{"x": [0.61, 0.04, 0.6125000000000003], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3874999999999997, 0.04], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.05, 0.04, 1.0500000000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.9499999999999997, 0.04], "ty0": [0.0, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.5700000000000001, 0.02, 0.5687500000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.01, 0.02, 1.00625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.79, 0.01, 0.7875000000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.6125000000000003, "y": 0.2}, {"x": 0.6125000000000003, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.0500000000000003, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.0500000000000003, "y": 0.0}]}, {"time": 1.35, "support_time": 0.9500000000000001, "positions": [{"x": [0.66, 0.04, 0.65625], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.34375, 0.04], "ty0": [0.2, 0.01], "tx1": [4.7875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.09, 0.04, 1.09375], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.90625, 0.04], "ty0": [0.0, 0.01], "tx1": [5.225, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.59, 0.02, 0.590625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.03, 0.02, 1.028125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.81, 0.01, 0.809375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.65625, "y": 0.2}, {"x": 0.65625, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.09375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.09375, "y": 0.0}]}, {"time": 1.4000000000000004, "support_time": 1.0000000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.612, 0.007, 0.6124999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.05, 0.007, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.8310000000000001, 0.005, 0.8312499999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.4500000000000002, "support_time": 1.0500000000000003, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.612, 0.007, 0.6124999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.05, 0.007, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.8310000000000001, 0.005, 0.8312499999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.5, "support_time": 1.1, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.04, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.475, 0.04], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.04, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.0375, 0.04], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.61, 0.02, 0.6124999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.05, 0.02, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.8300000000000001, 0.01, 0.8312499999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.5500000000000003, "support_time": 1.1500000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.5700000000000001, 0.04, 0.5687500000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.43125, 0.04], "ty0": [0.0, 0.01], "tx1": [4.7, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.01, 0.04, 1.00625], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.99375, 0.04], "ty0": [0.2, 0.01], "tx1": [5.1375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.63, 0.02, 0.6343750000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.07, 0.02, 1.071875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.85, 0.01, 0.853125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5687500000000002, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5687500000000002, "y": 0.0}], "forward_support_box": [{"x": 1.00625, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.00625, "y": 0.0}]}, {"time": 1.6, "support_time": 1.2000000000000002, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.61, 0.04, 0.6125], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.3875, 0.04], "ty0": [0.0, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.05, 0.04, 1.05], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.95, 0.04], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.66, 0.02, 0.65625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.09, 0.02, 1.09375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.88, 0.01, 0.875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.6125, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.6125, "y": 0.0}], "forward_support_box": [{"x": 1.05, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.05, "y": 0.0}]}, {"time": 1.6500000000000004, "support_time": 1.2500000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.66, 0.04, 0.6562500000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.34375, 0.04], "ty0": [0.0, 0.01], "tx1": [4.7875000000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.09, 0.04, 1.0937500000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.90625, 0.04], "ty0": [0.2, 0.01], "tx1": [5.225, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.68, 0.02, 0.6781250000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.12, 0.02, 1.115625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.9, 0.01, 0.8968750000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.6562500000000002, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.6562500000000002, "y": 0.0}], "forward_support_box": [{"x": 1.0937500000000002, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.0937500000000002, "y": 0.0}]}, {"time": 1.7000000000000002, "support_time": 1.3000000000000003, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.7000000000000001, 0.04, 0.7000000000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.3, 0.04], "ty0": [0.0, 0.01], "tx1": [4.83125, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.1400000000000001, 0.04, 1.1375000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.8625, 0.04], "ty0": [0.2, 0.01], "tx1": [5.26875, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.7000000000000001, 0.02, 0.7000000000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.1400000000000001, 0.02, 1.1375000000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.92, 0.01, 0.9187500000000002], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7000000000000002, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.7000000000000002, "y": 0.0}], "forward_support_box": [{"x": 1.1375000000000002, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.1375000000000002, "y": 0.0}]}, {"time": 1.75, "support_time": 1.35, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.74, 0.04, 0.7437499999999999], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.18, 0.04, 1.18125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.81875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.3125, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.72, 0.02, 0.7218749999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.16, 0.02, 1.1593749999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.9400000000000001, 0.01, 0.9406249999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7437499999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.7437499999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.18125, "y": 0.2}, {"x": 1.18125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.8000000000000003, "support_time": 1.4000000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.04, 0.7875000000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.2125, 0.04], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.22, 0.04, 1.225], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.775, 0.04], "ty0": [0.2, 0.01], "tx1": [5.35625, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.74, 0.02, 0.7437500000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.18, 0.02, 1.18125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.96, 0.01, 0.9625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7875000000000002, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.7875000000000002, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.225, "y": 0.2}, {"x": 1.225, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.85, "support_time": 1.4500000000000002, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.8300000000000001, 0.04, 0.83125], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.16875, 0.04], "ty0": [0.0, 0.01], "tx1": [4.9625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.27, 0.04, 1.26875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.73125, 0.04], "ty0": [0.2, 0.01], "tx1": [5.4, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.77, 0.02, 0.765625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.2, 0.02, 1.203125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.98, 0.01, 0.984375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.83125, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.83125, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.26875, "y": 0.2}, {"x": 1.26875, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.9000000000000004, "support_time": 1.5000000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.788, 0.007, 0.7875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.225, 0.007, 1.225], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.006, 0.005, 1.00625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.9500000000000002, "support_time": 1.5500000000000003, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.788, 0.007, 0.7875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.225, 0.007, 1.225], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.006, 0.005, 1.00625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 2.0, "support_time": 1.6, "positions": [{"x": [0.7000000000000001, 0.04, 0.7], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3, 0.04], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.04, 1.1375], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.8625, 0.04], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.79, 0.02, 0.7875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.22, 0.02, 1.225], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.01, 0.01, 1.00625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 2.0500000000000003, "support_time": 1.6500000000000004, "positions": [{"x": [0.74, 0.04, 0.7437500000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.2562499999999996, 0.04], "ty0": [0.2, 0.01], "tx1": [4.875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.18, 0.04, 1.1812500000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.8187499999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.3125, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.81, 0.02, 0.8093750000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.25, 0.02, 1.2468750000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.03, 0.01, 1.0281250000000002], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7437500000000001, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.7437500000000001, "y": 0.0}], "forward_support_box": [{"x": 1.1812500000000001, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1812500000000001, "y": 0.0}]}, {"time": 2.1, "support_time": 1.7000000000000002, "positions": [{"x": [0.79, 0.04, 0.7875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.2125, 0.04], "ty0": [0.2, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.22, 0.04, 1.225], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.775, 0.04], "ty0": [0.0, 0.01], "tx1": [5.35625, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.8300000000000001, 0.02, 0.83125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.27, 0.02, 1.26875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.05, 0.01, 1.05], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.7875, "y": 0.0}], "forward_support_box": [{"x": 1.225, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.225, "y": 0.0}]}, {"time": 2.1500000000000004, "support_time": 1.7500000000000004, "positions": [{"x": [0.8300000000000001, 0.04, 0.8312500000000003], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.1687499999999997, 0.04], "ty0": [0.2, 0.01], "tx1": [4.9625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.27, 0.04, 1.2687500000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.7312499999999997, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.85, 0.02, 0.8531250000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.29, 0.02, 1.2906250000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.07, 0.01, 1.0718750000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.8312500000000003, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.8312500000000003, "y": 0.0}], "forward_support_box": [{"x": 1.2687500000000003, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.2687500000000003, "y": 0.0}]}, {"time": 2.2, "support_time": 1.8000000000000003, "positions": [{"x": [0.88, 0.04, 0.875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.125, 0.04], "ty0": [0.2, 0.01], "tx1": [5.00625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.31, 0.04, 1.3125], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.6875, 0.04], "ty0": [0.0, 0.01], "tx1": [5.44375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.88, 0.02, 0.875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.31, 0.02, 1.3125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.09, 0.01, 1.09375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.3125, "y": 0.0}]}, {"time": 2.25, "support_time": 1.85, "positions": [{"x": [0.92, 0.04, 0.9187499999999998], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.36, 0.04, 1.35625], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.9, 0.02, 0.8968749999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.33, 0.02, 1.334375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.12, 0.01, 1.115625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.9187499999999998, "y": 0.2}, {"x": 0.9187499999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.35625, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.35625, "y": 0.0}]}, {"time": 2.3000000000000003, "support_time": 1.9000000000000004, "positions": [{"x": [0.96, 0.04, 0.9625000000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.4000000000000001, 0.04, 1.4000000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.92, 0.02, 0.9187500000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.36, 0.02, 1.3562500000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.1400000000000001, 0.01, 1.1375000000000002], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.9625000000000001, "y": 0.2}, {"x": 0.9625000000000001, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4000000000000001, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4000000000000001, "y": 0.0}]}, {"time": 2.35, "support_time": 1.9500000000000002, "positions": [{"x": [1.01, 0.04, 1.0062499999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.44, 0.04, 1.4437499999999999], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.9400000000000001, 0.02, 0.9406249999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.3800000000000001, 0.02, 1.3781249999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.16, 0.01, 1.1593749999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0062499999999999, "y": 0.2}, {"x": 1.0062499999999999, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4437499999999999, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4437499999999999, "y": 0.0}]}, {"time": 2.4000000000000004, "support_time": 2.0000000000000004, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.962, 0.007, 0.9624999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.4000000000000001, 0.007, 1.4], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.181, 0.005, 1.18125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.45, "support_time": 2.0500000000000003, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.962, 0.007, 0.9624999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.4000000000000001, 0.007, 1.4], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.181, 0.005, 1.18125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.5, "support_time": 2.1, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.04, 0.875], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.125, 0.04], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.04, 1.3125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.6875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.96, 0.02, 0.9624999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.4000000000000001, 0.02, 1.4], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.18, 0.01, 1.18125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.5500000000000003, "support_time": 2.1500000000000004, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.92, 0.04, 0.9187500000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.08125, 0.04], "ty0": [0.0, 0.01], "tx1": [5.05, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.36, 0.04, 1.3562500000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.64375, 0.04], "ty0": [0.2, 0.01], "tx1": [5.4875, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.98, 0.02, 0.984375], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.42, 0.02, 1.421875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.2, 0.01, 1.203125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.9187500000000002, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.9187500000000002, "y": 0.0}], "forward_support_box": [{"x": 1.3562500000000002, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.3562500000000002, "y": 0.0}]}, {"time": 2.6, "support_time": 2.2, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.96, 0.04, 0.9625], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.0375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.4000000000000001, 0.04, 1.4000000000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.5999999999999996, 0.04], "ty0": [0.2, 0.01], "tx1": [5.53125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.01, 0.02, 1.0062499999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.44, 0.02, 1.44375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.22, 0.01, 1.225], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.9625, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.9625, "y": 0.0}], "forward_support_box": [{"x": 1.4000000000000001, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.4000000000000001, "y": 0.0}]}, {"time": 2.6500000000000004, "support_time": 2.2500000000000004, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.01, 0.04, 1.0062500000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.9937499999999995, 0.04], "ty0": [0.0, 0.01], "tx1": [5.1375, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.44, 0.04, 1.4437500000000003], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.5562499999999995, 0.04], "ty0": [0.2, 0.01], "tx1": [5.575, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.03, 0.02, 1.0281250000000002], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.47, 0.02, 1.4656250000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.25, 0.01, 1.2468750000000002], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.0062500000000003, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.0062500000000003, "y": 0.0}], "forward_support_box": [{"x": 1.4437500000000003, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.4437500000000003, "y": 0.0}]}, {"time": 2.7, "support_time": 2.3000000000000003, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.05, 0.04, 1.05], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.95, 0.04], "ty0": [0.0, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.49, 0.04, 1.4875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.5125, 0.04], "ty0": [0.2, 0.01], "tx1": [5.61875, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.05, 0.02, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.49, 0.02, 1.4874999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.27, 0.01, 1.2687499999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.05, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.05, "y": 0.0}], "forward_support_box": [{"x": 1.4875, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.4875, "y": 0.0}]}, {"time": 2.75, "support_time": 2.35, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.09, 0.04, 1.09375], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.90625, 0.04], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.53, 0.04, 1.53125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.46875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.07, 0.02, 1.071875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.51, 0.02, 1.509375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.29, 0.01, 1.290625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.09375, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.09375, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.53125, "y": 0.2}, {"x": 1.53125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.8000000000000003, "support_time": 2.4000000000000004, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.04, 1.1375000000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.90625, 0.04], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.58, 0.04, 1.5750000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.46875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.09, 0.02, 1.09375], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.53, 0.02, 1.53125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.31, 0.01, 1.3125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.1375000000000002, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.1375000000000002, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.5750000000000002, "y": 0.2}, {"x": 1.5750000000000002, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.85, "support_time": 2.45, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.18, 0.04, 1.18125], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.90625, 0.04], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.62, 0.04, 1.61875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.46875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.12, 0.02, 1.1156249999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.55, 0.02, 1.5531249999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.33, 0.01, 1.3343749999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.18125, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.18125, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.61875, "y": 0.2}, {"x": 1.61875, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.9000000000000004, "support_time": 2.5000000000000004, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.22, 0.01, 1.2249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.90625, 0.04], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.6600000000000001, 0.01, 1.6624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.46875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.137, 0.007, 1.1374999999999997], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.575, 0.007, 1.5749999999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.356, 0.005, 1.3562499999999997], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.2249999999999999, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.2249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.95, "support_time": 2.5500000000000003, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.22, 0.01, 1.2249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.90625, 0.04], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.6600000000000001, 0.01, 1.6624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.46875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.137, 0.007, 1.1374999999999997], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.575, 0.007, 1.5749999999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.356, 0.005, 1.3562499999999997], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.2249999999999999, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.2249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 3.0, "support_time": 2.6, "positions": [{"x": [1.05, 0.04, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.22, 0.01, 1.2249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.90625, 0.04], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.6600000000000001, 0.01, 1.6624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.46875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.1400000000000001, 0.02, 1.1374999999999997], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.575, 0.007, 1.5749999999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.36, 0.01, 1.3562499999999997], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.2249999999999999, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.2249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}]}, "body": "<div class=\"top-container no-select\">\n  <div style=\"display:flex;padding:0 1.0em;align-items: flex-end;\">\n    <div class=\"header-box\">\n      <div class=\"header-title\">EQ-C</div>\n      <div class=\"header-summary\">A test run to verify that the simulation system works.</div>\n      <div class=\"header-entry date\">\n        <span class=\"name\">Date:</span>\n        <span class=\"value\">10-18-2026 11:55</span>\n      </div>\n      <div class=\"header-entry duty-cycle\">\n        <span class=\"name\">Duty Cycle:</span>\n        <span class=\"value\">60%</span>\n      </div>\n      <div class=\"header-entry activity-phases\">\n        <span class=\"name\">Activity Phases:</span>\n          <span class=\"value\">\n            Pes: (<span class=\"left_pes-value\">0%</span>,\n            <span class=\"right_pes-value\">50%</span>)\n            Manus: (<span class=\"left_manus-value\">-50%</span>,\n            <span class=\"right_manus-value\">-100%</span>)\n          </span>\n      </div>\n      <div class=\"header-entry support-phases\">\n        <span class=\"name\">Support Phases:</span>\n          <span class=\"value\">\n            Pes: (<span class=\"left_pes-value\">0%</span>,\n            <span class=\"right_pes-value\">50%</span>)\n            Manus: (<span class=\"left_manus-value\">-50%</span>,\n            <span class=\"right_manus-value\">-100%</span>)\n          </span>\n      </div>\n    </div>\n    <div class=\"spacer\"></div>\n\n    <div class=\"playback-controls\">\n      <div class=\"control-row\">\n        <div class=\"spacer\"></div>\n\n        <div class=\"control\" data-role=\"pop-out\">\n          <img src=\"img/picture-in-picture.svg\"/>\n        </div>\n\n        <div class=\"control\" data-role=\"save-svg\">\n          <img src=\"img/camera.svg\"/>\n        </div>\n      </div>\n\n      <div class=\"control-row animation-controls\">\n        <div class=\"spacer\"></div>\n\n        <div class=\"control\" data-role=\"backward-10\">\n          <img src=\"img/replay-10.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"jump-back\">\n          <img src=\"img/back.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"frame-back\">\n          <img src=\"img/step-back.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"toggle-play\">\n          <img src=\"img/play.svg\" class=\"play-icon\"/>\n          <img src=\"img/pause.svg\" class=\"pause-icon\"/>\n        </div>\n        <div class=\"control\" data-role=\"frame-forward\">\n          <img src=\"img/step-forward.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"jump-forward\">\n          <img src=\"img/forward.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"forward-10\">\n          <img src=\"img/forward-10.svg\"/>\n        </div>\n      </div>\n\n\n    </div>\n  </div>\n\n  <div class=\"progress-bar\">\n    <div class=\"header\">\n      <div class=\"value-box\">\n        <div class=\"header\">Left Pes</div>\n        <div class=\"swatch left_pes_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Right Pes</div>\n        <div class=\"swatch right_pes_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Left Manus</div>\n        <div class=\"swatch left_manus_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Right Manus</div>\n        <div class=\"swatch right_manus_color\"></div>\n      </div>\n\n      <div class=\"spacer\"></div>\n\n      <div class=\"time-box\">\n\n        <div class=\"value-box\">\n          <div class=\"header\">Progress</div>\n          <div class=\"value progress-value\"></div>\n        </div>\n\n        <div class=\"value-box activity-time-box\">\n          <div class=\"header\">Activity Cycle</div>\n          <div class=\"value\">\n            <span class=\"cycle-value\"></span> :\n            <span class=\"phase-value\"></span>\n          </div>\n        </div>\n\n        <div class=\"value-box support-time-box\">\n          <div class=\"header\">Support Cycle</div>\n          <div class=\"value\">\n            <span class=\"cycle-value\"></span> :\n            <span class=\"phase-value\"></span>\n          </div>\n        </div>\n\n      </div>\n    </div>\n\n    <div class=\"outer\">\n      <div class=\"inner\"></div>\n      <div class=\"cycles left_pes left_pes_color\"></div>\n      <div class=\"cycles left_manus left_manus_color\"></div>\n      <div class=\"cycles right_manus right_manus_color\"></div>\n      <div class=\"cycles right_pes right_pes_color\"></div>\n    </div>\n  </div>\n</div>\n\n        <div class=\"svg-box\">\n          <div class=\"svg-box-inner\">\n<svg version=\"1.1\"\n    id=\"svg-352363496529\"\n    xmlns:xlink=\"http://www.w3.org/1999/xlink\"\n    xmlns=\"http://www.w3.org/2000/svg\"\n    viewBox=\"-21 -268 2082 289\">\n\n<style>\n/* <![CDATA[ */\n#svg-352363496529 .left_pes { fill: DodgerBlue; opacity: 0.5; }\n#svg-352363496529 .right_pes { fill: DarkOrange; opacity: 0.5; }\n#svg-352363496529 .left_manus { fill: DarkOliveGreen; opacity: 0.5; }\n#svg-352363496529 .right_manus { fill: DarkOrchid; opacity: 0.5; }\n#svg-352363496529 .left_pes { fill: DodgerBlue; opacity: 0.5; stroke-width: 8px; stroke: DodgerBlue; }\n#svg-352363496529 .left_pes.assumed { fill: white; opacity: 0.33; }\n#svg-352363496529 .left_pes-marker { fill: transparent; stroke-width: 8px; stroke: DodgerBlue; }\n#svg-352363496529 .right_pes { fill: DarkOrange; opacity: 0.5; stroke-width: 8px; stroke: DarkOrange; }\n#svg-352363496529 .right_pes.assumed { fill: white; opacity: 0.33; }\n#svg-352363496529 .right_pes-marker { fill: transparent; stroke-width: 8px; stroke: DarkOrange; }\n#svg-352363496529 .left_manus { fill: DarkOliveGreen; opacity: 0.5; stroke-width: 8px; stroke: DarkOliveGreen; stroke-dasharray: 4,4; }\n#svg-352363496529 .left_manus.assumed { fill: white; opacity: 0.33; stroke-dasharray: 4,4; }\n#svg-352363496529 .left_manus-marker { fill: transparent; stroke-width: 8px; stroke: DarkOliveGreen; stroke-dasharray: 8,4; }\n#svg-352363496529 .right_manus { fill: DarkOrchid; opacity: 0.5; stroke-width: 8px; stroke: DarkOrchid; stroke-dasharray: 4,4; }\n#svg-352363496529 .right_manus.assumed { fill: white; opacity: 0.33; stroke-dasharray: 4,4; }\n#svg-352363496529 .right_manus-marker { fill: transparent; stroke-width: 8px; stroke: DarkOrchid; stroke-dasharray: 8,4; }\n/* ]]> */\n</style>\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"0.0\" cy=\"-246.3759398496241\" data-x=\"0.0\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-uid=\"2181\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"431.15789473684214\" cy=\"-246.3759398496241\" data-x=\"0.35000000000000003\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"2182\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"862.3157894736843\" cy=\"-246.3759398496241\" data-x=\"0.7000000000000001\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"2183\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"1293.4736842105262\" cy=\"-246.3759398496241\" data-x=\"1.05\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"2184\" />\n<circle id=\"left_pes\" class=\"left_pes-marker\" r=\"16.0\" cx=\"0.0\" cy=\"-246.3759398496241\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"215.57894736842107\" cy=\"-0.0\" data-x=\"0.18\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"2186\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"646.7368421052631\" cy=\"-0.0\" data-x=\"0.52\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"2187\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"1077.8947368421054\" cy=\"-0.0\" data-x=\"0.88\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"2188\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"1509.0526315789475\" cy=\"-0.0\" data-x=\"1.22\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"2189\" />\n<circle id=\"right_pes\" class=\"right_pes-marker\" r=\"16.0\" cx=\"215.57894736842107\" cy=\"-0.0\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"754.5263157894738\" cy=\"-246.3759398496241\" data-x=\"0.61\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"2192\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"1185.6842105263158\" cy=\"-246.3759398496241\" data-x=\"0.96\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"2193\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"1616.8421052631581\" cy=\"-246.3759398496241\" data-x=\"1.31\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"2194\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"2048.0\" cy=\"-246.3759398496241\" data-x=\"1.6600000000000001\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"2195\" />\n<circle id=\"left_manus\" class=\"left_manus-marker\" r=\"12.0\" cx=\"754.5263157894738\" cy=\"-246.3759398496241\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"538.9473684210527\" cy=\"-0.0\" data-x=\"0.44\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-uid=\"2197\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"970.1052631578948\" cy=\"-0.0\" data-x=\"0.79\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"2198\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"1401.2631578947369\" cy=\"-0.0\" data-x=\"1.1400000000000001\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"2199\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"1832.421052631579\" cy=\"-0.0\" data-x=\"1.49\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"2200\" />\n<circle id=\"right_manus\" class=\"right_manus-marker\" r=\"12.0\" cx=\"538.9473684210527\" cy=\"-0.0\" />\n</svg></div>\n          <div class=\"svg-controls-box\" style=\"display:none\">\n            <div>\n                <div>Activity: <span class=\"activity-status\"></span></div>\n                <div>Support: <span class=\"support-status\"></span></div>\n            </div>\n            <div class=\"spacer\"></div>\n          </div>\n        </div>\n        \n<div class=\"line-break\"></div>\n\n<div class=\"results-container\">\n  <div class=\"settings-box info-display-box\">\n    <div class=\"info-header\">Trial Results</div>\n\n    <div class=\"info-row\">\n      <div id=\"lengthResults\" class=\"entry\">\n        <div class=\"title title-box\">Average Calculated Lengths (m)</div>\n\n        <div>\n          <span class=\"label\">Coupling Length:</span>\n          <span class=\"value\">0.44 &#177; 0.02</span>\n          <!-- span class=\"deviation\"> </span -->\n        </div>\n\n        <div>\n          <span class=\"label\">Coupling IQR:</span>\n          <span class=\"value\">[0.421, 0.4589]</span>\n        </div>\n\n        <div>\n          <span class=\"label\">Coupling Bounds (2%):</span>\n          <span class=\"value\">[0.3806, 0.4999]</span>\n        </div>\n      </div>\n    </div>\n  </div>\n\n  <div class=\"status-box info-display-box\">\n    <div class=\"info-header\">Display Status</div>\n\n    <div class=\"info-row\">\n      <div class=\"entry left_pes\">\n        <div class=\"title left_pes_color\">Left Pes</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n\n      <div class=\"entry left_manus\">\n        <div class=\"title left_manus_color\">Left Manus</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n    </div>\n\n    <div class=\"info-row\">\n      <div class=\"entry right_pes\">\n        <div class=\"title right_pes_color\">Right Pes</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n\n      <div class=\"entry right_manus\">\n        <div class=\"title right_manus_color\">Right Manus</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n    </div>\n  </div>\n</div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"fa3a7d37-d947-4a6f-92db-0d5866a0622b\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"fa3a7d37-d947-4a6f-92db-0d5866a0622b\")) {\n                    Plotly.newPlot(\n                        'fa3a7d37-d947-4a6f-92db-0d5866a0622b',\n                        [{\"mode\": \"lines\", \"type\": \"scatter\", \"uid\": \"783083fe-23d0-4f4e-bbc7-7203fc6d36da\", \"x\": [0.35, 0.350722891566265, 0.35144578313253005, 0.3521686746987951, 0.35289156626506013, 0.35361445783132517, 0.3543373493975902, 0.35506024096385524, 0.3557831325301203, 0.3565060240963853, 0.35722891566265036, 0.3579518072289154, 0.35867469879518044, 0.3593975903614455, 0.3601204819277105, 0.36084337349397555, 0.3615662650602406, 0.3622891566265056, 0.36301204819277066, 0.3637349397590357, 0.36445783132530074, 0.3651807228915658, 0.3659036144578308, 0.36662650602409586, 0.3673493975903609, 0.36807228915662593, 0.36879518072289097, 0.369518072289156, 0.37024096385542105, 0.3709638554216861, 0.3716867469879511, 0.37240963855421616, 0.3731325301204812, 0.37385542168674624, 0.3745783132530113, 0.3753012048192763, 0.37602409638554135, 0.3767469879518064, 0.3774698795180714, 0.37819277108433647, 0.3789156626506015, 0.37963855421686654, 0.3803614457831316, 0.3810843373493966, 0.38180722891566166, 0.3825301204819267, 0.38325301204819173, 0.38397590361445677, 0.3846987951807218, 0.38542168674698685, 0.3861445783132519, 0.3868674698795169, 0.38759036144578196, 0.388313253012047, 0.38903614457831204, 0.3897590361445771, 0.3904819277108421, 0.39120481927710715, 0.3919277108433722, 0.39265060240963723, 0.39337349397590227, 0.3940963855421673, 0.39481927710843234, 0.3955421686746974, 0.3962650602409624, 0.39698795180722746, 0.3977108433734925, 0.39843373493975753, 0.39915662650602257, 0.3998795180722876, 0.40060240963855265, 0.4013253012048177, 0.4020481927710827, 0.40277108433734776, 0.4034939759036128, 0.40421686746987784, 0.4049397590361429, 0.4056626506024079, 0.40638554216867295, 0.407108433734938, 0.40783132530120303, 0.40855421686746807, 0.4092771084337331, 0.40999999999999814, 0.4107228915662632, 0.4114457831325282, 0.41216867469879326, 0.4128915662650583, 0.41361445783132333, 0.4143373493975884, 0.4150602409638534, 0.41578313253011845, 0.4165060240963835, 0.4172289156626485, 0.41795180722891356, 0.4186746987951786, 0.41939759036144364, 0.4201204819277087, 0.4208433734939737, 0.42156626506023875, 0.4222891566265038, 0.42301204819276883, 0.42373493975903387, 0.4244578313252989, 0.42518072289156394, 0.425903614457829, 0.426626506024094, 0.42734939759035906, 0.4280722891566241, 0.42879518072288914, 0.4295180722891542, 0.4302409638554192, 0.43096385542168425, 0.4316867469879493, 0.4324096385542143, 0.43313253012047936, 0.4338554216867444, 0.43457831325300944, 0.4353012048192745, 0.4360240963855395, 0.43674698795180456, 0.4374698795180696, 0.43819277108433463, 0.43891566265059967, 0.4396385542168647, 0.44036144578312975, 0.4410843373493948, 0.4418072289156598, 0.44253012048192486, 0.4432530120481899, 0.44397590361445494, 0.44469879518072, 0.445421686746985, 0.44614457831325005, 0.4468674698795151, 0.4475903614457801, 0.44831325301204517, 0.4490361445783102, 0.44975903614457524, 0.4504819277108403, 0.4512048192771053, 0.45192771084337036, 0.4526506024096354, 0.45337349397590043, 0.45409638554216547, 0.4548192771084305, 0.45554216867469555, 0.4562650602409606, 0.4569879518072256, 0.45771084337349066, 0.4584337349397557, 0.45915662650602074, 0.4598795180722858, 0.4606024096385508, 0.46132530120481585, 0.4620481927710809, 0.46277108433734593, 0.46349397590361097, 0.464216867469876, 0.46493975903614104, 0.4656626506024061, 0.4663855421686711, 0.46710843373493616, 0.4678313253012012, 0.46855421686746623, 0.46927710843373127, 0.4699999999999963, 0.47072289156626135, 0.4714457831325264, 0.4721686746987914, 0.47289156626505646, 0.4736144578313215, 0.47433734939758654, 0.4750602409638516, 0.4757831325301166, 0.47650602409638165, 0.4772289156626467, 0.47795180722891173, 0.47867469879517677, 0.4793975903614418, 0.48012048192770684, 0.4808433734939719, 0.4815662650602369, 0.48228915662650196, 0.483012048192767, 0.48373493975903203, 0.4844578313252971, 0.4851807228915621, 0.48590361445782715, 0.4866265060240922, 0.4873493975903572, 0.48807228915662226, 0.4887951807228873, 0.48951807228915234, 0.4902409638554174, 0.4909638554216824, 0.49168674698794745, 0.4924096385542125, 0.49313253012047753, 0.49385542168674257, 0.4945783132530076, 0.49530120481927264, 0.4960240963855377, 0.4967469879518027, 0.49746987951806776, 0.4981927710843328, 0.49891566265059784, 0.4996385542168629, 0.5003614457831279, 0.501084337349393, 0.501807228915658, 0.502530120481923, 0.5032530120481881, 0.5039759036144531, 0.5046987951807181, 0.5054216867469832, 0.5061445783132482, 0.5068674698795133, 0.5075903614457783, 0.5083132530120433, 0.5090361445783084, 0.5097590361445734, 0.5104819277108384, 0.5112048192771035, 0.5119277108433685, 0.5126506024096336, 0.5133734939758986, 0.5140963855421636, 0.5148192771084287, 0.5155421686746937, 0.5162650602409588, 0.5169879518072238, 0.5177108433734888, 0.5184337349397539, 0.5191566265060189, 0.5198795180722839, 0.520602409638549, 0.521325301204814, 0.5220481927710791, 0.5227710843373441, 0.5234939759036091, 0.5242168674698742, 0.5249397590361392, 0.5256626506024042, 0.5263855421686693, 0.5271084337349343, 0.5278313253011994, 0.5285542168674644, 0.5292771084337294, 0.53], \"y\": [0.12673840992042062, 0.1362115056661605, 0.14630874742766906, 0.15706447996113346, 0.16851443291902232, 0.18069574185172713, 0.19364696709790333, 0.20740811039112222, 0.22202062900975342, 0.23752744729686018, 0.2539729653773142, 0.27140306490027843, 0.2898651116366221, 0.30940795476268007, 0.33008192266396325, 0.3519388150949188, 0.37503189153349104, 0.3994158555720054, 0.425146835188603, 0.45228235874604, 0.4808813265669329, 0.5110039779363891, 0.5427118533842537, 0.5760677520997391, 0.6111356843309207, 0.6479808186202394, 0.686669423724705, 0.7272688050657425, 0.7698472355485105, 0.8144738805839514, 0.8612187171387163, 0.9101524466284562, 0.9613464014587636, 1.014872445005357, 1.0708028648109713, 1.1292102587610977, 1.1901674139842746, 1.2537471782054723, 1.3200223232634514, 1.3890654004852936, 1.4609485875940145, 1.535743526808819, 1.6135211537827934, 1.6943515170102559, 1.7783035873264017, 1.865445057116041, 1.9558421288470267, 2.0495592925482446, 2.1466590918627775, 2.2472018783249923, 2.3512455535367267, 2.4588452989535985, 2.5700532930383844, 2.6849184155955905, 2.803485939170358, 2.925797207476555, 3.051889300913872, 3.1817946893425497, 3.3155408724071473, 3.453150007837959, 3.594638528309987, 3.740016747604629, 3.889288456998064, 4.042450512991587, 4.199492417702288, 4.360395893445747, 4.525134453264469, 4.693672969384619, 4.865967241817009, 5.041963569553816, 5.22159832704733, 5.404797548888198, 5.591476525824902, 5.781539415479983, 5.974878871318479, 6.171375693606062, 6.370898506255026, 6.573303463591281, 6.778433991181602, 6.986120564933198, 7.196180532714161, 7.408417982739958, 7.622623662924549, 7.838574955302765, 8.056035909490394, 8.274757338958446, 8.494476983657114, 8.714919742231926, 8.935797976729898, 9.15681189229748, 9.377649993925942, 9.597989621806201, 9.817497566316009, 10.035830763082075, 10.252637067942079, 10.467556110981702, 10.680220228145476, 10.890255468223897, 11.09728267230923, 11.30091862209706, 11.500777252696611, 11.696470924909221, 11.887611751248926, 12.073812969320416, 12.254690355546314, 12.429863671655708, 12.598958135817735, 12.761605909834701, 12.917447593406825, 13.06613371615089, 13.207326217804248, 13.340699906878744, 13.46594388795002, 13.58276294777958, 13.690878890572167, 13.790031812869886, 13.879981308877188, 13.960507597395862, 14.031412562023691, 14.09252069683093, 14.143679950370302, 14.184762461592596, 14.215665182024456, 14.236310379409732, 14.246646018911722, 14.246646018911761, 14.236310379409854, 14.215665182024651, 14.184762461592872, 14.14367995037066, 14.092520696831361, 14.031412562024196, 13.960507597396445, 13.879981308877843, 13.79003181287061, 13.690878890572963, 13.582762947780447, 13.465943887950951, 13.340699906879738, 13.207326217805303, 13.066133716152004, 12.917447593407998, 12.761605909835923, 12.598958135819013, 12.429863671657031, 12.25469035554768, 12.073812969321827, 11.887611751250375, 11.696470924910708, 11.50077725269813, 11.30091862209861, 11.097282672310808, 10.890255468225496, 10.680220228147101, 10.467556110983342, 10.252637067943738, 10.035830763083748, 9.817497566317693, 9.597989621807892, 9.377649993927635, 9.156811892299178, 8.935797976731596, 8.71491974223362, 8.494476983658805, 8.27475733896013, 8.056035909492067, 7.83857495530443, 7.622623662926202, 7.4084179827415975, 7.196180532715782, 6.986120564934801, 6.7784339911831895, 6.573303463592846, 6.37089850625657, 6.171375693607585, 5.974878871319975, 5.781539415481457, 5.591476525826349, 5.404797548889619, 5.2215983270487225, 5.041963569555181, 4.865967241818346, 4.6936729693859265, 4.52513445326575, 4.360395893446998, 4.1994924177035085, 4.042450512992778, 3.889288456999225, 3.7400167476057606, 3.594638528311087, 3.453150007839031, 3.315540872408189, 3.181794689343562, 3.051889300914856, 2.9257972074775083, 2.8034859391712836, 2.6849184155964863, 2.5700532930392517, 2.458845298954439, 2.351245553537539, 2.247201878325777, 2.1466590918635364, 2.049559292548977, 1.9558421288477337, 1.865445057116722, 1.778303587327059, 1.6943515170108887, 1.6135211537834024, 1.5357435268094046, 1.4609485875945776, 1.389065400485835, 1.3200223232639707, 1.2537471782059704, 1.1901674139847527, 1.1292102587615556, 1.07080286481141, 1.0148724450057771, 0.9613464014591656, 0.9101524466288405, 0.861218717139084, 0.8144738805843021, 0.7698472355488452, 0.7272688050660617, 0.6866694237250096, 0.647980818620529, 0.6111356843311967, 0.576067752100002, 0.5427118533845033, 0.5110039779366263, 0.4808813265671583, 0.452282358746254, 0.42514683518880586, 0.3994158555721978, 0.37503189153367344, 0.35193881509509123, 0.33008192266412656, 0.3094079547628343, 0.2898651116367681, 0.27140306490041605, 0.25397296537744424, 0.23752744729698277, 0.222020629009869, 0.2074081103912311, 0.19364696709800566, 0.18069574185182358, 0.16851443291911303, 0.15706447996121867, 0.14630874742774908, 0.1362115056662356, 0.12673840992042062]}],\n                        {\"title\": {\"text\": \"Coupling Length Distribution\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Coupling Distance (m)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Expectation (au)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"b3ff9f41-17d3-4b44-aecd-7ce686536b2d\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"b3ff9f41-17d3-4b44-aecd-7ce686536b2d\")) {\n                    Plotly.newPlot(\n                        'b3ff9f41-17d3-4b44-aecd-7ce686536b2d',\n                        [{\"legendgroup\": \"Length\", \"line\": {\"color\": \"rgba(31, 119, 180, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Length\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"4a31256a-c602-49e7-ae4b-f3f3c5436d36\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0], \"y\": [0.41000000000000003, 0.41000000000000003, 0.41000000000000003, 0.41000000000000003, 0.41000000000000003, 0.41000000000000003, 0.42]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Length\", \"marker\": {\"color\": \"rgba(31, 119, 180, 1.0)\"}, \"mode\": \"markers\", \"name\": \"Length\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"26714af5-2abd-4c0a-b59f-78b2bc4c7297\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0], \"y\": [0.44, 0.44, 0.44, 0.44, 0.44, 0.44, 0.44]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Length\", \"line\": {\"color\": \"rgba(31, 119, 180, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Length\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"2b0cb4af-e8e8-4830-a411-ce00a054dec1\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0], \"y\": [0.47, 0.47, 0.47, 0.47, 0.47, 0.47, 0.46]}],\n                        {\"title\": {\"text\": \"Coupling Lengths\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Length (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"53a1b1a9-1d5f-4473-a4fa-fb4e701eb8ae\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"53a1b1a9-1d5f-4473-a4fa-fb4e701eb8ae\")) {\n                    Plotly.newPlot(\n                        '53a1b1a9-1d5f-4473-a4fa-fb4e701eb8ae',\n                        [{\"legendgroup\": \"Deviation\", \"line\": {\"color\": \"rgba(255, 127, 14, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Deviation\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"fb91c40b-98a9-4c50-8ce8-d3b51716aab5\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0], \"y\": [-3.0, -3.0, -3.0, -3.0, -3.0, -3.0, -2.0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Deviation\", \"marker\": {\"color\": \"rgba(255, 127, 14, 1.0)\"}, \"mode\": \"markers\", \"name\": \"Deviation\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"7df958c4-abd5-4e8f-8f41-38bf419a9c62\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0], \"y\": [0, 0, 0, 0, 0, 0, 0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Deviation\", \"line\": {\"color\": \"rgba(255, 127, 14, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Deviation\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"389758d1-798e-4817-8308-9b730fa7bee4\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0], \"y\": [3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 2.0]}],\n                        {\"title\": {\"text\": \"Coupling Length Median Deviations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Median Deviation (%)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"c58df878-16f3-40fc-9605-77ffd8fe6300\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"c58df878-16f3-40fc-9605-77ffd8fe6300\")) {\n                    Plotly.newPlot(\n                        'c58df878-16f3-40fc-9605-77ffd8fe6300',\n                        [{\"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"a6d3cc01-9829-4c98-94d4-a139ebca3c64\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003], \"y\": [0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.6)\"}, \"mode\": \"markers\", \"name\": \"Rear\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"acea7bed-955c-4ca2-8399-437046ddd404\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003], \"y\": [0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"4870e3f4-f4ea-4469-bd64-123028dcb998\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003], \"y\": [0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7]}, {\"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"3e8b5a0d-f711-4a94-83c2-dbeb7777a00a\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003], \"y\": [0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.6)\"}, \"mode\": \"markers\", \"name\": \"Forward\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"9f50be76-2e05-4474-b9fe-b76a37631cac\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003], \"y\": [0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"013ac03e-d5b4-448b-aeb2-52441aa08008\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003], \"y\": [0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7]}],\n                        {\"title\": {\"text\": \"Coupler Rate of Advancement\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Advance Rate (m/cycle)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"3f8b19a1-0771-4138-819f-131c974ccb2a\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"3f8b19a1-0771-4138-819f-131c974ccb2a\")) {\n                    Plotly.newPlot(\n                        '3f8b19a1-0771-4138-819f-131c974ccb2a',\n                        [{\"legendgroup\": \"Left pes\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"dcb79a2d-35a6-4dc7-aaa3-d06f1d7c1688\", \"x\": [1.4000000000000004, 2.4000000000000004], \"y\": [0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Left pes\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Left pes\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"f6885a7d-0433-4329-a836-b93b4885cde5\", \"x\": [1.4000000000000004, 2.4000000000000004], \"y\": [0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Left pes\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"3d160d56-7bde-45ec-ab60-41574b25f839\", \"x\": [1.4000000000000004, 2.4000000000000004], \"y\": [0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Right pes\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"fd1585ab-2efd-4dd1-9d7b-40431e765dac\", \"x\": [0.9000000000000001, 1.9000000000000004, 2.9000000000000004], \"y\": [0.33, 0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Right pes\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Right pes\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"ff0ac9cc-a207-4637-90b8-9c669bc20fbc\", \"x\": [0.9000000000000001, 1.9000000000000004, 2.9000000000000004], \"y\": [0.35000000000000003, 0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Right pes\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"c35912f9-253f-4e95-97d5-d6b023a90e2a\", \"x\": [0.9000000000000001, 1.9000000000000004, 2.9000000000000004], \"y\": [0.37000000000000005, 0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Left manus\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"744ffe98-f77d-4a97-adae-606924b94679\", \"x\": [0.9000000000000001, 1.9000000000000004, 2.9000000000000004], \"y\": [0.33, 0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left manus\", \"marker\": {\"color\": \"rgba(44, 160, 44, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Left manus\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"7c23450c-f817-4d98-b7a1-680fecd9e88c\", \"x\": [0.9000000000000001, 1.9000000000000004, 2.9000000000000004], \"y\": [0.35000000000000003, 0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left manus\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"bcb3389e-03bd-4303-9ccd-f65551d568ee\", \"x\": [0.9000000000000001, 1.9000000000000004, 2.9000000000000004], \"y\": [0.37000000000000005, 0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Right manus\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"036f0ab5-1508-4b37-ac58-d93a0ced4c3c\", \"x\": [1.4000000000000004, 2.4000000000000004], \"y\": [0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right manus\", \"marker\": {\"color\": \"rgba(148, 103, 189, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Right manus\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"7cc8cc66-e6f0-4de2-847f-d60b8a6b33a8\", \"x\": [1.4000000000000004, 2.4000000000000004], \"y\": [0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right manus\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"8c6839aa-9752-4f9c-9dfc-8a42bb020ec8\", \"x\": [1.4000000000000004, 2.4000000000000004], \"y\": [0.37000000000000005, 0.37000000000000005]}],\n                        {\"title\": {\"text\": \"Stepping Distances\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Distance (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"beb82754-e99e-4021-a9db-53f697b30241\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"beb82754-e99e-4021-a9db-53f697b30241\")) {\n                    Plotly.newPlot(\n                        'beb82754-e99e-4021-a9db-53f697b30241',\n                        [{\"legendgroup\": \"Left\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"b579a5ee-60e0-4aa0-a463-73e2a78ffb6c\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0], \"y\": [0.57, 0.53, 0.48000000000000004, 0.44, 0.4, 0.35000000000000003, 0.31000000000000005, 0.27, 0.24000000000000002, 0.24000000000000002, 0.22, 0.27, 0.31000000000000005, 0.35000000000000003, 0.4, 0.44, 0.48000000000000004, 0.53, 0.59, 0.59, 0.57, 0.53, 0.48000000000000004, 0.44, 0.4, 0.35000000000000003, 0.31000000000000005, 0.27, 0.24000000000000002, 0.24000000000000002, 0.22, 0.27, 0.31000000000000005, 0.35000000000000003, 0.4, 0.44, 0.49000000000000005, 0.53, 0.59, 0.59, 0.57, 0.53, 0.48000000000000004, 0.44, 0.4, 0.35000000000000003, 0.31000000000000005, 0.27, 0.24000000000000002, 0.24000000000000002, 0.22, 0.27, 0.31000000000000005, 0.35000000000000003, 0.4, 0.44, 0.49000000000000005, 0.53, 0.59, 0.59, 0.57]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left\", \"marker\": {\"color\": \"rgba(44, 160, 44, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Left\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"7ad239d4-dfe8-474b-935f-a4fc1c6c66f5\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0], \"y\": [0.61, 0.5700000000000001, 0.52, 0.48, 0.44, 0.39, 0.35000000000000003, 0.31, 0.26, 0.26, 0.26, 0.31, 0.35000000000000003, 0.39, 0.44, 0.48, 0.52, 0.5700000000000001, 0.61, 0.61, 0.61, 0.5700000000000001, 0.52, 0.48, 0.44, 0.39, 0.35000000000000003, 0.31, 0.26, 0.26, 0.26, 0.31, 0.35000000000000003, 0.39, 0.44, 0.48, 0.53, 0.5700000000000001, 0.61, 0.61, 0.61, 0.5700000000000001, 0.52, 0.48, 0.44, 0.39, 0.35000000000000003, 0.31, 0.26, 0.26, 0.26, 0.31, 0.35000000000000003, 0.39, 0.44, 0.48, 0.53, 0.5700000000000001, 0.61, 0.61, 0.61]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"82320405-bc4b-47d8-b276-8954e637c823\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0], \"y\": [0.65, 0.6100000000000001, 0.56, 0.52, 0.48, 0.43, 0.39, 0.35, 0.28, 0.28, 0.3, 0.35, 0.39, 0.43, 0.48, 0.52, 0.56, 0.6100000000000001, 0.63, 0.63, 0.65, 0.6100000000000001, 0.56, 0.52, 0.48, 0.43, 0.39, 0.35, 0.28, 0.28, 0.3, 0.35, 0.39, 0.43, 0.48, 0.52, 0.5700000000000001, 0.6100000000000001, 0.63, 0.63, 0.65, 0.6100000000000001, 0.56, 0.52, 0.48, 0.43, 0.39, 0.35, 0.28, 0.28, 0.3, 0.35, 0.39, 0.43, 0.48, 0.52, 0.5700000000000001, 0.6100000000000001, 0.63, 0.63, 0.65]}, {\"legendgroup\": \"Right\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"71612ba0-fec3-4db2-af9d-7b7d2078416c\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0], \"y\": [0.22, 0.27, 0.31000000000000005, 0.35000000000000003, 0.4, 0.44, 0.48000000000000004, 0.53, 0.59, 0.59, 0.57, 0.53, 0.48000000000000004, 0.44, 0.4, 0.35000000000000003, 0.31000000000000005, 0.27, 0.24000000000000002, 0.24000000000000002, 0.22, 0.27, 0.31000000000000005, 0.35000000000000003, 0.4, 0.44, 0.49000000000000005, 0.53, 0.59, 0.59, 0.57, 0.53, 0.48000000000000004, 0.44, 0.4, 0.35000000000000003, 0.31000000000000005, 0.27, 0.24000000000000002, 0.24000000000000002, 0.22, 0.27, 0.31000000000000005, 0.35000000000000003, 0.4, 0.44, 0.49000000000000005, 0.53, 0.59, 0.59, 0.57, 0.53, 0.48000000000000004, 0.44, 0.4, 0.35000000000000003, 0.31000000000000005, 0.27, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right\", \"marker\": {\"color\": \"rgba(148, 103, 189, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Right\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"9f84e3a3-39a0-4af5-ac6a-4b730493a364\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0], \"y\": [0.26, 0.31, 0.35000000000000003, 0.39, 0.44, 0.48, 0.52, 0.5700000000000001, 0.61, 0.61, 0.61, 0.5700000000000001, 0.52, 0.48, 0.44, 0.39, 0.35000000000000003, 0.31, 0.26, 0.26, 0.26, 0.31, 0.35000000000000003, 0.39, 0.44, 0.48, 0.53, 0.5700000000000001, 0.61, 0.61, 0.61, 0.5700000000000001, 0.52, 0.48, 0.44, 0.39, 0.35000000000000003, 0.31, 0.26, 0.26, 0.26, 0.31, 0.35000000000000003, 0.39, 0.44, 0.48, 0.53, 0.5700000000000001, 0.61, 0.61, 0.61, 0.5700000000000001, 0.52, 0.48, 0.44, 0.39, 0.35000000000000003, 0.31, 0.26, 0.26, 0.26]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"c89ab83d-38b0-4464-a577-7879ba655a2a\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0], \"y\": [0.3, 0.35, 0.39, 0.43, 0.48, 0.52, 0.56, 0.6100000000000001, 0.63, 0.63, 0.65, 0.6100000000000001, 0.56, 0.52, 0.48, 0.43, 0.39, 0.35, 0.28, 0.28, 0.3, 0.35, 0.39, 0.43, 0.48, 0.52, 0.5700000000000001, 0.6100000000000001, 0.63, 0.63, 0.65, 0.6100000000000001, 0.56, 0.52, 0.48, 0.43, 0.39, 0.35, 0.28, 0.28, 0.3, 0.35, 0.39, 0.43, 0.48, 0.52, 0.5700000000000001, 0.6100000000000001, 0.63, 0.63, 0.65, 0.6100000000000001, 0.56, 0.52, 0.48, 0.43, 0.39, 0.35, 0.28, 0.28, 0.28]}],\n                        {\"title\": {\"text\": \"Left &amp; Right Separations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Separation (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"b10761af-3878-430e-99ed-f611dd3dd8af\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"b10761af-3878-430e-99ed-f611dd3dd8af\")) {\n                    Plotly.newPlot(\n                        'b10761af-3878-430e-99ed-f611dd3dd8af',\n                        [{\"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"39887fee-9625-47e9-bec4-02aec89e1d07\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0], \"y\": [0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.26]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Forward\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"f84274ab-47be-4646-b86e-424d4189c1b2\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0], \"y\": [0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"da0d9c5f-e7fd-49e5-9ba4-21e7b6a7234b\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0], \"y\": [0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.28]}, {\"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"e473659c-b460-409c-9213-eedb3fb39006\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0], \"y\": [0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Rear\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"c141c4f5-4ea6-4a1e-93f4-150693ec17aa\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0], \"y\": [0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"782363f5-5438-4f4d-995f-2dccdd833f1d\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0], \"y\": [0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004]}],\n                        {\"title\": {\"text\": \"Forward &amp; Rear Separations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Separation (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div style=\"height:120px\"> </div>"};
+
+}());
\ No newline at end of file
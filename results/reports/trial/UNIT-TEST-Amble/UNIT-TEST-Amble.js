@@ -0,0 +1,5 @@
+(function () {
+
+    window.SIM_DATA = {"data": {"time": {"count": 68, "cycles": [0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45], "support_cycles": [-0.29999999999999993, -0.2499999999999999, -0.19999999999999984, -0.15000000000000002, -0.09999999999999998, -0.04999999999999993, 1.1102230246251565e-16, 0.050000000000000155, 0.09999999999999998, 0.15000000000000002, 0.20000000000000007, 0.2500000000000001, 0.30000000000000016, 0.35, 0.4, 0.45000000000000007, 0.5000000000000001, 0.5500000000000002, 0.6, 0.6500000000000002, 0.7000000000000001, 0.7499999999999999, 0.8000000000000002, 0.85, 0.9000000000000002, 0.9500000000000001, 1.0000000000000004, 1.0500000000000003, 1.1, 1.1500000000000004, 1.2000000000000002, 1.2500000000000004, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5000000000000004, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.7500000000000004, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0000000000000004, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.2500000000000004, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5000000000000004, 2.5500000000000003, 2.6, 2.65, 2.7000000000000006, 2.7500000000000004, 2.8000000000000003, 2.85, 2.9, 2.9500000000000006, 3.0000000000000004, 3.0500000000000003], "steps_per_cycle": 20, "progress": [0, 1.492537313432836, 2.985074626865672, 4.477611940298508, 5.970149253731344, 7.462686567164179, 8.955223880597016, 10.447761194029852, 11.940298507462687, 13.432835820895523, 14.925373134328359, 16.417910447761194, 17.910447761194032, 19.40298507462687, 20.895522388059707, 22.388059701492544, 23.88059701492538, 25.37313432835822, 26.865671641791057, 28.358208955223894, 29.85074626865673, 31.34328358208957, 32.8358208955224, 34.32835820895524, 35.82089552238807, 37.313432835820905, 38.80597014925374, 40.29850746268657, 41.791044776119406, 43.28358208955224, 44.776119402985074, 46.26865671641791, 47.76119402985074, 49.253731343283576, 50.74626865671641, 52.238805970149244, 53.73134328358208, 55.22388059701491, 56.716417910447745, 58.20895522388058, 59.70149253731341, 61.19402985074625, 62.68656716417908, 64.17910447761192, 65.67164179104475, 67.16417910447758, 68.65671641791042, 70.14925373134325, 71.64179104477608, 73.13432835820892, 74.62686567164175, 76.11940298507459, 77.61194029850742, 79.10447761194025, 80.59701492537309, 82.08955223880592, 83.58208955223876, 85.07462686567159, 86.56716417910442, 88.05970149253726, 89.55223880597009, 91.04477611940293, 92.53731343283576, 94.0298507462686, 95.52238805970143, 97.01492537313426, 98.5074626865671, 100.0]}, "cycles": {"left_pes": [[2, "F"], [8, "M"], [12, "F"], [8, "M"], [12, "F"], [9, "M"], [11, "F"], [6, "M"]], "right_pes": [[12, "F"], [8, "M"], [12, "F"], [8, "M"], [12, "F"], [8, "M"], [8, "F"]], "left_manus": [[5, "M"], [12, "F"], [8, "M"], [12, "F"], [9, "M"], [11, "F"], [8, "M"], [3, "F"]], "right_manus": [[7, "F"], [8, "M"], [12, "F"], [8, "M"], [12, "F"], [8, "M"], [13, "F"]]}, "scale": 1231.8796992481205, "offset": [0, 0], "markerIds": ["left_pes", "right_pes", "left_manus", "right_manus"], "frames": [{"time": 0.10000000000000009, "support_time": -0.29999999999999993, "positions": [{"x": [0.0, 0.01, 0.0], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-4.0, 0.01], "ty0": [0.2, 0.01], "tx1": [4.13125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.39, 0.03, 0.39375000000000004], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.60625, 0.03], "ty0": [0.2, 0.01], "tx1": [4.525, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.44, 0.01, 0.4375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.5625, 0.01], "ty0": [0.0, 0.01], "tx1": [4.56875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.08700000000000001, 0.007, 0.0875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.42, 0.02, 0.415625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.25, 0.01, 0.2515625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.0, "y": 0.2}, {"x": 0.0, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.39375000000000004, "y": 0.2}, {"x": 0.4375, "y": 0.2}, {"x": 0.4375, "y": 0.0}, {"x": 0.39375000000000004, "y": 0.0}]}, {"time": 0.15000000000000013, "support_time": -0.2499999999999999, "positions": [{"x": [0.0, 0.01, 0.0], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-4.0, 0.01], "ty0": [0.2, 0.01], "tx1": [4.13125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.44, 0.03, 0.4375], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.5625, 0.03], "ty0": [0.2, 0.01], "tx1": [4.56875, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.44, 0.01, 0.4375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.5625, 0.01], "ty0": [0.0, 0.01], "tx1": [4.56875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.08700000000000001, 0.007, 0.0875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.44, 0.02, 0.4375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.26, 0.01, 0.2625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.0, "y": 0.2}, {"x": 0.0, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.4375, "y": 0.2}, {"x": 0.4375, "y": 0.2}, {"x": 0.4375, "y": 0.0}, {"x": 0.4375, "y": 0.0}]}, {"time": 0.20000000000000018, "support_time": -0.19999999999999984, "positions": [{"x": [0.0, 0.03, 1.457167719820518e-16], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-4.0, 0.03], "ty0": [0.2, 0.01], "tx1": [4.13125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.48, 0.03, 0.48125000000000007], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.51875, 0.03], "ty0": [0.2, 0.01], "tx1": [4.6125, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.44, 0.01, 0.4375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.5625, 0.01], "ty0": [0.0, 0.01], "tx1": [4.56875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.09, 0.02, 0.08750000000000006], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.46, 0.02, 0.45937500000000003], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.27, 0.01, 0.27343750000000006], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.457167719820518e-16, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 1.457167719820518e-16, "y": 0.0}], "forward_support_box": [{"x": 0.4375, "y": 0.2}, {"x": 0.48125000000000007, "y": 0.2}, {"x": 0.48125000000000007, "y": 0.0}, {"x": 0.4375, "y": 0.0}]}, {"time": 0.25, "support_time": -0.15000000000000002, "positions": [{"x": [0.04, 0.03, 0.04374999999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.95625, 0.03], "ty0": [0.2, 0.01], "tx1": [4.175, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.52, 0.03, 0.5249999999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.475, 0.03], "ty0": [0.2, 0.01], "tx1": [4.65625, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.44, 0.01, 0.4375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.5625, 0.01], "ty0": [0.0, 0.01], "tx1": [4.56875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.11, 0.02, 0.10937499999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.48, 0.02, 0.48124999999999996], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.3, 0.01, 0.2953125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.04374999999999999, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.04374999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.4375, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.4375, "y": 0.0}]}, {"time": 0.30000000000000004, "support_time": -0.09999999999999998, "positions": [{"x": [0.09, 0.03, 0.08750000000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.9125, 0.03], "ty0": [0.2, 0.01], "tx1": [4.21875, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.5700000000000001, 0.03, 0.5687499999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.4312500000000004, 0.03], "ty0": [0.2, 0.01], "tx1": [4.7, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.44, 0.01, 0.4375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.5625, 0.01], "ty0": [0.0, 0.01], "tx1": [4.56875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.13, 0.02, 0.13125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.5, 0.02, 0.5031249999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.32, 0.01, 0.31718749999999996], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.08750000000000001, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.08750000000000001, "y": 0.0}], "forward_support_box": [{"x": 0.4375, "y": 0.2}, {"x": 0.5687499999999999, "y": 0.2}, {"x": 0.5687499999999999, "y": 0.0}, {"x": 0.4375, "y": 0.0}]}, {"time": 0.3500000000000001, "support_time": -0.04999999999999993, "positions": [{"x": [0.13, 0.03, 0.13125000000000006], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.86875, 0.03], "ty0": [0.2, 0.01], "tx1": [4.2625, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.44, 0.01, 0.4375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.5625, 0.01], "ty0": [0.0, 0.01], "tx1": [4.56875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.15, 0.02, 0.153125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.525, 0.007, 0.5249999999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.34, 0.01, 0.33906249999999993], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.13125000000000006, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.13125000000000006, "y": 0.0}], "forward_support_box": [{"x": 0.4375, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.4375, "y": 0.0}]}, {"time": 0.40000000000000013, "support_time": 1.1102230246251565e-16, "positions": [{"x": [0.18, 0.03, 0.17500000000000007], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.8249999999999997, 0.03], "ty0": [0.2, 0.01], "tx1": [4.30625, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.44, 0.01, 0.4375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.5625, 0.01], "ty0": [0.0, 0.01], "tx1": [4.56875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.18, 0.02, 0.17500000000000004], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.525, 0.007, 0.5249999999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.35000000000000003, 0.01, 0.35], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.17500000000000007, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.17500000000000007, "y": 0.0}], "forward_support_box": [{"x": 0.4375, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.4375, "y": 0.0}]}, {"time": 0.4500000000000002, "support_time": 0.050000000000000155, "positions": [{"x": [0.22, 0.03, 0.2187500000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.78125, 0.03], "ty0": [0.2, 0.01], "tx1": [4.35, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.44, 0.03, 0.4375000000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.5625, 0.03], "ty0": [0.0, 0.01], "tx1": [4.56875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.2, 0.02, 0.19687500000000005], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.53, 0.02, 0.5250000000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.36, 0.01, 0.3609375000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.2187500000000001, "y": 0.2}, {"x": 0.2187500000000001, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.4375000000000002, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.4375000000000002, "y": 0.0}]}, {"time": 0.5, "support_time": 0.09999999999999998, "positions": [{"x": [0.26, 0.03, 0.26249999999999996], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.7375, 0.03], "ty0": [0.2, 0.01], "tx1": [4.39375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.48, 0.03, 0.48125000000000007], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.51875, 0.03], "ty0": [0.0, 0.01], "tx1": [4.6125, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.22, 0.02, 0.21874999999999997], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.55, 0.02, 0.546875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.38, 0.01, 0.3828125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.26249999999999996, "y": 0.2}, {"x": 0.26249999999999996, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.48125000000000007, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.48125000000000007, "y": 0.0}]}, {"time": 0.55, "support_time": 0.15000000000000002, "positions": [{"x": [0.31, 0.03, 0.30624999999999997], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.69375, 0.03], "ty0": [0.2, 0.01], "tx1": [4.4375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.53, 0.03, 0.5250000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.4749999999999996, 0.03], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.24, 0.02, 0.24062499999999998], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.5700000000000001, 0.02, 0.5687500000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.4, 0.01, 0.40468750000000003], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.30624999999999997, "y": 0.2}, {"x": 0.30624999999999997, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.5250000000000001, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.5250000000000001, "y": 0.0}]}, {"time": 0.6000000000000001, "support_time": 0.20000000000000007, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.5700000000000001, 0.03, 0.5687500000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.43125, 0.03], "ty0": [0.0, 0.01], "tx1": [4.7, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.262, 0.007, 0.26249999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.59, 0.02, 0.590625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.43, 0.01, 0.42656249999999996], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.5687500000000001, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.5687500000000001, "y": 0.0}]}, {"time": 0.6500000000000001, "support_time": 0.2500000000000001, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.61, 0.03, 0.6125000000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.3874999999999997, 0.03], "ty0": [0.0, 0.01], "tx1": [4.74375, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.262, 0.007, 0.26249999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.61, 0.02, 0.6125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.44, 0.01, 0.4375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.6125000000000002, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.6125000000000002, "y": 0.0}]}, {"time": 0.7000000000000002, "support_time": 0.30000000000000016, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.03, 0.17500000000000018], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.8249999999999997, 0.03], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.66, 0.03, 0.6562500000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.34375, 0.03], "ty0": [0.0, 0.01], "tx1": [4.7875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.26, 0.02, 0.26250000000000007], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.63, 0.02, 0.6343750000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.45, 0.01, 0.4484375000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.17500000000000018, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.17500000000000018, "y": 0.0}], "forward_support_box": [{"x": 0.6562500000000002, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.6562500000000002, "y": 0.0}]}, {"time": 0.75, "support_time": 0.35, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.22, 0.03, 0.21875000000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.78125, 0.03], "ty0": [0.0, 0.01], "tx1": [4.35, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.7000000000000001, 0.03, 0.7], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.3, 0.03], "ty0": [0.0, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.28, 0.02, 0.284375], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.66, 0.02, 0.65625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.47000000000000003, 0.01, 0.4703125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.21875000000000003, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.21875000000000003, "y": 0.0}], "forward_support_box": [{"x": 0.7, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.7, "y": 0.0}]}, {"time": 0.8, "support_time": 0.4, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.26, 0.03, 0.26250000000000007], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.7375, 0.03], "ty0": [0.0, 0.01], "tx1": [4.39375, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.74, 0.03, 0.7437500000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.2562499999999996, 0.03], "ty0": [0.0, 0.01], "tx1": [4.875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.31, 0.02, 0.30625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.68, 0.02, 0.6781250000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.49, 0.01, 0.49218750000000006], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.26250000000000007, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.26250000000000007, "y": 0.0}], "forward_support_box": [{"x": 0.7437500000000001, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.7437500000000001, "y": 0.0}]}, {"time": 0.8500000000000001, "support_time": 0.45000000000000007, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.31, 0.03, 0.3062500000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.69375, 0.03], "ty0": [0.0, 0.01], "tx1": [4.4375, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.33, 0.02, 0.328125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.7000000000000001, 0.007, 0.7], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.51, 0.01, 0.5140625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.3062500000000001, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.3062500000000001, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.9000000000000001, "support_time": 0.5000000000000001, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.35000000000000003, 0.03, 0.3500000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.65, 0.03], "ty0": [0.0, 0.01], "tx1": [4.48125, 0.03], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.35000000000000003, 0.02, 0.35000000000000003], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.7000000000000001, 0.007, 0.7], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.52, 0.01, 0.525], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.3500000000000001, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.3500000000000001, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.9500000000000002, "support_time": 0.5500000000000002, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.39, 0.03, 0.39375000000000016], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.6062499999999997, 0.03], "ty0": [0.0, 0.01], "tx1": [4.525, 0.01], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.03, 0.6125000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3874999999999997, 0.03], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.37, 0.02, 0.37187500000000007], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.7000000000000001, 0.02, 0.7000000000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.54, 0.01, 0.5359375000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.39375000000000016, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.39375000000000016, "y": 0.0}], "forward_support_box": [{"x": 0.6125000000000002, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.6125000000000002, "y": 0.0}]}, {"time": 1.0, "support_time": 0.6, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.44, 0.03, 0.43749999999999994], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.5625, 0.03], "ty0": [0.0, 0.01], "tx1": [4.56875, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.66, 0.03, 0.65625], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.34375, 0.03], "ty0": [0.2, 0.01], "tx1": [4.7875, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.39, 0.02, 0.39374999999999993], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.72, 0.02, 0.721875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.56, 0.01, 0.5578125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.43749999999999994, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.43749999999999994, "y": 0.0}], "forward_support_box": [{"x": 0.65625, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.65625, "y": 0.0}]}, {"time": 1.0500000000000003, "support_time": 0.6500000000000002, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.48, 0.03, 0.4812500000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.51875, 0.03], "ty0": [0.0, 0.01], "tx1": [4.612500000000001, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.7000000000000001, 0.03, 0.7000000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3, 0.03], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.42, 0.02, 0.4156250000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.74, 0.02, 0.7437500000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.58, 0.01, 0.5796875000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.4812500000000002, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.4812500000000002, "y": 0.0}], "forward_support_box": [{"x": 0.7000000000000002, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.7000000000000002, "y": 0.0}]}, {"time": 1.1, "support_time": 0.7000000000000001, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.74, 0.03, 0.74375], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.25625, 0.03], "ty0": [0.2, 0.01], "tx1": [4.875, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.437, 0.007, 0.43749999999999994], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.77, 0.02, 0.765625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.6, 0.01, 0.6015625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.74375, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.74375, "y": 0.0}]}, {"time": 1.15, "support_time": 0.7499999999999999, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.79, 0.03, 0.7874999999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.2125000000000004, 0.03], "ty0": [0.2, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.437, 0.007, 0.43749999999999994], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.79, 0.02, 0.7874999999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.7874999999999999, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.7874999999999999, "y": 0.0}]}, {"time": 1.2000000000000002, "support_time": 0.8000000000000002, "positions": [{"x": [0.35000000000000003, 0.03, 0.3500000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.65, 0.03], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.8300000000000001, 0.03, 0.83125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.16875, 0.03], "ty0": [0.2, 0.01], "tx1": [4.9625, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.44, 0.02, 0.43750000000000006], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.81, 0.02, 0.809375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.62, 0.01, 0.6234375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.3500000000000002, "y": 0.2}, {"x": 0.3500000000000002, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.83125, "y": 0.2}, {"x": 0.83125, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 1.25, "support_time": 0.85, "positions": [{"x": [0.39, 0.03, 0.39375000000000004], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.60625, 0.03], "ty0": [0.2, 0.01], "tx1": [4.525, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.88, 0.03, 0.875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.125, 0.03], "ty0": [0.2, 0.01], "tx1": [5.00625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.46, 0.02, 0.459375], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.8300000000000001, 0.02, 0.83125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.65, 0.01, 0.6453125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.39375000000000004, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.39375000000000004, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 1.3000000000000003, "support_time": 0.9000000000000002, "positions": [{"x": [0.44, 0.03, 0.4375000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.5625, 0.03], "ty0": [0.2, 0.01], "tx1": [4.56875, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.92, 0.03, 0.9187500000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.08125, 0.03], "ty0": [0.2, 0.01], "tx1": [5.05, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.48, 0.02, 0.48125000000000007], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.85, 0.02, 0.8531250000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.67, 0.01, 0.6671875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.4375000000000002, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.4375000000000002, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9187500000000002, "y": 0.2}, {"x": 0.9187500000000002, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 1.35, "support_time": 0.9500000000000001, "positions": [{"x": [0.48, 0.03, 0.48125000000000007], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.51875, 0.03], "ty0": [0.2, 0.01], "tx1": [4.6125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.5, 0.02, 0.503125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.875, 0.007, 0.875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.6900000000000001, 0.01, 0.6890625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.48125000000000007, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.48125000000000007, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 1.4000000000000004, "support_time": 1.0000000000000004, "positions": [{"x": [0.53, 0.03, 0.5250000000000004], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.4749999999999996, 0.03], "ty0": [0.2, 0.01], "tx1": [4.65625, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.53, 0.02, 0.5250000000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.875, 0.007, 0.875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.7000000000000001, 0.01, 0.7000000000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5250000000000004, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.5250000000000004, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 1.4500000000000002, "support_time": 1.0500000000000003, "positions": [{"x": [0.5700000000000001, 0.03, 0.5687500000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.43125, 0.03], "ty0": [0.2, 0.01], "tx1": [4.7, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.03, 0.7875], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.2125, 0.03], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.55, 0.02, 0.546875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.88, 0.02, 0.875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.71, 0.01, 0.7109375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5687500000000001, "y": 0.2}, {"x": 0.5687500000000001, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 1.5, "support_time": 1.1, "positions": [{"x": [0.61, 0.03, 0.6125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3875, 0.03], "ty0": [0.2, 0.01], "tx1": [4.7437499999999995, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.8300000000000001, 0.03, 0.8312499999999998], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.16875, 0.03], "ty0": [0.0, 0.01], "tx1": [4.9625, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.5700000000000001, 0.02, 0.56875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.9, 0.02, 0.8968749999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.73, 0.01, 0.7328124999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.6125, "y": 0.2}, {"x": 0.6125, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.8312499999999998, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.8312499999999998, "y": 0.0}]}, {"time": 1.5500000000000003, "support_time": 1.1500000000000004, "positions": [{"x": [0.66, 0.03, 0.6562500000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.34375, 0.03], "ty0": [0.2, 0.01], "tx1": [4.7875, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.03, 0.8750000000000004], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.1249999999999996, 0.03], "ty0": [0.0, 0.01], "tx1": [5.00625, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.59, 0.02, 0.5906250000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.92, 0.02, 0.9187500000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.75, 0.01, 0.7546875000000002], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.6562500000000002, "y": 0.2}, {"x": 0.6562500000000002, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.8750000000000004, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.8750000000000004, "y": 0.0}]}, {"time": 1.6, "support_time": 1.2000000000000002, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.92, 0.03, 0.9187500000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.08125, 0.03], "ty0": [0.0, 0.01], "tx1": [5.05, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.612, 0.007, 0.6124999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.9400000000000001, 0.02, 0.940625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.78, 0.01, 0.7765625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.9187500000000003, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.9187500000000003, "y": 0.0}]}, {"time": 1.6500000000000004, "support_time": 1.2500000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.96, 0.03, 0.9625000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.0374999999999996, 0.03], "ty0": [0.0, 0.01], "tx1": [5.09375, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.612, 0.007, 0.6124999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.96, 0.02, 0.9625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.79, 0.01, 0.7875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.9625000000000001, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.9625000000000001, "y": 0.0}]}, {"time": 1.7000000000000002, "support_time": 1.3000000000000003, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.53, 0.04, 0.5250000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.4749999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.01, 0.03, 1.00625], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.99375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.1375, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.61, 0.02, 0.6125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.98, 0.02, 0.984375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.8, 0.01, 0.7984375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5250000000000001, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5250000000000001, "y": 0.0}], "forward_support_box": [{"x": 1.00625, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.00625, "y": 0.0}]}, {"time": 1.75, "support_time": 1.35, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.5700000000000001, 0.04, 0.56875], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.43125, 0.04], "ty0": [0.0, 0.01], "tx1": [4.7, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.05, 0.03, 1.0499999999999998], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.95, 0.03], "ty0": [0.0, 0.01], "tx1": [5.1812499999999995, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.63, 0.02, 0.6343749999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.01, 0.02, 1.0062499999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.8200000000000001, 0.01, 0.8203124999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.56875, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.56875, "y": 0.0}], "forward_support_box": [{"x": 1.0499999999999998, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.0499999999999998, "y": 0.0}]}, {"time": 1.8000000000000003, "support_time": 1.4000000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.61, 0.04, 0.6125000000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.3874999999999997, 0.04], "ty0": [0.0, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.09, 0.03, 1.0937500000000004], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.9062499999999996, 0.03], "ty0": [0.0, 0.01], "tx1": [5.2250000000000005, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.66, 0.02, 0.6562500000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.03, 0.02, 1.0281250000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.84, 0.01, 0.8421875000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.6125000000000003, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.6125000000000003, "y": 0.0}], "forward_support_box": [{"x": 1.0937500000000004, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.0937500000000004, "y": 0.0}]}, {"time": 1.85, "support_time": 1.4500000000000002, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.66, 0.04, 0.65625], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.34375, 0.04], "ty0": [0.0, 0.01], "tx1": [4.7875, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.68, 0.02, 0.678125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.05, 0.007, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.86, 0.01, 0.8640625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.65625, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.65625, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.9000000000000004, "support_time": 1.5000000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.7000000000000001, 0.04, 0.7000000000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.3, 0.04], "ty0": [0.0, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.7000000000000001, 0.02, 0.7000000000000002], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.05, 0.007, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.88, 0.01, 0.875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7000000000000003, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.7000000000000003, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.9500000000000002, "support_time": 1.5500000000000003, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.74, 0.04, 0.7437500000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.2562499999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.04, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.0375, 0.04], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.72, 0.02, 0.721875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.05, 0.02, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.89, 0.01, 0.8859374999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7437500000000001, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.7437500000000001, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 2.0, "support_time": 1.6, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.04, 0.7875000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.2125, 0.04], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.01, 0.04, 1.0062499999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.9937500000000004, 0.04], "ty0": [0.2, 0.01], "tx1": [5.1375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.74, 0.02, 0.74375], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.07, 0.02, 1.071875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.91, 0.01, 0.9078124999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7875000000000001, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.7875000000000001, "y": 0.0}], "forward_support_box": [{"x": 1.0062499999999999, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.0062499999999999, "y": 0.0}]}, {"time": 2.0500000000000003, "support_time": 1.6500000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.8300000000000001, 0.04, 0.8312500000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.1687499999999997, 0.04], "ty0": [0.0, 0.01], "tx1": [4.9625, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.05, 0.04, 1.05], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.95, 0.04], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.77, 0.02, 0.7656250000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.09, 0.02, 1.09375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.93, 0.01, 0.9296875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.8312500000000003, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.8312500000000003, "y": 0.0}], "forward_support_box": [{"x": 1.05, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.05, "y": 0.0}]}, {"time": 2.1, "support_time": 1.7000000000000002, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.09, 0.04, 1.0937499999999998], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.90625, 0.04], "ty0": [0.2, 0.01], "tx1": [5.225, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.788, 0.007, 0.7875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.12, 0.02, 1.1156249999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.9500000000000001, 0.01, 0.9515624999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.0937499999999998, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.0937499999999998, "y": 0.0}]}, {"time": 2.1500000000000004, "support_time": 1.7500000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.1400000000000001, 0.04, 1.1375000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.8625, 0.04], "ty0": [0.2, 0.01], "tx1": [5.26875, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.788, 0.007, 0.7875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.1400000000000001, 0.02, 1.1375000000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.96, 0.01, 0.9625000000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.1375000000000002, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.1375000000000002, "y": 0.0}]}, {"time": 2.2, "support_time": 1.8000000000000003, "positions": [{"x": [0.7000000000000001, 0.03, 0.7], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3, 0.03], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.18, 0.04, 1.18125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.81875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.3125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.79, 0.02, 0.7875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.16, 0.02, 1.1593749999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.97, 0.01, 0.9734375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.18125, "y": 0.2}, {"x": 1.18125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 2.25, "support_time": 1.85, "positions": [{"x": [0.74, 0.03, 0.7437499999999998], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.25625, 0.03], "ty0": [0.2, 0.01], "tx1": [4.875, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.22, 0.04, 1.2249999999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.7750000000000004, 0.04], "ty0": [0.2, 0.01], "tx1": [5.356249999999999, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.81, 0.02, 0.809375], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.18, 0.02, 1.18125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.0, 0.01, 0.9953124999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7437499999999998, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.7437499999999998, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.2249999999999999, "y": 0.2}, {"x": 1.2249999999999999, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 2.3000000000000003, "support_time": 1.9000000000000004, "positions": [{"x": [0.79, 0.03, 0.7875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.2125, 0.03], "ty0": [0.2, 0.01], "tx1": [4.91875, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.27, 0.04, 1.26875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.73125, 0.04], "ty0": [0.2, 0.01], "tx1": [5.3999999999999995, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.8300000000000001, 0.02, 0.83125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.2, 0.02, 1.203125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.02, 0.01, 1.0171875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.7875, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.26875, "y": 0.2}, {"x": 1.26875, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 2.35, "support_time": 1.9500000000000002, "positions": [{"x": [0.8300000000000001, 0.03, 0.8312499999999998], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.16875, 0.03], "ty0": [0.2, 0.01], "tx1": [4.9624999999999995, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.04, 1.3125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.6875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.85, 0.02, 0.8531249999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.22, 0.02, 1.225], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.04, 0.01, 1.0390625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.8312499999999998, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.8312499999999998, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 2.4000000000000004, "support_time": 2.0000000000000004, "positions": [{"x": [0.88, 0.03, 0.875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.125, 0.03], "ty0": [0.2, 0.01], "tx1": [5.00625, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.88, 0.02, 0.875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.225, 0.007, 1.225], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.05, 0.01, 1.05], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 2.45, "support_time": 2.0500000000000003, "positions": [{"x": [0.92, 0.03, 0.9187499999999998], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.0812500000000003, 0.03], "ty0": [0.2, 0.01], "tx1": [5.05, 0.03], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.03, 1.1375], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.8625, 0.03], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.9, 0.02, 0.8968749999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.22, 0.02, 1.225], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.06, 0.01, 1.0609375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.9187499999999998, "y": 0.2}, {"x": 0.9187499999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 2.5, "support_time": 2.1, "positions": [{"x": [0.96, 0.03, 0.9624999999999997], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.0375000000000005, 0.03], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.18, 0.03, 1.1812499999999997], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.8187500000000005, 0.03], "ty0": [0.0, 0.01], "tx1": [5.3125, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.92, 0.02, 0.9187499999999998], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.25, 0.02, 1.2468749999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.08, 0.01, 1.0828124999999997], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.9624999999999997, "y": 0.2}, {"x": 0.9624999999999997, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.1812499999999997, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1812499999999997, "y": 0.0}]}, {"time": 2.5500000000000003, "support_time": 2.1500000000000004, "positions": [{"x": [1.01, 0.03, 1.0062499999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.9937500000000004, 0.03], "ty0": [0.2, 0.01], "tx1": [5.137499999999999, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.23, 0.03, 1.2250000000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.7749999999999995, 0.03], "ty0": [0.0, 0.01], "tx1": [5.35625, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.9400000000000001, 0.02, 0.9406249999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.27, 0.02, 1.2687500000000003], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.1, 0.01, 1.1046875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0062499999999999, "y": 0.2}, {"x": 1.0062499999999999, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.2250000000000003, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.2250000000000003, "y": 0.0}]}, {"time": 2.6, "support_time": 2.2, "positions": [{"x": [1.05, 0.03, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.95, 0.03], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.27, 0.03, 1.2687500000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.7312499999999997, 0.03], "ty0": [0.0, 0.01], "tx1": [5.3999999999999995, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.96, 0.02, 0.9624999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.29, 0.02, 1.2906250000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.1300000000000001, 0.01, 1.1265625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.2687500000000003, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.2687500000000003, "y": 0.0}]}, {"time": 2.6500000000000004, "support_time": 2.2500000000000004, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.95, 0.01], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.31, 0.03, 1.3125], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.6875, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4437500000000005, 0.03], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.962, 0.007, 0.9624999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.31, 0.02, 1.3125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.3125, "y": 0.0}]}, {"time": 2.7, "support_time": 2.3000000000000003, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.95, 0.01], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.03, 0.875], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.125, 0.03], "ty0": [0.0, 0.01], "tx1": [5.0062500000000005, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.36, 0.03, 1.35625], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.96, 0.02, 0.9624999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.33, 0.02, 1.334375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.1500000000000001, 0.01, 1.1484375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.35625, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.35625, "y": 0.0}]}, {"time": 2.75, "support_time": 2.35, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.95, 0.01], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.92, 0.03, 0.9187499999999998], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.0812500000000003, 0.03], "ty0": [0.0, 0.01], "tx1": [5.05, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.4000000000000001, 0.03, 1.3999999999999997], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.98, 0.02, 0.9843749999999998], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.36, 0.02, 1.3562499999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.17, 0.01, 1.1703124999999996], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.9187499999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.9187499999999998, "y": 0.0}], "forward_support_box": [{"x": 1.3999999999999997, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.3999999999999997, "y": 0.0}]}, {"time": 2.8000000000000003, "support_time": 2.4000000000000004, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.95, 0.01], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.96, 0.03, 0.9625000000000005], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.0374999999999996, 0.03], "ty0": [0.0, 0.01], "tx1": [5.09375, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.44, 0.03, 1.4437500000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.01, 0.02, 1.00625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.3800000000000001, 0.02, 1.3781250000000003], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.19, 0.01, 1.1921875000000002], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.9625000000000005, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.9625000000000005, "y": 0.0}], "forward_support_box": [{"x": 1.4437500000000003, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4437500000000003, "y": 0.0}]}, {"time": 2.85, "support_time": 2.45, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.95, 0.01], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.01, 0.03, 1.0062500000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.9937499999999995, 0.03], "ty0": [0.0, 0.01], "tx1": [5.137499999999999, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.03, 0.02, 1.0281250000000002], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.4000000000000001, 0.007, 1.4], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.21, 0.01, 1.2140625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.0062500000000003, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.0062500000000003, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.9000000000000004, "support_time": 2.5000000000000004, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.95, 0.01], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.05, 0.03, 1.05], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.95, 0.03], "ty0": [0.0, 0.01], "tx1": [5.1812499999999995, 0.03], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.05, 0.02, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.4000000000000001, 0.007, 1.4], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.22, 0.01, 1.2249999999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.05, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.05, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.95, "support_time": 2.5500000000000003, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.95, 0.01], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.09, 0.03, 1.09375], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.90625, 0.03], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.03, 1.3125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.6875, 0.03], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.07, 0.02, 1.071875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.4000000000000001, 0.02, 1.4], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.24, 0.01, 1.2359375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.09375, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.09375, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 3.0, "support_time": 2.6, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.95, 0.01], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.03, 1.1374999999999997], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.90625, 0.03], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.36, 0.03, 1.3562499999999997], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.6437500000000003, 0.03], "ty0": [0.2, 0.01], "tx1": [5.4875, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.09, 0.02, 1.0937499999999998], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.42, 0.02, 1.4218749999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.26, 0.01, 1.2578124999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.1374999999999997, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.1374999999999997, "y": 0.0}], "forward_support_box": [{"x": 1.3562499999999997, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.3562499999999997, "y": 0.0}]}, {"time": 3.05, "support_time": 2.65, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.95, 0.01], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.18, 0.03, 1.1812499999999995], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.90625, 0.03], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.4000000000000001, 0.03, 1.3999999999999997], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.6000000000000005, 0.03], "ty0": [0.2, 0.01], "tx1": [5.53125, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.12, 0.02, 1.1156249999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.44, 0.02, 1.4437499999999996], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.28, 0.01, 1.2796874999999996], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.1812499999999995, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.1812499999999995, "y": 0.0}], "forward_support_box": [{"x": 1.3999999999999997, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.3999999999999997, "y": 0.0}]}, {"time": 3.1000000000000005, "support_time": 2.7000000000000006, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.95, 0.01], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.22, 0.01, 1.2249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.90625, 0.03], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.44, 0.03, 1.4437500000000003], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.5562499999999995, 0.03], "ty0": [0.2, 0.01], "tx1": [5.574999999999999, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.137, 0.007, 1.1374999999999997], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.47, 0.02, 1.4656250000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.3, 0.01, 1.3015625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.2249999999999999, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.2249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.4437500000000003, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.4437500000000003, "y": 0.0}]}, {"time": 3.1500000000000004, "support_time": 2.7500000000000004, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.95, 0.01], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.22, 0.01, 1.2249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.90625, 0.03], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.49, 0.03, 1.4875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.5125, 0.03], "ty0": [0.2, 0.01], "tx1": [5.6187499999999995, 0.03], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.137, 0.007, 1.1374999999999997], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.49, 0.02, 1.4874999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.31, 0.01, 1.3124999999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.2249999999999999, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.2249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.4875, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.4875, "y": 0.0}]}, {"time": 3.2, "support_time": 2.8000000000000003, "positions": [{"x": [1.05, 0.04, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.95, 0.04], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.22, 0.01, 1.2249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.90625, 0.03], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.53, 0.03, 1.53125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.46875, 0.03], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.1400000000000001, 0.02, 1.1374999999999997], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.51, 0.02, 1.509375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.32, 0.01, 1.3234374999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.2249999999999999, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.2249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.53125, "y": 0.2}, {"x": 1.53125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 3.25, "support_time": 2.85, "positions": [{"x": [1.09, 0.04, 1.0937499999999998], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.90625, 0.04], "ty0": [0.2, 0.01], "tx1": [5.225, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.22, 0.01, 1.2249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.90625, 0.03], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.57, 0.03, 1.5749999999999997], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.46875, 0.03], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.16, 0.02, 1.1593749999999998], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.53, 0.02, 1.5312499999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.35, 0.01, 1.3453125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.0937499999999998, "y": 0.2}, {"x": 1.2249999999999999, "y": 0.2}, {"x": 1.2249999999999999, "y": 0.0}, {"x": 1.0937499999999998, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.5749999999999997, "y": 0.2}, {"x": 1.5749999999999997, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 3.3, "support_time": 2.9, "positions": [{"x": [1.1400000000000001, 0.04, 1.1374999999999995], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.8625000000000007, 0.04], "ty0": [0.2, 0.01], "tx1": [5.26875, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.22, 0.01, 1.2249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.90625, 0.03], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.62, 0.03, 1.6187499999999995], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.46875, 0.03], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.18, 0.02, 1.1812499999999997], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.55, 0.02, 1.5531249999999996], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.37, 0.01, 1.3671874999999996], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.1374999999999995, "y": 0.2}, {"x": 1.2249999999999999, "y": 0.2}, {"x": 1.2249999999999999, "y": 0.0}, {"x": 1.1374999999999995, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6187499999999995, "y": 0.2}, {"x": 1.6187499999999995, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 3.3500000000000005, "support_time": 2.9500000000000006, "positions": [{"x": [1.18, 0.04, 1.1812500000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.8625000000000007, 0.04], "ty0": [0.2, 0.01], "tx1": [5.26875, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.22, 0.01, 1.2249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.90625, 0.03], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.6600000000000001, 0.01, 1.6624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.46875, 0.03], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.2, 0.02, 1.203125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.575, 0.007, 1.5749999999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.3900000000000001, 0.01, 1.3890624999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.1812500000000001, "y": 0.2}, {"x": 1.2249999999999999, "y": 0.2}, {"x": 1.2249999999999999, "y": 0.0}, {"x": 1.1812500000000001, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 3.4000000000000004, "support_time": 3.0000000000000004, "positions": [{"x": [1.22, 0.04, 1.225], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.8625000000000007, 0.04], "ty0": [0.2, 0.01], "tx1": [5.26875, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.22, 0.01, 1.2249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.90625, 0.03], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.6600000000000001, 0.01, 1.6624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.46875, 0.03], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.22, 0.02, 1.225], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.575, 0.007, 1.5749999999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.4000000000000001, 0.01, 1.4], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.225, "y": 0.2}, {"x": 1.2249999999999999, "y": 0.2}, {"x": 1.2249999999999999, "y": 0.0}, {"x": 1.225, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 3.45, "support_time": 3.0500000000000003, "positions": [{"x": [1.27, 0.04, 1.2687499999999998], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.8625000000000007, 0.04], "ty0": [0.2, 0.01], "tx1": [5.26875, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.22, 0.01, 1.2249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.90625, 0.03], "ty0": [0.0, 0.01], "tx1": [5.225, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.6600000000000001, 0.01, 1.6624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.46875, 0.03], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.03], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.25, 0.02, 1.2468749999999997], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.575, 0.007, 1.5749999999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.41, 0.01, 1.4109374999999997], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.2249999999999999, "y": 0.2}, {"x": 1.2687499999999998, "y": 0.2}, {"x": 1.2687499999999998, "y": 0.0}, {"x": 1.2249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}]}, "body": "<div class=\"top-container no-select\">\n  <div style=\"display:flex;padding:0 1.0em;align-items: flex-end;\">\n    <div class=\"header-box\">\n      <div class=\"header-title\">UNIT-TEST Amble</div>\n      <div class=\"header-summary\">A test run to verify that the simulation system works.</div>\n      <div class=\"header-entry date\">\n        <span class=\"name\">Date:</span>\n        <span class=\"value\">10-18-2026 11:49</span>\n      </div>\n      <div class=\"header-entry duty-cycle\">\n        <span class=\"name\">Duty Cycle:</span>\n        <span class=\"value\">60%</span>\n      </div>\n      <div class=\"header-entry activity-phases\">\n        <span class=\"name\">Activity Phases:</span>\n          <span class=\"value\">\n            Pes: (<span class=\"left_pes-value\">20%</span>,\n            <span class=\"right_pes-value\">70%</span>)\n            Manus: (<span class=\"left_manus-value\">-5%</span>,\n            <span class=\"right_manus-value\">-55%</span>)\n          </span>\n      </div>\n      <div class=\"header-entry support-phases\">\n        <span class=\"name\">Support Phases:</span>\n          <span class=\"value\">\n            Pes: (<span class=\"left_pes-value\">0%</span>,\n            <span class=\"right_pes-value\">50%</span>)\n            Manus: (<span class=\"left_manus-value\">-25%</span>,\n            <span class=\"right_manus-value\">-75%</span>)\n          </span>\n      </div>\n    </div>\n    <div class=\"spacer\"></div>\n\n    <div class=\"playback-controls\">\n      <div class=\"control-row\">\n        <div class=\"spacer\"></div>\n\n        <div class=\"control\" data-role=\"pop-out\">\n          <img src=\"img/picture-in-picture.svg\"/>\n        </div>\n\n        <div class=\"control\" data-role=\"save-svg\">\n          <img src=\"img/camera.svg\"/>\n        </div>\n      </div>\n\n      <div class=\"control-row animation-controls\">\n        <div class=\"spacer\"></div>\n\n        <div class=\"control\" data-role=\"backward-10\">\n          <img src=\"img/replay-10.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"jump-back\">\n          <img src=\"img/back.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"frame-back\">\n          <img src=\"img/step-back.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"toggle-play\">\n          <img src=\"img/play.svg\" class=\"play-icon\"/>\n          <img src=\"img/pause.svg\" class=\"pause-icon\"/>\n        </div>\n        <div class=\"control\" data-role=\"frame-forward\">\n          <img src=\"img/step-forward.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"jump-forward\">\n          <img src=\"img/forward.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"forward-10\">\n          <img src=\"img/forward-10.svg\"/>\n        </div>\n      </div>\n\n\n    </div>\n  </div>\n\n  <div class=\"progress-bar\">\n    <div class=\"header\">\n      <div class=\"value-box\">\n        <div class=\"header\">Left Pes</div>\n        <div class=\"swatch left_pes_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Right Pes</div>\n        <div class=\"swatch right_pes_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Left Manus</div>\n        <div class=\"swatch left_manus_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Right Manus</div>\n        <div class=\"swatch right_manus_color\"></div>\n      </div>\n\n      <div class=\"spacer\"></div>\n\n      <div class=\"time-box\">\n\n        <div class=\"value-box\">\n          <div class=\"header\">Progress</div>\n          <div class=\"value progress-value\"></div>\n        </div>\n\n        <div class=\"value-box activity-time-box\">\n          <div class=\"header\">Activity Cycle</div>\n          <div class=\"value\">\n            <span class=\"cycle-value\"></span> :\n            <span class=\"phase-value\"></span>\n          </div>\n        </div>\n\n        <div class=\"value-box support-time-box\">\n          <div class=\"header\">Support Cycle</div>\n          <div class=\"value\">\n            <span class=\"cycle-value\"></span> :\n            <span class=\"phase-value\"></span>\n          </div>\n        </div>\n\n      </div>\n    </div>\n\n    <div class=\"outer\">\n      <div class=\"inner\"></div>\n      <div class=\"cycles left_pes left_pes_color\"></div>\n      <div class=\"cycles left_manus left_manus_color\"></div>\n      <div class=\"cycles right_manus right_manus_color\"></div>\n      <div class=\"cycles right_pes right_pes_color\"></div>\n    </div>\n  </div>\n</div>\n\n        <div class=\"svg-box\">\n          <div class=\"svg-box-inner\">\n<svg version=\"1.1\"\n    id=\"svg-167940396179\"\n    xmlns:xlink=\"http://www.w3.org/1999/xlink\"\n    xmlns=\"http://www.w3.org/2000/svg\"\n    viewBox=\"-21 -268 2082 289\">\n\n<style>\n/* <![CDATA[ */\n#svg-167940396179 .left_pes { fill: DodgerBlue; opacity: 0.5; }\n#svg-167940396179 .right_pes { fill: DarkOrange; opacity: 0.5; }\n#svg-167940396179 .left_manus { fill: DarkOliveGreen; opacity: 0.5; }\n#svg-167940396179 .right_manus { fill: DarkOrchid; opacity: 0.5; }\n#svg-167940396179 .left_pes { fill: DodgerBlue; opacity: 0.5; stroke-width: 8px; stroke: DodgerBlue; }\n#svg-167940396179 .left_pes.assumed { fill: white; opacity: 0.33; }\n#svg-167940396179 .left_pes-marker { fill: transparent; stroke-width: 8px; stroke: DodgerBlue; }\n#svg-167940396179 .right_pes { fill: DarkOrange; opacity: 0.5; stroke-width: 8px; stroke: DarkOrange; }\n#svg-167940396179 .right_pes.assumed { fill: white; opacity: 0.33; }\n#svg-167940396179 .right_pes-marker { fill: transparent; stroke-width: 8px; stroke: DarkOrange; }\n#svg-167940396179 .left_manus { fill: DarkOliveGreen; opacity: 0.5; stroke-width: 8px; stroke: DarkOliveGreen; stroke-dasharray: 4,4; }\n#svg-167940396179 .left_manus.assumed { fill: white; opacity: 0.33; stroke-dasharray: 4,4; }\n#svg-167940396179 .left_manus-marker { fill: transparent; stroke-width: 8px; stroke: DarkOliveGreen; stroke-dasharray: 8,4; }\n#svg-167940396179 .right_manus { fill: DarkOrchid; opacity: 0.5; stroke-width: 8px; stroke: DarkOrchid; stroke-dasharray: 4,4; }\n#svg-167940396179 .right_manus.assumed { fill: white; opacity: 0.33; stroke-dasharray: 4,4; }\n#svg-167940396179 .right_manus-marker { fill: transparent; stroke-width: 8px; stroke: DarkOrchid; stroke-dasharray: 8,4; }\n/* ]]> */\n</style>\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"0.0\" cy=\"-246.3759398496241\" data-x=\"0.0\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"581\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"431.15789473684214\" cy=\"-246.3759398496241\" data-x=\"0.35000000000000003\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"582\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"862.3157894736843\" cy=\"-246.3759398496241\" data-x=\"0.7000000000000001\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"583\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"1293.4736842105262\" cy=\"-246.3759398496241\" data-x=\"1.05\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"584\" />\n<circle id=\"left_pes\" class=\"left_pes-marker\" r=\"16.0\" cx=\"0.0\" cy=\"-246.3759398496241\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"215.57894736842107\" cy=\"-0.0\" data-x=\"0.18\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"586\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"646.7368421052631\" cy=\"-0.0\" data-x=\"0.52\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"587\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"1077.8947368421054\" cy=\"-0.0\" data-x=\"0.88\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"588\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"1509.0526315789475\" cy=\"-0.0\" data-x=\"1.22\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"589\" />\n<circle id=\"right_pes\" class=\"right_pes-marker\" r=\"16.0\" cx=\"215.57894736842107\" cy=\"-0.0\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"323.36842105263156\" cy=\"-246.3759398496241\" data-x=\"0.26\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-uid=\"591\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"754.5263157894738\" cy=\"-246.3759398496241\" data-x=\"0.61\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"592\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"1185.6842105263158\" cy=\"-246.3759398496241\" data-x=\"0.96\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"593\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"1616.8421052631581\" cy=\"-246.3759398496241\" data-x=\"1.31\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"594\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"2048.0\" cy=\"-246.3759398496241\" data-x=\"1.6600000000000001\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"595\" />\n<circle id=\"left_manus\" class=\"left_manus-marker\" r=\"12.0\" cx=\"323.36842105263156\" cy=\"-246.3759398496241\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"538.9473684210527\" cy=\"-0.0\" data-x=\"0.44\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"597\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"970.1052631578948\" cy=\"-0.0\" data-x=\"0.79\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"598\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"1401.2631578947369\" cy=\"-0.0\" data-x=\"1.1400000000000001\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"599\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"1832.421052631579\" cy=\"-0.0\" data-x=\"1.49\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"600\" />\n<circle id=\"right_manus\" class=\"right_manus-marker\" r=\"12.0\" cx=\"538.9473684210527\" cy=\"-0.0\" />\n</svg></div>\n          <div class=\"svg-controls-box\" style=\"display:none\">\n            <div>\n                <div>Activity: <span class=\"activity-status\"></span></div>\n                <div>Support: <span class=\"support-status\"></span></div>\n            </div>\n            <div class=\"spacer\"></div>\n          </div>\n        </div>\n        \n<div class=\"line-break\"></div>\n\n<div class=\"results-container\">\n  <div class=\"settings-box info-display-box\">\n    <div class=\"info-header\">Trial Results</div>\n\n    <div class=\"info-row\">\n      <div id=\"lengthResults\" class=\"entry\">\n        <div class=\"title title-box\">Average Calculated Lengths (m)</div>\n\n        <div>\n          <span class=\"label\">Coupling Length:</span>\n          <span class=\"value\">0.33 &#177; 0.02</span>\n          <!-- span class=\"deviation\"> </span -->\n        </div>\n\n        <div>\n          <span class=\"label\">Coupling IQR:</span>\n          <span class=\"value\">[0.3099, 0.3502]</span>\n        </div>\n\n        <div>\n          <span class=\"label\">Coupling Bounds (2%):</span>\n          <span class=\"value\">[0.2688, 0.3907]</span>\n        </div>\n      </div>\n    </div>\n  </div>\n\n  <div class=\"status-box info-display-box\">\n    <div class=\"info-header\">Display Status</div>\n\n    <div class=\"info-row\">\n      <div class=\"entry left_pes\">\n        <div class=\"title left_pes_color\">Left Pes</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n\n      <div class=\"entry left_manus\">\n        <div class=\"title left_manus_color\">Left Manus</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n    </div>\n\n    <div class=\"info-row\">\n      <div class=\"entry right_pes\">\n        <div class=\"title right_pes_color\">Right Pes</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n\n      <div class=\"entry right_manus\">\n        <div class=\"title right_manus_color\">Right Manus</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n    </div>\n  </div>\n</div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"c15d9f92-2ed0-4987-b4ab-195b2ea77a9d\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"c15d9f92-2ed0-4987-b4ab-195b2ea77a9d\")) {\n                    Plotly.newPlot(\n                        'c15d9f92-2ed0-4987-b4ab-195b2ea77a9d',\n                        [{\"mode\": \"lines\", \"type\": \"scatter\", \"uid\": \"caff1eb0-dccb-45e9-b477-76e8988c33c5\", \"x\": [0.24000000000000002, 0.24072289156626508, 0.24144578313253015, 0.24216867469879522, 0.24289156626506028, 0.24361445783132535, 0.24433734939759041, 0.24506024096385548, 0.24578313253012055, 0.2465060240963856, 0.24722891566265068, 0.24795180722891574, 0.2486746987951808, 0.24939759036144588, 0.2501204819277109, 0.25084337349397595, 0.251566265060241, 0.25228915662650603, 0.25301204819277107, 0.2537349397590361, 0.25445783132530114, 0.2551807228915662, 0.2559036144578312, 0.25662650602409626, 0.2573493975903613, 0.25807228915662633, 0.25879518072289137, 0.2595180722891564, 0.26024096385542145, 0.2609638554216865, 0.2616867469879515, 0.26240963855421656, 0.2631325301204816, 0.26385542168674664, 0.2645783132530117, 0.2653012048192767, 0.26602409638554175, 0.2667469879518068, 0.26746987951807183, 0.26819277108433687, 0.2689156626506019, 0.26963855421686694, 0.270361445783132, 0.271084337349397, 0.27180722891566206, 0.2725301204819271, 0.27325301204819213, 0.2739759036144572, 0.2746987951807222, 0.27542168674698725, 0.2761445783132523, 0.2768674698795173, 0.27759036144578236, 0.2783132530120474, 0.27903614457831244, 0.2797590361445775, 0.2804819277108425, 0.28120481927710755, 0.2819277108433726, 0.28265060240963763, 0.28337349397590267, 0.2840963855421677, 0.28481927710843274, 0.2855421686746978, 0.2862650602409628, 0.28698795180722786, 0.2877108433734929, 0.28843373493975794, 0.289156626506023, 0.289879518072288, 0.29060240963855305, 0.2913253012048181, 0.2920481927710831, 0.29277108433734816, 0.2934939759036132, 0.29421686746987824, 0.2949397590361433, 0.2956626506024083, 0.29638554216867335, 0.2971084337349384, 0.29783132530120343, 0.29855421686746847, 0.2992771084337335, 0.29999999999999855, 0.3007228915662636, 0.3014457831325286, 0.30216867469879366, 0.3028915662650587, 0.30361445783132374, 0.3043373493975888, 0.3050602409638538, 0.30578313253011885, 0.3065060240963839, 0.3072289156626489, 0.30795180722891397, 0.308674698795179, 0.30939759036144404, 0.3101204819277091, 0.3108433734939741, 0.31156626506023916, 0.3122891566265042, 0.31301204819276923, 0.31373493975903427, 0.3144578313252993, 0.31518072289156435, 0.3159036144578294, 0.3166265060240944, 0.31734939759035946, 0.3180722891566245, 0.31879518072288954, 0.3195180722891546, 0.3202409638554196, 0.32096385542168465, 0.3216867469879497, 0.32240963855421473, 0.32313253012047977, 0.3238554216867448, 0.32457831325300984, 0.3253012048192749, 0.3260240963855399, 0.32674698795180496, 0.32746987951807, 0.32819277108433503, 0.32891566265060007, 0.3296385542168651, 0.33036144578313015, 0.3310843373493952, 0.3318072289156602, 0.33253012048192526, 0.3332530120481903, 0.33397590361445534, 0.3346987951807204, 0.3354216867469854, 0.33614457831325045, 0.3368674698795155, 0.33759036144578053, 0.33831325301204557, 0.3390361445783106, 0.33975903614457564, 0.3404819277108407, 0.3412048192771057, 0.34192771084337076, 0.3426506024096358, 0.34337349397590083, 0.3440963855421659, 0.3448192771084309, 0.34554216867469595, 0.346265060240961, 0.346987951807226, 0.34771084337349106, 0.3484337349397561, 0.34915662650602114, 0.3498795180722862, 0.3506024096385512, 0.35132530120481625, 0.3520481927710813, 0.35277108433734633, 0.35349397590361137, 0.3542168674698764, 0.35493975903614144, 0.3556626506024065, 0.3563855421686715, 0.35710843373493656, 0.3578313253012016, 0.35855421686746664, 0.3592771084337317, 0.3599999999999967, 0.36072289156626175, 0.3614457831325268, 0.3621686746987918, 0.36289156626505686, 0.3636144578313219, 0.36433734939758694, 0.365060240963852, 0.365783132530117, 0.36650602409638205, 0.3672289156626471, 0.36795180722891213, 0.36867469879517717, 0.3693975903614422, 0.37012048192770725, 0.3708433734939723, 0.3715662650602373, 0.37228915662650236, 0.3730120481927674, 0.37373493975903244, 0.3744578313252975, 0.3751807228915625, 0.37590361445782755, 0.3766265060240926, 0.3773493975903576, 0.37807228915662267, 0.3787951807228877, 0.37951807228915274, 0.3802409638554178, 0.3809638554216828, 0.38168674698794786, 0.3824096385542129, 0.38313253012047793, 0.38385542168674297, 0.384578313253008, 0.38530120481927305, 0.3860240963855381, 0.3867469879518031, 0.38746987951806816, 0.3881927710843332, 0.38891566265059824, 0.3896385542168633, 0.3903614457831283, 0.39108433734939335, 0.3918072289156584, 0.39253012048192343, 0.39325301204818847, 0.3939759036144535, 0.39469879518071854, 0.3954216867469836, 0.3961445783132486, 0.39686746987951366, 0.3975903614457787, 0.39831325301204373, 0.39903614457830877, 0.3997590361445738, 0.40048192771083885, 0.4012048192771039, 0.4019277108433689, 0.40265060240963396, 0.403373493975899, 0.40409638554216404, 0.4048192771084291, 0.4055421686746941, 0.40626506024095915, 0.4069879518072242, 0.40771084337348923, 0.40843373493975427, 0.4091566265060193, 0.40987951807228434, 0.4106024096385494, 0.4113253012048144, 0.41204819277107946, 0.4127710843373445, 0.41349397590360953, 0.4142168674698746, 0.4149397590361396, 0.41566265060240465, 0.4163855421686697, 0.4171084337349347, 0.41783132530119976, 0.4185542168674648, 0.41927710843372984, 0.42000000000000004], \"y\": [0.1477282803979336, 0.15875680163912606, 0.17050961443094825, 0.1830261890004025, 0.19634752643949058, 0.21051617242161533, 0.2255762272766941, 0.24157335212369224, 0.25855477075405237, 0.27656926695534517, 0.2956671769615186, 0.31590037671447163, 0.33732226362142276, 0.3599877324937885, 0.3839531453561222, 0.4092762948181992, 0.4360163607096175, 0.46423385968448067, 0.4939905875138266, 0.5253495537956078, 0.5583749088262535, 0.5931318623942095, 0.6296865942744175, 0.6681061562235056, 0.7084583652985126, 0.7508116883473316, 0.7952351175466966, 0.8417980368934362, 0.8905700795869187, 0.9416209762749815, 0.9950203941722117, 1.050837767098092, 1.1091421165232163, 1.1700018637543177, 1.233484633433264, 1.2996570485711778, 1.368584517386328, 1.4403310122633572, 1.5149588412012929, 1.5925284121687893, 1.6730979908365946, 1.7567234522093689, 1.8434580267312242, 1.9333520414916447, 2.026452657210294, 2.1228036017305176, 2.2224449008016514, 2.3254126069793006, 2.431738527520288, 2.541449952194491, 2.654569381979179, 2.7711142596421823, 2.8910967032581163, 3.0145232437364275, 3.141394567471119, 3.271705265249057, 3.405443588576739, 3.5425912146037377, 3.6831230208346075, 3.82700687082959, 3.974203412097523, 4.124665887382027, 4.278339960533786, 4.435163558147625, 4.59506672812276, 4.757971516278141, 4.923791862121871, 5.09243351483449, 5.2637939704801875, 5.437762431407936, 5.614219788746098, 5.79303862882934, 5.974083264325828, 6.157209790755892, 6.342266169010748, 6.529092334391891, 6.717520332598366, 6.9073744829911226, 7.098471569360974, 7.290621058319929, 7.483625345325335, 7.677280028232737, 7.8713742081571825, 8.065690817304384, 8.260006973313372, 8.454094359531469, 8.647719630521344, 8.840644841979072, 9.03262790412232, 9.223423057489489, 9.4127813699747, 9.600451253810434, 9.78617900110016, 9.969709336398099, 10.150785984732936, 10.329152253377394, 10.504551625577053, 10.676728364369621, 10.845428124551248, 11.010398570779595, 11.17138999974449, 11.328155964287307, 11.480453897309248, 11.628045733277345, 11.770698525115506, 11.908185054256483, 12.040284431629106, 12.166782687364547, 12.287473347024694, 12.402157992185892, 12.510646803251747, 12.612759082419544, 12.708323754785814, 12.79717984564766, 12.879176932136962, 12.954175567414781, 13.02204767575203, 13.082676916930017, 13.135959018509931, 13.181802074642986, 13.220126810222835, 13.250866809317502, 13.273968706959609, 13.289392343519546, 13.29711088103666, 13.297110881036687, 13.289392343519623, 13.273968706959737, 13.250866809317683, 13.220126810223062, 13.181802074643263, 13.135959018510258, 13.082676916930394, 13.022047675752452, 12.954175567415257, 12.879176932137481, 12.797179845648223, 12.708323754786422, 12.612759082420196, 12.510646803252444, 12.402157992186629, 12.28747334702547, 12.166782687365368, 12.040284431629962, 11.908185054257373, 11.770698525116432, 11.6280457332783, 11.480453897310241, 11.328155964288326, 11.171389999745536, 11.010398570780671, 10.845428124552349, 10.676728364370744, 10.504551625578202, 10.329152253378565, 10.150785984734123, 9.969709336399305, 9.78617900110138, 9.600451253811668, 9.412781369975946, 9.223423057490747, 9.032627904123585, 8.840644841980344, 8.647719630522621, 8.454094359532748, 8.260006973314654, 8.065690817305667, 7.871374208158464, 7.677280028234018, 7.483625345326613, 7.290621058321201, 7.09847156936224, 6.90737448299238, 6.717520332599615, 6.529092334393131, 6.342266169011977, 6.157209790757107, 5.974083264327032, 5.793038628830529, 5.6142197887472705, 5.437762431409092, 5.26379397048133, 5.092433514835613, 4.923791862122975, 4.757971516279226, 4.595066728123826, 4.435163558148672, 4.278339960534814, 4.124665887383031, 3.9742034120985053, 3.827006870830551, 3.683123020835548, 3.5425912146046543, 3.4054435885776333, 3.271705265249928, 3.1413945674719685, 3.014523243737255, 2.89109670325892, 2.7711142596429634, 2.6545693819799365, 2.5414499521952263, 2.4317385275210017, 2.3254126069799916, 2.2224449008023197, 2.122803601731165, 2.02645265721092, 1.933352041492249, 1.8434580267318077, 1.7567234522099309, 1.673097990837136, 1.5925284121693102, 1.5149588412017954, 1.4403310122638409, 1.3685845173867925, 1.2996570485716232, 1.2334846334336929, 1.170001863754728, 1.10914211652361, 1.050837767098469, 0.9950203941725723, 0.9416209762753266, 0.8905700795872481, 0.8417980368937507, 0.795235117546997, 0.7508116883476182, 0.7084583652987854, 0.6681061562237657, 0.6296865942746649, 0.5931318623944445, 0.5583749088264774, 0.5253495537958203, 0.4939905875140282, 0.46423385968467196, 0.43601636070979893, 0.4092762948183712, 0.38395314535628483, 0.3599877324939423, 0.3373222636215693, 0.31590037671461074, 0.2956671769616506, 0.2765692669554704, 0.25855477075417127, 0.24157335212380485, 0.22557622727680085, 0.21051617242171625, 0.196347526439586, 0.1830261890004927, 0.17050961443103352, 0.15875680163920658, 0.14772828039793318]}],\n                        {\"title\": {\"text\": \"Coupling Length Distribution\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Coupling Distance (m)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Expectation (au)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"eb75fa2b-9e72-45f2-93d3-1388c36d2d4f\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"eb75fa2b-9e72-45f2-93d3-1388c36d2d4f\")) {\n                    Plotly.newPlot(\n                        'eb75fa2b-9e72-45f2-93d3-1388c36d2d4f',\n                        [{\"legendgroup\": \"Length\", \"line\": {\"color\": \"rgba(31, 119, 180, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Length\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"e23304a7-aab2-4d22-81e9-b92701ece907\", \"x\": [0.5, 1.0, 1.5, 2.0, 2.5, 3.0], \"y\": [0.30000000000000004, 0.30000000000000004, 0.30000000000000004, 0.30000000000000004, 0.30000000000000004, 0.30000000000000004]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Length\", \"marker\": {\"color\": \"rgba(31, 119, 180, 1.0)\"}, \"mode\": \"markers\", \"name\": \"Length\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"2ec2c8de-59ba-4acc-a4a3-bc3a39cf5890\", \"x\": [0.5, 1.0, 1.5, 2.0, 2.5, 3.0], \"y\": [0.33, 0.33, 0.33, 0.33, 0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Length\", \"line\": {\"color\": \"rgba(31, 119, 180, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Length\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"82440b7c-0850-4b0c-a532-624cf75d954c\", \"x\": [0.5, 1.0, 1.5, 2.0, 2.5, 3.0], \"y\": [0.36, 0.36, 0.36, 0.36, 0.36, 0.36]}],\n                        {\"title\": {\"text\": \"Coupling Lengths\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Length (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"53c134ef-ef11-486a-878a-b3bd25e25c22\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"53c134ef-ef11-486a-878a-b3bd25e25c22\")) {\n                    Plotly.newPlot(\n                        '53c134ef-ef11-486a-878a-b3bd25e25c22',\n                        [{\"legendgroup\": \"Deviation\", \"line\": {\"color\": \"rgba(255, 127, 14, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Deviation\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"68e51fdc-c22e-4fd2-aaed-2e6c8ad61ffe\", \"x\": [0.5, 1.0, 1.5, 2.0, 2.5, 3.0], \"y\": [-3.0, -3.0, -3.0, -3.0, -3.0, -3.0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Deviation\", \"marker\": {\"color\": \"rgba(255, 127, 14, 1.0)\"}, \"mode\": \"markers\", \"name\": \"Deviation\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"7ab29890-5b2c-4947-ac6d-2cf5f6e45417\", \"x\": [0.5, 1.0, 1.5, 2.0, 2.5, 3.0], \"y\": [0, 0, 0, 0, 0, 0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Deviation\", \"line\": {\"color\": \"rgba(255, 127, 14, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Deviation\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"6769c080-6375-4a2c-b59a-1cf39251536f\", \"x\": [0.5, 1.0, 1.5, 2.0, 2.5, 3.0], \"y\": [3.0, 3.0, 3.0, 3.0, 3.0, 3.0]}],\n                        {\"title\": {\"text\": \"Coupling Length Median Deviations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Median Deviation (%)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"442a7ed4-ae06-4545-93eb-b457d1708656\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"442a7ed4-ae06-4545-93eb-b457d1708656\")) {\n                    Plotly.newPlot(\n                        '442a7ed4-ae06-4545-93eb-b457d1708656',\n                        [{\"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"8903ae49-2232-4636-b060-a58ee06140c0\", \"x\": [0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6500000000000004, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004], \"y\": [0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, -0.3, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.6)\"}, \"mode\": \"markers\", \"name\": \"Rear\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"a5b03f03-9c57-4d1a-91a7-d4c69e25acbe\", \"x\": [0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6500000000000004, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004], \"y\": [0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.0, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"35938a99-4fc9-4879-86c3-7ebd383e305a\", \"x\": [0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6500000000000004, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004], \"y\": [0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.3, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7]}, {\"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"cdf446c9-9a30-4bfc-9adc-79b85d3bdac2\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.4000000000000004, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25], \"y\": [0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, -0.3, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.6)\"}, \"mode\": \"markers\", \"name\": \"Forward\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"b5150212-000d-4165-9ebf-2b22d7a00744\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.4000000000000004, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25], \"y\": [0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.0, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"a8f236e0-5fca-4f15-815a-aa4acf984302\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.4000000000000004, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25], \"y\": [0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.3, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7]}],\n                        {\"title\": {\"text\": \"Coupler Rate of Advancement\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Advance Rate (m/cycle)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"34ce7595-e21e-49f1-aeea-8d17c6ad59bc\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"34ce7595-e21e-49f1-aeea-8d17c6ad59bc\")) {\n                    Plotly.newPlot(\n                        '34ce7595-e21e-49f1-aeea-8d17c6ad59bc',\n                        [{\"legendgroup\": \"Left pes\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"269b23c9-e4c8-4a65-a04c-a366586146a1\", \"x\": [0.6000000000000001, 1.6, 2.6500000000000004], \"y\": [0.33, 0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Left pes\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Left pes\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"297beb3b-8347-4677-824e-d677c52b5655\", \"x\": [0.6000000000000001, 1.6, 2.6500000000000004], \"y\": [0.35000000000000003, 0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Left pes\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"ad344ade-fccd-4121-947d-a44b2a8048cd\", \"x\": [0.6000000000000001, 1.6, 2.6500000000000004], \"y\": [0.37000000000000005, 0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Right pes\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"f9c4a5cd-f199-47ee-8c8c-9039e0a11362\", \"x\": [1.1, 2.1, 3.1000000000000005], \"y\": [0.33, 0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Right pes\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Right pes\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"259c858b-9023-48df-b6f4-a84d3fa8465e\", \"x\": [1.1, 2.1, 3.1000000000000005], \"y\": [0.35000000000000003, 0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Right pes\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"893babbd-5c3c-4cd4-9271-d8e8cc02af7c\", \"x\": [1.1, 2.1, 3.1000000000000005], \"y\": [0.37000000000000005, 0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Left manus\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"baea4436-f740-4edf-963a-02429137ee27\", \"x\": [1.35, 2.4000000000000004, 3.3500000000000005], \"y\": [0.33, 0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left manus\", \"marker\": {\"color\": \"rgba(44, 160, 44, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Left manus\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"15064456-7291-4df4-992b-7ade604e85e1\", \"x\": [1.35, 2.4000000000000004, 3.3500000000000005], \"y\": [0.35000000000000003, 0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left manus\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"104fc542-f0ef-4b3c-ba9e-4cda349b3d7d\", \"x\": [1.35, 2.4000000000000004, 3.3500000000000005], \"y\": [0.37000000000000005, 0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Right manus\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"b2117029-19e9-45e6-949d-6ab459063fae\", \"x\": [0.8500000000000001, 1.85, 2.85], \"y\": [0.33, 0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right manus\", \"marker\": {\"color\": \"rgba(148, 103, 189, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Right manus\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"6d255d24-cff6-4105-bb07-c05ea8352d3e\", \"x\": [0.8500000000000001, 1.85, 2.85], \"y\": [0.35000000000000003, 0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right manus\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"e565fd1e-b92d-4fd2-b076-5762c3a27838\", \"x\": [0.8500000000000001, 1.85, 2.85], \"y\": [0.37000000000000005, 0.37000000000000005, 0.37000000000000005]}],\n                        {\"title\": {\"text\": \"Stepping Distances\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Distance (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"7c8e9e87-cdd3-4a65-a4d7-38b00bfe7f85\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"7c8e9e87-cdd3-4a65-a4d7-38b00bfe7f85\")) {\n                    Plotly.newPlot(\n                        '7c8e9e87-cdd3-4a65-a4d7-38b00bfe7f85',\n                        [{\"legendgroup\": \"Left\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"491e2eec-5c7b-4052-b5e7-d6c7c80184ef\", \"x\": [0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45], \"y\": [0.35000000000000003, 0.4, 0.43, 0.43, 0.43, 0.44, 0.4, 0.35000000000000003, 0.31000000000000005, 0.27, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.22, 0.27, 0.31000000000000005, 0.35000000000000003, 0.4, 0.43, 0.43, 0.43, 0.44, 0.4, 0.35000000000000003, 0.31000000000000005, 0.27, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.22, 0.27, 0.31000000000000005, 0.35000000000000003, 0.4, 0.43, 0.43, 0.43, 0.43, 0.4, 0.35000000000000003, 0.31000000000000005, 0.27, 0.22, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.22, 0.27, 0.31000000000000005, 0.35000000000000003, 0.4, 0.43, 0.43, 0.43, 0.44, 0.4, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left\", \"marker\": {\"color\": \"rgba(44, 160, 44, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Left\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"60158791-ab26-4b79-9d36-f7f77c4b670e\", \"x\": [0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45], \"y\": [0.39, 0.44, 0.48, 0.48, 0.48, 0.48, 0.44, 0.39, 0.35000000000000003, 0.31, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.31, 0.35000000000000003, 0.39, 0.44, 0.48, 0.48, 0.48, 0.48, 0.44, 0.39, 0.35000000000000003, 0.31, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.31, 0.35000000000000003, 0.39, 0.44, 0.48, 0.48, 0.48, 0.48, 0.44, 0.39, 0.35000000000000003, 0.31, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.31, 0.35000000000000003, 0.39, 0.44, 0.48, 0.48, 0.48, 0.48, 0.44, 0.39]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"9039c175-eb64-4817-b095-b96b19888d58\", \"x\": [0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45], \"y\": [0.43, 0.48, 0.53, 0.53, 0.53, 0.52, 0.48, 0.43, 0.39, 0.35, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.3, 0.35, 0.39, 0.43, 0.48, 0.53, 0.53, 0.53, 0.52, 0.48, 0.43, 0.39, 0.35, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.3, 0.35, 0.39, 0.43, 0.48, 0.53, 0.53, 0.53, 0.53, 0.48, 0.43, 0.39, 0.35, 0.3, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.3, 0.35, 0.39, 0.43, 0.48, 0.53, 0.53, 0.53, 0.52, 0.48, 0.43]}, {\"legendgroup\": \"Right\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"10b2aae8-7a1a-4e13-89b4-f145c708d22d\", \"x\": [0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45], \"y\": [0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.22, 0.27, 0.31000000000000005, 0.35000000000000003, 0.4, 0.43, 0.43, 0.43, 0.44, 0.4, 0.35000000000000003, 0.31000000000000005, 0.27, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.22, 0.27, 0.31000000000000005, 0.35000000000000003, 0.4, 0.43, 0.43, 0.43, 0.44, 0.4, 0.35000000000000003, 0.31000000000000005, 0.27, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.22, 0.27, 0.31000000000000005, 0.35000000000000003, 0.4, 0.43, 0.43, 0.43, 0.44, 0.4, 0.35000000000000003, 0.31000000000000005, 0.27, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002, 0.24000000000000002]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right\", \"marker\": {\"color\": \"rgba(148, 103, 189, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Right\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"3a62fe37-3a08-428f-b416-bf5273d8b7f0\", \"x\": [0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45], \"y\": [0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.31, 0.35000000000000003, 0.39, 0.44, 0.48, 0.48, 0.48, 0.48, 0.44, 0.39, 0.35000000000000003, 0.31, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.31, 0.35000000000000003, 0.39, 0.44, 0.48, 0.48, 0.48, 0.48, 0.44, 0.39, 0.35000000000000003, 0.31, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.31, 0.35000000000000003, 0.39, 0.44, 0.48, 0.48, 0.48, 0.48, 0.44, 0.39, 0.35000000000000003, 0.31, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.26]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"8dc972fe-f75b-4349-a8dc-c793ef338156\", \"x\": [0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45], \"y\": [0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.3, 0.35, 0.39, 0.43, 0.48, 0.53, 0.53, 0.53, 0.52, 0.48, 0.43, 0.39, 0.35, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.3, 0.35, 0.39, 0.43, 0.48, 0.53, 0.53, 0.53, 0.52, 0.48, 0.43, 0.39, 0.35, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.3, 0.35, 0.39, 0.43, 0.48, 0.53, 0.53, 0.53, 0.52, 0.48, 0.43, 0.39, 0.35, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28]}],\n                        {\"title\": {\"text\": \"Left &amp; Right Separations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Separation (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"bc4884f6-a1d5-4f09-aa59-58a6512a2e35\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"bc4884f6-a1d5-4f09-aa59-58a6512a2e35\")) {\n                    Plotly.newPlot(\n                        'bc4884f6-a1d5-4f09-aa59-58a6512a2e35',\n                        [{\"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"e4911232-3216-49c1-873f-6f8b5fe4b713\", \"x\": [0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45], \"y\": [0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.24000000000000002, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.26]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Forward\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"d4a47238-8d0b-448a-89fa-3877fc151b10\", \"x\": [0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45], \"y\": [0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"b2ff64ba-4e47-4652-869b-7aeae4ed26b6\", \"x\": [0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45], \"y\": [0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.30000000000000004, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.28]}, {\"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"f0d345cf-2223-4c9a-9313-63e9e36377c9\", \"x\": [0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45], \"y\": [0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.24000000000000002, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Rear\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"88914d73-6b8a-41a2-8214-d55e8937b1c0\", \"x\": [0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45], \"y\": [0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"dcd5d829-b319-4f13-a53d-774896e893a5\", \"x\": [0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45], \"y\": [0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.30000000000000004, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22]}],\n                        {\"title\": {\"text\": \"Forward &amp; Rear Separations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Separation (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div style=\"height:120px\"> </div>"};
+
+}());
\ No newline at end of file
@@ -0,0 +1,5 @@
+(function () {
+
+    window.SIM_DATA = {"data": {"time": {"count": 51, "cycles": [0.0, 0.10000000000000009, 0.20000000000000018, 0.30000000000000004, 0.40000000000000013, 0.5, 0.6000000000000001, 0.7000000000000002, 0.8, 0.9000000000000001, 1.0, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1000000000000005, 3.2, 3.3, 3.4000000000000004, 3.5, 3.6000000000000005, 3.7, 3.8000000000000007, 3.9000000000000004, 4.0, 4.1000000000000005, 4.2, 4.300000000000001, 4.4, 4.5, 4.6000000000000005, 4.7, 4.800000000000001, 4.9, 5.0], "support_cycles": [-0.4, -0.29999999999999993, -0.19999999999999984, -0.09999999999999998, 1.1102230246251565e-16, 0.09999999999999998, 0.20000000000000007, 0.30000000000000016, 0.4, 0.5000000000000001, 0.6, 0.7000000000000001, 0.8000000000000002, 0.9000000000000002, 1.0000000000000004, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5000000000000004, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0000000000000004, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5000000000000004, 2.6, 2.7000000000000006, 2.8000000000000003, 2.9, 3.0000000000000004, 3.1, 3.2000000000000006, 3.3000000000000003, 3.400000000000001, 3.5000000000000004, 3.6, 3.7000000000000006, 3.8000000000000003, 3.900000000000001, 4.0, 4.1, 4.2, 4.3, 4.4, 4.5, 4.6], "steps_per_cycle": 10, "progress": [0, 2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 14.0, 16.0, 18.0, 20.0, 22.0, 24.0, 26.0, 28.0, 30.0, 32.0, 34.0, 36.0, 38.0, 40.0, 42.0, 44.0, 46.0, 48.0, 50.0, 52.0, 54.0, 56.0, 58.0, 60.0, 62.0, 64.0, 66.0, 68.0, 70.0, 72.0, 74.0, 76.0, 78.0, 80.0, 82.0, 84.0, 86.0, 88.0, 90.0, 92.0, 94.0, 96.0, 98.0, 100.0]}, "cycles": {"left_pes": [[4, "M"], [6, "F"], [4, "M"], [6, "F"], [4, "M"], [6, "F"], [4, "M"], [6, "F"], [4, "M"], [7, "F"]], "right_pes": [[5, "F"], [4, "M"], [6, "F"], [4, "M"], [6, "F"], [4, "M"], [6, "F"], [4, "M"], [6, "F"], [4, "M"], [2, "F"]], "left_manus": [[5, "F"], [4, "M"], [6, "F"], [4, "M"], [6, "F"], [4, "M"], [6, "F"], [4, "M"], [6, "F"], [4, "M"], [2, "F"]], "right_manus": [[4, "M"], [6, "F"], [4, "M"], [6, "F"], [4, "M"], [6, "F"], [4, "M"], [6, "F"], [4, "M"], [7, "F"]]}, "scale": 1017.6397515527951, "offset": [0, 0], "markerIds": ["left_pes", "right_pes", "left_manus", "right_manus"], "frames": {"version": 1, "count": 51, "scale": null, "keys": ["time", "support_time", "positions.0.x.0", "positions.0.x.1", "positions.0.x.2", "positions.0.y.0", "positions.0.y.1", "positions.0.y.2", "positions.0.f", "positions.0.tx0.0", "positions.0.tx0.1", "positions.0.ty0.0", "positions.0.ty0.1", "positions.0.tx1.0", "positions.0.tx1.1", "positions.0.ty1.0", "positions.0.ty1.1", "positions.1.x.0", "positions.1.x.1", "positions.1.x.2", "positions.1.y.0", "positions.1.y.1", "positions.1.y.2", "positions.1.f", "positions.1.tx0.0", "positions.1.tx0.1", "positions.1.ty0.0", "positions.1.ty0.1", "positions.1.tx1.0", "positions.1.tx1.1", "positions.1.ty1.0", "positions.1.ty1.1", "positions.2.x.0", "positions.2.x.1", "positions.2.x.2", "positions.2.y.0", "positions.2.y.1", "positions.2.y.2", "positions.2.f", "positions.2.tx0.0", "positions.2.tx0.1", "positions.2.ty0.0", "positions.2.ty0.1", "positions.2.tx1.0", "positions.2.tx1.1", "positions.2.ty1.0", "positions.2.ty1.1", "positions.3.x.0", "positions.3.x.1", "positions.3.x.2", "positions.3.y.0", "positions.3.y.1", "positions.3.y.2", "positions.3.f", "positions.3.tx0.0", "positions.3.tx0.1", "positions.3.ty0.0", "positions.3.ty0.1", "positions.3.tx1.0", "positions.3.tx1.1", "positions.3.ty1.0", "positions.3.ty1.1", "rear_coupler.x.0", "rear_coupler.x.1", "rear_coupler.x.2", "rear_coupler.y.0", "rear_coupler.y.1", "rear_coupler.y.2", "forward_coupler.x.0", "forward_coupler.x.1", "forward_coupler.x.2", "forward_coupler.y.0", "forward_coupler.y.1", "forward_coupler.y.2", "midpoint.x.0", "midpoint.x.1", "midpoint.x.2", "midpoint.y.0", "midpoint.y.1", "midpoint.y.2", "rear_support_box.0.x", "rear_support_box.0.y", "rear_support_box.1.x", "rear_support_box.1.y", "rear_support_box.2.x", "rear_support_box.2.y", "rear_support_box.3.x", "rear_support_box.3.y", "forward_support_box.0.x", "forward_support_box.0.y", "forward_support_box.1.x", "forward_support_box.1.y", "forward_support_box.2.x", "forward_support_box.2.y", "forward_support_box.3.x", "forward_support_box.3.y"], "types": ["f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "label", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "label", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "label", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "label", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8"], "labels": ["M", "F"], "columns": [[0.0, 0.10000000000000009, 0.20000000000000018, 0.30000000000000004, 0.40000000000000013, 0.5, 0.6000000000000001, 0.7000000000000002, 0.8, 0.9000000000000001, 1.0, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1000000000000005, 3.2, 3.3, 3.4000000000000004, 3.5, 3.6000000000000005, 3.7, 3.8000000000000007, 3.9000000000000004, 4.0, 4.1000000000000005, 4.2, 4.300000000000001, 4.4, 4.5, 4.6000000000000005, 4.7, 4.800000000000001, 4.9, 5.0], [-0.4, -0.29999999999999993, -0.19999999999999984, -0.09999999999999998, 1.1102230246251565e-16, 0.09999999999999998, 0.20000000000000007, 0.30000000000000016, 0.4, 0.5000000000000001, 0.6, 0.7000000000000001, 0.8000000000000002, 0.9000000000000002, 1.0000000000000004, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5000000000000004, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0000000000000004, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5000000000000004, 2.6, 2.7000000000000006, 2.8000000000000003, 2.9, 3.0000000000000004, 3.1, 3.2000000000000006, 3.3000000000000003, 3.400000000000001, 3.5000000000000004, 3.6, 3.7000000000000006, 3.8000000000000003, 3.900000000000001, 4.0, 4.1, 4.2, 4.3, 4.4, 4.5, 4.6], [0.0, 0.09, 0.18, 0.26, 0.35000000000000003, 0.35000000000000003, 0.35000000000000003, 0.35000000000000003, 0.35000000000000003, 0.35000000000000003, 0.35000000000000003, 0.44, 0.53, 0.61, 0.7000000000000001, 0.7000000000000001, 0.7000000000000001, 0.7000000000000001, 0.7000000000000001, 0.7000000000000001, 0.7000000000000001, 0.79, 0.88, 0.96, 1.05, 1.05, 1.05, 1.05, 1.05, 1.05, 1.05, 1.1400000000000001, 1.22, 1.31, 1.4000000000000001, 1.4000000000000001, 1.4000000000000001, 1.4000000000000001, 1.4000000000000001, 1.4000000000000001, 1.4000000000000001, 1.49, 1.58, 1.6600000000000001, 1.75, 1.75, 1.75, 1.75, 1.75, 1.75, 1.75], [0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.04, 0.04, 0.04, 0.04, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.04, 0.04, 0.04, 0.04, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.0, 0.08750000000000008, 0.17500000000000016, 0.2625, 0.35, 0.35, 0.35, 0.35, 0.35, 0.35, 0.35, 0.43750000000000006, 0.5250000000000001, 0.6125000000000003, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7875, 0.875, 0.9625000000000001, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.1375000000000004, 1.225, 1.3124999999999998, 1.4, 1.4, 1.4, 1.4, 1.4, 1.4, 1.4, 1.4875000000000005, 1.5750000000000002, 1.6625000000000005, 1.75, 1.75, 1.75, 1.75, 1.75, 1.75, 1.75], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2], [0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1], [-4.0, -3.9125, -3.8249999999999997, -3.7375, -3.65, -3.65, -3.65, -3.65, -3.65, -3.65, -3.65, -3.5625, -3.4749999999999996, -3.3874999999999997, -3.3, -3.3, -3.3, -3.3, -3.3, -3.3, -3.3, -3.2125, -3.125, -3.0374999999999996, -2.95, -2.95, -2.95, -2.95, -2.95, -2.95, -2.95, -2.8625, -2.775, -2.6875, -2.6, -2.6, -2.6, -2.6, -2.6, -2.6, -2.6, -2.5124999999999993, -2.425, -2.425, -2.425, -2.425, -2.425, -2.425, -2.425, -2.425, -2.425], [0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.04, 0.04, 0.04, 0.04, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [4.175, 4.2625, 4.35, 4.4375, 4.525, 4.525, 4.525, 4.525, 4.525, 4.525, 4.525, 4.612500000000001, 4.7, 4.7875, 4.875, 4.875, 4.875, 4.875, 4.875, 4.875, 4.875, 4.9625, 5.05, 5.1375, 5.225, 5.225, 5.225, 5.225, 5.225, 5.225, 5.225, 5.3125, 5.4, 5.487500000000001, 5.575, 5.575, 5.575, 5.575, 5.575, 5.575, 5.575, 5.6625000000000005, 5.75, 5.75, 5.75, 5.75, 5.75, 5.75, 5.75, 5.75, 5.75], [0.03, 0.03, 0.01, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.01, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.01, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.01, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.18, 0.18, 0.18, 0.18, 0.18, 0.18, 0.26, 0.35000000000000003, 0.44, 0.52, 0.52, 0.52, 0.52, 0.52, 0.52, 0.52, 0.61, 0.7000000000000001, 0.79, 0.88, 0.88, 0.88, 0.88, 0.88, 0.88, 0.88, 0.96, 1.05, 1.1400000000000001, 1.22, 1.22, 1.22, 1.22, 1.22, 1.22, 1.22, 1.31, 1.4000000000000001, 1.49, 1.58, 1.58, 1.58, 1.58, 1.58, 1.58, 1.58, 1.6600000000000001, 1.75, 1.84, 1.92, 1.92], [0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.04, 0.04, 0.04, 0.04, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.04, 0.04, 0.04, 0.04, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01], [0.175, 0.175, 0.175, 0.175, 0.175, 0.175, 0.26250000000000007, 0.3500000000000001, 0.43749999999999994, 0.5249999999999999, 0.5249999999999999, 0.5249999999999999, 0.5249999999999999, 0.5249999999999999, 0.5249999999999999, 0.5249999999999999, 0.6125, 0.7000000000000002, 0.7875000000000002, 0.875, 0.875, 0.875, 0.875, 0.875, 0.875, 0.875, 0.9625, 1.05, 1.1375000000000002, 1.2249999999999999, 1.2249999999999999, 1.2249999999999999, 1.2249999999999999, 1.2249999999999999, 1.2249999999999999, 1.2249999999999999, 1.3125000000000004, 1.4000000000000001, 1.4875000000000005, 1.575, 1.575, 1.575, 1.575, 1.575, 1.575, 1.575, 1.6625000000000003, 1.75, 1.8375000000000004, 1.9249999999999998, 1.9249999999999998], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1], [-3.825, -3.825, -3.825, -3.825, -3.825, -3.825, -3.7375, -3.65, -3.5625, -3.475, -3.475, -3.475, -3.475, -3.475, -3.475, -3.475, -3.3875, -3.3, -3.2125, -3.125, -3.125, -3.125, -3.125, -3.125, -3.125, -3.125, -3.0375, -2.95, -2.8625, -2.7750000000000004, -2.7750000000000004, -2.7750000000000004, -2.7750000000000004, -2.7750000000000004, -2.7750000000000004, -2.7750000000000004, -2.6874999999999996, -2.5999999999999996, -2.5124999999999993, -2.425, -2.425, -2.425, -2.425, -2.425, -2.425, -2.425, -2.3374999999999995, -2.25, -2.25, -2.25, -2.25], [0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.04, 0.04, 0.04, 0.04, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.04, 0.04, 0.04, 0.04, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [4.35, 4.35, 4.35, 4.35, 4.35, 4.35, 4.4375, 4.525, 4.6125, 4.7, 4.7, 4.7, 4.7, 4.7, 4.7, 4.7, 4.7875000000000005, 4.875, 4.9625, 5.05, 5.05, 5.05, 5.05, 5.05, 5.05, 5.05, 5.1375, 5.225, 5.3125, 5.4, 5.4, 5.4, 5.4, 5.4, 5.4, 5.4, 5.487500000000001, 5.575, 5.6625000000000005, 5.75, 5.75, 5.75, 5.75, 5.75, 5.75, 5.75, 5.8375, 5.925, 5.925, 5.925, 5.925], [0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.01, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.01, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.01, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.01, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.26, 0.26, 0.26, 0.26, 0.26, 0.26, 0.35000000000000003, 0.44, 0.52, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.7000000000000001, 0.79, 0.88, 0.96, 0.96, 0.96, 0.96, 0.96, 0.96, 0.96, 1.05, 1.1400000000000001, 1.22, 1.31, 1.31, 1.31, 1.31, 1.31, 1.31, 1.31, 1.4000000000000001, 1.49, 1.58, 1.6600000000000001, 1.6600000000000001, 1.6600000000000001, 1.6600000000000001, 1.6600000000000001, 1.6600000000000001, 1.6600000000000001, 1.75, 1.84, 1.93, 2.0100000000000002, 2.0100000000000002], [0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.04, 0.04, 0.04, 0.04, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01], [0.26249999999999996, 0.26249999999999996, 0.26249999999999996, 0.26249999999999996, 0.26249999999999996, 0.26249999999999996, 0.35000000000000003, 0.4375000000000001, 0.5249999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.7, 0.7875000000000001, 0.8750000000000002, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 1.05, 1.1375000000000002, 1.225, 1.3125, 1.3125, 1.3125, 1.3125, 1.3125, 1.3125, 1.3125, 1.4000000000000004, 1.4875, 1.5750000000000006, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.7500000000000002, 1.8375, 1.9250000000000003, 2.0124999999999997, 2.0124999999999997], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2], [1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1], [-3.7375, -3.7375, -3.7375, -3.7375, -3.7375, -3.7375, -3.65, -3.5625, -3.475, -3.3875, -3.3875, -3.3875, -3.3875, -3.3875, -3.3875, -3.3875, -3.3, -3.2125, -3.125, -3.0375, -3.0375, -3.0375, -3.0375, -3.0375, -3.0375, -3.0375, -2.95, -2.8625, -2.775, -2.6875, -2.6875, -2.6875, -2.6875, -2.6875, -2.6875, -2.6875, -2.5999999999999996, -2.5125, -2.4249999999999994, -2.3375000000000004, -2.3375000000000004, -2.3375000000000004, -2.3375000000000004, -2.3375000000000004, -2.3375000000000004, -2.3375000000000004, -2.25, -2.1625, -2.1625, -2.1625, -2.1625], [0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.04, 0.04, 0.04, 0.04, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [4.4375, 4.4375, 4.4375, 4.4375, 4.4375, 4.4375, 4.525, 4.6125, 4.7, 4.7875, 4.7875, 4.7875, 4.7875, 4.7875, 4.7875, 4.7875, 4.875, 4.9625, 5.05, 5.1375, 5.1375, 5.1375, 5.1375, 5.1375, 5.1375, 5.1375, 5.225, 5.3125, 5.4, 5.4875, 5.4875, 5.4875, 5.4875, 5.4875, 5.4875, 5.4875, 5.575000000000001, 5.6625, 5.75, 5.8375, 5.8375, 5.8375, 5.8375, 5.8375, 5.8375, 5.8375, 5.925000000000001, 6.012499999999999, 6.012499999999999, 6.012499999999999, 6.012499999999999], [0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.01, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.01, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.01, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.01, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.09, 0.18, 0.26, 0.35000000000000003, 0.44, 0.44, 0.44, 0.44, 0.44, 0.44, 0.44, 0.53, 0.61, 0.7000000000000001, 0.79, 0.79, 0.79, 0.79, 0.79, 0.79, 0.79, 0.88, 0.96, 1.05, 1.1400000000000001, 1.1400000000000001, 1.1400000000000001, 1.1400000000000001, 1.1400000000000001, 1.1400000000000001, 1.1400000000000001, 1.23, 1.31, 1.4000000000000001, 1.49, 1.49, 1.49, 1.49, 1.49, 1.49, 1.49, 1.58, 1.6600000000000001, 1.75, 1.84, 1.84, 1.84, 1.84, 1.84, 1.84, 1.84], [0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.04, 0.04, 0.04, 0.04, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.0875, 0.17500000000000007, 0.2625000000000002, 0.35, 0.4375, 0.4375, 0.4375, 0.4375, 0.4375, 0.4375, 0.4375, 0.5250000000000001, 0.6125000000000002, 0.7000000000000002, 0.7875, 0.7875, 0.7875, 0.7875, 0.7875, 0.7875, 0.7875, 0.875, 0.9625000000000001, 1.0500000000000003, 1.1375, 1.1375, 1.1375, 1.1375, 1.1375, 1.1375, 1.1375, 1.2250000000000003, 1.3125, 1.3999999999999997, 1.4874999999999998, 1.4874999999999998, 1.4874999999999998, 1.4874999999999998, 1.4874999999999998, 1.4874999999999998, 1.4874999999999998, 1.5750000000000004, 1.6625, 1.7500000000000004, 1.8375, 1.8375, 1.8375, 1.8375, 1.8375, 1.8375, 1.8375], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1], [-3.9125, -3.8249999999999997, -3.7375, -3.65, -3.5625, -3.5625, -3.5625, -3.5625, -3.5625, -3.5625, -3.5625, -3.4749999999999996, -3.3874999999999997, -3.3, -3.2125, -3.2125, -3.2125, -3.2125, -3.2125, -3.2125, -3.2125, -3.125, -3.0374999999999996, -2.9499999999999997, -2.8625, -2.8625, -2.8625, -2.8625, -2.8625, -2.8625, -2.8625, -2.7749999999999995, -2.6875, -2.6000000000000005, -2.5125, -2.5125, -2.5125, -2.5125, -2.5125, -2.5125, -2.5125, -2.425, -2.3375, -2.3375, -2.3375, -2.3375, -2.3375, -2.3375, -2.3375, -2.3375, -2.3375], [0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.03, 0.03, 0.03, 0.03, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [4.2625, 4.35, 4.4375, 4.525, 4.6125, 4.6125, 4.6125, 4.6125, 4.6125, 4.6125, 4.6125, 4.7, 4.7875, 4.875, 4.9625, 4.9625, 4.9625, 4.9625, 4.9625, 4.9625, 4.9625, 5.050000000000001, 5.1375, 5.2250000000000005, 5.3125, 5.3125, 5.3125, 5.3125, 5.3125, 5.3125, 5.3125, 5.3999999999999995, 5.4875, 5.575, 5.6625, 5.6625, 5.6625, 5.6625, 5.6625, 5.6625, 5.6625, 5.75, 5.8375, 5.8375, 5.8375, 5.8375, 5.8375, 5.8375, 5.8375, 5.8375, 5.8375], [0.03, 0.03, 0.01, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.01, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.01, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.01, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.09, 0.13, 0.18, 0.22, 0.262, 0.26, 0.31, 0.35000000000000003, 0.39, 0.437, 0.44, 0.48, 0.52, 0.5700000000000001, 0.612, 0.61, 0.66, 0.7000000000000001, 0.74, 0.788, 0.79, 0.8300000000000001, 0.88, 0.92, 0.962, 0.96, 1.01, 1.05, 1.09, 1.137, 1.1400000000000001, 1.18, 1.22, 1.27, 1.312, 1.31, 1.36, 1.4000000000000001, 1.44, 1.487, 1.49, 1.53, 1.58, 1.62, 1.6620000000000001, 1.6600000000000001, 1.71, 1.75, 1.79, 1.837, 1.837], [0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.007], [0.0875, 0.13125000000000003, 0.17500000000000007, 0.21875, 0.26249999999999996, 0.26249999999999996, 0.30625, 0.35000000000000003, 0.39374999999999993, 0.43749999999999994, 0.43749999999999994, 0.48124999999999996, 0.525, 0.5687500000000001, 0.6124999999999999, 0.6124999999999999, 0.65625, 0.7000000000000001, 0.7437500000000001, 0.7875, 0.7875, 0.83125, 0.875, 0.9187500000000001, 0.9624999999999999, 0.9624999999999999, 1.0062499999999999, 1.0499999999999998, 1.09375, 1.1374999999999997, 1.1374999999999997, 1.1812500000000001, 1.225, 1.2687499999999998, 1.3125, 1.3125, 1.3562500000000002, 1.4, 1.44375, 1.4874999999999998, 1.4874999999999998, 1.5312500000000002, 1.5750000000000002, 1.6187500000000004, 1.6625, 1.6625, 1.7062500000000003, 1.75, 1.7937500000000002, 1.8375, 1.8375], [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1], [0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007], [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1], [0.18, 0.22, 0.26, 0.31, 0.35000000000000003, 0.35000000000000003, 0.39, 0.44, 0.48, 0.525, 0.52, 0.5700000000000001, 0.61, 0.66, 0.7000000000000001, 0.7000000000000001, 0.74, 0.79, 0.8300000000000001, 0.875, 0.88, 0.92, 0.96, 1.01, 1.05, 1.05, 1.09, 1.1400000000000001, 1.18, 1.225, 1.22, 1.27, 1.31, 1.36, 1.4000000000000001, 1.4000000000000001, 1.44, 1.49, 1.53, 1.575, 1.57, 1.62, 1.6600000000000001, 1.71, 1.75, 1.75, 1.79, 1.84, 1.8800000000000001, 1.925, 1.925], [0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.02, 0.02, 0.02, 0.02, 0.007, 0.007], [0.175, 0.21875, 0.26250000000000007, 0.30624999999999997, 0.35, 0.35, 0.39375000000000004, 0.43750000000000006, 0.48124999999999996, 0.5249999999999999, 0.5249999999999999, 0.5687500000000001, 0.6125, 0.65625, 0.7, 0.7, 0.7437499999999999, 0.7875000000000001, 0.83125, 0.875, 0.875, 0.91875, 0.9625, 1.00625, 1.0499999999999998, 1.0499999999999998, 1.09375, 1.1375000000000002, 1.18125, 1.225, 1.225, 1.2687500000000003, 1.3125, 1.3562499999999997, 1.4, 1.4, 1.44375, 1.4874999999999998, 1.5312500000000002, 1.5749999999999997, 1.5749999999999997, 1.6187500000000001, 1.6625, 1.7062500000000003, 1.75, 1.75, 1.7937500000000002, 1.8375, 1.88125, 1.9249999999999998, 1.9249999999999998], [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1], [0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007], [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1], [0.13, 0.18, 0.22, 0.26, 0.306, 0.31, 0.35000000000000003, 0.39, 0.44, 0.481, 0.48, 0.52, 0.5700000000000001, 0.61, 0.656, 0.66, 0.7000000000000001, 0.74, 0.79, 0.8310000000000001, 0.8300000000000001, 0.88, 0.92, 0.96, 1.006, 1.01, 1.05, 1.09, 1.1400000000000001, 1.181, 1.18, 1.22, 1.27, 1.31, 1.356, 1.36, 1.4000000000000001, 1.44, 1.49, 1.5310000000000001, 1.53, 1.58, 1.62, 1.6600000000000001, 1.706, 1.71, 1.75, 1.79, 1.84, 1.881, 1.881], [0.01, 0.01, 0.01, 0.01, 0.005, 0.01, 0.01, 0.01, 0.01, 0.005, 0.01, 0.01, 0.01, 0.01, 0.005, 0.01, 0.01, 0.01, 0.01, 0.005, 0.01, 0.01, 0.01, 0.01, 0.005, 0.01, 0.01, 0.01, 0.01, 0.005, 0.01, 0.01, 0.01, 0.01, 0.005, 0.01, 0.01, 0.01, 0.01, 0.005, 0.01, 0.01, 0.01, 0.01, 0.005, 0.01, 0.01, 0.01, 0.01, 0.005, 0.005], [0.13124999999999998, 0.17500000000000002, 0.21875000000000006, 0.26249999999999996, 0.30624999999999997, 0.30624999999999997, 0.35000000000000003, 0.39375000000000004, 0.43749999999999994, 0.48124999999999996, 0.48124999999999996, 0.525, 0.5687500000000001, 0.6125, 0.65625, 0.65625, 0.7, 0.7437500000000001, 0.7875000000000001, 0.83125, 0.83125, 0.875, 0.91875, 0.9625000000000001, 1.0062499999999999, 1.0062499999999999, 1.0499999999999998, 1.09375, 1.1375, 1.18125, 1.18125, 1.225, 1.26875, 1.3124999999999998, 1.35625, 1.35625, 1.4000000000000001, 1.4437499999999999, 1.4875000000000003, 1.5312499999999998, 1.5312499999999998, 1.5750000000000002, 1.6187500000000001, 1.6625000000000003, 1.70625, 1.70625, 1.7500000000000002, 1.79375, 1.8375000000000001, 1.8812499999999999, 1.8812499999999999], [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1], [0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005], [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1], [0.0, 0.08750000000000008, 0.17500000000000016, 0.175, 0.175, 0.175, 0.26250000000000007, 0.3500000000000001, 0.43749999999999994, 0.5249999999999999, 0.5249999999999999, 0.43750000000000006, 0.5250000000000001, 0.5249999999999999, 0.5249999999999999, 0.5249999999999999, 0.6125, 0.7000000000000002, 0.7875000000000002, 0.875, 0.875, 0.7875, 0.875, 0.875, 0.875, 0.875, 0.9625, 1.05, 1.1375000000000002, 1.2249999999999999, 1.2249999999999999, 1.1375000000000004, 1.225, 1.2249999999999999, 1.2249999999999999, 1.2249999999999999, 1.3125000000000004, 1.4000000000000001, 1.4875000000000005, 1.575, 1.575, 1.4875000000000005, 1.5750000000000002, 1.575, 1.575, 1.575, 1.6625000000000003, 1.75, 1.8375000000000004, 1.9249999999999998, 1.9249999999999998], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2], [0.175, 0.175, 0.175, 0.2625, 0.35, 0.35, 0.35, 0.35, 0.35, 0.35, 0.35, 0.5249999999999999, 0.5249999999999999, 0.6125000000000003, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.875, 0.875, 0.9625000000000001, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.2249999999999999, 1.2249999999999999, 1.3124999999999998, 1.4, 1.4, 1.4, 1.4, 1.4, 1.4, 1.4, 1.575, 1.575, 1.6625000000000005, 1.75, 1.75, 1.75, 1.75, 1.75, 1.75, 1.75], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2], [0.175, 0.175, 0.175, 0.2625, 0.35, 0.35, 0.35, 0.35, 0.35, 0.35, 0.35, 0.5249999999999999, 0.5249999999999999, 0.6125000000000003, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.875, 0.875, 0.9625000000000001, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.0499999999999998, 1.2249999999999999, 1.2249999999999999, 1.3124999999999998, 1.4, 1.4, 1.4, 1.4, 1.4, 1.4, 1.4, 1.575, 1.575, 1.6625000000000005, 1.75, 1.75, 1.75, 1.75, 1.75, 1.75, 1.75], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.08750000000000008, 0.17500000000000016, 0.175, 0.175, 0.175, 0.26250000000000007, 0.3500000000000001, 0.43749999999999994, 0.5249999999999999, 0.5249999999999999, 0.43750000000000006, 0.5250000000000001, 0.5249999999999999, 0.5249999999999999, 0.5249999999999999, 0.6125, 0.7000000000000002, 0.7875000000000002, 0.875, 0.875, 0.7875, 0.875, 0.875, 0.875, 0.875, 0.9625, 1.05, 1.1375000000000002, 1.2249999999999999, 1.2249999999999999, 1.1375000000000004, 1.225, 1.2249999999999999, 1.2249999999999999, 1.2249999999999999, 1.3125000000000004, 1.4000000000000001, 1.4875000000000005, 1.575, 1.575, 1.4875000000000005, 1.5750000000000002, 1.575, 1.575, 1.575, 1.6625000000000003, 1.75, 1.8375000000000004, 1.9249999999999998, 1.9249999999999998], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [0.0875, 0.17500000000000007, 0.2625000000000002, 0.35, 0.4375, 0.4375, 0.35000000000000003, 0.4375000000000001, 0.4375, 0.4375, 0.4375, 0.5250000000000001, 0.6125000000000002, 0.7000000000000002, 0.7875, 0.7875, 0.7, 0.7875000000000001, 0.7875, 0.7875, 0.7875, 0.875, 0.9625000000000001, 1.0500000000000003, 1.1375, 1.1375, 1.05, 1.1375000000000002, 1.1375, 1.1375, 1.1375, 1.2250000000000003, 1.3125, 1.3999999999999997, 1.4874999999999998, 1.4874999999999998, 1.4000000000000004, 1.4875, 1.4874999999999998, 1.4874999999999998, 1.4874999999999998, 1.5750000000000004, 1.6625, 1.7500000000000004, 1.8375, 1.8375, 1.7500000000000002, 1.8375, 1.8375, 1.8375, 1.8375], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2], [0.26249999999999996, 0.26249999999999996, 0.26249999999999996, 0.26249999999999996, 0.26249999999999996, 0.26249999999999996, 0.4375, 0.4375, 0.5249999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.7875, 0.7875, 0.8750000000000002, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 1.1375, 1.1375, 1.225, 1.3125, 1.3125, 1.3125, 1.3125, 1.3125, 1.3125, 1.3125, 1.4874999999999998, 1.4874999999999998, 1.5750000000000006, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.8375, 1.8375, 1.9250000000000003, 2.0124999999999997, 2.0124999999999997], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2], [0.26249999999999996, 0.26249999999999996, 0.26249999999999996, 0.26249999999999996, 0.26249999999999996, 0.26249999999999996, 0.4375, 0.4375, 0.5249999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.6124999999999999, 0.7875, 0.7875, 0.8750000000000002, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 0.9624999999999999, 1.1375, 1.1375, 1.225, 1.3125, 1.3125, 1.3125, 1.3125, 1.3125, 1.3125, 1.3125, 1.4874999999999998, 1.4874999999999998, 1.5750000000000006, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.6624999999999999, 1.8375, 1.8375, 1.9250000000000003, 2.0124999999999997, 2.0124999999999997], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [0.0875, 0.17500000000000007, 0.2625000000000002, 0.35, 0.4375, 0.4375, 0.35000000000000003, 0.4375000000000001, 0.4375, 0.4375, 0.4375, 0.5250000000000001, 0.6125000000000002, 0.7000000000000002, 0.7875, 0.7875, 0.7, 0.7875000000000001, 0.7875, 0.7875, 0.7875, 0.875, 0.9625000000000001, 1.0500000000000003, 1.1375, 1.1375, 1.05, 1.1375000000000002, 1.1375, 1.1375, 1.1375, 1.2250000000000003, 1.3125, 1.3999999999999997, 1.4874999999999998, 1.4874999999999998, 1.4000000000000004, 1.4875, 1.4874999999999998, 1.4874999999999998, 1.4874999999999998, 1.5750000000000004, 1.6625, 1.7500000000000004, 1.8375, 1.8375, 1.7500000000000002, 1.8375, 1.8375, 1.8375, 1.8375], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]]}}, "body": "<div class=\"top-container no-select\">\n  <div style=\"display:flex;padding:0 1.0em;align-items: flex-end;\">\n    <div class=\"header-box\">\n      <div class=\"header-title\">UNIT-TEST Columnar</div>\n      <div class=\"header-summary\">None</div>\n      <div class=\"header-entry date\">\n        <span class=\"name\">Date:</span>\n        <span class=\"value\">10-18-2026 12:27</span>\n      </div>\n      <div class=\"header-entry duty-cycle\">\n        <span class=\"name\">Duty Cycle:</span>\n        <span class=\"value\">60%</span>\n      </div>\n      <div class=\"header-entry activity-phases\">\n        <span class=\"name\">Activity Phases:</span>\n          <span class=\"value\">\n            Pes: (<span class=\"left_pes-value\">0%</span>,\n            <span class=\"right_pes-value\">50%</span>)\n            Manus: (<span class=\"left_manus-value\">50%</span>,\n            <span class=\"right_manus-value\">0%</span>)\n          </span>\n      </div>\n      <div class=\"header-entry support-phases\">\n        <span class=\"name\">Support Phases:</span>\n          <span class=\"value\">\n            Pes: (<span class=\"left_pes-value\">0%</span>,\n            <span class=\"right_pes-value\">50%</span>)\n            Manus: (<span class=\"left_manus-value\">50%</span>,\n            <span class=\"right_manus-value\">0%</span>)\n          </span>\n      </div>\n    </div>\n    <div class=\"spacer\"></div>\n\n    <div class=\"playback-controls\">\n      <div class=\"control-row\">\n        <div class=\"spacer\"></div>\n\n        <div class=\"control\" data-role=\"pop-out\">\n          <img src=\"img/picture-in-picture.svg\"/>\n        </div>\n\n        <div class=\"control\" data-role=\"save-svg\">\n          <img src=\"img/camera.svg\"/>\n        </div>\n      </div>\n\n      <div class=\"control-row animation-controls\">\n        <div class=\"spacer\"></div>\n\n        <div class=\"control\" data-role=\"backward-10\">\n          <img src=\"img/replay-10.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"jump-back\">\n          <img src=\"img/back.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"frame-back\">\n          <img src=\"img/step-back.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"toggle-play\">\n          <img src=\"img/play.svg\" class=\"play-icon\"/>\n          <img src=\"img/pause.svg\" class=\"pause-icon\"/>\n        </div>\n        <div class=\"control\" data-role=\"frame-forward\">\n          <img src=\"img/step-forward.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"jump-forward\">\n          <img src=\"img/forward.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"forward-10\">\n          <img src=\"img/forward-10.svg\"/>\n        </div>\n      </div>\n\n\n    </div>\n  </div>\n\n  <div class=\"progress-bar\">\n    <div class=\"header\">\n      <div class=\"value-box\">\n        <div class=\"header\">Left Pes</div>\n        <div class=\"swatch left_pes_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Right Pes</div>\n        <div class=\"swatch right_pes_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Left Manus</div>\n        <div class=\"swatch left_manus_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Right Manus</div>\n        <div class=\"swatch right_manus_color\"></div>\n      </div>\n\n      <div class=\"spacer\"></div>\n\n      <div class=\"time-box\">\n\n        <div class=\"value-box\">\n          <div class=\"header\">Progress</div>\n          <div class=\"value progress-value\"></div>\n        </div>\n\n        <div class=\"value-box activity-time-box\">\n          <div class=\"header\">Activity Cycle</div>\n          <div class=\"value\">\n            <span class=\"cycle-value\"></span> :\n            <span class=\"phase-value\"></span>\n          </div>\n        </div>\n\n        <div class=\"value-box support-time-box\">\n          <div class=\"header\">Support Cycle</div>\n          <div class=\"value\">\n            <span class=\"cycle-value\"></span> :\n            <span class=\"phase-value\"></span>\n          </div>\n        </div>\n\n      </div>\n    </div>\n\n    <div class=\"outer\">\n      <div class=\"inner\"></div>\n      <div class=\"cycles left_pes left_pes_color\"></div>\n      <div class=\"cycles left_manus left_manus_color\"></div>\n      <div class=\"cycles right_manus right_manus_color\"></div>\n      <div class=\"cycles right_pes right_pes_color\"></div>\n    </div>\n  </div>\n</div>\n\n        <div class=\"svg-box\">\n          <div class=\"svg-box-inner\">\n<svg version=\"1.1\"\n    id=\"svg-270631435668\"\n    xmlns:xlink=\"http://www.w3.org/1999/xlink\"\n    xmlns=\"http://www.w3.org/2000/svg\"\n    viewBox=\"-21 -225 2082 246\">\n\n<style>\n/* <![CDATA[ */\n#svg-270631435668 .left_pes { fill: DodgerBlue; opacity: 0.5; }\n#svg-270631435668 .right_pes { fill: DarkOrange; opacity: 0.5; }\n#svg-270631435668 .left_manus { fill: DarkOliveGreen; opacity: 0.5; }\n#svg-270631435668 .right_manus { fill: DarkOrchid; opacity: 0.5; }\n#svg-270631435668 .left_pes { fill: DodgerBlue; opacity: 0.5; stroke-width: 8px; stroke: DodgerBlue; }\n#svg-270631435668 .left_pes.assumed { fill: white; opacity: 0.33; }\n#svg-270631435668 .left_pes-marker { fill: transparent; stroke-width: 8px; stroke: DodgerBlue; }\n#svg-270631435668 .right_pes { fill: DarkOrange; opacity: 0.5; stroke-width: 8px; stroke: DarkOrange; }\n#svg-270631435668 .right_pes.assumed { fill: white; opacity: 0.33; }\n#svg-270631435668 .right_pes-marker { fill: transparent; stroke-width: 8px; stroke: DarkOrange; }\n#svg-270631435668 .left_manus { fill: DarkOliveGreen; opacity: 0.5; stroke-width: 8px; stroke: DarkOliveGreen; stroke-dasharray: 4,4; }\n#svg-270631435668 .left_manus.assumed { fill: white; opacity: 0.33; stroke-dasharray: 4,4; }\n#svg-270631435668 .left_manus-marker { fill: transparent; stroke-width: 8px; stroke: DarkOliveGreen; stroke-dasharray: 8,4; }\n#svg-270631435668 .right_manus { fill: DarkOrchid; opacity: 0.5; stroke-width: 8px; stroke: DarkOrchid; stroke-dasharray: 4,4; }\n#svg-270631435668 .right_manus.assumed { fill: white; opacity: 0.33; stroke-dasharray: 4,4; }\n#svg-270631435668 .right_manus-marker { fill: transparent; stroke-width: 8px; stroke: DarkOrchid; stroke-dasharray: 8,4; }\n/* ]]> */\n</style>\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"0.0\" cy=\"-203.52795031055905\" data-x=\"0.0\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-uid=\"1462\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"356.17391304347825\" cy=\"-203.52795031055905\" data-x=\"0.35000000000000003\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"1463\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"712.3478260869565\" cy=\"-203.52795031055905\" data-x=\"0.7000000000000001\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"1464\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"1068.5217391304348\" cy=\"-203.52795031055905\" data-x=\"1.05\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"1465\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"1424.695652173913\" cy=\"-203.52795031055905\" data-x=\"1.4000000000000001\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"1466\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"1780.8695652173915\" cy=\"-203.52795031055905\" data-x=\"1.75\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"1467\" />\n<circle id=\"left_pes\" class=\"left_pes-marker\" r=\"16.0\" cx=\"0.0\" cy=\"-203.52795031055905\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"178.08695652173913\" cy=\"-0.0\" data-x=\"0.18\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"1468\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"534.2608695652174\" cy=\"-0.0\" data-x=\"0.52\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"1469\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"890.4347826086957\" cy=\"-0.0\" data-x=\"0.88\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"1470\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"1246.608695652174\" cy=\"-0.0\" data-x=\"1.22\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"1471\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"1602.7826086956522\" cy=\"-0.0\" data-x=\"1.58\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"1472\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"1958.9565217391305\" cy=\"-0.0\" data-x=\"1.92\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"1473\" />\n<circle id=\"right_pes\" class=\"right_pes-marker\" r=\"16.0\" cx=\"178.08695652173913\" cy=\"-0.0\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"267.1304347826087\" cy=\"-203.52795031055905\" data-x=\"0.26\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"1474\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"623.304347826087\" cy=\"-203.52795031055905\" data-x=\"0.61\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"1475\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"979.4782608695652\" cy=\"-203.52795031055905\" data-x=\"0.96\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"1476\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"1335.6521739130435\" cy=\"-203.52795031055905\" data-x=\"1.31\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"1477\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"1691.8260869565217\" cy=\"-203.52795031055905\" data-x=\"1.6600000000000001\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"1478\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"2048.0\" cy=\"-203.52795031055905\" data-x=\"2.0100000000000002\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"1479\" />\n<circle id=\"left_manus\" class=\"left_manus-marker\" r=\"12.0\" cx=\"267.1304347826087\" cy=\"-203.52795031055905\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"89.04347826086956\" cy=\"-0.0\" data-x=\"0.09\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-uid=\"1480\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"445.21739130434787\" cy=\"-0.0\" data-x=\"0.44\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"1481\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"801.3913043478261\" cy=\"-0.0\" data-x=\"0.79\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"1482\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"1157.5652173913045\" cy=\"-0.0\" data-x=\"1.1400000000000001\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"1483\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"1513.7391304347825\" cy=\"-0.0\" data-x=\"1.49\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"1484\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"1869.913043478261\" cy=\"-0.0\" data-x=\"1.84\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"1485\" />\n<circle id=\"right_manus\" class=\"right_manus-marker\" r=\"12.0\" cx=\"89.04347826086956\" cy=\"-0.0\" />\n</svg></div>\n          <div class=\"svg-controls-box\" style=\"display:none\">\n            <div>\n                <div>Activity: <span class=\"activity-status\"></span></div>\n                <div>Support: <span class=\"support-status\"></span></div>\n            </div>\n            <div class=\"spacer\"></div>\n          </div>\n        </div>\n        \n<div class=\"line-break\"></div>\n\n<div class=\"results-container\">\n  <div class=\"settings-box info-display-box\">\n    <div class=\"info-header\">Trial Results</div>\n\n    <div class=\"info-row\">\n      <div id=\"lengthResults\" class=\"entry\">\n        <div class=\"title title-box\">Average Calculated Lengths (m)</div>\n\n        <div>\n          <span class=\"label\">Coupling Length:</span>\n          <span class=\"value\">0.09 &#177; 0.02</span>\n          <!-- span class=\"deviation\"> </span -->\n        </div>\n\n        <div>\n          <span class=\"label\">Coupling IQR:</span>\n          <span class=\"value\">[0.07178, 0.1082]</span>\n        </div>\n\n        <div>\n          <span class=\"label\">Coupling Bounds (2%):</span>\n          <span class=\"value\">[0.03005, 0.1499]</span>\n        </div>\n      </div>\n    </div>\n  </div>\n\n  <div class=\"status-box info-display-box\">\n    <div class=\"info-header\">Display Status</div>\n\n    <div class=\"info-row\">\n      <div class=\"entry left_pes\">\n        <div class=\"title left_pes_color\">Left Pes</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n\n      <div class=\"entry left_manus\">\n        <div class=\"title left_manus_color\">Left Manus</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n    </div>\n\n    <div class=\"info-row\">\n      <div class=\"entry right_pes\">\n        <div class=\"title right_pes_color\">Right Pes</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n\n      <div class=\"entry right_manus\">\n        <div class=\"title right_manus_color\">Right Manus</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n    </div>\n  </div>\n</div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"0bb63a26-0a11-429f-900c-b4e8fc4543ef\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"0bb63a26-0a11-429f-900c-b4e8fc4543ef\")) {\n                    Plotly.newPlot(\n                        '0bb63a26-0a11-429f-900c-b4e8fc4543ef',\n                        [{\"mode\": \"lines\", \"type\": \"scatter\", \"uid\": \"2712bb3e-5ec0-457e-af22-c3229385914f\", \"x\": [0.0, 0.0007228915662650603, 0.0014457831325301205, 0.002168674698795181, 0.002891566265060241, 0.0036144578313253013, 0.004337349397590362, 0.005060240963855421, 0.005783132530120482, 0.006506024096385543, 0.0072289156626506035, 0.007951807228915664, 0.008674698795180725, 0.009397590361445786, 0.010120481927710846, 0.010843373493975907, 0.011566265060240968, 0.012289156626506028, 0.013012048192771089, 0.01373493975903615, 0.01445783132530121, 0.015180722891566271, 0.015903614457831332, 0.01662650602409639, 0.01734939759036145, 0.01807228915662651, 0.018795180722891568, 0.019518072289156627, 0.020240963855421686, 0.020963855421686745, 0.021686746987951804, 0.022409638554216862, 0.02313253012048192, 0.02385542168674698, 0.02457831325301204, 0.0253012048192771, 0.026024096385542157, 0.026746987951807216, 0.027469879518072275, 0.028192771084337334, 0.028915662650602393, 0.029638554216867452, 0.03036144578313251, 0.03108433734939757, 0.03180722891566263, 0.03253012048192769, 0.03325301204819275, 0.033975903614457806, 0.034698795180722865, 0.035421686746987924, 0.03614457831325298, 0.03686746987951804, 0.0375903614457831, 0.03831325301204816, 0.03903614457831322, 0.03975903614457828, 0.040481927710843336, 0.041204819277108395, 0.041927710843373454, 0.04265060240963851, 0.04337349397590357, 0.04409638554216863, 0.04481927710843369, 0.04554216867469875, 0.04626506024096381, 0.04698795180722887, 0.047710843373493926, 0.048433734939758985, 0.049156626506024044, 0.0498795180722891, 0.05060240963855416, 0.05132530120481922, 0.05204819277108428, 0.05277108433734934, 0.0534939759036144, 0.05421686746987946, 0.054939759036144516, 0.055662650602409575, 0.056385542168674634, 0.05710843373493969, 0.05783132530120475, 0.05855421686746981, 0.05927710843373487, 0.05999999999999993, 0.06072289156626499, 0.061445783132530046, 0.062168674698795105, 0.06289156626506016, 0.06361445783132523, 0.0643373493975903, 0.06506024096385536, 0.06578313253012043, 0.0665060240963855, 0.06722891566265056, 0.06795180722891563, 0.06867469879518069, 0.06939759036144576, 0.07012048192771082, 0.07084337349397589, 0.07156626506024096, 0.07228915662650602, 0.07301204819277109, 0.07373493975903615, 0.07445783132530122, 0.07518072289156628, 0.07590361445783135, 0.07662650602409642, 0.07734939759036148, 0.07807228915662655, 0.07879518072289161, 0.07951807228915668, 0.08024096385542175, 0.08096385542168681, 0.08168674698795188, 0.08240963855421694, 0.08313253012048201, 0.08385542168674708, 0.08457831325301214, 0.08530120481927721, 0.08602409638554227, 0.08674698795180734, 0.0874698795180724, 0.08819277108433747, 0.08891566265060254, 0.0896385542168676, 0.09036144578313267, 0.09108433734939773, 0.0918072289156628, 0.09253012048192787, 0.09325301204819293, 0.093975903614458, 0.09469879518072306, 0.09542168674698813, 0.0961445783132532, 0.09686746987951826, 0.09759036144578333, 0.0983132530120484, 0.09903614457831346, 0.09975903614457853, 0.10048192771084359, 0.10120481927710866, 0.10192771084337372, 0.10265060240963879, 0.10337349397590385, 0.10409638554216892, 0.10481927710843399, 0.10554216867469905, 0.10626506024096412, 0.10698795180722918, 0.10771084337349425, 0.10843373493975932, 0.10915662650602438, 0.10987951807228945, 0.11060240963855451, 0.11132530120481958, 0.11204819277108465, 0.11277108433734971, 0.11349397590361478, 0.11421686746987984, 0.11493975903614491, 0.11566265060240997, 0.11638554216867504, 0.1171084337349401, 0.11783132530120517, 0.11855421686747024, 0.1192771084337353, 0.12000000000000037, 0.12072289156626544, 0.1214457831325305, 0.12216867469879557, 0.12289156626506063, 0.1236144578313257, 0.12433734939759077, 0.12506024096385582, 0.12578313253012088, 0.12650602409638595, 0.12722891566265102, 0.12795180722891608, 0.12867469879518115, 0.1293975903614462, 0.13012048192771128, 0.13084337349397634, 0.1315662650602414, 0.13228915662650648, 0.13301204819277154, 0.1337349397590366, 0.13445783132530167, 0.13518072289156674, 0.1359036144578318, 0.13662650602409687, 0.13734939759036194, 0.138072289156627, 0.13879518072289207, 0.13951807228915714, 0.1402409638554222, 0.14096385542168727, 0.14168674698795233, 0.1424096385542174, 0.14313253012048247, 0.14385542168674753, 0.1445783132530126, 0.14530120481927766, 0.14602409638554273, 0.1467469879518078, 0.14746987951807286, 0.14819277108433793, 0.148915662650603, 0.14963855421686806, 0.15036144578313312, 0.1510843373493982, 0.15180722891566326, 0.15253012048192832, 0.1532530120481934, 0.15397590361445845, 0.15469879518072352, 0.15542168674698859, 0.15614457831325365, 0.15686746987951872, 0.15759036144578378, 0.15831325301204885, 0.15903614457831391, 0.15975903614457898, 0.16048192771084405, 0.1612048192771091, 0.16192771084337418, 0.16265060240963924, 0.1633734939759043, 0.16409638554216938, 0.16481927710843444, 0.1655421686746995, 0.16626506024096457, 0.16698795180722964, 0.1677108433734947, 0.16843373493975977, 0.16915662650602484, 0.1698795180722899, 0.17060240963855497, 0.17132530120482004, 0.1720481927710851, 0.17277108433735017, 0.17349397590361523, 0.1742168674698803, 0.17493975903614536, 0.17566265060241043, 0.1763855421686755, 0.17710843373494056, 0.17783132530120563, 0.1785542168674707, 0.17927710843373576, 0.18], \"y\": [0.13429843672539415, 0.14432436512647825, 0.15500874039177087, 0.16638744454582036, 0.17849775130862747, 0.19137833856510456, 0.2050692975242674, 0.21961213829426568, 0.23504979159459366, 0.2514266063230423, 0.26878834269229296, 0.28718216064952684, 0.3066566032922164, 0.32726157499437947, 0.3490483139601601, 0.3720693589257247, 0.3963785097361747, 0.4220307815316257, 0.44908235228578675, 0.4775905034514054, 0.5076135534798873, 0.5392107839972747, 0.5724423584356356, 0.6073692329378637, 0.6440530593748309, 0.6825560803369111, 0.7229410159870265, 0.765270942689606, 0.8096091633591229, 0.8560190695032047, 0.9045639949686598, 0.9553070614340405, 1.008311015729571, 1.0636380591042676, 1.1213496686009543, 1.1815064107423874, 1.2441677477759725, 1.3093918367704673, 1.3772353219056832, 1.4477531203456346, 1.520998202136932, 1.5970213646277946, 1.6758710019594327, 1.7575928702411245, 1.8422298490842999, 1.9298217002404492, 2.0204048241644976, 2.1140120154117246, 2.2106722178752674, 2.3104102809865084, 2.4132467181368717, 2.51919746874243, 2.6282736655692136, 2.7404814091752465, 2.8558215516145955, 2.9742894918995493, 3.0958749861411974, 3.2205619757980597, 3.34832843806965, 3.4791462631879626, 3.612981164194857, 3.749792625752708, 3.88953389962076, 4.0321520556327135, 4.177588098315362, 4.325777160662072, 4.476648787971198, 4.630127326010071, 4.786132428978578, 4.9445797037054895, 5.105381507070069, 5.268447913627784, 5.433687869631736, 5.60101054785755, 5.77032691461976, 5.941551515867573, 6.114604483031632, 6.2894137511521215, 6.4659174715932, 6.644066589254701, 6.8238275396476675, 7.00518500465595, 7.1881446475721225, 7.372735728567398, 7.559013481830792, 7.74706111610442, 7.936991282371216, 8.12894683733263, 8.323100720516525, 8.519654757949128, 8.718837207903066, 8.920898875818546, 9.126107647426009, 9.33474132240926, 9.547078676236048, 9.7633887350852, 9.983918317480112, 10.208877974899472, 10.438426550064401, 10.672654662760108, 10.911567525125076, 11.155067576844624, 11.402937510628018, 11.654824324460954, 11.91022508414568, 12.168475102630453, 12.428739237319947, 12.69000696969341, 12.951091861220645, 13.210635875449663, 13.467118919747277, 13.718873794921803, 13.964106552163598, 14.20092205149134, 14.427354302778893, 14.641400959171154, 14.841061133623867, 15.02437553283919, 15.18946775889742, 15.334585526136953, 15.458140486317193, 15.55874535359888, 15.635247074580674, 15.686754896896794, 15.712662349175048, 15.712662349175043, 15.686754896896781, 15.635247074580649, 15.558745353598844, 15.458140486317147, 15.334585526136902, 15.189467758897363, 15.024375532839127, 14.841061133623793, 14.641400959171074, 14.427354302778808, 14.20092205149125, 13.964106552163503, 13.718873794921707, 13.46711891974718, 13.210635875449562, 12.951091861220545, 12.690006969693307, 12.428739237319844, 12.168475102630351, 11.910225084145582, 11.654824324460856, 11.402937510627922, 11.155067576844532, 10.911567525124983, 10.672654662760019, 10.438426550064312, 10.208877974899385, 9.983918317480025, 9.763388735085117, 9.54707867623597, 9.33474132240918, 9.126107647425929, 8.920898875818468, 8.718837207902986, 8.519654757949052, 8.323100720516452, 8.128946837332556, 7.9369912823711415, 7.747061116104345, 7.559013481830714, 7.372735728567323, 7.1881446475720425, 7.005185004655869, 6.823827539647587, 6.644066589254618, 6.465917471593115, 6.289413751152036, 6.11460448303155, 5.941551515867489, 5.770326914619677, 5.6010105478574665, 5.433687869631651, 5.2684479136277, 5.105381507069985, 4.944579703705404, 4.7861324289784895, 4.630127326009984, 4.4766487879711105, 4.325777160661985, 4.177588098315277, 4.032152055632628, 3.8895338996206745, 3.7497926257526255, 3.6129811641947724, 3.479146263187879, 3.348328438069565, 3.220561975797978, 3.095874986141115, 2.974289491899469, 2.855821551614515, 2.740481409175168, 2.6282736655691354, 2.5191974687423535, 2.4132467181367963, 2.310410280986435, 2.210672217875195, 2.1140120154116535, 2.020404824164428, 1.9298217002403804, 1.8422298490842335, 1.7575928702410586, 1.6758710019593688, 1.597021364627732, 1.520998202136871, 1.4477531203455754, 1.377235321905625, 1.3093918367704107, 1.2441677477759188, 1.1815064107423336, 1.1213496686009026, 1.0636380591042176, 1.0083110157295225, 0.9553070614339937, 0.9045639949686138, 0.8560190695031611, 0.8096091633590811, 0.7652709426895654, 0.7229410159869866, 0.6825560803368732, 0.6440530593747951, 0.6073692329378285, 0.5724423584356017, 0.539210783997242, 0.5076135534798567, 0.4775905034513755, 0.44908235228575855, 0.42203078153159895, 0.3963785097361488, 0.3720693589257, 0.3490483139601368, 0.3272615749943569, 0.3066566032921953, 0.2871821606495066, 0.26878834269227386, 0.2514266063230241, 0.23504979159457617, 0.21961213829424925, 0.20506929752425151, 0.19137833856508976, 0.17849775130861348, 0.16638744454580706, 0.15500874039175835, 0.14432436512646632, 0.13429843672539415]}],\n                        {\"title\": {\"text\": \"Coupling Length Distribution\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Coupling Distance (m)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Expectation (au)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"54abd5dd-a6d2-4cc2-bfd5-9e8ebecca535\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"54abd5dd-a6d2-4cc2-bfd5-9e8ebecca535\")) {\n                    Plotly.newPlot(\n                        '54abd5dd-a6d2-4cc2-bfd5-9e8ebecca535',\n                        [{\"legendgroup\": \"Length\", \"line\": {\"color\": \"rgba(31, 119, 180, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Length\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"7f8b18ba-4034-419d-ae80-4c9092b3b767\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0], \"y\": [0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.08]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Length\", \"marker\": {\"color\": \"rgba(31, 119, 180, 1.0)\"}, \"mode\": \"markers\", \"name\": \"Length\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"825d046d-3d88-48f6-b7b3-ddf223621396\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0], \"y\": [0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Length\", \"line\": {\"color\": \"rgba(31, 119, 180, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Length\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"1ac49aa2-d6fc-467c-b751-d469324168f3\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0], \"y\": [0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.09999999999999999]}],\n                        {\"title\": {\"text\": \"Coupling Lengths\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Length (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"630b91d2-1c23-43f0-a952-26d720e87aaa\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"630b91d2-1c23-43f0-a952-26d720e87aaa\")) {\n                    Plotly.newPlot(\n                        '630b91d2-1c23-43f0-a952-26d720e87aaa',\n                        [{\"legendgroup\": \"Deviation\", \"line\": {\"color\": \"rgba(255, 127, 14, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Deviation\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"bbb23b5c-de0b-45d7-8f4f-5292a7262293\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0], \"y\": [-3.0, -3.0, -3.0, -3.0, -3.0, -3.0, -3.0, -3.0, -3.0, -3.0, -1.0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Deviation\", \"marker\": {\"color\": \"rgba(255, 127, 14, 1.0)\"}, \"mode\": \"markers\", \"name\": \"Deviation\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"f2204012-1e11-453b-9a21-39f55731e56a\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0], \"y\": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Deviation\", \"line\": {\"color\": \"rgba(255, 127, 14, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Deviation\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"8016e98f-7f2f-49e8-b81e-67a13fe61f16\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0], \"y\": [3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 1.0]}],\n                        {\"title\": {\"text\": \"Coupling Length Median Deviations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Median Deviation (%)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"1e050bda-4512-4ebf-bf4b-aa2aa5fb4cad\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"1e050bda-4512-4ebf-bf4b-aa2aa5fb4cad\")) {\n                    Plotly.newPlot(\n                        '1e050bda-4512-4ebf-bf4b-aa2aa5fb4cad',\n                        [{\"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"58f9b81b-9b52-45b1-83b1-1fc753cbdb3c\", \"x\": [0.10000000000000009, 0.20000000000000018, 0.40000000000000013, 0.6000000000000001, 0.7000000000000002, 0.9000000000000001, 1.1, 1.2000000000000002, 1.4000000000000004, 1.6, 1.7000000000000002, 1.9000000000000004, 2.1, 2.2, 2.4000000000000004, 2.6, 2.7, 2.9000000000000004, 3.1000000000000005, 3.2, 3.4000000000000004, 3.6000000000000005, 3.7, 3.9000000000000004, 4.1000000000000005, 4.2, 4.4, 4.6000000000000005, 4.7], \"y\": [0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.6)\"}, \"mode\": \"markers\", \"name\": \"Rear\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"31854a6e-0f8a-4274-9bc7-84112ca494ff\", \"x\": [0.10000000000000009, 0.20000000000000018, 0.40000000000000013, 0.6000000000000001, 0.7000000000000002, 0.9000000000000001, 1.1, 1.2000000000000002, 1.4000000000000004, 1.6, 1.7000000000000002, 1.9000000000000004, 2.1, 2.2, 2.4000000000000004, 2.6, 2.7, 2.9000000000000004, 3.1000000000000005, 3.2, 3.4000000000000004, 3.6000000000000005, 3.7, 3.9000000000000004, 4.1000000000000005, 4.2, 4.4, 4.6000000000000005, 4.7], \"y\": [0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"cbdf6a84-04fb-4201-ae13-6720de50d6bd\", \"x\": [0.10000000000000009, 0.20000000000000018, 0.40000000000000013, 0.6000000000000001, 0.7000000000000002, 0.9000000000000001, 1.1, 1.2000000000000002, 1.4000000000000004, 1.6, 1.7000000000000002, 1.9000000000000004, 2.1, 2.2, 2.4000000000000004, 2.6, 2.7, 2.9000000000000004, 3.1000000000000005, 3.2, 3.4000000000000004, 3.6000000000000005, 3.7, 3.9000000000000004, 4.1000000000000005, 4.2, 4.4, 4.6000000000000005, 4.7], \"y\": [0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5]}, {\"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"b1550fc8-e423-4f8d-9cb3-572b20bc6145\", \"x\": [0.10000000000000009, 0.20000000000000018, 0.40000000000000013, 0.6000000000000001, 0.7000000000000002, 0.9000000000000001, 1.1, 1.2000000000000002, 1.4000000000000004, 1.6, 1.7000000000000002, 1.9000000000000004, 2.1, 2.2, 2.4000000000000004, 2.6, 2.7, 2.9000000000000004, 3.1000000000000005, 3.2, 3.4000000000000004, 3.6000000000000005, 3.7, 3.9000000000000004, 4.1000000000000005, 4.2, 4.4, 4.6000000000000005, 4.7], \"y\": [0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004, 0.1, 0.30000000000000004, 0.30000000000000004]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.6)\"}, \"mode\": \"markers\", \"name\": \"Forward\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"7211a1a0-1827-452f-b0fa-0d48eb6b5e04\", \"x\": [0.10000000000000009, 0.20000000000000018, 0.40000000000000013, 0.6000000000000001, 0.7000000000000002, 0.9000000000000001, 1.1, 1.2000000000000002, 1.4000000000000004, 1.6, 1.7000000000000002, 1.9000000000000004, 2.1, 2.2, 2.4000000000000004, 2.6, 2.7, 2.9000000000000004, 3.1000000000000005, 3.2, 3.4000000000000004, 3.6000000000000005, 3.7, 3.9000000000000004, 4.1000000000000005, 4.2, 4.4, 4.6000000000000005, 4.7], \"y\": [0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4, 0.2, 0.4, 0.4]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"821a50e4-1db6-4cf4-a987-d6a5e3d63ea0\", \"x\": [0.10000000000000009, 0.20000000000000018, 0.40000000000000013, 0.6000000000000001, 0.7000000000000002, 0.9000000000000001, 1.1, 1.2000000000000002, 1.4000000000000004, 1.6, 1.7000000000000002, 1.9000000000000004, 2.1, 2.2, 2.4000000000000004, 2.6, 2.7, 2.9000000000000004, 3.1000000000000005, 3.2, 3.4000000000000004, 3.6000000000000005, 3.7, 3.9000000000000004, 4.1000000000000005, 4.2, 4.4, 4.6000000000000005, 4.7], \"y\": [0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5, 0.30000000000000004, 0.5, 0.5]}],\n                        {\"title\": {\"text\": \"Coupler Rate of Advancement\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Advance Rate (m/cycle)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"9e139a22-2237-47cb-b12b-74ecec6a2503\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"9e139a22-2237-47cb-b12b-74ecec6a2503\")) {\n                    Plotly.newPlot(\n                        '9e139a22-2237-47cb-b12b-74ecec6a2503',\n                        [{\"legendgroup\": \"Left pes\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"2e3c6c28-d75d-4b66-81be-158af9c0d209\", \"x\": [1.4000000000000004, 2.4000000000000004, 3.4000000000000004, 4.4], \"y\": [0.33, 0.33, 0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Left pes\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Left pes\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"820a37f7-4cc2-4684-8ffb-742d8ce7f473\", \"x\": [1.4000000000000004, 2.4000000000000004, 3.4000000000000004, 4.4], \"y\": [0.35000000000000003, 0.35000000000000003, 0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Left pes\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"d8899dcc-e5b9-4c7d-85d4-fdc9b890245a\", \"x\": [1.4000000000000004, 2.4000000000000004, 3.4000000000000004, 4.4], \"y\": [0.37000000000000005, 0.37000000000000005, 0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Right pes\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"635d5779-ed00-4f98-b8cf-ab61dcce44ec\", \"x\": [0.9000000000000001, 1.9000000000000004, 2.9000000000000004, 3.9000000000000004, 4.9], \"y\": [0.33, 0.33, 0.33, 0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Right pes\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Right pes\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"195bafdc-0cb5-47ad-bf3f-d58d4d1d6ba8\", \"x\": [0.9000000000000001, 1.9000000000000004, 2.9000000000000004, 3.9000000000000004, 4.9], \"y\": [0.35000000000000003, 0.35000000000000003, 0.35000000000000003, 0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Right pes\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"35c1e672-2a94-4e8a-8db1-e4263b002e17\", \"x\": [0.9000000000000001, 1.9000000000000004, 2.9000000000000004, 3.9000000000000004, 4.9], \"y\": [0.37000000000000005, 0.37000000000000005, 0.37000000000000005, 0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Left manus\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"aaede379-d95a-440b-b8d7-d1e215ef5e63\", \"x\": [0.9000000000000001, 1.9000000000000004, 2.9000000000000004, 3.9000000000000004, 4.9], \"y\": [0.33, 0.33, 0.33, 0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left manus\", \"marker\": {\"color\": \"rgba(44, 160, 44, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Left manus\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"ac5e83a6-f5d4-4823-af67-de752a67ad89\", \"x\": [0.9000000000000001, 1.9000000000000004, 2.9000000000000004, 3.9000000000000004, 4.9], \"y\": [0.35000000000000003, 0.35000000000000003, 0.35000000000000003, 0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left manus\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"44ddb133-2fcc-45c5-b6de-0da1b630cb91\", \"x\": [0.9000000000000001, 1.9000000000000004, 2.9000000000000004, 3.9000000000000004, 4.9], \"y\": [0.37000000000000005, 0.37000000000000005, 0.37000000000000005, 0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Right manus\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"8524d2f1-5173-47d0-b17f-726e50972c70\", \"x\": [1.4000000000000004, 2.4000000000000004, 3.4000000000000004, 4.4], \"y\": [0.33, 0.33, 0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right manus\", \"marker\": {\"color\": \"rgba(148, 103, 189, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Right manus\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"fbba4f44-a7b6-4149-a47a-9665e1c9ab14\", \"x\": [1.4000000000000004, 2.4000000000000004, 3.4000000000000004, 4.4], \"y\": [0.35000000000000003, 0.35000000000000003, 0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right manus\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"1e5c0660-a64f-412d-8bc6-39776c96a383\", \"x\": [1.4000000000000004, 2.4000000000000004, 3.4000000000000004, 4.4], \"y\": [0.37000000000000005, 0.37000000000000005, 0.37000000000000005, 0.37000000000000005]}],\n                        {\"title\": {\"text\": \"Stepping Distances\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Distance (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"9bb13dd3-9b57-4219-aa4f-5630c05b65e1\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"9bb13dd3-9b57-4219-aa4f-5630c05b65e1\")) {\n                    Plotly.newPlot(\n                        '9bb13dd3-9b57-4219-aa4f-5630c05b65e1',\n                        [{\"legendgroup\": \"Left\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"44e89bd9-498c-478b-a0b9-086df2cdbd09\", \"x\": [0.0, 0.10000000000000009, 0.20000000000000018, 0.30000000000000004, 0.40000000000000013, 0.5, 0.6000000000000001, 0.7000000000000002, 0.8, 0.9000000000000001, 1.0, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1000000000000005, 3.2, 3.3, 3.4000000000000004, 3.5, 3.6000000000000005, 3.7, 3.8000000000000007, 3.9000000000000004, 4.0, 4.1000000000000005, 4.2, 4.300000000000001, 4.4, 4.5, 4.6000000000000005, 4.7, 4.800000000000001, 4.9, 5.0], \"y\": [0.22, 0.13, 0.049999999999999996, -0.04, 0.06999999999999999, 0.049999999999999996, -0.04, 0.049999999999999996, 0.13, 0.24000000000000002, 0.22, 0.13, 0.049999999999999996, -0.04, 0.06999999999999999, 0.049999999999999996, -0.04, 0.049999999999999996, 0.13999999999999999, 0.24000000000000002, 0.22, 0.13, 0.049999999999999996, -0.04, 0.06999999999999999, 0.049999999999999996, -0.04, 0.049999999999999996, 0.13999999999999999, 0.24000000000000002, 0.22, 0.13, 0.049999999999999996, -0.04, 0.06999999999999999, 0.049999999999999996, -0.04, 0.049999999999999996, 0.13999999999999999, 0.24000000000000002, 0.22, 0.13, 0.049999999999999996, -0.04, 0.06999999999999999, 0.049999999999999996, -0.04, 0.049999999999999996, 0.13999999999999999, 0.24000000000000002, 0.24000000000000002]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left\", \"marker\": {\"color\": \"rgba(44, 160, 44, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Left\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"96bbf279-3b2b-4b10-b647-9980c8e22ac8\", \"x\": [0.0, 0.10000000000000009, 0.20000000000000018, 0.30000000000000004, 0.40000000000000013, 0.5, 0.6000000000000001, 0.7000000000000002, 0.8, 0.9000000000000001, 1.0, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1000000000000005, 3.2, 3.3, 3.4000000000000004, 3.5, 3.6000000000000005, 3.7, 3.8000000000000007, 3.9000000000000004, 4.0, 4.1000000000000005, 4.2, 4.300000000000001, 4.4, 4.5, 4.6000000000000005, 4.7, 4.800000000000001, 4.9, 5.0], \"y\": [0.26, 0.17, 0.09, 0.0, 0.09, 0.09, 0.0, 0.09, 0.17, 0.26, 0.26, 0.17, 0.09, 0.0, 0.09, 0.09, 0.0, 0.09, 0.18, 0.26, 0.26, 0.17, 0.09, 0.0, 0.09, 0.09, 0.0, 0.09, 0.18, 0.26, 0.26, 0.17, 0.09, 0.0, 0.09, 0.09, 0.0, 0.09, 0.18, 0.26, 0.26, 0.17, 0.09, 0.0, 0.09, 0.09, 0.0, 0.09, 0.18, 0.26, 0.26]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"7c4d699f-83ce-4302-a32b-2d6ce4867206\", \"x\": [0.0, 0.10000000000000009, 0.20000000000000018, 0.30000000000000004, 0.40000000000000013, 0.5, 0.6000000000000001, 0.7000000000000002, 0.8, 0.9000000000000001, 1.0, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1000000000000005, 3.2, 3.3, 3.4000000000000004, 3.5, 3.6000000000000005, 3.7, 3.8000000000000007, 3.9000000000000004, 4.0, 4.1000000000000005, 4.2, 4.300000000000001, 4.4, 4.5, 4.6000000000000005, 4.7, 4.800000000000001, 4.9, 5.0], \"y\": [0.3, 0.21000000000000002, 0.13, 0.04, 0.11, 0.13, 0.04, 0.13, 0.21000000000000002, 0.28, 0.3, 0.21000000000000002, 0.13, 0.04, 0.11, 0.13, 0.04, 0.13, 0.22, 0.28, 0.3, 0.21000000000000002, 0.13, 0.04, 0.11, 0.13, 0.04, 0.13, 0.22, 0.28, 0.3, 0.21000000000000002, 0.13, 0.04, 0.11, 0.13, 0.04, 0.13, 0.22, 0.28, 0.3, 0.21000000000000002, 0.13, 0.04, 0.11, 0.13, 0.04, 0.13, 0.22, 0.28, 0.28]}, {\"legendgroup\": \"Right\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"bc18a963-1757-4690-9eef-43146c2aebb6\", \"x\": [0.0, 0.10000000000000009, 0.20000000000000018, 0.30000000000000004, 0.40000000000000013, 0.5, 0.6000000000000001, 0.7000000000000002, 0.8, 0.9000000000000001, 1.0, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1000000000000005, 3.2, 3.3, 3.4000000000000004, 3.5, 3.6000000000000005, 3.7, 3.8000000000000007, 3.9000000000000004, 4.0, 4.1000000000000005, 4.2, 4.300000000000001, 4.4, 4.5, 4.6000000000000005, 4.7, 4.800000000000001, 4.9, 5.0], \"y\": [0.049999999999999996, -0.04, 0.049999999999999996, 0.13999999999999999, 0.24000000000000002, 0.22, 0.13, 0.049999999999999996, -0.04, 0.06999999999999999, 0.049999999999999996, -0.04, 0.049999999999999996, 0.13999999999999999, 0.24000000000000002, 0.22, 0.13, 0.049999999999999996, -0.04, 0.06999999999999999, 0.049999999999999996, -0.04, 0.049999999999999996, 0.13999999999999999, 0.24000000000000002, 0.22, 0.13, 0.049999999999999996, -0.04, 0.06999999999999999, 0.049999999999999996, -0.04, 0.049999999999999996, 0.13, 0.24000000000000002, 0.22, 0.13, 0.049999999999999996, -0.04, 0.06999999999999999, 0.049999999999999996, -0.04, 0.049999999999999996, 0.13999999999999999, 0.24000000000000002, 0.22, 0.13, 0.049999999999999996, -0.04, 0.06999999999999999, 0.06999999999999999]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right\", \"marker\": {\"color\": \"rgba(148, 103, 189, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Right\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"34373654-7972-476c-9d11-a6c82b49b949\", \"x\": [0.0, 0.10000000000000009, 0.20000000000000018, 0.30000000000000004, 0.40000000000000013, 0.5, 0.6000000000000001, 0.7000000000000002, 0.8, 0.9000000000000001, 1.0, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1000000000000005, 3.2, 3.3, 3.4000000000000004, 3.5, 3.6000000000000005, 3.7, 3.8000000000000007, 3.9000000000000004, 4.0, 4.1000000000000005, 4.2, 4.300000000000001, 4.4, 4.5, 4.6000000000000005, 4.7, 4.800000000000001, 4.9, 5.0], \"y\": [0.09, 0.0, 0.09, 0.18, 0.26, 0.26, 0.17, 0.09, 0.0, 0.09, 0.09, 0.0, 0.09, 0.18, 0.26, 0.26, 0.17, 0.09, 0.0, 0.09, 0.09, 0.0, 0.09, 0.18, 0.26, 0.26, 0.17, 0.09, 0.0, 0.09, 0.09, 0.0, 0.09, 0.17, 0.26, 0.26, 0.17, 0.09, 0.0, 0.09, 0.09, 0.0, 0.09, 0.18, 0.26, 0.26, 0.17, 0.09, 0.0, 0.09, 0.09]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"62950878-5c6a-4fec-92e3-42920909e0ce\", \"x\": [0.0, 0.10000000000000009, 0.20000000000000018, 0.30000000000000004, 0.40000000000000013, 0.5, 0.6000000000000001, 0.7000000000000002, 0.8, 0.9000000000000001, 1.0, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1000000000000005, 3.2, 3.3, 3.4000000000000004, 3.5, 3.6000000000000005, 3.7, 3.8000000000000007, 3.9000000000000004, 4.0, 4.1000000000000005, 4.2, 4.300000000000001, 4.4, 4.5, 4.6000000000000005, 4.7, 4.800000000000001, 4.9, 5.0], \"y\": [0.13, 0.04, 0.13, 0.22, 0.28, 0.3, 0.21000000000000002, 0.13, 0.04, 0.11, 0.13, 0.04, 0.13, 0.22, 0.28, 0.3, 0.21000000000000002, 0.13, 0.04, 0.11, 0.13, 0.04, 0.13, 0.22, 0.28, 0.3, 0.21000000000000002, 0.13, 0.04, 0.11, 0.13, 0.04, 0.13, 0.21000000000000002, 0.28, 0.3, 0.21000000000000002, 0.13, 0.04, 0.11, 0.13, 0.04, 0.13, 0.22, 0.28, 0.3, 0.21000000000000002, 0.13, 0.04, 0.11, 0.11]}],\n                        {\"title\": {\"text\": \"Left &amp; Right Separations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Separation (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"948fbb01-4018-4854-835b-0f7e1c7a1aa2\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"948fbb01-4018-4854-835b-0f7e1c7a1aa2\")) {\n                    Plotly.newPlot(\n                        '948fbb01-4018-4854-835b-0f7e1c7a1aa2',\n                        [{\"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"d8ceab2b-ac73-4191-aefd-d82f44ecbaf0\", \"x\": [0.0, 0.10000000000000009, 0.20000000000000018, 0.30000000000000004, 0.40000000000000013, 0.5, 0.6000000000000001, 0.7000000000000002, 0.8, 0.9000000000000001, 1.0, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1000000000000005, 3.2, 3.3, 3.4000000000000004, 3.5, 3.6000000000000005, 3.7, 3.8000000000000007, 3.9000000000000004, 4.0, 4.1000000000000005, 4.2, 4.300000000000001, 4.4, 4.5, 4.6000000000000005, 4.7, 4.800000000000001, 4.9, 5.0], \"y\": [0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.26]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Forward\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"0246c6ca-2059-43aa-83b4-1ad564f14b66\", \"x\": [0.0, 0.10000000000000009, 0.20000000000000018, 0.30000000000000004, 0.40000000000000013, 0.5, 0.6000000000000001, 0.7000000000000002, 0.8, 0.9000000000000001, 1.0, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1000000000000005, 3.2, 3.3, 3.4000000000000004, 3.5, 3.6000000000000005, 3.7, 3.8000000000000007, 3.9000000000000004, 4.0, 4.1000000000000005, 4.2, 4.300000000000001, 4.4, 4.5, 4.6000000000000005, 4.7, 4.800000000000001, 4.9, 5.0], \"y\": [0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"5853e08d-4a8b-45fb-934b-89439644d6f9\", \"x\": [0.0, 0.10000000000000009, 0.20000000000000018, 0.30000000000000004, 0.40000000000000013, 0.5, 0.6000000000000001, 0.7000000000000002, 0.8, 0.9000000000000001, 1.0, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1000000000000005, 3.2, 3.3, 3.4000000000000004, 3.5, 3.6000000000000005, 3.7, 3.8000000000000007, 3.9000000000000004, 4.0, 4.1000000000000005, 4.2, 4.300000000000001, 4.4, 4.5, 4.6000000000000005, 4.7, 4.800000000000001, 4.9, 5.0], \"y\": [0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.28]}, {\"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"ad5b1e90-1986-4632-9cd6-68858206df16\", \"x\": [0.0, 0.10000000000000009, 0.20000000000000018, 0.30000000000000004, 0.40000000000000013, 0.5, 0.6000000000000001, 0.7000000000000002, 0.8, 0.9000000000000001, 1.0, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1000000000000005, 3.2, 3.3, 3.4000000000000004, 3.5, 3.6000000000000005, 3.7, 3.8000000000000007, 3.9000000000000004, 4.0, 4.1000000000000005, 4.2, 4.300000000000001, 4.4, 4.5, 4.6000000000000005, 4.7, 4.800000000000001, 4.9, 5.0], \"y\": [0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.24000000000000002, 0.2, 0.16, 0.2, 0.26, 0.26]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Rear\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"7f96f22a-482f-44b8-b7a1-a754bfa378cb\", \"x\": [0.0, 0.10000000000000009, 0.20000000000000018, 0.30000000000000004, 0.40000000000000013, 0.5, 0.6000000000000001, 0.7000000000000002, 0.8, 0.9000000000000001, 1.0, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1000000000000005, 3.2, 3.3, 3.4000000000000004, 3.5, 3.6000000000000005, 3.7, 3.8000000000000007, 3.9000000000000004, 4.0, 4.1000000000000005, 4.2, 4.300000000000001, 4.4, 4.5, 4.6000000000000005, 4.7, 4.800000000000001, 4.9, 5.0], \"y\": [0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27, 0.22, 0.2, 0.22, 0.27, 0.27]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"51527be2-fd4d-4044-94ac-3a63f83b7bf2\", \"x\": [0.0, 0.10000000000000009, 0.20000000000000018, 0.30000000000000004, 0.40000000000000013, 0.5, 0.6000000000000001, 0.7000000000000002, 0.8, 0.9000000000000001, 1.0, 1.1, 1.2000000000000002, 1.3000000000000003, 1.4000000000000004, 1.5, 1.6, 1.7000000000000002, 1.8000000000000003, 1.9000000000000004, 2.0, 2.1, 2.2, 2.3000000000000003, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1000000000000005, 3.2, 3.3, 3.4000000000000004, 3.5, 3.6000000000000005, 3.7, 3.8000000000000007, 3.9000000000000004, 4.0, 4.1000000000000005, 4.2, 4.300000000000001, 4.4, 4.5, 4.6000000000000005, 4.7, 4.800000000000001, 4.9, 5.0], \"y\": [0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.30000000000000004, 0.24, 0.24000000000000002, 0.24, 0.28, 0.28]}],\n                        {\"title\": {\"text\": \"Forward &amp; Rear Separations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Separation (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div style=\"height:120px\"> </div>"};
+
+}());
\ No newline at end of file
@@ -0,0 +1,5 @@
+(function () {
+
+    window.SIM_DATA = {"data": {"time": {"count": 101, "cycles": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95, 5.0], "support_cycles": [-0.5, -0.44999999999999996, -0.3999999999999999, -0.34999999999999987, -0.2999999999999998, -0.25, -0.19999999999999996, -0.1499999999999999, -0.09999999999999987, -0.04999999999999982, 0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.5500000000000003, 0.6000000000000001, 0.6499999999999999, 0.7000000000000002, 0.75, 0.8000000000000003, 0.8500000000000001, 0.9000000000000004, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.1500000000000004, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.55, 2.6000000000000005, 2.6500000000000004, 2.7, 2.75, 2.8, 2.8500000000000005, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3000000000000007, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.5500000000000007, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5], "steps_per_cycle": 20, "progress": [0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0, 24.0, 25.0, 26.0, 27.0, 28.0, 29.0, 30.0, 31.0, 32.0, 33.0, 34.0, 35.0, 36.0, 37.0, 38.0, 39.0, 40.0, 41.0, 42.0, 43.0, 44.0, 45.0, 46.0, 47.0, 48.0, 49.0, 50.0, 51.0, 52.0, 53.0, 54.0, 55.0, 56.0, 57.0, 58.0, 59.0, 60.0, 61.0, 62.0, 63.0, 64.0, 65.0, 66.0, 67.0, 68.0, 69.0, 70.0, 71.0, 72.0, 73.0, 74.0, 75.0, 76.0, 77.0, 78.0, 79.0, 80.0, 81.0, 82.0, 83.0, 84.0, 85.0, 86.0, 87.0, 88.0, 89.0, 90.0, 91.0, 92.0, 93.0, 94.0, 95.0, 96.0, 97.0, 98.0, 99.0, 100.0]}, "cycles": {"left_pes": [[10, "M"], [10, "F"], [10, "M"], [10, "F"], [10, "M"], [10, "F"], [10, "M"], [10, "F"], [10, "M"], [10, "F"], [1, "M"]], "right_pes": [[10, "F"], [10, "M"], [10, "F"], [10, "M"], [10, "F"], [10, "M"], [10, "F"], [10, "M"], [10, "F"], [10, "M"], [1, "F"]], "left_manus": [[10, "F"], [10, "M"], [10, "F"], [10, "M"], [10, "F"], [10, "M"], [10, "F"], [10, "M"], [10, "F"], [10, "M"], [1, "F"]], "right_manus": [[10, "M"], [10, "F"], [10, "M"], [10, "F"], [10, "M"], [10, "F"], [10, "M"], [10, "F"], [10, "M"], [10, "F"], [1, "M"]]}, "scale": 101.83844158833867, "offset": [0, 0], "markerIds": ["left_pes", "right_pes", "left_manus", "right_manus"], "frames": {"version": 1, "count": 101, "scale": null, "keys": ["time", "support_time", "positions.0.x.0", "positions.0.x.1", "positions.0.x.2", "positions.0.y.0", "positions.0.y.1", "positions.0.y.2", "positions.0.f", "positions.0.tx0.0", "positions.0.tx0.1", "positions.0.ty0.0", "positions.0.ty0.1", "positions.0.tx1.0", "positions.0.tx1.1", "positions.0.ty1.0", "positions.0.ty1.1", "positions.1.x.0", "positions.1.x.1", "positions.1.x.2", "positions.1.y.0", "positions.1.y.1", "positions.1.y.2", "positions.1.f", "positions.1.tx0.0", "positions.1.tx0.1", "positions.1.ty0.0", "positions.1.ty0.1", "positions.1.tx1.0", "positions.1.tx1.1", "positions.1.ty1.0", "positions.1.ty1.1", "positions.2.x.0", "positions.2.x.1", "positions.2.x.2", "positions.2.y.0", "positions.2.y.1", "positions.2.y.2", "positions.2.f", "positions.2.tx0.0", "positions.2.tx0.1", "positions.2.ty0.0", "positions.2.ty0.1", "positions.2.tx1.0", "positions.2.tx1.1", "positions.2.ty1.0", "positions.2.ty1.1", "positions.3.x.0", "positions.3.x.1", "positions.3.x.2", "positions.3.y.0", "positions.3.y.1", "positions.3.y.2", "positions.3.f", "positions.3.tx0.0", "positions.3.tx0.1", "positions.3.ty0.0", "positions.3.ty0.1", "positions.3.tx1.0", "positions.3.tx1.1", "positions.3.ty1.0", "positions.3.ty1.1", "rear_coupler.x.0", "rear_coupler.x.1", "rear_coupler.x.2", "rear_coupler.y.0", "rear_coupler.y.1", "rear_coupler.y.2", "forward_coupler.x.0", "forward_coupler.x.1", "forward_coupler.x.2", "forward_coupler.y.0", "forward_coupler.y.1", "forward_coupler.y.2", "midpoint.x.0", "midpoint.x.1", "midpoint.x.2", "midpoint.y.0", "midpoint.y.1", "midpoint.y.2", "rear_support_box.0.x", "rear_support_box.0.y", "rear_support_box.1.x", "rear_support_box.1.y", "rear_support_box.2.x", "rear_support_box.2.y", "rear_support_box.3.x", "rear_support_box.3.y", "forward_support_box.0.x", "forward_support_box.0.y", "forward_support_box.1.x", "forward_support_box.1.y", "forward_support_box.2.x", "forward_support_box.2.y", "forward_support_box.3.x", "forward_support_box.3.y"], "types": ["f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "label", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "label", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "label", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "label", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8"], "labels": ["M", "F"], "columns": [[0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95, 5.0], [-0.5, -0.44999999999999996, -0.3999999999999999, -0.34999999999999987, -0.2999999999999998, -0.25, -0.19999999999999996, -0.1499999999999999, -0.09999999999999987, -0.04999999999999982, 0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.5500000000000003, 0.6000000000000001, 0.6499999999999999, 0.7000000000000002, 0.75, 0.8000000000000003, 0.8500000000000001, 0.9000000000000004, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.1500000000000004, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.55, 2.6000000000000005, 2.6500000000000004, 2.7, 2.75, 2.8, 2.8500000000000005, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3000000000000007, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.5500000000000007, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5], [0.0, 0.4, 0.8, 1.2000000000000002, 1.5, 1.9000000000000001, 2.3000000000000003, 2.6, 3.0, 3.4000000000000004, 3.74, 3.74, 3.74, 3.74, 3.74, 3.74, 3.74, 3.74, 3.74, 3.74, 3.7, 3.9000000000000004, 4.1000000000000005, 4.2, 4.4, 4.6000000000000005, 4.7, 4.9, 5.1000000000000005, 5.300000000000001, 5.42, 5.42, 5.42, 5.42, 5.42, 5.42, 5.42, 5.42, 5.42, 5.42, 5.4, 5.6000000000000005, 5.800000000000001, 6.0, 6.2, 6.300000000000001, 6.5, 6.7, 6.9, 7.1000000000000005, 7.26, 7.26, 7.26, 7.26, 7.26, 7.26, 7.26, 7.26, 7.26, 7.26, 7.300000000000001, 7.4, 7.6000000000000005, 7.800000000000001, 8.0, 8.200000000000001, 8.4, 8.6, 8.8, 8.9, 9.120000000000001, 9.120000000000001, 9.120000000000001, 9.120000000000001, 9.120000000000001, 9.120000000000001, 9.120000000000001, 9.120000000000001, 9.120000000000001, 9.120000000000001, 9.1, 9.5, 9.9, 10.200000000000001, 10.600000000000001, 11.0, 11.3, 11.700000000000001, 12.100000000000001, 12.5, 12.83, 12.83, 12.83, 12.83, 12.83, 12.83, 12.83, 12.83, 12.83, 12.83, 12.8], [0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.2], [0.049715827755630534, 0.41864007315885166, 0.7875643185620728, 1.1564885639652938, 1.5254128093685149, 1.8943370547717344, 2.263261300174956, 2.632185545578177, 3.0011097909813977, 3.3700340363846193, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.9074397974335957, 4.075921313079351, 4.244402828725107, 4.412884344370864, 4.5813658600166205, 4.7498473756623785, 4.918328891308135, 5.086810406953891, 5.255291922599647, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.607629320038468, 5.791485201831531, 5.9753410836245955, 6.159196965417658, 6.343052847210722, 6.526908729003786, 6.710764610796849, 6.894620492589913, 7.078476374382976, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.448482633182897, 7.6346330101897575, 7.820783387196616, 8.006933764203472, 8.19308414121033, 8.379234518217189, 8.56538489522405, 8.751535272230907, 8.937685649237764, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.494163764017456, 9.864491501790283, 10.234819239563112, 10.60514697733594, 10.975474715108769, 11.345802452881603, 11.716130190654427, 12.086457928427256, 12.456785666200085, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913], [0.64, 0.61, 0.5700000000000001, 0.54, 0.5, 0.46, 0.43, 0.39, 0.36, 0.32, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.28, 0.29, 0.29, 0.29, 0.29, 0.3, 0.3, 0.3, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.32, 0.33, 0.34, 0.35000000000000003, 0.36, 0.37, 0.38, 0.39, 0.4, 0.41000000000000003, 0.41000000000000003, 0.41000000000000003, 0.41000000000000003, 0.41000000000000003, 0.41000000000000003, 0.41000000000000003, 0.41000000000000003, 0.41000000000000003, 0.41000000000000003, 0.41000000000000003, 0.41000000000000003, 0.4, 0.4, 0.4, 0.39, 0.39, 0.39, 0.38, 0.38, 0.37, 0.37, 0.37, 0.37, 0.37, 0.37, 0.37, 0.37, 0.37, 0.37, 0.37, 0.4, 0.42, 0.45, 0.47000000000000003, 0.5, 0.52, 0.55, 0.5700000000000001, 0.59, 0.62, 0.62, 0.62, 0.62, 0.62, 0.62, 0.62, 0.62, 0.62, 0.62, 0.62], [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04], [0.6436430473166519, 0.6077139344182767, 0.5717848215199008, 0.5358557086215257, 0.49992659572315057, 0.4639974828247747, 0.42806836992639963, 0.3921392570280245, 0.35621014412964935, 0.32028103123127344, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.286993676404421, 0.28963543447594264, 0.29227719254746526, 0.2949189506189878, 0.29756070869051043, 0.300202466762032, 0.3028442248335545, 0.30548598290507706, 0.3081277409765988, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.32086973320853557, 0.33096996736894985, 0.34107020152936496, 0.35117043568977935, 0.3612706698501936, 0.3713709040106078, 0.3814711381710222, 0.39157137233143724, 0.4016716064918515, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4080252234841698, 0.40427860631607326, 0.40053198914797694, 0.39678537197988095, 0.39303875481178574, 0.3892921376436893, 0.3855455204755931, 0.3817989033074969, 0.3780522861394009, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.39876720277561406, 0.42322873657992366, 0.4476902703842328, 0.4721518041885421, 0.49661333799285146, 0.521074871797161, 0.5455364056014703, 0.5699979394057797, 0.594459473210089, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0], [-3.9314488693150635, -3.562524623911842, -3.1936003785086213, -2.8246761331054007, -2.4557518877021787, -2.08682764229896, -1.7179033968957382, -1.3489791514925171, -0.9800549060892956, -0.6111306606860749, -0.2610417182121618, -0.2610417182121618, -0.2610417182121618, -0.2610417182121618, -0.2610417182121618, -0.2610417182121618, -0.2610417182121618, -0.2610417182121618, -0.2610417182121618, -0.2610417182121618, -0.2610417182121618, -0.09256020256640429, 0.07592131307935102, 0.2444028287251072, 0.4128843443708643, 0.5813658600166205, 0.7498473756623785, 0.9183288913081347, 1.0868104069538909, 1.255291922599647, 1.4297956522117365, 1.4297956522117365, 1.4297956522117365, 1.4297956522117365, 1.4297956522117365, 1.4297956522117365, 1.4297956522117365, 1.4297956522117365, 1.4297956522117365, 1.4297956522117365, 1.4297956522117365, 1.6136515340048017, 1.7975074157978654, 1.9813632975909292, 2.1652191793839917, 2.3490750611770554, 2.5329309429701197, 2.716786824763183, 2.900642706556246, 3.08449858834931, 3.2623322561760384, 3.2623322561760384, 3.2623322561760384, 3.2623322561760384, 3.2623322561760384, 3.2623322561760384, 3.2623322561760384, 3.2623322561760384, 3.2623322561760384, 3.2623322561760384, 3.2623322561760384, 3.4484826331828966, 3.6346330101897575, 3.8207833871966157, 4.006933764203472, 4.1930841412103295, 4.379234518217189, 4.5653848952240494, 4.751535272230907, 4.937685649237764, 5.13253376909556, 5.13253376909556, 5.13253376909556, 5.13253376909556, 5.13253376909556, 5.13253376909556, 5.13253376909556, 5.13253376909556, 5.13253376909556, 5.13253376909556, 5.13253376909556, 5.502861506868394, 5.87318924464122, 6.243516982414049, 6.613844720186877, 6.984172457959706, 7.354500195732541, 7.724827933505364, 8.095155671278192, 8.465483409051023, 8.465483409051023, 8.465483409051023, 8.465483409051023, 8.465483409051023, 8.465483409051023, 8.465483409051023, 8.465483409051023, 8.465483409051023, 8.465483409051023, 8.465483409051023, 8.465483409051023], [0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4], [1.0313641517177492, 0.9954350388193811, 0.9595059259209981, 0.923576813022623, 0.8876477001242569, 0.8517185872258721, 0.8157894743274969, 0.7798603614291219, 0.7439312485307557, 0.7080021356323708, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.286993676404421, 0.28963543447594264, 0.29227719254746526, 0.2949189506189878, 0.29756070869051043, 0.300202466762032, 0.3028442248335545, 0.30548598290507706, 0.3081277409765988, 0.09135791168407609, 0.09135791168407609, 0.09135791168407609, 0.09135791168407609, 0.09135791168407609, 0.09135791168407609, 0.09135791168407609, 0.09135791168407609, 0.09135791168407609, 0.09135791168407609, 0.09135791168407609, 0.10145814584448493, 0.11155838000488325, 0.12165861416531257, 0.13175884832573048, 0.14185908248614654, 0.1519593166465554, 0.16205955080695736, 0.17215978496738837, 0.18226001912780088, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4080252234841698, 0.40427860631607326, 0.40053198914797694, 0.39678537197988095, 0.39303875481178574, 0.3892921376436893, 0.3855455204755931, 0.3817989033074969, 0.3780522861394009, 0.11066520910826488, 0.11066520910826488, 0.11066520910826488, 0.11066520910826488, 0.11066520910826488, 0.11066520910826488, 0.11066520910826488, 0.11066520910826488, 0.11066520910826488, 0.11066520910826488, 0.11066520910826488, 0.13512674291256915, 0.15958827671688586, 0.18404981052119324, 0.2085113443255025, 0.23297287812981188, 0.2574344119341179, 0.28189594573843074, 0.3063574795427401, 0.33081901334704583, 0.33081901334704583, 0.33081901334704583, 0.33081901334704583, 0.33081901334704583, 0.33081901334704583, 0.33081901334704583, 0.33081901334704583, 0.33081901334704583, 0.33081901334704583, 0.33081901334704583, 0.33081901334704583], [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06], [4.3998047702295455, 4.768729015632767, 5.137653261035988, 5.506577506439209, 5.875501751842428, 6.24442599724565, 6.613350242648871, 6.9822744880520915, 7.351198733455313, 7.720122978858532, 7.907439797433596, 7.907439797433596, 7.907439797433596, 7.907439797433596, 7.907439797433596, 7.907439797433596, 7.907439797433596, 7.907439797433596, 7.907439797433596, 7.907439797433596, 7.907439797433596, 8.075921313079352, 8.244402828725107, 8.412884344370864, 8.581365860016621, 8.749847375662378, 8.918328891308136, 9.08681040695389, 9.255291922599646, 9.423773438245403, 9.601607106072134, 9.601607106072134, 9.601607106072134, 9.601607106072134, 9.601607106072134, 9.601607106072134, 9.601607106072134, 9.601607106072134, 9.601607106072134, 9.601607106072134, 9.601607106072134, 9.785462987865197, 9.969318869658261, 10.153174751451324, 10.337030633244389, 10.520886515037454, 10.704742396830515, 10.888598278623578, 11.072454160416644, 11.256310042209705, 11.448482633182897, 11.448482633182897, 11.448482633182897, 11.448482633182897, 11.448482633182897, 11.448482633182897, 11.448482633182897, 11.448482633182897, 11.448482633182897, 11.448482633182897, 11.448482633182897, 11.634633010189757, 11.820783387196617, 12.006933764203472, 12.19308414121033, 12.379234518217189, 12.56538489522405, 12.751535272230907, 12.937685649237764, 13.123836026244623, 13.48546602116652, 13.48546602116652, 13.48546602116652, 13.48546602116652, 13.48546602116652, 13.48546602116652, 13.48546602116652, 13.48546602116652, 13.48546602116652, 13.48546602116652, 13.48546602116652, 13.855793758939345, 14.226121496712175, 14.596449234485004, 14.966776972257833, 15.337104710030665, 15.70743244780349, 16.07776018557632, 16.44808792334915, 16.818415661121975, 16.818415661121975, 16.818415661121975, 16.818415661121975, 16.818415661121975, 16.818415661121975, 16.818415661121975, 16.818415661121975, 16.818415661121975, 16.818415661121975, 16.818415661121975, 16.818415661121975], [0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.04, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.06, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.03, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.03, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03], [0.21999283001717856, 0.18406371711879554, 0.1481346042204274, 0.1122054913220536, 0.0762763784236678, 0.0403472655253031, 0.004418152626926963, -0.031510960271448674, -0.06744007316983197, -0.10336918606819961, 0.286993676404421, 0.286993676404421, 0.286993676404421, 0.286993676404421, 0.286993676404421, 0.286993676404421, 0.286993676404421, 0.286993676404421, 0.286993676404421, 0.286993676404421, 0.286993676404421, 0.28963543447594264, 0.29227719254746526, 0.2949189506189878, 0.29756070869051043, 0.300202466762032, 0.3028442248335545, 0.30548598290507706, 0.3081277409765988, 0.3107694990481214, 0.5402813205725808, 0.5402813205725808, 0.5402813205725808, 0.5402813205725808, 0.5402813205725808, 0.5402813205725808, 0.5402813205725808, 0.5402813205725808, 0.5402813205725808, 0.5402813205725808, 0.5402813205725808, 0.5503815547329997, 0.5604817888934307, 0.5705820230538315, 0.5806822572142424, 0.5907824913746541, 0.6008827255350744, 0.6109829596955028, 0.6210831938559003, 0.6311834280163167, 0.4080252234841698, 0.4080252234841698, 0.4080252234841698, 0.4080252234841698, 0.4080252234841698, 0.4080252234841698, 0.4080252234841698, 0.4080252234841698, 0.4080252234841698, 0.4080252234841698, 0.4080252234841698, 0.40427860631607326, 0.40053198914797694, 0.39678537197988095, 0.39303875481178574, 0.3892921376436893, 0.3855455204755931, 0.3817989033074969, 0.3780522861394009, 0.37430566897130446, 0.6624076626386544, 0.6624076626386544, 0.6624076626386544, 0.6624076626386544, 0.6624076626386544, 0.6624076626386544, 0.6624076626386544, 0.6624076626386544, 0.6624076626386544, 0.6624076626386544, 0.6624076626386544, 0.6868691964429677, 0.7113307302472709, 0.7357922640515826, 0.7602537978558919, 0.7847153316602, 0.8091768654645133, 0.8336383992688201, 0.8580999330731283, 0.8825614668774413, 0.8825614668774413, 0.8825614668774413, 0.8825614668774413, 0.8825614668774413, 0.8825614668774413, 0.8825614668774413, 0.8825614668774413, 0.8825614668774413, 0.8825614668774413, 0.8825614668774413, 0.8825614668774413], [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04], [0.97, 0.97, 0.97, 0.97, 0.97, 0.97, 0.97, 0.97, 0.97, 0.97, 1.0, 1.2000000000000002, 1.3, 1.5, 1.7000000000000002, 1.9000000000000001, 2.1, 2.3000000000000003, 2.5, 2.6, 2.83, 2.83, 2.83, 2.83, 2.83, 2.83, 2.83, 2.83, 2.83, 2.83, 2.8000000000000003, 3.0, 3.2, 3.4000000000000004, 3.5, 3.7, 3.9000000000000004, 4.1000000000000005, 4.2, 4.4, 4.6000000000000005, 4.6000000000000005, 4.6000000000000005, 4.6000000000000005, 4.6000000000000005, 4.6000000000000005, 4.6000000000000005, 4.6000000000000005, 4.6000000000000005, 4.6000000000000005, 4.6000000000000005, 4.800000000000001, 5.0, 5.1000000000000005, 5.300000000000001, 5.5, 5.7, 5.800000000000001, 6.0, 6.2, 6.36, 6.36, 6.36, 6.36, 6.36, 6.36, 6.36, 6.36, 6.36, 6.36, 6.4, 6.5, 6.7, 6.9, 7.1000000000000005, 7.2, 7.4, 7.6000000000000005, 7.800000000000001, 7.9, 8.1, 8.1, 8.1, 8.1, 8.1, 8.1, 8.1, 8.1, 8.1, 8.1, 8.1, 8.5, 8.8, 9.200000000000001, 9.600000000000001, 9.9, 10.3, 10.700000000000001, 11.100000000000001, 11.4, 11.790000000000001], [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.06], [0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 1.1535347110770082, 1.3400809805262865, 1.5266272499755649, 1.7131735194248436, 1.8997197888741213, 2.086266058323399, 2.272812327772678, 2.4593585972219567, 2.6459048666712346, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 3.0092940432467783, 3.1861369503730437, 3.3629798574993095, 3.5398227646255735, 3.716665671751839, 3.8935085788781048, 4.070351486004369, 4.247194393130636, 4.4240373002569, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.777234450078867, 4.953588692774567, 5.12994293547027, 5.306297178165971, 5.482651420861672, 5.659005663557374, 5.835359906253076, 6.011714148948776, 6.188068391644477, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.538321642335629, 6.712220650331083, 6.8861196583265345, 7.060018666321984, 7.233917674317435, 7.407816682312888, 7.58171569030834, 7.75561469830379, 7.929513706299242, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.472330513726714, 8.84124831315873, 9.210166112590743, 9.579083912022758, 9.948001711454772, 10.316919510886796, 10.68583731031881, 11.054755109750825, 11.423672909182839, 11.792590708614854], [0.18, 0.18, 0.18, 0.18, 0.18, 0.18, 0.18, 0.18, 0.18, 0.18, 0.18, 0.16, 0.14, 0.12, 0.1, 0.08, 0.06, 0.05, 0.03, 0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.02, -0.03, -0.05, -0.06, -0.07, -0.08, -0.09, -0.1, -0.12, -0.13, -0.13, -0.13, -0.13, -0.13, -0.13, -0.13, -0.13, -0.13, -0.13, -0.13, -0.12, -0.12, -0.11, -0.11, -0.11, -0.1, -0.1, -0.09, -0.09, -0.08, -0.08, -0.08, -0.08, -0.08, -0.08, -0.08, -0.08, -0.08, -0.08, -0.08, -0.07, -0.07, -0.06, -0.05, -0.04, -0.03, -0.02, -0.01, 0.0, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.02, 0.02, 0.03, 0.04, 0.04, 0.05, 0.06, 0.07, 0.07, 0.08], [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06], [0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.15795191828182148, 0.13917721842916397, 0.12040251857650561, 0.1016278187238481, 0.08285311887118976, 0.0640784190185314, 0.04530371916587389, 0.026529019313215496, 0.007754319460558046, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.02266452909997768, -0.034308677807855015, -0.04595282651573243, -0.05759697522360968, -0.06924112393148615, -0.08088527263936357, -0.09252942134724079, -0.10417357005511829, -0.11581771876299551, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.12308224611442686, -0.11870262475798071, -0.11432300340153384, -0.10994338204508775, -0.10556376068864165, -0.10118413933219561, -0.09680451797574957, -0.09242489661930264, -0.08804527526285655, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.07449313962744919, -0.06532062534848837, -0.05614811106952722, -0.046975596790566954, -0.0378030825116058, -0.02863056823264487, -0.019458053953683718, -0.010285539674722455, -0.0011130253957623015, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.015316021267133606, 0.022572553651068028, 0.02982908603500245, 0.03708561841893687, 0.044342150802871294, 0.05159868318680505, 0.05885521557073947, 0.0661117479546739, 0.07336828033860843, 0.08062481272254263], [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1], [-3.0129058763953056, -3.0129058763953056, -3.0129058763953056, -3.0129058763953056, -3.0129058763953056, -3.0129058763953056, -3.0129058763953056, -3.0129058763953056, -3.0129058763953056, -3.0129058763953056, -3.0129058763953056, -2.8263596069460286, -2.639813337496749, -2.453267068047472, -2.2667207985981914, -2.080174529148914, -1.8936282596996379, -1.7070819902503573, -1.5205357208010803, -1.3339894513518007, -1.1589059373136932, -1.1589059373136932, -1.1589059373136932, -1.1589059373136932, -1.1589059373136932, -1.1589059373136932, -1.1589059373136932, -1.1589059373136932, -1.1589059373136932, -1.1589059373136932, -1.1589059373136932, -0.9820630301874274, -0.805220123061162, -0.6283772159348961, -0.451534308808633, -0.2746914016823667, -0.0978484945561009, 0.07899441257016315, 0.2558373196964303, 0.4326802268226939, 0.6008802073831641, 0.6008802073831641, 0.6008802073831641, 0.6008802073831641, 0.6008802073831641, 0.6008802073831641, 0.6008802073831641, 0.6008802073831641, 0.6008802073831641, 0.6008802073831641, 0.6008802073831641, 0.7772344500788666, 0.9535886927745674, 1.12994293547027, 1.3062971781659707, 1.4826514208616723, 1.659005663557374, 1.8353599062530757, 2.0117141489487764, 2.188068391644477, 2.369975376715729, 2.369975376715729, 2.369975376715729, 2.369975376715729, 2.369975376715729, 2.369975376715729, 2.369975376715729, 2.369975376715729, 2.369975376715729, 2.369975376715729, 2.369975376715729, 2.5438743847111795, 2.7177733927066337, 2.8916724007020846, 3.0655714086975347, 3.2394704166929853, 3.4133694246884394, 3.5872684326838917, 3.76116744067934, 3.9350664486747933, 4.104186290411731, 4.104186290411731, 4.104186290411731, 4.104186290411731, 4.104186290411731, 4.104186290411731, 4.104186290411731, 4.104186290411731, 4.104186290411731, 4.104186290411731, 4.104186290411731, 4.473104089843752, 4.842021889275768, 5.210939688707781, 5.579857488139797, 5.94877528757181, 6.317693087003835, 6.686610886435848, 7.055528685867864, 7.424446485299877, 7.424446485299877], [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4], [0.5772777601475323, 0.5772777601475323, 0.5772777601475323, 0.5772777601475323, 0.5772777601475323, 0.5772777601475323, 0.5772777601475323, 0.5772777601475323, 0.5772777601475323, 0.5772777601475323, 0.5772777601475323, 0.5585030602948545, 0.5397283604422165, 0.5209536605895386, 0.5021789607369006, 0.48340426088424227, 0.46462956103156444, 0.44585486117892636, 0.42708016132624854, 0.4083054614736105, 0.25178888951049405, 0.25178888951049405, 0.25178888951049405, 0.25178888951049405, 0.25178888951049405, 0.25178888951049405, 0.25178888951049405, 0.25178888951049405, 0.25178888951049405, 0.25178888951049405, 0.25178888951049405, 0.24014474080261666, 0.22850059209473933, 0.2168564433868619, 0.20521229467896518, 0.1935681459711082, 0.181923997263229, 0.17027984855535355, 0.15863569984747605, 0.14699155113959883, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.12308224611442686, -0.11870262475798071, -0.11432300340153384, -0.10994338204508775, -0.10556376068864165, -0.10118413933219561, -0.09680451797574957, -0.09242489661930264, -0.08804527526285655, -0.2943576235125629, -0.2943576235125629, -0.2943576235125629, -0.2943576235125629, -0.2943576235125629, -0.2943576235125629, -0.2943576235125629, -0.2943576235125629, -0.2943576235125629, -0.2943576235125629, -0.2943576235125629, -0.2851851092335893, -0.27601259495463915, -0.26684008067566023, -0.25766756639671773, -0.24849505211774944, -0.23932253783879562, -0.2301500235598398, -0.22097750928085014, -0.2118049950019166, -0.07060441971723598, -0.07060441971723598, -0.07060441971723598, -0.07060441971723598, -0.07060441971723598, -0.07060441971723598, -0.07060441971723598, -0.07060441971723598, -0.07060441971723598, -0.07060441971723598, -0.07060441971723598, -0.06334788733329956, -0.05609135494936514, -0.048834822565430716, -0.041578290181496294, -0.03432175779755299, -0.027065225413628116, -0.019808693029693694, -0.012552160645761049, -0.005295628261822963, -0.005295628261822963], [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06], [5.133429029100044, 5.133429029100044, 5.133429029100044, 5.133429029100044, 5.133429029100044, 5.133429029100044, 5.133429029100044, 5.133429029100044, 5.133429029100044, 5.133429029100044, 5.133429029100044, 5.319975298549323, 5.5065215679986, 5.693067837447881, 5.879614106897156, 6.066160376346434, 6.2527066457957154, 6.439252915244992, 6.625799184694271, 6.812345454143548, 7.000651116680984, 7.000651116680984, 7.000651116680984, 7.000651116680984, 7.000651116680984, 7.000651116680984, 7.000651116680984, 7.000651116680984, 7.000651116680984, 7.000651116680984, 7.000651116680984, 7.177494023807249, 7.354336930933515, 7.53117983805978, 7.708022745186046, 7.88486565231231, 8.061708559438575, 8.238551466564841, 8.415394373691106, 8.59223728081737, 8.777234450078867, 8.777234450078867, 8.777234450078867, 8.777234450078867, 8.777234450078867, 8.777234450078867, 8.777234450078867, 8.777234450078867, 8.777234450078867, 8.777234450078867, 8.777234450078867, 8.953588692774566, 9.12994293547027, 9.30629717816597, 9.482651420861671, 9.659005663557373, 9.835359906253075, 10.011714148948776, 10.188068391644478, 10.364422634340178, 10.532768899960079, 10.532768899960079, 10.532768899960079, 10.532768899960079, 10.532768899960079, 10.532768899960079, 10.532768899960079, 10.532768899960079, 10.532768899960079, 10.532768899960079, 10.532768899960079, 10.706667907955532, 10.880566915950983, 11.054465923946434, 11.228364931941883, 11.402263939937338, 11.57616294793279, 11.750061955928238, 11.923960963923692, 12.097859971919142, 12.471556937609677, 12.471556937609677, 12.471556937609677, 12.471556937609677, 12.471556937609677, 12.471556937609677, 12.471556937609677, 12.471556937609677, 12.471556937609677, 12.471556937609677, 12.471556937609677, 12.840474737041692, 13.209392536473704, 13.57831033590572, 13.947228135337735, 14.316145934769757, 14.685063734201773, 15.053981533633788, 15.4228993330658, 15.791817132497815, 15.791817132497815], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.03, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.06, 0.06], [-0.24259922373123088, -0.24259922373123088, -0.24259922373123088, -0.24259922373123088, -0.24259922373123088, -0.24259922373123088, -0.24259922373123088, -0.24259922373123088, -0.24259922373123088, -0.24259922373123088, -0.24259922373123088, -0.26137392358386985, -0.28014862343654634, -0.2989233232891848, -0.317698023141863, -0.3364727229945215, -0.355247422847159, -0.37402212269983615, -0.39279682255247556, -0.41157152240515266, -0.28547379900257175, -0.28547379900257175, -0.28547379900257175, -0.28547379900257175, -0.28547379900257175, -0.28547379900257175, -0.28547379900257175, -0.28547379900257175, -0.28547379900257175, -0.28547379900257175, -0.28547379900257175, -0.2971179477104485, -0.3087620964183272, -0.3204062451262033, -0.3320503938340603, -0.3436945425419583, -0.35533869124983375, -0.3669828399577129, -0.37862698866558914, -0.39027113737346636, -0.12308224611442686, -0.12308224611442686, -0.12308224611442686, -0.12308224611442686, -0.12308224611442686, -0.12308224611442686, -0.12308224611442686, -0.12308224611442686, -0.12308224611442686, -0.12308224611442686, -0.12308224611442686, -0.11870262475798071, -0.11432300340153384, -0.10994338204508775, -0.10556376068864165, -0.10118413933219561, -0.09680451797574957, -0.09242489661930264, -0.08804527526285655, -0.0836656539064104, 0.13619882997870367, 0.13619882997870367, 0.13619882997870367, 0.13619882997870367, 0.13619882997870367, 0.13619882997870367, 0.13619882997870367, 0.13619882997870367, 0.13619882997870367, 0.13619882997870367, 0.13619882997870367, 0.14537134425765239, 0.1545438585366233, 0.16371637281556645, 0.17288888709454578, 0.18206140137349844, 0.1912339156524668, 0.20040642993143276, 0.20957894421036533, 0.2187514584893531, 0.09397992986756795, 0.09397992986756795, 0.09397992986756795, 0.09397992986756795, 0.09397992986756795, 0.09397992986756795, 0.09397992986756795, 0.09397992986756795, 0.09397992986756795, 0.09397992986756795, 0.09397992986756795, 0.10123646225150111, 0.10849299463543591, 0.11574952701936995, 0.12300605940330475, 0.13026259178722902, 0.13751912417117293, 0.144775656555107, 0.15203218893904308, 0.15928872132297328, 0.15928872132297328], [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06], [0.44, 0.44, 0.44, 0.44, 0.44, 0.44, 0.44, 0.44, 0.44, 0.44, 0.4, 0.8, 1.2000000000000002, 1.5, 1.9000000000000001, 2.3000000000000003, 2.6, 3.0, 3.4000000000000004, 3.7, 4.08, 4.08, 4.08, 4.08, 4.08, 4.08, 4.08, 4.08, 4.08, 4.08, 4.1000000000000005, 4.6000000000000005, 5.1000000000000005, 5.7, 6.2, 6.7, 7.300000000000001, 7.800000000000001, 8.3, 8.8, 9.370000000000001, 9.370000000000001, 9.370000000000001, 9.370000000000001, 9.370000000000001, 9.370000000000001, 9.370000000000001, 9.370000000000001, 9.370000000000001, 9.370000000000001, 9.4, 9.700000000000001, 10.100000000000001, 10.4, 10.8, 11.200000000000001, 11.5, 11.9, 12.200000000000001, 12.600000000000001, 12.94, 12.94, 12.94, 12.94, 12.94, 12.94, 12.94, 12.94, 12.94, 12.94, 12.9, 13.100000000000001, 13.3, 13.5, 13.700000000000001, 13.9, 14.100000000000001, 14.3, 14.5, 14.700000000000001, 14.88, 14.88, 14.88, 14.88, 14.88, 14.88, 14.88, 14.88, 14.88, 14.88, 14.9, 15.4, 15.9, 16.5, 17.0, 17.5, 18.0, 18.6, 19.1, 19.6, 20.16], [0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.03], [0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.8013605815159166, 1.1658630219492043, 1.530365462382492, 1.89486790281578, 2.259370343249066, 2.623872783682354, 2.988375224115642, 3.3528776645489295, 3.7173801049822175, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.611013241000917, 5.140143936586326, 5.66927463217174, 6.19840532775715, 6.727536023342558, 7.256666718927973, 7.7857974145133815, 8.314928110098794, 8.844058805684204, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.730227019642804, 10.087264538015992, 10.444302056389182, 10.801339574762371, 11.15837709313556, 11.515414611508751, 11.872452129881937, 12.22948964825513, 12.586527166628318, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 13.136938385141292, 13.33031208528108, 13.523685785420867, 13.71705948556065, 13.910433185700436, 14.103806885840223, 14.29718058598001, 14.490554286119796, 14.68392798625958, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 15.405189629101626, 15.93307757180388, 16.46096551450613, 16.98885345720839, 17.516741399910643, 18.044629342612904, 18.57251728531516, 19.10040522801741, 19.628293170719665, 20.156181113421916], [0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.76, 0.72, 0.67, 0.63, 0.59, 0.55, 0.5, 0.46, 0.42, 0.38, 0.38, 0.38, 0.38, 0.38, 0.38, 0.38, 0.38, 0.38, 0.38, 0.38, 0.4, 0.42, 0.45, 0.47000000000000003, 0.49, 0.52, 0.54, 0.56, 0.59, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.62, 0.64, 0.66, 0.67, 0.6900000000000001, 0.71, 0.72, 0.74, 0.75, 0.77, 0.77, 0.77, 0.77, 0.77, 0.77, 0.77, 0.77, 0.77, 0.77, 0.77, 0.78, 0.78, 0.79, 0.79, 0.8, 0.8, 0.81, 0.81, 0.8200000000000001, 0.8200000000000001, 0.8200000000000001, 0.8200000000000001, 0.8200000000000001, 0.8200000000000001, 0.8200000000000001, 0.8200000000000001, 0.8200000000000001, 0.8200000000000001, 0.8200000000000001, 0.8200000000000001, 0.79, 0.76, 0.74, 0.71, 0.68, 0.65, 0.62, 0.59, 0.5700000000000001, 0.54], [0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03], [0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.7578672310284514, 0.7155001339107827, 0.6731330367931141, 0.6307659396754455, 0.5883988425577771, 0.5460317454401085, 0.5036646483224397, 0.4612975512047712, 0.4189304540871025, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.39975186682452907, 0.42294037667962436, 0.4461288865347193, 0.46931739638981396, 0.49250590624490853, 0.5156944161000042, 0.5388829259550989, 0.5620714358101939, 0.5852599456652893, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.6246413698323309, 0.6408342841442761, 0.6570271984562233, 0.6732201127681705, 0.6894130270801178, 0.7056059413920629, 0.7217988557040104, 0.7379917700159573, 0.7541846843279028, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7753386564150051, 0.7802997141901618, 0.7852607719653169, 0.7902218297404722, 0.795182887515627, 0.8001439452907839, 0.805105003065939, 0.8100660608410941, 0.815027118616251, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.7918399979498123, 0.7636918195082174, 0.7355436410666241, 0.7073954626250292, 0.6792472841834358, 0.6510991057418403, 0.6229509273002467, 0.5948027488586518, 0.5666545704170587, 0.5385063919754636], [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1], [-3.5363925203895525, -3.5363925203895525, -3.5363925203895525, -3.5363925203895525, -3.5363925203895525, -3.5363925203895525, -3.5363925203895525, -3.5363925203895525, -3.5363925203895525, -3.5363925203895525, -3.5363925203895525, -3.171890079956264, -2.807387639522977, -2.442885199089689, -2.078382758656401, -1.713880318223115, -1.3493778777898267, -0.9848754373565392, -0.6203729969232512, -0.25587055648996326, 0.08571806990420683, 0.08571806990420683, 0.08571806990420683, 0.08571806990420683, 0.08571806990420683, 0.08571806990420683, 0.08571806990420683, 0.08571806990420683, 0.08571806990420683, 0.08571806990420683, 0.08188254541550322, 0.6110132410009168, 1.140143936586326, 1.6692746321717404, 2.1984053277571496, 2.727536023342558, 3.256666718927973, 3.7857974145133815, 4.314928110098794, 4.847894330172908, 5.377297052247956, 5.377297052247956, 5.377297052247956, 5.377297052247956, 5.377297052247956, 5.377297052247956, 5.377297052247956, 5.377297052247956, 5.377297052247956, 5.377297052247956, 5.377297052247956, 5.7343345706211455, 6.091372088994335, 6.448409607367525, 6.805447125740715, 7.162484644113901, 7.519522162487094, 7.8765596808602805, 8.233597199233472, 8.590634717606662, 8.943564685001506, 8.943564685001506, 8.943564685001506, 8.943564685001506, 8.943564685001506, 8.943564685001506, 8.943564685001506, 8.943564685001506, 8.943564685001506, 8.943564685001506, 8.943564685001506, 9.136938385141292, 9.33031208528108, 9.523685785420867, 9.71705948556065, 9.910433185700436, 10.103806885840223, 10.29718058598001, 10.490554286119796, 10.68392798625958, 10.882976115787244, 10.882976115787244, 10.882976115787244, 10.882976115787244, 10.882976115787244, 10.882976115787244, 10.882976115787244, 10.882976115787244, 10.882976115787244, 10.882976115787244, 10.882976115787244, 11.410864058489505, 11.938752001191759, 12.466639943894013, 12.994527886596268, 13.522415829298524, 14.050303772000783, 14.578191714703042, 15.10607965740529, 15.633967600107546, 15.633967600107546], [0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5], [1.2620559182768503, 1.2620559182768503, 1.2620559182768503, 1.2620559182768503, 1.2620559182768503, 1.2620559182768503, 1.2620559182768503, 1.2620559182768503, 1.2620559182768503, 1.2620559182768503, 1.2620559182768503, 1.2196888211591834, 1.1773217240415128, 1.1349546269238442, 1.0925875298061756, 1.0502204326885072, 1.0078533355708403, 0.9654862384531699, 0.9231191413355031, 0.8807520442178345, 0.20143630405776572, 0.20143630405776572, 0.20143630405776572, 0.20143630405776572, 0.20143630405776572, 0.20143630405776572, 0.20143630405776572, 0.20143630405776572, 0.20143630405776572, 0.20143630405776572, 0.376563356969434, 0.39975186682452907, 0.42294037667962436, 0.4461288865347193, 0.46931739638981396, 0.49250590624490853, 0.5156944161000042, 0.5388829259550989, 0.5620714358101939, 0.41013289275362275, 0.4272205993511317, 0.4272205993511317, 0.4272205993511317, 0.4272205993511317, 0.4272205993511317, 0.4272205993511317, 0.4272205993511317, 0.4272205993511317, 0.4272205993511317, 0.4272205993511317, 0.4272205993511317, 0.44341351366309634, 0.4596064279750203, 0.47579934228696746, 0.49199225659891294, 0.508185170910885, 0.5243780852228017, 0.5405709995347598, 0.5567639138467193, 0.572956828158647, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7753386564150051, 0.7802997141901618, 0.7852607719653169, 0.7902218297404722, 0.795182887515627, 0.8001439452907839, 0.805105003065939, 0.8100660608410941, 0.815027118616251, 1.0329746453375754, 1.0329746453375754, 1.0329746453375754, 1.0329746453375754, 1.0329746453375754, 1.0329746453375754, 1.0329746453375754, 1.0329746453375754, 1.0329746453375754, 1.0329746453375754, 1.0329746453375754, 1.0048264668959903, 0.9766782884543848, 0.9485301100128003, 0.9203819315711947, 0.8922337531296156, 0.8640855746880076, 0.8359373962464265, 0.8077892178048156, 0.7796410393632403, 0.7796410393632403], [0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03], [4.774611242988097, 4.774611242988097, 4.774611242988097, 4.774611242988097, 4.774611242988097, 4.774611242988097, 4.774611242988097, 4.774611242988097, 4.774611242988097, 4.774611242988097, 4.774611242988097, 5.139113683421385, 5.503616123854673, 5.868118564287961, 6.232621004721247, 6.597123445154535, 6.961625885587823, 7.32612832602111, 7.690630766454398, 8.055133206887684, 8.607177716512213, 8.607177716512213, 8.607177716512213, 8.607177716512213, 8.607177716512213, 8.607177716512213, 8.607177716512213, 8.607177716512213, 8.607177716512213, 8.607177716512213, 8.611013241000917, 9.140143936586327, 9.66927463217174, 10.19840532775715, 10.727536023342559, 11.256666718927974, 11.785797414513382, 12.314928110098794, 12.844058805684204, 13.369353976780909, 13.72611946866446, 13.72611946866446, 13.72611946866446, 13.72611946866446, 13.72611946866446, 13.72611946866446, 13.72611946866446, 13.72611946866446, 13.72611946866446, 13.72611946866446, 13.72611946866446, 14.08315698703765, 14.440194505410838, 14.797232023784028, 15.154269542157216, 15.51130706053041, 15.868344578903594, 16.22538209727679, 16.582419615649975, 16.939457134023165, 17.136938385141292, 17.136938385141292, 17.136938385141292, 17.136938385141292, 17.136938385141292, 17.136938385141292, 17.136938385141292, 17.136938385141292, 17.136938385141292, 17.136938385141292, 17.136938385141292, 17.33031208528108, 17.523685785420867, 17.71705948556065, 17.910433185700434, 18.10380688584022, 18.29718058598001, 18.490554286119796, 18.68392798625958, 18.877301686399363, 19.399515199713747, 19.399515199713747, 19.399515199713747, 19.399515199713747, 19.399515199713747, 19.399515199713747, 19.399515199713747, 19.399515199713747, 19.399515199713747, 19.399515199713747, 19.399515199713747, 19.927403142416, 20.45529108511825, 20.98317902782051, 21.511066970522762, 22.038954913225023, 22.56684285592728, 23.09473079862953, 23.622618741331785, 24.150506684034035, 24.150506684034035], [0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.04, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.03, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.03, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.04, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.03, 0.03], [0.2960456408977206, 0.2960456408977206, 0.2960456408977206, 0.2960456408977206, 0.2960456408977206, 0.2960456408977206, 0.2960456408977206, 0.2960456408977206, 0.2960456408977206, 0.2960456408977206, 0.2960456408977206, 0.2536785437800506, 0.21131144666238322, 0.16894434954471488, 0.12657725242704665, 0.08421015530937787, 0.041843058191707916, -0.0005240389259594247, -0.04289113604362871, -0.08525823316129821, 0.5748789197361973, 0.5748789197361973, 0.5748789197361973, 0.5748789197361973, 0.5748789197361973, 0.5748789197361973, 0.5748789197361973, 0.5748789197361973, 0.5748789197361973, 0.5748789197361973, 0.39975186682452907, 0.42294037667962436, 0.4461288865347193, 0.46931739638981396, 0.49250590624490853, 0.5156944161000042, 0.5388829259550989, 0.5620714358101939, 0.5852599456652893, 0.783575508432051, 0.8058692260015828, 0.8058692260015828, 0.8058692260015828, 0.8058692260015828, 0.8058692260015828, 0.8058692260015828, 0.8058692260015828, 0.8058692260015828, 0.8058692260015828, 0.8058692260015828, 0.8058692260015828, 0.8220621403135113, 0.8382550546254786, 0.854447968937427, 0.8706408832493753, 0.886833797561295, 0.9030267118732712, 0.9192196261852084, 0.9354125404971404, 0.9516054548091047, 0.7753386564150051, 0.7753386564150051, 0.7753386564150051, 0.7753386564150051, 0.7753386564150051, 0.7753386564150051, 0.7753386564150051, 0.7753386564150051, 0.7753386564150051, 0.7753386564150051, 0.7753386564150051, 0.7802997141901618, 0.7852607719653169, 0.7902218297404722, 0.795182887515627, 0.8001439452907839, 0.805105003065939, 0.8100660608410941, 0.815027118616251, 0.8199881763914063, 0.578853529003644, 0.578853529003644, 0.578853529003644, 0.578853529003644, 0.578853529003644, 0.578853529003644, 0.578853529003644, 0.578853529003644, 0.578853529003644, 0.578853529003644, 0.578853529003644, 0.5507053505620395, 0.5225571721204572, 0.4944089936788527, 0.4662608152372697, 0.43811263679566026, 0.4099644583540803, 0.38181627991247247, 0.3536681014708942, 0.32551992302928257, 0.32551992302928257], [0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.03, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.03, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03], [1.3, 1.5, 1.7000000000000002, 1.9000000000000001, 2.1, 2.2, 2.4000000000000004, 2.6, 2.8000000000000003, 3.0, 3.18, 3.18, 3.18, 3.18, 3.18, 3.18, 3.18, 3.18, 3.18, 3.18, 3.2, 3.4000000000000004, 3.5, 3.7, 3.9000000000000004, 4.1000000000000005, 4.3, 4.5, 4.6000000000000005, 4.800000000000001, 5.01, 5.01, 5.01, 5.01, 5.01, 5.01, 5.01, 5.01, 5.01, 5.01, 5.0, 5.2, 5.4, 5.5, 5.7, 5.9, 6.0, 6.2, 6.4, 6.6000000000000005, 6.73, 6.73, 6.73, 6.73, 6.73, 6.73, 6.73, 6.73, 6.73, 6.73, 6.7, 6.9, 7.1000000000000005, 7.2, 7.4, 7.6000000000000005, 7.800000000000001, 7.9, 8.1, 8.3, 8.46, 8.46, 8.46, 8.46, 8.46, 8.46, 8.46, 8.46, 8.46, 8.46, 8.5, 8.8, 9.200000000000001, 9.600000000000001, 10.0, 10.3, 10.700000000000001, 11.100000000000001, 11.4, 11.8, 12.19, 12.19, 12.19, 12.19, 12.19, 12.19, 12.19, 12.19, 12.19, 12.19, 12.200000000000001], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.5], [1.2997722462714665, 1.4875925190649426, 1.675412791858419, 1.8632330646518949, 2.0510533374453708, 2.238873610238846, 2.4266938830323217, 2.6145141558257983, 2.8023344286192744, 2.9901547014127505, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.361670116512837, 3.545365258819446, 3.7290604011260555, 3.9127555434326657, 4.096450685739275, 4.280145828045886, 4.4638409703524955, 4.647536112659107, 4.831231254965715, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.1863949750573655, 5.357863552842405, 5.529332130627447, 5.700800708412485, 5.8722692861975245, 6.043737863982566, 6.215206441767605, 6.386675019552646, 6.558143597337685, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.902979355679142, 7.076346536235563, 7.249713716791979, 7.423080897348398, 7.596448077904815, 7.7698152584612314, 7.943182439017652, 8.116549619574068, 8.289916800130486, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.83615972514813, 9.209035469609352, 9.581911214070573, 9.954786958531797, 10.327662702993017, 10.700538447454246, 11.073414191915466, 11.44628993637669, 11.81916568083791, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132], [-0.05, -0.08, -0.1, -0.12, -0.14, -0.16, -0.18, -0.21, -0.23, -0.25, -0.27, -0.27, -0.27, -0.27, -0.27, -0.27, -0.27, -0.27, -0.27, -0.27, -0.27, -0.27, -0.27, -0.27, -0.27, -0.26, -0.26, -0.26, -0.26, -0.26, -0.26, -0.26, -0.26, -0.26, -0.26, -0.26, -0.26, -0.26, -0.26, -0.26, -0.26, -0.26, -0.25, -0.25, -0.25, -0.25, -0.24, -0.24, -0.24, -0.23, -0.23, -0.23, -0.23, -0.23, -0.23, -0.23, -0.23, -0.23, -0.23, -0.23, -0.23, -0.23, -0.22, -0.22, -0.21, -0.21, -0.21, -0.2, -0.2, -0.19, -0.19, -0.19, -0.19, -0.19, -0.19, -0.19, -0.19, -0.19, -0.19, -0.19, -0.19, -0.17, -0.15, -0.13, -0.11, -0.1, -0.08, -0.06, -0.04, -0.02, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04], [-0.05339278427835609, -0.07506177428215179, -0.0967307642859484, -0.11839975428974409, -0.1400687442935407, -0.16173773429733634, -0.18340672430113203, -0.20507571430492863, -0.22674470430872434, -0.24841369431252094, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.269036408561898, -0.26799013280747835, -0.26694385705305956, -0.26589758129864094, -0.2648513055442213, -0.2638050297898027, -0.26275875403538396, -0.26171247828096444, -0.2606662025265457, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.2566998527361684, -0.2537797787002106, -0.2508597046642521, -0.24793963062829344, -0.24501955659233476, -0.24209948255637714, -0.23917940852041852, -0.2362593344844599, -0.23333926044850223, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2263178810205334, -0.2222165756285237, -0.21811527023651361, -0.21401396484450352, -0.20991265945249343, -0.20581135406048334, -0.20171004866847364, -0.19760874327646344, -0.19350743788445357, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.17073317899040996, -0.15206022548837705, -0.13338727198634315, -0.11471431848431002, -0.09604136498227711, -0.07736841148024376, -0.05869545797821085, -0.040022504476176834, -0.021349550974143927, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977], [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0], [-2.673869712101916, -2.486049439308438, -2.2982291665149637, -2.1104088937214858, -1.9225886209280119, -1.7347683481345366, -1.5469480753410587, -1.3591278025475844, -1.171307529754106, -0.9834872569606321, -0.8220250257937738, -0.8220250257937738, -0.8220250257937738, -0.8220250257937738, -0.8220250257937738, -0.8220250257937738, -0.8220250257937738, -0.8220250257937738, -0.8220250257937738, -0.8220250257937738, -0.8220250257937738, -0.6383298834871631, -0.4546347411805538, -0.2709395988739445, -0.08724445656733426, 0.09645068573927507, 0.28014582804588617, 0.4638409703524955, 0.6475361126591066, 0.831231254965715, 1.0149263972723253, 1.0149263972723253, 1.0149263972723253, 1.0149263972723253, 1.0149263972723253, 1.0149263972723253, 1.0149263972723253, 1.0149263972723253, 1.0149263972723253, 1.0149263972723253, 1.0149263972723253, 1.1863949750573655, 1.3578635528424048, 1.5293321306274468, 1.7008007084124852, 1.8722692861975245, 2.0437378639825656, 2.215206441767605, 2.386675019552646, 2.5581435973376854, 2.7296121751227247, 2.7296121751227247, 2.7296121751227247, 2.7296121751227247, 2.7296121751227247, 2.7296121751227247, 2.7296121751227247, 2.7296121751227247, 2.7296121751227247, 2.7296121751227247, 2.7296121751227247, 2.9029793556791423, 3.0763465362355626, 3.2497137167919794, 3.423080897348398, 3.5964480779048147, 3.7698152584612314, 3.9431824390176518, 4.116549619574068, 4.289916800130486, 4.468290222759913, 4.468290222759913, 4.468290222759913, 4.468290222759913, 4.468290222759913, 4.468290222759913, 4.468290222759913, 4.468290222759913, 4.468290222759913, 4.468290222759913, 4.468290222759913, 4.841165967221139, 5.214041711682361, 5.586917456143581, 5.959793200604805, 6.332668945066025, 6.705544689527255, 7.078420433988475, 7.451296178449699, 7.824171922910919, 7.824171922910919, 7.824171922910919, 7.824171922910919, 7.824171922910919, 7.824171922910919, 7.824171922910919, 7.824171922910919, 7.824171922910919, 7.824171922910919, 7.824171922910919, 7.824171922910919], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4], [0.40504978208579345, 0.3833807920820172, 0.3617118020782029, 0.3400428120744249, 0.3183738220706106, 0.29670483206681497, 0.27503584206303694, 0.2533668520592227, 0.23169786205544463, 0.21002887205163037, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.269036408561898, -0.26799013280747835, -0.26694385705305956, -0.26589758129864094, -0.2648513055442213, -0.2638050297898027, -0.26275875403538396, -0.26171247828096444, -0.2606662025265457, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.2566998527361684, -0.2537797787002106, -0.2508597046642521, -0.24793963062829344, -0.24501955659233476, -0.24209948255637714, -0.23917940852041852, -0.2362593344844599, -0.23333926044850223, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2263178810205334, -0.2222165756285237, -0.21811527023651361, -0.21401396484450352, -0.20991265945249343, -0.20581135406048334, -0.20171004866847364, -0.19760874327646344, -0.19350743788445357, -0.38946830813884636, -0.38946830813884636, -0.38946830813884636, -0.38946830813884636, -0.38946830813884636, -0.38946830813884636, -0.38946830813884636, -0.38946830813884636, -0.38946830813884636, -0.38946830813884636, -0.38946830813884636, -0.37079535463680746, -0.352122401134787, -0.3334494476327424, -0.3147764941307093, -0.2961035406286764, -0.27743058712664304, -0.258757633624619, -0.24008468012257614, -0.221411726620545, -0.221411726620545, -0.221411726620545, -0.221411726620545, -0.221411726620545, -0.221411726620545, -0.221411726620545, -0.221411726620545, -0.221411726620545, -0.221411726620545, -0.221411726620545, -0.221411726620545], [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05], [5.4612344774383255, 5.6490547502318, 5.836875023025278, 6.024695295818751, 6.212515568612229, 6.400335841405704, 6.588156114199179, 6.775976386992657, 6.963796659786131, 7.151616932579609, 7.361670116512837, 7.361670116512837, 7.361670116512837, 7.361670116512837, 7.361670116512837, 7.361670116512837, 7.361670116512837, 7.361670116512837, 7.361670116512837, 7.361670116512837, 7.361670116512837, 7.545365258819446, 7.7290604011260555, 7.912755543432666, 8.096450685739274, 8.280145828045885, 8.463840970352496, 8.647536112659107, 8.831231254965715, 9.014926397272326, 9.186394975057365, 9.186394975057365, 9.186394975057365, 9.186394975057365, 9.186394975057365, 9.186394975057365, 9.186394975057365, 9.186394975057365, 9.186394975057365, 9.186394975057365, 9.186394975057365, 9.357863552842405, 9.529332130627447, 9.700800708412485, 9.872269286197525, 10.043737863982566, 10.215206441767606, 10.386675019552646, 10.558143597337686, 10.729612175122725, 10.902979355679143, 10.902979355679143, 10.902979355679143, 10.902979355679143, 10.902979355679143, 10.902979355679143, 10.902979355679143, 10.902979355679143, 10.902979355679143, 10.902979355679143, 10.902979355679143, 11.076346536235562, 11.24971371679198, 11.423080897348399, 11.596448077904814, 11.769815258461232, 11.94318243901765, 12.116549619574068, 12.289916800130486, 12.463283980686905, 12.831153483075122, 12.831153483075122, 12.831153483075122, 12.831153483075122, 12.831153483075122, 12.831153483075122, 12.831153483075122, 12.831153483075122, 12.831153483075122, 12.831153483075122, 12.831153483075122, 13.204029227536344, 13.576904971997564, 13.949780716458788, 14.322656460920008, 14.695532205381237, 15.068407949842458, 15.441283694303682, 15.814159438764902, 16.187035183226126, 16.187035183226126, 16.187035183226126, 16.187035183226126, 16.187035183226126, 16.187035183226126, 16.187035183226126, 16.187035183226126, 16.187035183226126, 16.187035183226126, 16.187035183226126, 16.187035183226126], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.03, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.05, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04], [-0.533504340646302, -0.5551733306501173, -0.5768423206538946, -0.5985113106577103, -0.6201803006614879, -0.6418492906652831, -0.6635182806690967, -0.685187270672875, -0.70685626067669, -0.7285252506804671, -0.269036408561898, -0.269036408561898, -0.269036408561898, -0.269036408561898, -0.269036408561898, -0.269036408561898, -0.269036408561898, -0.269036408561898, -0.269036408561898, -0.269036408561898, -0.269036408561898, -0.26799013280747835, -0.26694385705305956, -0.26589758129864094, -0.2648513055442213, -0.2638050297898027, -0.26275875403538396, -0.26171247828096444, -0.2606662025265457, -0.25961992677212686, -0.2566998527361684, -0.2566998527361684, -0.2566998527361684, -0.2566998527361684, -0.2566998527361684, -0.2566998527361684, -0.2566998527361684, -0.2566998527361684, -0.2566998527361684, -0.2566998527361684, -0.2566998527361684, -0.2537797787002106, -0.2508597046642521, -0.24793963062829344, -0.24501955659233476, -0.24209948255637714, -0.23917940852041852, -0.2362593344844599, -0.23333926044850223, -0.2304191864125435, -0.2263178810205334, -0.2263178810205334, -0.2263178810205334, -0.2263178810205334, -0.2263178810205334, -0.2263178810205334, -0.2263178810205334, -0.2263178810205334, -0.2263178810205334, -0.2263178810205334, -0.2263178810205334, -0.2222165756285237, -0.21811527023651361, -0.21401396484450352, -0.20991265945249343, -0.20581135406048334, -0.20171004866847364, -0.19760874327646344, -0.19350743788445357, -0.18940613249244354, 0.029328996655993256, 0.029328996655993256, 0.029328996655993256, 0.029328996655993256, 0.029328996655993256, 0.029328996655993256, 0.029328996655993256, 0.029328996655993256, 0.029328996655993256, 0.029328996655993256, 0.029328996655993256, 0.04800195015802097, 0.06667490366006648, 0.0853478571620894, 0.10402081066412183, 0.12269376416615518, 0.1413667176681881, 0.1600396711702321, 0.17871262467225502, 0.1973855781742896, 0.1973855781742896, 0.1973855781742896, 0.1973855781742896, 0.1973855781742896, 0.1973855781742896, 0.1973855781742896, 0.1973855781742896, 0.1973855781742896, 0.1973855781742896, 0.1973855781742896, 0.1973855781742896], [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04], [0.5, 0.7000000000000001, 0.9, 1.1, 1.2000000000000002, 1.4000000000000001, 1.6, 1.8, 2.0, 2.2, 2.4000000000000004, 2.4000000000000004, 2.5, 2.6, 2.7, 2.8000000000000003, 2.9000000000000004, 3.0, 3.1, 3.2, 3.29, 3.37, 3.45, 3.54, 3.62, 3.71, 3.79, 3.88, 3.96, 4.04, 4.13, 4.22, 4.3, 4.39, 4.48, 4.57, 4.66, 4.75, 4.84, 4.92, 5.01, 5.1000000000000005, 5.2, 5.29, 5.38, 5.47, 5.5600000000000005, 5.66, 5.75, 5.84, 5.93, 6.0200000000000005, 6.11, 6.2, 6.28, 6.37, 6.46, 6.55, 6.640000000000001, 6.73, 6.8100000000000005, 6.91, 7.0, 7.09, 7.19, 7.28, 7.37, 7.46, 7.5600000000000005, 7.65, 7.74, 7.83, 7.92, 8.0, 8.09, 8.18, 8.27, 8.35, 8.44, 8.53, 8.6, 8.8, 9.0, 9.200000000000001, 9.4, 9.5, 9.700000000000001, 9.9, 10.100000000000001, 10.3, 10.5, 10.600000000000001, 10.8, 11.0, 11.200000000000001, 11.4, 11.600000000000001, 11.8, 11.9, 12.100000000000001, 12.3], [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.1], [0.5083521346916802, 0.6928142573932907, 0.8772763800949013, 1.0617385027965118, 1.2462006254981224, 1.430662748199732, 1.6151248709013428, 1.7995869936029534, 1.9840491163045637, 2.1685112390061745, 2.352973361707784, 2.446246496432423, 2.5395196311570625, 2.6327927658817014, 2.726065900606341, 2.8193390353309797, 2.9126121700556187, 3.005885304780258, 3.0991584395048974, 3.1924315742295364, 3.2857047089541753, 3.369945466777054, 3.4541862245999315, 3.53842698242281, 3.6226677402456886, 3.7069084980685663, 3.7911492558914457, 3.8753900137143233, 3.959630771537202, 4.0438715293600795, 4.128112287182958, 4.21653374074609, 4.3049551943092235, 4.393376647872357, 4.481798101435489, 4.570219554998621, 4.658641008561754, 4.747062462124886, 4.83548391568802, 4.923905369251152, 5.012326822814284, 5.104254763710816, 5.196182704607347, 5.288110645503879, 5.380038586400412, 5.471966527296943, 5.5638944681934746, 5.655822409090007, 5.747750349986538, 5.83967829088307, 5.931606231779601, 6.019783353127453, 6.107960474475303, 6.196137595823155, 6.2843147171710045, 6.372491838518855, 6.460668959866706, 6.548846081214557, 6.637023202562407, 6.725200323910258, 6.813377445258109, 6.906452633761537, 6.999527822264968, 7.092603010768396, 7.185678199271825, 7.278753387775254, 7.371828576278683, 7.464903764782114, 7.557978953285542, 7.651054141788971, 7.744129330292401, 7.8310788342901265, 7.9180283382878525, 8.004977842285578, 8.091927346283303, 8.178876850281029, 8.265826354278756, 8.352775858276482, 8.439725362274206, 8.526674866271932, 8.613624370269658, 8.798788239156075, 8.983952108042487, 9.169115976928904, 9.354279845815316, 9.539443714701731, 9.72460758358815, 9.90977145247456, 10.094935321360975, 10.28009919024739, 10.465263059133804, 10.649721958849813, 10.834180858565821, 11.018639758281829, 11.203098657997835, 11.387557557713842, 11.572016457429854, 11.756475357145861, 11.940934256861869, 12.125393156577875, 12.309852056293884], [0.41000000000000003, 0.39, 0.37, 0.36, 0.34, 0.32, 0.3, 0.28, 0.27, 0.25, 0.23, 0.22, 0.21, 0.2, 0.19, 0.18, 0.17, 0.16, 0.16, 0.15, 0.14, 0.14, 0.14, 0.14, 0.14, 0.14, 0.14, 0.15, 0.15, 0.15, 0.15, 0.14, 0.14, 0.13, 0.13, 0.12, 0.11, 0.11, 0.1, 0.1, 0.09, 0.1, 0.1, 0.11, 0.11, 0.12, 0.12, 0.13, 0.13, 0.14, 0.14, 0.14, 0.15, 0.15, 0.15, 0.15, 0.16, 0.16, 0.16, 0.16, 0.16, 0.16, 0.16, 0.16, 0.16, 0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.15, 0.16, 0.16, 0.17, 0.17, 0.18, 0.18, 0.19, 0.19, 0.2, 0.22, 0.23, 0.24, 0.25, 0.26, 0.28, 0.29, 0.3, 0.31, 0.32, 0.32, 0.32, 0.33, 0.33, 0.34, 0.34, 0.34, 0.35000000000000003, 0.35000000000000003], [0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04], [0.4101848327255659, 0.3922202762763783, 0.37425571982719036, 0.35629116337800276, 0.3383266069288152, 0.3203620504796273, 0.30239749403043975, 0.2844329375812522, 0.2664683811320646, 0.24850382468287666, 0.23053926823368917, 0.22115191830735997, 0.21176456838103122, 0.20237721845470202, 0.1929898685283733, 0.18360251860204413, 0.17421516867571493, 0.16482781874938618, 0.15544046882305698, 0.14605311889672826, 0.1366657689703991, 0.13798664800616037, 0.13930752704192118, 0.14062840607768248, 0.14194928511344376, 0.14327016414920507, 0.14459104318496585, 0.1459119222207271, 0.14723280125648838, 0.14855368029224925, 0.14987455932801055, 0.14405248497407186, 0.1382304106201332, 0.13240833626619447, 0.12658626191225586, 0.12076418755831762, 0.11494211320437892, 0.1091200388504403, 0.10329796449650155, 0.09747589014256294, 0.0916538157886243, 0.09670393286883139, 0.10175404994903853, 0.10680416702924608, 0.11185428410945328, 0.11690440118966042, 0.1219545182698675, 0.1270046353500747, 0.13205475243028222, 0.13710486951048936, 0.1421549865906965, 0.14434479726891947, 0.14653460794714254, 0.14872441862536598, 0.15091422930358903, 0.15310403998181207, 0.1552938506600351, 0.1574836613382581, 0.15967347201648158, 0.16186328269470462, 0.1640530933729277, 0.1621797847888797, 0.16030647620483143, 0.15843316762078327, 0.15655985903673528, 0.15468655045268767, 0.15281324186863945, 0.15093993328459135, 0.14906662470054324, 0.14719331611649525, 0.14532000753244703, 0.14990626467192764, 0.15449252181140805, 0.15907877895088862, 0.16366503609036875, 0.16825129322984933, 0.1728375503693298, 0.17742380750881037, 0.182010064648291, 0.18659632178777108, 0.1911825789272517, 0.2034133458294065, 0.2156441127315613, 0.2278748796337159, 0.24010564653587052, 0.2523364134380252, 0.26456718034018, 0.27679794724233464, 0.28902871414448933, 0.30125948104664396, 0.3134902479487987, 0.31711851414076603, 0.32074678033273324, 0.32437504652470045, 0.32800331271666766, 0.33163157890863487, 0.33525984510060175, 0.33888811129256896, 0.34251637748453617, 0.34614464367650344, 0.34977290986847054], [0.9, 1.0, 1.1, 1.2000000000000002, 1.2000000000000002, 1.3, 1.4000000000000001, 1.5, 1.6, 1.7000000000000002, 1.8, 2.0, 2.2, 2.4000000000000004, 2.5, 2.7, 2.9000000000000004, 3.1, 3.3000000000000003, 3.4000000000000004, 3.63, 3.72, 3.81, 3.91, 4.0, 4.09, 4.18, 4.2700000000000005, 4.36, 4.46, 4.5, 4.800000000000001, 5.1000000000000005, 5.300000000000001, 5.6000000000000005, 5.9, 6.1000000000000005, 6.4, 6.7, 6.9, 7.19, 7.28, 7.37, 7.45, 7.54, 7.62, 7.71, 7.79, 7.88, 7.97, 8.1, 8.200000000000001, 8.4, 8.6, 8.8, 8.9, 9.1, 9.3, 9.5, 9.700000000000001, 9.84, 9.92, 10.01, 10.1, 10.18, 10.27, 10.36, 10.44, 10.53, 10.620000000000001, 10.700000000000001, 10.8, 10.9, 11.0, 11.100000000000001, 11.200000000000001, 11.3, 11.4, 11.5, 11.600000000000001, 11.700000000000001, 11.9, 12.0, 12.200000000000001, 12.4, 12.600000000000001, 12.8, 13.0, 13.200000000000001, 13.3, 13.5, 13.8, 14.100000000000001, 14.3, 14.600000000000001, 14.9, 15.100000000000001, 15.4, 15.600000000000001, 15.9, 16.2], [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.09, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3, 0.3], [0.8683151936770477, 0.9622253300737857, 1.0561354664705238, 1.1500456028672619, 1.2439557392639997, 1.3378658756607373, 1.4317760120574752, 1.5256861484542135, 1.6195962848509515, 1.7135064212476896, 1.8074165576444274, 1.9896677778610714, 2.1719189980777154, 2.3541702182943594, 2.5364214385110033, 2.7186726587276464, 2.9009238789442904, 3.0831750991609344, 3.265426319377578, 3.447677539594222, 3.6299287598108645, 3.72177633096417, 3.8136239021174747, 3.9054714732707794, 3.9973190444240845, 4.089166615577389, 4.181014186730694, 4.272861757884, 4.364709329037305, 4.456556900190609, 4.548404471343915, 4.812969819136621, 5.077535166929326, 5.342100514722032, 5.606665862514737, 5.8712312103074416, 6.135796558100149, 6.400361905892853, 6.66492725368556, 6.929492601478264, 7.194057949270968, 7.279792238163489, 7.365526527056009, 7.45126081594853, 7.536995104841049, 7.622729393733568, 7.708463682626089, 7.794197971518608, 7.879932260411129, 7.9656665493036485, 8.05140083819617, 8.229919597382764, 8.40843835656936, 8.586957115755954, 8.765475874942549, 8.943994634129142, 9.122513393315739, 9.30103215250233, 9.479550911688928, 9.658069670875522, 9.836588430062115, 9.923272020340324, 10.009955610618535, 10.096639200896742, 10.183322791174952, 10.270006381453161, 10.356689971731369, 10.44337356200958, 10.530057152287787, 10.616740742565996, 10.703424332844206, 10.800111182914097, 10.896798032983991, 10.993484883053885, 11.090171733123778, 11.18685858319367, 11.283545433263564, 11.380232283333457, 11.47691913340335, 11.573605983473243, 11.670292833543135, 11.856730705773748, 12.043168578004359, 12.229606450234968, 12.41604432246558, 12.60248219469619, 12.788920066926806, 12.975357939157416, 13.161795811388028, 13.348233683618638, 13.534671555849249, 13.79861552720038, 14.062559498551506, 14.326503469902633, 14.590447441253762, 14.854391412604887, 15.118335383956019, 15.382279355307148, 15.646223326658273, 15.910167298009398, 16.174111269360523], [0.37, 0.36, 0.35000000000000003, 0.34, 0.33, 0.32, 0.31, 0.3, 0.29, 0.28, 0.27, 0.24, 0.22, 0.2, 0.18, 0.16, 0.14, 0.12, 0.1, 0.07, 0.05, 0.05, 0.05, 0.05, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.07, 0.08, 0.09, 0.1, 0.12, 0.13, 0.14, 0.15, 0.16, 0.17, 0.18, 0.18, 0.18, 0.18, 0.18, 0.18, 0.18, 0.19, 0.19, 0.19, 0.2, 0.21, 0.21, 0.22, 0.23, 0.24, 0.25, 0.25, 0.26, 0.27, 0.27, 0.27, 0.28, 0.28, 0.28, 0.28, 0.28, 0.29, 0.29, 0.29, 0.29, 0.3, 0.3, 0.3, 0.3, 0.31, 0.31, 0.31, 0.31, 0.32, 0.32, 0.33, 0.34, 0.35000000000000003, 0.36, 0.37, 0.38, 0.39, 0.4, 0.41000000000000003, 0.39, 0.38, 0.37, 0.35000000000000003, 0.34, 0.32, 0.31, 0.3, 0.28, 0.27], [0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03], [0.373420771933882, 0.36258627693198414, 0.3517517819300858, 0.340917286928188, 0.3300827919262897, 0.31924829692439183, 0.308413801922494, 0.2975793069205957, 0.28674481191869783, 0.27591031691679957, 0.26507582191490175, 0.24389227335606742, 0.22270872479723305, 0.20152517623839875, 0.18034162767956444, 0.15915807912073024, 0.13797453056189593, 0.11679098200306157, 0.09560743344422729, 0.07442388488539295, 0.053240336326558696, 0.05376347420376801, 0.05428661208097782, 0.054809749958187215, 0.05533288783539653, 0.05585602571260634, 0.05637916358981565, 0.05690230146702502, 0.057425439344234774, 0.05794857722144414, 0.058471715098653565, 0.0700659700262011, 0.08166022495374875, 0.09325447988129623, 0.10484873480884355, 0.11644298973639083, 0.12803724466393868, 0.13963149959148602, 0.15122575451903353, 0.1628200094465812, 0.17441426437412855, 0.17587430139210777, 0.17733433841008667, 0.17879437542806592, 0.18025441244604526, 0.1817144494640246, 0.1831744864820034, 0.18463452349998272, 0.18609456051796203, 0.18755459753594086, 0.18901463455392023, 0.1971110917098937, 0.2052075488658663, 0.21330400602183988, 0.2214004631778135, 0.22949692033378713, 0.2375933774897597, 0.24568983464573343, 0.25378629180170686, 0.2618827489576796, 0.2699792061136531, 0.2720298588096582, 0.27408051150566304, 0.27613116420166806, 0.27818181689767313, 0.2802324695936782, 0.2822831222896832, 0.28433377498568807, 0.28638442768169314, 0.2884350803776981, 0.2904857330737031, 0.2929662619612808, 0.2954467908488591, 0.29792731973643666, 0.3004078486240143, 0.30288837751159176, 0.3053689063991702, 0.30784943528674774, 0.3103299641743253, 0.3128104930619037, 0.3152910219494814, 0.3246274987004982, 0.3339639754515146, 0.3433004522025316, 0.35263692895354815, 0.3619734057045646, 0.3713098824555813, 0.38064635920659773, 0.38998283595761474, 0.3993193127086312, 0.40865578945964776, 0.39458170023885075, 0.3805076110180533, 0.36643352179725663, 0.3523594325764592, 0.3382853433556625, 0.32421125413486473, 0.31013716491406795, 0.2960630756932705, 0.28198898647247395, 0.2679148972516764], [0.7000000000000001, 0.8, 1.0, 1.1, 1.2000000000000002, 1.4000000000000001, 1.5, 1.7000000000000002, 1.8, 1.9000000000000001, 2.1, 2.2, 2.4000000000000004, 2.5, 2.6, 2.8000000000000003, 2.9000000000000004, 3.0, 3.2, 3.3000000000000003, 3.46, 3.5500000000000003, 3.63, 3.72, 3.81, 3.9, 3.99, 4.07, 4.16, 4.25, 4.3, 4.5, 4.7, 4.9, 5.0, 5.2, 5.4, 5.6000000000000005, 5.800000000000001, 5.9, 6.1000000000000005, 6.19, 6.28, 6.37, 6.46, 6.55, 6.640000000000001, 6.73, 6.8100000000000005, 6.9, 7.0, 7.1000000000000005, 7.300000000000001, 7.4, 7.5, 7.7, 7.800000000000001, 7.9, 8.1, 8.200000000000001, 8.32, 8.41, 8.5, 8.59, 8.68, 8.77, 8.86, 8.950000000000001, 9.040000000000001, 9.13, 9.22, 9.32, 9.41, 9.5, 9.59, 9.68, 9.77, 9.870000000000001, 9.96, 10.05, 10.100000000000001, 10.3, 10.5, 10.700000000000001, 10.9, 11.100000000000001, 11.3, 11.4, 11.600000000000001, 11.8, 12.0, 12.200000000000001, 12.4, 12.700000000000001, 12.9, 13.100000000000001, 13.3, 13.600000000000001, 13.8, 14.0, 14.200000000000001], [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.1], [0.6883336641843639, 0.8275197937335382, 0.9667059232827125, 1.1058920528318867, 1.245078182381061, 1.3842643119302347, 1.523450441479409, 1.6626365710285835, 1.8018227005777576, 1.9410088301269321, 2.080194959676106, 2.2179571371467475, 2.3557193146173887, 2.4934814920880304, 2.631243669558672, 2.7690058470293133, 2.9067680244999545, 3.044530201970596, 3.182292379441238, 3.320054556911879, 3.45781673438252, 3.545860898870612, 3.633905063358703, 3.7219492278467947, 3.8099933923348868, 3.8980375568229775, 3.98608172131107, 4.074125885799162, 4.162170050287253, 4.250214214775344, 4.338258379263436, 4.5147517799413555, 4.6912451806192745, 4.8677385812971945, 5.044231981975113, 5.220725382653031, 5.397218783330952, 5.573712184008869, 5.75020558468679, 5.926698985364708, 6.103192386042626, 6.192023500937153, 6.280854615831678, 6.3696857307262045, 6.45851684562073, 6.547347960515255, 6.636179075409782, 6.725010190304308, 6.813841305198833, 6.902672420093359, 6.991503534987885, 7.124851475255109, 7.258199415522331, 7.391547355789554, 7.524895296056776, 7.658243236323999, 7.791591176591222, 7.924939116858443, 8.058287057125668, 8.191634997392889, 8.324982937660112, 8.41486232705093, 8.504741716441751, 8.59462110583257, 8.68450049522339, 8.774379884614207, 8.864259274005025, 8.954138663395847, 9.044018052786665, 9.133897442177483, 9.223776831568303, 9.315595008602113, 9.40741318563592, 9.499231362669732, 9.59104953970354, 9.682867716737348, 9.77468589377116, 9.86650407080497, 9.958322247838778, 10.050140424872588, 10.141958601906396, 10.327759472464912, 10.513560343023423, 10.699361213581936, 10.885162084140449, 11.07096295469896, 11.256763825257478, 11.442564695815989, 11.628365566374502, 11.814166436933014, 11.999967307491527, 12.224168743025096, 12.448370178558664, 12.67257161409223, 12.896773049625798, 13.120974485159365, 13.345175920692936, 13.569377356226504, 13.793578791760071, 14.017780227293636, 14.241981662827204], [0.39, 0.38, 0.36, 0.35000000000000003, 0.33, 0.32, 0.31, 0.29, 0.28, 0.26, 0.25, 0.23, 0.22, 0.2, 0.19, 0.17, 0.16, 0.14, 0.13, 0.11, 0.09, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.11, 0.11, 0.11, 0.12, 0.12, 0.12, 0.12, 0.13, 0.13, 0.13, 0.14, 0.14, 0.14, 0.15, 0.15, 0.15, 0.16, 0.16, 0.16, 0.17, 0.17, 0.18, 0.18, 0.19, 0.19, 0.2, 0.2, 0.21, 0.21, 0.22, 0.22, 0.22, 0.22, 0.22, 0.22, 0.22, 0.22, 0.22, 0.22, 0.22, 0.22, 0.22, 0.23, 0.23, 0.24, 0.24, 0.24, 0.25, 0.25, 0.25, 0.26, 0.27, 0.29, 0.3, 0.31, 0.32, 0.33, 0.34, 0.35000000000000003, 0.36, 0.36, 0.35000000000000003, 0.35000000000000003, 0.34, 0.33, 0.33, 0.32, 0.32, 0.31, 0.31], [0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02], [0.391802802329724, 0.3774032766041812, 0.3630037508786381, 0.3486042251530954, 0.3342046994275525, 0.31980517370200956, 0.30540564797646685, 0.2910061222509239, 0.2766065965253812, 0.2622070707998381, 0.24780754507429548, 0.23252209583171368, 0.21723664658913214, 0.20195119734655037, 0.18666574810396885, 0.17138029886138717, 0.15609484961880543, 0.14080940037622386, 0.12552395113364212, 0.1102385018910606, 0.09495305264847889, 0.09587506110496419, 0.0967970695614495, 0.09771907801793485, 0.09864108647442014, 0.0995630949309057, 0.10048510338739075, 0.10140711184387606, 0.10232912030036158, 0.1032511287568467, 0.10417313721333206, 0.10705922750013648, 0.10994531778694097, 0.11283140807374535, 0.1157174983605497, 0.11860358864735424, 0.1214896789341588, 0.12437576922096316, 0.12726185950776753, 0.13014794979457206, 0.13303404008137643, 0.1362891171304696, 0.1395441941795626, 0.142799271228656, 0.14605434827774927, 0.1493094253268425, 0.15256450237593544, 0.15581957942502872, 0.1590746564741221, 0.16232973352321511, 0.16558481057230837, 0.1707279444894066, 0.17587107840650443, 0.18101421232360293, 0.18615734624070127, 0.1913004801577996, 0.1964436140748974, 0.20158674799199577, 0.20672988190909422, 0.2118730158261921, 0.21701614974329042, 0.21710482179926893, 0.21719349385524722, 0.21728216591122568, 0.2173708379672042, 0.21745951002318292, 0.21754818207916132, 0.21763685413513972, 0.21772552619111818, 0.2178141982470967, 0.2179028703030751, 0.2214362633166042, 0.22496965633013358, 0.22850304934366264, 0.23203644235719154, 0.23556983537072054, 0.23910322838425, 0.24263662139777906, 0.24617001441130815, 0.2497034074248374, 0.25323680043836655, 0.26402042226495237, 0.27480404409153797, 0.28558766591812373, 0.29637128774470933, 0.3071549095712949, 0.31793853139788064, 0.3287221532244662, 0.33950577505105206, 0.3502893968776376, 0.36107301870422326, 0.35585010718980836, 0.35062719567539324, 0.34540428416097857, 0.34018137264656345, 0.33495846113214867, 0.3297355496177332, 0.32451263810331843, 0.3192897265889033, 0.3140668150744887, 0.30884390356007346], [0.049715827755630534, 0.41864007315885166, 0.7875643185620728, 1.0034154513423041, 1.0034154513423053, 1.0034154513423041, 1.0034154513423041, 1.0034154513423041, 1.0034154513423055, 1.0034154513423041, 0.9669535062282618, 1.1534936842652428, 1.3400338623022239, 1.526574040339205, 1.7131142183761863, 1.8996543964131667, 2.0861945744501473, 2.272734752487129, 2.4592749305241104, 2.64581510856109, 2.832355286598071, 2.8323544498526076, 2.832353613107144, 2.8323527763616814, 2.8323519396162182, 2.8323511028707546, 2.8323502661252915, 2.832349429379828, 2.832348592634365, 2.832347755888901, 2.8226234786967677, 2.998296540090901, 3.1739696014850347, 3.349642662879168, 3.5253157242732995, 3.7009887856674326, 3.876661847061566, 4.052334908455698, 4.228007969849833, 4.4036810312439645, 4.579354092638097, 4.579354092638095, 4.579354092638094, 4.579354092638095, 4.579354092638095, 4.579354092638097, 4.579354092638095, 4.579354092638094, 4.579354092638095, 4.579354092638095, 4.601126722104702, 4.777478923405805, 4.953831124706904, 5.130183326008005, 5.306535527309105, 5.482887728610205, 5.659239929911306, 5.835592131212406, 6.011944332513506, 6.188296533814605, 6.364648735115706, 6.36464705936621, 6.364645383616715, 6.364643707867219, 6.3646420321177235, 6.36464035636823, 6.364638680618734, 6.3646370048692384, 6.364635329119743, 6.364633653370248, 6.346290614088982, 6.520037426772433, 6.693784239455886, 6.867531052139338, 7.041277864822786, 7.215024677506236, 7.388771490189689, 7.56251830287314, 7.73626511555659, 7.91001192824004, 8.083758740923491, 8.08375874092349, 8.083758740923491, 8.083758740923491, 8.083758740923491, 8.083758740923491, 8.08375874092349, 8.083758740923491, 8.083758740923491, 8.08375874092349, 8.08375874092349, 8.451551147482526, 8.819343554041556, 9.187135960600584, 9.554928367159611, 9.92272077371864, 10.29051318027768, 10.658305586836708, 11.026097993395737, 11.393890399954765, 11.761682806513795], [0.6436430473166519, 0.6077139344182767, 0.5717848215199008, 0.5507633250594913, 0.550763325059492, 0.5507633250594907, 0.5507633250594902, 0.5507633250594902, 0.550763325059495, 0.5507633250594894, 0.2847490626846048, 0.28480939140299005, 0.2848697201213753, 0.28493004883976053, 0.2849903775581458, 0.28505070627653106, 0.2851110349949163, 0.28517136371330154, 0.2852316924316868, 0.285292021150072, 0.28535234986845726, 0.2879396192796959, 0.29052688869093435, 0.29311415810217334, 0.29570142751341233, 0.2982886969246511, 0.30087596633588937, 0.3034632357471283, 0.3060505051583672, 0.3086377745696055, 0.1678737514572815, 0.17752445742574566, 0.18717516339420973, 0.19682586936267385, 0.20647657533113786, 0.216127281299602, 0.22577798726806608, 0.23542869323653012, 0.24507939920499433, 0.25473010517345834, 0.26438081114192236, 0.26438081114192064, 0.26438081114191564, 0.2643808111419209, 0.26438081114192236, 0.2643808111419229, 0.26438081114192047, 0.2643808111419139, 0.26438081114192313, 0.2643808111419221, 0.4111591044942923, 0.41107839205259544, 0.4109976796108985, 0.4109169671692016, 0.41083625472750473, 0.4107555422858078, 0.4106748298441109, 0.410594117402414, 0.41051340496071714, 0.4104326925190202, 0.4103519800773233, 0.40669056052283226, 0.40302914096834086, 0.3993677214138497, 0.395706301859359, 0.3920448823048685, 0.3883834627503772, 0.3847220431958861, 0.381060623641395, 0.377399204086904, 0.19083839373812217, 0.20231502132591145, 0.21379164891370084, 0.22526827650149012, 0.23674490408927923, 0.2482215316770684, 0.2596981592648578, 0.271174786852647, 0.2826514144404361, 0.29412804202822546, 0.3056046696160148, 0.3056046696160123, 0.3056046696160159, 0.3056046696160152, 0.3056046696160152, 0.30560466961601496, 0.3056046696160118, 0.30560466961601546, 0.30560466961601546, 0.30560466961601124, 0.30560466961601124, 0.32989873529988173, 0.35419280098375167, 0.3784868666676216, 0.40278093235149154, 0.42707499803536136, 0.4513690637192321, 0.4756631294031019, 0.49995719508697184, 0.5242512607708416, 0.5485453264547118], [1.0034154513423044, 1.0034154513423048, 1.0034154513423044, 1.1564885639652938, 1.5254128093685149, 1.8943370547717344, 2.263261300174956, 2.632185545578177, 3.0011097909813977, 3.3700340363846193, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.738958281787838, 3.9074397974335957, 4.075921313079351, 4.244402828725107, 4.412884344370864, 4.5813658600166205, 4.7498473756623785, 4.918328891308135, 5.086810406953891, 5.255291922599647, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.423773438245403, 5.607629320038468, 5.791485201831531, 5.9753410836245955, 6.159196965417658, 6.343052847210722, 6.526908729003786, 6.710764610796849, 6.894620492589913, 7.078476374382976, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.262332256176038, 7.448482633182897, 7.6346330101897575, 7.820783387196616, 8.006933764203472, 8.19308414121033, 8.379234518217189, 8.56538489522405, 8.751535272230907, 8.937685649237764, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.123836026244623, 9.494163764017456, 9.864491501790283, 10.234819239563112, 10.60514697733594, 10.975474715108769, 11.345802452881603, 11.716130190654427, 12.086457928427256, 12.456785666200085, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913, 12.827113403972913], [0.5507633250594914, 0.5507633250594904, 0.5507633250594908, 0.5358557086215257, 0.49992659572315057, 0.4639974828247747, 0.42806836992639963, 0.3921392570280245, 0.35621014412964935, 0.32028103123127344, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.28435191833289847, 0.286993676404421, 0.28963543447594264, 0.29227719254746526, 0.2949189506189878, 0.29756070869051043, 0.300202466762032, 0.3028442248335545, 0.30548598290507706, 0.3081277409765988, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.3107694990481214, 0.32086973320853557, 0.33096996736894985, 0.34107020152936496, 0.35117043568977935, 0.3612706698501936, 0.3713709040106078, 0.3814711381710222, 0.39157137233143724, 0.4016716064918515, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4117718406522658, 0.4080252234841698, 0.40427860631607326, 0.40053198914797694, 0.39678537197988095, 0.39303875481178574, 0.3892921376436893, 0.3855455204755931, 0.3817989033074969, 0.3780522861394009, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.37430566897130446, 0.39876720277561406, 0.42322873657992366, 0.4476902703842328, 0.4721518041885421, 0.49661333799285146, 0.521074871797161, 0.5455364056014703, 0.5699979394057797, 0.594459473210089, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984, 0.6189210070143984], [0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 1.1188067073424912, 1.487611314239596, 1.8564159211366995, 2.225220528033805, 2.59402513493091, 2.9628297418280143, 3.331634348725119, 3.7004389556222224, 3.700438955622225, 3.7004389556222224, 3.7004389556222246, 3.7004389556222224, 3.7004389556222224, 3.7004389556222246, 3.7004389556222224, 3.7004389556222246, 3.700438955622223, 3.715680364714145, 3.883261385686037, 4.050842406657927, 4.218423427629818, 4.38600444860171, 4.553585469573601, 4.721166490545493, 4.888747511517384, 5.0563285324892755, 5.223909553461167, 5.391490574433057, 5.391490574433057, 5.391490574433057, 5.391490574433057, 5.39149057443306, 5.391490574433057, 5.391490574433057, 5.391490574433057, 5.391490574433057, 5.391490574433057, 5.4240067907543645, 5.60786802993239, 5.791729269110411, 5.975590508288437, 6.159451747466458, 6.343312986644482, 6.527174225822506, 6.711035465000528, 6.894896704178552, 7.078757943356575, 7.262619182534597, 7.262616887212731, 7.262614591890866, 7.262612296568999, 7.262610001247134, 7.2626077059252685, 7.2626054106034035, 7.262603115281538, 7.262600819959672, 7.262598524637806, 7.285901005149383, 7.471337846750336, 7.656774688351292, 7.8422115299522455, 8.027648371553196, 8.213085213154148, 8.398522054755103, 8.583958896356059, 8.76939573795701, 8.954832579557962, 9.140269421158917, 9.140269421158917, 9.140269421158916, 9.140269421158916, 9.140269421158916, 9.140269421158917, 9.140269421158916, 9.140269421158916, 9.140269421158916, 9.140269421158917, 9.130642572929252, 9.501308053136825, 9.87197353334439, 10.242639013551958, 10.613304493759525, 10.983969973967092, 11.354635454174666, 11.725300934382227, 12.095966414589796, 12.466631894797365, 12.83729737500493, 12.83729737500493, 12.83729737500493, 12.83729737500493, 12.83729737500493, 12.837297375004928, 12.83729737500493, 12.83729737500493, 12.83729737500493, 12.83729737500493, 12.83729737500493], [0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.16144707178192857, 0.12432922525938803, 0.08721137873684759, 0.05009353221430701, 0.012975685691766436, -0.02414216083077403, -0.06126000735331466, -0.09837785387585501, -0.09837785387584352, -0.0983778538758538, -0.09837785387584358, -0.09837785387585346, -0.09837785387585368, -0.09837785387584547, -0.0983778538758518, -0.09837785387584691, -0.09837785387585135, -0.06917624679360071, -0.0802105504053445, -0.09124485401708818, -0.10227915762883191, -0.11331346124057576, -0.12434776485231944, -0.13538206846406334, -0.14641637207580707, -0.1574506756875508, -0.16848497929929454, -0.17951928291103827, -0.1795192829110378, -0.17951928291103883, -0.17951928291103803, -0.17951928291102914, -0.1795192829110379, -0.17951928291103725, -0.17951928291103778, -0.17951928291103705, -0.17951928291103697, -0.12487838495991808, -0.12477990064945098, -0.12468141633898387, -0.12458293202851677, -0.12448444771804966, -0.12438596340758255, -0.12428747909711545, -0.12418899478664834, -0.12409051047618123, -0.12399202616571413, -0.12389354185524702, -0.11960838495536978, -0.1153232280554919, -0.11103807115561448, -0.10675291425573724, -0.10246775735586004, -0.09818260045598283, -0.09389744355610505, -0.08961228665622753, -0.08532712975635023, -0.035061158622443744, -0.025280067303770415, -0.015498975985096974, -0.005717884666423645, 0.0040632066522495736, 0.013844297970922848, 0.023625389289596288, 0.03340648060826973, 0.043187571926943, 0.05296866324561622, 0.06274975456428966, 0.06274975456428178, 0.0627497545642875, 0.0627497545642779, 0.06274975456428761, 0.06274975456428328, 0.06274975456428644, 0.06274975456428811, 0.06274975456427873, 0.06274975456428677, 0.028264875412128798, 0.035555784294470705, 0.042846693176812445, 0.05013760205915427, 0.057428510941496036, 0.06471941982383783, 0.07201032870617977, 0.07930123758852145, 0.08659214647086322, 0.09388305535320504, 0.10117396423554681, 0.1011739642355454, 0.10117396423554584, 0.10117396423554542, 0.10117396423554581, 0.10117396423553882, 0.10117396423554498, 0.10117396423554464, 0.10117396423554526, 0.1011739642355437, 0.1011739642355437], [0.012392886651176546, 0.3811974935482814, 0.7500021004453864, 0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 0.9669884416277298, 1.1535347110770082, 1.3400809805262865, 1.5266272499755649, 1.7131735194248436, 1.8997197888741213, 2.086266058323399, 2.272812327772678, 2.4593585972219567, 2.6459048666712346, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 2.8324511361205125, 3.0092940432467783, 3.1861369503730437, 3.3629798574993095, 3.5398227646255735, 3.716665671751839, 3.8935085788781048, 4.070351486004369, 4.247194393130636, 4.4240373002569, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.600880207383164, 4.777234450078867, 4.953588692774567, 5.12994293547027, 5.306297178165971, 5.482651420861672, 5.659005663557374, 5.835359906253076, 6.011714148948776, 6.188068391644477, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.364422634340178, 6.538321642335629, 6.712220650331083, 6.8861196583265345, 7.060018666321984, 7.233917674317435, 7.407816682312888, 7.58171569030834, 7.75561469830379, 7.929513706299242, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.103412714294693, 8.472330513726714, 8.84124831315873, 9.210166112590743, 9.579083912022758, 9.948001711454772, 10.316919510886796, 10.68583731031881, 11.054755109750825, 11.423672909182839, 11.792590708614854], [0.2728006113495502, 0.23568276482700967, 0.1985649183044691, 0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.17672661813447987, 0.15795191828182148, 0.13917721842916397, 0.12040251857650561, 0.1016278187238481, 0.08285311887118976, 0.0640784190185314, 0.04530371916587389, 0.026529019313215496, 0.007754319460558046, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.011020380392100293, -0.02266452909997768, -0.034308677807855015, -0.04595282651573243, -0.05759697522360968, -0.06924112393148615, -0.08088527263936357, -0.09252942134724079, -0.10417357005511829, -0.11581771876299551, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.1274618674708728, -0.12308224611442686, -0.11870262475798071, -0.11432300340153384, -0.10994338204508775, -0.10556376068864165, -0.10118413933219561, -0.09680451797574957, -0.09242489661930264, -0.08804527526285655, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.0836656539064104, -0.07449313962744919, -0.06532062534848837, -0.05614811106952722, -0.046975596790566954, -0.0378030825116058, -0.02863056823264487, -0.019458053953683718, -0.010285539674722455, -0.0011130253957623015, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.008059488883198962, 0.015316021267133606, 0.022572553651068028, 0.02982908603500245, 0.03708561841893687, 0.044342150802871294, 0.05159868318680505, 0.05885521557073947, 0.0661117479546739, 0.07336828033860843, 0.08062481272254263], [1.3861664270236043, 1.5739681366623246, 1.7617698463010454, 1.9495715559397655, 2.1373732655784856, 2.325174975217205, 2.512976684855925, 2.700778394494646, 2.8885801041333665, 3.0763818137720866, 3.2641835234108068, 0.8013605815159166, 1.1658630219492043, 1.530365462382492, 1.89486790281578, 2.259370343249066, 2.623872783682354, 2.988375224115642, 3.3528776645489295, 3.2641835234108068, 3.151423466221126, 3.33481225769152, 3.5182010491619122, 3.7015898406323053, 3.884978632102699, 4.068367423573092, 4.251756215043486, 4.435145006513879, 4.6185337979842735, 4.801922589454665, 5.013160328921387, 4.611013241000917, 5.140143936586326, 5.012982932777772, 5.012923800729901, 5.012864668682029, 5.012805536634158, 5.012746404586286, 5.012687272538415, 4.985311380925058, 4.984583539471925, 5.155832303940513, 5.3270810684091, 5.49832983287769, 5.669578597346278, 5.840827361814865, 6.012076126283454, 6.183324890752042, 6.354573655220632, 6.525822419689219, 6.697071184157807, 6.697071184157809, 6.697071184157805, 6.697071184157805, 6.697071184157805, 6.697071184157809, 6.697071184157805, 6.697071184157807, 6.697071184157808, 6.697071184157805, 6.729007008247838, 6.902376608567882, 7.075746208887929, 7.249115809207972, 7.422485409528018, 7.59585500984806, 7.769224610168104, 7.942594210488151, 8.115963810808193, 8.28933341112824, 8.462703011448285, 8.462700078442833, 8.46269714543738, 8.462694212431929, 8.462691279426476, 8.462688346421023, 8.462685413415572, 8.46268248041012, 8.462679547404667, 8.462676614399218, 8.535139604853859, 8.905965310039695, 9.276791015225529, 9.64761672041136, 10.018442425597193, 10.389268130783025, 10.760093835968865, 11.130919541154697, 11.50174524634053, 11.872570951526361, 12.243396656712193, 12.243396656712193, 12.243396656712191, 12.243396656712196, 12.243396656712191, 12.243396656712195, 12.243396656712191, 12.243396656712195, 12.24339665671219, 12.243396656712196, 12.243396656712196], [0.6898936777590893, 0.6680649809150578, 0.6462362840710264, 0.624407587226995, 0.6025788903829636, 0.5807501935389323, 0.558921496694901, 0.5370927998508694, 0.5152641030068379, 0.4934354061628065, 0.4716067093187752, 0.7578672310284514, 0.7155001339107827, 0.6731330367931141, 0.6307659396754455, 0.5883988425577771, 0.5460317454401085, 0.5036646483224397, 0.4612975512047712, 0.471606709318775, 0.33578711830539176, 0.34382390927935014, 0.35186070025330857, 0.359897491227267, 0.36793428220122537, 0.37597107317518375, 0.38400786414914223, 0.3920446551231006, 0.40008144609705915, 0.40811823707101746, 0.38997023131129666, 0.39975186682452907, 0.42294037667962436, 0.4552195682991923, 0.47696934729515705, 0.4987191262911221, 0.5204689052870877, 0.5422186842830526, 0.5639684632790178, 0.41615502804497806, 0.40940965250582273, 0.41717638968711845, 0.4249431268684142, 0.43270986404971, 0.44047660123100574, 0.44824333841230146, 0.4560100755935972, 0.4637768127748929, 0.47154354995618875, 0.47931028713748447, 0.4870770243187802, 0.48707702431879396, 0.48707702431877553, 0.48707702431877564, 0.48707702431877387, 0.48707702431880184, 0.48707702431876726, 0.4870770243187809, 0.4870770243187986, 0.48707702431877237, 0.7690366920752436, 0.7691416667334395, 0.7692466413916353, 0.7693516160498313, 0.7694565907080272, 0.769561565366223, 0.7696665400244189, 0.7697715146826148, 0.7698764893408107, 0.7699814639990066, 0.7700864386572025, 0.7749304075890425, 0.7797743765208841, 0.7846183454527239, 0.7894623143845642, 0.7943062833164035, 0.7991502522482454, 0.8039942211800853, 0.8088381901119248, 0.813682159043767, 1.1581665955896332, 1.1383933307052936, 1.118620065820954, 1.0988468009366148, 1.0790735360522754, 1.059300271167936, 1.0395270062835964, 1.019753741399257, 0.9999804765149177, 0.9802072116305783, 0.9604339467462389, 0.960433946746246, 0.9604339467462363, 0.9604339467462455, 0.960433946746233, 0.9604339467462518, 0.9604339467462333, 0.9604339467462534, 0.9604339467462263, 0.9604339467462584, 0.9604339467462584], [0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 0.4368581410826288, 3.2641835234108063, 3.2641835234108068, 3.2641835234108068, 3.2641835234108068, 3.2641835234108068, 3.2641835234108063, 3.2641835234108068, 3.2641835234108063, 3.7173801049822175, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 4.081882545415503, 5.0131011968735155, 5.013042064825644, 5.66927463217174, 6.19840532775715, 6.727536023342558, 7.256666718927973, 7.7857974145133815, 8.314928110098794, 8.844058805684204, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.373189501269612, 9.730227019642804, 10.087264538015992, 10.444302056389182, 10.801339574762371, 11.15837709313556, 11.515414611508751, 11.872452129881937, 12.22948964825513, 12.586527166628318, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 12.943564685001506, 13.136938385141292, 13.33031208528108, 13.523685785420867, 13.71705948556065, 13.910433185700436, 14.103806885840223, 14.29718058598001, 14.490554286119796, 14.68392798625958, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 14.877301686399365, 15.405189629101626, 15.93307757180388, 16.46096551450613, 16.98885345720839, 17.516741399910643, 18.044629342612904, 18.57251728531516, 19.10040522801741, 19.628293170719665, 20.156181113421916], [0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.80023432814612, 0.47160670931877435, 0.4716067093187749, 0.47160670931877513, 0.4716067093187752, 0.47160670931877513, 0.4716067093187752, 0.4716067093187748, 0.4716067093187755, 0.4189304540871025, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.376563356969434, 0.411720010307262, 0.4334697893032273, 0.4461288865347193, 0.46931739638981396, 0.49250590624490853, 0.5156944161000042, 0.5388829259550989, 0.5620714358101939, 0.5852599456652893, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.608448455520384, 0.6246413698323309, 0.6408342841442761, 0.6570271984562233, 0.6732201127681705, 0.6894130270801178, 0.7056059413920629, 0.7217988557040104, 0.7379917700159573, 0.7541846843279028, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7703775986398498, 0.7753386564150051, 0.7802997141901618, 0.7852607719653169, 0.7902218297404722, 0.795182887515627, 0.8001439452907839, 0.805105003065939, 0.8100660608410941, 0.815027118616251, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.8199881763914063, 0.7918399979498123, 0.7636918195082174, 0.7355436410666241, 0.7073954626250292, 0.6792472841834358, 0.6510991057418403, 0.6229509273002467, 0.5948027488586518, 0.5666545704170587, 0.5385063919754636], [0.3510029669585988, 0.35100296695859595, 0.35100296695859867, 0.35100296695859595, 0.3510029669585984, 0.35100296695859856, 0.35100296695859634, 0.3510029669585985, 0.3510029669585963, 0.3510029669585984, 0.43699495926894355, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.177974974206226, 3.717468120298382, 4.08196513819054, 4.081965007427979, 4.081964876665418, 4.081964745902858, 4.081964615140296, 4.081964484377736, 4.081964353615175, 4.081964222852614, 4.081964092090053, 4.081963961327492, 4.082109493815468, 5.014926397272325, 5.014926397272325, 5.669526237099949, 6.198665151528106, 6.727804065956262, 7.256942980384426, 7.786081894812582, 8.315220809240742, 8.8443597236689, 9.373498638097056, 9.373497616505189, 9.373496594913322, 9.373495573321454, 9.373494551729586, 9.37349353013772, 9.373492508545851, 9.373491486953984, 9.373490465362117, 9.373489443770248, 9.373608762882412, 9.730654316779916, 10.087699870677415, 10.444745424574917, 10.801790978472418, 11.158836532369918, 11.515882086267421, 11.872927640164919, 12.229973194062424, 12.587018747959926, 12.944064301857425, 12.944062287520673, 12.944060273183922, 12.94405825884717, 12.94405624451042, 12.944054230173668, 12.944052215836917, 12.944050201500167, 12.944048187163416, 12.944046172826663, 12.980301043356622, 13.173438828074252, 13.366576612791885, 13.559714397509516, 13.752852182227144, 13.945989966944776, 14.139127751662407, 14.33226553638004, 14.52540332109767, 14.7185411058153, 14.91167889053293, 14.911678890532926, 14.911678890532931, 14.911678890532928, 14.911678890532928, 14.911678890532928, 14.911678890532928, 14.91167889053293, 14.911678890532928, 14.911678890532928, 14.911678890532928, 15.4368402082567, 15.962001525980462, 16.487162843704226, 17.01232416142799, 17.537485479151755, 18.062646796875526, 18.58780811459929, 19.11296943232305, 19.638130750046816, 20.163292067770573], [0.05606756163406345, 0.05606756163406962, 0.056067561634063595, 0.05606756163407025, 0.056067561634062485, 0.05606756163406259, 0.05606756163407234, 0.05606756163406189, 0.05606756163407301, 0.05606756163406105, -0.26992172009883375, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2700826843163166, -0.2695023154812714, -0.2694557149682089, -0.26843292443740463, -0.26741013390660046, -0.26638734337579667, -0.2653645528449925, -0.2643417623141883, -0.2633189717833846, -0.2622961812525805, -0.2612733907217762, -0.26025060019097235, -0.25852386899028634, -0.25961992677212686, -0.25961992677212686, -0.25795660566764295, -0.25776751789342844, -0.257578430119214, -0.2573893423449995, -0.257200254570785, -0.25701116679657054, -0.25682207902235604, -0.2566329912481416, -0.2537741918680588, -0.2509153924879752, -0.24805659310789152, -0.24519779372780776, -0.242338994347725, -0.23948019496764142, -0.23662139558755776, -0.2337625962074749, -0.23090379682739126, -0.2270853022950285, -0.22690614077896734, -0.22672697926290616, -0.22654781774684501, -0.22636865623078384, -0.2261894947147227, -0.2260103331986615, -0.22583117168260036, -0.22565201016653919, -0.225472848650478, -0.22529368713441686, -0.22127937648987378, -0.21726506584533015, -0.2132507552007866, -0.20923644455624305, -0.2052221339116995, -0.20120782326715636, -0.19719351262261264, -0.19317920197806934, -0.18916489133352585, 0.03679804096753014, 0.046470037408942844, 0.056142033850355544, 0.06581403029176836, 0.07548602673318094, 0.08515802317459376, 0.09483001961600646, 0.10450201605741916, 0.11417401249883186, 0.12384600894024445, 0.13351800538165726, 0.13351800538164915, 0.13351800538166592, 0.13351800538165215, 0.1335180053816517, 0.1335180053816517, 0.1335180053816516, 0.13351800538166136, 0.13351800538165248, 0.13351800538165348, 0.13351800538165348, 0.1598171492991315, 0.18611629321660905, 0.21241543713408673, 0.2387145810515644, 0.26501372496904196, 0.2913128688865201, 0.31761201280399787, 0.34391115672147543, 0.3702103006389531, 0.3965094445564302], [1.2997722462714665, 1.4875925190649426, 1.675412791858419, 1.8632330646518949, 2.0510533374453708, 2.238873610238846, 2.4266938830323217, 2.6145141558257983, 2.8023344286192744, 2.9901547014127505, 3.177974974206226, 0.8014919771611034, 1.1659889950532636, 1.5304860129454234, 1.8949830308375835, 2.259480048729742, 2.623977066621902, 2.9884740845140625, 3.3529711024062223, 3.177974974206226, 3.177974974206226, 3.361670116512837, 3.545365258819446, 3.7290604011260555, 3.9127555434326657, 4.096450685739275, 4.280145828045886, 4.4638409703524955, 4.647536112659107, 4.831231254965715, 5.014926397272325, 4.611248408243629, 5.140387322671787, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.014926397272325, 5.1863949750573655, 5.357863552842405, 5.529332130627447, 5.700800708412485, 5.8722692861975245, 6.043737863982566, 6.215206441767605, 6.386675019552646, 6.558143597337685, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.729612175122725, 6.902979355679142, 7.076346536235563, 7.249713716791979, 7.423080897348398, 7.596448077904815, 7.7698152584612314, 7.943182439017652, 8.116549619574068, 8.289916800130486, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.463283980686905, 8.83615972514813, 9.209035469609352, 9.581911214070573, 9.954786958531797, 10.327662702993017, 10.700538447454246, 11.073414191915466, 11.44628993637669, 11.81916568083791, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132, 12.192041425299132], [-0.05339278427835609, -0.07506177428215179, -0.0967307642859484, -0.11839975428974409, -0.1400687442935407, -0.16173773429733634, -0.18340672430113203, -0.20507571430492863, -0.22674470430872434, -0.24841369431252094, -0.2700826843163166, -0.26987511958577126, -0.2698285190727088, -0.2697819185596463, -0.26973531804658385, -0.26968871753352136, -0.26964211702045887, -0.2695955165073964, -0.2695489159943339, -0.2700826843163166, -0.2700826843163166, -0.269036408561898, -0.26799013280747835, -0.26694385705305956, -0.26589758129864094, -0.2648513055442213, -0.2638050297898027, -0.26275875403538396, -0.26171247828096444, -0.2606662025265457, -0.25961992677212686, -0.2583347812160719, -0.2581456934418574, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.25961992677212686, -0.2566998527361684, -0.2537797787002106, -0.2508597046642521, -0.24793963062829344, -0.24501955659233476, -0.24209948255637714, -0.23917940852041852, -0.2362593344844599, -0.23333926044850223, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2304191864125435, -0.2263178810205334, -0.2222165756285237, -0.21811527023651361, -0.21401396484450352, -0.20991265945249343, -0.20581135406048334, -0.20171004866847364, -0.19760874327646344, -0.19350743788445357, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.18940613249244354, -0.17073317899040996, -0.15206022548837705, -0.13338727198634315, -0.11471431848431002, -0.09604136498227711, -0.07736841148024376, -0.05869545797821085, -0.040022504476176834, -0.021349550974143927, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977, -0.0026765974721107977]]}}, "body": "<div class=\"top-container no-select\">\n  <div style=\"display:flex;padding:0 1.0em;align-items: flex-end;\">\n    <div class=\"header-box\">\n      <div class=\"header-title\">UNIT-TEST Data File Trot Test</div>\n      <div class=\"header-summary\">A test run to verify that the simulation system works with data loaded from file</div>\n      <div class=\"header-entry date\">\n        <span class=\"name\">Date:</span>\n        <span class=\"value\">10-18-2026 12:28</span>\n      </div>\n      <div class=\"header-entry duty-cycle\">\n        <span class=\"name\">Duty Cycle:</span>\n        <span class=\"value\">50%</span>\n      </div>\n      <div class=\"header-entry activity-phases\">\n        <span class=\"name\">Activity Phases:</span>\n          <span class=\"value\">\n            Pes: (<span class=\"left_pes-value\">0%</span>,\n            <span class=\"right_pes-value\">50%</span>)\n            Manus: (<span class=\"left_manus-value\">50%</span>,\n            <span class=\"right_manus-value\">0%</span>)\n          </span>\n      </div>\n      <div class=\"header-entry support-phases\">\n        <span class=\"name\">Support Phases:</span>\n          <span class=\"value\">\n            Pes: (<span class=\"left_pes-value\">0%</span>,\n            <span class=\"right_pes-value\">50%</span>)\n            Manus: (<span class=\"left_manus-value\">50%</span>,\n            <span class=\"right_manus-value\">0%</span>)\n          </span>\n      </div>\n    </div>\n    <div class=\"spacer\"></div>\n\n    <div class=\"playback-controls\">\n      <div class=\"control-row\">\n        <div class=\"spacer\"></div>\n\n        <div class=\"control\" data-role=\"pop-out\">\n          <img src=\"img/picture-in-picture.svg\"/>\n        </div>\n\n        <div class=\"control\" data-role=\"save-svg\">\n          <img src=\"img/camera.svg\"/>\n        </div>\n      </div>\n\n      <div class=\"control-row animation-controls\">\n        <div class=\"spacer\"></div>\n\n        <div class=\"control\" data-role=\"backward-10\">\n          <img src=\"img/replay-10.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"jump-back\">\n          <img src=\"img/back.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"frame-back\">\n          <img src=\"img/step-back.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"toggle-play\">\n          <img src=\"img/play.svg\" class=\"play-icon\"/>\n          <img src=\"img/pause.svg\" class=\"pause-icon\"/>\n        </div>\n        <div class=\"control\" data-role=\"frame-forward\">\n          <img src=\"img/step-forward.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"jump-forward\">\n          <img src=\"img/forward.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"forward-10\">\n          <img src=\"img/forward-10.svg\"/>\n        </div>\n      </div>\n\n\n    </div>\n  </div>\n\n  <div class=\"progress-bar\">\n    <div class=\"header\">\n      <div class=\"value-box\">\n        <div class=\"header\">Left Pes</div>\n        <div class=\"swatch left_pes_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Right Pes</div>\n        <div class=\"swatch right_pes_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Left Manus</div>\n        <div class=\"swatch left_manus_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Right Manus</div>\n        <div class=\"swatch right_manus_color\"></div>\n      </div>\n\n      <div class=\"spacer\"></div>\n\n      <div class=\"time-box\">\n\n        <div class=\"value-box\">\n          <div class=\"header\">Progress</div>\n          <div class=\"value progress-value\"></div>\n        </div>\n\n        <div class=\"value-box activity-time-box\">\n          <div class=\"header\">Activity Cycle</div>\n          <div class=\"value\">\n            <span class=\"cycle-value\"></span> :\n            <span class=\"phase-value\"></span>\n          </div>\n        </div>\n\n        <div class=\"value-box support-time-box\">\n          <div class=\"header\">Support Cycle</div>\n          <div class=\"value\">\n            <span class=\"cycle-value\"></span> :\n            <span class=\"phase-value\"></span>\n          </div>\n        </div>\n\n      </div>\n    </div>\n\n    <div class=\"outer\">\n      <div class=\"inner\"></div>\n      <div class=\"cycles left_pes left_pes_color\"></div>\n      <div class=\"cycles left_manus left_manus_color\"></div>\n      <div class=\"cycles right_manus right_manus_color\"></div>\n      <div class=\"cycles right_pes right_pes_color\"></div>\n    </div>\n  </div>\n</div>\n\n        <div class=\"svg-box\">\n          <div class=\"svg-box-inner\">\n<svg version=\"1.1\"\n    id=\"svg-209845694866\"\n    xmlns:xlink=\"http://www.w3.org/1999/xlink\"\n    xmlns=\"http://www.w3.org/2000/svg\"\n    viewBox=\"-16 -99 2082 140\">\n\n<style>\n/* <![CDATA[ */\n#svg-209845694866 .left_pes { fill: DodgerBlue; opacity: 0.5; }\n#svg-209845694866 .right_pes { fill: DarkOrange; opacity: 0.5; }\n#svg-209845694866 .left_manus { fill: DarkOliveGreen; opacity: 0.5; }\n#svg-209845694866 .right_manus { fill: DarkOrchid; opacity: 0.5; }\n#svg-209845694866 .left_pes { fill: DodgerBlue; opacity: 0.5; stroke-width: 8px; stroke: DodgerBlue; }\n#svg-209845694866 .left_pes.assumed { fill: white; opacity: 0.33; }\n#svg-209845694866 .left_pes-marker { fill: transparent; stroke-width: 8px; stroke: DodgerBlue; }\n#svg-209845694866 .right_pes { fill: DarkOrange; opacity: 0.5; stroke-width: 8px; stroke: DarkOrange; }\n#svg-209845694866 .right_pes.assumed { fill: white; opacity: 0.33; }\n#svg-209845694866 .right_pes-marker { fill: transparent; stroke-width: 8px; stroke: DarkOrange; }\n#svg-209845694866 .left_manus { fill: DarkOliveGreen; opacity: 0.5; stroke-width: 8px; stroke: DarkOliveGreen; stroke-dasharray: 4,4; }\n#svg-209845694866 .left_manus.assumed { fill: white; opacity: 0.33; stroke-dasharray: 4,4; }\n#svg-209845694866 .left_manus-marker { fill: transparent; stroke-width: 8px; stroke: DarkOliveGreen; stroke-dasharray: 8,4; }\n#svg-209845694866 .right_manus { fill: DarkOrchid; opacity: 0.5; stroke-width: 8px; stroke: DarkOrchid; stroke-dasharray: 4,4; }\n#svg-209845694866 .right_manus.assumed { fill: white; opacity: 0.33; stroke-dasharray: 4,4; }\n#svg-209845694866 .right_manus-marker { fill: transparent; stroke-width: 8px; stroke: DarkOrchid; stroke-dasharray: 8,4; }\n/* ]]> */\n</style>\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"5.062982420907686\" cy=\"-65.54760487789716\" data-x=\"0.05\" data-x-unc=\"0.03\" data-y=\"0.64\" data-y-unc=\"0.04\" data-color=\"DodgerBlue\" data-uid=\"track3dIU~-1-2Zaw5moOBawX\" data-name=\"BEB-500-2014-1-S-1-L-P-1\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"380.76968458108587\" cy=\"-28.957956225676927\" data-x=\"3.74\" data-x-unc=\"0.04\" data-y=\"0.28\" data-y-unc=\"0.05\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"track3dIU~-F-klOXKnqXAwUQ\" data-name=\"BEB-500-2014-1-S-1-L-P-3\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"552.3486344791373\" cy=\"-31.64828147624938\" data-x=\"5.42\" data-x-unc=\"0.06\" data-y=\"0.31\" data-y-unc=\"0.06\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"track3dIU~-N-W9Di8PIeUMSL\" data-name=\"BEB-500-2014-1-S-1-L-P-4\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"739.5845992656913\" cy=\"-41.93420254198847\" data-x=\"7.26\" data-x-unc=\"0.03\" data-y=\"0.41000000000000003\" data-y-unc=\"0.03\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"track3dIU~-U-HL659ZxCYYpn\" data-name=\"BEB-500-2014-1-S-1-L-P-5\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"929.157242220293\" cy=\"-38.11870600571822\" data-x=\"9.120000000000001\" data-x-unc=\"0.03\" data-y=\"0.37\" data-y-unc=\"0.04\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"track3dIU~-a-iPUQsRtimaGK\" data-name=\"BEB-500-2014-1-S-1-L-P-6\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"1306.2932391374914\" cy=\"-63.02995082063156\" data-x=\"12.83\" data-x-unc=\"0.03\" data-y=\"0.62\" data-y-unc=\"0.04\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"track3dIV0-m-TuNq3IwJiB5D\" data-name=\"BEB-500-2014-1-S-1-L-P-8\" />\n<circle id=\"left_pes\" class=\"left_pes-marker\" r=\"16.0\" cx=\"5.062982420907686\" cy=\"-65.54760487789716\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"98.4765959293042\" cy=\"-17.99756337799286\" data-x=\"0.97\" data-x-unc=\"0.05\" data-y=\"0.18\" data-y-unc=\"0.05\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"track3dIU~-3-SWwV3EO20FTf\" data-name=\"BEB-500-2014-1-S-1-R-P-1\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"288.4524095776323\" cy=\"1.1222983648421785\" data-x=\"2.83\" data-x-unc=\"0.05\" data-y=\"-0.01\" data-y-unc=\"0.05\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"track3dIU~-A-CzgTW36l4bIB\" data-name=\"BEB-500-2014-1-S-1-R-P-2\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"468.54647025453386\" cy=\"12.980517945173043\" data-x=\"4.6000000000000005\" data-x-unc=\"0.05\" data-y=\"-0.13\" data-y-unc=\"0.05\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"track3dIU~-H-HK3XTChFKLgz\" data-name=\"BEB-500-2014-1-S-1-R-P-3\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"648.1428826907527\" cy=\"8.520379808298134\" data-x=\"6.36\" data-x-unc=\"0.03\" data-y=\"-0.08\" data-y-unc=\"0.03\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"track3dIU~-P-f26EVYZWDc6q\" data-name=\"BEB-500-2014-1-S-1-R-P-4\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"825.238922370901\" cy=\"-0.8207657878635223\" data-x=\"8.1\" data-x-unc=\"0.05\" data-y=\"0.01\" data-y-unc=\"0.05\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"track3dIU~-W-abIXvWj8lNnR\" data-name=\"BEB-500-2014-1-S-1-R-P-5\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"1200.939060054459\" cy=\"-8.210705281015402\" data-x=\"11.790000000000001\" data-x-unc=\"0.06\" data-y=\"0.08\" data-y-unc=\"0.06\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"track3dIU~-h-mOBRibe3tOYC\" data-name=\"BEB-500-2014-1-S-1-R-P-7\" />\n<circle id=\"right_pes\" class=\"right_pes-marker\" r=\"16.0\" cx=\"98.4765959293042\" cy=\"-17.99756337799286\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"44.488952283033505\" cy=\"-81.49461688389208\" data-x=\"0.44\" data-x-unc=\"0.03\" data-y=\"0.8\" data-y-unc=\"0.03\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"track3dIU~-5-qxz1RxG2xSVd\" data-name=\"BEB-500-2014-1-S-1-L-M-1\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"415.6925571717559\" cy=\"-38.348625433040425\" data-x=\"4.08\" data-x-unc=\"0.04\" data-y=\"0.38\" data-y-unc=\"0.04\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"track3dIU~-J-ydlVsyyoHCFs\" data-name=\"BEB-500-2014-1-S-1-L-M-3\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"954.5510115214747\" cy=\"-61.9634424970275\" data-x=\"9.370000000000001\" data-x-unc=\"0.03\" data-y=\"0.61\" data-y-unc=\"0.03\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"track3dIU~-d-5NH4iKwWviKk\" data-name=\"BEB-500-2014-1-S-1-L-M-6\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"1318.1524561184092\" cy=\"-78.45405408004895\" data-x=\"12.94\" data-x-unc=\"0.03\" data-y=\"0.77\" data-y-unc=\"0.03\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"track3dIV0-q-3jYzhXQEDCy1\" data-name=\"BEB-500-2014-1-S-1-L-M-8\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"1515.081218782474\" cy=\"-83.50631800456458\" data-x=\"14.88\" data-x-unc=\"0.04\" data-y=\"0.8200000000000001\" data-y-unc=\"0.04\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"track3dIV0-w-yi8c56LEWOfp\" data-name=\"BEB-500-2014-1-S-1-L-M-9\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"2052.674072963193\" cy=\"-54.84065174414025\" data-x=\"20.16\" data-x-unc=\"0.03\" data-y=\"0.54\" data-y-unc=\"0.03\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"track3dIV0-1F-VKjEsZEQqOuA\" data-name=\"BEB-500-2014-1-S-1-L-M-12\" />\n<circle id=\"left_manus\" class=\"left_manus-marker\" r=\"12.0\" cx=\"44.488952283033505\" cy=\"-81.49461688389208\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"132.36677998006047\" cy=\"5.437437942970133\" data-x=\"1.3\" data-x-unc=\"0.06\" data-y=\"-0.05\" data-y-unc=\"0.06\" data-color=\"DarkOrchid\" data-uid=\"track3dIU~-7-ZpH4ZKwRRomg\" data-name=\"BEB-500-2014-1-S-1-R-M-1\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"323.64001877990285\" cy=\"27.50479967076892\" data-x=\"3.18\" data-x-unc=\"0.05\" data-y=\"-0.27\" data-y-unc=\"0.05\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"track3dIU~-D-9iP3cH5XPQqF\" data-name=\"BEB-500-2014-1-S-1-R-M-2\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"510.71228897843537\" cy=\"26.439288747752006\" data-x=\"5.01\" data-x-unc=\"0.03\" data-y=\"-0.26\" data-y-unc=\"0.03\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"track3dIU~-L-aBtv84x1aFgU\" data-name=\"BEB-500-2014-1-S-1-R-M-3\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"685.3332164084084\" cy=\"23.46553085630633\" data-x=\"6.73\" data-x-unc=\"0.05\" data-y=\"-0.23\" data-y-unc=\"0.05\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"track3dIU~-S-LrveB6VXhC3o\" data-name=\"BEB-500-2014-1-S-1-R-M-4\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"861.8876513127057\" cy=\"19.288825360304845\" data-x=\"8.46\" data-x-unc=\"0.05\" data-y=\"-0.19\" data-y-unc=\"0.05\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"track3dIU~-Z-okwAlbpgLTYH\" data-name=\"BEB-500-2014-1-S-1-R-M-5\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"1241.618498532931\" cy=\"0.2725805153190504\" data-x=\"12.19\" data-x-unc=\"0.04\" data-y=\"0.0\" data-y-unc=\"0.04\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"track3dIV0-k-fnSGS1iaSllS\" data-name=\"BEB-500-2014-1-S-1-R-M-7\" />\n<circle id=\"right_manus\" class=\"right_manus-marker\" r=\"12.0\" cx=\"132.36677998006047\" cy=\"5.437437942970133\" />\n</svg></div>\n          <div class=\"svg-controls-box\" style=\"display:none\">\n            <div>\n                <div>Activity: <span class=\"activity-status\"></span></div>\n                <div>Support: <span class=\"support-status\"></span></div>\n            </div>\n            <div class=\"spacer\"></div>\n          </div>\n        </div>\n        \n<div class=\"line-break\"></div>\n\n<div class=\"results-container\">\n  <div class=\"settings-box info-display-box\">\n    <div class=\"info-header\">Trial Results</div>\n\n    <div class=\"info-row\">\n      <div id=\"lengthResults\" class=\"entry\">\n        <div class=\"title title-box\">Average Calculated Lengths (m)</div>\n\n        <div>\n          <span class=\"label\">Coupling Length:</span>\n          <span class=\"value\">2 &#177; 1.0</span>\n          <!-- span class=\"deviation\"> </span -->\n        </div>\n\n        <div>\n          <span class=\"label\">Coupling IQR:</span>\n          <span class=\"value\">[0.5135, 3.05]</span>\n        </div>\n\n        <div>\n          <span class=\"label\">Coupling Bounds (2%):</span>\n          <span class=\"value\">[0.08893, 4.121]</span>\n        </div>\n      </div>\n    </div>\n  </div>\n\n  <div class=\"status-box info-display-box\">\n    <div class=\"info-header\">Display Status</div>\n\n    <div class=\"info-row\">\n      <div class=\"entry left_pes\">\n        <div class=\"title left_pes_color\">Left Pes</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n\n      <div class=\"entry left_manus\">\n        <div class=\"title left_manus_color\">Left Manus</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n    </div>\n\n    <div class=\"info-row\">\n      <div class=\"entry right_pes\">\n        <div class=\"title right_pes_color\">Right Pes</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n\n      <div class=\"entry right_manus\">\n        <div class=\"title right_manus_color\">Right Manus</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n    </div>\n  </div>\n</div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"9eadb61a-093a-4ced-986e-324fdace7ab9\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"9eadb61a-093a-4ced-986e-324fdace7ab9\")) {\n                    Plotly.newPlot(\n                        '9eadb61a-093a-4ced-986e-324fdace7ab9',\n                        [{\"mode\": \"lines\", \"type\": \"scatter\", \"uid\": \"17ab4e1a-965c-475b-82bf-049cdae0f3fe\", \"x\": [-0.4999999999999999, -0.4787148594377509, -0.4574297188755019, -0.4361445783132529, -0.41485943775100387, -0.39357429718875486, -0.37228915662650586, -0.35100401606425685, -0.32971887550200785, -0.30843373493975884, -0.28714859437750984, -0.26586345381526083, -0.24457831325301183, -0.22329317269076282, -0.20200803212851381, -0.1807228915662648, -0.1594377510040158, -0.1381526104417668, -0.1168674698795178, -0.09558232931726879, -0.07429718875501978, -0.053012048192770785, -0.031726907630521786, -0.010441767068272788, 0.01084337349397621, 0.03212851405622521, 0.05341365461847421, 0.0746987951807232, 0.0959839357429722, 0.11726907630522121, 0.13855421686747021, 0.15983935742971922, 0.18112449799196823, 0.20240963855421723, 0.22369477911646624, 0.24497991967871524, 0.26626506024096425, 0.28755020080321325, 0.30883534136546226, 0.33012048192771126, 0.35140562248996027, 0.3726907630522093, 0.3939759036144583, 0.4152610441767073, 0.4365461847389563, 0.4578313253012053, 0.4791164658634543, 0.5004016064257033, 0.5216867469879523, 0.5429718875502012, 0.5642570281124502, 0.5855421686746991, 0.606827309236948, 0.628112449799197, 0.649397590361446, 0.6706827309236949, 0.6919678714859439, 0.7132530120481928, 0.7345381526104418, 0.7558232931726907, 0.7771084337349397, 0.7983935742971886, 0.8196787148594376, 0.8409638554216865, 0.8622489959839355, 0.8835341365461844, 0.9048192771084334, 0.9261044176706823, 0.9473895582329313, 0.9686746987951802, 0.9899598393574291, 1.011244979919678, 1.032530120481927, 1.053815261044176, 1.075100401606425, 1.096385542168674, 1.1176706827309228, 1.1389558232931718, 1.1602409638554207, 1.1815261044176697, 1.2028112449799186, 1.2240963855421676, 1.2453815261044165, 1.2666666666666655, 1.2879518072289144, 1.3092369477911634, 1.3305220883534123, 1.3518072289156613, 1.3730923694779102, 1.3943775100401592, 1.4156626506024081, 1.436947791164657, 1.458232931726906, 1.479518072289155, 1.500803212851404, 1.522088353413653, 1.5433734939759018, 1.5646586345381508, 1.5859437751003997, 1.6072289156626487, 1.6285140562248976, 1.6497991967871466, 1.6710843373493955, 1.6923694779116445, 1.7136546184738934, 1.7349397590361424, 1.7562248995983913, 1.7775100401606403, 1.7987951807228892, 1.8200803212851382, 1.8413654618473871, 1.862650602409636, 1.883935742971885, 1.905220883534134, 1.926506024096383, 1.947791164658632, 1.9690763052208808, 1.9903614457831298, 2.0116465863453787, 2.032931726907628, 2.054216867469877, 2.0755020080321263, 2.0967871485943754, 2.1180722891566246, 2.1393574297188738, 2.160642570281123, 2.181927710843372, 2.2032128514056213, 2.2244979919678705, 2.2457831325301196, 2.267068273092369, 2.288353413654618, 2.309638554216867, 2.3309236947791163, 2.3522088353413655, 2.3734939759036147, 2.394779116465864, 2.416064257028113, 2.437349397590362, 2.4586345381526113, 2.4799196787148605, 2.5012048192771097, 2.522489959839359, 2.543775100401608, 2.565060240963857, 2.5863453815261064, 2.6076305220883556, 2.6289156626506047, 2.650200803212854, 2.671485943775103, 2.6927710843373522, 2.7140562248996014, 2.7353413654618506, 2.7566265060240998, 2.777911646586349, 2.799196787148598, 2.8204819277108473, 2.8417670682730964, 2.8630522088353456, 2.884337349397595, 2.905622489959844, 2.926907630522093, 2.9481927710843423, 2.9694779116465915, 2.9907630522088406, 3.01204819277109, 3.033333333333339, 3.054618473895588, 3.0759036144578373, 3.0971887550200865, 3.1184738955823357, 3.139759036144585, 3.161044176706834, 3.182329317269083, 3.2036144578313324, 3.2248995983935815, 3.2461847389558307, 3.26746987951808, 3.288755020080329, 3.310040160642578, 3.3313253012048274, 3.3526104417670766, 3.3738955823293257, 3.395180722891575, 3.416465863453824, 3.4377510040160733, 3.4590361445783224, 3.4803212851405716, 3.5016064257028208, 3.52289156626507, 3.544176706827319, 3.5654618473895683, 3.5867469879518175, 3.6080321285140666, 3.629317269076316, 3.650602409638565, 3.671887550200814, 3.6931726907630633, 3.7144578313253125, 3.7357429718875617, 3.757028112449811, 3.77831325301206, 3.799598393574309, 3.8208835341365583, 3.8421686746988075, 3.8634538152610567, 3.884738955823306, 3.906024096385555, 3.927309236947804, 3.9485943775100534, 3.9698795180723025, 3.9911646586345517, 4.0124497991968004, 4.033734939759049, 4.055020080321298, 4.076305220883547, 4.097590361445795, 4.118875502008044, 4.140160642570293, 4.1614457831325415, 4.18273092369479, 4.204016064257039, 4.225301204819288, 4.2465863453815365, 4.267871485943785, 4.289156626506034, 4.310441767068283, 4.331726907630531, 4.35301204819278, 4.374297188755029, 4.3955823293172775, 4.416867469879526, 4.438152610441775, 4.459437751004024, 4.4807228915662725, 4.502008032128521, 4.52329317269077, 4.544578313253019, 4.565863453815267, 4.587148594377516, 4.608433734939765, 4.6297188755020136, 4.651004016064262, 4.672289156626511, 4.69357429718876, 4.7148594377510085, 4.736144578313257, 4.757429718875506, 4.778714859437755, 4.800000000000001], \"y\": [0.0013509254857183254, 0.0016701709363448351, 0.0020554925002942122, 0.0025185156424963437, 0.003072584260718679, 0.003733007077225622, 0.004517356442969028, 0.005445832973141547, 0.006541710249032035, 0.007831873147676251, 0.009347460455761356, 0.011124616477550062, 0.013205346573551236, 0.015638457355962445, 0.01848054340660966, 0.02179695941569436, 0.025662691456642704, 0.03016301800045558, 0.03539383874203149, 0.041461563041583945, 0.04848251660524039, 0.056581986396417934, 0.06589333414646381, 0.07655811973082183, 0.08872889218752737, 0.10257710560851127, 0.11830913858554752, 0.1361929518249112, 0.1565955389144689, 0.18002608099062326, 0.20717141525893903, 0.23890056551910402, 0.2762075760948235, 0.3200628027053249, 0.3711583459011793, 0.42956605874935294, 0.4943713871427591, 0.5633884892757162, 0.6330804258119436, 0.6987837700196609, 0.755264507318212, 0.7975279607212987, 0.8217058923422349, 0.825791400660879, 0.8100154838505248, 0.7767568659976049, 0.7300150454171757, 0.6746032105898713, 0.6152857570916459, 0.556074069942254, 0.49981697637175765, 0.44811596785429103, 0.4015019362217212, 0.3597583258361638, 0.32227176647849964, 0.28832285846415645, 0.25727553793224844, 0.2286642079926733, 0.2022030013641718, 0.17774982408630532, 0.15525394615716806, 0.13470640343498744, 0.11610265325894499, 0.09941962962522824, 0.0846052343593543, 0.07157676617018335, 0.06022481881854908, 0.05041989744075841, 0.042019855127609036, 0.034876981062645335, 0.02884410614566618, 0.02377945045322982, 0.01955016352039383, 0.01603464453679299, 0.013123805123058758, 0.010721472220529833, 0.00874413589129819, 0.007120235706274985, 0.005789156883451737, 0.004700078923708276, 0.0038107894422404216, 0.0030865473272676134, 0.0024990543145573052, 0.002025573622776657, 0.0016482187185829446, 0.0013534242091223277, 0.0011316034781921674, 0.0009769928849988577, 0.0008876788734898428, 0.0008658009032519217, 0.000917918486337238, 0.001055523743103624, 0.0012956709931517256, 0.0016616815830162888, 0.002183865541299392, 0.002900182497605366, 0.003856744086591746, 0.005108041046154056, 0.0067167634416171965, 0.008753075639306449, 0.011293213188699901, 0.01441729179033085, 0.018206265545747283, 0.02273805217724987, 0.028082972173338452, 0.03429885178560658, 0.04142645321825912, 0.04948636201544003, 0.058479105471912735, 0.06839104440638072, 0.07920925019032717, 0.09094864649942372, 0.10369333288543112, 0.11765021103633896, 0.13320610733381277, 0.1509699754779041, 0.17177199917870806, 0.19658650557424284, 0.22635206612915348, 0.2616851988203215, 0.3025233957690246, 0.3477794818475778, 0.39512428247572673, 0.4410166440958998, 0.48105459901648634, 0.510632461774371, 0.5257817505290329, 0.5239901683374355, 0.5047714477144397, 0.4698166847575534, 0.42267872364458087, 0.3680807996770326, 0.3110459969158614, 0.2560777484322094, 0.20657779569933687, 0.16459221705482488, 0.13087021326943205, 0.10514232879570096, 0.08649404529656089, 0.07372450319518895, 0.06562068702400078, 0.06112323596592983, 0.05939524901540032, 0.05982371863129285, 0.06198642325916226, 0.06561129911919737, 0.07054676209805553, 0.0767542191104074, 0.08432925868361893, 0.09355446721792314, 0.10498175136901312, 0.11953256208025324, 0.13858909676763845, 0.16403040347212958, 0.19815128028819895, 0.2434006186912299, 0.30190221815705315, 0.3747819974846372, 0.46141346031766906, 0.5587815836278777, 0.661212635653109, 0.760683721674532, 0.8477950538168184, 0.9132858649385139, 0.9497690958515502, 0.9532360051612714, 0.9239038042375245, 0.8661549158116741, 0.7875866088365235, 0.6974527381313194, 0.6049365777512846, 0.517694529094483, 0.44097115987549035, 0.3773758773029801, 0.32721579446405485, 0.2891609264295133, 0.26099655143326134, 0.2402728954461022, 0.22475274435616932, 0.2126430495005696, 0.2026529092649777, 0.19394226786659613, 0.18602139446305008, 0.17864367011387525, 0.1717145970033877, 0.16522468485410974, 0.15920484035842783, 0.15369913450724637, 0.14874938494583712, 0.14438706725911024, 0.14062948793558838, 0.13747835157343025, 0.13491968084216382, 0.13292454251112834, 0.13145029788416454, 0.1304422242482355, 0.1298354099838577, 0.1295568478250439, 0.12952765827159718, 0.1296653777543324, 0.12988624790151176, 0.13010744474697236, 0.13024919049028152, 0.13023669556546233, 0.1300018852161194, 0.12948487234571304, 0.12863514689716388, 0.12741246116490998, 0.12578739997639857, 0.12374163430090857, 0.12126786624422273, 0.1183694822626113, 0.11505993948804338, 0.11136191703528313, 0.10730626983746779, 0.10293082675805203, 0.09827907734188958, 0.093398792550895, 0.08834062420266611, 0.0831567256830294, 0.07789943298685048, 0.0726200404600622, 0.0673677000160426, 0.06218846635604321, 0.057124504124983884, 0.05221346626824082, 0.047488046394512366, 0.042975701939117206, 0.03869853956766036, 0.03467334972264718, 0.03091177360578575, 0.027420583265140408, 0.02420205382756595, 0.0212544062455782, 0.01857229913698966, 0.016147349276531057, 0.013968661919698694, 0.012023354254916572, 0.010297057740664093, 0.008774387742661626, 0.00743937160591723, 0.006275828956527202, 0.005267700527328011, 0.004399324060494204, 0.0036556578023633334, 0.003022453736697132, 0.00248638398827809, 0.00203512477314122, 0.0016574028936238263, 0.001343010105973612]}],\n                        {\"title\": {\"text\": \"Coupling Length Distribution\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Coupling Distance (m)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Expectation (au)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"3c375055-7245-45d7-ad8d-33f46f200d74\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"3c375055-7245-45d7-ad8d-33f46f200d74\")) {\n                    Plotly.newPlot(\n                        '3c375055-7245-45d7-ad8d-33f46f200d74',\n                        [{\"legendgroup\": \"Length\", \"line\": {\"color\": \"rgba(31, 119, 180, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Length\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"fd4f9a7f-7437-42fd-a7d8-ee369b3de8e5\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0], \"y\": [0.2, 0.3, 0.30000000000000004, 0.10000000000000003, 2.1, 1.9000000000000001, 2.9, 2.9, 2.8000000000000003, 2.8000000000000003, 3.6000000000000005]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Length\", \"marker\": {\"color\": \"rgba(31, 119, 180, 1.0)\"}, \"mode\": \"markers\", \"name\": \"Length\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"19659bef-0734-4ade-af08-51bfe660f76a\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0], \"y\": [0.4, 0.5, 0.4, 0.4, 2.2, 2.1, 3.0, 3.0, 3.1, 3.1, 3.9000000000000004]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Length\", \"line\": {\"color\": \"rgba(31, 119, 180, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Length\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"528d00e6-1105-4bd7-8aab-e6d515dc3557\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0], \"y\": [0.6000000000000001, 0.7, 0.5, 0.7, 2.3000000000000003, 2.3000000000000003, 3.1, 3.1, 3.4, 3.4, 4.2]}],\n                        {\"title\": {\"text\": \"Coupling Lengths\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Length (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"be30a379-f15b-4960-b4d2-ab0f25e3ae97\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"be30a379-f15b-4960-b4d2-ab0f25e3ae97\")) {\n                    Plotly.newPlot(\n                        'be30a379-f15b-4960-b4d2-ab0f25e3ae97',\n                        [{\"legendgroup\": \"Deviation\", \"line\": {\"color\": \"rgba(255, 127, 14, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Deviation\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"2d0ea840-55e0-4d87-a24c-3ce1d8ba1673\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0], \"y\": [-210.0, -190.0, -200.0, -210.0, -20.0, -30.0, 70.0, 60.0, 50.0, 50.0, 130.0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Deviation\", \"marker\": {\"color\": \"rgba(255, 127, 14, 1.0)\"}, \"mode\": \"markers\", \"name\": \"Deviation\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"3cfda1e5-81dd-4fa4-8255-6316d8cceb08\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0], \"y\": [-190.0, -170.0, -190.0, -180.0, -10.0, -10.0, 80.0, 70.0, 80.0, 80.0, 160.0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Deviation\", \"line\": {\"color\": \"rgba(255, 127, 14, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Deviation\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"f0da253c-05c6-4657-ab73-415b39253593\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0], \"y\": [-170.0, -150.0, -180.0, -150.0, 0.0, 10.0, 90.0, 80.0, 110.0, 110.0, 190.0]}],\n                        {\"title\": {\"text\": \"Coupling Length Median Deviations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Median Deviation (%)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"07e22bf9-f035-442b-8b6a-0c0bae742969\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"07e22bf9-f035-442b-8b6a-0c0bae742969\")) {\n                    Plotly.newPlot(\n                        '07e22bf9-f035-442b-8b6a-0c0bae742969',\n                        [{\"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"e2e9c5f0-18fe-4df1-a74e-6164e8398d3f\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95], \"y\": [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.6)\"}, \"mode\": \"markers\", \"name\": \"Rear\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"186e541d-610e-41c9-9b37-e36d68b78d6f\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95], \"y\": [4, 4, 4, 4, 4, 4, 4, 4, 4, 3, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"5f29b33d-22f2-4427-ba8c-f992b2395d2e\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95], \"y\": [7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 6.0, 5.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 4.0, 5.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 6.0]}, {\"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"4fe15883-9001-4662-9caf-fce928edf20d\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95], \"y\": [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, -1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.6)\"}, \"mode\": \"markers\", \"name\": \"Forward\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"b43e1eab-617e-44a3-a402-2a7c449b5057\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95], \"y\": [2, 2, 2, 2, 2, 2, 2, 2, 2, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 3, 2, 2, 2, 2, 2, 2, 2, 2, 2, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 4, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 3, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"f311ae4e-bb43-438b-bb79-9e637f058ce4\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95], \"y\": [3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 4.0, 5.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 6.0, 5.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 5.0, 7.0, 9.0, 9.0, 9.0, 9.0, 9.0, 9.0, 9.0, 9.0, 8.0, 7.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 4.0, 5.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 6.0, 5.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0, 4.0, 5.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 7.0, 8.0, 9.0, 9.0, 9.0, 9.0, 9.0, 9.0, 9.0, 9.0, 9.0]}],\n                        {\"title\": {\"text\": \"Coupler Rate of Advancement\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Advance Rate (m/cycle)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"0ae95cfc-1336-4943-8615-5963f36cdbdd\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"0ae95cfc-1336-4943-8615-5963f36cdbdd\")) {\n                    Plotly.newPlot(\n                        '0ae95cfc-1336-4943-8615-5963f36cdbdd',\n                        [{\"legendgroup\": \"Left pes\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"07fb815e-f99b-479b-836b-01d5790b00a4\", \"x\": [1.5, 2.5, 3.5, 4.5], \"y\": [1.6199999999999999, 1.77, 1.82, 3.67]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Left pes\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Left pes\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"405bb09b-489a-41f1-9b91-69894fa92dc5\", \"x\": [1.5, 2.5, 3.5, 4.5], \"y\": [1.69, 1.84, 1.86, 3.71]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Left pes\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"78274a45-295e-406c-8687-b60434a389de\", \"x\": [1.5, 2.5, 3.5, 4.5], \"y\": [1.76, 1.9100000000000001, 1.9000000000000001, 3.75]}, {\"legendgroup\": \"Right pes\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"95170810-e093-407f-b735-6a11e663e3ba\", \"x\": [1.0, 2.0, 3.0, 4.0, 5.0], \"y\": [1.8, 1.7, 1.7, 1.68, 3.61]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Right pes\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Right pes\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"99431318-1728-4501-8a6a-fd11d53c11e2\", \"x\": [1.0, 2.0, 3.0, 4.0, 5.0], \"y\": [1.87, 1.77, 1.76, 1.74, 3.69]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Right pes\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"4396ca39-676d-4080-9938-3236b6e0ab67\", \"x\": [1.0, 2.0, 3.0, 4.0, 5.0], \"y\": [1.9400000000000002, 1.84, 1.82, 1.8, 3.77]}, {\"legendgroup\": \"Left manus\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"5b4a01bd-2452-4647-aa60-3d9d81124aea\", \"x\": [1.0, 2.0, 3.0, 4.0, 5.0], \"y\": [3.62, 5.25, 3.5300000000000002, 1.88, 5.24]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left manus\", \"marker\": {\"color\": \"rgba(44, 160, 44, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Left manus\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"3b7690ba-ec7a-4e20-a898-18f2eed5bd3f\", \"x\": [1.0, 2.0, 3.0, 4.0, 5.0], \"y\": [3.67, 5.3, 3.5700000000000003, 1.93, 5.29]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left manus\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"d2eda672-61d1-4c98-a4ce-66a46f0209ee\", \"x\": [1.0, 2.0, 3.0, 4.0, 5.0], \"y\": [3.7199999999999998, 5.35, 3.6100000000000003, 1.98, 5.34]}, {\"legendgroup\": \"Right manus\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"4ccaa283-5217-416a-b5eb-01dac7902272\", \"x\": [1.5, 2.5, 3.5, 4.5], \"y\": [1.78, 1.65, 1.66, 3.67]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right manus\", \"marker\": {\"color\": \"rgba(148, 103, 189, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Right manus\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"421fedc3-fbbd-4750-a839-fc8b97c7d2c3\", \"x\": [1.5, 2.5, 3.5, 4.5], \"y\": [1.84, 1.71, 1.73, 3.73]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right manus\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"3c61db5d-3f17-4af5-905e-186157c2623f\", \"x\": [1.5, 2.5, 3.5, 4.5], \"y\": [1.9000000000000001, 1.77, 1.8, 3.79]}],\n                        {\"title\": {\"text\": \"Stepping Distances\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Distance (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"ab475f0e-18ac-4a7b-a446-e8f7f2322a84\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"ab475f0e-18ac-4a7b-a446-e8f7f2322a84\")) {\n                    Plotly.newPlot(\n                        'ab475f0e-18ac-4a7b-a446-e8f7f2322a84',\n                        [{\"legendgroup\": \"Left\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"0283b0d4-6da8-43f7-9a53-0e6f1df0ba08\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95, 5.0], \"y\": [0.10000000000000003, -0.2, 0.10000000000000003, 0.5, 0.7000000000000001, 1.1, 1.5, 1.8000000000000003, 2.2, 2.6, 2.9000000000000004, 2.6, 2.2, 1.8000000000000003, 1.5, 1.1, 0.7000000000000001, 0.4, 0.10000000000000003, -0.30000000000000004, 0.2, 0.0, -0.1, 0.0, 0.10000000000000003, 0.3, 0.5, 0.6000000000000001, 0.8, 1.0000000000000002, 0.8, 0.30000000000000004, -0.19999999999999996, -0.19999999999999996, 0.30000000000000004, 0.8, 1.3, 1.9000000000000004, 2.4000000000000004, 2.9000000000000004, 3.8, 3.6, 3.4, 3.2, 3.0, 2.8, 2.7, 2.5, 2.3, 2.1, 1.7000000000000002, 2.1, 2.4000000000000004, 2.8000000000000003, 3.1, 3.5000000000000004, 3.9, 4.2, 4.6, 4.9, 5.5, 5.3, 5.1000000000000005, 4.9, 4.8, 4.6000000000000005, 4.4, 4.2, 4.0, 3.8, 3.6, 3.8, 4.0, 4.2, 4.4, 4.6000000000000005, 4.8, 5.0, 5.2, 5.4, 5.4, 5.0, 4.6, 4.3, 3.9, 3.5000000000000004, 3.1, 2.8000000000000003, 2.4000000000000004, 2.0000000000000004, 1.6, 2.1, 2.6, 3.1, 3.7, 4.2, 4.7, 5.2, 5.800000000000001, 6.300000000000001, 7.1000000000000005]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left\", \"marker\": {\"color\": \"rgba(44, 160, 44, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Left\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"1657a307-c65a-4fac-968e-c7ddf42384ac\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95, 5.0], \"y\": [0.4, 0.2, 0.4, 0.8, 1.1, 1.5, 1.9000000000000001, 2.2, 2.6, 3.0, 3.3000000000000003, 3.0, 2.6, 2.2, 1.9000000000000001, 1.5, 1.1, 0.8, 0.4, 0.1, 0.4, 0.2, 0.1, 0.2, 0.30000000000000004, 0.5, 0.7000000000000001, 0.8, 1.0, 1.2000000000000002, 1.3, 0.8, 0.30000000000000004, 0.30000000000000004, 0.8, 1.3, 1.8, 2.4000000000000004, 2.9000000000000004, 3.4000000000000004, 4.0, 3.8000000000000003, 3.6, 3.4000000000000004, 3.2, 3.0, 2.9000000000000004, 2.7, 2.5, 2.3000000000000003, 2.1, 2.5, 2.8000000000000003, 3.2, 3.5, 3.9000000000000004, 4.3, 4.6000000000000005, 5.0, 5.300000000000001, 5.7, 5.5, 5.300000000000001, 5.1000000000000005, 5.0, 4.800000000000001, 4.6000000000000005, 4.4, 4.2, 4.0, 3.8000000000000003, 4.0, 4.2, 4.4, 4.6000000000000005, 4.800000000000001, 5.0, 5.2, 5.4, 5.6000000000000005, 5.800000000000001, 5.4, 5.0, 4.7, 4.3, 3.9000000000000004, 3.5, 3.2, 2.8000000000000003, 2.4000000000000004, 2.1, 2.6, 3.1, 3.6, 4.2, 4.7, 5.2, 5.7, 6.300000000000001, 6.800000000000001, 7.300000000000001]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"d47ac971-0c00-4f04-8d3c-8e274445270e\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95, 5.0], \"y\": [0.7, 0.6000000000000001, 0.7, 1.1, 1.5, 1.9, 2.3000000000000003, 2.6, 3.0, 3.4, 3.7, 3.4, 3.0, 2.6, 2.3000000000000003, 1.9, 1.5, 1.2000000000000002, 0.7, 0.5, 0.6000000000000001, 0.4, 0.30000000000000004, 0.4, 0.5, 0.7, 0.9000000000000001, 1.0, 1.2, 1.4000000000000001, 1.8, 1.3, 0.8, 0.8, 1.3, 1.8, 2.3, 2.9000000000000004, 3.4000000000000004, 3.9000000000000004, 4.2, 4.0, 3.8000000000000003, 3.6000000000000005, 3.4000000000000004, 3.2, 3.1000000000000005, 2.9000000000000004, 2.7, 2.5000000000000004, 2.5, 2.9, 3.2, 3.6, 3.9, 4.300000000000001, 4.7, 5.000000000000001, 5.4, 5.700000000000001, 5.9, 5.7, 5.500000000000001, 5.300000000000001, 5.2, 5.000000000000001, 4.800000000000001, 4.6000000000000005, 4.4, 4.2, 4.0, 4.2, 4.4, 4.6000000000000005, 4.800000000000001, 5.000000000000001, 5.2, 5.4, 5.6000000000000005, 5.800000000000001, 6.200000000000001, 5.800000000000001, 5.4, 5.1000000000000005, 4.7, 4.300000000000001, 3.9, 3.6, 3.2, 2.8000000000000003, 2.6, 3.1, 3.6, 4.1, 4.7, 5.2, 5.7, 6.2, 6.800000000000001, 7.300000000000001, 7.500000000000001]}, {\"legendgroup\": \"Right\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"17140c19-47ad-4766-bcd1-0eeca4e72a09\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95, 5.0], \"y\": [0.2, 0.4000000000000001, 0.6000000000000001, 0.7, 0.9000000000000001, 1.1, 1.3, 1.5000000000000002, 1.7000000000000002, 1.9000000000000001, 2.1, 1.9000000000000001, 1.7000000000000002, 1.5000000000000002, 1.3, 1.1, 0.9000000000000001, 0.8, 0.6000000000000001, 0.4000000000000001, 0.2, 0.4000000000000001, 0.6000000000000001, 0.7, 0.9000000000000001, 1.1, 1.3, 1.5000000000000002, 1.6, 1.8, 2.0, 1.8, 1.6, 1.5000000000000002, 1.3, 1.1, 0.9000000000000001, 0.8, 0.6000000000000001, 0.4000000000000001, 0.2, 0.4000000000000001, 0.6000000000000001, 0.7, 0.9000000000000001, 1.1, 1.2000000000000002, 1.4000000000000001, 1.6, 1.8, 1.9000000000000001, 1.8, 1.6, 1.4000000000000001, 1.2000000000000002, 1.1, 0.9000000000000001, 0.7, 0.5, 0.4000000000000001, 0.2, 0.4000000000000001, 0.5, 0.7, 0.9000000000000001, 1.0000000000000002, 1.2000000000000002, 1.4000000000000001, 1.6, 1.7000000000000002, 1.9000000000000001, 1.7000000000000002, 1.6, 1.4000000000000001, 1.2000000000000002, 1.0000000000000002, 0.9000000000000001, 0.7, 0.5, 0.4000000000000001, 0.10000000000000003, 0.4, 0.7000000000000001, 1.1, 1.5, 1.8000000000000003, 2.2, 2.6, 2.9000000000000004, 3.3000000000000003, 3.7000000000000006, 3.3000000000000003, 3.0000000000000004, 2.6, 2.2, 1.8000000000000003, 1.5, 1.1, 0.7000000000000001, 0.4, -0.09999999999999998]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right\", \"marker\": {\"color\": \"rgba(148, 103, 189, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Right\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"4a84dd3a-050c-4224-b75d-6532c0fdf82e\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95, 5.0], \"y\": [0.4, 0.6000000000000001, 0.8, 0.9, 1.1, 1.3, 1.5, 1.7000000000000002, 1.9000000000000001, 2.1, 2.3000000000000003, 2.1, 1.9000000000000001, 1.7000000000000002, 1.5, 1.3, 1.1, 1.0, 0.8, 0.6000000000000001, 0.4, 0.6000000000000001, 0.8, 0.9, 1.1, 1.3, 1.5, 1.7000000000000002, 1.8, 2.0, 2.2, 2.0, 1.8, 1.7000000000000002, 1.5, 1.3, 1.1, 1.0, 0.8, 0.6000000000000001, 0.4, 0.6000000000000001, 0.8, 0.9, 1.1, 1.3, 1.4000000000000001, 1.6, 1.8, 2.0, 2.1, 2.0, 1.8, 1.6, 1.4000000000000001, 1.3, 1.1, 0.9, 0.7000000000000001, 0.6000000000000001, 0.4, 0.6000000000000001, 0.7000000000000001, 0.9, 1.1, 1.2000000000000002, 1.4000000000000001, 1.6, 1.8, 1.9000000000000001, 2.1, 1.9000000000000001, 1.8, 1.6, 1.4000000000000001, 1.2000000000000002, 1.1, 0.9, 0.7000000000000001, 0.6000000000000001, 0.4, 0.8, 1.1, 1.5, 1.9000000000000001, 2.2, 2.6, 3.0, 3.3000000000000003, 3.7, 4.1000000000000005, 3.7, 3.4000000000000004, 3.0, 2.6, 2.2, 1.9000000000000001, 1.5, 1.1, 0.8, 0.4]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"46f7bd49-48b8-4738-84a2-875bf9d5b61e\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95, 5.0], \"y\": [0.6000000000000001, 0.8, 1.0, 1.1, 1.3, 1.5, 1.7, 1.9000000000000001, 2.1, 2.3000000000000003, 2.5000000000000004, 2.3000000000000003, 2.1, 1.9000000000000001, 1.7, 1.5, 1.3, 1.2, 1.0, 0.8, 0.6000000000000001, 0.8, 1.0, 1.1, 1.3, 1.5, 1.7, 1.9000000000000001, 2.0, 2.2, 2.4000000000000004, 2.2, 2.0, 1.9000000000000001, 1.7, 1.5, 1.3, 1.2, 1.0, 0.8, 0.6000000000000001, 0.8, 1.0, 1.1, 1.3, 1.5, 1.6, 1.8, 2.0, 2.2, 2.3000000000000003, 2.2, 2.0, 1.8, 1.6, 1.5, 1.3, 1.1, 0.9000000000000001, 0.8, 0.6000000000000001, 0.8, 0.9000000000000001, 1.1, 1.3, 1.4000000000000001, 1.6, 1.8, 2.0, 2.1, 2.3000000000000003, 2.1, 2.0, 1.8, 1.6, 1.4000000000000001, 1.3, 1.1, 0.9000000000000001, 0.8, 0.7, 1.2000000000000002, 1.5, 1.9, 2.3000000000000003, 2.6, 3.0, 3.4, 3.7, 4.1000000000000005, 4.500000000000001, 4.1000000000000005, 3.8000000000000003, 3.4, 3.0, 2.6, 2.3000000000000003, 1.9, 1.5, 1.2000000000000002, 0.9]}],\n                        {\"title\": {\"text\": \"Left &amp; Right Separations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Separation (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"ed3941a7-df26-423d-9fe9-6890fc09e6f5\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"ed3941a7-df26-423d-9fe9-6890fc09e6f5\")) {\n                    Plotly.newPlot(\n                        'ed3941a7-df26-423d-9fe9-6890fc09e6f5',\n                        [{\"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"fd2bf28c-991e-42ed-a030-69069cbfb11b\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95, 5.0], \"y\": [1.1, 1.2000000000000002, 1.3, 1.5000000000000002, 1.7000000000000002, 1.8, 2.0, 2.2, 2.4, 2.6, 2.6000000000000005, 2.3000000000000003, 1.9000000000000001, 1.6, 1.3, 1.0, 0.8, 0.7000000000000001, 0.7000000000000001, 0.7, 0.9000000000000001, 0.9, 0.7000000000000001, 0.6000000000000001, 0.5900000000000001, 0.4000000000000001, 0.6000000000000001, 0.6000000000000001, 0.8, 0.9, 0.7000000000000001, 0.5, 0.6000000000000001, 0.6, 1.0, 1.4000000000000001, 1.9000000000000004, 2.4000000000000004, 2.9000000000000004, 3.4000000000000004, 4.2, 4.1, 3.9000000000000004, 3.7, 3.6, 3.4, 3.2, 3.1, 2.9, 2.7, 2.5000000000000004, 2.8000000000000003, 3.2, 3.5000000000000004, 3.9000000000000004, 4.1, 4.5, 4.8, 5.2, 5.5, 6.1000000000000005, 5.9, 5.8, 5.6000000000000005, 5.4, 5.2, 5.1000000000000005, 4.9, 4.7, 4.6000000000000005, 4.4, 4.6000000000000005, 4.8, 5.0, 5.1000000000000005, 5.3, 5.5, 5.7, 5.9, 6.1000000000000005, 6.1, 5.7, 5.4, 5.0, 4.6, 4.2, 3.9, 3.5000000000000004, 3.1, 2.8000000000000003, 2.3000000000000003, 2.8000000000000003, 3.3000000000000003, 3.8, 4.300000000000001, 4.9, 5.4, 5.9, 6.4, 7.0, 7.5]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Forward\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"e92b7f15-f2a9-4f93-b84c-944a500d304c\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95, 5.0], \"y\": [1.2000000000000002, 1.4000000000000001, 1.5, 1.7000000000000002, 1.9000000000000001, 2.0, 2.2, 2.4000000000000004, 2.6, 2.8000000000000003, 2.9000000000000004, 2.6, 2.2, 1.9000000000000001, 1.6, 1.3, 1.0, 0.8, 0.8, 0.9, 1.1, 1.0, 0.8, 0.7000000000000001, 0.66, 0.6000000000000001, 0.67, 0.7000000000000001, 0.9, 1.0, 1.1, 0.8, 0.7000000000000001, 1.0, 1.4000000000000001, 1.9000000000000001, 2.4000000000000004, 2.9000000000000004, 3.4000000000000004, 3.9000000000000004, 4.4, 4.3, 4.1000000000000005, 3.9000000000000004, 3.8000000000000003, 3.6, 3.4000000000000004, 3.3000000000000003, 3.1, 2.9000000000000004, 2.8000000000000003, 3.1, 3.5, 3.8000000000000003, 4.2, 4.5, 4.9, 5.2, 5.6000000000000005, 5.9, 6.300000000000001, 6.1000000000000005, 6.0, 5.800000000000001, 5.6000000000000005, 5.4, 5.300000000000001, 5.1000000000000005, 4.9, 4.800000000000001, 4.6000000000000005, 4.800000000000001, 5.0, 5.2, 5.300000000000001, 5.5, 5.7, 5.9, 6.1000000000000005, 6.300000000000001, 6.5, 6.1000000000000005, 5.800000000000001, 5.4, 5.0, 4.6000000000000005, 4.3, 3.9000000000000004, 3.5, 3.2, 2.8000000000000003, 3.3000000000000003, 3.8000000000000003, 4.3, 4.800000000000001, 5.4, 5.9, 6.4, 6.9, 7.5, 8.0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"9043b899-5f6a-4185-88a2-f5b16fa29c30\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95, 5.0], \"y\": [1.3000000000000003, 1.6, 1.7, 1.9000000000000001, 2.1, 2.2, 2.4000000000000004, 2.6000000000000005, 2.8000000000000003, 3.0000000000000004, 3.2, 2.9, 2.5, 2.2, 1.9000000000000001, 1.6, 1.2, 0.9, 0.9, 1.1, 1.3, 1.1, 0.9, 0.8, 0.73, 0.8, 0.74, 0.8, 1.0, 1.1, 1.5, 1.1, 0.8, 1.4, 1.8000000000000003, 2.4000000000000004, 2.9000000000000004, 3.4000000000000004, 3.9000000000000004, 4.4, 4.6000000000000005, 4.5, 4.300000000000001, 4.1000000000000005, 4.0, 3.8000000000000003, 3.6000000000000005, 3.5000000000000004, 3.3000000000000003, 3.1000000000000005, 3.1, 3.4, 3.8, 4.1000000000000005, 4.5, 4.9, 5.300000000000001, 5.6000000000000005, 6.000000000000001, 6.300000000000001, 6.500000000000001, 6.300000000000001, 6.2, 6.000000000000001, 5.800000000000001, 5.6000000000000005, 5.500000000000001, 5.300000000000001, 5.1000000000000005, 5.000000000000001, 4.800000000000001, 5.000000000000001, 5.2, 5.4, 5.500000000000001, 5.7, 5.9, 6.1000000000000005, 6.300000000000001, 6.500000000000001, 6.9, 6.500000000000001, 6.200000000000001, 5.800000000000001, 5.4, 5.000000000000001, 4.7, 4.300000000000001, 3.9, 3.6, 3.3000000000000003, 3.8000000000000003, 4.300000000000001, 4.8, 5.300000000000001, 5.9, 6.4, 6.9, 7.4, 8.0, 8.5]}, {\"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"f1e3994e-76a7-4be4-972b-cd34d2e875a9\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95, 5.0], \"y\": [0.7, 0.4000000000000001, 0.2, 0.2, 0.3000000000000001, 0.6, 0.9, 1.3000000000000003, 1.6, 2.0000000000000004, 2.6, 2.4, 2.2, 2.0, 1.8, 1.7000000000000002, 1.5000000000000002, 1.3, 1.1, 0.9000000000000001, 0.8, 0.9000000000000001, 1.1, 1.2000000000000002, 1.4000000000000001, 1.6, 1.7000000000000002, 1.9000000000000001, 2.1, 2.2, 2.4, 2.2, 2.1, 1.9000000000000001, 1.7000000000000002, 1.5000000000000002, 1.4000000000000001, 1.2000000000000002, 1.0000000000000002, 0.9000000000000001, 0.7, 0.9000000000000001, 1.1, 1.3, 1.4000000000000001, 1.6, 1.8, 2.0, 2.2, 2.3, 2.5, 2.3, 2.2, 2.0, 1.8, 1.7000000000000002, 1.5000000000000002, 1.3, 1.1, 1.0000000000000002, 0.8, 1.0000000000000002, 1.2000000000000002, 1.3, 1.5000000000000002, 1.7000000000000002, 1.9000000000000001, 2.1, 2.2, 2.4, 2.6, 2.4, 2.3, 2.1, 1.9000000000000001, 1.7000000000000002, 1.6, 1.4000000000000001, 1.2000000000000002, 1.1, 0.8, 1.0, 1.4, 1.8000000000000003, 2.1, 2.5000000000000004, 2.9000000000000004, 3.3000000000000003, 3.6, 4.0, 4.4, 4.0, 3.6, 3.3000000000000003, 2.9000000000000004, 2.5000000000000004, 2.2, 1.8000000000000003, 1.5, 1.2, 1.0000000000000002]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Rear\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"81cdf55f-fafb-41f3-ac9d-7bc698fe1906\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95, 5.0], \"y\": [1.0, 0.7000000000000001, 0.4, 0.4, 0.6000000000000001, 1.0, 1.3, 1.7000000000000002, 2.0, 2.4000000000000004, 2.8000000000000003, 2.6, 2.4000000000000004, 2.2, 2.0, 1.9000000000000001, 1.7000000000000002, 1.5, 1.3, 1.1, 1.0, 1.1, 1.3, 1.4000000000000001, 1.6, 1.8, 1.9000000000000001, 2.1, 2.3000000000000003, 2.4000000000000004, 2.6, 2.4000000000000004, 2.3000000000000003, 2.1, 1.9000000000000001, 1.7000000000000002, 1.6, 1.4000000000000001, 1.2000000000000002, 1.1, 0.9, 1.1, 1.3, 1.5, 1.6, 1.8, 2.0, 2.2, 2.4000000000000004, 2.5, 2.7, 2.5, 2.4000000000000004, 2.2, 2.0, 1.9000000000000001, 1.7000000000000002, 1.5, 1.3, 1.2000000000000002, 1.0, 1.2000000000000002, 1.4000000000000001, 1.5, 1.7000000000000002, 1.9000000000000001, 2.1, 2.3000000000000003, 2.4000000000000004, 2.6, 2.8000000000000003, 2.6, 2.5, 2.3000000000000003, 2.1, 1.9000000000000001, 1.8, 1.6, 1.4000000000000001, 1.3, 1.1, 1.4000000000000001, 1.8, 2.2, 2.5, 2.9000000000000004, 3.3000000000000003, 3.7, 4.0, 4.4, 4.800000000000001, 4.4, 4.0, 3.7, 3.3000000000000003, 2.9000000000000004, 2.6, 2.2, 1.9000000000000001, 1.5, 1.2000000000000002]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"5a8fd599-472f-4e51-8a56-7304b0997f12\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75, 2.8000000000000003, 2.85, 2.9000000000000004, 2.95, 3.0, 3.05, 3.1000000000000005, 3.1500000000000004, 3.2, 3.25, 3.3, 3.3500000000000005, 3.4000000000000004, 3.45, 3.5, 3.55, 3.6000000000000005, 3.6500000000000004, 3.7, 3.75, 3.8000000000000007, 3.8500000000000005, 3.9000000000000004, 3.95, 4.0, 4.050000000000001, 4.1000000000000005, 4.15, 4.2, 4.25, 4.300000000000001, 4.3500000000000005, 4.4, 4.45, 4.5, 4.550000000000001, 4.6000000000000005, 4.65, 4.7, 4.75, 4.800000000000001, 4.8500000000000005, 4.9, 4.95, 5.0], \"y\": [1.3, 1.0, 0.6000000000000001, 0.6000000000000001, 0.9000000000000001, 1.4, 1.7000000000000002, 2.1, 2.4, 2.8000000000000003, 3.0000000000000004, 2.8000000000000003, 2.6000000000000005, 2.4000000000000004, 2.2, 2.1, 1.9000000000000001, 1.7, 1.5, 1.3, 1.2, 1.3, 1.5, 1.6, 1.8, 2.0, 2.1, 2.3000000000000003, 2.5000000000000004, 2.6000000000000005, 2.8000000000000003, 2.6000000000000005, 2.5000000000000004, 2.3000000000000003, 2.1, 1.9000000000000001, 1.8, 1.6, 1.4000000000000001, 1.3, 1.1, 1.3, 1.5, 1.7, 1.8, 2.0, 2.2, 2.4000000000000004, 2.6000000000000005, 2.7, 2.9000000000000004, 2.7, 2.6000000000000005, 2.4000000000000004, 2.2, 2.1, 1.9000000000000001, 1.7, 1.5, 1.4000000000000001, 1.2, 1.4000000000000001, 1.6, 1.7, 1.9000000000000001, 2.1, 2.3000000000000003, 2.5000000000000004, 2.6000000000000005, 2.8000000000000003, 3.0000000000000004, 2.8000000000000003, 2.7, 2.5000000000000004, 2.3000000000000003, 2.1, 2.0, 1.8, 1.6, 1.5, 1.4000000000000001, 1.8000000000000003, 2.2, 2.6, 2.9, 3.3000000000000003, 3.7, 4.1000000000000005, 4.4, 4.800000000000001, 5.200000000000001, 4.800000000000001, 4.4, 4.1000000000000005, 3.7, 3.3000000000000003, 3.0, 2.6, 2.3000000000000003, 1.8, 1.4000000000000001]}],\n                        {\"title\": {\"text\": \"Forward &amp; Rear Separations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Separation (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div style=\"height:120px\"> </div>"};
+
+}());
\ No newline at end of file
@@ -0,0 +1,5 @@
+(function () {
+
+    window.SIM_DATA = {"data": {"time": {"count": 51, "cycles": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], "support_cycles": [-0.4, -0.35, -0.29999999999999993, -0.2499999999999999, -0.19999999999999984, -0.15000000000000002, -0.09999999999999998, -0.04999999999999993, 1.1102230246251565e-16, 0.050000000000000155, 0.09999999999999998, 0.15000000000000002, 0.20000000000000007, 0.2500000000000001, 0.30000000000000016, 0.35, 0.4, 0.45000000000000007, 0.5000000000000001, 0.5500000000000002, 0.6, 0.6500000000000002, 0.7000000000000001, 0.7499999999999999, 0.8000000000000002, 0.85, 0.9000000000000002, 0.9500000000000001, 1.0000000000000004, 1.0500000000000003, 1.1, 1.1500000000000004, 1.2000000000000002, 1.2500000000000004, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5000000000000004, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.7500000000000004, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0000000000000004, 2.0500000000000003, 2.1], "steps_per_cycle": 20, "progress": [0, 2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 14.0, 16.0, 18.0, 20.0, 22.0, 24.0, 26.0, 28.0, 30.0, 32.0, 34.0, 36.0, 38.0, 40.0, 42.0, 44.0, 46.0, 48.0, 50.0, 52.0, 54.0, 56.0, 58.0, 60.0, 62.0, 64.0, 66.0, 68.0, 70.0, 72.0, 74.0, 76.0, 78.0, 80.0, 82.0, 84.0, 86.0, 88.0, 90.0, 92.0, 94.0, 96.0, 98.0, 100.0]}, "cycles": {"left_pes": [[8, "M"], [12, "F"], [8, "M"], [12, "F"], [8, "M"], [3, "F"]], "right_pes": [[10, "F"], [8, "M"], [12, "F"], [8, "M"], [12, "F"], [1, "M"]], "left_manus": [[8, "M"], [12, "F"], [8, "M"], [12, "F"], [8, "M"], [3, "F"]], "right_manus": [[10, "F"], [8, "M"], [12, "F"], [8, "M"], [13, "F"]]}, "scale": 1231.8796992481205, "offset": [0, 0], "markerIds": ["left_pes", "right_pes", "left_manus", "right_manus"], "frames": [{"time": 0.0, "support_time": -0.4, "positions": [{"x": [0.0, 0.04, 0.0], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-4.0, 0.04], "ty0": [0.2, 0.01], "tx1": [4.1312500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.04, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3875, 0.04], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.09, 0.02, 0.0875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.7000000000000001, 0.02, 0.7], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.39, 0.01, 0.39375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.0, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.0, "y": 0.0}], "forward_support_box": [{"x": 0.6124999999999999, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.6124999999999999, "y": 0.0}]}, {"time": 0.050000000000000044, "support_time": -0.35, "positions": [{"x": [0.04, 0.04, 0.04375000000000004], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.95625, 0.04], "ty0": [0.2, 0.01], "tx1": [4.175, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.66, 0.04, 0.65625], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.34375, 0.04], "ty0": [0.2, 0.01], "tx1": [4.7875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.11, 0.02, 0.10937500000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.72, 0.02, 0.721875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.42, 0.01, 0.415625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.04375000000000004, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.04375000000000004, "y": 0.0}], "forward_support_box": [{"x": 0.65625, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.65625, "y": 0.0}]}, {"time": 0.10000000000000009, "support_time": -0.29999999999999993, "positions": [{"x": [0.09, 0.04, 0.08750000000000008], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.9125, 0.04], "ty0": [0.2, 0.01], "tx1": [4.21875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.7000000000000001, 0.04, 0.7], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3, 0.04], "ty0": [0.2, 0.01], "tx1": [4.83125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.13, 0.02, 0.13125000000000003], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.74, 0.02, 0.7437499999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.44, 0.01, 0.4375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.08750000000000008, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.08750000000000008, "y": 0.0}], "forward_support_box": [{"x": 0.7, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.7, "y": 0.0}]}, {"time": 0.15000000000000013, "support_time": -0.2499999999999999, "positions": [{"x": [0.13, 0.04, 0.13125000000000012], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.86875, 0.04], "ty0": [0.2, 0.01], "tx1": [4.2625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.74, 0.04, 0.74375], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.25625, 0.04], "ty0": [0.2, 0.01], "tx1": [4.875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.15, 0.02, 0.15312500000000007], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.77, 0.02, 0.765625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.46, 0.01, 0.45937500000000003], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.13125000000000012, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.13125000000000012, "y": 0.0}], "forward_support_box": [{"x": 0.74375, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.74375, "y": 0.0}]}, {"time": 0.20000000000000018, "support_time": -0.19999999999999984, "positions": [{"x": [0.18, 0.04, 0.17500000000000016], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.8249999999999997, 0.04], "ty0": [0.2, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.79, 0.04, 0.7875000000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.2125, 0.04], "ty0": [0.2, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.18, 0.02, 0.17500000000000007], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.79, 0.02, 0.7875000000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.48, 0.01, 0.48125000000000007], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.17500000000000016, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.17500000000000016, "y": 0.0}], "forward_support_box": [{"x": 0.7875000000000001, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.7875000000000001, "y": 0.0}]}, {"time": 0.25, "support_time": -0.15000000000000002, "positions": [{"x": [0.22, 0.04, 0.21875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.78125, 0.04], "ty0": [0.2, 0.01], "tx1": [4.35, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.8300000000000001, 0.04, 0.8312499999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.16875, 0.04], "ty0": [0.2, 0.01], "tx1": [4.9625, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.2, 0.02, 0.196875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.81, 0.02, 0.809375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.5, 0.01, 0.5031249999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.21875, "y": 0.2}, {"x": 0.21875, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.8312499999999999, "y": 0.2}, {"x": 0.8312499999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.30000000000000004, "support_time": -0.09999999999999998, "positions": [{"x": [0.26, 0.04, 0.2625], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.7375, 0.04], "ty0": [0.2, 0.01], "tx1": [4.39375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.88, 0.04, 0.875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.125, 0.04], "ty0": [0.2, 0.01], "tx1": [5.00625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.22, 0.02, 0.21875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.8300000000000001, 0.02, 0.83125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.52, 0.01, 0.525], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.2625, "y": 0.2}, {"x": 0.2625, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.3500000000000001, "support_time": -0.04999999999999993, "positions": [{"x": [0.31, 0.04, 0.3062500000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.69375, 0.04], "ty0": [0.2, 0.01], "tx1": [4.4375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.92, 0.04, 0.91875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.08125, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.24, 0.02, 0.24062500000000003], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.85, 0.02, 0.8531249999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.55, 0.01, 0.546875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.3062500000000001, "y": 0.2}, {"x": 0.3062500000000001, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.91875, "y": 0.2}, {"x": 0.91875, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.40000000000000013, "support_time": 1.1102230246251565e-16, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.262, 0.007, 0.26249999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.875, 0.007, 0.875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.5690000000000001, 0.005, 0.56875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.4500000000000002, "support_time": 0.050000000000000155, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.262, 0.007, 0.26249999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.875, 0.007, 0.875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.5690000000000001, 0.005, 0.56875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.5, "support_time": 0.09999999999999998, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.04, 0.175], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.825, 0.04], "ty0": [0.0, 0.01], "tx1": [4.30625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.04, 0.7875], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.2125, 0.04], "ty0": [0.0, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.26, 0.02, 0.26249999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.88, 0.02, 0.875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.5700000000000001, 0.01, 0.56875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.55, "support_time": 0.15000000000000002, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.22, 0.04, 0.21875000000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.78125, 0.04], "ty0": [0.0, 0.01], "tx1": [4.35, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.8300000000000001, 0.04, 0.8312499999999998], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.16875, 0.04], "ty0": [0.0, 0.01], "tx1": [4.9625, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.28, 0.02, 0.284375], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.9, 0.02, 0.8968749999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.59, 0.01, 0.590625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.21875000000000003, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.21875000000000003, "y": 0.0}], "forward_support_box": [{"x": 0.8312499999999998, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.8312499999999998, "y": 0.0}]}, {"time": 0.6000000000000001, "support_time": 0.20000000000000007, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.26, 0.04, 0.26250000000000007], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.7375, 0.04], "ty0": [0.0, 0.01], "tx1": [4.39375, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.04, 0.875], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.125, 0.04], "ty0": [0.0, 0.01], "tx1": [5.00625, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.31, 0.02, 0.30625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.92, 0.02, 0.91875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.61, 0.01, 0.6125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.26250000000000007, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.26250000000000007, "y": 0.0}], "forward_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.875, "y": 0.0}]}, {"time": 0.6500000000000001, "support_time": 0.2500000000000001, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.31, 0.04, 0.3062500000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.69375, 0.04], "ty0": [0.0, 0.01], "tx1": [4.4375, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.92, 0.04, 0.9187500000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.08125, 0.04], "ty0": [0.0, 0.01], "tx1": [5.05, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.33, 0.02, 0.328125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.9400000000000001, 0.02, 0.940625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.63, 0.01, 0.634375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.3062500000000001, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.3062500000000001, "y": 0.0}], "forward_support_box": [{"x": 0.9187500000000003, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.9187500000000003, "y": 0.0}]}, {"time": 0.7000000000000002, "support_time": 0.30000000000000016, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.35000000000000003, 0.04, 0.3500000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.65, 0.04], "ty0": [0.0, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.96, 0.04, 0.9625000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.0374999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.35000000000000003, 0.02, 0.35000000000000003], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.96, 0.02, 0.9625], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.66, 0.01, 0.65625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.3500000000000001, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.3500000000000001, "y": 0.0}], "forward_support_box": [{"x": 0.9625000000000001, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.9625000000000001, "y": 0.0}]}, {"time": 0.75, "support_time": 0.35, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.39, 0.04, 0.39374999999999993], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.60625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.525, 0.01], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.01, 0.04, 1.00625], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.99375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.1375, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.37, 0.02, 0.37187499999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.98, 0.02, 0.984375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.68, 0.01, 0.678125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.39374999999999993, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.39374999999999993, "y": 0.0}], "forward_support_box": [{"x": 1.00625, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.00625, "y": 0.0}]}, {"time": 0.8, "support_time": 0.4, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.44, 0.04, 0.43749999999999994], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.5625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.5687500000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.05, 0.04, 1.0499999999999998], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.95, 0.04], "ty0": [0.0, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.39, 0.02, 0.39374999999999993], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.01, 0.02, 1.0062499999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.7000000000000001, 0.01, 0.7], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.43749999999999994, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.43749999999999994, "y": 0.0}], "forward_support_box": [{"x": 1.0499999999999998, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.0499999999999998, "y": 0.0}]}, {"time": 0.8500000000000001, "support_time": 0.45000000000000007, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.48, 0.04, 0.48125], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.51875, 0.04], "ty0": [0.0, 0.01], "tx1": [4.6125, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.09, 0.04, 1.09375], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.90625, 0.04], "ty0": [0.0, 0.01], "tx1": [5.225, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.42, 0.02, 0.415625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.03, 0.02, 1.028125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.72, 0.01, 0.721875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.48125, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.48125, "y": 0.0}], "forward_support_box": [{"x": 1.09375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.09375, "y": 0.0}]}, {"time": 0.9000000000000001, "support_time": 0.5000000000000001, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.437, 0.007, 0.43749999999999994], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.05, 0.007, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.744, 0.005, 0.7437499999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 0.9500000000000002, "support_time": 0.5500000000000002, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.437, 0.007, 0.43749999999999994], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.05, 0.007, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.744, 0.005, 0.7437499999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.0, "support_time": 0.6, "positions": [{"x": [0.35000000000000003, 0.04, 0.35], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.65, 0.04], "ty0": [0.2, 0.01], "tx1": [4.48125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.04, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.0375, 0.04], "ty0": [0.2, 0.01], "tx1": [5.09375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.44, 0.02, 0.43749999999999994], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.05, 0.02, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.74, 0.01, 0.7437499999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.0500000000000003, "support_time": 0.6500000000000002, "positions": [{"x": [0.39, 0.04, 0.3937500000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.6062499999999997, 0.04], "ty0": [0.2, 0.01], "tx1": [4.525, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.01, 0.04, 1.00625], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.99375, 0.04], "ty0": [0.2, 0.01], "tx1": [5.1375, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.46, 0.02, 0.4593750000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.07, 0.02, 1.071875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.77, 0.01, 0.765625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.3937500000000002, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.3937500000000002, "y": 0.0}], "forward_support_box": [{"x": 1.00625, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.00625, "y": 0.0}]}, {"time": 1.1, "support_time": 0.7000000000000001, "positions": [{"x": [0.44, 0.04, 0.43750000000000006], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.5625, 0.04], "ty0": [0.2, 0.01], "tx1": [4.56875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.05, 0.04, 1.05], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.95, 0.04], "ty0": [0.2, 0.01], "tx1": [5.18125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.48, 0.02, 0.48124999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.09, 0.02, 1.09375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.79, 0.01, 0.7875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.43750000000000006, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.43750000000000006, "y": 0.0}], "forward_support_box": [{"x": 1.05, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.05, "y": 0.0}]}, {"time": 1.15, "support_time": 0.7499999999999999, "positions": [{"x": [0.48, 0.04, 0.4812499999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.5187500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [4.612500000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.09, 0.04, 1.0937499999999998], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.90625, 0.04], "ty0": [0.2, 0.01], "tx1": [5.225, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.5, 0.02, 0.5031249999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.12, 0.02, 1.1156249999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.81, 0.01, 0.809375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.4812499999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.4812499999999999, "y": 0.0}], "forward_support_box": [{"x": 1.0937499999999998, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.0937499999999998, "y": 0.0}]}, {"time": 1.2000000000000002, "support_time": 0.8000000000000002, "positions": [{"x": [0.53, 0.04, 0.5250000000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.4749999999999996, 0.04], "ty0": [0.2, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.1400000000000001, 0.04, 1.1375000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.8625, 0.04], "ty0": [0.2, 0.01], "tx1": [5.26875, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.52, 0.02, 0.525], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.1400000000000001, 0.02, 1.1375000000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.8300000000000001, 0.01, 0.83125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5250000000000001, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.5250000000000001, "y": 0.0}], "forward_support_box": [{"x": 1.1375000000000002, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.1375000000000002, "y": 0.0}]}, {"time": 1.25, "support_time": 0.85, "positions": [{"x": [0.5700000000000001, 0.04, 0.56875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.43125, 0.04], "ty0": [0.2, 0.01], "tx1": [4.7, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.18, 0.04, 1.18125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.81875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.3125, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.55, 0.02, 0.546875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.16, 0.02, 1.1593749999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.85, 0.01, 0.8531249999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.56875, "y": 0.2}, {"x": 0.56875, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.18125, "y": 0.2}, {"x": 1.18125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.3000000000000003, "support_time": 0.9000000000000002, "positions": [{"x": [0.61, 0.04, 0.6125000000000003], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3874999999999997, 0.04], "ty0": [0.2, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.22, 0.04, 1.225], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.775, 0.04], "ty0": [0.2, 0.01], "tx1": [5.35625, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.5700000000000001, 0.02, 0.5687500000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.18, 0.02, 1.18125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.88, 0.01, 0.875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.6125000000000003, "y": 0.2}, {"x": 0.6125000000000003, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.225, "y": 0.2}, {"x": 1.225, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.35, "support_time": 0.9500000000000001, "positions": [{"x": [0.66, 0.04, 0.65625], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.34375, 0.04], "ty0": [0.2, 0.01], "tx1": [4.7875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.27, 0.04, 1.26875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.73125, 0.04], "ty0": [0.2, 0.01], "tx1": [5.4, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.59, 0.02, 0.590625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.2, 0.02, 1.203125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.9, 0.01, 0.896875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.65625, "y": 0.2}, {"x": 0.65625, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.26875, "y": 0.2}, {"x": 1.26875, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.4000000000000004, "support_time": 1.0000000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.612, 0.007, 0.6124999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.225, 0.007, 1.225], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.919, 0.005, 0.91875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.4500000000000002, "support_time": 1.0500000000000003, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.612, 0.007, 0.6124999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.225, 0.007, 1.225], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.919, 0.005, 0.91875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.5, "support_time": 1.1, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.04, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.475, 0.04], "ty0": [0.0, 0.01], "tx1": [4.65625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.04, 1.1375], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.8625, 0.04], "ty0": [0.0, 0.01], "tx1": [5.268750000000001, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.61, 0.02, 0.6124999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.22, 0.02, 1.225], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.92, 0.01, 0.91875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.5500000000000003, "support_time": 1.1500000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.5700000000000001, 0.04, 0.5687500000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.43125, 0.04], "ty0": [0.0, 0.01], "tx1": [4.7, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.18, 0.04, 1.1812500000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.8187499999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.3125, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.63, 0.02, 0.6343750000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.25, 0.02, 1.2468750000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.9400000000000001, 0.01, 0.9406250000000002], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5687500000000002, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5687500000000002, "y": 0.0}], "forward_support_box": [{"x": 1.1812500000000001, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1812500000000001, "y": 0.0}]}, {"time": 1.6, "support_time": 1.2000000000000002, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.61, 0.04, 0.6125], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.3875, 0.04], "ty0": [0.0, 0.01], "tx1": [4.74375, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.22, 0.04, 1.225], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.775, 0.04], "ty0": [0.0, 0.01], "tx1": [5.35625, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.66, 0.02, 0.65625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.27, 0.02, 1.26875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.96, 0.01, 0.9625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.6125, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.6125, "y": 0.0}], "forward_support_box": [{"x": 1.225, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.225, "y": 0.0}]}, {"time": 1.6500000000000004, "support_time": 1.2500000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.66, 0.04, 0.6562500000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.34375, 0.04], "ty0": [0.0, 0.01], "tx1": [4.7875000000000005, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.27, 0.04, 1.2687500000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.7312499999999997, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.68, 0.02, 0.6781250000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.29, 0.02, 1.2906250000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.98, 0.01, 0.9843750000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.6562500000000002, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.6562500000000002, "y": 0.0}], "forward_support_box": [{"x": 1.2687500000000003, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.2687500000000003, "y": 0.0}]}, {"time": 1.7000000000000002, "support_time": 1.3000000000000003, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.7000000000000001, 0.04, 0.7000000000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.3, 0.04], "ty0": [0.0, 0.01], "tx1": [4.83125, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.31, 0.04, 1.3125], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.6875, 0.04], "ty0": [0.0, 0.01], "tx1": [5.44375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.7000000000000001, 0.02, 0.7000000000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.31, 0.02, 1.3125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.01, 0.01, 1.00625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7000000000000002, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.7000000000000002, "y": 0.0}], "forward_support_box": [{"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.3125, "y": 0.0}]}, {"time": 1.75, "support_time": 1.35, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.74, 0.04, 0.7437499999999999], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.36, 0.04, 1.35625], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.72, 0.02, 0.7218749999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.33, 0.02, 1.334375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.03, 0.01, 1.028125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7437499999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.7437499999999999, "y": 0.0}], "forward_support_box": [{"x": 1.35625, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.35625, "y": 0.0}]}, {"time": 1.8000000000000003, "support_time": 1.4000000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.04, 0.7875000000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.4000000000000001, 0.04, 1.4000000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.74, 0.02, 0.7437500000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.36, 0.02, 1.3562500000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.05, 0.01, 1.0500000000000003], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7875000000000002, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.7875000000000002, "y": 0.0}], "forward_support_box": [{"x": 1.4000000000000001, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4000000000000001, "y": 0.0}]}, {"time": 1.85, "support_time": 1.4500000000000002, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.8300000000000001, 0.04, 0.83125], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.44, 0.04, 1.4437499999999999], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.77, 0.02, 0.765625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.3800000000000001, 0.02, 1.3781249999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.07, 0.01, 1.071875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.83125, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.83125, "y": 0.0}], "forward_support_box": [{"x": 1.4437499999999999, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4437499999999999, "y": 0.0}]}, {"time": 1.9000000000000004, "support_time": 1.5000000000000004, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.788, 0.007, 0.7875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.4000000000000001, 0.007, 1.4], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.094, 0.005, 1.09375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 1.9500000000000002, "support_time": 1.5500000000000003, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.788, 0.007, 0.7875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.4000000000000001, 0.007, 1.4], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.094, 0.005, 1.09375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.0, "support_time": 1.6, "positions": [{"x": [0.7000000000000001, 0.04, 0.7], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3, 0.04], "ty0": [0.2, 0.01], "tx1": [4.831250000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.04, 1.3125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.6875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.4437500000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.79, 0.02, 0.7875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.4000000000000001, 0.02, 1.4], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.09, 0.01, 1.09375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.0500000000000003, "support_time": 1.6500000000000004, "positions": [{"x": [0.74, 0.04, 0.7437500000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.2562499999999996, 0.04], "ty0": [0.2, 0.01], "tx1": [4.875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.36, 0.04, 1.3562500000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.64375, 0.04], "ty0": [0.2, 0.01], "tx1": [5.4875, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.81, 0.02, 0.8093750000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.42, 0.02, 1.421875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.12, 0.01, 1.115625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7437500000000001, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.7437500000000001, "y": 0.0}], "forward_support_box": [{"x": 1.3562500000000002, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.3562500000000002, "y": 0.0}]}, {"time": 2.1, "support_time": 1.7000000000000002, "positions": [{"x": [0.79, 0.04, 0.7875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.2125, 0.04], "ty0": [0.2, 0.01], "tx1": [4.91875, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.4000000000000001, 0.04, 1.4000000000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.5999999999999996, 0.04], "ty0": [0.2, 0.01], "tx1": [5.53125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.8300000000000001, 0.02, 0.83125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.44, 0.02, 1.44375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.1400000000000001, 0.01, 1.1375000000000002], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.7875, "y": 0.0}], "forward_support_box": [{"x": 1.4000000000000001, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.4000000000000001, "y": 0.0}]}, {"time": 2.1500000000000004, "support_time": 1.7500000000000004, "positions": [{"x": [0.8300000000000001, 0.04, 0.8312500000000003], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.1687499999999997, 0.04], "ty0": [0.2, 0.01], "tx1": [4.9625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.44, 0.04, 1.4437500000000003], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.5562499999999995, 0.04], "ty0": [0.2, 0.01], "tx1": [5.575, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.85, 0.02, 0.8531250000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.47, 0.02, 1.4656250000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.16, 0.01, 1.1593750000000003], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.8312500000000003, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.8312500000000003, "y": 0.0}], "forward_support_box": [{"x": 1.4437500000000003, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.4437500000000003, "y": 0.0}]}, {"time": 2.2, "support_time": 1.8000000000000003, "positions": [{"x": [0.88, 0.04, 0.875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.125, 0.04], "ty0": [0.2, 0.01], "tx1": [5.00625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.49, 0.04, 1.4875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.5125, 0.04], "ty0": [0.2, 0.01], "tx1": [5.61875, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.88, 0.02, 0.875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.49, 0.02, 1.4874999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.18, 0.01, 1.18125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4875, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.4875, "y": 0.0}]}, {"time": 2.25, "support_time": 1.85, "positions": [{"x": [0.92, 0.04, 0.9187499999999998], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.53, 0.04, 1.53125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.46875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.9, 0.02, 0.8968749999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.51, 0.02, 1.509375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.2, 0.01, 1.203125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.9187499999999998, "y": 0.2}, {"x": 0.9187499999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.53125, "y": 0.2}, {"x": 1.53125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.3000000000000003, "support_time": 1.9000000000000004, "positions": [{"x": [0.96, 0.04, 0.9625000000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.58, 0.04, 1.5750000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.46875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.92, 0.02, 0.9187500000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.53, 0.02, 1.53125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.22, 0.01, 1.225], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.9625000000000001, "y": 0.2}, {"x": 0.9625000000000001, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.5750000000000002, "y": 0.2}, {"x": 1.5750000000000002, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.35, "support_time": 1.9500000000000002, "positions": [{"x": [1.01, 0.04, 1.0062499999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.62, 0.04, 1.61875], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.46875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.9400000000000001, 0.02, 0.9406249999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.55, 0.02, 1.5531249999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.25, 0.01, 1.246875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0062499999999999, "y": 0.2}, {"x": 1.0062499999999999, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.61875, "y": 0.2}, {"x": 1.61875, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.4000000000000004, "support_time": 2.0000000000000004, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.6600000000000001, 0.01, 1.6624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.46875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.962, 0.007, 0.9624999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.575, 0.007, 1.5749999999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.2690000000000001, 0.005, 1.2687499999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.45, "support_time": 2.0500000000000003, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.6600000000000001, 0.01, 1.6624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.46875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.962, 0.007, 0.9624999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.575, 0.007, 1.5749999999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.2690000000000001, 0.005, 1.2687499999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.5, "support_time": 2.1, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0812500000000003, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.04, 0.875], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.25625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.6600000000000001, 0.01, 1.6624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.46875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.6625, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.64375, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.96, 0.02, 0.9624999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.575, 0.007, 1.5749999999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.27, 0.01, 1.2687499999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}]}, "body": "<div class=\"top-container no-select\">\n  <div style=\"display:flex;padding:0 1.0em;align-items: flex-end;\">\n    <div class=\"header-box\">\n      <div class=\"header-title\">UNIT-TEST Longer Pace</div>\n      <div class=\"header-summary\">A test run to verify that the simulation system works.</div>\n      <div class=\"header-entry date\">\n        <span class=\"name\">Date:</span>\n        <span class=\"value\">10-18-2026 11:49</span>\n      </div>\n      <div class=\"header-entry duty-cycle\">\n        <span class=\"name\">Duty Cycle:</span>\n        <span class=\"value\">60%</span>\n      </div>\n      <div class=\"header-entry activity-phases\">\n        <span class=\"name\">Activity Phases:</span>\n          <span class=\"value\">\n            Pes: (<span class=\"left_pes-value\">0%</span>,\n            <span class=\"right_pes-value\">50%</span>)\n            Manus: (<span class=\"left_manus-value\">-100%</span>,\n            <span class=\"right_manus-value\">-150%</span>)\n          </span>\n      </div>\n      <div class=\"header-entry support-phases\">\n        <span class=\"name\">Support Phases:</span>\n          <span class=\"value\">\n            Pes: (<span class=\"left_pes-value\">0%</span>,\n            <span class=\"right_pes-value\">50%</span>)\n            Manus: (<span class=\"left_manus-value\">-100%</span>,\n            <span class=\"right_manus-value\">-150%</span>)\n          </span>\n      </div>\n    </div>\n    <div class=\"spacer\"></div>\n\n    <div class=\"playback-controls\">\n      <div class=\"control-row\">\n        <div class=\"spacer\"></div>\n\n        <div class=\"control\" data-role=\"pop-out\">\n          <img src=\"img/picture-in-picture.svg\"/>\n        </div>\n\n        <div class=\"control\" data-role=\"save-svg\">\n          <img src=\"img/camera.svg\"/>\n        </div>\n      </div>\n\n      <div class=\"control-row animation-controls\">\n        <div class=\"spacer\"></div>\n\n        <div class=\"control\" data-role=\"backward-10\">\n          <img src=\"img/replay-10.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"jump-back\">\n          <img src=\"img/back.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"frame-back\">\n          <img src=\"img/step-back.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"toggle-play\">\n          <img src=\"img/play.svg\" class=\"play-icon\"/>\n          <img src=\"img/pause.svg\" class=\"pause-icon\"/>\n        </div>\n        <div class=\"control\" data-role=\"frame-forward\">\n          <img src=\"img/step-forward.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"jump-forward\">\n          <img src=\"img/forward.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"forward-10\">\n          <img src=\"img/forward-10.svg\"/>\n        </div>\n      </div>\n\n\n    </div>\n  </div>\n\n  <div class=\"progress-bar\">\n    <div class=\"header\">\n      <div class=\"value-box\">\n        <div class=\"header\">Left Pes</div>\n        <div class=\"swatch left_pes_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Right Pes</div>\n        <div class=\"swatch right_pes_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Left Manus</div>\n        <div class=\"swatch left_manus_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Right Manus</div>\n        <div class=\"swatch right_manus_color\"></div>\n      </div>\n\n      <div class=\"spacer\"></div>\n\n      <div class=\"time-box\">\n\n        <div class=\"value-box\">\n          <div class=\"header\">Progress</div>\n          <div class=\"value progress-value\"></div>\n        </div>\n\n        <div class=\"value-box activity-time-box\">\n          <div class=\"header\">Activity Cycle</div>\n          <div class=\"value\">\n            <span class=\"cycle-value\"></span> :\n            <span class=\"phase-value\"></span>\n          </div>\n        </div>\n\n        <div class=\"value-box support-time-box\">\n          <div class=\"header\">Support Cycle</div>\n          <div class=\"value\">\n            <span class=\"cycle-value\"></span> :\n            <span class=\"phase-value\"></span>\n          </div>\n        </div>\n\n      </div>\n    </div>\n\n    <div class=\"outer\">\n      <div class=\"inner\"></div>\n      <div class=\"cycles left_pes left_pes_color\"></div>\n      <div class=\"cycles left_manus left_manus_color\"></div>\n      <div class=\"cycles right_manus right_manus_color\"></div>\n      <div class=\"cycles right_pes right_pes_color\"></div>\n    </div>\n  </div>\n</div>\n\n        <div class=\"svg-box\">\n          <div class=\"svg-box-inner\">\n<svg version=\"1.1\"\n    id=\"svg-76042811863\"\n    xmlns:xlink=\"http://www.w3.org/1999/xlink\"\n    xmlns=\"http://www.w3.org/2000/svg\"\n    viewBox=\"-21 -268 2082 289\">\n\n<style>\n/* <![CDATA[ */\n#svg-76042811863 .left_pes { fill: DodgerBlue; opacity: 0.5; }\n#svg-76042811863 .right_pes { fill: DarkOrange; opacity: 0.5; }\n#svg-76042811863 .left_manus { fill: DarkOliveGreen; opacity: 0.5; }\n#svg-76042811863 .right_manus { fill: DarkOrchid; opacity: 0.5; }\n#svg-76042811863 .left_pes { fill: DodgerBlue; opacity: 0.5; stroke-width: 8px; stroke: DodgerBlue; }\n#svg-76042811863 .left_pes.assumed { fill: white; opacity: 0.33; }\n#svg-76042811863 .left_pes-marker { fill: transparent; stroke-width: 8px; stroke: DodgerBlue; }\n#svg-76042811863 .right_pes { fill: DarkOrange; opacity: 0.5; stroke-width: 8px; stroke: DarkOrange; }\n#svg-76042811863 .right_pes.assumed { fill: white; opacity: 0.33; }\n#svg-76042811863 .right_pes-marker { fill: transparent; stroke-width: 8px; stroke: DarkOrange; }\n#svg-76042811863 .left_manus { fill: DarkOliveGreen; opacity: 0.5; stroke-width: 8px; stroke: DarkOliveGreen; stroke-dasharray: 4,4; }\n#svg-76042811863 .left_manus.assumed { fill: white; opacity: 0.33; stroke-dasharray: 4,4; }\n#svg-76042811863 .left_manus-marker { fill: transparent; stroke-width: 8px; stroke: DarkOliveGreen; stroke-dasharray: 8,4; }\n#svg-76042811863 .right_manus { fill: DarkOrchid; opacity: 0.5; stroke-width: 8px; stroke: DarkOrchid; stroke-dasharray: 4,4; }\n#svg-76042811863 .right_manus.assumed { fill: white; opacity: 0.33; stroke-dasharray: 4,4; }\n#svg-76042811863 .right_manus-marker { fill: transparent; stroke-width: 8px; stroke: DarkOrchid; stroke-dasharray: 8,4; }\n/* ]]> */\n</style>\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"0.0\" cy=\"-246.3759398496241\" data-x=\"0.0\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-uid=\"2105\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"431.15789473684214\" cy=\"-246.3759398496241\" data-x=\"0.35000000000000003\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"2106\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"862.3157894736843\" cy=\"-246.3759398496241\" data-x=\"0.7000000000000001\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"2107\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"1293.4736842105262\" cy=\"-246.3759398496241\" data-x=\"1.05\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"2108\" />\n<circle id=\"left_pes\" class=\"left_pes-marker\" r=\"16.0\" cx=\"0.0\" cy=\"-246.3759398496241\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"215.57894736842107\" cy=\"-0.0\" data-x=\"0.18\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"2110\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"646.7368421052631\" cy=\"-0.0\" data-x=\"0.52\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"2111\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"1077.8947368421054\" cy=\"-0.0\" data-x=\"0.88\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"2112\" />\n<circle id=\"right_pes\" class=\"right_pes-marker\" r=\"16.0\" cx=\"215.57894736842107\" cy=\"-0.0\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"754.5263157894738\" cy=\"-246.3759398496241\" data-x=\"0.61\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-uid=\"2116\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"1185.6842105263158\" cy=\"-246.3759398496241\" data-x=\"0.96\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"2117\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"1616.8421052631581\" cy=\"-246.3759398496241\" data-x=\"1.31\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"2118\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"2048.0\" cy=\"-246.3759398496241\" data-x=\"1.6600000000000001\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"2119\" />\n<circle id=\"left_manus\" class=\"left_manus-marker\" r=\"12.0\" cx=\"754.5263157894738\" cy=\"-246.3759398496241\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"970.1052631578948\" cy=\"-0.0\" data-x=\"0.79\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"2122\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"1401.2631578947369\" cy=\"-0.0\" data-x=\"1.1400000000000001\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"2123\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"1832.421052631579\" cy=\"-0.0\" data-x=\"1.49\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"2124\" />\n<circle id=\"right_manus\" class=\"right_manus-marker\" r=\"12.0\" cx=\"970.1052631578948\" cy=\"-0.0\" />\n</svg></div>\n          <div class=\"svg-controls-box\" style=\"display:none\">\n            <div>\n                <div>Activity: <span class=\"activity-status\"></span></div>\n                <div>Support: <span class=\"support-status\"></span></div>\n            </div>\n            <div class=\"spacer\"></div>\n          </div>\n        </div>\n        \n<div class=\"line-break\"></div>\n\n<div class=\"results-container\">\n  <div class=\"settings-box info-display-box\">\n    <div class=\"info-header\">Trial Results</div>\n\n    <div class=\"info-row\">\n      <div id=\"lengthResults\" class=\"entry\">\n        <div class=\"title title-box\">Average Calculated Lengths (m)</div>\n\n        <div>\n          <span class=\"label\">Coupling Length:</span>\n          <span class=\"value\">0.61 &#177; 0.02</span>\n          <!-- span class=\"deviation\"> </span -->\n        </div>\n\n        <div>\n          <span class=\"label\">Coupling IQR:</span>\n          <span class=\"value\">[0.5912, 0.6288]</span>\n        </div>\n\n        <div>\n          <span class=\"label\">Coupling Bounds (2%):</span>\n          <span class=\"value\">[0.5509, 0.6689]</span>\n        </div>\n      </div>\n    </div>\n  </div>\n\n  <div class=\"status-box info-display-box\">\n    <div class=\"info-header\">Display Status</div>\n\n    <div class=\"info-row\">\n      <div class=\"entry left_pes\">\n        <div class=\"title left_pes_color\">Left Pes</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n\n      <div class=\"entry left_manus\">\n        <div class=\"title left_manus_color\">Left Manus</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n    </div>\n\n    <div class=\"info-row\">\n      <div class=\"entry right_pes\">\n        <div class=\"title right_pes_color\">Right Pes</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n\n      <div class=\"entry right_manus\">\n        <div class=\"title right_manus_color\">Right Manus</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n    </div>\n  </div>\n</div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"e87bdd0f-74f7-4beb-b003-43fb8e3e59e8\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"e87bdd0f-74f7-4beb-b003-43fb8e3e59e8\")) {\n                    Plotly.newPlot(\n                        'e87bdd0f-74f7-4beb-b003-43fb8e3e59e8',\n                        [{\"mode\": \"lines\", \"type\": \"scatter\", \"uid\": \"251eed01-a171-4e35-b908-5265e27ae353\", \"x\": [0.52, 0.5207228915662651, 0.5214457831325301, 0.5221686746987951, 0.5228915662650602, 0.5236144578313252, 0.5243373493975902, 0.5250602409638553, 0.5257831325301203, 0.5265060240963854, 0.5272289156626504, 0.5279518072289154, 0.5286746987951805, 0.5293975903614455, 0.5301204819277106, 0.5308433734939756, 0.5315662650602406, 0.5322891566265057, 0.5330120481927707, 0.5337349397590357, 0.5344578313253008, 0.5351807228915658, 0.5359036144578309, 0.5366265060240959, 0.5373493975903609, 0.538072289156626, 0.538795180722891, 0.539518072289156, 0.5402409638554211, 0.5409638554216861, 0.5416867469879512, 0.5424096385542162, 0.5431325301204812, 0.5438554216867463, 0.5445783132530113, 0.5453012048192764, 0.5460240963855414, 0.5467469879518064, 0.5474698795180715, 0.5481927710843365, 0.5489156626506015, 0.5496385542168666, 0.5503614457831316, 0.5510843373493967, 0.5518072289156617, 0.5525301204819267, 0.5532530120481918, 0.5539759036144568, 0.5546987951807218, 0.5554216867469869, 0.5561445783132519, 0.556867469879517, 0.557590361445782, 0.558313253012047, 0.5590361445783121, 0.5597590361445771, 0.5604819277108422, 0.5612048192771072, 0.5619277108433722, 0.5626506024096373, 0.5633734939759023, 0.5640963855421673, 0.5648192771084324, 0.5655421686746974, 0.5662650602409625, 0.5669879518072275, 0.5677108433734925, 0.5684337349397576, 0.5691566265060226, 0.5698795180722876, 0.5706024096385527, 0.5713253012048177, 0.5720481927710828, 0.5727710843373478, 0.5734939759036128, 0.5742168674698779, 0.5749397590361429, 0.575662650602408, 0.576385542168673, 0.577108433734938, 0.5778313253012031, 0.5785542168674681, 0.5792771084337331, 0.5799999999999982, 0.5807228915662632, 0.5814457831325283, 0.5821686746987933, 0.5828915662650583, 0.5836144578313234, 0.5843373493975884, 0.5850602409638535, 0.5857831325301185, 0.5865060240963835, 0.5872289156626486, 0.5879518072289136, 0.5886746987951786, 0.5893975903614437, 0.5901204819277087, 0.5908433734939738, 0.5915662650602388, 0.5922891566265038, 0.5930120481927689, 0.5937349397590339, 0.594457831325299, 0.595180722891564, 0.595903614457829, 0.5966265060240941, 0.5973493975903591, 0.5980722891566241, 0.5987951807228892, 0.5995180722891542, 0.6002409638554193, 0.6009638554216843, 0.6016867469879493, 0.6024096385542144, 0.6031325301204794, 0.6038554216867444, 0.6045783132530095, 0.6053012048192745, 0.6060240963855396, 0.6067469879518046, 0.6074698795180696, 0.6081927710843347, 0.6089156626505997, 0.6096385542168647, 0.6103614457831298, 0.6110843373493948, 0.6118072289156599, 0.6125301204819249, 0.6132530120481899, 0.613975903614455, 0.61469879518072, 0.615421686746985, 0.6161445783132501, 0.6168674698795151, 0.6175903614457802, 0.6183132530120452, 0.6190361445783102, 0.6197590361445753, 0.6204819277108403, 0.6212048192771054, 0.6219277108433704, 0.6226506024096354, 0.6233734939759005, 0.6240963855421655, 0.6248192771084305, 0.6255421686746956, 0.6262650602409606, 0.6269879518072257, 0.6277108433734907, 0.6284337349397557, 0.6291566265060208, 0.6298795180722858, 0.6306024096385509, 0.6313253012048159, 0.6320481927710809, 0.632771084337346, 0.633493975903611, 0.634216867469876, 0.6349397590361411, 0.6356626506024061, 0.6363855421686712, 0.6371084337349362, 0.6378313253012012, 0.6385542168674663, 0.6392771084337313, 0.6399999999999963, 0.6407228915662614, 0.6414457831325264, 0.6421686746987915, 0.6428915662650565, 0.6436144578313215, 0.6443373493975866, 0.6450602409638516, 0.6457831325301167, 0.6465060240963817, 0.6472289156626467, 0.6479518072289118, 0.6486746987951768, 0.6493975903614418, 0.6501204819277069, 0.6508433734939719, 0.651566265060237, 0.652289156626502, 0.653012048192767, 0.6537349397590321, 0.6544578313252971, 0.6551807228915622, 0.6559036144578272, 0.6566265060240922, 0.6573493975903573, 0.6580722891566223, 0.6587951807228873, 0.6595180722891524, 0.6602409638554174, 0.6609638554216825, 0.6616867469879475, 0.6624096385542125, 0.6631325301204776, 0.6638554216867426, 0.6645783132530076, 0.6653012048192727, 0.6660240963855377, 0.6667469879518028, 0.6674698795180678, 0.6681927710843328, 0.6689156626505979, 0.6696385542168629, 0.670361445783128, 0.671084337349393, 0.671807228915658, 0.6725301204819231, 0.6732530120481881, 0.6739759036144531, 0.6746987951807182, 0.6754216867469832, 0.6761445783132483, 0.6768674698795133, 0.6775903614457783, 0.6783132530120434, 0.6790361445783084, 0.6797590361445734, 0.6804819277108385, 0.6812048192771035, 0.6819277108433686, 0.6826506024096336, 0.6833734939758986, 0.6840963855421637, 0.6848192771084287, 0.6855421686746938, 0.6862650602409588, 0.6869879518072238, 0.6877108433734889, 0.6884337349397539, 0.6891566265060189, 0.689879518072284, 0.690602409638549, 0.6913253012048141, 0.6920481927710791, 0.6927710843373441, 0.6934939759036092, 0.6942168674698742, 0.6949397590361392, 0.6956626506024043, 0.6963855421686693, 0.6971084337349344, 0.6978313253011994, 0.6985542168674644, 0.6992771084337295, 0.7], \"y\": [0.1232400981741692, 0.13245395633733376, 0.1422752695937902, 0.15273752845458977, 0.1638755839989456, 0.17572567009008055, 0.1883254237347732, 0.20171390343569576, 0.21593160538570574, 0.2310204773537818, 0.24702393011328283, 0.2639868462645824, 0.28195558630582523, 0.3009779918074987, 0.32110338554860735, 0.34238256847437604, 0.36486781333747453, 0.38861285488659725, 0.41367287646773726, 0.4401044929044506, 0.4679657295237177, 0.49731599719342445, 0.5282160632358988, 0.5607280180791179, 0.5949152375029954, 0.6308423403323974, 0.6685751414210466, 0.7081805997611338, 0.7497267615421168, 0.793282697968788, 0.8389184376331426, 0.886704893216859, 0.9367137822813644, 0.9890175418805396, 1.0436892367072652, 1.1008024604594278, 1.1604312300839432, 1.2226498725291692, 1.287532903607156, 1.355154898538057, 1.4255903537202645, 1.4989135392420743, 1.5751983416247353, 1.6545180962633725, 1.7369454090124343, 1.8225519663469765, 1.9114083335212724, 2.003583740143085, 2.0991458525865436, 2.198160532680093, 2.300691582129669, 2.4068004721721867, 2.5165460580017815, 2.6299842775721367, 2.747167834453586, 2.868145864514492, 2.9929635863034165, 3.121661935132374, 3.254277181002593, 3.390840530672712, 3.531377714345421, 3.675908557641755, 3.824446539742134, 3.9769983387989387, 4.1335633659655695, 4.294133289640375, 4.458691551788264, 4.627212878476335, 4.79966278703984, 4.975997092578159, 5.156161416764231, 5.340090702231373, 5.527708736074779, 5.718927686267364, 5.913647655036464, 6.111756253475125, 6.313128201864502, 6.517624960358009, 6.725094394818407, 6.935370482702108, 7.148273063945666, 7.36360764182453, 7.581165238719144, 7.800722311635865, 8.022040732186596, 8.244867835529643, 8.468936542513111, 8.693965558940768, 8.919659655497865, 9.14571003143218, 9.371794764584516, 9.59757934980553, 9.822717327185352, 10.046851000862768, 10.26961224847697, 10.49062342058245, 10.709498328573583, 10.925843318866308, 11.139258430268924, 11.349338630650003, 11.555675128188662, 11.757856751679569, 11.955471393572232, 12.148107508660956, 12.33535566061814, 12.516810107888938, 12.6920704198492, 12.86074311357975, 13.022443301137207, 13.176796336811746, 13.323439453563017, 13.462023377621966, 13.592213910144075, 13.713693464801585, 13.826162550311386, 13.929341187112415, 14.022970247731394, 14.10681271080685, 14.180654819275993, 14.244307133862263, 14.297605473728224, 14.340411736971786, 14.372614594535264, 14.3941300520581, 14.404901875224233, 14.404901875224274, 14.394130052058223, 14.372614594535468, 14.340411736972067, 14.297605473728582, 14.2443071338627, 14.180654819276512, 14.106812710807445, 14.02297024773206, 13.929341187113158, 13.826162550312196, 13.713693464802462, 13.592213910145022, 13.462023377622977, 13.323439453564092, 13.176796336812878, 13.022443301138393, 12.860743113580995, 12.692070419850493, 12.516810107890285, 12.335355660619529, 12.148107508662386, 11.955471393573703, 11.757856751681075, 11.555675128190197, 11.349338630651571, 11.139258430270518, 10.925843318867928, 10.70949832857522, 10.490623420584106, 10.269612248478643, 10.046851000864452, 9.822717327187041, 9.597579349807228, 9.371794764586218, 9.145710031433882, 8.919659655499563, 8.693965558942464, 8.468936542514802, 8.244867835531325, 8.022040732188268, 7.800722311637522, 7.581165238720789, 7.36360764182616, 7.148273063947279, 6.935370482703703, 6.725094394819981, 6.517624960359559, 6.3131282018660295, 6.111756253476628, 5.913647655037944, 5.718927686268817, 5.527708736076206, 5.340090702232771, 5.156161416765602, 4.975997092579501, 4.799662787041153, 4.627212878477618, 4.458691551789517, 4.294133289641599, 4.133563365966762, 3.9769983388001013, 3.824446539743269, 3.6759085576428574, 3.5313777143464935, 3.3908405306737546, 3.2542771810036055, 3.1216619351333574, 2.9929635863043704, 2.868145864515417, 2.7471678344544816, 2.629984277573005, 2.516546058002621, 2.4068004721729985, 2.300691582130454, 2.198160532680851, 2.099145852587275, 2.003583740143791, 1.9114083335219536, 1.8225519663476335, 1.7369454090130665, 1.6545180962639812, 1.5751983416253206, 1.498913539242637, 1.4255903537208052, 1.3551548985385764, 1.2875329036076544, 1.222649872529648, 1.160431230084401, 1.1008024604598665, 1.0436892367076862, 0.9890175418809424, 0.9367137822817492, 0.8867048932172267, 0.838918437633494, 0.7932826979691233, 0.7497267615424371, 0.7081805997614391, 0.6685751414213379, 0.6308423403326742, 0.5949152375032591, 0.5607280180793686, 0.5282160632361375, 0.49731599719365116, 0.467965729523933, 0.440104492904655, 0.4136728764679307, 0.3886128548867809, 0.36486781333764823, 0.3423825684745407, 0.32110338554876316, 0.30097799180764595, 0.28195558630596435, 0.26398684626471386, 0.24702393011340684, 0.23102047735389866, 0.21593160538581602, 0.20171390343579956, 0.18832542373487093, 0.17572567009017256, 0.1638755839990321, 0.15273752845467103, 0.14227526959386663, 0.1324539563374054, 0.1232400981741692]}],\n                        {\"title\": {\"text\": \"Coupling Length Distribution\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Coupling Distance (m)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Expectation (au)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"04feef70-1d15-4be8-a5fc-d91de7509048\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"04feef70-1d15-4be8-a5fc-d91de7509048\")) {\n                    Plotly.newPlot(\n                        '04feef70-1d15-4be8-a5fc-d91de7509048',\n                        [{\"legendgroup\": \"Length\", \"line\": {\"color\": \"rgba(31, 119, 180, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Length\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"1b5b96c9-f5fd-485c-8f21-ba432c870387\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5], \"y\": [0.58, 0.58, 0.58, 0.58, 0.58, 0.59]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Length\", \"marker\": {\"color\": \"rgba(31, 119, 180, 1.0)\"}, \"mode\": \"markers\", \"name\": \"Length\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"6aa9f263-863f-4c17-b3ff-ee77c89d0578\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5], \"y\": [0.61, 0.61, 0.61, 0.61, 0.61, 0.61]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Length\", \"line\": {\"color\": \"rgba(31, 119, 180, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Length\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"5ea038a5-979c-4189-9944-d6bdeeeeb049\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5], \"y\": [0.64, 0.64, 0.64, 0.64, 0.64, 0.63]}],\n                        {\"title\": {\"text\": \"Coupling Lengths\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Length (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"2473b2a6-4a95-48b4-b9f4-0d359b74811b\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"2473b2a6-4a95-48b4-b9f4-0d359b74811b\")) {\n                    Plotly.newPlot(\n                        '2473b2a6-4a95-48b4-b9f4-0d359b74811b',\n                        [{\"legendgroup\": \"Deviation\", \"line\": {\"color\": \"rgba(255, 127, 14, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Deviation\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"2f8993a3-7d51-4ff7-9ec3-d3fadbf8722b\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5], \"y\": [-3.0, -3.0, -3.0, -3.0, -3.0, -2.0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Deviation\", \"marker\": {\"color\": \"rgba(255, 127, 14, 1.0)\"}, \"mode\": \"markers\", \"name\": \"Deviation\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"d532f667-88ee-431e-b6b7-1e2241c651bc\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5], \"y\": [0, 0, 0, 0, 0, 0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Deviation\", \"line\": {\"color\": \"rgba(255, 127, 14, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Deviation\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"ca754a58-afd9-4531-a9a9-19ed029894d7\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5], \"y\": [3.0, 3.0, 3.0, 3.0, 3.0, 2.0]}],\n                        {\"title\": {\"text\": \"Coupling Length Median Deviations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Median Deviation (%)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"de3c9c1b-24c2-4bab-a655-35267b7394b8\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"de3c9c1b-24c2-4bab-a655-35267b7394b8\")) {\n                    Plotly.newPlot(\n                        'de3c9c1b-24c2-4bab-a655-35267b7394b8',\n                        [{\"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"4040afcb-d447-4224-a707-055c218ad7bd\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003], \"y\": [0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.6)\"}, \"mode\": \"markers\", \"name\": \"Rear\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"8c749e3e-1985-4dc1-a0a5-86c3c448f088\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003], \"y\": [0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"ae85e4da-dd93-4216-b89e-febd0ad12020\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003], \"y\": [0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7]}, {\"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"9e6cfdca-edb7-4161-bdf4-7a89b267f6c0\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003], \"y\": [0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003, 0.10000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.6)\"}, \"mode\": \"markers\", \"name\": \"Forward\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"4d8146e6-8a0e-4dde-b82c-eaa974c5e7f0\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003], \"y\": [0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"8d642e4b-1e57-4e65-a88b-8f2eb7b13e8f\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003], \"y\": [0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7, 0.7]}],\n                        {\"title\": {\"text\": \"Coupler Rate of Advancement\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Advance Rate (m/cycle)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"3f4c5bf2-8fdf-4e76-aed6-28c56fa769a6\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"3f4c5bf2-8fdf-4e76-aed6-28c56fa769a6\")) {\n                    Plotly.newPlot(\n                        '3f4c5bf2-8fdf-4e76-aed6-28c56fa769a6',\n                        [{\"legendgroup\": \"Left pes\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"8af34fc9-3ec2-41e7-90fa-8e04c73cc31e\", \"x\": [1.4000000000000004, 2.4000000000000004], \"y\": [0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Left pes\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Left pes\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"8ca374f0-36a2-4587-993a-aefde3186308\", \"x\": [1.4000000000000004, 2.4000000000000004], \"y\": [0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Left pes\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"748d1d4c-b827-468b-bc2a-cc849062070a\", \"x\": [1.4000000000000004, 2.4000000000000004], \"y\": [0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Right pes\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"bba851e0-b62d-432c-8df7-a257731923fc\", \"x\": [0.9000000000000001, 1.9000000000000004], \"y\": [0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Right pes\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Right pes\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"656e5e5c-55d6-485e-aee5-8dc0536992ca\", \"x\": [0.9000000000000001, 1.9000000000000004], \"y\": [0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Right pes\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"6768abd4-10a0-43e1-936d-d71a4ea0d9e9\", \"x\": [0.9000000000000001, 1.9000000000000004], \"y\": [0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Left manus\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"aa97b37d-b1c1-415d-896a-0c44a7685fa4\", \"x\": [1.4000000000000004, 2.4000000000000004], \"y\": [0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left manus\", \"marker\": {\"color\": \"rgba(44, 160, 44, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Left manus\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"0f596299-66d3-4d4e-8662-8f7131f99173\", \"x\": [1.4000000000000004, 2.4000000000000004], \"y\": [0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left manus\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"3322cf1d-ca87-479d-a36e-a91f42243dd0\", \"x\": [1.4000000000000004, 2.4000000000000004], \"y\": [0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Right manus\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"7ca6aa1f-3194-41e9-918e-4e3f4d569ced\", \"x\": [0.9000000000000001, 1.9000000000000004], \"y\": [0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right manus\", \"marker\": {\"color\": \"rgba(148, 103, 189, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Right manus\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"9f4851b0-d7f8-4554-9d96-4ee049e3f073\", \"x\": [0.9000000000000001, 1.9000000000000004], \"y\": [0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right manus\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"df5be3ef-6bbc-4bcd-890c-9a9fe8ff013f\", \"x\": [0.9000000000000001, 1.9000000000000004], \"y\": [0.37000000000000005, 0.37000000000000005]}],\n                        {\"title\": {\"text\": \"Stepping Distances\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Distance (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"10c559a8-2ba7-4190-8b60-4c21137039e1\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"10c559a8-2ba7-4190-8b60-4c21137039e1\")) {\n                    Plotly.newPlot(\n                        '10c559a8-2ba7-4190-8b60-4c21137039e1',\n                        [{\"legendgroup\": \"Left\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"f95e2395-a01d-40a2-9b2b-2b63716c54ae\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.59, 0.59, 0.59]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left\", \"marker\": {\"color\": \"rgba(44, 160, 44, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Left\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"c5e21caf-881a-43dc-9aba-df8f00aa1089\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"f9a4f874-ef59-4698-88e6-f542a1434eaf\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.63, 0.63, 0.63]}, {\"legendgroup\": \"Right\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"da3ba973-dcb0-406b-afa9-6e68be21424a\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.5599999999999999, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.57]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right\", \"marker\": {\"color\": \"rgba(148, 103, 189, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Right\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"6203e5b9-4e80-4b80-94ea-c9221263fa36\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"249651a6-1c2c-4d13-a4a9-ac6d5e0966ae\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.66, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.65]}],\n                        {\"title\": {\"text\": \"Left &amp; Right Separations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Separation (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"ea6bdbdc-7eb9-4584-8ba6-4cdfc6b4cbbf\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"ea6bdbdc-7eb9-4584-8ba6-4cdfc6b4cbbf\")) {\n                    Plotly.newPlot(\n                        'ea6bdbdc-7eb9-4584-8ba6-4cdfc6b4cbbf',\n                        [{\"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"cbe10baf-c486-4703-8424-cea74642cb8e\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.26]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Forward\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"7428ecb0-77a8-4763-9222-4d03c26ca9e9\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"4fc7453d-92fa-4688-ab8e-79985e7bfa7e\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.28]}, {\"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"946905ab-3189-4ac7-9000-707851ecd8d0\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002, 0.22, 0.2, 0.18000000000000002, 0.16, 0.18000000000000002, 0.2, 0.22, 0.26, 0.26, 0.24000000000000002]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Rear\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"3fd06388-afce-41dd-9242-35b446100c4f\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27, 0.24, 0.22, 0.2, 0.2, 0.2, 0.22, 0.24, 0.27, 0.27, 0.27]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"8d5ada28-2273-4dca-ba82-44956855b72d\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004, 0.26, 0.24, 0.22, 0.24000000000000002, 0.22, 0.24, 0.26, 0.28, 0.28, 0.30000000000000004]}],\n                        {\"title\": {\"text\": \"Forward &amp; Rear Separations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Separation (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div style=\"height:120px\"> </div>"};
+
+}());
\ No newline at end of file
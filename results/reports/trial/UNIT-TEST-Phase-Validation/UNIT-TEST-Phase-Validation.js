@@ -0,0 +1,5 @@
+(function () {
+
+    window.SIM_DATA = {"data": {"time": {"count": 38, "cycles": [0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0], "support_cycles": [-0.2499999999999999, -0.19999999999999984, -0.15000000000000002, -0.09999999999999998, -0.04999999999999993, 1.1102230246251565e-16, 0.050000000000000155, 0.09999999999999998, 0.15000000000000002, 0.20000000000000007, 0.2500000000000001, 0.30000000000000016, 0.35, 0.4, 0.45000000000000007, 0.5000000000000001, 0.5500000000000002, 0.6, 0.6500000000000002, 0.7000000000000001, 0.7499999999999999, 0.8000000000000002, 0.85, 0.9000000000000002, 0.9500000000000001, 1.0000000000000004, 1.0500000000000003, 1.1, 1.1500000000000004, 1.2000000000000002, 1.2500000000000004, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5000000000000004, 1.5500000000000003, 1.6], "steps_per_cycle": 20, "progress": [0, 2.7027027027027026, 5.405405405405405, 8.108108108108109, 10.81081081081081, 13.513513513513512, 16.216216216216214, 18.918918918918916, 21.621621621621617, 24.32432432432432, 27.02702702702702, 29.729729729729723, 32.43243243243243, 35.13513513513513, 37.83783783783783, 40.54054054054053, 43.243243243243235, 45.94594594594594, 48.64864864864864, 51.35135135135134, 54.05405405405404, 56.756756756756744, 59.459459459459445, 62.16216216216215, 64.86486486486486, 67.56756756756756, 70.27027027027027, 72.97297297297298, 75.67567567567569, 78.3783783783784, 81.08108108108111, 83.78378378378382, 86.48648648648653, 89.18918918918924, 91.89189189189194, 94.59459459459465, 97.29729729729736, 100.0]}, "cycles": {"left_pes": [[5, "M"], [12, "F"], [8, "M"], [13, "F"]], "right_pes": [[12, "F"], [9, "M"], [11, "F"], [6, "M"]], "left_manus": [[2, "F"], [8, "M"], [12, "F"], [8, "M"], [8, "F"]], "right_manus": [[7, "F"], [8, "M"], [12, "F"], [8, "M"], [3, "F"]]}, "scale": 2048.0, "offset": [0, 0], "markerIds": ["left_pes", "right_pes", "left_manus", "right_manus"], "frames": {"version": 1, "count": 38, "scale": null, "keys": ["time", "support_time", "positions.0.x.0", "positions.0.x.1", "positions.0.x.2", "positions.0.y.0", "positions.0.y.1", "positions.0.y.2", "positions.0.f", "positions.0.tx0.0", "positions.0.tx0.1", "positions.0.ty0.0", "positions.0.ty0.1", "positions.0.tx1.0", "positions.0.tx1.1", "positions.0.ty1.0", "positions.0.ty1.1", "positions.1.x.0", "positions.1.x.1", "positions.1.x.2", "positions.1.y.0", "positions.1.y.1", "positions.1.y.2", "positions.1.f", "positions.1.tx0.0", "positions.1.tx0.1", "positions.1.ty0.0", "positions.1.ty0.1", "positions.1.tx1.0", "positions.1.tx1.1", "positions.1.ty1.0", "positions.1.ty1.1", "positions.2.x.0", "positions.2.x.1", "positions.2.x.2", "positions.2.y.0", "positions.2.y.1", "positions.2.y.2", "positions.2.f", "positions.2.tx0.0", "positions.2.tx0.1", "positions.2.ty0.0", "positions.2.ty0.1", "positions.2.tx1.0", "positions.2.tx1.1", "positions.2.ty1.0", "positions.2.ty1.1", "positions.3.x.0", "positions.3.x.1", "positions.3.x.2", "positions.3.y.0", "positions.3.y.1", "positions.3.y.2", "positions.3.f", "positions.3.tx0.0", "positions.3.tx0.1", "positions.3.ty0.0", "positions.3.ty0.1", "positions.3.tx1.0", "positions.3.tx1.1", "positions.3.ty1.0", "positions.3.ty1.1", "rear_coupler.x.0", "rear_coupler.x.1", "rear_coupler.x.2", "rear_coupler.y.0", "rear_coupler.y.1", "rear_coupler.y.2", "forward_coupler.x.0", "forward_coupler.x.1", "forward_coupler.x.2", "forward_coupler.y.0", "forward_coupler.y.1", "forward_coupler.y.2", "midpoint.x.0", "midpoint.x.1", "midpoint.x.2", "midpoint.y.0", "midpoint.y.1", "midpoint.y.2", "rear_support_box.0.x", "rear_support_box.0.y", "rear_support_box.1.x", "rear_support_box.1.y", "rear_support_box.2.x", "rear_support_box.2.y", "rear_support_box.3.x", "rear_support_box.3.y", "forward_support_box.0.x", "forward_support_box.0.y", "forward_support_box.1.x", "forward_support_box.1.y", "forward_support_box.2.x", "forward_support_box.2.y", "forward_support_box.3.x", "forward_support_box.3.y"], "types": ["f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "label", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "label", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "label", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "label", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8", "f8"], "labels": ["M", "F"], "columns": [[0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0], [-0.2499999999999999, -0.19999999999999984, -0.15000000000000002, -0.09999999999999998, -0.04999999999999993, 1.1102230246251565e-16, 0.050000000000000155, 0.09999999999999998, 0.15000000000000002, 0.20000000000000007, 0.2500000000000001, 0.30000000000000016, 0.35, 0.4, 0.45000000000000007, 0.5000000000000001, 0.5500000000000002, 0.6, 0.6500000000000002, 0.7000000000000001, 0.7499999999999999, 0.8000000000000002, 0.85, 0.9000000000000002, 0.9500000000000001, 1.0000000000000004, 1.0500000000000003, 1.1, 1.1500000000000004, 1.2000000000000002, 1.2500000000000004, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5000000000000004, 1.5500000000000003, 1.6], [0.19, 0.25, 0.31, 0.38, 0.44, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.56, 0.63, 0.6900000000000001, 0.75, 0.81, 0.88, 0.9400000000000001, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0], [0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.18750000000000017, 0.2500000000000002, 0.3125, 0.37500000000000006, 0.4375000000000001, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5625000000000003, 0.6250000000000001, 0.6874999999999999, 0.7500000000000002, 0.8125, 0.8750000000000003, 0.9375000000000001, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0], [0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24, 0.24], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245], [0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], [-3.8125, -3.75, -3.6875, -3.625, -3.5625, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.4374999999999996, -3.375, -3.3125, -3.25, -3.1875, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996], [0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05], [0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [4.3125, 4.375, 4.4375, 4.5, 4.5625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.6875, 4.75, 4.8125, 4.875, 4.9375, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0], [0.05, 0.05, 0.05, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.06, 0.13, 0.19, 0.25, 0.31, 0.38, 0.44, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.56, 0.63, 0.6900000000000001, 0.75, 0.81], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.06250000000000006, 0.1250000000000001, 0.18750000000000017, 0.2500000000000002, 0.3125, 0.37500000000000033, 0.4375000000000001, 0.4999999999999999, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5625000000000003, 0.6250000000000001, 0.6875000000000004, 0.7500000000000002, 0.8125], [-0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01, -0.01], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [-0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044], [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0], [-4.0, -4.0, -4.0, -4.0, -4.0, -4.0, -4.0, -4.0, -4.0, -4.0, -4.0, -4.0, -4.0, -3.9375, -3.875, -3.8125, -3.75, -3.6875, -3.6249999999999996, -3.5625, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.4374999999999996, -3.375, -3.3124999999999996, -3.3124999999999996, -3.3124999999999996], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05], [-0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [4.125, 4.125, 4.125, 4.125, 4.125, 4.125, 4.125, 4.125, 4.125, 4.125, 4.125, 4.125, 4.125, 4.1875, 4.25, 4.3125, 4.375, 4.4375, 4.5, 4.5625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.6875, 4.75, 4.8125, 4.8125, 4.8125], [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05], [-0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.0, 0.0, 0.0, 0.06, 0.13, 0.19, 0.25, 0.31, 0.38, 0.44, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.56, 0.63, 0.6900000000000001, 0.75, 0.81, 0.88, 0.9400000000000001, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0], [0.01, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.0, 0.0, 0.0, 0.06250000000000006, 0.1250000000000001, 0.18750000000000017, 0.2500000000000002, 0.3125, 0.37500000000000006, 0.4375000000000001, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5625000000000003, 0.6250000000000001, 0.6875000000000004, 0.7500000000000002, 0.8125, 0.8750000000000003, 0.9375000000000001, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0], [0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17, 0.17], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998], [1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1], [-4.0, -4.0, -4.0, -3.9375, -3.875, -3.8125, -3.75, -3.6875, -3.625, -3.5625, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.4374999999999996, -3.375, -3.3124999999999996, -3.25, -3.1875, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996], [0.01, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05], [0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [4.125, 4.125, 4.125, 4.1875, 4.25, 4.3125, 4.375, 4.4375, 4.5, 4.5625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.6875, 4.75, 4.8125, 4.875, 4.9375, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0], [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.06, 0.13, 0.19, 0.25, 0.31, 0.38, 0.44, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.56, 0.63, 0.6900000000000001, 0.75, 0.81, 0.88, 0.9400000000000001, 1.0, 1.0, 1.0], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.01, 0.01], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.06250000000000006, 0.1250000000000001, 0.18750000000000017, 0.2500000000000002, 0.3125, 0.37500000000000006, 0.4375000000000001, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5625000000000003, 0.6250000000000001, 0.6875000000000004, 0.7500000000000002, 0.8125, 0.8750000000000003, 0.9375000000000001, 1.0, 1.0, 1.0], [0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07, 0.07], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999], [1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1], [-4.0, -4.0, -4.0, -4.0, -4.0, -4.0, -4.0, -4.0, -3.9375, -3.875, -3.8125, -3.75, -3.6875, -3.625, -3.5625, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.5, -3.4374999999999996, -3.375, -3.3124999999999996, -3.25, -3.1875, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996, -3.1249999999999996], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05], [0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [4.125, 4.125, 4.125, 4.125, 4.125, 4.125, 4.125, 4.125, 4.1875, 4.25, 4.3125, 4.375, 4.4375, 4.5, 4.5625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.625, 4.6875, 4.75, 4.8125, 4.875, 4.9375, 5.0, 5.0, 5.0, 5.0, 5.0], [0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05, 0.01, 0.01, 0.01, 0.01, 0.01], [0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999], [0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01, 0.01], [0.09, 0.13, 0.16, 0.19, 0.22, 0.25, 0.25, 0.25, 0.25, 0.25, 0.25, 0.25, 0.25, 0.28, 0.31, 0.34, 0.38, 0.41000000000000003, 0.47000000000000003, 0.53, 0.59, 0.63, 0.66, 0.6900000000000001, 0.72, 0.75, 0.75, 0.75, 0.75, 0.75, 0.75, 0.75, 0.75, 0.78, 0.81, 0.84, 0.88, 0.91], [0.03, 0.03, 0.03, 0.03, 0.03, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.03, 0.03, 0.03, 0.03, 0.03, 0.04, 0.04, 0.04, 0.04, 0.03, 0.03, 0.03, 0.03, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.03, 0.03, 0.03, 0.03, 0.03, 0.03], [0.09375000000000008, 0.1250000000000001, 0.15625, 0.18750000000000003, 0.21875000000000006, 0.25, 0.25, 0.25, 0.25, 0.25, 0.25, 0.25, 0.25, 0.28125, 0.31250000000000006, 0.3437500000000001, 0.3750000000000001, 0.40625, 0.46875000000000033, 0.5312500000000001, 0.5937499999999999, 0.6250000000000001, 0.65625, 0.6875000000000002, 0.71875, 0.75, 0.75, 0.75, 0.75, 0.75, 0.75, 0.75, 0.75, 0.7812500000000002, 0.8125, 0.8437500000000002, 0.8750000000000001, 0.90625], [0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12], [0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007], [0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12], [0.0, 0.0, 0.0, 0.03, 0.06, 0.09, 0.13, 0.16, 0.22, 0.28, 0.34, 0.38, 0.41000000000000003, 0.44, 0.47000000000000003, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.53, 0.56, 0.59, 0.63, 0.66, 0.72, 0.78, 0.84, 0.88, 0.91, 0.9400000000000001, 0.97, 1.0, 1.0, 1.0], [0.007, 0.007, 0.03, 0.03, 0.03, 0.03, 0.03, 0.04, 0.04, 0.04, 0.03, 0.03, 0.03, 0.03, 0.03, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.03, 0.03, 0.03, 0.03, 0.03, 0.04, 0.04, 0.04, 0.03, 0.03, 0.03, 0.03, 0.03, 0.007, 0.007, 0.007], [0.0, 0.0, 0.0, 0.03125000000000003, 0.06250000000000006, 0.09375000000000008, 0.1250000000000001, 0.15625, 0.21875000000000006, 0.2812500000000001, 0.3437500000000001, 0.3750000000000001, 0.40625, 0.4375, 0.46875000000000006, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5312500000000002, 0.5625, 0.5937500000000002, 0.6250000000000001, 0.65625, 0.7187500000000003, 0.7812500000000001, 0.8437500000000002, 0.8750000000000001, 0.90625, 0.9375000000000002, 0.96875, 1.0, 1.0, 1.0], [0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12], [0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007, 0.007], [0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12], [0.05, 0.06, 0.08, 0.11, 0.14, 0.17, 0.19, 0.2, 0.23, 0.27, 0.3, 0.31, 0.33, 0.36, 0.39, 0.42, 0.44, 0.45, 0.48, 0.52, 0.55, 0.56, 0.58, 0.61, 0.64, 0.67, 0.6900000000000001, 0.7000000000000001, 0.73, 0.77, 0.8, 0.81, 0.8300000000000001, 0.86, 0.89, 0.92, 0.9400000000000001, 0.9500000000000001], [0.01, 0.01, 0.02, 0.02, 0.02, 0.01, 0.01, 0.02, 0.02, 0.02, 0.01, 0.01, 0.02, 0.02, 0.02, 0.01, 0.01, 0.02, 0.02, 0.02, 0.02, 0.01, 0.02, 0.02, 0.02, 0.01, 0.01, 0.02, 0.02, 0.02, 0.01, 0.01, 0.02, 0.02, 0.02, 0.01, 0.01, 0.01], [0.04687500000000004, 0.06250000000000006, 0.078125, 0.10937500000000003, 0.14062500000000006, 0.17187500000000006, 0.18750000000000006, 0.203125, 0.23437500000000003, 0.26562500000000006, 0.29687500000000006, 0.31250000000000006, 0.328125, 0.359375, 0.39062500000000006, 0.42187500000000006, 0.43750000000000006, 0.453125, 0.48437500000000017, 0.515625, 0.546875, 0.5625, 0.578125, 0.6093750000000002, 0.640625, 0.6718750000000001, 0.6875, 0.703125, 0.7343750000000002, 0.765625, 0.7968750000000001, 0.8125, 0.828125, 0.8593750000000002, 0.890625, 0.9218750000000001, 0.9375, 0.953125], [0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12], [0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005, 0.005], [0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12, 0.12], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.06250000000000006, 0.1250000000000001, 0.18750000000000017, 0.2500000000000002, 0.3125, 0.37500000000000033, 0.4375000000000001, 0.4999999999999999, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5625000000000003, 0.6250000000000001, 0.6875000000000004, 0.7500000000000002, 0.8125], [0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245], [0.18750000000000017, 0.2500000000000002, 0.3125, 0.37500000000000006, 0.4375000000000001, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5625000000000003, 0.6250000000000001, 0.6874999999999999, 0.7500000000000002, 0.8125, 0.8750000000000003, 0.9375000000000001, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0], [0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245, 0.245], [0.18750000000000017, 0.2500000000000002, 0.3125, 0.37500000000000006, 0.4375000000000001, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5625000000000003, 0.6250000000000001, 0.6874999999999999, 0.7500000000000002, 0.8125, 0.8750000000000003, 0.9375000000000001, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0], [-0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.06250000000000006, 0.1250000000000001, 0.18750000000000017, 0.2500000000000002, 0.3125, 0.37500000000000033, 0.4375000000000001, 0.4999999999999999, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5625000000000003, 0.6250000000000001, 0.6875000000000004, 0.7500000000000002, 0.8125], [-0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044, -0.0050000000000000044], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.06250000000000006, 0.1250000000000001, 0.18750000000000017, 0.2500000000000002, 0.3125, 0.37500000000000006, 0.4375000000000001, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5625000000000003, 0.6250000000000001, 0.6875000000000004, 0.7500000000000002, 0.8125, 0.8750000000000003, 0.9375000000000001, 1.0, 1.0, 1.0], [0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998], [0.0, 0.0, 0.0, 0.06250000000000006, 0.1250000000000001, 0.18750000000000017, 0.2500000000000002, 0.3125, 0.37500000000000006, 0.4375000000000001, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5625000000000003, 0.6250000000000001, 0.6875000000000004, 0.7500000000000002, 0.8125, 0.8750000000000003, 0.9375000000000001, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0], [0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998, 0.16999999999999998], [0.0, 0.0, 0.0, 0.06250000000000006, 0.1250000000000001, 0.18750000000000017, 0.2500000000000002, 0.3125, 0.37500000000000006, 0.4375000000000001, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5625000000000003, 0.6250000000000001, 0.6875000000000004, 0.7500000000000002, 0.8125, 0.8750000000000003, 0.9375000000000001, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0], [0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999], [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.06250000000000006, 0.1250000000000001, 0.18750000000000017, 0.2500000000000002, 0.3125, 0.37500000000000006, 0.4375000000000001, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5625000000000003, 0.6250000000000001, 0.6875000000000004, 0.7500000000000002, 0.8125, 0.8750000000000003, 0.9375000000000001, 1.0, 1.0, 1.0], [0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999, 0.06999999999999999]]}}, "body": "<div class=\"top-container no-select\">\n  <div style=\"display:flex;padding:0 1.0em;align-items: flex-end;\">\n    <div class=\"header-box\">\n      <div class=\"header-title\">UNIT-TEST Phase Validation</div>\n      <div class=\"header-summary\">Validates the phase relationships.</div>\n      <div class=\"header-entry date\">\n        <span class=\"name\">Date:</span>\n        <span class=\"value\">10-18-2026 12:28</span>\n      </div>\n      <div class=\"header-entry duty-cycle\">\n        <span class=\"name\">Duty Cycle:</span>\n        <span class=\"value\">60%</span>\n      </div>\n      <div class=\"header-entry activity-phases\">\n        <span class=\"name\">Activity Phases:</span>\n          <span class=\"value\">\n            Pes: (<span class=\"left_pes-value\">0%</span>,\n            <span class=\"right_pes-value\">75%</span>)\n            Manus: (<span class=\"left_manus-value\">25%</span>,\n            <span class=\"right_manus-value\">50%</span>)\n          </span>\n      </div>\n      <div class=\"header-entry support-phases\">\n        <span class=\"name\">Support Phases:</span>\n          <span class=\"value\">\n            Pes: (<span class=\"left_pes-value\">0%</span>,\n            <span class=\"right_pes-value\">75%</span>)\n            Manus: (<span class=\"left_manus-value\">25%</span>,\n            <span class=\"right_manus-value\">50%</span>)\n          </span>\n      </div>\n    </div>\n    <div class=\"spacer\"></div>\n\n    <div class=\"playback-controls\">\n      <div class=\"control-row\">\n        <div class=\"spacer\"></div>\n\n        <div class=\"control\" data-role=\"pop-out\">\n          <img src=\"img/picture-in-picture.svg\"/>\n        </div>\n\n        <div class=\"control\" data-role=\"save-svg\">\n          <img src=\"img/camera.svg\"/>\n        </div>\n      </div>\n\n      <div class=\"control-row animation-controls\">\n        <div class=\"spacer\"></div>\n\n        <div class=\"control\" data-role=\"backward-10\">\n          <img src=\"img/replay-10.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"jump-back\">\n          <img src=\"img/back.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"frame-back\">\n          <img src=\"img/step-back.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"toggle-play\">\n          <img src=\"img/play.svg\" class=\"play-icon\"/>\n          <img src=\"img/pause.svg\" class=\"pause-icon\"/>\n        </div>\n        <div class=\"control\" data-role=\"frame-forward\">\n          <img src=\"img/step-forward.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"jump-forward\">\n          <img src=\"img/forward.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"forward-10\">\n          <img src=\"img/forward-10.svg\"/>\n        </div>\n      </div>\n\n\n    </div>\n  </div>\n\n  <div class=\"progress-bar\">\n    <div class=\"header\">\n      <div class=\"value-box\">\n        <div class=\"header\">Left Pes</div>\n        <div class=\"swatch left_pes_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Right Pes</div>\n        <div class=\"swatch right_pes_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Left Manus</div>\n        <div class=\"swatch left_manus_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Right Manus</div>\n        <div class=\"swatch right_manus_color\"></div>\n      </div>\n\n      <div class=\"spacer\"></div>\n\n      <div class=\"time-box\">\n\n        <div class=\"value-box\">\n          <div class=\"header\">Progress</div>\n          <div class=\"value progress-value\"></div>\n        </div>\n\n        <div class=\"value-box activity-time-box\">\n          <div class=\"header\">Activity Cycle</div>\n          <div class=\"value\">\n            <span class=\"cycle-value\"></span> :\n            <span class=\"phase-value\"></span>\n          </div>\n        </div>\n\n        <div class=\"value-box support-time-box\">\n          <div class=\"header\">Support Cycle</div>\n          <div class=\"value\">\n            <span class=\"cycle-value\"></span> :\n            <span class=\"phase-value\"></span>\n          </div>\n        </div>\n\n      </div>\n    </div>\n\n    <div class=\"outer\">\n      <div class=\"inner\"></div>\n      <div class=\"cycles left_pes left_pes_color\"></div>\n      <div class=\"cycles left_manus left_manus_color\"></div>\n      <div class=\"cycles right_manus right_manus_color\"></div>\n      <div class=\"cycles right_pes right_pes_color\"></div>\n    </div>\n  </div>\n</div>\n\n        <div class=\"svg-box\">\n          <div class=\"svg-box-inner\">\n<svg version=\"1.1\"\n    id=\"svg-459882579605\"\n    xmlns:xlink=\"http://www.w3.org/1999/xlink\"\n    xmlns=\"http://www.w3.org/2000/svg\"\n    viewBox=\"-21 -523 2086 555\">\n\n<style>\n/* <![CDATA[ */\n#svg-459882579605 .left_pes { fill: DodgerBlue; opacity: 0.5; }\n#svg-459882579605 .right_pes { fill: DarkOrange; opacity: 0.5; }\n#svg-459882579605 .left_manus { fill: DarkOliveGreen; opacity: 0.5; }\n#svg-459882579605 .right_manus { fill: DarkOrchid; opacity: 0.5; }\n#svg-459882579605 .left_pes { fill: DodgerBlue; opacity: 0.5; stroke-width: 8px; stroke: DodgerBlue; }\n#svg-459882579605 .left_pes.assumed { fill: white; opacity: 0.33; }\n#svg-459882579605 .left_pes-marker { fill: transparent; stroke-width: 8px; stroke: DodgerBlue; }\n#svg-459882579605 .right_pes { fill: DarkOrange; opacity: 0.5; stroke-width: 8px; stroke: DarkOrange; }\n#svg-459882579605 .right_pes.assumed { fill: white; opacity: 0.33; }\n#svg-459882579605 .right_pes-marker { fill: transparent; stroke-width: 8px; stroke: DarkOrange; }\n#svg-459882579605 .left_manus { fill: DarkOliveGreen; opacity: 0.5; stroke-width: 8px; stroke: DarkOliveGreen; stroke-dasharray: 4,4; }\n#svg-459882579605 .left_manus.assumed { fill: white; opacity: 0.33; stroke-dasharray: 4,4; }\n#svg-459882579605 .left_manus-marker { fill: transparent; stroke-width: 8px; stroke: DarkOliveGreen; stroke-dasharray: 8,4; }\n#svg-459882579605 .right_manus { fill: DarkOrchid; opacity: 0.5; stroke-width: 8px; stroke: DarkOrchid; stroke-dasharray: 4,4; }\n#svg-459882579605 .right_manus.assumed { fill: white; opacity: 0.33; stroke-dasharray: 4,4; }\n#svg-459882579605 .right_manus-marker { fill: transparent; stroke-width: 8px; stroke: DarkOrchid; stroke-dasharray: 8,4; }\n/* ]]> */\n</style>\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"0.0\" cy=\"-501.76\" data-x=\"0.0\" data-x-unc=\"0.01\" data-y=\"0.24\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-uid=\"1\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"1024.0\" cy=\"-501.76\" data-x=\"0.5\" data-x-unc=\"0.01\" data-y=\"0.24\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"2\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"2048.0\" cy=\"-501.76\" data-x=\"1.0\" data-x-unc=\"0.01\" data-y=\"0.24\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"3\" />\n<circle id=\"left_pes\" class=\"left_pes-marker\" r=\"16.0\" cx=\"0.0\" cy=\"-501.76\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"0.0\" cy=\"10.240000000000009\" data-x=\"0.0\" data-x-unc=\"0.01\" data-y=\"-0.01\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"4\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"1024.0\" cy=\"10.240000000000009\" data-x=\"0.5\" data-x-unc=\"0.01\" data-y=\"-0.01\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"5\" />\n<circle id=\"right_pes\" class=\"right_pes-marker\" r=\"16.0\" cx=\"0.0\" cy=\"10.240000000000009\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"0.0\" cy=\"-348.15999999999997\" data-x=\"0.0\" data-x-unc=\"0.01\" data-y=\"0.17\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"7\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"1024.0\" cy=\"-348.15999999999997\" data-x=\"0.5\" data-x-unc=\"0.01\" data-y=\"0.17\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"8\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"2048.0\" cy=\"-348.15999999999997\" data-x=\"1.0\" data-x-unc=\"0.01\" data-y=\"0.17\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"9\" />\n<circle id=\"left_manus\" class=\"left_manus-marker\" r=\"12.0\" cx=\"0.0\" cy=\"-348.15999999999997\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"0.0\" cy=\"-143.35999999999999\" data-x=\"0.0\" data-x-unc=\"0.01\" data-y=\"0.07\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"10\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"1024.0\" cy=\"-143.35999999999999\" data-x=\"0.5\" data-x-unc=\"0.01\" data-y=\"0.07\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"11\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"2048.0\" cy=\"-143.35999999999999\" data-x=\"1.0\" data-x-unc=\"0.01\" data-y=\"0.07\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"12\" />\n<circle id=\"right_manus\" class=\"right_manus-marker\" r=\"12.0\" cx=\"0.0\" cy=\"-143.35999999999999\" />\n</svg></div>\n          <div class=\"svg-controls-box\" style=\"display:none\">\n            <div>\n                <div>Activity: <span class=\"activity-status\"></span></div>\n                <div>Support: <span class=\"support-status\"></span></div>\n            </div>\n            <div class=\"spacer\"></div>\n          </div>\n        </div>\n        \n<div class=\"line-break\"></div>\n\n<div class=\"results-container\">\n  <div class=\"settings-box info-display-box\">\n    <div class=\"info-header\">Trial Results</div>\n\n    <div class=\"info-row\">\n      <div id=\"lengthResults\" class=\"entry\">\n        <div class=\"title title-box\">Average Calculated Lengths (m)</div>\n\n        <div>\n          <span class=\"label\">Coupling Length:</span>\n          <span class=\"value\">0.09 &#177; 0.02</span>\n          <!-- span class=\"deviation\"> </span -->\n        </div>\n\n        <div>\n          <span class=\"label\">Coupling IQR:</span>\n          <span class=\"value\">[0.06526, 0.1149]</span>\n        </div>\n\n        <div>\n          <span class=\"label\">Coupling Bounds (2%):</span>\n          <span class=\"value\">[0.01182, 0.1677]</span>\n        </div>\n      </div>\n    </div>\n  </div>\n\n  <div class=\"status-box info-display-box\">\n    <div class=\"info-header\">Display Status</div>\n\n    <div class=\"info-row\">\n      <div class=\"entry left_pes\">\n        <div class=\"title left_pes_color\">Left Pes</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n\n      <div class=\"entry left_manus\">\n        <div class=\"title left_manus_color\">Left Manus</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n    </div>\n\n    <div class=\"info-row\">\n      <div class=\"entry right_pes\">\n        <div class=\"title right_pes_color\">Right Pes</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n\n      <div class=\"entry right_manus\">\n        <div class=\"title right_manus_color\">Right Manus</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n    </div>\n  </div>\n</div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"cc0e62de-4321-410d-9cfa-143ce5e97fd4\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"cc0e62de-4321-410d-9cfa-143ce5e97fd4\")) {\n                    Plotly.newPlot(\n                        'cc0e62de-4321-410d-9cfa-143ce5e97fd4',\n                        [{\"mode\": \"lines\", \"type\": \"scatter\", \"uid\": \"5dd5550f-18b6-4f1c-80d5-0a328f01458c\", \"x\": [-0.03, -0.02903614457831325, -0.028072289156626504, -0.027108433734939756, -0.02614457831325301, -0.02518072289156626, -0.024216867469879513, -0.023253012048192766, -0.022289156626506018, -0.02132530120481927, -0.020361445783132523, -0.019397590361445775, -0.018433734939759028, -0.01746987951807228, -0.016506024096385533, -0.015542168674698785, -0.014578313253012037, -0.01361445783132529, -0.012650602409638542, -0.011686746987951795, -0.010722891566265047, -0.0097590361445783, -0.008795180722891552, -0.007831325301204804, -0.0068674698795180575, -0.005903614457831311, -0.004939759036144564, -0.003975903614457817, -0.0030120481927710706, -0.002048192771084324, -0.001084337349397577, -0.00012048192771083, 0.0008433734939759169, 0.0018072289156626639, 0.0027710843373494106, 0.0037349397590361573, 0.004698795180722904, 0.005662650602409651, 0.0066265060240963975, 0.007590361445783144, 0.008554216867469891, 0.009518072289156639, 0.010481927710843386, 0.011445783132530134, 0.012409638554216881, 0.013373493975903629, 0.014337349397590377, 0.015301204819277124, 0.01626506024096387, 0.01722891566265062, 0.018192771084337367, 0.019156626506024114, 0.020120481927710862, 0.02108433734939761, 0.022048192771084357, 0.023012048192771105, 0.023975903614457852, 0.0249397590361446, 0.025903614457831348, 0.026867469879518095, 0.027831325301204843, 0.02879518072289159, 0.029759036144578338, 0.030722891566265086, 0.03168674698795183, 0.03265060240963858, 0.03361445783132533, 0.034578313253012076, 0.035542168674698824, 0.03650602409638557, 0.03746987951807232, 0.038433734939759066, 0.039397590361445814, 0.04036144578313256, 0.04132530120481931, 0.04228915662650606, 0.043253012048192804, 0.04421686746987955, 0.0451807228915663, 0.04614457831325305, 0.047108433734939795, 0.04807228915662654, 0.04903614457831329, 0.05000000000000004, 0.050963855421686785, 0.05192771084337353, 0.05289156626506028, 0.05385542168674703, 0.054819277108433775, 0.05578313253012052, 0.05674698795180727, 0.05771084337349402, 0.058674698795180766, 0.05963855421686751, 0.06060240963855426, 0.06156626506024101, 0.06253012048192776, 0.0634939759036145, 0.06445783132530124, 0.06542168674698798, 0.06638554216867472, 0.06734939759036146, 0.0683132530120482, 0.06927710843373494, 0.07024096385542168, 0.07120481927710842, 0.07216867469879516, 0.0731325301204819, 0.07409638554216864, 0.07506024096385538, 0.07602409638554213, 0.07698795180722887, 0.0779518072289156, 0.07891566265060235, 0.07987951807228909, 0.08084337349397583, 0.08180722891566257, 0.08277108433734931, 0.08373493975903605, 0.08469879518072279, 0.08566265060240953, 0.08662650602409627, 0.08759036144578301, 0.08855421686746975, 0.0895180722891565, 0.09048192771084324, 0.09144578313252998, 0.09240963855421672, 0.09337349397590346, 0.0943373493975902, 0.09530120481927694, 0.09626506024096368, 0.09722891566265042, 0.09819277108433716, 0.0991566265060239, 0.10012048192771064, 0.10108433734939738, 0.10204819277108412, 0.10301204819277086, 0.1039759036144576, 0.10493975903614434, 0.10590361445783109, 0.10686746987951783, 0.10783132530120457, 0.10879518072289131, 0.10975903614457805, 0.11072289156626479, 0.11168674698795153, 0.11265060240963827, 0.11361445783132501, 0.11457831325301175, 0.11554216867469849, 0.11650602409638523, 0.11746987951807197, 0.11843373493975871, 0.11939759036144545, 0.1203614457831322, 0.12132530120481894, 0.12228915662650568, 0.12325301204819242, 0.12421686746987916, 0.1251807228915659, 0.12614457831325265, 0.1271084337349394, 0.12807228915662616, 0.12903614457831292, 0.12999999999999967, 0.13096385542168643, 0.13192771084337318, 0.13289156626505993, 0.1338554216867467, 0.13481927710843344, 0.1357831325301202, 0.13674698795180695, 0.1377108433734937, 0.13867469879518046, 0.13963855421686722, 0.14060240963855397, 0.14156626506024073, 0.14253012048192748, 0.14349397590361423, 0.144457831325301, 0.14542168674698774, 0.1463855421686745, 0.14734939759036125, 0.148313253012048, 0.14927710843373476, 0.15024096385542152, 0.15120481927710827, 0.15216867469879503, 0.15313253012048178, 0.15409638554216853, 0.1550602409638553, 0.15602409638554204, 0.1569879518072288, 0.15795180722891555, 0.1589156626506023, 0.15987951807228906, 0.16084337349397582, 0.16180722891566257, 0.16277108433734933, 0.16373493975903608, 0.16469879518072283, 0.1656626506024096, 0.16662650602409634, 0.1675903614457831, 0.16855421686746985, 0.1695180722891566, 0.17048192771084336, 0.17144578313253012, 0.17240963855421687, 0.17337349397590363, 0.17433734939759038, 0.17530120481927713, 0.1762650602409639, 0.17722891566265064, 0.1781927710843374, 0.17915662650602415, 0.1801204819277109, 0.18108433734939766, 0.18204819277108442, 0.18301204819277117, 0.18397590361445793, 0.18493975903614468, 0.18590361445783143, 0.1868674698795182, 0.18783132530120494, 0.1887951807228917, 0.18975903614457845, 0.1907228915662652, 0.19168674698795196, 0.19265060240963872, 0.19361445783132547, 0.19457831325301223, 0.19554216867469898, 0.19650602409638573, 0.1974698795180725, 0.19843373493975924, 0.199397590361446, 0.20036144578313275, 0.2013253012048195, 0.20228915662650626, 0.20325301204819302, 0.20421686746987977, 0.20518072289156652, 0.20614457831325328, 0.20710843373494003, 0.2080722891566268, 0.20903614457831354, 0.21], \"y\": [0.08421240960521167, 0.09056824117972989, 0.09735079552499983, 0.10458451058445123, 0.11229491564187773, 0.1205086590807954, 0.12925353539777637, 0.13855851133277095, 0.14845375097053598, 0.15897063965797273, 0.17014180657247277, 0.18200114576623463, 0.19458383550097666, 0.2079263556765191, 0.22206650314536025, 0.2370434046936461, 0.2528975274568474, 0.2696706865260622, 0.2874060494881934, 0.306148137630361, 0.32594282352587917, 0.3468373247060398, 0.3688801931088881, 0.3921212999832673, 0.41661181591378604, 0.44240418562017175, 0.4695520971728619, 0.4981104452558592, 0.5281352880980374, 0.5596837976854212, 0.592814202859764, 0.6275857249032203, 0.664058505205364, 0.7022935246074871, 0.7423525140203843, 0.7842978559159348, 0.8281924763000933, 0.8740997267857322, 0.922083256398414, 0.9722068727670369, 1.0245343923745658, 1.0791294795722528, 1.1360554740939193, 1.19537520684552, 1.2571508037894312, 1.3214434777929964, 1.388313308366964, 1.4578190092817436, 1.5300176841179307, 1.6049645698823483, 1.682712768901899, 1.7633129692947116, 1.8468131544112238, 1.9332583017366645, 2.0226900718506364, 2.115146488148628, 2.2106616081438513, 2.3092651872851615, 2.41098233634722, 2.5158331735718535, 2.6238324728636573, 2.734989309467437, 2.8493067046789373, 2.966781271262416, 3.08740286136759, 3.2111542188531628, 3.3380106380331758, 3.4679396309642656, 3.6009006054853736, 3.736844556304812, 3.875713771501676, 4.017441556867722, 4.161951980560737, 4.309159640569725, 4.458969457504593, 4.611276495217247, 4.765965811736018, 4.92291234295014, 5.081980821414692, 5.243025732558494, 5.4058913104671, 5.57041157528039, 5.736410414088742, 5.903701707033892, 6.072089500120461, 6.241368226022498, 6.411322973926936, 6.581729809193849, 6.752356143333017, 6.922961154499214, 7.0932962583966646, 7.2631056291582095, 7.432126769429351, 7.600091128543752, 7.766724767327778, 7.931749067720043, 8.094881485040583, 8.255836340396378, 8.414325650368513, 8.570059990794583, 8.72274939114125, 8.872104255659165, 9.017836307229128, 9.159659549547268, 9.297291243061132, 9.430452889860664, 9.558871222550561, 9.682279191986007, 9.800416948643917, 9.91303281232884, 10.0198842248776, 10.120738680530982, 10.215374628684884, 10.303582343817776, 10.385164757516069, 10.459938247683564, 10.527733380224896, 10.588395598734424, 10.641785857999928, 10.68778119744271, 10.726275250959997, 10.757178690009185, 10.780419597173694, 10.795943767873508, 10.803714938326596, 10.803714938326596, 10.79594376787351, 10.7804195971737, 10.75717869000919, 10.726275250960008, 10.687781197442723, 10.641785857999942, 10.58839559873444, 10.527733380224912, 10.459938247683583, 10.38516475751609, 10.3035823438178, 10.21537462868491, 10.120738680531009, 10.019884224877629, 9.913032812328872, 9.800416948643951, 9.68227919198604, 9.558871222550595, 9.4304528898607, 9.29729124306117, 9.159659549547303, 9.017836307229167, 8.872104255659206, 8.722749391141292, 8.570059990794626, 8.414325650368555, 8.255836340396423, 8.094881485040627, 7.93174906772009, 7.766724767327826, 7.600091128543801, 7.432126769429402, 7.263105629158262, 7.09329625839672, 6.922961154499271, 6.752356143333074, 6.581729809193905, 6.411322973926991, 6.241368226022551, 6.072089500120512, 5.9037017070339415, 5.73641041408879, 5.570411575280436, 5.405891310467144, 5.243025732558537, 5.081980821414733, 4.922912342950179, 4.765965811736056, 4.611276495217284, 4.458969457504628, 4.309159640569758, 4.161951980560769, 4.017441556867753, 3.8757137715017045, 3.7368445563048387, 3.6009006054853994, 3.46793963096429, 3.338010638033197, 3.2111542188531828, 3.0874028613676097, 2.966781271262434, 2.8493067046789533, 2.7349893094674527, 2.623832472863672, 2.515833173571865, 2.4109823363472316, 2.3092651872851735, 2.210661608143861, 2.1151464881486355, 2.0226900718506444, 1.933258301736672, 1.8468131544112296, 1.7633129692947167, 1.6827127689019035, 1.6049645698823525, 1.530017684117934, 1.4578190092817458, 1.3883133083669663, 1.3214434777929984, 1.2571508037894323, 1.19537520684552, 1.1360554740939193, 1.0791294795722528, 1.0245343923745653, 0.9722068727670354, 0.9220832563984128, 0.8740997267857302, 0.8281924763000915, 0.7842978559159323, 0.7423525140203817, 0.7022935246074842, 0.664058505205361, 0.6275857249032173, 0.5928142028597608, 0.559683797685418, 0.5281352880980343, 0.4981104452558558, 0.469552097172858, 0.44240418562016826, 0.41661181591378227, 0.39212129998326367, 0.3688801931088845, 0.3468373247060362, 0.3259428235258754, 0.30614813763035775, 0.2874060494881901, 0.2696706865260586, 0.2528975274568441, 0.23704340469364296, 0.22206650314535703, 0.20792635567651596, 0.19458383550097377, 0.18200114576623175, 0.17014180657247, 0.15897063965796993, 0.14845375097053337, 0.13855851133276845, 0.12925353539777382, 0.12050865908079303, 0.1122949156418754, 0.10458451058444916, 0.09735079552499783, 0.0905682411797278, 0.08421240960521167]}],\n                        {\"title\": {\"text\": \"Coupling Length Distribution\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Coupling Distance (m)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Expectation (au)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"def8ffc4-4fe8-411a-9236-4028fffbb145\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"def8ffc4-4fe8-411a-9236-4028fffbb145\")) {\n                    Plotly.newPlot(\n                        'def8ffc4-4fe8-411a-9236-4028fffbb145',\n                        [{\"legendgroup\": \"Length\", \"line\": {\"color\": \"rgba(31, 119, 180, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Length\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"bfa37f51-8e66-4442-95b4-c9ccf1c6df67\", \"x\": [0.5, 1.0, 1.5, 2.0], \"y\": [0.049999999999999996, 0.049999999999999996, 0.049999999999999996, 0.06]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Length\", \"marker\": {\"color\": \"rgba(31, 119, 180, 1.0)\"}, \"mode\": \"markers\", \"name\": \"Length\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"6252d821-29b4-4596-aa85-77929f99c11d\", \"x\": [0.5, 1.0, 1.5, 2.0], \"y\": [0.09, 0.09, 0.09, 0.09]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Length\", \"line\": {\"color\": \"rgba(31, 119, 180, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Length\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"b5731d63-ac5f-42d2-9e75-e9a5b5a68871\", \"x\": [0.5, 1.0, 1.5, 2.0], \"y\": [0.13, 0.13, 0.13, 0.12]}],\n                        {\"title\": {\"text\": \"Coupling Lengths\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Length (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"7c741e87-9518-48a1-9c94-792a0a64c7ba\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"7c741e87-9518-48a1-9c94-792a0a64c7ba\")) {\n                    Plotly.newPlot(\n                        '7c741e87-9518-48a1-9c94-792a0a64c7ba',\n                        [{\"legendgroup\": \"Deviation\", \"line\": {\"color\": \"rgba(255, 127, 14, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Deviation\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"176241bf-8124-429f-84ce-753fd7d3cdce\", \"x\": [0.5, 1.0, 1.5, 2.0], \"y\": [-4.0, -4.0, -4.0, -3.0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Deviation\", \"marker\": {\"color\": \"rgba(255, 127, 14, 1.0)\"}, \"mode\": \"markers\", \"name\": \"Deviation\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"e8f5376b-d403-4919-ba4c-b74ffe0b200e\", \"x\": [0.5, 1.0, 1.5, 2.0], \"y\": [0, 0, 0, 0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Deviation\", \"line\": {\"color\": \"rgba(255, 127, 14, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Deviation\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"cc2b8e93-6327-4b25-9daf-349d83b4fda4\", \"x\": [0.5, 1.0, 1.5, 2.0], \"y\": [4.0, 4.0, 4.0, 3.0]}],\n                        {\"title\": {\"text\": \"Coupling Length Median Deviations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Median Deviation (%)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"b68b4c52-cbf2-4875-93b3-80a141bcba74\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"b68b4c52-cbf2-4875-93b3-80a141bcba74\")) {\n                    Plotly.newPlot(\n                        'b68b4c52-cbf2-4875-93b3-80a141bcba74',\n                        [{\"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"0d5b9766-ea3c-4033-8c8b-22a7f1b0ab6c\", \"x\": [0.20000000000000018, 0.25, 0.30000000000000004, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002], \"y\": [0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.5, 0.7000000000000002, 0.7000000000000002, 0.5, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.6)\"}, \"mode\": \"markers\", \"name\": \"Rear\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"dbdb55ab-dae6-4796-adbe-21b7871424d9\", \"x\": [0.20000000000000018, 0.25, 0.30000000000000004, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002], \"y\": [0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.9, 1.2000000000000002, 1.2000000000000002, 0.9, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"e5de6f00-55a1-4184-a439-a894c97009e2\", \"x\": [0.20000000000000018, 0.25, 0.30000000000000004, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002], \"y\": [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.3, 1.7000000000000002, 1.7000000000000002, 1.3, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]}, {\"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"f0af3b03-c29c-42ea-a45b-234f0e471b0b\", \"x\": [0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003], \"y\": [0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.5, 0.7000000000000002, 0.8000000000000002, 0.5, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007, 0.5, 0.7000000000000002, 0.8000000000000002, 0.5, 0.20000000000000007, 0.20000000000000007, 0.20000000000000007]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.6)\"}, \"mode\": \"markers\", \"name\": \"Forward\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"8fd399da-b112-4bfe-b706-f85001cbd3c4\", \"x\": [0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003], \"y\": [0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.9, 1.2000000000000002, 1.2000000000000002, 0.9, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001, 0.9, 1.2000000000000002, 1.2000000000000002, 0.9, 0.6000000000000001, 0.6000000000000001, 0.6000000000000001]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"4fed95ae-f71e-457e-b8fe-528bab1170c0\", \"x\": [0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003], \"y\": [1.0, 1.0, 1.0, 1.0, 1.3, 1.7000000000000002, 1.6, 1.3, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.3, 1.7000000000000002, 1.6, 1.3, 1.0, 1.0, 1.0]}],\n                        {\"title\": {\"text\": \"Coupler Rate of Advancement\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Advance Rate (m/cycle)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"a002d48d-acda-4840-b917-a5e532ab328e\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"a002d48d-acda-4840-b917-a5e532ab328e\")) {\n                    Plotly.newPlot(\n                        'a002d48d-acda-4840-b917-a5e532ab328e',\n                        [{\"legendgroup\": \"Left pes\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"c687d7a7-ce29-41d1-8094-cb5fc7f2e29f\", \"x\": [1.4000000000000004], \"y\": [0.48]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Left pes\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Left pes\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"4114dfe6-e8be-4f53-a0de-df869d55d49c\", \"x\": [1.4000000000000004], \"y\": [0.5]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Left pes\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"be3ce161-7115-4f22-9b8d-c500ec71cd7d\", \"x\": [1.4000000000000004], \"y\": [0.52]}, {\"legendgroup\": \"Right pes\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"187ef7ef-f870-49fa-a942-dcfeb088c0f6\", \"x\": [1.2000000000000002], \"y\": [0.48]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Right pes\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Right pes\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"f4157af3-c5d7-4bb7-9c30-58150d462f0e\", \"x\": [1.2000000000000002], \"y\": [0.5]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Right pes\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"c86490eb-7315-4841-8175-378f0dd5ed55\", \"x\": [1.2000000000000002], \"y\": [0.52]}, {\"legendgroup\": \"Left manus\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"36c74002-0639-420b-be4d-22ed7c08518d\", \"x\": [0.6500000000000001, 1.6500000000000004], \"y\": [0.48, 0.48]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left manus\", \"marker\": {\"color\": \"rgba(44, 160, 44, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Left manus\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"4e57839b-a0cb-45e9-a142-8251d77d1afd\", \"x\": [0.6500000000000001, 1.6500000000000004], \"y\": [0.5, 0.5]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left manus\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"9051fbfd-13ac-440f-9eec-533ecb5a84f6\", \"x\": [0.6500000000000001, 1.6500000000000004], \"y\": [0.52, 0.52]}, {\"legendgroup\": \"Right manus\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"95f9d2ba-9ded-4343-83ff-ecac44b7435c\", \"x\": [0.9000000000000001, 1.9000000000000004], \"y\": [0.48, 0.48]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right manus\", \"marker\": {\"color\": \"rgba(148, 103, 189, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Right manus\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"b9510e70-05ae-49f7-920d-af30b14cfba4\", \"x\": [0.9000000000000001, 1.9000000000000004], \"y\": [0.5, 0.5]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right manus\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"66c2f2f0-a0d0-4253-b93b-5c8f6259b3da\", \"x\": [0.9000000000000001, 1.9000000000000004], \"y\": [0.52, 0.52]}],\n                        {\"title\": {\"text\": \"Stepping Distances\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Distance (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"689d676e-3b7f-498b-ad7e-68270be6f3f7\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"689d676e-3b7f-498b-ad7e-68270be6f3f7\")) {\n                    Plotly.newPlot(\n                        '689d676e-3b7f-498b-ad7e-68270be6f3f7',\n                        [{\"legendgroup\": \"Left\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"5dd39799-d051-40bf-bb0f-054e2e7de765\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0], \"y\": [0.15000000000000002, 0.21000000000000002, 0.25, 0.25, 0.25, 0.27, 0.21000000000000002, 0.15000000000000002, 0.10999999999999999, 0.07, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.03, 0.07, 0.10999999999999999, 0.15000000000000002, 0.21000000000000002, 0.25, 0.25, 0.25, 0.27, 0.21000000000000002, 0.15000000000000002, 0.10999999999999999, 0.07, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left\", \"marker\": {\"color\": \"rgba(44, 160, 44, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Left\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"42a635ea-4d00-4403-94b9-9c14da6d1ead\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0], \"y\": [0.2, 0.26, 0.32, 0.32, 0.32, 0.32, 0.26, 0.2, 0.15, 0.1, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.1, 0.15, 0.2, 0.26, 0.32, 0.32, 0.32, 0.32, 0.26, 0.2, 0.15, 0.1, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"b5ad7336-0dd9-4cbc-abc1-351bf84e1049\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0], \"y\": [0.25, 0.31, 0.39, 0.39, 0.39, 0.37, 0.31, 0.25, 0.19, 0.13, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.13, 0.13, 0.19, 0.25, 0.31, 0.39, 0.39, 0.39, 0.37, 0.31, 0.25, 0.19, 0.13, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1]}, {\"legendgroup\": \"Right\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"6583e323-7505-49e9-8ca5-9d62a1803b89\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0], \"y\": [0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.03, 0.07, 0.10999999999999999, 0.15000000000000002, 0.21000000000000002, 0.25, 0.25, 0.25, 0.27, 0.21000000000000002, 0.15000000000000002, 0.10999999999999999, 0.07, 0.03, 0.06, 0.06, 0.06, 0.06, 0.06, 0.06, 0.03, 0.07, 0.10999999999999999, 0.15000000000000002, 0.21000000000000002, 0.25, 0.25, 0.25, 0.27, 0.21000000000000002, 0.15000000000000002]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right\", \"marker\": {\"color\": \"rgba(148, 103, 189, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Right\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"3355b3c2-f40b-4cf6-b867-3b9c61252f49\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0], \"y\": [0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.1, 0.15, 0.2, 0.26, 0.32, 0.32, 0.32, 0.32, 0.26, 0.2, 0.15, 0.1, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.1, 0.15, 0.2, 0.26, 0.32, 0.32, 0.32, 0.32, 0.26, 0.2]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"fde97618-15b0-4d91-8f13-33f6c4549aff\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0], \"y\": [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.13, 0.13, 0.19, 0.25, 0.31, 0.39, 0.39, 0.39, 0.37, 0.31, 0.25, 0.19, 0.13, 0.13, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.13, 0.13, 0.19, 0.25, 0.31, 0.39, 0.39, 0.39, 0.37, 0.31, 0.25]}],\n                        {\"title\": {\"text\": \"Left &amp; Right Separations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Separation (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"1113a3d5-a79e-44f2-8189-16b107a3d006\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"1113a3d5-a79e-44f2-8189-16b107a3d006\")) {\n                    Plotly.newPlot(\n                        '1113a3d5-a79e-44f2-8189-16b107a3d006',\n                        [{\"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"0724709f-5e16-409e-a93a-13c0702ccd5e\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0], \"y\": [0.08, 0.08, 0.05, 0.09, 0.12, 0.15999999999999998, 0.22000000000000003, 0.26, 0.26, 0.26, 0.28, 0.22000000000000003, 0.15999999999999998, 0.12, 0.09, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.08, 0.05, 0.09, 0.12, 0.15999999999999998, 0.22000000000000003, 0.26, 0.26, 0.26, 0.28, 0.22000000000000003, 0.15999999999999998, 0.12, 0.09, 0.08, 0.08, 0.08]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Forward\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"f525b657-fb68-423b-a5cf-4a1008d3f0af\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0], \"y\": [0.1, 0.1, 0.1, 0.12, 0.16, 0.21, 0.27, 0.33, 0.33, 0.33, 0.33, 0.27, 0.21, 0.16, 0.12, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.12, 0.16, 0.21, 0.27, 0.33, 0.33, 0.33, 0.33, 0.27, 0.21, 0.16, 0.12, 0.1, 0.1, 0.1]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"ba74148d-2a57-4cad-9da1-b1f856726e45\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0], \"y\": [0.12000000000000001, 0.12000000000000001, 0.15000000000000002, 0.15, 0.2, 0.26, 0.32, 0.4, 0.4, 0.4, 0.38, 0.32, 0.26, 0.2, 0.15, 0.12000000000000001, 0.12000000000000001, 0.12000000000000001, 0.12000000000000001, 0.12000000000000001, 0.12000000000000001, 0.12000000000000001, 0.15000000000000002, 0.15, 0.2, 0.26, 0.32, 0.4, 0.4, 0.4, 0.38, 0.32, 0.26, 0.2, 0.15, 0.12000000000000001, 0.12000000000000001, 0.12000000000000001]}, {\"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"0891b096-5753-4f3e-9955-2eaa7266e08f\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0], \"y\": [0.28, 0.31000000000000005, 0.36000000000000004, 0.41000000000000003, 0.46, 0.55, 0.55, 0.55, 0.55, 0.55, 0.55, 0.55, 0.51, 0.46, 0.41000000000000003, 0.36000000000000004, 0.31000000000000005, 0.27, 0.27, 0.27, 0.27, 0.31000000000000005, 0.36000000000000004, 0.41000000000000003, 0.46, 0.55, 0.55, 0.55, 0.55, 0.55, 0.55, 0.55, 0.51, 0.46, 0.41000000000000003, 0.36000000000000004, 0.31000000000000005, 0.28]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Rear\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"4f468bf0-7e7c-40c7-b73c-c6937bbd6bc3\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0], \"y\": [0.31, 0.35000000000000003, 0.4, 0.45, 0.5, 0.56, 0.56, 0.56, 0.56, 0.56, 0.56, 0.56, 0.56, 0.5, 0.45, 0.4, 0.35000000000000003, 0.31, 0.31, 0.31, 0.31, 0.35000000000000003, 0.4, 0.45, 0.5, 0.56, 0.56, 0.56, 0.56, 0.56, 0.56, 0.56, 0.56, 0.5, 0.45, 0.4, 0.35000000000000003, 0.31]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"51ed8c0d-7af0-4251-a8bd-e216c6264172\", \"x\": [0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0], \"y\": [0.33999999999999997, 0.39, 0.44, 0.49, 0.54, 0.5700000000000001, 0.5700000000000001, 0.5700000000000001, 0.5700000000000001, 0.5700000000000001, 0.5700000000000001, 0.5700000000000001, 0.6100000000000001, 0.54, 0.49, 0.44, 0.39, 0.35, 0.35, 0.35, 0.35, 0.39, 0.44, 0.49, 0.54, 0.5700000000000001, 0.5700000000000001, 0.5700000000000001, 0.5700000000000001, 0.5700000000000001, 0.5700000000000001, 0.5700000000000001, 0.6100000000000001, 0.54, 0.49, 0.44, 0.39, 0.33999999999999997]}],\n                        {\"title\": {\"text\": \"Forward &amp; Rear Separations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Separation (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div style=\"height:120px\"> </div>"};
+
+}());
\ No newline at end of file
@@ -0,0 +1,5 @@
+(function () {
+
+    window.SIM_DATA = {"data": {"time": {"count": 56, "cycles": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75], "support_cycles": [-0.35, -0.29999999999999993, -0.2499999999999999, -0.19999999999999984, -0.1499999999999998, -0.09999999999999998, -0.04999999999999993, 1.1102230246251565e-16, 0.050000000000000155, 0.1000000000000002, 0.15000000000000002, 0.20000000000000007, 0.2500000000000001, 0.30000000000000016, 0.3500000000000002, 0.4, 0.45000000000000007, 0.5000000000000001, 0.5500000000000002, 0.6000000000000002, 0.65, 0.7000000000000003, 0.7500000000000001, 0.7999999999999999, 0.8500000000000002, 0.9, 0.9500000000000003, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.65, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.15, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4], "steps_per_cycle": 20, "progress": [0, 1.8181818181818181, 3.6363636363636362, 5.454545454545454, 7.2727272727272725, 9.09090909090909, 10.909090909090908, 12.727272727272727, 14.545454545454545, 16.363636363636363, 18.18181818181818, 19.999999999999996, 21.818181818181813, 23.63636363636363, 25.454545454545446, 27.272727272727263, 29.09090909090908, 30.909090909090896, 32.72727272727271, 34.54545454545453, 36.36363636363635, 38.18181818181817, 39.99999999999999, 41.81818181818181, 43.63636363636363, 45.45454545454545, 47.27272727272727, 49.09090909090909, 50.909090909090914, 52.727272727272734, 54.545454545454554, 56.363636363636374, 58.181818181818194, 60.000000000000014, 61.818181818181834, 63.636363636363654, 65.45454545454547, 67.27272727272728, 69.0909090909091, 70.9090909090909, 72.72727272727272, 74.54545454545453, 76.36363636363635, 78.18181818181816, 79.99999999999997, 81.81818181818178, 83.6363636363636, 85.45454545454541, 87.27272727272722, 89.09090909090904, 90.90909090909085, 92.72727272727266, 94.54545454545448, 96.36363636363629, 98.1818181818181, 100.0]}, "cycles": {"left_pes": [[7, "M"], [13, "F"], [7, "M"], [13, "F"], [7, "M"], [9, "F"]], "right_pes": [[10, "F"], [7, "M"], [13, "F"], [7, "M"], [13, "F"], [6, "M"]], "left_manus": [[5, "F"], [7, "M"], [13, "F"], [7, "M"], [13, "F"], [7, "M"], [4, "F"]], "right_manus": [[2, "M"], [13, "F"], [7, "M"], [13, "F"], [7, "M"], [14, "F"]]}, "scale": 1231.8796992481205, "offset": [0, 0], "markerIds": ["left_pes", "right_pes", "left_manus", "right_manus"], "frames": [{"time": 0.0, "support_time": -0.35, "positions": [{"x": [0.0, 0.04, 0.0], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-4.0, 0.04], "ty0": [0.2, 0.01], "tx1": [4.1, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.275, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.7125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.6900000000000001, 0.04, 0.6875], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.3125, 0.04], "ty0": [0.0, 0.01], "tx1": [4.8374999999999995, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.09, 0.02, 0.0875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.65, 0.02, 0.6499999999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.37, 0.01, 0.36874999999999997], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.0, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.0, "y": 0.0}], "forward_support_box": [{"x": 0.6875, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.6875, "y": 0.0}]}, {"time": 0.050000000000000044, "support_time": -0.29999999999999993, "positions": [{"x": [0.05, 0.04, 0.050000000000000044], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.95, 0.04], "ty0": [0.2, 0.01], "tx1": [4.15, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.275, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.7125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.74, 0.04, 0.7375], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.2625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.11, 0.02, 0.11250000000000002], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.68, 0.02, 0.675], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.39, 0.01, 0.39375000000000004], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.050000000000000044, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.050000000000000044, "y": 0.0}], "forward_support_box": [{"x": 0.7375, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.7375, "y": 0.0}]}, {"time": 0.10000000000000009, "support_time": -0.2499999999999999, "positions": [{"x": [0.1, 0.04, 0.10000000000000009], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.9, 0.04], "ty0": [0.2, 0.01], "tx1": [4.2, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.275, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.7125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.14, 0.02, 0.13750000000000004], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.7000000000000001, 0.007, 0.7], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.42, 0.01, 0.41875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.10000000000000009, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.10000000000000009, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.15000000000000013, "support_time": -0.19999999999999984, "positions": [{"x": [0.15, 0.04, 0.15000000000000013], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.8499999999999996, 0.04], "ty0": [0.2, 0.01], "tx1": [4.3, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.275, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.7125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.16, 0.02, 0.16250000000000006], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.7000000000000001, 0.007, 0.7], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.43, 0.01, 0.43125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.15000000000000013, "y": 0.2}, {"x": 0.175, "y": 0.2}, {"x": 0.175, "y": 0.0}, {"x": 0.15000000000000013, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.20000000000000018, "support_time": -0.1499999999999998, "positions": [{"x": [0.2, 0.04, 0.20000000000000018], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.8, 0.04], "ty0": [0.2, 0.01], "tx1": [4.35, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.275, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.01, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3875, 0.01], "ty0": [0.2, 0.01], "tx1": [4.7125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.19, 0.02, 0.18750000000000008], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.7000000000000001, 0.007, 0.7], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.44, 0.01, 0.44375000000000003], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.20000000000000018, "y": 0.2}, {"x": 0.20000000000000018, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.25, "support_time": -0.09999999999999998, "positions": [{"x": [0.25, 0.04, 0.25], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.75, 0.04], "ty0": [0.2, 0.01], "tx1": [4.4, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.275, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.61, 0.04, 0.6124999999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3875, 0.04], "ty0": [0.2, 0.01], "tx1": [4.7125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.21, 0.02, 0.2125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.7000000000000001, 0.02, 0.7], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.46, 0.01, 0.45625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.25, "y": 0.2}, {"x": 0.25, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.2}, {"x": 0.6124999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.30000000000000004, "support_time": -0.04999999999999993, "positions": [{"x": [0.3, 0.04, 0.30000000000000004], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.7, 0.04], "ty0": [0.2, 0.01], "tx1": [4.4, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.275, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.66, 0.04, 0.6625], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3375, 0.04], "ty0": [0.2, 0.01], "tx1": [4.7625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.24, 0.02, 0.23750000000000002], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.72, 0.02, 0.725], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.48, 0.01, 0.48125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.30000000000000004, "y": 0.2}, {"x": 0.30000000000000004, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.6625, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.6625, "y": 0.0}]}, {"time": 0.3500000000000001, "support_time": 1.1102230246251565e-16, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.45, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.275, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.71, 0.04, 0.7125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.2875, 0.04], "ty0": [0.2, 0.01], "tx1": [4.8125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.262, 0.007, 0.26249999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.75, 0.02, 0.75], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.51, 0.01, 0.50625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7125, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.7125, "y": 0.0}]}, {"time": 0.40000000000000013, "support_time": 0.050000000000000155, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.45, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.275, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.76, 0.04, 0.7625000000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.2375, 0.04], "ty0": [0.2, 0.01], "tx1": [4.9125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.262, 0.007, 0.26249999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.78, 0.02, 0.775], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.52, 0.01, 0.51875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7625000000000001, "y": 0.2}, {"x": 0.7875, "y": 0.2}, {"x": 0.7875, "y": 0.0}, {"x": 0.7625000000000001, "y": 0.0}]}, {"time": 0.4500000000000002, "support_time": 0.1000000000000002, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.45, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.01, 0.175], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.825, 0.01], "ty0": [0.0, 0.01], "tx1": [4.275, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.81, 0.04, 0.8125000000000001], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.1875, 0.04], "ty0": [0.2, 0.01], "tx1": [4.9625, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.262, 0.007, 0.26249999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.8, 0.02, 0.8], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.53, 0.01, 0.53125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.8125000000000001, "y": 0.2}, {"x": 0.8125000000000001, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.5, "support_time": 0.15000000000000002, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.45, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.18, 0.04, 0.175], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.825, 0.04], "ty0": [0.0, 0.01], "tx1": [4.275, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.86, 0.04, 0.8624999999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.1375, 0.04], "ty0": [0.2, 0.01], "tx1": [5.0125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.26, 0.02, 0.26249999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.8200000000000001, 0.02, 0.825], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.54, 0.01, 0.54375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.175, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.175, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.8624999999999999, "y": 0.2}, {"x": 0.8624999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.55, "support_time": 0.20000000000000007, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.45, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.23, 0.04, 0.22500000000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.775, 0.04], "ty0": [0.0, 0.01], "tx1": [4.325, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.91, 0.04, 0.9125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.0875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.0125, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.29, 0.02, 0.2875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.85, 0.02, 0.85], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.5700000000000001, 0.01, 0.56875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.22500000000000003, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.22500000000000003, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9125, "y": 0.2}, {"x": 0.9125, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.6000000000000001, "support_time": 0.2500000000000001, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.45, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.28, 0.04, 0.2750000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.725, 0.04], "ty0": [0.0, 0.01], "tx1": [4.375, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.0625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.31, 0.02, 0.3125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.875, 0.007, 0.875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.59, 0.01, 0.59375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.2750000000000001, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.2750000000000001, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.6500000000000001, "support_time": 0.30000000000000016, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.45, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.33, 0.04, 0.32500000000000007], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.675, 0.04], "ty0": [0.0, 0.01], "tx1": [4.475, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.0625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.34, 0.02, 0.3375], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.875, 0.007, 0.875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.61, 0.01, 0.60625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.32500000000000007, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.32500000000000007, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.7000000000000002, "support_time": 0.3500000000000002, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.45, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.38, 0.04, 0.3750000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.525, 0.01], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.0625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.01, 0.7875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.2125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.36, 0.02, 0.36250000000000004], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.875, 0.007, 0.875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.62, 0.01, 0.61875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.3750000000000001, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.3750000000000001, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.75, "support_time": 0.4, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.45, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.42, 0.04, 0.42499999999999993], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.575, 0.04], "ty0": [0.0, 0.01], "tx1": [4.575, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.0625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.79, 0.04, 0.7875], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.2125, 0.04], "ty0": [0.0, 0.01], "tx1": [4.8875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.39, 0.02, 0.38749999999999996], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.88, 0.02, 0.875], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.63, 0.01, 0.63125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.42499999999999993, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.42499999999999993, "y": 0.0}], "forward_support_box": [{"x": 0.7875, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.7875, "y": 0.0}]}, {"time": 0.8, "support_time": 0.45000000000000007, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.45, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.48, 0.04, 0.475], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.525, 0.04], "ty0": [0.0, 0.01], "tx1": [4.575, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.0625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.84, 0.04, 0.8374999999999998], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.1625, 0.04], "ty0": [0.0, 0.01], "tx1": [4.9375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.41000000000000003, 0.02, 0.4125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.9, 0.02, 0.8999999999999999], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.66, 0.01, 0.65625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.475, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.475, "y": 0.0}], "forward_support_box": [{"x": 0.8374999999999998, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.8374999999999998, "y": 0.0}]}, {"time": 0.8500000000000001, "support_time": 0.5000000000000001, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.45, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.0625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.89, 0.04, 0.8875000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.1125, 0.04], "ty0": [0.0, 0.01], "tx1": [4.9875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.437, 0.007, 0.43749999999999994], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.92, 0.02, 0.925], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.68, 0.01, 0.68125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.8875000000000001, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.8875000000000001, "y": 0.0}]}, {"time": 0.9000000000000001, "support_time": 0.5500000000000002, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.45, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.0625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.9400000000000001, 0.04, 0.9375000000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.0624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.0875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.437, 0.007, 0.43749999999999994], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.9500000000000001, 0.02, 0.9500000000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.6900000000000001, 0.01, 0.6937500000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.9375000000000003, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.9375000000000003, "y": 0.0}]}, {"time": 0.9500000000000002, "support_time": 0.6000000000000002, "positions": [{"x": [0.35000000000000003, 0.01, 0.35], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.65, 0.01], "ty0": [0.2, 0.01], "tx1": [4.45, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.0625, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.99, 0.04, 0.9875000000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.0124999999999997, 0.04], "ty0": [0.0, 0.01], "tx1": [5.0875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.437, 0.007, 0.43749999999999994], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [0.98, 0.02, 0.9750000000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.71, 0.01, 0.70625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 0.9875000000000002, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 0.9875000000000002, "y": 0.0}]}, {"time": 1.0, "support_time": 0.65, "positions": [{"x": [0.35000000000000003, 0.04, 0.35], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.65, 0.04], "ty0": [0.2, 0.01], "tx1": [4.45, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.0625, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.04, 0.04, 1.0375], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.9625, 0.04], "ty0": [0.0, 0.01], "tx1": [5.1875, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.44, 0.02, 0.43749999999999994], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.0, 0.02, 1.0], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.72, 0.01, 0.71875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.35, "y": 0.2}, {"x": 0.35, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.0375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.0375, "y": 0.0}]}, {"time": 1.0500000000000003, "support_time": 0.7000000000000003, "positions": [{"x": [0.4, 0.04, 0.40000000000000024], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.5999999999999996, 0.04], "ty0": [0.2, 0.01], "tx1": [4.55, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.0625, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.09, 0.04, 1.0875000000000004], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.9124999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.46, 0.02, 0.4625000000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.03, 0.02, 1.0250000000000001], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.74, 0.01, 0.7437500000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.40000000000000024, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.40000000000000024, "y": 0.0}], "forward_support_box": [{"x": 1.0875000000000004, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.0875000000000004, "y": 0.0}]}, {"time": 1.1, "support_time": 0.7500000000000001, "positions": [{"x": [0.45, 0.04, 0.45000000000000007], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.55, 0.04], "ty0": [0.2, 0.01], "tx1": [4.55, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.0625, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.49, 0.02, 0.4875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.05, 0.007, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.77, 0.01, 0.7687499999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.45000000000000007, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.45000000000000007, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.15, "support_time": 0.7999999999999999, "positions": [{"x": [0.5, 0.04, 0.4999999999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.5, 0.04], "ty0": [0.2, 0.01], "tx1": [4.6, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.0625, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.51, 0.02, 0.5125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.05, 0.007, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.78, 0.01, 0.7812499999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.4999999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5249999999999999, "y": 0.0}, {"x": 0.4999999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.2000000000000002, "support_time": 0.8500000000000002, "positions": [{"x": [0.55, 0.04, 0.5500000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.4499999999999997, 0.04], "ty0": [0.2, 0.01], "tx1": [4.65, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.01, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.0375, 0.01], "ty0": [0.2, 0.01], "tx1": [5.0625, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.54, 0.02, 0.5375000000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.05, 0.007, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.79, 0.01, 0.79375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.5500000000000002, "y": 0.2}, {"x": 0.5500000000000002, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.25, "support_time": 0.9, "positions": [{"x": [0.6, 0.04, 0.6], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.4, 0.04], "ty0": [0.2, 0.01], "tx1": [4.75, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.625, 0.04], "ty1": [0.0, 0.01]}, {"x": [0.96, 0.04, 0.9624999999999999], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.0375, 0.04], "ty0": [0.2, 0.01], "tx1": [5.0625, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.56, 0.02, 0.5625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.05, 0.02, 1.0499999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.81, 0.01, 0.8062499999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.6, "y": 0.2}, {"x": 0.6, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.2}, {"x": 0.9624999999999999, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.3000000000000003, "support_time": 0.9500000000000003, "positions": [{"x": [0.65, 0.04, 0.6500000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3499999999999996, 0.04], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.01, 0.04, 1.0125000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.9875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.112500000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.59, 0.02, 0.5875000000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.08, 0.02, 1.0750000000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.8300000000000001, 0.01, 0.8312500000000002], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.6500000000000002, "y": 0.2}, {"x": 0.6500000000000002, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.0125000000000002, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.0125000000000002, "y": 0.0}]}, {"time": 1.35, "support_time": 1.0, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.06, 0.04, 1.0625], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.9375, 0.04], "ty0": [0.2, 0.01], "tx1": [5.1625, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.612, 0.007, 0.6124999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.1, 0.02, 1.1], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.86, 0.01, 0.85625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.0625, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.0625, "y": 0.0}]}, {"time": 1.4000000000000004, "support_time": 1.0500000000000003, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.11, 0.04, 1.1125000000000003], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.8874999999999997, 0.04], "ty0": [0.2, 0.01], "tx1": [5.2625, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.612, 0.007, 0.6124999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.12, 0.02, 1.125], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.87, 0.01, 0.8687499999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1125000000000003, "y": 0.2}, {"x": 1.1375, "y": 0.2}, {"x": 1.1375, "y": 0.0}, {"x": 1.1125000000000003, "y": 0.0}]}, {"time": 1.4500000000000002, "support_time": 1.1, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.01, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.475, 0.01], "ty0": [0.0, 0.01], "tx1": [4.625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.16, 0.04, 1.1625], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.8375, 0.04], "ty0": [0.2, 0.01], "tx1": [5.2625, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.612, 0.007, 0.6124999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.1500000000000001, 0.02, 1.15], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.88, 0.01, 0.8812499999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.1625, "y": 0.2}, {"x": 1.1625, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.5, "support_time": 1.15, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.52, 0.04, 0.5249999999999999], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.475, 0.04], "ty0": [0.0, 0.01], "tx1": [4.625, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.21, 0.04, 1.2125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.7875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.3125, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.61, 0.02, 0.6124999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.17, 0.02, 1.1749999999999998], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.89, 0.01, 0.8937499999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5249999999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5249999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.2125, "y": 0.2}, {"x": 1.2125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.5500000000000003, "support_time": 1.2000000000000002, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.58, 0.04, 0.5750000000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.425, 0.04], "ty0": [0.0, 0.01], "tx1": [4.675000000000001, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.26, 0.04, 1.2625000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.7375, 0.04], "ty0": [0.2, 0.01], "tx1": [5.362500000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.64, 0.02, 0.6375000000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.2, 0.02, 1.2000000000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.92, 0.01, 0.9187500000000002], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.5750000000000002, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.5750000000000002, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.2625000000000002, "y": 0.2}, {"x": 1.2625000000000002, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.6, "support_time": 1.25, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.62, 0.04, 0.625], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.375, 0.04], "ty0": [0.0, 0.01], "tx1": [4.725, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.66, 0.02, 0.6625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.225, 0.007, 1.225], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.9400000000000001, 0.01, 0.9437500000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.625, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.625, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.6500000000000004, "support_time": 1.3000000000000003, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.68, 0.04, 0.6750000000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.3249999999999997, 0.04], "ty0": [0.0, 0.01], "tx1": [4.825, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.6900000000000001, 0.02, 0.6875000000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.225, 0.007, 1.225], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.96, 0.01, 0.95625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.6750000000000003, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.6750000000000003, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.7000000000000002, "support_time": 1.35, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.73, 0.04, 0.7250000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.275, 0.04], "ty0": [0.0, 0.01], "tx1": [4.825, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.01, 1.1375], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.8625, 0.01], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.71, 0.02, 0.7125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.225, 0.007, 1.225], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.97, 0.01, 0.96875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7250000000000001, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.7250000000000001, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.75, "support_time": 1.4, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.77, 0.04, 0.7749999999999999], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.225, 0.04], "ty0": [0.0, 0.01], "tx1": [4.875, 0.01], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.1400000000000001, 0.04, 1.1375], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.8625, 0.04], "ty0": [0.0, 0.01], "tx1": [5.2375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.74, 0.02, 0.7374999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.22, 0.02, 1.225], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [0.98, 0.01, 0.98125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7749999999999999, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.7749999999999999, "y": 0.0}], "forward_support_box": [{"x": 1.1375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1375, "y": 0.0}]}, {"time": 1.8000000000000003, "support_time": 1.4500000000000002, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.8300000000000001, 0.04, 0.8250000000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.175, 0.04], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.19, 0.04, 1.1875000000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.8125, 0.04], "ty0": [0.0, 0.01], "tx1": [5.2875000000000005, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.76, 0.02, 0.7625000000000002], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.25, 0.02, 1.25], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.01, 0.01, 1.00625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.8250000000000003, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.8250000000000003, "y": 0.0}], "forward_support_box": [{"x": 1.1875000000000002, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.1875000000000002, "y": 0.0}]}, {"time": 1.85, "support_time": 1.5, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.24, 0.04, 1.2375], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.7625, 0.04], "ty0": [0.0, 0.01], "tx1": [5.3375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.788, 0.007, 0.7875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.27, 0.02, 1.275], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.03, 0.01, 1.03125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.2375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.2375, "y": 0.0}]}, {"time": 1.9000000000000004, "support_time": 1.5500000000000003, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.29, 0.04, 1.2875000000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.7124999999999995, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4375, 0.04], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.788, 0.007, 0.7875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.3, 0.02, 1.3000000000000003], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.04, 0.01, 1.0437500000000002], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.2875000000000003, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.2875000000000003, "y": 0.0}]}, {"time": 1.9500000000000002, "support_time": 1.6, "positions": [{"x": [0.7000000000000001, 0.01, 0.7], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.3, 0.01], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.34, 0.04, 1.3375000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.788, 0.007, 0.7875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.33, 0.02, 1.3250000000000002], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.06, 0.01, 1.0562500000000001], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.3375000000000001, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.3375000000000001, "y": 0.0}]}, {"time": 2.0, "support_time": 1.65, "positions": [{"x": [0.7000000000000001, 0.04, 0.7], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.3, 0.04], "ty0": [0.2, 0.01], "tx1": [4.8, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.3900000000000001, 0.04, 1.3875], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.79, 0.02, 0.7875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.35, 0.02, 1.35], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.07, 0.01, 1.06875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.7, "y": 0.2}, {"x": 0.7, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.3875, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.3875, "y": 0.0}]}, {"time": 2.0500000000000003, "support_time": 1.7000000000000002, "positions": [{"x": [0.75, 0.04, 0.7500000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.25, 0.04], "ty0": [0.2, 0.01], "tx1": [4.8500000000000005, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.44, 0.04, 1.4375], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.81, 0.02, 0.8125000000000001], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.3800000000000001, 0.02, 1.375], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.09, 0.01, 1.09375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.7500000000000002, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.7500000000000002, "y": 0.0}], "forward_support_box": [{"x": 1.4375, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4375, "y": 0.0}]}, {"time": 2.1, "support_time": 1.75, "positions": [{"x": [0.8, 0.04, 0.8], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.2, 0.04], "ty0": [0.2, 0.01], "tx1": [4.95, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.84, 0.02, 0.8375], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.4000000000000001, 0.007, 1.4], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.12, 0.01, 1.11875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.8, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.8, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.1500000000000004, "support_time": 1.8000000000000003, "positions": [{"x": [0.85, 0.04, 0.8500000000000003], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.1499999999999995, 0.04], "ty0": [0.2, 0.01], "tx1": [5.0, 0.04], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.86, 0.02, 0.8625000000000002], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.4000000000000001, 0.007, 1.4], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.1300000000000001, 0.01, 1.13125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.8500000000000003, "y": 0.2}, {"x": 0.875, "y": 0.2}, {"x": 0.875, "y": 0.0}, {"x": 0.8500000000000003, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.2, "support_time": 1.85, "positions": [{"x": [0.9, 0.04, 0.9], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.1, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.01, 1.3125], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.6875, 0.01], "ty0": [0.2, 0.01], "tx1": [5.4125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.89, 0.02, 0.8875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.4000000000000001, 0.007, 1.4], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.1400000000000001, 0.01, 1.1437499999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.9, "y": 0.2}, {"x": 0.9, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.25, "support_time": 1.9, "positions": [{"x": [0.9500000000000001, 0.04, 0.9499999999999998], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.1, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.31, 0.04, 1.3125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.6875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.4125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.91, 0.02, 0.9124999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.4000000000000001, 0.02, 1.4], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.16, 0.01, 1.15625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 0.9499999999999998, "y": 0.2}, {"x": 0.9499999999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.3125, "y": 0.2}, {"x": 1.3125, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.3000000000000003, "support_time": 1.9500000000000002, "positions": [{"x": [1.0, 0.04, 1.0], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-3.1, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.36, 0.04, 1.3625000000000003], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.6374999999999997, 0.04], "ty0": [0.2, 0.01], "tx1": [5.4625, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.9400000000000001, 0.02, 0.9375], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.42, 0.02, 1.425], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.18, 0.01, 1.18125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0, "y": 0.2}, {"x": 1.0, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.3625000000000003, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.3625000000000003, "y": 0.0}]}, {"time": 2.35, "support_time": 2.0, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.1, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.41, 0.04, 1.4125], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.5875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.5125, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.962, 0.007, 0.9624999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.45, 0.02, 1.45], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.21, 0.01, 1.2062499999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4125, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.4125, "y": 0.0}]}, {"time": 2.4000000000000004, "support_time": 2.0500000000000003, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.1, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.46, 0.04, 1.4625000000000004], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.5374999999999996, 0.04], "ty0": [0.2, 0.01], "tx1": [5.612500000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.962, 0.007, 0.9624999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.48, 0.02, 1.475], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.22, 0.01, 1.21875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4625000000000004, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.2}, {"x": 1.4874999999999998, "y": 0.0}, {"x": 1.4625000000000004, "y": 0.0}]}, {"time": 2.45, "support_time": 2.1, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.1, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.01, 0.875], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-3.125, 0.01], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.51, 0.04, 1.5125000000000002], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.4875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.612500000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.962, 0.007, 0.9624999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.5, 0.02, 1.5], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.23, 0.01, 1.23125], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.5125000000000002, "y": 0.2}, {"x": 1.5125000000000002, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.5, "support_time": 2.15, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.1, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.88, 0.04, 0.875], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.125, 0.04], "ty0": [0.0, 0.01], "tx1": [4.975, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.56, 0.04, 1.5625], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.4875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.612500000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.96, 0.02, 0.9624999999999999], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.52, 0.02, 1.525], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.24, 0.01, 1.24375], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.875, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.875, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.5625, "y": 0.2}, {"x": 1.5625, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.5500000000000003, "support_time": 2.2, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.1, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.93, 0.04, 0.9250000000000003], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.0749999999999997, 0.04], "ty0": [0.0, 0.01], "tx1": [5.025, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.61, 0.04, 1.6125000000000003], "y": [0.2, 0.01, 0.2], "f": "M", "tx0": [-2.4875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.612500000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [0.99, 0.02, 0.9875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.55, 0.02, 1.55], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.27, 0.01, 1.26875], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.9250000000000003, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.9250000000000003, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6125000000000003, "y": 0.2}, {"x": 1.6125000000000003, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.6, "support_time": 2.25, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.1, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [0.98, 0.04, 0.9750000000000001], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.025, 0.04], "ty0": [0.0, 0.01], "tx1": [5.075, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.6600000000000001, 0.01, 1.6624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.4875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.612500000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.01, 0.02, 1.0125], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.575, 0.007, 1.5749999999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.29, 0.01, 1.2937499999999997], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 0.9750000000000001, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 0.9750000000000001, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.6500000000000004, "support_time": 2.3000000000000003, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.1, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.03, 0.04, 1.0250000000000004], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.025, 0.04], "ty0": [0.0, 0.01], "tx1": [5.075, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.6600000000000001, 0.01, 1.6624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.4875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.612500000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.04, 0.02, 1.0375], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.575, 0.007, 1.5749999999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.31, 0.01, 1.30625], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.0250000000000004, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.0250000000000004, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.7, "support_time": 2.35, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.1, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.08, 0.04, 1.0750000000000002], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.025, 0.04], "ty0": [0.0, 0.01], "tx1": [5.075, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.6600000000000001, 0.01, 1.6624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.4875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.612500000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.06, 0.02, 1.0625], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.575, 0.007, 1.5749999999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.32, 0.01, 1.3187499999999999], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.0750000000000002, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.0750000000000002, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}, {"time": 2.75, "support_time": 2.4, "positions": [{"x": [1.05, 0.01, 1.0499999999999998], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-3.1, 0.04], "ty0": [0.2, 0.01], "tx1": [5.05, 0.01], "ty1": [0.2, 0.01]}, {"x": [1.12, 0.04, 1.125], "y": [0.0, 0.01, 0.0], "f": "M", "tx0": [-3.025, 0.04], "ty0": [0.0, 0.01], "tx1": [5.075, 0.04], "ty1": [0.0, 0.01]}, {"x": [1.6600000000000001, 0.01, 1.6624999999999999], "y": [0.2, 0.01, 0.2], "f": "F", "tx0": [-2.4875, 0.04], "ty0": [0.2, 0.01], "tx1": [5.612500000000001, 0.04], "ty1": [0.2, 0.01]}, {"x": [1.49, 0.01, 1.4874999999999998], "y": [0.0, 0.01, 0.0], "f": "F", "tx0": [-2.6624999999999996, 0.04], "ty0": [0.0, 0.01], "tx1": [5.4875, 0.01], "ty1": [0.0, 0.01]}], "rear_coupler": {"x": [1.09, 0.02, 1.0875], "y": [0.1, 0.007, 0.1]}, "forward_coupler": {"x": [1.575, 0.007, 1.5749999999999997], "y": [0.1, 0.007, 0.1]}, "midpoint": {"x": [1.33, 0.01, 1.3312499999999998], "y": [0.1, 0.005, 0.1]}, "rear_support_box": [{"x": 1.125, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.2}, {"x": 1.0499999999999998, "y": 0.0}, {"x": 1.125, "y": 0.0}], "forward_support_box": [{"x": 1.4874999999999998, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.2}, {"x": 1.6624999999999999, "y": 0.0}, {"x": 1.4874999999999998, "y": 0.0}]}]}, "body": "<div class=\"top-container no-select\">\n  <div style=\"display:flex;padding:0 1.0em;align-items: flex-end;\">\n    <div class=\"header-box\">\n      <div class=\"header-title\">UNIT-TEST Walk</div>\n      <div class=\"header-summary\">A test run to verify that the simulation system works.</div>\n      <div class=\"header-entry date\">\n        <span class=\"name\">Date:</span>\n        <span class=\"value\">10-18-2026 11:49</span>\n      </div>\n      <div class=\"header-entry duty-cycle\">\n        <span class=\"name\">Duty Cycle:</span>\n        <span class=\"value\">65%</span>\n      </div>\n      <div class=\"header-entry activity-phases\">\n        <span class=\"name\">Activity Phases:</span>\n          <span class=\"value\">\n            Pes: (<span class=\"left_pes-value\">0%</span>,\n            <span class=\"right_pes-value\">50%</span>)\n            Manus: (<span class=\"left_manus-value\">-75%</span>,\n            <span class=\"right_manus-value\">-125%</span>)\n          </span>\n      </div>\n      <div class=\"header-entry support-phases\">\n        <span class=\"name\">Support Phases:</span>\n          <span class=\"value\">\n            Pes: (<span class=\"left_pes-value\">0%</span>,\n            <span class=\"right_pes-value\">50%</span>)\n            Manus: (<span class=\"left_manus-value\">-75%</span>,\n            <span class=\"right_manus-value\">-125%</span>)\n          </span>\n      </div>\n    </div>\n    <div class=\"spacer\"></div>\n\n    <div class=\"playback-controls\">\n      <div class=\"control-row\">\n        <div class=\"spacer\"></div>\n\n        <div class=\"control\" data-role=\"pop-out\">\n          <img src=\"img/picture-in-picture.svg\"/>\n        </div>\n\n        <div class=\"control\" data-role=\"save-svg\">\n          <img src=\"img/camera.svg\"/>\n        </div>\n      </div>\n\n      <div class=\"control-row animation-controls\">\n        <div class=\"spacer\"></div>\n\n        <div class=\"control\" data-role=\"backward-10\">\n          <img src=\"img/replay-10.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"jump-back\">\n          <img src=\"img/back.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"frame-back\">\n          <img src=\"img/step-back.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"toggle-play\">\n          <img src=\"img/play.svg\" class=\"play-icon\"/>\n          <img src=\"img/pause.svg\" class=\"pause-icon\"/>\n        </div>\n        <div class=\"control\" data-role=\"frame-forward\">\n          <img src=\"img/step-forward.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"jump-forward\">\n          <img src=\"img/forward.svg\"/>\n        </div>\n        <div class=\"control\" data-role=\"forward-10\">\n          <img src=\"img/forward-10.svg\"/>\n        </div>\n      </div>\n\n\n    </div>\n  </div>\n\n  <div class=\"progress-bar\">\n    <div class=\"header\">\n      <div class=\"value-box\">\n        <div class=\"header\">Left Pes</div>\n        <div class=\"swatch left_pes_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Right Pes</div>\n        <div class=\"swatch right_pes_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Left Manus</div>\n        <div class=\"swatch left_manus_color\"></div>\n      </div>\n\n      <div class=\"value-box\">\n        <div class=\"header\">Right Manus</div>\n        <div class=\"swatch right_manus_color\"></div>\n      </div>\n\n      <div class=\"spacer\"></div>\n\n      <div class=\"time-box\">\n\n        <div class=\"value-box\">\n          <div class=\"header\">Progress</div>\n          <div class=\"value progress-value\"></div>\n        </div>\n\n        <div class=\"value-box activity-time-box\">\n          <div class=\"header\">Activity Cycle</div>\n          <div class=\"value\">\n            <span class=\"cycle-value\"></span> :\n            <span class=\"phase-value\"></span>\n          </div>\n        </div>\n\n        <div class=\"value-box support-time-box\">\n          <div class=\"header\">Support Cycle</div>\n          <div class=\"value\">\n            <span class=\"cycle-value\"></span> :\n            <span class=\"phase-value\"></span>\n          </div>\n        </div>\n\n      </div>\n    </div>\n\n    <div class=\"outer\">\n      <div class=\"inner\"></div>\n      <div class=\"cycles left_pes left_pes_color\"></div>\n      <div class=\"cycles left_manus left_manus_color\"></div>\n      <div class=\"cycles right_manus right_manus_color\"></div>\n      <div class=\"cycles right_pes right_pes_color\"></div>\n    </div>\n  </div>\n</div>\n\n        <div class=\"svg-box\">\n          <div class=\"svg-box-inner\">\n<svg version=\"1.1\"\n    id=\"svg-165893859041\"\n    xmlns:xlink=\"http://www.w3.org/1999/xlink\"\n    xmlns=\"http://www.w3.org/2000/svg\"\n    viewBox=\"-21 -268 2082 289\">\n\n<style>\n/* <![CDATA[ */\n#svg-165893859041 .left_pes { fill: DodgerBlue; opacity: 0.5; }\n#svg-165893859041 .right_pes { fill: DarkOrange; opacity: 0.5; }\n#svg-165893859041 .left_manus { fill: DarkOliveGreen; opacity: 0.5; }\n#svg-165893859041 .right_manus { fill: DarkOrchid; opacity: 0.5; }\n#svg-165893859041 .left_pes { fill: DodgerBlue; opacity: 0.5; stroke-width: 8px; stroke: DodgerBlue; }\n#svg-165893859041 .left_pes.assumed { fill: white; opacity: 0.33; }\n#svg-165893859041 .left_pes-marker { fill: transparent; stroke-width: 8px; stroke: DodgerBlue; }\n#svg-165893859041 .right_pes { fill: DarkOrange; opacity: 0.5; stroke-width: 8px; stroke: DarkOrange; }\n#svg-165893859041 .right_pes.assumed { fill: white; opacity: 0.33; }\n#svg-165893859041 .right_pes-marker { fill: transparent; stroke-width: 8px; stroke: DarkOrange; }\n#svg-165893859041 .left_manus { fill: DarkOliveGreen; opacity: 0.5; stroke-width: 8px; stroke: DarkOliveGreen; stroke-dasharray: 4,4; }\n#svg-165893859041 .left_manus.assumed { fill: white; opacity: 0.33; stroke-dasharray: 4,4; }\n#svg-165893859041 .left_manus-marker { fill: transparent; stroke-width: 8px; stroke: DarkOliveGreen; stroke-dasharray: 8,4; }\n#svg-165893859041 .right_manus { fill: DarkOrchid; opacity: 0.5; stroke-width: 8px; stroke: DarkOrchid; stroke-dasharray: 4,4; }\n#svg-165893859041 .right_manus.assumed { fill: white; opacity: 0.33; stroke-dasharray: 4,4; }\n#svg-165893859041 .right_manus-marker { fill: transparent; stroke-width: 8px; stroke: DarkOrchid; stroke-dasharray: 8,4; }\n/* ]]> */\n</style>\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"0.0\" cy=\"-246.3759398496241\" data-x=\"0.0\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-uid=\"83\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"431.15789473684214\" cy=\"-246.3759398496241\" data-x=\"0.35000000000000003\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"84\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"862.3157894736843\" cy=\"-246.3759398496241\" data-x=\"0.7000000000000001\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"85\" />\n<circle class=\"left_pes track-pos\" r=\"12\" cx=\"1293.4736842105262\" cy=\"-246.3759398496241\" data-x=\"1.05\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DodgerBlue\" data-annotation=\"F\" data-uid=\"86\" />\n<circle id=\"left_pes\" class=\"left_pes-marker\" r=\"16.0\" cx=\"0.0\" cy=\"-246.3759398496241\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"215.57894736842107\" cy=\"-0.0\" data-x=\"0.18\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"88\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"646.7368421052631\" cy=\"-0.0\" data-x=\"0.52\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"89\" />\n<circle class=\"right_pes track-pos\" r=\"12\" cx=\"1077.8947368421054\" cy=\"-0.0\" data-x=\"0.88\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrange\" data-annotation=\"F\" data-uid=\"90\" />\n<circle id=\"right_pes\" class=\"right_pes-marker\" r=\"16.0\" cx=\"215.57894736842107\" cy=\"-0.0\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"754.5263157894738\" cy=\"-246.3759398496241\" data-x=\"0.61\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"94\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"1185.6842105263158\" cy=\"-246.3759398496241\" data-x=\"0.96\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"95\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"1616.8421052631581\" cy=\"-246.3759398496241\" data-x=\"1.31\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"96\" />\n<circle class=\"left_manus track-pos\" r=\"8\" cx=\"2048.0\" cy=\"-246.3759398496241\" data-x=\"1.6600000000000001\" data-x-unc=\"0.01\" data-y=\"0.2\" data-y-unc=\"0.01\" data-color=\"DarkOliveGreen\" data-annotation=\"F\" data-uid=\"97\" />\n<circle id=\"left_manus\" class=\"left_manus-marker\" r=\"12.0\" cx=\"754.5263157894738\" cy=\"-246.3759398496241\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"538.9473684210527\" cy=\"-0.0\" data-x=\"0.44\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-uid=\"99\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"970.1052631578948\" cy=\"-0.0\" data-x=\"0.79\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"100\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"1401.2631578947369\" cy=\"-0.0\" data-x=\"1.1400000000000001\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"101\" />\n<circle class=\"right_manus track-pos\" r=\"8\" cx=\"1832.421052631579\" cy=\"-0.0\" data-x=\"1.49\" data-x-unc=\"0.01\" data-y=\"0.0\" data-y-unc=\"0.01\" data-color=\"DarkOrchid\" data-annotation=\"F\" data-uid=\"102\" />\n<circle id=\"right_manus\" class=\"right_manus-marker\" r=\"12.0\" cx=\"538.9473684210527\" cy=\"-0.0\" />\n</svg></div>\n          <div class=\"svg-controls-box\" style=\"display:none\">\n            <div>\n                <div>Activity: <span class=\"activity-status\"></span></div>\n                <div>Support: <span class=\"support-status\"></span></div>\n            </div>\n            <div class=\"spacer\"></div>\n          </div>\n        </div>\n        \n<div class=\"line-break\"></div>\n\n<div class=\"results-container\">\n  <div class=\"settings-box info-display-box\">\n    <div class=\"info-header\">Trial Results</div>\n\n    <div class=\"info-row\">\n      <div id=\"lengthResults\" class=\"entry\">\n        <div class=\"title title-box\">Average Calculated Lengths (m)</div>\n\n        <div>\n          <span class=\"label\">Coupling Length:</span>\n          <span class=\"value\">0.56 &#177; 0.02</span>\n          <!-- span class=\"deviation\"> </span -->\n        </div>\n\n        <div>\n          <span class=\"label\">Coupling IQR:</span>\n          <span class=\"value\">[0.5397, 0.5803]</span>\n        </div>\n\n        <div>\n          <span class=\"label\">Coupling Bounds (2%):</span>\n          <span class=\"value\">[0.4993, 0.6212]</span>\n        </div>\n      </div>\n    </div>\n  </div>\n\n  <div class=\"status-box info-display-box\">\n    <div class=\"info-header\">Display Status</div>\n\n    <div class=\"info-row\">\n      <div class=\"entry left_pes\">\n        <div class=\"title left_pes_color\">Left Pes</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n\n      <div class=\"entry left_manus\">\n        <div class=\"title left_manus_color\">Left Manus</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n    </div>\n\n    <div class=\"info-row\">\n      <div class=\"entry right_pes\">\n        <div class=\"title right_pes_color\">Right Pes</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n\n      <div class=\"entry right_manus\">\n        <div class=\"title right_manus_color\">Right Manus</div>\n        <div>\n          <span class=\"label\">X:&nbsp;</span>\n          <span class=\"value position x\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Y:&nbsp;</span>\n          <span class=\"value position y\"></span>\n        </div>\n        <div>\n          <span class=\"label\">Status: </span>\n          <span class=\"value mode\"></span>\n        </div>\n      </div>\n    </div>\n  </div>\n</div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"0830a953-80df-4343-bfbd-28a4c8c96f69\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"0830a953-80df-4343-bfbd-28a4c8c96f69\")) {\n                    Plotly.newPlot(\n                        '0830a953-80df-4343-bfbd-28a4c8c96f69',\n                        [{\"mode\": \"lines\", \"type\": \"scatter\", \"uid\": \"a5276c8b-a907-4f97-83e4-a9cac718df90\", \"x\": [0.4700000000000001, 0.4707228915662651, 0.47144578313253016, 0.4721686746987952, 0.47289156626506024, 0.4736144578313253, 0.4743373493975903, 0.47506024096385535, 0.4757831325301204, 0.4765060240963854, 0.47722891566265047, 0.4779518072289155, 0.47867469879518054, 0.4793975903614456, 0.4801204819277106, 0.48084337349397566, 0.4815662650602407, 0.48228915662650573, 0.48301204819277077, 0.4837349397590358, 0.48445783132530085, 0.4851807228915659, 0.4859036144578309, 0.48662650602409596, 0.487349397590361, 0.48807228915662604, 0.4887951807228911, 0.4895180722891561, 0.49024096385542115, 0.4909638554216862, 0.49168674698795123, 0.49240963855421627, 0.4931325301204813, 0.49385542168674634, 0.4945783132530114, 0.4953012048192764, 0.49602409638554146, 0.4967469879518065, 0.49746987951807153, 0.49819277108433657, 0.4989156626506016, 0.49963855421686665, 0.5003614457831317, 0.5010843373493967, 0.5018072289156618, 0.5025301204819268, 0.5032530120481918, 0.5039759036144569, 0.5046987951807219, 0.505421686746987, 0.506144578313252, 0.506867469879517, 0.5075903614457821, 0.5083132530120471, 0.5090361445783121, 0.5097590361445772, 0.5104819277108422, 0.5112048192771073, 0.5119277108433723, 0.5126506024096373, 0.5133734939759024, 0.5140963855421674, 0.5148192771084324, 0.5155421686746975, 0.5162650602409625, 0.5169879518072276, 0.5177108433734926, 0.5184337349397576, 0.5191566265060227, 0.5198795180722877, 0.5206024096385528, 0.5213253012048178, 0.5220481927710828, 0.5227710843373479, 0.5234939759036129, 0.524216867469878, 0.524939759036143, 0.525662650602408, 0.5263855421686731, 0.5271084337349381, 0.5278313253012031, 0.5285542168674682, 0.5292771084337332, 0.5299999999999983, 0.5307228915662633, 0.5314457831325283, 0.5321686746987934, 0.5328915662650584, 0.5336144578313234, 0.5343373493975885, 0.5350602409638535, 0.5357831325301186, 0.5365060240963836, 0.5372289156626486, 0.5379518072289137, 0.5386746987951787, 0.5393975903614437, 0.5401204819277088, 0.5408433734939738, 0.5415662650602389, 0.5422891566265039, 0.5430120481927689, 0.543734939759034, 0.544457831325299, 0.545180722891564, 0.5459036144578291, 0.5466265060240941, 0.5473493975903592, 0.5480722891566242, 0.5487951807228892, 0.5495180722891543, 0.5502409638554193, 0.5509638554216844, 0.5516867469879494, 0.5524096385542144, 0.5531325301204795, 0.5538554216867445, 0.5545783132530095, 0.5553012048192746, 0.5560240963855396, 0.5567469879518047, 0.5574698795180697, 0.5581927710843347, 0.5589156626505998, 0.5596385542168648, 0.5603614457831299, 0.5610843373493949, 0.5618072289156599, 0.562530120481925, 0.56325301204819, 0.563975903614455, 0.5646987951807201, 0.5654216867469851, 0.5661445783132502, 0.5668674698795152, 0.5675903614457802, 0.5683132530120453, 0.5690361445783103, 0.5697590361445753, 0.5704819277108404, 0.5712048192771054, 0.5719277108433705, 0.5726506024096355, 0.5733734939759005, 0.5740963855421656, 0.5748192771084306, 0.5755421686746957, 0.5762650602409607, 0.5769879518072257, 0.5777108433734908, 0.5784337349397558, 0.5791566265060208, 0.5798795180722859, 0.5806024096385509, 0.581325301204816, 0.582048192771081, 0.582771084337346, 0.5834939759036111, 0.5842168674698761, 0.5849397590361411, 0.5856626506024062, 0.5863855421686712, 0.5871084337349363, 0.5878313253012013, 0.5885542168674663, 0.5892771084337314, 0.5899999999999964, 0.5907228915662615, 0.5914457831325265, 0.5921686746987915, 0.5928915662650566, 0.5936144578313216, 0.5943373493975866, 0.5950602409638517, 0.5957831325301167, 0.5965060240963818, 0.5972289156626468, 0.5979518072289118, 0.5986746987951769, 0.5993975903614419, 0.600120481927707, 0.600843373493972, 0.601566265060237, 0.6022891566265021, 0.6030120481927671, 0.6037349397590321, 0.6044578313252972, 0.6051807228915622, 0.6059036144578273, 0.6066265060240923, 0.6073493975903573, 0.6080722891566224, 0.6087951807228874, 0.6095180722891524, 0.6102409638554175, 0.6109638554216825, 0.6116867469879476, 0.6124096385542126, 0.6131325301204776, 0.6138554216867427, 0.6145783132530077, 0.6153012048192728, 0.6160240963855378, 0.6167469879518028, 0.6174698795180679, 0.6181927710843329, 0.6189156626505979, 0.619638554216863, 0.620361445783128, 0.6210843373493931, 0.6218072289156581, 0.6225301204819231, 0.6232530120481882, 0.6239759036144532, 0.6246987951807182, 0.6254216867469833, 0.6261445783132483, 0.6268674698795134, 0.6275903614457784, 0.6283132530120434, 0.6290361445783085, 0.6297590361445735, 0.6304819277108386, 0.6312048192771036, 0.6319277108433686, 0.6326506024096337, 0.6333734939758987, 0.6340963855421637, 0.6348192771084288, 0.6355421686746938, 0.6362650602409589, 0.6369879518072239, 0.6377108433734889, 0.638433734939754, 0.639156626506019, 0.639879518072284, 0.6406024096385491, 0.6413253012048141, 0.6420481927710792, 0.6427710843373442, 0.6434939759036092, 0.6442168674698743, 0.6449397590361393, 0.6456626506024044, 0.6463855421686694, 0.6471084337349344, 0.6478313253011995, 0.6485542168674645, 0.6492771084337295, 0.65], \"y\": [0.14772828039793398, 0.15875680163912606, 0.17050961443094761, 0.1830261890004015, 0.19634752643948902, 0.21051617242161305, 0.22557622727669127, 0.2415733521236886, 0.25855477075404765, 0.2765692669553394, 0.29566717696151174, 0.31590037671446364, 0.3373222636214135, 0.3599877324937775, 0.3839531453561109, 0.4092762948181872, 0.43601636070960487, 0.46423385968446723, 0.4939905875138125, 0.5253495537955929, 0.558374908826238, 0.5931318623941929, 0.6296865942744, 0.6681061562234875, 0.7084583652984934, 0.750811688347312, 0.7952351175466753, 0.8417980368934136, 0.8905700795868957, 0.9416209762749578, 0.9950203941721859, 1.0508377670980662, 1.1091421165231894, 1.1700018637542884, 1.233484633433234, 1.299657048571146, 1.368584517386296, 1.4403310122633235, 1.5149588412012578, 1.592528412168752, 1.6730979908365564, 1.7567234522093294, 1.8434580267311838, 1.933352041491603, 2.02645265721025, 2.1228036017304728, 2.2224449008016047, 2.3254126069792527, 2.4317385275202383, 2.5414499521944403, 2.6545693819791256, 2.7711142596421277, 2.8910967032580603, 3.0145232437363707, 3.1413945674710604, 3.2717052652489964, 3.405443588576677, 3.542591214603673, 3.6831230208345427, 3.8270068708295226, 3.9742034120974545, 4.1246658873819575, 4.278339960533715, 4.4351635581475515, 4.595066728122688, 4.757971516278065, 4.923791862121795, 5.092433514834414, 5.263793970480108, 5.4377624314078545, 5.6142197887460155, 5.793038628829257, 5.9740832643257455, 6.157209790755805, 6.342266169010663, 6.529092334391806, 6.717520332598277, 6.907374482991034, 7.098471569360885, 7.290621058319842, 7.483625345325245, 7.677280028232647, 7.871374208157093, 8.065690817304295, 8.260006973313281, 8.45409435953138, 8.647719630521253, 8.840644841978985, 9.032627904122235, 9.2234230574894, 9.412781369974612, 9.600451253810348, 9.786179001100075, 9.969709336398013, 10.15078598473285, 10.329152253377314, 10.504551625576978, 10.67672836436954, 10.845428124551171, 11.010398570779516, 11.171389999744413, 11.328155964287234, 11.48045389730918, 11.628045733277276, 11.770698525115442, 11.908185054256421, 12.040284431629049, 12.16678268736449, 12.287473347024642, 12.40215799218584, 12.510646803251701, 12.6127590824195, 12.708323754785773, 12.79717984564762, 12.879176932136927, 12.954175567414751, 13.022047675752, 13.082676916929993, 13.135959018509908, 13.181802074642968, 13.220126810222817, 13.250866809317495, 13.273968706959602, 13.289392343519543, 13.297110881036659, 13.297110881036687, 13.289392343519632, 13.273968706959748, 13.250866809317698, 13.220126810223077, 13.181802074643285, 13.135959018510283, 13.082676916930422, 13.02204767575248, 12.95417556741529, 12.879176932137517, 12.79717984564826, 12.708323754786468, 12.612759082420242, 12.510646803252493, 12.40215799218668, 12.287473347025527, 12.166782687365425, 12.040284431630022, 11.908185054257437, 11.770698525116499, 11.628045733278368, 11.48045389731031, 11.328155964288397, 11.171389999745609, 11.010398570780746, 10.845428124552425, 10.676728364370824, 10.504551625578285, 10.329152253378645, 10.150785984734206, 9.969709336399388, 9.786179001101464, 9.600451253811753, 9.412781369976033, 9.223423057490832, 9.032627904123673, 8.840644841980433, 8.64771963052271, 8.454094359532839, 8.260006973314743, 8.065690817305756, 7.871374208158554, 7.677280028234107, 7.483625345326701, 7.2906210583212925, 7.098471569362329, 6.907374482992467, 6.717520332599702, 6.529092334393218, 6.3422661690120625, 6.157209790757192, 5.974083264327116, 5.793038628830612, 5.614219788747352, 5.437762431409175, 5.263793970481409, 5.092433514835693, 4.923791862123053, 4.757971516279302, 4.595066728123901, 4.435163558148743, 4.278339960534885, 4.1246658873831015, 3.9742034120985736, 3.8270068708306186, 3.6831230208356125, 3.5425912146047174, 3.4054435885776964, 3.2717052652499894, 3.141394567472028, 3.014523243737313, 2.8910967032589756, 2.771114259643017, 2.65456938197999, 2.5414499521952787, 2.4317385275210506, 2.3254126069800396, 2.2224449008023672, 2.1228036017312104, 2.0264526572109633, 1.9333520414922916, 1.843458026731848, 1.75672345220997, 1.6730979908371741, 1.592528412169347, 1.5149588412018302, 1.4403310122638748, 1.368584517386825, 1.2996570485716539, 1.2334846334337224, 1.1700018637547567, 1.1091421165236375, 1.0508377670984952, 0.995020394172597, 0.9416209762753504, 0.8905700795872714, 0.8417980368937723, 0.7952351175470179, 0.750811688347638, 0.7084583652988047, 0.6681061562237836, 0.6296865942746822, 0.5931318623944613, 0.558374908826493, 0.5253495537958354, 0.4939905875140422, 0.46423385968468533, 0.4360163607098115, 0.40927629481838296, 0.3839531453562964, 0.35998773249395294, 0.3373222636215793, 0.3159003767146204, 0.2956671769616597, 0.2765692669554789, 0.2585547707541794, 0.24157335212381262, 0.22557622727680807, 0.21051617242172302, 0.19634752643959244, 0.18302618900049872, 0.1705096144310391, 0.1587568016392118, 0.14772828039793398]}],\n                        {\"title\": {\"text\": \"Coupling Length Distribution\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Coupling Distance (m)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Expectation (au)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"a805a25b-d615-4215-ad82-ad0c9dd5e0d7\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"a805a25b-d615-4215-ad82-ad0c9dd5e0d7\")) {\n                    Plotly.newPlot(\n                        'a805a25b-d615-4215-ad82-ad0c9dd5e0d7',\n                        [{\"legendgroup\": \"Length\", \"line\": {\"color\": \"rgba(31, 119, 180, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Length\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"f4c7f510-486c-4617-a70a-1f5630d03173\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5], \"y\": [0.53, 0.53, 0.53, 0.53, 0.53, 0.53]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Length\", \"marker\": {\"color\": \"rgba(31, 119, 180, 1.0)\"}, \"mode\": \"markers\", \"name\": \"Length\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"de0e10f3-6811-4926-92e4-c1de4405d246\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5], \"y\": [0.56, 0.56, 0.56, 0.56, 0.56, 0.56]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Length\", \"line\": {\"color\": \"rgba(31, 119, 180, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Length\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"2bb07f96-b198-4250-89bb-a884e9cc1213\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5], \"y\": [0.5900000000000001, 0.5900000000000001, 0.5900000000000001, 0.5900000000000001, 0.5900000000000001, 0.5900000000000001]}],\n                        {\"title\": {\"text\": \"Coupling Lengths\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Length (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"014ced32-5a64-4b3f-8ec7-c3443941fba9\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"014ced32-5a64-4b3f-8ec7-c3443941fba9\")) {\n                    Plotly.newPlot(\n                        '014ced32-5a64-4b3f-8ec7-c3443941fba9',\n                        [{\"legendgroup\": \"Deviation\", \"line\": {\"color\": \"rgba(255, 127, 14, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Deviation\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"183e0553-7876-471a-b0ae-972d29969678\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5], \"y\": [-3.0, -3.0, -3.0, -3.0, -3.0, -3.0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Deviation\", \"marker\": {\"color\": \"rgba(255, 127, 14, 1.0)\"}, \"mode\": \"markers\", \"name\": \"Deviation\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"76f5cc16-4686-4076-8a26-8dfee0cb1598\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5], \"y\": [0, 0, 0, 0, 0, 0]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(68, 68, 68, 0.1)\", \"legendgroup\": \"Deviation\", \"line\": {\"color\": \"rgba(255, 127, 14, 1.0)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Deviation\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"4577b51b-badd-4871-ba52-cad0fffa84af\", \"x\": [0.0, 0.5, 1.0, 1.5, 2.0, 2.5], \"y\": [3.0, 3.0, 3.0, 3.0, 3.0, 3.0]}],\n                        {\"title\": {\"text\": \"Coupling Length Median Deviations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Median Deviation (%)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"e3b6abb3-cad5-4591-bc29-a3addbcf7398\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"e3b6abb3-cad5-4591-bc29-a3addbcf7398\")) {\n                    Plotly.newPlot(\n                        'e3b6abb3-cad5-4591-bc29-a3addbcf7398',\n                        [{\"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"247a27c2-4892-47c0-b61d-a08490f89ea4\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7], \"y\": [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.6)\"}, \"mode\": \"markers\", \"name\": \"Rear\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"54ed3713-b497-454f-a92b-c1dfdf27fe54\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7], \"y\": [0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"390c1238-91d2-4f9c-94ab-e8399e62c4b7\", \"x\": [0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7], \"y\": [0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8]}, {\"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"e255f8a4-2dfe-487e-b8c1-455d9efd0407\", \"x\": [0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2, 0.2]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.6)\"}, \"mode\": \"markers\", \"name\": \"Forward\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"90c4458d-0d98-459b-8564-76e5de8aeebb\", \"x\": [0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.6)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"4b538b49-7130-4b63-9db9-47755fb1401c\", \"x\": [0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5], \"y\": [0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8, 0.8]}],\n                        {\"title\": {\"text\": \"Coupler Rate of Advancement\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Advance Rate (m/cycle)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"89388b85-920f-4ba9-aaa4-92b31c9957c3\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"89388b85-920f-4ba9-aaa4-92b31c9957c3\")) {\n                    Plotly.newPlot(\n                        '89388b85-920f-4ba9-aaa4-92b31c9957c3',\n                        [{\"legendgroup\": \"Left pes\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"8343da23-65be-4dab-ace9-51cb00934241\", \"x\": [1.35, 2.35], \"y\": [0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Left pes\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Left pes\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"18ecd5f3-47c6-4327-bfa2-1c3f19c9d706\", \"x\": [1.35, 2.35], \"y\": [0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Left pes\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"bf260183-cfd7-4766-9ba9-125f684d00ad\", \"x\": [1.35, 2.35], \"y\": [0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Right pes\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"5e50a793-dc59-4409-9ed4-43cea691649e\", \"x\": [0.8500000000000001, 1.85], \"y\": [0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Right pes\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Right pes\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"65ab81fc-c6b7-4b23-b412-7e0d7bbab90a\", \"x\": [0.8500000000000001, 1.85], \"y\": [0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Right pes\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right pes\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"db81c7b4-7b4f-4752-a1c8-557127460032\", \"x\": [0.8500000000000001, 1.85], \"y\": [0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Left manus\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"47aec43c-3060-4a49-9c86-e2fa85e62fb5\", \"x\": [0.6000000000000001, 1.6, 2.6], \"y\": [0.33, 0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left manus\", \"marker\": {\"color\": \"rgba(44, 160, 44, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Left manus\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"c39326a4-2ea9-463a-902e-b6f5d9dfdce7\", \"x\": [0.6000000000000001, 1.6, 2.6], \"y\": [0.35000000000000003, 0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left manus\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"36063066-8387-481a-a38c-74fa6f3bb208\", \"x\": [0.6000000000000001, 1.6, 2.6], \"y\": [0.37000000000000005, 0.37000000000000005, 0.37000000000000005]}, {\"legendgroup\": \"Right manus\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"923625e6-aba5-45e3-91d0-76a7cc2447b9\", \"x\": [1.1, 2.1], \"y\": [0.33, 0.33]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right manus\", \"marker\": {\"color\": \"rgba(148, 103, 189, 0.5)\"}, \"mode\": \"markers\", \"name\": \"Right manus\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"1d663da0-3384-40c4-9b5c-c7db5d465872\", \"x\": [1.1, 2.1], \"y\": [0.35000000000000003, 0.35000000000000003]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right manus\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.5)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right manus\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"6860c42e-a6b6-4d6b-870c-6f2ee2a9d411\", \"x\": [1.1, 2.1], \"y\": [0.37000000000000005, 0.37000000000000005]}],\n                        {\"title\": {\"text\": \"Stepping Distances\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Distance (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"0b903955-3657-466a-b185-00df00e551df\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"0b903955-3657-466a-b185-00df00e551df\")) {\n                    Plotly.newPlot(\n                        '0b903955-3657-466a-b185-00df00e551df',\n                        [{\"legendgroup\": \"Left\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Left\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"34fe134f-268d-46dd-9f65-6b0432d7457b\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75], \"y\": [0.57, 0.52, 0.47000000000000003, 0.42000000000000004, 0.37000000000000005, 0.31, 0.31, 0.32, 0.37000000000000005, 0.42000000000000004, 0.47000000000000003, 0.52, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.57, 0.52, 0.47000000000000003, 0.42000000000000004, 0.37000000000000005, 0.31, 0.31, 0.32, 0.37000000000000005, 0.42000000000000004, 0.47000000000000003, 0.52, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.57, 0.52, 0.47000000000000003, 0.42000000000000004, 0.37000000000000005, 0.31, 0.31, 0.32, 0.37000000000000005, 0.42000000000000004, 0.47000000000000003, 0.52, 0.59, 0.59, 0.59, 0.59]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left\", \"marker\": {\"color\": \"rgba(44, 160, 44, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Left\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"10e0a9c7-0a2a-4c0d-837c-0f731e9589f6\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75], \"y\": [0.61, 0.56, 0.51, 0.46, 0.41000000000000003, 0.36, 0.36, 0.36, 0.41000000000000003, 0.46, 0.51, 0.56, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.56, 0.51, 0.46, 0.41000000000000003, 0.36, 0.36, 0.36, 0.41000000000000003, 0.46, 0.51, 0.56, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.56, 0.51, 0.46, 0.41000000000000003, 0.36, 0.36, 0.36, 0.41000000000000003, 0.46, 0.51, 0.56, 0.61, 0.61, 0.61, 0.61]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(44, 160, 44, 0.2)\", \"legendgroup\": \"Left\", \"line\": {\"color\": \"rgba(44, 160, 44, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Left\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"a43a0131-3da6-4d33-ae73-228359ac7b96\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75], \"y\": [0.65, 0.6000000000000001, 0.55, 0.5, 0.45, 0.41, 0.41, 0.39999999999999997, 0.45, 0.5, 0.55, 0.6000000000000001, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.65, 0.6000000000000001, 0.55, 0.5, 0.45, 0.41, 0.41, 0.39999999999999997, 0.45, 0.5, 0.55, 0.6000000000000001, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.65, 0.6000000000000001, 0.55, 0.5, 0.45, 0.41, 0.41, 0.39999999999999997, 0.45, 0.5, 0.55, 0.6000000000000001, 0.63, 0.63, 0.63, 0.63]}, {\"legendgroup\": \"Right\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Right\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"dbf8b111-8673-4cbd-ad42-c95b584032a5\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75], \"y\": [0.47000000000000003, 0.52, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.57, 0.52, 0.47000000000000003, 0.42000000000000004, 0.37000000000000005, 0.31, 0.31, 0.32, 0.37000000000000005, 0.42000000000000004, 0.47000000000000003, 0.52, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.57, 0.52, 0.47000000000000003, 0.42000000000000004, 0.37000000000000005, 0.31, 0.31, 0.32, 0.37000000000000005, 0.42000000000000004, 0.47000000000000003, 0.52, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.59, 0.57, 0.52, 0.47000000000000003, 0.42000000000000004, 0.37000000000000005, 0.32]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right\", \"marker\": {\"color\": \"rgba(148, 103, 189, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Right\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"90e0fb82-c9b3-45fc-bcc6-932aea48b1b6\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75], \"y\": [0.51, 0.56, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.56, 0.51, 0.46, 0.41000000000000003, 0.36, 0.36, 0.36, 0.41000000000000003, 0.46, 0.51, 0.56, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.56, 0.51, 0.46, 0.41000000000000003, 0.36, 0.36, 0.36, 0.41000000000000003, 0.46, 0.51, 0.56, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.61, 0.56, 0.51, 0.46, 0.41000000000000003, 0.36]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(148, 103, 189, 0.2)\", \"legendgroup\": \"Right\", \"line\": {\"color\": \"rgba(148, 103, 189, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Right\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"86802a75-2fb5-40b8-aa41-a985123fa4ed\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75], \"y\": [0.55, 0.6000000000000001, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.65, 0.6000000000000001, 0.55, 0.5, 0.45, 0.41, 0.41, 0.39999999999999997, 0.45, 0.5, 0.55, 0.6000000000000001, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.65, 0.6000000000000001, 0.55, 0.5, 0.45, 0.41, 0.41, 0.39999999999999997, 0.45, 0.5, 0.55, 0.6000000000000001, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.63, 0.65, 0.6000000000000001, 0.55, 0.5, 0.45, 0.39999999999999997]}],\n                        {\"title\": {\"text\": \"Left &amp; Right Separations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Separation (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div class=\"box\"><div>\n        \n        \n            <div id=\"157527ca-d66b-471b-a585-6ecc09112b12\" class=\"plotly-graph-div\" style=\"height:100%; width:100%;\"></div>\n            <script type=\"text/javascript\">\n                \n                    window.PLOTLYENV=window.PLOTLYENV || {};\n                    window.PLOTLYENV.BASE_URL='https://plot.ly';\n                    \n                if (document.getElementById(\"157527ca-d66b-471b-a585-6ecc09112b12\")) {\n                    Plotly.newPlot(\n                        '157527ca-d66b-471b-a585-6ecc09112b12',\n                        [{\"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"604114ca-9720-42c9-98d8-c7b5396b91c0\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75], \"y\": [0.19, 0.22, 0.26, 0.26, 0.26, 0.24000000000000002, 0.22, 0.19, 0.19, 0.19, 0.19, 0.22, 0.26, 0.26, 0.26, 0.24000000000000002, 0.22, 0.19, 0.19, 0.19, 0.19, 0.22, 0.26, 0.26, 0.26, 0.24000000000000002, 0.22, 0.19, 0.19, 0.19, 0.19, 0.22, 0.26, 0.26, 0.26, 0.24000000000000002, 0.22, 0.19, 0.19, 0.19, 0.19, 0.22, 0.26, 0.26, 0.26, 0.24000000000000002, 0.22, 0.19, 0.19, 0.19, 0.19, 0.22, 0.26, 0.26, 0.26, 0.26]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"marker\": {\"color\": \"rgba(255, 127, 14, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Forward\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"ec547ca4-a6d9-44af-a456-c21b37cd1049\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75], \"y\": [0.21, 0.24, 0.27, 0.27, 0.27, 0.27, 0.24, 0.21, 0.2, 0.2, 0.21, 0.24, 0.27, 0.27, 0.27, 0.27, 0.24, 0.21, 0.2, 0.2, 0.21, 0.24, 0.27, 0.27, 0.27, 0.27, 0.24, 0.21, 0.2, 0.2, 0.21, 0.24, 0.27, 0.27, 0.27, 0.27, 0.24, 0.21, 0.2, 0.2, 0.21, 0.24, 0.27, 0.27, 0.27, 0.27, 0.24, 0.21, 0.2, 0.2, 0.21, 0.24, 0.27, 0.27, 0.27, 0.27]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(255, 127, 14, 0.2)\", \"legendgroup\": \"Forward\", \"line\": {\"color\": \"rgba(255, 127, 14, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Forward\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"73cb9923-0eac-4585-b960-af63444a9375\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75], \"y\": [0.22999999999999998, 0.26, 0.28, 0.28, 0.28, 0.30000000000000004, 0.26, 0.22999999999999998, 0.21000000000000002, 0.21000000000000002, 0.22999999999999998, 0.26, 0.28, 0.28, 0.28, 0.30000000000000004, 0.26, 0.22999999999999998, 0.21000000000000002, 0.21000000000000002, 0.22999999999999998, 0.26, 0.28, 0.28, 0.28, 0.30000000000000004, 0.26, 0.22999999999999998, 0.21000000000000002, 0.21000000000000002, 0.22999999999999998, 0.26, 0.28, 0.28, 0.28, 0.30000000000000004, 0.26, 0.22999999999999998, 0.21000000000000002, 0.21000000000000002, 0.22999999999999998, 0.26, 0.28, 0.28, 0.28, 0.30000000000000004, 0.26, 0.22999999999999998, 0.21000000000000002, 0.21000000000000002, 0.22999999999999998, 0.26, 0.28, 0.28, 0.28, 0.28]}, {\"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"- Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"25fe9128-23f9-490c-8118-2950c1eb0f16\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75], \"y\": [0.24000000000000002, 0.22, 0.19, 0.19, 0.19, 0.19, 0.22, 0.26, 0.26, 0.26, 0.24000000000000002, 0.22, 0.19, 0.19, 0.19, 0.19, 0.22, 0.26, 0.26, 0.26, 0.24000000000000002, 0.22, 0.19, 0.19, 0.19, 0.19, 0.22, 0.26, 0.26, 0.26, 0.24000000000000002, 0.22, 0.19, 0.19, 0.19, 0.19, 0.22, 0.26, 0.26, 0.26, 0.24000000000000002, 0.22, 0.19, 0.19, 0.19, 0.19, 0.22, 0.26, 0.26, 0.26, 0.24000000000000002, 0.22, 0.19, 0.19, 0.19, 0.19]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"marker\": {\"color\": \"rgba(31, 119, 180, 0.7)\"}, \"mode\": \"markers\", \"name\": \"Rear\", \"showlegend\": true, \"type\": \"scatter\", \"uid\": \"61bbfa18-9a6d-49ea-bc1e-9f26e2f20fdb\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75], \"y\": [0.27, 0.24, 0.21, 0.2, 0.2, 0.21, 0.24, 0.27, 0.27, 0.27, 0.27, 0.24, 0.21, 0.2, 0.2, 0.21, 0.24, 0.27, 0.27, 0.27, 0.27, 0.24, 0.21, 0.2, 0.2, 0.21, 0.24, 0.27, 0.27, 0.27, 0.27, 0.24, 0.21, 0.2, 0.2, 0.21, 0.24, 0.27, 0.27, 0.27, 0.27, 0.24, 0.21, 0.2, 0.2, 0.21, 0.24, 0.27, 0.27, 0.27, 0.27, 0.24, 0.21, 0.2, 0.2, 0.21]}, {\"fill\": \"tonexty\", \"fillcolor\": \"rgba(31, 119, 180, 0.2)\", \"legendgroup\": \"Rear\", \"line\": {\"color\": \"rgba(31, 119, 180, 0.7)\", \"width\": 0}, \"mode\": \"lines\", \"name\": \"+ Rear\", \"showlegend\": false, \"type\": \"scatter\", \"uid\": \"67a6ebdb-830e-44dd-b7a5-abecf62862ed\", \"x\": [0.0, 0.050000000000000044, 0.10000000000000009, 0.15000000000000013, 0.20000000000000018, 0.25, 0.30000000000000004, 0.3500000000000001, 0.40000000000000013, 0.4500000000000002, 0.5, 0.55, 0.6000000000000001, 0.6500000000000001, 0.7000000000000002, 0.75, 0.8, 0.8500000000000001, 0.9000000000000001, 0.9500000000000002, 1.0, 1.0500000000000003, 1.1, 1.15, 1.2000000000000002, 1.25, 1.3000000000000003, 1.35, 1.4000000000000004, 1.4500000000000002, 1.5, 1.5500000000000003, 1.6, 1.6500000000000004, 1.7000000000000002, 1.75, 1.8000000000000003, 1.85, 1.9000000000000004, 1.9500000000000002, 2.0, 2.0500000000000003, 2.1, 2.1500000000000004, 2.2, 2.25, 2.3000000000000003, 2.35, 2.4000000000000004, 2.45, 2.5, 2.5500000000000003, 2.6, 2.6500000000000004, 2.7, 2.75], \"y\": [0.30000000000000004, 0.26, 0.22999999999999998, 0.21000000000000002, 0.21000000000000002, 0.22999999999999998, 0.26, 0.28, 0.28, 0.28, 0.30000000000000004, 0.26, 0.22999999999999998, 0.21000000000000002, 0.21000000000000002, 0.22999999999999998, 0.26, 0.28, 0.28, 0.28, 0.30000000000000004, 0.26, 0.22999999999999998, 0.21000000000000002, 0.21000000000000002, 0.22999999999999998, 0.26, 0.28, 0.28, 0.28, 0.30000000000000004, 0.26, 0.22999999999999998, 0.21000000000000002, 0.21000000000000002, 0.22999999999999998, 0.26, 0.28, 0.28, 0.28, 0.30000000000000004, 0.26, 0.22999999999999998, 0.21000000000000002, 0.21000000000000002, 0.22999999999999998, 0.26, 0.28, 0.28, 0.28, 0.30000000000000004, 0.26, 0.22999999999999998, 0.21000000000000002, 0.21000000000000002, 0.22999999999999998]}],\n                        {\"title\": {\"text\": \"Forward &amp; Rear Separations\"}, \"xaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Activity Cycle (#)\"}}, \"yaxis\": {\"title\": {\"font\": {\"color\": \"#7f7f7f\", \"family\": \"Courier New, monospace\", \"size\": 18}, \"text\": \"Separation (m)\"}}},\n                        {\"showLink\": false, \"linkText\": \"Export to plot.ly\", \"responsive\": true, \"plotlyServerURL\": \"https://plot.ly\"}\n                    )\n                };\n                \n            </script>\n        </div></div>\n<div style=\"height:120px\"> </div>"};
+
+}());
\ No newline at end of file
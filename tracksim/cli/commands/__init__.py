@@ -12,6 +12,8 @@ from tracksim.cli.commands import configure
 from tracksim.cli.commands import generate
 from tracksim.cli.commands import create
 from tracksim.cli.commands import list_
+from tracksim.cli.commands import sweep
+from tracksim.cli.commands import render
 
 ME = sys.modules[__name__]
 
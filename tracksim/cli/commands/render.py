@@ -0,0 +1,75 @@
+from argparse import ArgumentParser
+
+from tracksim import cli
+from tracksim import system
+from tracksim.cli.commands.run import print_results
+from tracksim.trial import render as render_trial
+
+DESCRIPTION = """
+    Renders the reports of trials that have already been run, such as trials
+    run with the --noReport flag, from their stored results. Only the report
+    stage of each trial is run when its stored stage outputs are up to date.
+    """
+
+
+def run(**kwargs):
+    """
+
+    :param kwargs:
+    :return:
+    """
+
+    trial_ids = render_trial.find_trials(kwargs.get('trials'))
+    if not trial_ids:
+        system.log('[ERROR]: No stored trials found to render')
+        system.end(1)
+
+    try:
+        results = render_trial.render(trial_ids, kwargs.get('workers'))
+    except ValueError as err:
+        system.log('[ERROR]: {}'.format(err))
+        return system.end(1)
+
+    print_results([r['url'] for r in results])
+
+
+def execute_command():
+    """
+
+    :return:
+    """
+
+    parser = ArgumentParser()
+
+    parser.description = cli.reformat(DESCRIPTION)
+
+    parser.add_argument(
+        'render',
+        type=str,
+        help='The render command to execute'
+    )
+
+    parser.add_argument(
+        'trials',
+        type=str,
+        nargs='*',
+        help=cli.reformat("""
+            The identifiers of the stored trials to render, which can include
+            glob patterns such as "UNIT-TEST-*". By default the reports of
+            every stored trial are rendered.
+            """)
+    )
+
+    parser.add_argument(
+        '-w', '--workers',
+        dest='workers',
+        type=int,
+        default=None,
+        help=cli.reformat("""
+            The number of worker processes used to render the reports in
+            parallel. A value of 0 uses one worker per CPU. By default the
+            reports are rendered one at a time.
+            """)
+    )
+
+    run(**vars(parser.parse_args()))
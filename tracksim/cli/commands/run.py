@@ -8,7 +8,9 @@ from json import decoder as json_decoder
 from tracksim import cli
 from tracksim import system
 from tracksim.group import simulate as simulate_group
+from tracksim.trial import cache as trial_cache
 from tracksim.trial import simulate as simulate_trial
+from tracksim.trial import stages as trial_stages
 
 DESCRIPTION = """
     Runs a trackway gait analysis simulation for the given scenario group
@@ -111,6 +113,11 @@ def run(**kwargs):
         system.log('ERROR: Invalid or missing path argument')
         sys.exit(1)
 
+    if kwargs.get('clear_cache'):
+        trial_cache.clear()
+        trial_stages.clear()
+        system.log('[CACHE]: Cleared the trial results and stages caches')
+
     urls = []
 
     if os.path.isfile(path):
@@ -198,6 +205,20 @@ def run_simulation(
         args['end_time'] = kwargs.get('end_time')
     if kwargs.get('start_time', -1) >= 0:
         args['start_time'] = kwargs.get('start_time')
+    if is_group and kwargs.get('workers') is not None:
+        args['workers'] = kwargs.get('workers')
+    if kwargs.get('columnar'):
+        args['columnar'] = True
+    if kwargs.get('no_cache'):
+        args['cache'] = False
+    if kwargs.get('rerun'):
+        args['rerun'] = kwargs.get('rerun')
+    if kwargs.get('event_sampling'):
+        args['sampling'] = 'events'
+    if kwargs.get('stream_window'):
+        args['stream_window'] = kwargs.get('stream_window')
+    if kwargs.get('no_report'):
+        args['report'] = False
 
     return runner.run(
         settings_path,
@@ -267,6 +288,109 @@ def execute_command():
             """)
     )
 
+    parser.add_argument(
+        '-w', '--workers',
+        dest='workers',
+        type=int,
+        default=None,
+        help=cli.reformat("""
+            The number of worker processes used to run the trials of a group
+            in parallel. A value of 0 uses one worker per CPU. By default the
+            trials are run one at a time, unless the group configuration
+            specifies a "workers" value.
+            """)
+    )
+
+    parser.add_argument(
+        '-c', '--columnar',
+        dest='columnar',
+        action='store_true',
+        default=False,
+        help=cli.reformat("""
+            When included, the results of each trial are also written in a
+            columnar format alongside the JSON results file, which allows
+            individual sections of the results to be read without loading the
+            entire results file.
+            """)
+    )
+
+    parser.add_argument(
+        '-nc', '--noCache',
+        dest='no_cache',
+        action='store_true',
+        default=False,
+        help=cli.reformat("""
+            When included, trials are simulated and analyzed even if their
+            results are already in the trial results cache, and the cache is
+            not updated with the new results.
+            """)
+    )
+
+    parser.add_argument(
+        '-cc', '--clearCache',
+        dest='clear_cache',
+        action='store_true',
+        default=False,
+        help=cli.reformat("""
+            When included, all entries are removed from the trial results
+            cache and the stored trial stage outputs before running the
+            simulations.
+            """)
+    )
+
+    parser.add_argument(
+        '-r', '--rerun',
+        dest='rerun',
+        nargs='+',
+        choices=trial_stages.NAMES,
+        default=None,
+        help=cli.reformat("""
+            The names of trial stages to run again, along with the stages
+            that depend on them, even if their stored outputs are up to date.
+            For example, "--rerun report" renders the reports of stored trials
+            again without repeating their simulation or analysis.
+            """)
+    )
+
+    parser.add_argument(
+        '-es', '--eventSampling',
+        dest='event_sampling',
+        action='store_true',
+        default=False,
+        help=cli.reformat("""
+            When included, trials are simulated only at the times when the
+            motion of a limb changes, which makes the coupling statistics
+            independent of the number of steps per cycle. The steps per cycle
+            are still used to animate the trackway in the report.
+            """)
+    )
+
+    parser.add_argument(
+        '-sw', '--streamWindow',
+        dest='stream_window',
+        type=int,
+        default=None,
+        help=cli.reformat("""
+            When included, trials are simulated and analyzed this many time
+            steps at a time, which keeps the memory used by trials over very
+            long trackways bounded. The per time step results are written to
+            chunk files within the trial's report directory instead of
+            rendering a report.
+            """)
+    )
+
+    parser.add_argument(
+        '-nr', '--noReport', '--no-report',
+        dest='no_report',
+        action='store_true',
+        default=False,
+        help=cli.reformat("""
+            When included, only the results data of each trial and group is
+            written and no HTML reports are rendered. The reports of the
+            trials can be rendered later with the render command.
+            """)
+    )
+
     parser.add_argument(
         '-a', '--all',
         dest='run_all_groups',
@@ -0,0 +1,70 @@
+import sys
+from argparse import ArgumentParser
+
+from tracksim import cli
+from tracksim import system
+from tracksim.cli.commands.run import get_path
+from tracksim.group import sweep
+
+DESCRIPTION = """
+    Runs a batch of simulation trials over every combination of the duty
+    cycles, phases, steps per cycle and start/end times listed in the grid of
+    a sweep configuration file and writes their coupling results to a single
+    CSV table
+    """
+
+
+def run(**kwargs):
+    """
+
+    :param kwargs:
+    :return:
+    """
+
+    cli_configs = system.load_configs()
+
+    path = get_path(kwargs.get('path'), cli_configs)
+    if path is None:
+        system.log('ERROR: Invalid or missing sweep path argument')
+        sys.exit(1)
+
+    table_path = sweep.run(path)
+
+    system.log(
+        """
+        ------------------------------------------
+        Sweep Complete. Results Table Available At:
+
+          * {}
+        """.format(table_path),
+        whitespace=1
+    )
+
+
+def execute_command():
+    """
+
+    :return:
+    """
+
+    parser = ArgumentParser()
+
+    parser.description = cli.reformat(DESCRIPTION)
+
+    parser.add_argument(
+        'sweep',
+        type=str,
+        help='The sweep command to execute'
+    )
+
+    parser.add_argument(
+        'path',
+        type=str,
+        help=cli.reformat("""
+            The relative or absolute path to the sweep configuration file,
+            which contains trial settings and a "grid" object with lists of
+            values for each of the settings that should be varied.
+            """)
+    )
+
+    run(**vars(parser.parse_args()))
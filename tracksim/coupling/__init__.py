@@ -4,6 +4,8 @@ import measurement_stats as mstats
 import functools
 import pandas as pd
 
+from tracksim import mixture
+
 
 def compute_fitness_rankings(df):
     """
@@ -54,8 +56,9 @@ def distribution(
     )
 
     dist = mstats.create_distribution(measurements)
+    mix = mixture.GaussianMixture(dist.values, dist.uncertainties)
     x_values = mstats.distributions.adaptive_range(dist, 4)
-    y_values = dist.heighted_probabilities_at(x_values, df['fitness'])
+    y_values = list(mix.probabilities_at(x_values, df['fitness']))
 
     max_value = functools.reduce(
         lambda a, b: (a if a[1] > b[1] else b),
@@ -69,15 +72,18 @@ def distribution(
         ]
     x_segment_values, y_segment_values = zip(*points)
 
-    population = mstats.distributions.population(dist, 4096)
-    population = [x for x in population if segment_min < x < segment_max]
+    population = np.array(mix.population(4096))
+    population = population[
+        (segment_min < population) & (population < segment_max)
+    ]
 
+    median = np.median(population)
     coupling_length = mstats.ValueUncertainty(
-        np.median(population),
-        mstats.distributions.weighted_median_average_deviation(population)
+        median,
+        np.median(np.abs(np.percentile(population, 50) - population))
     )
 
-    gaussian_fit = mstats.create_distribution([coupling_length])
+    gaussian_fit = mixture.GaussianMixture.from_measurements([coupling_length])
 
     y_gauss_values = gaussian_fit.probabilities_at(x_values)
     y_gauss_values = [scale_factor * y for y in y_gauss_values]
@@ -4,6 +4,10 @@ import pandas as pd
 import typing
 import numpy as np
 
+# The fields of each trial's results that are needed to create its data entry.
+# Other values are loaded from the results files when they are first accessed.
+FIELDS = ['settings.duty_cycle', 'couplings.value', 'times.cycles']
+
 
 def to_data_entry(trial: dict) -> dict:
     """
@@ -55,11 +59,11 @@ def load(
 
     if not group_ids:
         group_ids = []
-    groups = [reader.group(gid) for gid in group_ids]
+    groups = [reader.group(gid, fields=FIELDS) for gid in group_ids]
 
     if not trial_ids:
         trial_ids = []
-    trials = [reader.trial(tid) for tid in trial_ids]
+    trials = [reader.trial(tid, fields=FIELDS) for tid in trial_ids]
 
     for g in groups:
         trials += g['trials']
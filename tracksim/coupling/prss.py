@@ -1,6 +1,8 @@
 import math
 import measurement_stats as mstats
 
+from tracksim import uncertain
+
 
 def compute_many(trials) -> dict:
     """
@@ -32,26 +34,22 @@ def compute(trial) -> dict:
     """
 
     median = mstats.ValueUncertainty(**trial['couplings']['value'])
-    couplings = mstats.values.from_serialized(
+    couplings = uncertain.UncertainArray.from_serialized(
         [cl['value'] for cl in trial['couplings']['lengths']]
     )
 
     # Unnormalized
-    residuals = [abs(cl - median.value) for cl in couplings]
+    residuals = abs(couplings - median.value)
 
     prss = mstats.ValueUncertainty(0, 0.0000001)
-    for index, residual in enumerate(residuals[:-1]):
-        prss += residual * residuals[index + 1]
-
+    prss += (residuals[:-1] * residuals[1:]).sum()
     prss.freeze()
 
     # Normalized
-    residuals = [abs(cl / median.value - 1) for cl in couplings]
+    residuals = abs(couplings / median.value - 1)
 
     prss_norm = mstats.ValueUncertainty(0, 0.0000001)
-    for index, residual in enumerate(residuals[:-1]):
-        prss_norm += residual * residuals[index + 1]
-
+    prss_norm += (residuals[:-1] * residuals[1:]).sum()
     prss_norm /= len(residuals) - 1
     prss_norm.freeze()
 
@@ -71,7 +69,9 @@ def to_fitness(prss_data: dict) -> dict:
     data = prss_data['prss_norm'] if 'prss_norm' in prss_data else prss_data
 
     fitness_values = dict()
-    minimum_residual = mstats.values.minimum(data.values())
+    minimum_residual = uncertain.UncertainArray.from_values(
+        data.values()
+    ).min()
 
     for track_id, res in data.items():
         fitness_values[track_id] = abs(
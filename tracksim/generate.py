@@ -24,12 +24,26 @@ def time_steps_from_data(
         The positional information for the trackway
     """
 
+    return time_steps(steps_per_cycle, *time_range(trackway_definition))
+
+
+def time_range(
+        trackway_definition: trackway.TrackwayDefinition
+) -> typing.Tuple[float, float]:
+    """
+    Returns the minimum and maximum times of the time steps simulated for the
+    trackway_definition
+
+    :param trackway_definition:
+        The positional information for the trackway
+    """
+
     max_time = 0
     for key in limb.KEYS:
         track_count = trackway_definition.limb_positions.get(key)
         max_time = max(max_time, len(track_count))
 
-    return time_steps(steps_per_cycle, -1.0, max_time)
+    return -1.0, max_time
 
 
 def time_steps(
@@ -53,10 +67,174 @@ def time_steps(
     return np.linspace(
         start=min_time,
         stop=max_time,
-        num=steps_per_cycle * (max_time - min_time) + 1
+        num=time_step_count(steps_per_cycle, min_time, max_time)
     )
 
 
+def time_step_count(
+        steps_per_cycle: int,
+        min_time: float,
+        max_time: float
+) -> int:
+    """
+    Returns the number of time steps created by the time_steps function for
+    the specified arguments
+    """
+
+    return int(round(steps_per_cycle * (max_time - min_time))) + 1
+
+
+def time_step_windows(
+        steps_per_cycle: int,
+        min_time: float,
+        max_time: float,
+        window_size: int,
+        start: int = 0,
+        end: int = None
+) -> typing.Iterator[typing.Tuple[int, np.ndarray]]:
+    """
+    Generates the time steps created by the time_steps function in
+    consecutive windows of at most window_size time steps without creating
+    the full array, which is needed when the number of time steps is too large
+    to hold in memory at once. The values are identical to those created by
+    the time_steps function. Each window is yielded as a tuple containing the
+    index of its first time step within the full array and the array of time
+    steps in the window.
+
+    :param steps_per_cycle:
+        The number of time steps in each cycle
+    :param min_time:
+        The time at which to start the time steps
+    :param max_time:
+        The time at which to end the time steps
+    :param window_size:
+        The maximum number of time steps in each window
+    :param start:
+        The index of the first time step to generate
+    :param end:
+        The index after the last time step to generate, which defaults to the
+        total number of time steps
+    """
+
+    count = time_step_count(steps_per_cycle, min_time, max_time)
+    end = count if end is None else min(end, count)
+
+    for offset in range(start, end, window_size):
+        yield offset, time_step_slice(
+            steps_per_cycle,
+            min_time,
+            max_time,
+            offset,
+            min(end, offset + window_size)
+        )
+
+
+def time_step_slice(
+        steps_per_cycle: int,
+        min_time: float,
+        max_time: float,
+        start: int,
+        end: int
+) -> np.ndarray:
+    """
+    Returns the time steps created by the time_steps function between the
+    start index and the exclusive end index without creating the full array.
+    The values are identical to those created by the time_steps function.
+
+    :param steps_per_cycle:
+        The number of time steps in each cycle
+    :param min_time:
+        The time at which the full array of time steps starts
+    :param max_time:
+        The time at which the full array of time steps ends
+    :param start:
+        The index of the first time step to return
+    :param end:
+        The index after the last time step to return
+    """
+
+    count = time_step_count(steps_per_cycle, min_time, max_time)
+    start = min(max(0, start), count)
+    end = min(max(start, end), count)
+    step = (max_time - min_time) / max(1, count - 1)
+
+    # Computed as np.linspace does so that the values match exactly
+    out = np.arange(start, end, dtype=float) * step + min_time
+    if end == count and count > 1 and end > start:
+        out[-1] = max_time
+
+    return out
+
+
+def time_step_index(
+        steps_per_cycle: int,
+        min_time: float,
+        max_time: float,
+        time: float
+) -> int:
+    """
+    Returns the index of the time step created by the time_steps function
+    that is nearest to the specified time, which is clamped to the range of
+    indexes of the time steps
+
+    :param steps_per_cycle:
+        The number of time steps in each cycle
+    :param min_time:
+        The time at which the full array of time steps starts
+    :param max_time:
+        The time at which the full array of time steps ends
+    :param time:
+        The time for which to find the index
+    """
+
+    count = time_step_count(steps_per_cycle, min_time, max_time)
+    step = (max_time - min_time) / max(1, count - 1)
+    if step <= 0:
+        return 0
+
+    index = int(round((min(max(time, min_time), max_time) - min_time) / step))
+    return min(max(0, index), count - 1)
+
+
+def event_time_steps(
+        trackway_definition: trackway.TrackwayDefinition,
+        duty_cycle: float
+) -> np.ndarray:
+    """
+    Creates a sorted array of the times at which the motion of any limb in
+    the trackway changes, which are the times when each limb lifts off of
+    and lands on a track position, along with the whole and half cycle times
+    at which coupling lengths are sampled. Each limb is either fixed or
+    moving linearly between these times, so the positions at any other time
+    can be interpolated from them. The times span the same range as the
+    time_steps_from_data function.
+
+    :param trackway_definition:
+        The positional information and activity phases for the trackway
+    :param duty_cycle:
+        The fraction of each cycle during which a limb is fixed
+    """
+
+    min_time, max_time = time_range(trackway_definition)
+    move_time = 1.0 - duty_cycle
+
+    times = [np.arange(2 * min_time, 2 * max_time + 1) * 0.5]
+
+    for key in limb.KEYS:
+        phase = trackway_definition.activity_phases.get(key)
+        track_count = len(trackway_definition.limb_positions.get(key))
+
+        lift_times = phase + np.arange(-1, track_count)
+        times += [lift_times, lift_times + move_time]
+
+    times = np.concatenate(times)
+    times = times[(times >= min_time) & (times <= max_time)]
+
+    # Rounding merges times that differ only by floating point error, which
+    # would otherwise create nearly empty intervals between them
+    return np.unique(np.round(times, 12))
+
+
 def trackway_data(
         cycle_count: int,
         step_size: float,
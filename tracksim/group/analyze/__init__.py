@@ -1,4 +1,5 @@
 import os
+import shutil
 import typing
 from datetime import datetime
 
@@ -14,7 +15,8 @@ def create(
 ) -> dict:
     """
     Creates a group report dictionary and writes it to the group report
-    directory as well as returning it.
+    directory as well as returning it. When the "report" setting is False,
+    only the group results data file is written and its path is returned.
 
     :param settings:
         Configuration for the group
@@ -23,23 +25,35 @@ def create(
     """
 
     group_id = settings['id']
-    report = reporting.Report('group', group_id)
+    directory = paths.results('reports', 'group', group_id)
+    url = None
 
-    add_header_section(report, settings, trials)
-    add_coupling_plots(report, trials)
+    if settings.get('report', True):
+        report = reporting.Report('group', group_id)
 
-    report.add_whitespace(10)
-    report.write()
+        add_header_section(report, settings, trials)
+        add_coupling_plots(report, trials)
 
-    reporting.write_json_results(
-        path=os.path.join(report.directory, '{}.json'.format(group_id)),
+        report.add_whitespace(10)
+        report.write()
+        url = report.url
+    elif os.path.exists(directory):
+        # Removes any previously rendered report, which no longer matches the
+        # results data
+        shutil.rmtree(directory)
+
+    path = reporting.write_json_results(
+        path=os.path.join(directory, '{}.json'.format(group_id)),
         data=dict(
-            trials=trials,
+            trials=[
+                dict([(k, v) for k, v in t.items() if k != 'couplings'])
+                for t in trials
+            ],
             settings=settings
         )
     )
 
-    return report.url
+    return url or path
 
 
 def add_header_section(
@@ -87,10 +101,12 @@ def add_coupling_plots(
     index = 0
 
     for trial in trials:
-        trial_data = reader.trial(trial['id'], paths.results())
+        coupling_data = trial.get('couplings')
+        if coupling_data is None:
+            trial_data = reader.trial(trial['id'], paths.results())
+            coupling_data = trial_data['couplings']
 
         index += 1
-        coupling_data = trial_data['couplings']
 
         distribution_traces.append(dict(
             x=coupling_data['distribution_profile']['x'],
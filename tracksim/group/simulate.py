@@ -1,12 +1,32 @@
+import copy
 import os
 import json
 import typing
+from concurrent import futures
+from multiprocessing import util
 
 from tracksim import configs
 from tracksim import paths
 from tracksim import system
 from tracksim.group import analyze
+from tracksim.trial import cache
+from tracksim.trial import series_cache
 from tracksim.trial import simulate as simulate_trial
+from tracksim.trial import trackways
+
+# Trial settings that are only used by the report stage of a trial, or that
+# locate its configuration file, and so do not change the outputs of its
+# simulation and analysis stages
+REPORT_SETTINGS = [
+    'id',
+    'name',
+    'summary',
+    'support_phases',
+    'filename',
+    'directory',
+    'report',
+    'frame_decimals'
+]
 
 
 def run(
@@ -20,36 +40,53 @@ def run(
 
     :param settings:
         Settings for running the group of trials. Each trial configuration
-        will inherit values from these settings.
+        will inherit values from these settings. The optional "workers"
+        setting specifies the number of processes used to run the trials in
+        parallel, where a value less than 1 uses one process per CPU.
     :param kwargs:
         Optional setting overrides to be included in the group configuration
     """
 
     settings = configs.load('group', settings, **kwargs)
-    trials = []
 
     system.log('[{}]: STARTING'.format(settings['id']))
 
-    for source in fetch_trial_list(settings):
-        if isinstance(source, str):
-            original = source
-            source = os.path.abspath(os.path.join(settings['path'], source))
-            if not os.path.exists(source):
-                source = '{}.json'.format(source)
-            if not os.path.exists(source):
-                system.log(
-                    """
-                    [ERROR]: Unable to locate simulation trial file "{}"
-                    """.format(original)
-                )
-                raise FileNotFoundError('No such file {}'.format(source))
-
-        trial_settings = configs.load('trial', source, inherits=settings)
-        simulate_trial.run(trial_settings)
+    trials_settings = [
+        load_trial_settings(settings, source)
+        for source in fetch_trial_list(settings)
+    ]
+
+    equivalents = find_equivalent_trials(trials_settings)
+    aliased = len(trials_settings) - len(equivalents)
+    if aliased:
+        system.log('[{}]: REUSING RESULTS OF {} EQUIVALENT TRIALS'.format(
+            settings['id'],
+            aliased
+        ))
+
+    workers = get_worker_count(len(equivalents), settings.get('workers'))
+    with trackways.share(trials_settings, workers > 1) as shared:
+        with series_cache.enabled():
+            results = run_trials(
+                trials_settings,
+                workers,
+                shared,
+                equivalents
+            )
+
+    system.log('[{}]: POSITION SERIES CACHE {} HITS, {} MISSES'.format(
+        settings['id'],
+        sum([r.get('series_cache', {}).get('hits', 0) for r in results]),
+        sum([r.get('series_cache', {}).get('misses', 0) for r in results])
+    ))
+
+    trials = []
+    for trial_settings, result in zip(trials_settings, results):
         trials.append(dict(
             settings=trial_settings,
             index=len(trials) + 1,
             id=trial_settings['id'],
+            couplings=result['couplings']
         ))
 
     system.log('[{}]: ANALYZING'.format(settings['id']))
@@ -61,6 +98,253 @@ def run(
     return url
 
 
+def load_trial_settings(
+        settings: dict,
+        source: typing.Union[str, dict]
+) -> dict:
+    """
+    Loads the configuration for a trial within the group, where the trial
+    inherits values from the group settings
+
+    :param settings:
+        Configuration for the group
+    :param source:
+        Either the trial configuration or a path to the trial configuration
+        file relative to the group path
+    """
+
+    if isinstance(source, str):
+        original = source
+        source = os.path.abspath(os.path.join(settings['path'], source))
+        if not os.path.exists(source):
+            source = '{}.json'.format(source)
+        if not os.path.exists(source):
+            system.log(
+                """
+                [ERROR]: Unable to locate simulation trial file "{}"
+                """.format(original)
+            )
+            raise FileNotFoundError('No such file {}'.format(source))
+
+    return configs.load('trial', source, inherits=settings)
+
+
+def get_worker_count(trial_count: int, workers: int = None) -> int:
+    """
+    Returns the number of processes used to run the trials, where a workers
+    setting less than 1 uses one process per CPU
+
+    :param trial_count:
+        The number of trials to run
+    :param workers:
+        The workers setting of the group
+    """
+
+    if workers is not None and workers < 1:
+        workers = os.cpu_count() or 1
+
+    return max(1, min(workers or 1, trial_count))
+
+
+def create_equivalence_key(
+        trial_settings: dict
+) -> typing.Union[str, None]:
+    """
+    Returns a key that is the same for trials whose simulation and analysis
+    stages produce identical outputs, or None if the trial cannot be
+    compared with other trials. The key is created from a normalized copy of
+    the trial settings, in which the defaults have been applied, the activity
+    phases have been resolved as lists (from the support phases when they are
+    not specified), the trackway data path is absolute and the settings that
+    are only used by the report stage, that locate the configuration file or
+    that control how the trial is run have been removed.
+
+    :param trial_settings:
+        The loaded configuration for the trial
+    """
+
+    if trial_settings.get('stream_window'):
+        # Streamed trials do not run the stages that would be shared
+        return None
+
+    settings = simulate_trial.apply_defaults(copy.deepcopy(trial_settings))
+
+    try:
+        simulate_trial.load_activity_phases(settings)
+    except (KeyError, TypeError, ValueError):
+        # The trial raises the error itself when it is run
+        return None
+
+    data_path = simulate_trial.get_data_path(settings)
+    if data_path:
+        settings['data'] = os.path.abspath(data_path)
+
+    normalized = dict([
+        (key, value)
+        for key, value in settings.items()
+        if key not in REPORT_SETTINGS and key not in cache.IGNORED_SETTINGS
+    ])
+
+    return json.dumps(normalized, sort_keys=True, default=str)
+
+
+def find_equivalent_trials(
+        trials_settings: typing.List[dict]
+) -> typing.List[typing.List[int]]:
+    """
+    Groups the trials into classes of equivalent trials, which have the same
+    equivalence key, and returns a list with the indexes of the trials in
+    each class. Only the first trial of each class is simulated and analyzed,
+    and the other trials reuse its stage outputs to create their reports.
+
+    :param trials_settings:
+        The loaded configuration for each trial of the group
+    """
+
+    classes = dict()
+
+    for index, trial_settings in enumerate(trials_settings):
+        key = create_equivalence_key(trial_settings)
+        if key is None:
+            key = index
+        classes.setdefault(key, []).append(index)
+
+    return list(classes.values())
+
+
+def run_trials(
+        trials_settings: typing.List[dict],
+        workers: int = None,
+        shared_trackways: typing.List[dict] = None,
+        equivalents: typing.List[typing.List[int]] = None
+) -> typing.List[dict]:
+    """
+    Runs each of the trials and returns their results in the same order as
+    the trials settings list. If workers is greater than 1, or less than 1 to
+    use one worker per CPU, the classes of equivalent trials are run in
+    parallel within a process pool. Otherwise they are run one after another
+    in this process.
+
+    :param trials_settings:
+        The loaded configuration for each trial to run
+    :param workers:
+        The number of worker processes to use when running the trials
+    :param shared_trackways:
+        Descriptors of the trackway positions shared in memory by the
+        trackways module, which each worker process attaches to
+    :param equivalents:
+        The classes of equivalent trials returned by the
+        find_equivalent_trials function, which are found if not specified
+    """
+
+    if equivalents is None:
+        equivalents = find_equivalent_trials(trials_settings)
+
+    classes = [
+        [trials_settings[index] for index in indexes]
+        for indexes in equivalents
+    ]
+
+    workers = get_worker_count(len(classes), workers)
+
+    if workers < 2:
+        classes_results = [run_equivalent_trials(c) for c in classes]
+    else:
+        with futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=initialize_worker,
+            initargs=(paths.overrides(), shared_trackways or [])
+        ) as executor:
+            classes_results = list(executor.map(
+                run_equivalent_trials,
+                classes
+            ))
+
+    results = [None] * len(trials_settings)
+    for indexes, class_results in zip(equivalents, classes_results):
+        for index, result in zip(indexes, class_results):
+            results[index] = result
+
+    return results
+
+
+def initialize_worker(
+        path_overrides: dict,
+        shared_trackways: typing.List[dict] = None
+):
+    """
+    Initializes a worker process so that it resolves paths in the same way
+    as the process that started it, shares the trackway positions loaded
+    by that process until it exits and memoizes the position series of the
+    trials it runs
+
+    :param path_overrides:
+        The path overrides set in the parent process
+    :param shared_trackways:
+        Descriptors of the trackway positions shared in memory
+    """
+
+    for key, path in path_overrides.items():
+        paths.override(key, path)
+
+    trackways.attach(shared_trackways or [])
+    series_cache.enable()
+
+    # Closes the attached shared memory blocks when the pool shuts down
+    # the worker
+    util.Finalize(None, trackways.detach, exitpriority=10)
+
+
+def run_equivalent_trials(
+        trials_settings: typing.List[dict]
+) -> typing.List[dict]:
+    """
+    Runs a class of equivalent trials and returns their results in order.
+    The stage outputs of the first trial are shared with the others, which
+    only create their own reports from them.
+
+    :param trials_settings:
+        The loaded configuration for each trial in the class
+    """
+
+    stage_outputs = dict()
+    return [run_trial(ts, stage_outputs) for ts in trials_settings]
+
+
+def run_trial(trial_settings: dict, stage_outputs: dict = None) -> dict:
+    """
+    Runs the trial and returns its results, including a summary of the
+    coupling data that group analysis uses in place of re-reading the trial
+    results from disk. When a series memo is enabled, the results also
+    include the number of its hits and misses during the trial.
+
+    :param trial_settings:
+        The loaded configuration for the trial
+    :param stage_outputs:
+        Stage outputs shared with equivalent trials, as described by the
+        trial simulate.execute function
+    """
+
+    memo = series_cache.active()
+    if memo is None:
+        return simulate_trial.execute(
+            trial_settings,
+            stage_outputs=stage_outputs
+        )
+
+    before = memo.counts()
+    result = simulate_trial.execute(
+        trial_settings,
+        stage_outputs=stage_outputs
+    )
+    after = memo.counts()
+
+    return dict(result, series_cache={
+        key: after[key] - before[key]
+        for key in after.keys()
+    })
+
+
 def fetch_trial_list(settings: dict) -> list:
     """
 
@@ -0,0 +1,254 @@
+import itertools
+import os
+import typing
+
+import numpy as np
+import pandas as pd
+
+from tracksim import configs
+from tracksim import limb
+from tracksim import paths
+from tracksim import system
+from tracksim import trackway
+from tracksim.trial import analyze
+from tracksim.trial import series_cache
+from tracksim.trial import simulate as simulate_trial
+from tracksim.trial.analyze import coupling
+
+# The trial settings that can be varied by the parameter grid of a sweep, in
+# the order that their combinations are iterated
+GRID_KEYS = [
+    'duty_cycle',
+    'activity_phases',
+    'support_phases',
+    'steps_per_cycle',
+    'start_time',
+    'end_time'
+]
+
+
+def run(
+        settings: typing.Union[str, dict],
+        **kwargs
+) -> str:
+    """
+    Runs a batch of simulation trials for every combination of the values in
+    the "grid" of the sweep settings, where each grid entry is a list of
+    values for one of the GRID_KEYS trial settings. The trackway data is loaded
+    and reoriented only once and shared by every combination, and no reports
+    are written for the individual trials. Instead the coupling results of
+    every combination are written to a single CSV table, whose path is
+    returned.
+
+    :param settings:
+        Either a dictionary containing the configuration values for the sweep
+        or an absolute path to a json format file that contains them. All
+        values other than the grid are used as trial settings for every
+        combination.
+    :param kwargs:
+        Optional setting overrides to be included in the sweep configuration
+    """
+
+    settings = configs.load('trial', settings, **kwargs)
+    settings['type'] = 'sweep'
+    simulate_trial.apply_defaults(settings)
+
+    system.log('[{}]: STARTING'.format(settings['id']))
+
+    trackway_definition = trackway.TrackwayDefinition(
+        simulate_trial.load_trackway_positions(settings)
+    )
+    trackway_definition.reorient_positions()
+
+    rows = []
+    with series_cache.enabled() as memo:
+        for index, combination in enumerate(create_combinations(settings)):
+            trial_settings = create_trial_settings(
+                settings,
+                combination,
+                index
+            )
+            rows.append(run_combination(
+                trial_settings,
+                trackway_definition.limb_positions
+            ))
+
+    system.log('[{}]: POSITION SERIES CACHE {} HITS, {} MISSES'.format(
+        settings['id'],
+        memo.hits,
+        memo.misses
+    ))
+
+    system.log('[{}]: WRITING'.format(settings['id']))
+
+    path = write_table(settings['id'], pd.DataFrame(rows))
+
+    system.log('[{}]: COMPLETE'.format(settings['id']))
+
+    return path
+
+
+def create_combinations(settings: dict) -> typing.List[dict]:
+    """
+    Returns a list of dictionaries containing the trial settings values for
+    each combination of the values in the grid of the sweep settings
+
+    :param settings:
+        Configuration for the sweep
+    """
+
+    grid = settings.get('grid', {})
+
+    unknown = [key for key in grid.keys() if key not in GRID_KEYS]
+    if unknown:
+        system.log(
+            """
+            [ERROR]: Unsupported sweep grid settings "{}"
+            """.format('", "'.join(unknown))
+        )
+        raise KeyError('Unsupported grid settings')
+
+    keys = [key for key in GRID_KEYS if key in grid]
+    values = [grid[key] for key in keys]
+
+    return [dict(zip(keys, entry)) for entry in itertools.product(*values)]
+
+
+def create_trial_settings(
+        settings: dict,
+        combination: dict,
+        index: int
+) -> dict:
+    """
+    Creates the trial settings for a combination of grid values, which
+    inherit all of the other sweep settings
+
+    :param settings:
+        Configuration for the sweep
+    :param combination:
+        The grid values for the combination
+    :param index:
+        The index of the combination within the sweep
+    """
+
+    out = dict([(k, v) for k, v in settings.items() if k != 'grid'])
+
+    if 'activity_phases' in combination or 'support_phases' in combination:
+        # Phases in the combination replace any phases inherited from the
+        # sweep settings
+        out.pop('activity_phases', None)
+        out.pop('support_phases', None)
+
+    out.update(combination)
+    out['type'] = 'trial'
+    out['index'] = index
+    out['name'] = '{}-{}'.format(settings['name'], index)
+    out['id'] = '{}-{}'.format(settings['id'], index)
+
+    return out
+
+
+def run_combination(
+        settings: dict,
+        limb_positions: limb.Property
+) -> dict:
+    """
+    Simulates the trial for a single combination of the sweep and returns a
+    row of results for the sweep table
+
+    :param settings:
+        Trial configuration for the combination
+    :param limb_positions:
+        The shared reoriented trackway positions, which are copied before
+        being used by the simulation
+    """
+
+    activity_phases = simulate_trial.load_activity_phases(settings)
+    trackway_definition = trackway.TrackwayDefinition(
+        trackway.clone_positions(limb_positions),
+        activity_phases
+    )
+
+    try:
+        simulated = simulate_trial.simulate(settings, trackway_definition)
+    except ValueError:
+        return create_row(settings)
+
+    times = analyze.make_time_data(simulated['time_steps'], settings)
+    coupling_data = coupling.calculate(simulated['foot_positions'], times)
+
+    return create_row(settings, coupling_data, times)
+
+
+def create_row(
+        settings: dict,
+        coupling_data: dict = None,
+        times: dict = None
+) -> dict:
+    """
+    Creates a row of the sweep results table for a combination
+
+    :param settings:
+        Trial configuration for the combination
+    :param coupling_data:
+        The coupling analysis results for the combination, or None if the
+        combination produced no valid results
+    :param times:
+        Time step information for the simulation of the combination
+    """
+
+    row = dict(
+        id=settings['id'],
+        index=settings['index'],
+        duty_cycle=settings['duty_cycle'],
+        steps_per_cycle=settings['steps_per_cycle'],
+        start_time=settings.get('start_time', np.nan),
+        end_time=settings.get('end_time', np.nan),
+        valid=coupling_data is not None
+    )
+
+    for index, key in enumerate(limb.SHORT_KEYS):
+        row['{}_activity_phase'.format(key)] = \
+            settings['activity_phases'][index]
+        row['{}_support_phase'.format(key)] = \
+            settings['support_phases'][index]
+
+    if coupling_data is None:
+        return row
+
+    row.update(
+        sample_count=times['count'],
+        first_cycle=times['cycles'][0],
+        last_cycle=times['cycles'][-1],
+        coupling_length=coupling_data['value'].raw,
+        uncertainty=coupling_data['value'].raw_uncertainty,
+        rmsd=coupling_data['rmsd'],
+        swing=coupling_data['swing'],
+        fitness=coupling_data['fitness']
+    )
+
+    return row
+
+
+def write_table(sweep_id: str, df: pd.DataFrame) -> str:
+    """
+    Writes the consolidated results table for the sweep to a CSV file within
+    the results directory and returns the path to that file
+
+    :param sweep_id:
+        The identifier of the sweep
+    :param df:
+        The results table with one row per combination
+    """
+
+    path = paths.results(
+        'reports', 'sweep', sweep_id,
+        '{}.csv'.format(sweep_id)
+    )
+
+    directory = os.path.dirname(path)
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    df.to_csv(path, index=False)
+    return path
@@ -144,12 +144,12 @@ class Property(object):
         def deep_copy(value):
             try:
                 if hasattr(value, 'clone'):
-                    value.clone()
+                    return value.clone()
             except Exception:
                 pass
 
             try:
-                json.loads(json.dumps(value))
+                return json.loads(json.dumps(value))
             except Exception:
                 pass
 
@@ -0,0 +1,321 @@
+"""
+A NumPy implementation of the Gaussian kernel distributions created by
+mstats.create_distribution, in which the distribution is the sum of a
+Gaussian for each of its measurements. Densities are evaluated for many
+positions on the measurement axis at once by broadcasting the positions
+against the measurements instead of looping over the positions in Python.
+The functions reproduce the results of the mstats distribution functions,
+including the random draws of weighted populations, so that they can be used
+in their place.
+"""
+
+import math
+import random
+import typing
+
+import measurement_stats as mstats
+import numpy as np
+
+from tracksim import uncertain
+
+# The number of steps into which the range of a distribution is divided when
+# creating a weighted population, matching mstats.distributions.population
+POPULATION_STEPS = 512
+
+# The default population sizes used by mstats for percentiles and deviations
+PERCENTILE_COUNT = 4096
+DEVIATION_COUNT = 2048
+
+# The maximum number of kernel evaluations held in memory at once
+BLOCK_SIZE = 2 ** 20
+
+
+class GaussianMixture(object):
+    """
+    A distribution of measurements in which each measurement is represented
+    by a Gaussian kernel centered on its value with a width of its
+    uncertainty. As with mstats distributions, the values and uncertainties
+    of the measurements are rounded to a single significant digit of
+    uncertainty.
+    """
+
+    def __init__(
+            self,
+            values: np.ndarray,
+            uncertainties: np.ndarray
+    ):
+        """
+        :param values:
+            The rounded values of the measurements
+        :param uncertainties:
+            The rounded uncertainties of the measurements
+        """
+
+        self.values = np.asarray(values, dtype=float)
+        self.uncertainties = np.asarray(uncertainties, dtype=float)
+        self._grid = None
+
+    @classmethod
+    def from_raw(
+            cls,
+            values: np.ndarray,
+            uncertainties: np.ndarray
+    ) -> 'GaussianMixture':
+        """
+        Creates a distribution from the raw values and raw uncertainties of
+        the measurements, which are rounded in the same way as those of a
+        ValueUncertainty
+
+        :param values:
+            The raw values of the measurements
+        :param uncertainties:
+            The raw uncertainties of the measurements
+        """
+
+        return cls(
+            uncertain.round_values(values, uncertainties),
+            uncertain.round_uncertainties(uncertainties)
+        )
+
+    @classmethod
+    def from_measurements(
+            cls,
+            measurements: typing.List[mstats.ValueUncertainty]
+    ) -> 'GaussianMixture':
+        """
+        Creates a distribution from a list of ValueUncertainty measurements
+
+        :param measurements:
+            The measurements that make up the distribution
+        """
+
+        return cls.from_raw(
+            [m.raw for m in measurements],
+            [m.raw_uncertainty for m in measurements]
+        )
+
+    def __len__(self):
+        return len(self.values)
+
+    def minimum_boundary(self, sigma_threshold: float) -> float:
+        """
+        The position on the measurement axis that every measurement is above
+        by at least the specified number of sigma deviations
+
+        :param sigma_threshold:
+            The number of sigma deviations
+        """
+
+        return float(np.min(
+            self.values - float(sigma_threshold) * self.uncertainties
+        ))
+
+    def maximum_boundary(self, sigma_threshold: float) -> float:
+        """
+        The position on the measurement axis that every measurement is below
+        by at least the specified number of sigma deviations
+
+        :param sigma_threshold:
+            The number of sigma deviations
+        """
+
+        return float(np.max(
+            self.values + float(sigma_threshold) * self.uncertainties
+        ))
+
+    def kernels_at(self, x_values: np.ndarray) -> np.ndarray:
+        """
+        Returns a two-dimensional array with the density of each measurement's
+        kernel (columns) at each of the positions (rows)
+
+        :param x_values:
+            Positions on the measurement axis
+        """
+
+        x_values = np.asarray(x_values, dtype=float)
+        width = np.maximum(self.uncertainties, 1e-6)
+        coefficient = 1 / np.sqrt(2.0 * math.pi * width * width)
+        exponent = (
+            -0.5
+            * ((x_values[:, np.newaxis] - self.values) ** 2)
+            / (width * width)
+        )
+        return coefficient * np.exp(exponent)
+
+    def densities_at(
+            self,
+            x_values: np.ndarray,
+            heights: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Returns the summed densities of the measurement kernels at each of
+        the positions, where each kernel is optionally scaled by a height
+
+        :param x_values:
+            Positions on the measurement axis
+        :param heights:
+            Optional scale factors for the kernel of each measurement
+        """
+
+        x_values = np.asarray(x_values, dtype=float).reshape(-1)
+        out = np.zeros(len(x_values))
+        block = max(1, BLOCK_SIZE // max(1, len(self)))
+
+        for start in range(0, len(x_values), block):
+            kernels = self.kernels_at(x_values[start:start + block])
+            if heights is not None:
+                kernels *= np.asarray(heights, dtype=float)
+            out[start:start + block] = np.sum(kernels, axis=1)
+
+        return out
+
+    def probabilities_at(
+            self,
+            x_values: np.ndarray,
+            heights: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Returns the probabilities of the distribution at each of the
+        positions, which are the densities normalized by the number of
+        measurements or by the sum of the heights if they are specified
+
+        :param x_values:
+            Positions on the measurement axis
+        :param heights:
+            Optional scale factors for the kernel of each measurement
+        """
+
+        densities = self.densities_at(x_values, heights)
+        if heights is None:
+            return densities / len(self)
+        return densities / np.sum(np.asarray(heights, dtype=float))
+
+    def cumulative_at(self, x_values: np.ndarray) -> np.ndarray:
+        """
+        Returns the fraction of the distribution that lies below each of the
+        positions
+
+        :param x_values:
+            Positions on the measurement axis
+        """
+
+        x_values = np.asarray(x_values, dtype=float).reshape(-1)
+        width = np.maximum(self.uncertainties, 1e-6)
+        erf = np.frompyfunc(math.erf, 1, 1)
+        out = np.zeros(len(x_values))
+        block = max(1, BLOCK_SIZE // max(1, len(self)))
+
+        for start in range(0, len(x_values), block):
+            z = (
+                (x_values[start:start + block, np.newaxis] - self.values)
+                / (math.sqrt(2.0) * width)
+            )
+            out[start:start + block] = np.sum(
+                0.5 * (1.0 + erf(z).astype(float)),
+                axis=1
+            )
+
+        return out / len(self)
+
+    def population_grid(self) -> typing.Tuple[np.ndarray, float, np.ndarray]:
+        """
+        Returns the positions at which mstats samples a distribution to
+        create a weighted population along with the spacing between them
+        and the probability of the distribution at each position. The grid
+        is the same for every population and so is only evaluated once.
+        """
+
+        if self._grid is not None:
+            return self._grid
+
+        x_min = self.minimum_boundary(10)
+        x_max = self.maximum_boundary(10)
+        delta = (x_max - x_min) / float(POPULATION_STEPS)
+
+        # Accumulates the positions in the same order as mstats so that they
+        # are rounded identically
+        steps = np.full(POPULATION_STEPS + 2, delta)
+        steps[0] = x_min
+        x_values = np.cumsum(steps)
+        x_values = np.append(x_values[x_values < x_max], x_max)
+
+        self._grid = (x_values, delta, self.probabilities_at(x_values))
+        return self._grid
+
+    def population(self, count: int = DEVIATION_COUNT) -> list:
+        """
+        Creates a list of values that are representative of the distribution
+        in the same way as mstats.distributions.population, drawing the same
+        random numbers in the same order
+
+        :param count:
+            The approximate number of values in the population
+        """
+
+        x_values, delta, probabilities = self.population_grid()
+        counts = np.round(count * delta * probabilities).astype(int)
+        centers = np.repeat(x_values, counts)
+
+        draws = np.array([random.random() for _ in range(len(centers))])
+        low = centers - 0.5 * delta
+        high = centers + 0.5 * delta
+        return (low + (high - low) * draws).tolist()
+
+    def percentiles(
+            self,
+            targets: typing.List[float],
+            count: int = PERCENTILE_COUNT
+    ) -> typing.List[float]:
+        """
+        Computes the positions along the measurement axis where the
+        distribution reaches each of the target fractions from a single
+        weighted population
+
+        :param targets:
+            The fractions of the distribution, between 0 and 1
+        :param count:
+            The size of the weighted population
+        """
+
+        population = self.population(count)
+        return [np.percentile(population, 100 * t) for t in targets]
+
+    def percentile(
+            self,
+            target: float = 0.5,
+            count: int = PERCENTILE_COUNT
+    ) -> float:
+        """
+        Computes the position along the measurement axis where the
+        distribution reaches the target fraction, in the same way as
+        mstats.distributions.percentile
+
+        :param target:
+            The fraction of the distribution, between 0 and 1
+        :param count:
+            The size of the weighted population
+        """
+
+        return self.percentiles([target], count)[0]
+
+    def weighted_two(self, count: int = PERCENTILE_COUNT) -> tuple:
+        """
+        Returns the weighted "Twos" box-whisker boundaries of the
+        distribution in the same way as mstats boxes.weighted_two
+
+        :param count:
+            The size of the weighted population
+        """
+
+        return tuple(self.percentiles([0.02, 0.25, 0.5, 0.75, 0.98], count))
+
+    def weighted_median_average_deviation(self) -> float:
+        """
+        Calculates the median absolute deviation of the distribution from its
+        weighted median, in the same way as
+        mstats.distributions.weighted_median_average_deviation
+        """
+
+        median = self.percentile(0.5)
+        population = np.array(self.population(DEVIATION_COUNT))
+        return np.median(np.abs(median - population))
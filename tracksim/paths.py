@@ -24,6 +24,15 @@ def override(key: str, path: str):
     _path_overrides[key] = clean(path)
 
 
+def overrides() -> dict:
+    """
+    Returns a copy of the path overrides that have been set, which can be used
+    to apply the same overrides within another process
+    """
+
+    return dict(_path_overrides)
+
+
 def clean(path: str) -> str:
     """
     Cleans the specified path by expanding shorthand elements, redirecting to
@@ -5,6 +5,139 @@ import glob
 import gzip
 
 from tracksim import paths
+from tracksim.reporting import columnar
+from tracksim.reporting import streaming
+
+
+class LazyRecord(dict):
+    """
+    A dictionary of results data that initially holds only the fields that
+    were requested when it was read. Any other key is loaded from the results
+    file the first time it is accessed, where nested records load the full
+    value of their section once to fill in the keys that were not requested.
+    Iterating over a record only includes the values loaded so far, so call
+    load() before iterating over or serializing the entire record.
+    """
+
+    def __init__(self, path: str, values: dict, key_path: tuple = ()):
+        """
+        :param path:
+            The path to the results file from which the values were read
+        :param values:
+            The values that have already been read
+        :param key_path:
+            The keys leading from the root of the results data to this
+            record, which is empty for the root record
+        """
+
+        super().__init__(values)
+        self.path = path
+        self.key_path = key_path
+        self.is_complete = False
+
+    def __missing__(self, key):
+        if self.is_complete:
+            raise KeyError(key)
+
+        if self.key_path:
+            self.load()
+            return dict.__getitem__(self, key)
+
+        value = read_sections(self.path, [key])[key]
+        self[key] = value
+        return value
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def load(self) -> 'LazyRecord':
+        """
+        Loads all of the values that have not yet been loaded, after which
+        the record contains the same values as the results data
+        """
+
+        if self.is_complete:
+            return self
+        self.is_complete = True
+
+        if self.key_path:
+            section = self.key_path[0]
+            source = read_sections(self.path, [section])[section]
+            for k in self.key_path[1:]:
+                source = source[k]
+        else:
+            source = read_sections(self.path)
+
+        for k, v in source.items():
+            self.setdefault(k, v)
+
+        return self
+
+
+def create_record(
+        path: str,
+        values: dict,
+        selection: dict,
+        key_path: tuple = ()
+) -> LazyRecord:
+    """
+    Creates a lazy record from the values read for the selection, where each
+    partially selected dictionary within the values also becomes a lazy
+    record
+
+    :param path:
+        The path to the results file from which the values were read
+    :param values:
+        The values read from the results file for the selection
+    :param selection:
+        The nested selection dictionary used to read the values
+    :param key_path:
+        The keys leading from the root of the results data to the values
+    """
+
+    out = dict()
+    for key, value in values.items():
+        selected = selection.get(key)
+        if isinstance(value, dict) and isinstance(selected, dict):
+            value = create_record(path, value, selected, key_path + (key,))
+        out[key] = value
+
+    return LazyRecord(path, out, key_path)
+
+
+def project(data: dict, selection: dict) -> dict:
+    """
+    Returns the parts of the data dictionary that are within the selection,
+    omitting any selected keys that do not exist in the data
+
+    :param data:
+        The full data dictionary
+    :param selection:
+        The nested selection dictionary
+    """
+
+    out = dict()
+    for key, selected in selection.items():
+        if key not in data:
+            continue
+
+        value = data[key]
+        if isinstance(selected, dict) and isinstance(value, dict):
+            value = project(value, selected)
+        out[key] = value
+
+    return out
+
 
 def listings(
         report_type: str,
@@ -69,12 +202,84 @@ def read_path(path: str) -> dict:
         return json.load(f)
 
 
-def read(report_type: str, report_id: str, results_path: str = None) -> dict:
+def read_sections(path: str, sections: typing.List[str] = None) -> dict:
+    """
+    Reads the results data at the specified path, including only the
+    requested top-level sections. When columnar results exist alongside the
+    results file, only the requested sections are loaded from them. Otherwise
+    the results file is streamed and only the requested sections are decoded.
+
+    :param path:
+        The path to the JSON results file
+    :param sections:
+        The names of the top-level sections to read, or None to read all of
+        them
+    """
+
+    if columnar.exists(path):
+        return columnar.read(path, sections)
+
+    if sections is None:
+        return read_path(path)
+
+    out = streaming.read(path, dict([(key, True) for key in sections]))
+
+    missing = [key for key in sections if key not in out]
+    if missing:
+        raise KeyError('Unknown results sections "{}"'.format(
+            '", "'.join(missing)
+        ))
+
+    return out
+
+
+def read_fields(path: str, fields: typing.List[str]) -> LazyRecord:
+    """
+    Reads only the specified fields of the results data at the specified
+    path and returns them as a lazy record, which loads any other values the
+    first time they are accessed. Fields that do not exist in the results
+    data are omitted.
+
+    :param path:
+        The path to the JSON results file
+    :param fields:
+        Dotted names of the fields to read, e.g. "couplings.value", where
+        a top-level name such as "settings" reads the entire section
+    """
+
+    selection = streaming.create_selection(fields)
+
+    if columnar.exists(path):
+        available = columnar.read_manifest(path)['sections']
+        values = project(
+            columnar.read(path, [k for k in selection if k in available]),
+            selection
+        )
+    else:
+        values = streaming.read(path, selection)
+
+    return create_record(path, values, selection)
+
+
+def read(
+        report_type: str,
+        report_id: str,
+        results_path: str = None,
+        sections: typing.List[str] = None,
+        fields: typing.List[str] = None
+) -> dict:
     """
 
     :param report_type:
     :param report_id:
     :param results_path:
+    :param sections:
+        The names of the top-level sections of the results data to read. If
+        not specified, all of the results data is read.
+    :param fields:
+        Dotted names of the fields to read, e.g. "couplings.value". When
+        specified, a lazy record is returned that contains only these fields
+        until other values are accessed. See read_fields.
     :return:
     """
 
@@ -97,7 +302,10 @@ def read(report_type: str, report_id: str, results_path: str = None) -> dict:
     if not os.path.exists(path):
         return None
 
-    out = read_path(path)
+    if fields is not None:
+        out = read_fields(path, fields)
+    else:
+        out = read_sections(path, sections)
     out['id'] = report_id
     return out
 
@@ -145,7 +353,8 @@ def all_by_type(
 def group(
         group_id: str,
         results_path: str = None,
-        load_trials: bool = True
+        load_trials: bool = True,
+        fields: typing.List[str] = None
 ) -> typing.Dict:
     """
     Loads the specified group and the trials associated with the group and
@@ -160,6 +369,10 @@ def group(
     :param load_trials:
         When True, the full results data for each trial will be included as
         well.
+    :param fields:
+        Dotted names of the fields to load for each trial, e.g.
+        "couplings.value". When specified, each trial is a lazy record that
+        loads any other values the first time they are accessed.
     :return:
     """
 
@@ -180,7 +393,8 @@ def group(
         trial_data = read(
             report_type='trial',
             report_id=trial_info['id'],
-            results_path=results_path
+            results_path=results_path,
+            fields=fields
         )
         trial_data['group_id'] = group_id
         trial_data['group_index'] = len(trials_data)
@@ -195,13 +409,18 @@ def group(
 def groups(
         matching_glob: str = None,
         results_path: str = None,
-        load_trials: bool = True
+        load_trials: bool = True,
+        fields: typing.List[str] = None
 ) -> dict:
     """
 
     :param matching_glob:
     :param results_path:
     :param load_trials:
+    :param fields:
+        Dotted names of the fields to load for each trial, e.g.
+        "couplings.value". When specified, each trial is a lazy record that
+        loads any other values the first time they are accessed.
     :return:
     """
 
@@ -217,7 +436,8 @@ def groups(
         result = group(
             group_id=key,
             results_path=results_path,
-            load_trials=load_trials
+            load_trials=load_trials,
+            fields=fields
         )
         groups_data.append(result['group'])
         trials_data += result['trials']
@@ -228,7 +448,12 @@ def groups(
     )
 
 
-def trial(trial_id: str, results_path: str = None) -> dict:
+def trial(
+        trial_id: str,
+        results_path: str = None,
+        sections: typing.List[str] = None,
+        fields: typing.List[str] = None
+) -> dict:
     """
     Returns the specified trial data
 
@@ -237,24 +462,39 @@ def trial(trial_id: str, results_path: str = None) -> dict:
     :param results_path:
         The root directory where the simulation results are stored. If not
         specified, the default location will be used.
+    :param sections:
+        The names of the top-level sections of the trial data to load, e.g.
+        ['couplings', 'settings']. If not specified, all of the trial data is
+        loaded.
+    :param fields:
+        Dotted names of the fields to load, e.g. "couplings.value". When
+        specified, the trial is returned as a lazy record that loads any other
+        values the first time they are accessed.
     :return:
     """
 
     return read(
         report_type='trial',
         report_id=trial_id,
-        results_path=results_path
+        results_path=results_path,
+        sections=sections,
+        fields=fields
     )
 
 
 def trials(
         matching_glob: str = None,
-        results_path: str = None
+        results_path: str = None,
+        fields: typing.List[str] = None
 ) -> list:
     """
 
     :param matching_glob:
     :param results_path:
+    :param fields:
+        Dotted names of the fields to load for each trial, e.g.
+        "couplings.value". When specified, each trial is a lazy record that
+        loads any other values the first time they are accessed.
     :return:
     """
 
@@ -267,7 +507,7 @@ def trials(
     trials_data = []
     for key in trials_matches.keys():
         trials_data.append(
-            trial(trial_id=key, results_path=results_path)
+            trial(trial_id=key, results_path=results_path, fields=fields)
         )
 
     return trials_data
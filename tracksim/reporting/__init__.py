@@ -4,6 +4,8 @@ import os
 from json import encoder
 
 from tracksim import paths
+from tracksim.reporting import columnar
+from tracksim.reporting import frames
 from tracksim.reporting.build import create_index_file
 from tracksim.reporting.report import Report
 
@@ -43,6 +45,23 @@ def write_json_results(path: str, data: dict) -> str:
     return path
 
 
+def write_columnar_results(path: str, data: dict) -> str:
+    """
+    Writes the data in the columnar results format alongside the JSON results
+    file at the specified path, where each top-level key of the data is stored
+    as a separately readable section
+
+    :param path:
+        The path to the location of the json results file
+    :param data:
+        The object to be stored in the columnar format
+    :return:
+        The path to the manifest file of the columnar results
+    """
+
+    return columnar.write(path, data)
+
+
 def save_temp_json_file(filename: str, data: dict):
     """
     Saves the data dictionary to a temporary JSON file with the specified
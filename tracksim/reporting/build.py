@@ -64,8 +64,10 @@ def get_report_info(report_type: str, target_path: str) -> typing.List[dict]:
         if not os.path.exists(json_path):
             continue
 
-        data = reader.read_path(json_path)
-        data['id'] = item
+        data = reader.read_fields(
+            json_path,
+            ['settings.name', 'settings.summary']
+        )
 
         out.append({
             'id': item,
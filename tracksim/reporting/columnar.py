@@ -0,0 +1,325 @@
+"""
+A columnar storage format for results data that is written alongside the
+gzipped JSON results file. The data is stored in two files:
+
+    * A Numpy .npz archive that holds the values of every list within the
+      data as a typed array, where lists of dictionaries are stored as one
+      array per key
+    * A small JSON manifest that describes how the arrays are assembled back
+      into the structure of the original data, including any scalar values
+
+Each top-level key of the data is a section that can be read without
+loading or decoding the arrays of the other sections.
+"""
+
+import json
+import os
+import typing
+
+import numpy as np
+
+FORMAT_VERSION = 1
+
+MANIFEST_SUFFIX = '.manifest.json'
+ARRAYS_SUFFIX = '.npz'
+
+
+def get_paths(path: str) -> typing.Tuple[str, str]:
+    """
+    Returns the manifest and arrays file paths for the columnar results
+    associated with the specified results path
+
+    :param path:
+        The path to the JSON results file, with or without its extension
+    """
+
+    base = path[:-5] if path.endswith('.json') else path
+    return base + MANIFEST_SUFFIX, base + ARRAYS_SUFFIX
+
+
+def exists(path: str) -> bool:
+    """
+    Whether or not columnar results exist for the specified results path
+
+    :param path:
+        The path to the JSON results file, with or without its extension
+    """
+
+    return all([os.path.exists(p) for p in get_paths(path)])
+
+
+def write(path: str, data: dict) -> str:
+    """
+    Writes the data in the columnar format alongside the results file at the
+    specified path and returns the path of the manifest file
+
+    :param path:
+        The path to the JSON results file, with or without its extension
+    :param data:
+        The JSON serializable results data, where each key is a section
+    """
+
+    manifest_path, arrays_path = get_paths(path)
+
+    directory = os.path.dirname(manifest_path)
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    arrays = dict()
+    sections = dict([
+        (key, encode(value, arrays))
+        for key, value in data.items()
+    ])
+
+    with open(arrays_path, 'wb') as f:
+        np.savez_compressed(f, **arrays)
+
+    with open(manifest_path, 'w+') as f:
+        json.dump(
+            dict(
+                version=FORMAT_VERSION,
+                arrays=os.path.basename(arrays_path),
+                sections=sections
+            ),
+            f
+        )
+
+    return manifest_path
+
+
+def read_manifest(path: str) -> dict:
+    """
+    Reads the manifest of the columnar results for the specified path
+
+    :param path:
+        The path to the JSON results file, with or without its extension
+    """
+
+    with open(get_paths(path)[0], 'r+') as f:
+        return json.load(f)
+
+
+def read(path: str, sections: typing.List[str] = None) -> dict:
+    """
+    Reads the columnar results for the specified path and returns the data
+    for the requested sections in the same structure as the JSON results.
+    Only the arrays of the requested sections are loaded.
+
+    :param path:
+        The path to the JSON results file, with or without its extension
+    :param sections:
+        The names of the top-level sections to read. All sections are read
+        if not specified.
+    """
+
+    manifest = read_manifest(path)
+    schemas = manifest['sections']
+
+    if sections is None:
+        sections = list(schemas.keys())
+
+    missing = [key for key in sections if key not in schemas]
+    if missing:
+        raise KeyError('Unknown results sections "{}"'.format(
+            '", "'.join(missing)
+        ))
+
+    arrays_path = os.path.join(
+        os.path.dirname(get_paths(path)[0]),
+        manifest['arrays']
+    )
+
+    with np.load(arrays_path) as arrays:
+        return dict([
+            (key, decode(schemas[key], arrays))
+            for key in sections
+        ])
+
+
+def add_array(arrays: dict, values: np.ndarray) -> str:
+    """
+    Adds the array to the arrays dictionary and returns its generated key
+    """
+
+    key = 'a{}'.format(len(arrays))
+    arrays[key] = values
+    return key
+
+
+def encode(value, arrays: dict) -> dict:
+    """
+    Encodes the value by adding the arrays needed to store its lists to the
+    arrays dictionary and returning the JSON serializable schema that
+    describes how to decode it
+
+    :param value:
+        A JSON serializable value to encode
+    :param arrays:
+        The dictionary of named arrays that will be written to the archive
+    """
+
+    if isinstance(value, dict):
+        return dict(
+            type='dict',
+            fields=dict([(k, encode(v, arrays)) for k, v in value.items()])
+        )
+
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+
+    if isinstance(value, (list, tuple)):
+        return encode_sequence(list(value), arrays)
+
+    if isinstance(value, np.generic):
+        value = value.item()
+
+    return dict(type='value', value=value)
+
+
+def encode_sequence(values: list, arrays: dict) -> dict:
+    """
+    Encodes a list of values, storing homogeneous numeric, boolean and
+    string lists as typed arrays, lists of dictionaries as columns of arrays
+    and lists of lists as flattened values with offsets. Any other list is
+    stored as JSON text.
+
+    :param values:
+        The list of values to encode
+    :param arrays:
+        The dictionary of named arrays that will be written to the archive
+    """
+
+    def all_of(types) -> bool:
+        return all([isinstance(v, types) for v in values])
+
+    if not values:
+        return dict(type='value', value=[])
+
+    if all_of(dict):
+        return encode_records(values, arrays)
+
+    if all_of(bool):
+        return dict(
+            type='array',
+            key=add_array(arrays, np.array(values, dtype=bool))
+        )
+
+    is_flag = any([isinstance(v, bool) for v in values])
+    if all_of((int, float)) and not is_flag:
+        dtype = np.int64 if all_of(int) else np.float64
+        return dict(
+            type='array',
+            key=add_array(arrays, np.array(values, dtype=dtype))
+        )
+
+    if all_of(str):
+        return dict(
+            type='array',
+            key=add_array(arrays, np.array(values, dtype=str))
+        )
+
+    if all_of((list, tuple)):
+        lengths = [len(v) for v in values]
+        flattened = [item for v in values for item in v]
+        return dict(
+            type='ragged',
+            offsets=add_array(
+                arrays,
+                np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+            ),
+            values=encode_sequence(flattened, arrays)
+        )
+
+    return dict(
+        type='json',
+        key=add_array(arrays, np.array(json.dumps(values)))
+    )
+
+
+def encode_records(records: typing.List[dict], arrays: dict) -> dict:
+    """
+    Encodes a list of dictionaries as one encoded column for each of their
+    keys. Keys that are missing from some of the dictionaries are stored
+    with a boolean mask of the dictionaries in which they are present.
+
+    :param records:
+        The list of dictionaries to encode
+    :param arrays:
+        The dictionary of named arrays that will be written to the archive
+    """
+
+    keys = []
+    for record in records:
+        keys += [k for k in record.keys() if k not in keys]
+
+    fields = dict()
+    for key in keys:
+        present = [key in record for record in records]
+        column = encode_sequence(
+            [record[key] for record in records if key in record],
+            arrays
+        )
+
+        if not all(present):
+            column = dict(
+                type='optional',
+                present=add_array(arrays, np.array(present, dtype=bool)),
+                values=column
+            )
+
+        fields[key] = column
+
+    return dict(type='records', length=len(records), fields=fields)
+
+
+def decode(schema: dict, arrays) -> typing.Any:
+    """
+    Decodes the value described by the schema from the loaded arrays
+
+    :param schema:
+        The schema created when the value was encoded
+    :param arrays:
+        The loaded .npz archive, or a dictionary of the named arrays
+    """
+
+    value_type = schema['type']
+
+    if value_type == 'value':
+        return schema['value']
+
+    if value_type == 'dict':
+        return dict([
+            (k, decode(v, arrays))
+            for k, v in schema['fields'].items()
+        ])
+
+    if value_type == 'array':
+        return arrays[schema['key']].tolist()
+
+    if value_type == 'json':
+        return json.loads(str(arrays[schema['key']]))
+
+    if value_type == 'ragged':
+        offsets = arrays[schema['offsets']].tolist()
+        values = decode(schema['values'], arrays)
+        return [
+            values[start:end]
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+
+    if value_type == 'records':
+        records = [dict() for _ in range(schema['length'])]
+        for key, field in schema['fields'].items():
+            if field['type'] == 'optional':
+                present = arrays[field['present']]
+                targets = [r for r, p in zip(records, present) if p]
+                column = decode(field['values'], arrays)
+            else:
+                targets = records
+                column = decode(field, arrays)
+
+            for record, value in zip(targets, column):
+                record[key] = value
+        return records
+
+    raise ValueError('Unknown columnar schema type "{}"'.format(value_type))
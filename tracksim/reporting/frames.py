@@ -0,0 +1,141 @@
+"""
+A compact columnar layout for the animation frames of trial reports. Instead
+of one dictionary per frame that repeats every key, the frames are stored as:
+
+    * keys: A shared key table with the path of each field within a frame,
+      where path components are separated by periods and integer components
+      are list indexes, e.g. "positions.0.x.2"
+    * types: The encoding of each column, which is "f8" for plain floats,
+      "delta" for integer steps of the fixed-point values relative to the
+      previous frame and "label" for indexes into the labels table
+    * columns: One list of values per key with a value for every frame
+
+The JavaScript trial report decodes each column into a typed array and
+assembles frames from them as they are displayed.
+"""
+
+import typing
+
+import numpy as np
+
+FORMAT_VERSION = 1
+
+
+def encode(
+        columns: typing.Dict[str, list],
+        decimals: int = None
+) -> dict:
+    """
+    Encodes the frame columns into the compact columnar frames layout
+
+    :param columns:
+        An ordered dictionary of the values of each field path for every
+        frame, all of which must have the same length. Columns of strings are
+        stored as indexes into a labels table shared by all columns.
+    :param decimals:
+        If specified, finite numeric columns are delta-encoded as integer
+        steps of 10^-decimals, which decode to values rounded to that many
+        decimal places. Otherwise numeric columns are stored as plain floats.
+    """
+
+    counts = set([len(values) for values in columns.values()])
+    if len(counts) > 1:
+        raise ValueError('Frame columns must have the same length')
+
+    scale = None if decimals is None else 10 ** decimals
+    labels = []
+    types = []
+    encoded = []
+
+    for values in columns.values():
+        if any([isinstance(v, str) for v in values]):
+            for v in values:
+                if v not in labels:
+                    labels.append(v)
+            types.append('label')
+            encoded.append([labels.index(v) for v in values])
+            continue
+
+        array = np.asarray(values, dtype=float)
+        if scale is None or not np.all(np.isfinite(array)):
+            types.append('f8')
+            encoded.append(array.tolist())
+            continue
+
+        steps = np.rint(array * scale).astype(np.int64)
+        types.append('delta')
+        encoded.append(np.diff(steps, prepend=0).tolist())
+
+    return dict(
+        version=FORMAT_VERSION,
+        count=counts.pop() if counts else 0,
+        scale=scale,
+        keys=list(columns.keys()),
+        types=types,
+        labels=labels,
+        columns=encoded
+    )
+
+
+def decode_columns(frames: dict) -> typing.Dict[str, list]:
+    """
+    Decodes the columns of an encoded frames layout into a dictionary of the
+    values of each field path for every frame
+
+    :param frames:
+        The frames layout returned by the encode function
+    """
+
+    out = dict()
+    for key, column_type, values in zip(
+            frames['keys'],
+            frames['types'],
+            frames['columns']
+    ):
+        if column_type == 'label':
+            out[key] = [frames['labels'][v] for v in values]
+        elif column_type == 'delta':
+            out[key] = (
+                np.cumsum(np.asarray(values, dtype=np.int64)) / frames['scale']
+            ).tolist()
+        else:
+            out[key] = list(values)
+
+    return out
+
+
+def decode(frames: dict) -> typing.List[dict]:
+    """
+    Decodes an encoded frames layout into a list with one nested frame
+    dictionary per frame, in the same way as the JavaScript trial report
+
+    :param frames:
+        The frames layout returned by the encode function
+    """
+
+    columns = decode_columns(frames)
+    out = [dict() for _ in range(frames['count'])]
+
+    for key, values in columns.items():
+        path = [int(p) if p.isdigit() else p for p in key.split('.')]
+        for frame, value in zip(out, values):
+            target = frame
+            for part, following in zip(path[:-1], path[1:]):
+                if isinstance(target, list):
+                    while len(target) <= part:
+                        target.append(None)
+                    if target[part] is None:
+                        target[part] = [] if isinstance(following, int) else {}
+                    target = target[part]
+                else:
+                    target = target.setdefault(
+                        part,
+                        [] if isinstance(following, int) else {}
+                    )
+
+            if isinstance(target, list):
+                while len(target) <= path[-1]:
+                    target.append(None)
+            target[path[-1]] = value
+
+    return out
@@ -5,11 +5,9 @@ import shutil
 from datetime import datetime
 
 import markdown
-from jinja2 import Environment
-from jinja2 import FileSystemLoader
-from jinja2 import Template
 
 from tracksim import paths
+from tracksim.reporting import templates
 
 try:
     import plotly
@@ -23,9 +21,7 @@ class Report(object):
     """
 
     def __init__(self, report_type:str, identifier: str = None, **kwargs):
-        self.env = Environment(
-            loader=FileSystemLoader(paths.resource('reports'))
-        )
+        self.env = templates.environment()
 
         self.id = identifier
         self.type = report_type
@@ -61,7 +57,9 @@ class Report(object):
         :return:
         """
 
-        template = Template('<h{{level}}>{{text}}</h{{level}}>')
+        template = templates.from_string(
+            '<h{{level}}>{{text}}</h{{level}}>'
+        )
 
         self.body.append(template.render(level=level, text=text))
 
@@ -91,7 +89,9 @@ class Report(object):
         :return:
         """
 
-        template = Template('<div class="textbox">{{ text }}</div>')
+        template = templates.from_string(
+            '<div class="textbox">{{ text }}</div>'
+        )
 
         self.body.append(template.render(
             text=markdown.markdown(source)
@@ -105,7 +105,7 @@ class Report(object):
         :return:
         """
 
-        template = Template("""
+        template = templates.from_string("""
             <script>
                 window.{{ KEY }} = {{ DATA }};
             </script>
@@ -123,7 +123,9 @@ class Report(object):
         :return:
         """
 
-        template = Template('<div class="box">{{content}}</div>')
+        template = templates.from_string(
+            '<div class="box">{{content}}</div>'
+        )
 
         self.body.append(template.render(content=content))
 
@@ -233,7 +235,7 @@ class Report(object):
                 </div>
                 """
 
-        template = Template(dom_template)
+        template = templates.from_string(dom_template)
         self.body.append(template.render(svg=svg))
 
         if not filename:
@@ -252,10 +254,7 @@ class Report(object):
         :return:
         """
 
-        with open(path, 'r+') as f:
-            contents = f.read()
-
-        self.body.append(Template(contents).render(**kwargs))
+        self.body.append(templates.from_file(path).render(**kwargs))
 
     def add_data(self, **kwargs):
         """
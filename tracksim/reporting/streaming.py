@@ -0,0 +1,304 @@
+"""
+An incremental parser for JSON results files that reads the file in fixed
+size chunks and returns only the selected values. Other values are skipped
+over one buffered piece at a time and discarded, so that memory use depends
+on the size of the selected values instead of the size of the file.
+"""
+
+import gzip
+import json
+import re
+import typing
+
+CHUNK_SIZE = 1 << 16
+
+DECODER = json.JSONDecoder()
+DELIMITERS = ',:]} \t\r\n'
+
+WHITESPACE_PATTERN = re.compile(r'\s*')
+
+
+def create_selection(fields: typing.Iterable[str]) -> dict:
+    """
+    Converts a list of dotted field names, e.g. "couplings.value", into a
+    nested selection dictionary where a value of True selects the entire
+    value of that key
+
+    :param fields:
+        The dotted names of the fields to select
+    """
+
+    selection = dict()
+
+    for field in fields:
+        keys = field.split('.')
+        target = selection
+
+        for key in keys[:-1]:
+            child = target.get(key)
+            if child is True:
+                break
+            if child is None:
+                child = target[key] = dict()
+            target = child
+        else:
+            target[keys[-1]] = True
+
+    return selection
+
+
+def open_text(path: str) -> typing.TextIO:
+    """
+    Opens the results file at the specified path for reading as text, which
+    can be either gzipped or plain text JSON
+    """
+
+    with open(path, 'rb') as f:
+        is_gzipped = f.read(2) == b'\x1f\x8b'
+
+    if is_gzipped:
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def read(path: str, selection: dict) -> dict:
+    """
+    Reads the selected values from the JSON results file at the specified
+    path without decoding the rest of the file. The file is only read as far
+    as needed to find all of the selected top-level keys.
+
+    :param path:
+        The path to the gzipped or plain text JSON file
+    :param selection:
+        A nested dictionary of the keys to read, where a value of True reads
+        the entire value for that key and a dictionary reads only the selected
+        keys of that value. See create_selection.
+    :return:
+        A dictionary with the same nested structure as the file containing
+        the selected keys that were found
+    """
+
+    with open_text(path) as f:
+        return JsonStream(f).select(selection)
+
+
+class JsonStream(object):
+    """
+    Scans JSON text read from a file object in chunks, keeping only the
+    unconsumed text of the current chunk in memory, along with the text of
+    any value that is being read
+    """
+
+    def __init__(self, source: typing.TextIO, chunk_size: int = CHUNK_SIZE):
+        self.source = source
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.position = 0
+        self.mark = None
+        self.captured = []
+        self.exhausted = False
+
+    def fill(self) -> bool:
+        """
+        Reads the next chunk from the source into the buffer, discarding the
+        text that has already been consumed. Returns False if there was no
+        more text to read.
+        """
+
+        if self.exhausted:
+            return False
+
+        chunk = self.source.read(self.chunk_size)
+        if not chunk:
+            self.exhausted = True
+            return False
+
+        if self.mark is not None:
+            self.captured.append(self.buffer[self.mark:self.position])
+            self.mark = 0
+
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+
+        return True
+
+    def peek(self) -> str:
+        """
+        Skips any whitespace and returns the next character without
+        consuming it, or an empty string at the end of the text
+        """
+
+        while True:
+            end = WHITESPACE_PATTERN.match(self.buffer, self.position).end()
+            self.position = end
+            if end < len(self.buffer):
+                return self.buffer[end]
+            if not self.fill():
+                return ''
+
+    def expect(self, character: str):
+        """
+        Consumes the next non-whitespace character, which must be the
+        specified character
+        """
+
+        found = self.peek()
+        if found != character:
+            raise ValueError('Expected "{}" but found "{}" at {}'.format(
+                character,
+                found,
+                self.position
+            ))
+        self.position += 1
+
+    def read_string(self) -> str:
+        """
+        Consumes and decodes the string at the current position
+        """
+
+        decoded, value = self.decode()
+        if not decoded or not isinstance(value, str):
+            raise ValueError('Expected a string at {}'.format(self.position))
+        return value
+
+    def decode(self) -> typing.Tuple[bool, typing.Any]:
+        """
+        Decodes the value at the current position if the entire value fits
+        within the buffer, reading at most one more chunk to complete an
+        array or object. Returns whether or not the value was decoded and the
+        decoded value.
+        """
+
+        is_container = self.peek() in '[{'
+
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                end = None
+
+            # A number that is not followed by a delimiter may be truncated
+            is_complete = end is not None and (
+                self.exhausted or
+                (end < len(self.buffer) and self.buffer[end] in DELIMITERS)
+            )
+            if is_complete:
+                self.position = end
+                return True, value
+
+            remaining = len(self.buffer) - self.position
+            if is_container and remaining >= self.chunk_size:
+                return False, None
+
+            if not self.fill() and end is None:
+                return False, None
+
+    def skip_value(self):
+        """
+        Consumes the value at the current position. Values that fit within
+        the buffer are decoded and discarded, while larger arrays and objects
+        are consumed one item at a time.
+        """
+
+        first = self.peek()
+
+        if self.decode()[0]:
+            return
+
+        if first == '[':
+            self.skip_items(']', keyed=False)
+        elif first == '{':
+            self.skip_items('}', keyed=True)
+        else:
+            raise ValueError('Invalid JSON at {}'.format(self.position))
+
+    def skip_items(self, closing: str, keyed: bool):
+        """
+        Consumes the array or object at the current position one item at a
+        time
+
+        :param closing:
+            The closing character of the array or object
+        :param keyed:
+            Whether or not each item is preceded by a key, as in an object
+        """
+
+        self.position += 1
+
+        if self.peek() == closing:
+            self.position += 1
+            return
+
+        while True:
+            if keyed:
+                self.read_string()
+                self.expect(':')
+
+            self.skip_value()
+
+            if self.peek() == closing:
+                self.position += 1
+                return
+            self.expect(',')
+
+    def read_value(self) -> typing.Any:
+        """
+        Consumes and decodes the value at the current position
+        """
+
+        self.peek()
+
+        decoded, value = self.decode()
+        if decoded:
+            return value
+
+        self.mark = self.position
+        self.skip_value()
+
+        self.captured.append(self.buffer[self.mark:self.position])
+        text = ''.join(self.captured)
+        self.mark = None
+        self.captured = []
+
+        return json.loads(text)
+
+    def select(self, selection: dict, finish: bool = False) -> dict:
+        """
+        Consumes the object at the current position, decoding only the keys
+        within the selection
+
+        :param selection:
+            A nested dictionary of the keys to read. See create_selection.
+        :param finish:
+            When False, reading stops as soon as all of the selected keys have
+            been found and the remainder of the object is left unread.
+            Otherwise the entire object is consumed.
+        """
+
+        out = dict()
+        self.expect('{')
+
+        if self.peek() == '}':
+            self.position += 1
+            return out
+
+        while finish or len(out) < len(selection):
+            key = self.read_string()
+            self.expect(':')
+
+            selected = selection.get(key)
+            if selected is True:
+                out[key] = self.read_value()
+            elif selected and self.peek() == '{':
+                out[key] = self.select(selected, finish=True)
+            elif selected:
+                out[key] = self.read_value()
+            else:
+                self.skip_value()
+
+            if self.peek() == '}':
+                self.position += 1
+                break
+            self.expect(',')
+
+        return out
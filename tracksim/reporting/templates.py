@@ -0,0 +1,134 @@
+"""
+A process-wide registry of the compiled Jinja templates used by reports, so
+that each template is compiled once per process instead of once per report.
+Every Report shares the same Environment, whose loader finds templates within
+the reports resources folder by name and within the resources folder by
+relative path. Templates loaded from files are reloaded when the file is
+modified, and their compiled bytecode is stored in the results cache folder
+where it is shared by worker processes and later runs. Template strings are
+compiled the first time they are used and are then reused by source.
+"""
+
+import os
+
+from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
+from jinja2 import FileSystemLoader
+from jinja2 import Template
+
+from tracksim import paths
+
+# The shared environment by the resources folder that its loader searches and
+# the folder where its bytecode is stored
+_environments = dict()
+
+# Compiled template strings by source
+_strings = dict()
+
+# Compiled templates for files outside of the resources folder by absolute
+# path, along with the modification time and size of the file they were
+# compiled from
+_files = dict()
+
+
+class BytecodeCache(FileSystemBytecodeCache):
+    """
+    A bytecode cache within the results cache folder, which can be removed
+    while the process is running, e.g. when the caches are cleared. The
+    folder is created again when bytecode is stored, and bytecode that cannot
+    be stored is compiled again when it is next needed.
+    """
+
+    def dump_bytecode(self, bucket):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+def environment() -> Environment:
+    """
+    Returns the Jinja environment shared by the reports of this process,
+    creating it the first time it is used
+    """
+
+    root = paths.resource()
+    cache_directory = paths.results('cache', 'templates')
+
+    env = _environments.get((root, cache_directory))
+    if env is not None:
+        return env
+
+    env = Environment(
+        loader=FileSystemLoader([paths.resource('reports'), root]),
+        bytecode_cache=BytecodeCache(cache_directory),
+        auto_reload=True
+    )
+    _environments[(root, cache_directory)] = env
+    return env
+
+
+def get(name: str) -> Template:
+    """
+    Returns the compiled template with the specified name, which is either a
+    filename within the reports resources folder or a path relative to the
+    resources folder
+
+    :param name:
+        The name of the template
+    """
+
+    return environment().get_template(name)
+
+
+def from_string(source: str) -> Template:
+    """
+    Returns the compiled template for the template source string
+
+    :param source:
+        The Jinja template source
+    """
+
+    template = _strings.get(source)
+    if template is None:
+        template = environment().from_string(source)
+        _strings[source] = template
+    return template
+
+
+def from_file(path: str) -> Template:
+    """
+    Returns the compiled template for the template file at the specified
+    path, compiling it again if the file has changed since it was compiled
+
+    :param path:
+        The path to the template file
+    """
+
+    path = os.path.abspath(path)
+    relative = os.path.relpath(path, paths.resource())
+    if not relative.startswith(os.pardir):
+        return get(relative.replace(os.sep, '/'))
+
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    entry = _files.get(path)
+    if entry is None or entry[0] != version:
+        with open(path, 'r') as f:
+            entry = (version, environment().from_string(f.read()))
+        _files[path] = entry
+
+    return entry[1]
+
+
+def clear():
+    """
+    Removes every compiled template from the registry of this process, but
+    not the stored bytecode, which is only reused for unchanged files
+    """
+
+    _environments.clear()
+    _strings.clear()
+    _files.clear()
@@ -0,0 +1,45 @@
+"""
+Compares the run times of the scalar coupling_calculate functions and the
+array-based coupling calculation on a long simulated trial. Run this module
+directly, as it is not part of the unit test suite:
+
+    python -m tracksim.tests.benchmark_coupling
+"""
+
+import random
+import time
+
+from tracksim.tests.test_coupling import calculate_scalar
+from tracksim.tests.test_coupling import simulate
+from tracksim.trial.analyze.coupling import coupling_arrays
+
+
+def measure(function, *args, repeats: int = 3) -> float:
+    """
+        Returns the fastest of the run times of the function in seconds
+    """
+
+    elapsed = []
+    for _ in range(repeats):
+        random.seed(0)
+        start = time.perf_counter()
+        function(*args)
+        elapsed.append(time.perf_counter() - start)
+    return min(elapsed)
+
+
+def run(cycle_count: int = 500, steps_per_cycle: int = 20):
+    foot_positions, times = simulate(cycle_count, steps_per_cycle)
+    step_count = len(times['cycles'])
+
+    scalar = measure(calculate_scalar, foot_positions, times)
+    arrays = measure(coupling_arrays.calculate, foot_positions, times)
+
+    print('Time steps: {}'.format(step_count))
+    print('Scalar:     {:.3f} s'.format(scalar))
+    print('Arrays:     {:.3f} s'.format(arrays))
+    print('Speedup:    {:.1f}x'.format(scalar / arrays))
+
+
+if __name__ == '__main__':
+    run()
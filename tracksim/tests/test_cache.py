@@ -0,0 +1,96 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from tracksim import paths
+from tracksim.trial import cache
+from tracksim.trial import simulate
+
+
+def create_settings(**kwargs) -> dict:
+    settings = dict(
+        name='UNIT-TEST Cache',
+        duty_cycle=0.6,
+        steps_per_cycle=10,
+        activity_phases=[0, 0.5, 0.5, 0],
+        data=dict(
+            count=6,
+            offsets=[0, 0.5, 0.75, 0.25],
+            step_size=0.35,
+            lateral_displacement=0.1
+        )
+    )
+    settings.update(kwargs)
+    return settings
+
+
+class test_cache(unittest.TestCase):
+
+    def setUp(self):
+        self.results_path = tempfile.mkdtemp()
+        paths.override('results', self.results_path)
+
+    def tearDown(self):
+        paths.override('results', None)
+        shutil.rmtree(self.results_path)
+
+    def test_execute(self):
+        """
+            Restores the stored results when a trial is run again
+        """
+
+        result = simulate.execute(create_settings())
+        entries = cache.list_entries()
+        self.assertEqual(len(entries), 1)
+
+        report_directory = paths.results('reports', 'trial', result['id'])
+        shutil.rmtree(report_directory)
+
+        self.assertEqual(simulate.execute(create_settings()), result)
+        self.assertTrue(os.path.exists(os.path.join(
+            report_directory,
+            '{}.json'.format(result['id'])
+        )))
+        self.assertEqual(len(cache.list_entries()), 1)
+
+        simulate.execute(create_settings(duty_cycle=0.7))
+        simulate.execute(create_settings(steps_per_cycle=12), cache=False)
+        self.assertEqual(len(cache.list_entries()), 2)
+
+        cache.clear()
+        self.assertEqual(len(cache.list_entries()), 0)
+
+    def test_prune(self):
+        """
+            Evicts the least recently used entries first
+        """
+
+        report_directory = os.path.join(self.results_path, 'report')
+        os.makedirs(report_directory)
+        with open(os.path.join(report_directory, 'data.txt'), 'w+') as f:
+            f.write('x' * 1000)
+
+        for index, key in enumerate(['a', 'b', 'c']):
+            cache.store(key, report_directory, dict(id=key))
+            os.utime(
+                os.path.join(cache.directory(key), cache.RESULT_FILENAME),
+                (index, index)
+            )
+
+        self.assertIsNotNone(cache.fetch('a', report_directory))
+        self.assertEqual(cache.prune(2500), 1)
+        self.assertEqual(
+            [e['key'] for e in cache.list_entries()],
+            ['c', 'a']
+        )
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_cache)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
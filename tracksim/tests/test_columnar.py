@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+from tracksim import reader
+from tracksim.reporting import columnar
+from tracksim.trial import simulate
+
+
+class test_columnar(unittest.TestCase):
+
+    def test_round_trip(self):
+        """
+            Decodes the same nested structure that was encoded
+        """
+
+        data = dict(
+            settings=dict(id='TEST', duty_cycle=0.6, phases=[0, 0.5, 0.5, 0]),
+            positions=[
+                dict(x=1.5, y=2, annotation='F', uid='a'),
+                dict(x=2.5, y=3, uid='b', assumed=True),
+                dict(x=3.5, y=None, uid='c')
+            ],
+            boxes=[[1, 2, 3], [], [4.5]],
+            flags=[True, False],
+            mixed=[1, 'a', None],
+            empty=[]
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'TEST.json')
+            columnar.write(path, data)
+
+            self.assertTrue(columnar.exists(path))
+            self.assertEqual(columnar.read(path), data)
+            self.assertEqual(
+                columnar.read(path, ['boxes', 'flags']),
+                dict(boxes=data['boxes'], flags=data['flags'])
+            )
+
+            with self.assertRaises(KeyError):
+                columnar.read(path, ['unknown'])
+
+    def test_trial_sections(self):
+        """
+            Reads only the requested sections of a trial's results
+        """
+
+        simulate.run(
+            dict(
+                name='UNIT-TEST Columnar',
+                duty_cycle=0.6,
+                steps_per_cycle=10,
+                activity_phases=[0, 0.5, 0.5, 0],
+                data=dict(
+                    count=6,
+                    offsets=[0, 0.5, 0.75, 0.25],
+                    step_size=0.35,
+                    lateral_displacement=0.1
+                )
+            ),
+            columnar=True
+        )
+
+        result = reader.trial('UNIT-TEST-Columnar', sections=['couplings'])
+        self.assertEqual(sorted(result.keys()), ['couplings', 'id'])
+
+        expected = reader.read_path(reader.listings(
+            'trial',
+            matching_glob='UNIT-TEST-Columnar'
+        )['UNIT-TEST-Columnar'])
+        self.assertEqual(result['couplings'], expected['couplings'])
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_columnar)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
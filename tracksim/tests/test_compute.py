@@ -0,0 +1,168 @@
+import unittest
+
+import numpy as np
+
+from tracksim import generate
+from tracksim import limb
+from tracksim.trial import compute
+
+
+def reference_positions(time_steps, limb_positions, activity_phase, settings):
+    """
+        Computes the positions one time step at a time with the scalar
+        position_at_cycle_time function for comparison
+    """
+
+    out = []
+    duty_cycle = settings['duty_cycle']
+    track_count = len(limb_positions)
+
+    for time in time_steps:
+        limb_time = time - activity_phase
+        limb_cycle = int(limb_time)
+
+        if (
+            time < activity_phase - duty_cycle or
+            time > track_count - 1 + activity_phase
+        ):
+            out.append(None)
+        elif limb_cycle < 0 or limb_time < 0:
+            out.append(limb_positions[0])
+        elif (limb_cycle + 1) == track_count:
+            out.append(limb_positions[-1])
+        else:
+            out.append(compute.position_at_cycle_time(
+                cycle_time=limb_time - limb_cycle,
+                before_position=limb_positions[limb_cycle],
+                after_position=limb_positions[limb_cycle + 1],
+                duty_cycle=duty_cycle,
+                settings=settings
+            ))
+
+    return out
+
+
+class test_compute(unittest.TestCase):
+
+    def setUp(self):
+        """
+        """
+
+        self.settings = dict(duty_cycle=0.6, moving_ambiguity=0.1)
+        self.phases = limb.Property().assign(0.0, 0.5, -0.75, -0.25)
+        self.trackway = generate.trackway_data(
+            cycle_count=8,
+            step_size=0.75,
+            activity_phases=self.phases,
+            track_offsets=limb.Property().assign(0.0, 0.5, 0.25, 0.75),
+            lateral_displacement=[0.2, 0.15],
+            positional_uncertainty=0.02
+        )
+        self.time_steps = generate.time_steps_from_data(20, self.trackway)
+
+    def test_arrays_match_scalar(self):
+        """
+            The array engine matches the scalar position computation
+        """
+
+        for key in limb.KEYS:
+            limb_positions = self.trackway.limb_positions.get(key)
+            phase = self.phases.get(key)
+
+            expected = reference_positions(
+                self.time_steps,
+                limb_positions,
+                phase,
+                self.settings
+            )
+            result = compute.positions_over_time(
+                self.time_steps,
+                limb_positions,
+                phase,
+                self.settings
+            )
+
+            self.assertEqual(len(expected), len(result))
+            for e, r in zip(expected, result):
+                if e is None:
+                    self.assertIsNone(r)
+                    continue
+
+                self.assertTrue(e.compare(r, raw=True))
+                if e.annotation == compute.MOVING_ANNOTATION:
+                    self.assertEqual(r.annotation, compute.MOVING_ANNOTATION)
+                else:
+                    self.assertEqual(r.annotation, compute.FIXED_ANNOTATION)
+                    self.assertEqual(e.uid, r.uid)
+
+    def test_trackway_arrays(self):
+        """
+            Structure-of-arrays output has one entry per time step per limb
+        """
+
+        arrays = compute.trackway_positions_over_time_arrays(
+            self.time_steps,
+            self.trackway,
+            self.settings
+        )
+
+        for key, data in arrays.items():
+            self.assertEqual(len(data['x']), len(self.time_steps))
+            valid = data['valid']
+            self.assertFalse(np.any(np.isnan(data['x'][valid])))
+            self.assertTrue(np.all(data['annotation'][~valid] == ''))
+
+        positions = compute.to_track_position_lists(arrays, self.trackway)
+        for key, series in positions.items():
+            self.assertEqual(len(series), len(self.time_steps))
+
+    def test_track_ranges(self):
+        """
+            Positions computed from only the track positions within the
+            ranges match those computed from every track position
+        """
+
+        time_steps = self.time_steps[60:95]
+        ranges = compute.track_ranges(
+            time_steps[0],
+            time_steps[-1],
+            self.trackway
+        )
+
+        expected = compute.trackway_positions_over_time_arrays(
+            time_steps,
+            self.trackway,
+            self.settings
+        )
+        result = compute.trackway_positions_over_time_arrays(
+            time_steps,
+            self.trackway,
+            self.settings,
+            track_ranges=ranges
+        )
+
+        for key in limb.KEYS:
+            start, end = ranges.get(key)
+            self.assertLess(end - start, 8)
+
+            e = expected.get(key)
+            r = result.get(key)
+            fixed = e['track_index'] >= 0
+            self.assertTrue(np.array_equal(
+                r['track_index'][fixed] + start,
+                e['track_index'][fixed]
+            ))
+            for name in ['x', 'y', 'x_uncertainty', 'y_uncertainty']:
+                self.assertTrue(
+                    np.array_equal(r[name], e[name], equal_nan=True)
+                )
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_compute)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
@@ -0,0 +1,128 @@
+import random
+import unittest
+
+import measurement_stats as mstats
+import numpy as np
+
+from tracksim import trackway
+from tracksim.trial import analyze
+from tracksim.trial import simulate as simulate_trial
+from tracksim.trial.analyze.coupling import coupling_arrays
+from tracksim.trial.analyze.coupling import coupling_calculate
+
+
+def simulate(cycle_count: int, steps_per_cycle: int = 20) -> tuple:
+    """
+        Simulates a walking trial on generated trackway data and returns the
+        foot positions and times data for the simulation
+    """
+
+    settings = dict(
+        id='UNIT-TEST-Coupling',
+        name='UNIT-TEST Coupling',
+        duty_cycle=0.6,
+        steps_per_cycle=steps_per_cycle,
+        activity_phases=[0, 0.5, 0.5, 0],
+        data=dict(
+            count=cycle_count,
+            offsets=[0, 0.5, 0.75, 0.25],
+            step_size=0.35,
+            lateral_displacement=0.1
+        )
+    )
+    simulate_trial.apply_defaults(settings)
+
+    trackway_definition = trackway.TrackwayDefinition(
+        simulate_trial.load_trackway_positions(settings),
+        simulate_trial.load_activity_phases(settings)
+    )
+    trackway_definition.reorient_positions()
+
+    simulated = simulate_trial.simulate(settings, trackway_definition)
+    times = analyze.make_time_data(simulated['time_steps'], settings)
+    return simulated['foot_positions'], times
+
+
+def calculate_scalar(foot_positions, times) -> dict:
+    """
+        Calculates the coupling data one time step at a time with the
+        coupling_calculate functions
+    """
+
+    positions = coupling_calculate.positions(foot_positions, times)
+    stats = coupling_calculate.statistics(positions)
+    advances = coupling_calculate.advance(foot_positions, positions, times)
+    return dict(**positions, **stats, **advances)
+
+
+class test_coupling(unittest.TestCase):
+
+    def assertSameValue(self, expected, result):
+        self.assertAlmostEqual(expected.raw, result.raw, places=9)
+        self.assertAlmostEqual(
+            expected.raw_uncertainty,
+            result.raw_uncertainty,
+            places=9
+        )
+
+    def test_calculate(self):
+        """
+            Array coupling calculation matches the scalar calculation
+        """
+
+        foot_positions, times = simulate(12)
+
+        random.seed(0)
+        expected = calculate_scalar(foot_positions, times)
+        random.seed(0)
+        result = coupling_arrays.calculate(foot_positions, times)
+
+        for key in ['lengths', 'rear_advance', 'forward_advance']:
+            self.assertEqual(len(expected[key]), len(result[key]))
+            for e, r in zip(expected[key], result[key]):
+                self.assertEqual(e.index, r.index)
+                self.assertSameValue(e.value, r.value)
+
+        for key in ['rear', 'forward', 'midpoints']:
+            self.assertEqual(len(expected[key]), len(result[key]))
+            for e, r in zip(expected[key], result[key]):
+                self.assertTrue(e.compare(r, raw=True))
+
+        for e, r in zip(expected['deviations'], result['deviations']):
+            self.assertSameValue(e, r)
+
+        self.assertSameValue(expected['value'], result['value'])
+        for key in ['rmsd', 'swing', 'fitness']:
+            self.assertAlmostEqual(expected[key], result[key], places=6)
+
+    def test_swing(self):
+        """
+            Array swing selects the same extremes as the scalar swing
+        """
+
+        rng = np.random.RandomState(9)
+        values = rng.uniform(0.9, 1.1, 200).round(2)
+        uncertainties = rng.choice([0.01, 0.02, 0.05], 200)
+        lengths = [
+            mstats.ValueUncertainty(v, u)
+            for v, u in zip(values, uncertainties)
+        ]
+
+        self.assertAlmostEqual(
+            coupling_calculate.calculate_swing(1.0, lengths),
+            coupling_arrays.calculate_swing(1.0, values, uncertainties)
+        )
+        self.assertAlmostEqual(
+            coupling_calculate.calculate_rmsd(1.0, lengths),
+            coupling_arrays.calculate_rmsd(1.0, values, uncertainties)
+        )
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_coupling)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
@@ -0,0 +1,90 @@
+import random
+import unittest
+
+from tracksim.reporting import frames
+
+
+class test_frames(unittest.TestCase):
+
+    def test_round_trip(self):
+        """
+            Decodes the nested frames from the encoded columns
+        """
+
+        columns = dict([
+            ('time', [0.0, 0.05, 0.1]),
+            ('positions.0.x.0', [1.25, 1.5, 1.75]),
+            ('positions.0.x.1', [0.1, 0.1, 0.1]),
+            ('positions.0.f', ['F', 'M', 'F']),
+            ('positions.1.f', ['M', 'M', 'F']),
+            ('box.1.x', [0.5, float('nan'), -0.25])
+        ])
+
+        result = frames.encode(columns)
+        self.assertEqual(result['keys'], list(columns.keys()))
+        self.assertEqual(result['types'], ['f8'] * 3 + ['label'] * 2 + ['f8'])
+        self.assertEqual(result['labels'], ['F', 'M'])
+        self.assertEqual(result['columns'][4], [1, 1, 0])
+
+        decoded = frames.decode(result)
+        self.assertEqual(len(decoded), 3)
+        self.assertEqual(decoded[1]['time'], 0.05)
+        self.assertEqual(
+            decoded[2]['positions'],
+            [dict(x=[1.75, 0.1], f='F'), dict(f='F')]
+        )
+        self.assertEqual(decoded[0]['box'], [None, dict(x=0.5)])
+
+    def test_delta(self):
+        """
+            Delta-encodes finite numeric columns as fixed-point steps
+        """
+
+        columns = dict([
+            ('time', [0.0, 0.05, 0.1, 0.15]),
+            ('x', [1.0000004, 1.25, 1.25, 0.5]),
+            ('y', [1.0, float('nan'), 2.0, 3.0])
+        ])
+
+        result = frames.encode(columns, decimals=6)
+        self.assertEqual(result['types'], ['delta', 'delta', 'f8'])
+        self.assertEqual(result['columns'][0], [0, 50000, 50000, 50000])
+        self.assertEqual(result['columns'][1], [1000000, 250000, 0, -750000])
+
+        decoded = frames.decode_columns(result)
+        self.assertEqual(decoded['time'], columns['time'])
+        self.assertEqual(decoded['x'], [1.0, 1.25, 1.25, 0.5])
+
+        with self.assertRaises(ValueError):
+            frames.encode(dict(a=[1.0], b=[1.0, 2.0]))
+
+    def test_delta_error(self):
+        """
+            Bounds the error of the decoded delta-encoded values
+        """
+
+        random.seed(0)
+        values = [random.uniform(-100, 100) for _ in range(500)]
+
+        self.assertEqual(frames.decode_columns(frames.encode(dict(
+            x=values
+        )))['x'], values)
+
+        for decimals in [2, 6]:
+            decoded = frames.decode_columns(frames.encode(
+                dict(x=values),
+                decimals=decimals
+            ))['x']
+
+            error = max([abs(a - b) for a, b in zip(values, decoded)])
+            self.assertLessEqual(error, 0.5 * 10 ** -decimals + 1e-12)
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_frames)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
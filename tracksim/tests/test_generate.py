@@ -1,6 +1,8 @@
 import random
 import unittest
 
+import numpy as np
+
 from tracksim import generate
 from tracksim import limb
 
@@ -83,6 +85,28 @@ class test_generate(unittest.TestCase):
                     'length':len(out)})
                 raise
 
+    def test_event_time_steps(self):
+        """
+            Includes the lift off and landing times of every limb and the
+            whole and half cycle times
+        """
+
+        trackway_definition = generate.trackway_data(
+            cycle_count=3,
+            step_size=1.0,
+            activity_phases=limb.Property().assign(0, 0.25, 0.5, 0.75),
+            track_offsets=limb.Property().assign(0, 0, 0, 0),
+            lateral_displacement=0.1
+        )
+
+        out = generate.event_time_steps(trackway_definition, 0.6)
+
+        self.assertEqual(out[0], -1.0)
+        self.assertEqual(out[-1], 3.0)
+        self.assertTrue(np.all(np.diff(out) > 0))
+        for time in [-0.5, 0.25, 0.4, 0.65, 1.5, 2.15]:
+            self.assertTrue(np.any(np.isclose(out, time)), time)
+
 ################################################################################
 ################################################################################
 
@@ -2,9 +2,45 @@ import unittest
 import math
 
 import measurement_stats as mstats
+import numpy as np
+
+from tracksim import uncertain
 from tracksim.trackway import TrackPosition
 from tracksim.trial.analyze import geometry
 
+
+def create_lines_and_points(count: int) -> tuple:
+    """
+        Creates random line segments, including vertical, steep and horizontal
+        ones, and random points for comparing batched and scalar operations
+    """
+
+    rng = np.random.RandomState(3)
+    lines = []
+    points = []
+
+    for i in range(count):
+        start = TrackPosition.from_raw_values(
+            *rng.uniform(-2, 2, 2),
+            *rng.uniform(0.01, 0.05, 2)
+        )
+        angle = math.pi / 2 if i % 7 == 0 else rng.uniform(0, 2 * math.pi)
+        angle = 0 if i % 11 == 0 else angle
+        length = rng.uniform(0.5, 3)
+        end = TrackPosition.from_raw_values(
+            start.x.raw + length * math.cos(angle),
+            start.y.raw + length * math.sin(angle),
+            *rng.uniform(0.01, 0.05, 2)
+        )
+
+        lines.append(geometry.LineSegment2D(start, end))
+        points.append(TrackPosition.from_raw_values(
+            *rng.uniform(-3, 3, 2),
+            *rng.uniform(0.01, 0.05, 2)
+        ))
+
+    return lines, points
+
 class TestGeometry(unittest.TestCase):
 
     def test_line_extension_horizontal(self):
@@ -109,6 +145,85 @@ class TestGeometry(unittest.TestCase):
         self.assertAlmostEqual(length + post_delta + pre_delta, l.length.raw)
 
 
+    def test_batch_closest_points(self):
+        """
+            Batched closest points match the scalar closest points
+        """
+
+        lines, points = create_lines_and_points(200)
+        start, end = geometry.line_columns(lines)
+        point_columns = uncertain.to_columns(points)
+
+        for contained in [False, True]:
+            result = geometry.closest_points_on_lines(
+                start,
+                end,
+                point_columns,
+                contained=contained
+            )
+
+            for i in range(len(lines)):
+                expected = lines[i].closest_point_on_line(
+                    points[i],
+                    contained=contained
+                )
+                if expected is None:
+                    self.assertTrue(np.isnan(result[0][i]))
+                    continue
+
+                self.assertAlmostEqual(expected.x.raw, result[0][i])
+                self.assertAlmostEqual(expected.y.raw, result[1][i])
+                self.assertAlmostEqual(
+                    expected.x.raw_uncertainty,
+                    result[2][i]
+                )
+                self.assertAlmostEqual(
+                    expected.y.raw_uncertainty,
+                    result[3][i]
+                )
+
+    def test_batch_distances_to_points(self):
+        """
+            Batched point distances match the scalar point distances
+        """
+
+        lines, points = create_lines_and_points(200)
+        values, uncertainties = geometry.distances_to_points(
+            *geometry.line_columns(lines),
+            uncertain.to_columns(points)
+        )
+
+        for i in range(len(lines)):
+            expected = lines[i].distance_to_point(points[i])
+            self.assertAlmostEqual(expected.raw, values[i])
+            self.assertAlmostEqual(
+                expected.raw_uncertainty,
+                uncertainties[i]
+            )
+
+    def test_batch_extrapolate(self):
+        """
+            Batched extrapolation matches the scalar line extension
+        """
+
+        lines, _ = create_lines_and_points(200)
+        start, end = geometry.line_columns(lines)
+
+        angles, _ = geometry.angles(start, end)
+        for i in range(len(lines)):
+            self.assertAlmostEqual(lines[i].angle.radians, angles[i])
+
+        for pre in [False, True]:
+            result = geometry.extrapolate_by_length(start, end, 4, pre=pre)
+
+            for i in range(len(lines)):
+                x, y = lines[i]._extrapolate_by_length(4, pre=pre)
+                self.assertAlmostEqual(x.raw, result[0][i])
+                self.assertAlmostEqual(y.raw, result[1][i])
+                self.assertAlmostEqual(x.raw_uncertainty, result[2][i])
+                self.assertAlmostEqual(y.raw_uncertainty, result[3][i])
+
+
 ################################################################################
 ################################################################################
 
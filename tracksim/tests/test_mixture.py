@@ -0,0 +1,99 @@
+import random
+import unittest
+
+import measurement_stats as mstats
+import numpy as np
+from measurement_stats.distributions import boxes
+
+from tracksim import mixture
+
+
+def create_measurements(count: int) -> list:
+    rng = np.random.RandomState(count)
+    return [
+        mstats.ValueUncertainty(value, uncertainty)
+        for value, uncertainty in zip(
+            1.2 + 0.05 * rng.randn(count),
+            0.001 + 0.02 * rng.rand(count)
+        )
+    ]
+
+
+class test_mixture(unittest.TestCase):
+
+    def test_probabilities_at(self):
+        """
+            Matches the probabilities of the mstats distribution
+        """
+
+        for count in [1, 50]:
+            measurements = create_measurements(count)
+            expected = mstats.create_distribution(measurements)
+            result = mixture.GaussianMixture.from_measurements(measurements)
+
+            x_values = mstats.ops.linear_space(
+                expected.minimum_boundary(3),
+                expected.maximum_boundary(3),
+                250
+            )
+            self.assertEqual(
+                list(result.probabilities_at(x_values)),
+                expected.probabilities_at(x_values)
+            )
+
+            heights = np.linspace(0.1, 1.0, count)
+            self.assertTrue(np.allclose(
+                result.probabilities_at(x_values, heights),
+                expected.heighted_probabilities_at(x_values, heights)
+            ))
+
+    def test_cumulative_at(self):
+        """
+            Integrates to the fraction of the distribution below a position
+        """
+
+        measurements = create_measurements(20)
+        result = mixture.GaussianMixture.from_measurements(measurements)
+
+        minimum = result.minimum_boundary(10)
+        maximum = result.maximum_boundary(10)
+        middle = 0.5 * (minimum + maximum)
+        x_values = np.linspace(minimum, middle, 4001)
+        y_values = result.probabilities_at(x_values)
+        integral = np.sum(
+            0.5 * (y_values[1:] + y_values[:-1]) * np.diff(x_values)
+        )
+
+        cumulative = result.cumulative_at([minimum, middle, maximum])
+        self.assertAlmostEqual(cumulative[0], 0.0)
+        self.assertAlmostEqual(cumulative[1], integral, places=6)
+        self.assertAlmostEqual(cumulative[2], 1.0)
+
+    def test_population(self):
+        """
+            Draws the same populations and statistics as mstats
+        """
+
+        measurements = create_measurements(50)
+        expected = mstats.create_distribution(measurements)
+        result = mixture.GaussianMixture.from_measurements(measurements)
+
+        random.seed(0)
+        population = mstats.distributions.population(expected, 256)
+        bounds = boxes.weighted_two(expected)
+        mad = mstats.distributions.weighted_median_average_deviation(expected)
+
+        random.seed(0)
+        self.assertEqual(result.population(256), population)
+        self.assertEqual(result.weighted_two(), bounds)
+        self.assertEqual(result.weighted_median_average_deviation(), mad)
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_mixture)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
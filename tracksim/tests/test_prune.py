@@ -0,0 +1,115 @@
+import itertools
+import unittest
+
+from tracksim import limb
+from tracksim import trackway
+from tracksim.trial import prune
+
+
+def create_prints(count: int) -> list:
+    return [
+        trackway.TrackPosition.from_raw_values(i, 0, 0.01, 0.01)
+        for i in range(count)
+    ]
+
+
+def reference_unused(foot_prints: list, used_uids: set) -> list:
+    """
+        Trims the foot prints one at a time in the same way as the original
+        implementation for comparison
+    """
+
+    foot_prints = list(foot_prints)
+
+    index = len(foot_prints) - 1
+    while index > 0:
+        index -= 1
+        if foot_prints[index].uid in used_uids:
+            break
+        foot_prints.pop()
+
+    while len(foot_prints) > 1:
+        if foot_prints[1].uid in used_uids:
+            break
+        foot_prints.pop(0)
+
+    return foot_prints
+
+
+class test_prune(unittest.TestCase):
+
+    def test_invalid_positions(self):
+        """
+            Slices all limbs to the window where every limb is valid
+        """
+
+        prints = create_prints(10)
+        foot_positions = limb.Property()
+        for offset, key in enumerate(limb.KEYS):
+            foot_positions.set(key, trackway.TrackPositionArray.from_positions(
+                [None] * offset + prints[offset:] + [None] * 3
+            ))
+
+        time_steps = [0.5 * i for i in range(13)]
+        window = prune.invalid_positions(
+            dict(end_time=4.5),
+            time_steps,
+            foot_positions
+        )
+
+        self.assertEqual(window, (3, 10))
+        self.assertEqual(time_steps, [1.5, 2, 2.5, 3, 3.5, 4, 4.5])
+        for positions in foot_positions.values():
+            self.assertEqual(len(positions), 7)
+            self.assertTrue(positions.valid.all())
+
+        window = prune.invalid_positions(
+            dict(start_time=100),
+            time_steps,
+            foot_positions
+        )
+        self.assertEqual(window, (0, 0))
+        self.assertEqual(len(time_steps), 0)
+
+    def test_unused_foot_prints(self):
+        """
+            Trims the same prints as the original implementation
+        """
+
+        count = 6
+        for used in itertools.product([False, True], repeat=count):
+            prints = create_prints(count)
+            used_positions = [p for p, u in zip(prints, used) if u]
+
+            print_positions = limb.Property().assign(
+                *[list(prints) for _ in limb.KEYS]
+            )
+            foot_positions = limb.Property().assign(
+                *[used_positions + [None] for _ in limb.KEYS]
+            )
+
+            expected = reference_unused(
+                prints,
+                set([p.uid for p in used_positions])
+            )
+            was_pruned = prune.unused_foot_prints(
+                print_positions,
+                foot_positions
+            )
+
+            self.assertEqual(was_pruned, len(expected) != count)
+            for result in print_positions.values():
+                self.assertEqual(
+                    [p.uid for p in expected],
+                    [p.uid for p in result]
+                )
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_prune)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
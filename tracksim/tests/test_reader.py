@@ -0,0 +1,87 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from tracksim import reader
+from tracksim.reporting import streaming
+
+DATA = dict(
+    settings=dict(id='TEST', name='Test', duty_cycle=0.6, escaped='a"}['),
+    foot_positions=dict(left_pes=[
+        dict(x=i, y=-1.5e-3 * i, uid='p{}'.format(i))
+        for i in range(50)
+    ]),
+    couplings=dict(value=dict(value=1.2, uncertainty=0.05), lengths=[1, 2]),
+    times=dict(cycles=[0, 1.5, 3], progress=[])
+)
+
+
+class test_reader(unittest.TestCase):
+
+    def test_streaming_select(self):
+        """
+            Streams only the selected values for any chunk size
+        """
+
+        text = json.dumps(DATA)
+        selection = streaming.create_selection([
+            'settings.duty_cycle',
+            'settings.escaped',
+            'couplings.value',
+            'times',
+            'missing.value'
+        ])
+
+        for chunk_size in [1, 3, 17, 1 << 16]:
+            stream = streaming.JsonStream(io.StringIO(text), chunk_size)
+            self.assertEqual(stream.select(selection), dict(
+                settings=dict(duty_cycle=0.6, escaped='a"}['),
+                couplings=dict(value=DATA['couplings']['value']),
+                times=DATA['times']
+            ))
+
+            stream = streaming.JsonStream(io.StringIO(text), chunk_size)
+            self.assertEqual(
+                stream.select(dict(foot_positions=True)),
+                dict(foot_positions=DATA['foot_positions'])
+            )
+
+    def test_read_fields(self):
+        """
+            Loads unselected values when they are first accessed
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'TEST.json')
+            with gzip.open(path, 'w+') as f:
+                f.write(json.dumps(DATA).encode())
+
+            record = reader.read_fields(
+                path,
+                ['settings.duty_cycle', 'couplings.value']
+            )
+            self.assertEqual(sorted(record.keys()), ['couplings', 'settings'])
+            self.assertEqual(list(record['settings'].keys()), ['duty_cycle'])
+
+            self.assertEqual(record['settings']['name'], 'Test')
+            self.assertEqual(record['settings'], DATA['settings'])
+            self.assertIn('lengths', record['couplings'])
+            self.assertEqual(record['couplings'], DATA['couplings'])
+            self.assertEqual(record['times'], DATA['times'])
+            self.assertIsNone(record.get('missing'))
+            self.assertIsNone(record['settings'].get('missing'))
+
+            self.assertEqual(record.load(), DATA)
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_reader)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from tracksim import paths
+from tracksim.trial import render
+from tracksim.trial import simulate
+from tracksim.trial import stages
+
+
+def get_configs_path() -> str:
+    return paths.project('test_resources', 'unit_test_trial_trot.json')
+
+
+class test_render(unittest.TestCase):
+
+    def setUp(self):
+        self.results_path = tempfile.mkdtemp()
+        paths.override('results', self.results_path)
+
+    def tearDown(self):
+        paths.override('results', None)
+        shutil.rmtree(self.results_path)
+
+    def test_render(self):
+        """
+            Renders the report of a trial that only wrote its results data
+        """
+
+        result = simulate.execute(
+            get_configs_path(),
+            name='UNIT-TEST Render',
+            report=False
+        )
+        trial_id = result['id']
+        directory = paths.results('reports', 'trial', trial_id)
+
+        self.assertEqual(
+            result['url'],
+            os.path.join(directory, '{}.json'.format(trial_id))
+        )
+        self.assertEqual(os.listdir(directory), ['{}.json'.format(trial_id)])
+
+        self.assertEqual(render.find_trials([trial_id]), [trial_id])
+        self.assertEqual(render.load_settings(trial_id)['report'], False)
+
+        rendered = render.render([trial_id])[0]
+        self.assertTrue(rendered['url'].startswith('file://'))
+        self.assertTrue(
+            os.path.exists(os.path.join(directory, '{}.js'.format(trial_id)))
+        )
+        self.assertEqual(rendered['couplings'], result['couplings'])
+
+    def test_cache_disabled(self):
+        """
+            Renders from the stage outputs stored with the cache disabled
+        """
+
+        result = simulate.execute(
+            get_configs_path(),
+            name='UNIT-TEST Render Uncached',
+            cache=False,
+            report=False
+        )
+        trial_id = result['id']
+        self.assertTrue(stages.has_outputs(trial_id))
+
+        with mock.patch.object(
+            stages,
+            'save_output',
+            wraps=stages.save_output
+        ) as save_output:
+            rendered = render.render([trial_id])[0]
+
+        save_output.assert_not_called()
+        self.assertTrue(rendered['url'].startswith('file://'))
+        self.assertEqual(rendered['couplings'], result['couplings'])
+
+    def test_unrenderable(self):
+        """
+            Fails to render trials without stored stage outputs
+        """
+
+        trial_id = simulate.execute(
+            get_configs_path(),
+            name='UNIT-TEST Render Unstored',
+            cache=False
+        )['id']
+        self.assertFalse(stages.has_outputs(trial_id))
+
+        with self.assertRaisesRegex(ValueError, 'no stored stage outputs'):
+            render.render([trial_id])
+
+        trial_id = simulate.execute(
+            get_configs_path(),
+            name='UNIT-TEST Render Streamed',
+            stream_window=20,
+            report=False
+        )['id']
+
+        with self.assertRaisesRegex(ValueError, 'was streamed'):
+            render.render([trial_id])
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_render)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
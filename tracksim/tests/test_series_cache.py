@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+
+from tracksim import configs
+from tracksim import limb
+from tracksim import paths
+from tracksim.trial import series_cache
+from tracksim.trial import simulate
+from tracksim.trial import stages
+
+
+def simulate_positions(**kwargs) -> list:
+    settings = simulate.apply_defaults(configs.load('trial', paths.project(
+        'test_resources',
+        'unit_test_trial_trot_data.json'
+    ), **kwargs))
+
+    result = simulate.simulate(settings, stages.create_trackway(settings))
+    positions = [result['foot_positions'].get(key) for key in limb.KEYS]
+
+    return [
+        (
+            np.asarray(p.x).tolist(),
+            np.asarray(p.y_uncertainty).tolist(),
+            list(p.name),
+            list(p.annotation_code)
+        )
+        for p in positions
+    ]
+
+
+class test_series_cache(unittest.TestCase):
+
+    def test_fetch(self):
+        """
+            Requests within a stored series are hits and others extend it
+        """
+
+        memo = series_cache.SeriesCache()
+        created = []
+
+        def create(start: int, end: int) -> dict:
+            created.append((start, end))
+            return dict(values=np.arange(start, end))
+
+        def fetch(start: int, end: int) -> list:
+            return memo.fetch('a', start, end, create)['values'].tolist()
+
+        self.assertEqual(fetch(2, 6), [2, 3, 4, 5])
+        self.assertEqual(fetch(3, 5), [3, 4])
+        self.assertEqual(fetch(4, 9), [4, 5, 6, 7, 8])
+        self.assertEqual(fetch(3, 8), [3, 4, 5, 6, 7])
+
+        self.assertEqual(created, [(2, 6), (2, 9)])
+        self.assertEqual(memo.counts(), dict(hits=2, misses=2))
+
+    def test_simulate(self):
+        """
+            Trials sharing a memo compute the same positions as without it
+        """
+
+        windows = [dict(), dict(start_time=2, end_time=6), dict(end_time=3)]
+        expected = [simulate_positions(**window) for window in windows]
+
+        with series_cache.enabled() as memo:
+            result = [simulate_positions(**window) for window in windows]
+
+        self.assertIsNone(series_cache.active())
+        self.assertEqual(expected, result)
+        self.assertGreater(memo.hits, 0)
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_series_cache)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
@@ -1,9 +1,13 @@
+import random
 import unittest
 
+from tracksim import configs
 from tracksim import paths
 from tracksim import system
 from tracksim.group import simulate as simulate_group
 from tracksim.trial import simulate as simulate_trial
+from tracksim.trial import stages
+from tracksim.trial.analyze import coupling
 
 
 class test_simulate(unittest.TestCase):
@@ -30,6 +34,109 @@ class test_simulate(unittest.TestCase):
         )
         simulate_group.run(configs_path)
 
+    def test_run_group_parallel(self):
+        """
+            Runs the group trials within a process pool and confirms that the
+            results are returned in the order of the trials
+        """
+
+        configs_path = paths.project(
+                'test_resources', 'unit_test_group.json'
+        )
+        settings = configs.load('group', configs_path)
+        trials_settings = [
+            simulate_group.load_trial_settings(settings, source)
+            for source in simulate_group.fetch_trial_list(settings)
+        ]
+
+        results = simulate_group.run_trials(trials_settings, workers=2)
+
+        self.assertEqual(
+            [r['id'] for r in results],
+            [ts['id'] for ts in trials_settings]
+        )
+        for result in results:
+            self.assertIn('population', result['couplings'])
+
+        simulate_group.run(configs_path, workers=2)
+
+    def test_equivalent_trials(self):
+        """
+            Trials that differ only in their report settings share results
+        """
+
+        configs_path = paths.project(
+                'test_resources', 'unit_test_trial_trot.json'
+        )
+        trials_settings = [
+            configs.load('trial', configs_path, cache=False, **kwargs)
+            for kwargs in [
+                dict(name='UNIT-TEST Trot Equivalent A'),
+                dict(name='UNIT-TEST Trot Wider', duty_cycle=0.7),
+                dict(
+                    name='UNIT-TEST Trot Equivalent B',
+                    activity_phases=dict(lp=0, rp=0.5, lm=-0.5, rm=-1.0)
+                )
+            ]
+        ]
+
+        equivalents = simulate_group.find_equivalent_trials(trials_settings)
+        self.assertEqual(equivalents, [[0, 2], [1]])
+
+        results = simulate_group.run_trials(trials_settings)
+        self.assertEqual(
+            [r['id'] for r in results],
+            [ts['id'] for ts in trials_settings]
+        )
+        self.assertEqual(results[0]['couplings'], results[2]['couplings'])
+        self.assertNotEqual(results[0]['couplings'], results[1]['couplings'])
+
+    def test_event_driven(self):
+        """
+            Computes coupling statistics that do not depend on the number of
+            steps per cycle when sampling at the gait events
+        """
+
+        def run_coupling(**kwargs) -> dict:
+            settings = configs.load('trial', dict(
+                name='UNIT-TEST Events',
+                duty_cycle=0.6,
+                activity_phases=[0, 0.3, 0.7, 0.1],
+                data=dict(
+                    count=8,
+                    offsets=[0, 0.5, 0.75, 0.25],
+                    step_size=0.35,
+                    lateral_displacement=0.1,
+                    uncertainty=0.02
+                )
+            ), **kwargs)
+            simulate_trial.apply_defaults(settings)
+            simulate_trial.load_activity_phases(settings)
+
+            random.seed(0)
+            trackway_definition = stages.create_trackway(settings)
+            simulation = stages.create_simulation(
+                settings,
+                trackway_definition
+            )
+            return coupling.calculate(
+                simulation['foot_positions'],
+                simulation['times']
+            )
+
+        expected = run_coupling(steps_per_cycle=20)['value']
+
+        for steps_per_cycle in [7, 20]:
+            result = run_coupling(
+                steps_per_cycle=steps_per_cycle,
+                sampling='events'
+            )
+            self.assertEqual(result['value'].raw, expected.raw)
+            self.assertEqual(
+                result['value'].raw_uncertainty,
+                expected.raw_uncertainty
+            )
+
 ################################################################################
 ################################################################################
 
@@ -0,0 +1,134 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from tracksim import configs
+from tracksim import mixture
+from tracksim import paths
+from tracksim.trial import simulate
+from tracksim.trial import stages
+from tracksim.trial.analyze import geometry
+
+
+def create_settings() -> dict:
+    settings = configs.load('trial', dict(
+        name='UNIT-TEST Stages',
+        duty_cycle=0.6,
+        steps_per_cycle=10,
+        activity_phases=[0, 0.5, 0.5, 0],
+        data=dict(
+            count=6,
+            offsets=[0, 0.5, 0.75, 0.25],
+            step_size=0.35,
+            lateral_displacement=0.1
+        )
+    ))
+    simulate.apply_defaults(settings)
+    simulate.load_activity_phases(settings)
+    return settings
+
+
+class test_stages(unittest.TestCase):
+
+    def setUp(self):
+        self.results_path = tempfile.mkdtemp()
+        paths.override('results', self.results_path)
+
+    def tearDown(self):
+        paths.override('results', None)
+        shutil.rmtree(self.results_path)
+
+    def test_dependents(self):
+        """
+            Finds every stage downstream of the specified stages
+        """
+
+        self.assertEqual(
+            stages.get_dependents(['coupling']),
+            {'coupling', 'report'}
+        )
+        self.assertEqual(
+            stages.get_dependents(['trackway']),
+            set(stages.NAMES)
+        )
+
+    def test_run(self):
+        """
+            Reuses stored stage outputs unless they are rerun
+        """
+
+        settings = create_settings()
+        first = stages.run(settings, settings_key='key')
+
+        stored = [
+            name
+            for name in stages.NAMES
+            if os.path.exists(stages.directory(
+                settings['id'],
+                '{}.pickle'.format(name)
+            ))
+        ]
+        self.assertEqual(stored, stages.NAMES[:-1])
+
+        second = stages.run(settings, settings_key='key', rerun=['tangent'])
+        self.assertEqual(
+            first['coupling']['value'].raw,
+            second['coupling']['value'].raw
+        )
+        self.assertEqual(first['report'], second['report'])
+
+        with self.assertRaises(ValueError):
+            stages.run(settings, settings_key='key', rerun=['unknown'])
+
+    def test_sources(self):
+        """
+            Reruns the stages that import a helper module when it changes
+        """
+
+        self.assertIn(mixture.__file__, stages.get_sources('coupling'))
+        self.assertIn(geometry.__file__, stages.get_sources('tangent'))
+        self.assertNotIn(mixture.__file__, stages.get_sources('simulation'))
+
+        settings = create_settings()
+        stages.run(settings, settings_key='key')
+
+        fingerprint_source = stages.fingerprint_source
+
+        def changed_fingerprint(path: str) -> str:
+            if path == mixture.__file__:
+                return 'changed'
+            return fingerprint_source(path)
+
+        def run_stages() -> list:
+            with mock.patch.object(
+                stages,
+                'save_output',
+                wraps=stages.save_output
+            ) as save_output:
+                stages.run(settings, settings_key='key')
+            return [c[0][1].name for c in save_output.call_args_list]
+
+        self.assertEqual(run_stages(), [])
+
+        with mock.patch.object(
+            stages,
+            'fingerprint_source',
+            changed_fingerprint
+        ):
+            rerun = run_stages()
+
+        self.assertIn('coupling', rerun)
+        self.assertNotIn('trackway', rerun)
+        self.assertNotIn('simulation', rerun)
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_stages)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
@@ -0,0 +1,123 @@
+import random
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from tracksim import configs
+from tracksim import generate
+from tracksim import paths
+from tracksim import reader
+from tracksim.trial import simulate
+from tracksim.trial import stages
+from tracksim.trial import streaming
+from tracksim.trial.analyze import advancement
+
+
+def create_settings(**kwargs) -> dict:
+    settings = configs.load('trial', dict(
+        name='UNIT-TEST Streaming',
+        duty_cycle=0.6,
+        steps_per_cycle=10,
+        activity_phases=[0, 0.3, 0.7, 0.1],
+        start_time=2.3,
+        end_time=8.1,
+        data=dict(
+            count=12,
+            offsets=[0, 0.5, 0.75, 0.25],
+            step_size=0.35,
+            lateral_displacement=0.1,
+            uncertainty=0.02
+        )
+    ), **kwargs)
+    simulate.apply_defaults(settings)
+    simulate.load_activity_phases(settings)
+    return settings
+
+
+class test_streaming(unittest.TestCase):
+
+    def setUp(self):
+        self.results_path = tempfile.mkdtemp()
+        paths.override('results', self.results_path)
+
+    def tearDown(self):
+        paths.override('results', None)
+        shutil.rmtree(self.results_path)
+
+    def test_time_step_windows(self):
+        """
+            Generates the same time steps as the full array in windows
+        """
+
+        expected = generate.time_steps(17, -1.0, 200)
+        windows = list(generate.time_step_windows(17, -1.0, 200, 1000))
+
+        self.assertEqual(
+            [offset for offset, _ in windows],
+            [0, 1000, 2000, 3000]
+        )
+        self.assertTrue(np.array_equal(
+            np.concatenate([steps for _, steps in windows]),
+            expected
+        ))
+
+    def test_run(self):
+        """
+            Produces the same results as the staged trial pipeline
+        """
+
+        settings = create_settings()
+        random.seed(0)
+        outputs = stages.run(settings)
+        coupling_data = outputs['coupling']
+        separation_data = outputs['separation']
+
+        for window_size in [3, 1000]:
+            settings = create_settings(stream_window=window_size)
+            random.seed(0)
+            result = streaming.run(settings, stages.create_trackway(settings))
+
+            self.assertEqual(
+                result['couplings']['value'],
+                coupling_data['value'].serialize()
+            )
+
+            chunks = list(streaming.read_chunks(settings['id']))
+            self.assertTrue(np.array_equal(
+                np.concatenate([c['cycles'] for c in chunks]),
+                outputs['simulation']['time_steps']
+            ))
+            self.assertTrue(np.array_equal(
+                np.concatenate([c['rear_lengths.value'] for c in chunks]),
+                [v.raw for v in separation_data['rear_lengths']]
+            ))
+            self.assertTrue(np.array_equal(
+                np.concatenate([c['rear_advance.index'] for c in chunks]),
+                [e.index for e in coupling_data['rear_advance']]
+            ))
+
+            data = reader.read_fields(
+                paths.results(
+                    'reports',
+                    'trial',
+                    settings['id'],
+                    '{}.json'.format(settings['id'])
+                ),
+                ['advancement']
+            )
+            self.assertEqual(
+                data['advancement'],
+                advancement.serialize(outputs['advancement'])
+            )
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_streaming)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
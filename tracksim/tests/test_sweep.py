@@ -0,0 +1,61 @@
+import unittest
+
+import pandas as pd
+
+from tracksim.group import sweep
+
+
+class test_sweep(unittest.TestCase):
+
+    def test_combinations(self):
+        """
+            Creates one combination for every set of grid values
+        """
+
+        combinations = sweep.create_combinations(dict(grid=dict(
+            duty_cycle=[0.5, 0.6, 0.7],
+            activity_phases=[[0, 0.5, 0.5, 0], [0, 0.5, 0.25, 0.75]]
+        )))
+
+        self.assertEqual(len(combinations), 6)
+        self.assertEqual(combinations[0]['duty_cycle'], 0.5)
+        self.assertEqual(combinations[1]['activity_phases'][2], 0.25)
+
+        with self.assertRaises(KeyError):
+            sweep.create_combinations(dict(grid=dict(unknown=[1])))
+
+    def test_run(self):
+        """
+            Runs a sweep on generated trackway data
+        """
+
+        path = sweep.run(dict(
+            name='UNIT-TEST Sweep',
+            data=dict(
+                count=6,
+                offsets=[0, 0.5, 0.75, 0.25],
+                step_size=0.35,
+                lateral_displacement=0.1
+            ),
+            activity_phases=[0, 0.5, 0.5, 0],
+            grid=dict(
+                duty_cycle=[0.5, 0.7],
+                steps_per_cycle=[10, 20],
+                end_time=[3, 100]
+            )
+        ))
+
+        df = pd.read_csv(path)
+        self.assertEqual(df.shape[0], 8)
+        self.assertTrue(df['valid'].all())
+        self.assertFalse(df['coupling_length'].isnull().any())
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_sweep)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
@@ -0,0 +1,105 @@
+import unittest
+
+import measurement_stats as mstats
+
+from tracksim import limb
+from tracksim.tests.test_coupling import simulate
+from tracksim.trial.analyze import geometry
+from tracksim.trial.analyze.tangent import tangent_calculate
+
+
+def reference_tangents(positions: list) -> list:
+    """
+        Creates the tangents one position at a time by scanning forward for
+        the next distinct position, as the original implementation did
+    """
+
+    out = []
+
+    for i, p in enumerate(positions):
+        next_pos = None
+        for pos in positions[(i + 1):]:
+            identical = (
+                mstats.value.equivalent(pos.x.raw, p.x.raw, 0.1) and
+                mstats.value.equivalent(pos.y.raw, p.y.raw, 0.1)
+            )
+            if not identical:
+                next_pos = pos
+                break
+
+        if not next_pos or i >= (len(positions) - 1):
+            out.append(out[-1])
+            continue
+
+        tan = geometry.LineSegment2D(p, next_pos)
+        tan.post_extend_line(4)
+        tan.pre_extend_line(4)
+        out.append(tan)
+
+    return out
+
+
+class test_tangent(unittest.TestCase):
+
+    def test_create_tangents(self):
+        """
+            Tangents match the forward scanning tangents and are shared
+        """
+
+        foot_positions, _ = simulate(6)
+        tangents = tangent_calculate.create_tangents(foot_positions)
+
+        for key in limb.KEYS:
+            positions = foot_positions.get(key)
+            result = tangents.get(key)
+            expected = reference_tangents(list(positions))
+
+            self.assertEqual(len(expected), len(result))
+            self.assertLess(result.distinct_count, len(result))
+            for e, r in zip(expected, result):
+                self.assertTrue(e.start.compare(r.start, raw=True))
+                self.assertTrue(e.end.compare(r.end, raw=True))
+                self.assertEqual(e.start.uid, r.start.uid)
+                self.assertEqual(e.end.annotation, r.end.annotation)
+
+    def test_support_boxes(self):
+        """
+            Batched support boxes match the scalar support boxes
+        """
+
+        foot_positions, _ = simulate(6)
+        tangents = tangent_calculate.create_tangents(foot_positions)
+        result = tangent_calculate.support_boxes(foot_positions, tangents)
+
+        left = foot_positions.left_pes
+        right = foot_positions.right_pes
+        count = len(left)
+
+        for i in range(count):
+            box = tangent_calculate.compute_support_box(
+                left_position=left[i],
+                left_tangent=tangents.left_pes[i],
+                right_position=right[i],
+                right_tangent=tangents.right_pes[i],
+                last_left_position=left[i - 1] if i > 0 else None,
+                next_left_position=left[i + 1] if i < count - 1 else None
+            )
+
+            for expected, corner in zip(box, result['rear_boxes'][i]):
+                self.assertTrue(expected.compare(corner, raw=True))
+
+            expected_range = box[0].distance_between(box[1])
+            self.assertAlmostEqual(
+                expected_range.raw,
+                result['rear_ranges'][i].raw
+            )
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_tangent)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+
+from tracksim import paths
+from tracksim.reporting import templates
+
+
+class test_templates(unittest.TestCase):
+
+    def test_from_string(self):
+        """
+            Compiles each template string once
+        """
+
+        source = '<b>{{ text }}</b>'
+        template = templates.from_string(source)
+
+        self.assertIs(templates.from_string(source), template)
+        self.assertEqual(template.render(text='a'), '<b>a</b>')
+
+    def test_from_file(self):
+        """
+            Compiles template files again only when they change
+        """
+
+        path = paths.resource('trial', 'header.html')
+        self.assertIs(
+            templates.from_file(path),
+            templates.get('trial/header.html')
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'test.html')
+            with open(path, 'w') as f:
+                f.write('<i>{{ text }}</i>')
+
+            template = templates.from_file(path)
+            self.assertIs(templates.from_file(path), template)
+
+            with open(path, 'w') as f:
+                f.write('<em>{{ text }}</em>')
+
+            self.assertEqual(
+                templates.from_file(path).render(text='a'),
+                '<em>a</em>'
+            )
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_templates)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
@@ -1,5 +1,12 @@
+import math
+import os
+import shutil
+import tempfile
 import unittest
 
+import measurement_stats as mstats
+
+from tracksim import limb
 from tracksim import paths
 from tracksim import trackway
 
@@ -36,6 +43,93 @@ class test_trackway(unittest.TestCase):
         self.assertEqual(len(positions.left_pes), 4)
         self.assertEqual(len(positions.right_pes), 5)
 
+    def test_position_array(self):
+        """
+        """
+
+        path = paths.project('test_resources', 'test_data.csv')
+        positions = trackway.load_positions_file(path).left_pes
+        positions[2].annotation = 'F'
+        source = positions + [None]
+
+        array = trackway.TrackPositionArray.from_positions(source)
+        self.assertEqual(len(array), len(source))
+        self.assertIsNone(array[-1])
+        self.assertEqual(array.valid.sum(), len(positions))
+
+        for expected, view in zip(positions, array):
+            self.assertTrue(expected.compare(view, raw=True))
+            self.assertEqual(expected.uid, view.uid)
+            self.assertEqual(expected.name, view.name)
+            self.assertEqual(expected.annotation, view.annotation)
+
+        view = array[0]
+        view.x = mstats.ValueUncertainty(1.5, 0.25)
+        self.assertEqual(array.x[0], 1.5)
+        self.assertEqual(array.x_uncertainty[0], 0.25)
+
+        sliced = array[1:4]
+        self.assertEqual(len(sliced), 3)
+        sliced[0].y = mstats.ValueUncertainty(2.5, 0.5)
+        self.assertEqual(array.y[1], 2.5)
+
+        del array[0:2]
+        self.assertEqual(len(array), len(source) - 2)
+        self.assertEqual(array[0].uid, positions[2].uid)
+
+    def test_position_array_rotate(self):
+        """
+        """
+
+        path = paths.project('test_resources', 'test_data.csv')
+        positions = trackway.load_positions_file(path).right_pes
+        array = trackway.TrackPositionArray.from_positions(positions)
+
+        pivot = trackway.TrackPosition.from_raw_values(1.0, 2.0, 0.1, 0.1)
+        offset = trackway.TrackPosition.from_raw_values(3.0, -1.0, 0.01, 0.02)
+        angle = 0.25 * math.pi
+
+        array.subtract(offset.x, offset.y)
+        array.rotate(angle, pivot)
+
+        for pos, view in zip(positions, array):
+            pos.x -= offset.x
+            pos.y -= offset.y
+            pos.rotate(angle, pivot)
+            self.assertTrue(pos.compare(view, raw=True))
+
+    def test_trackways_file(self):
+        """
+        """
+
+        path = paths.project('test_resources', 'test_data.csv')
+        positions = trackway.load_positions_file(path)
+        pes_only = trackway.load_positions_file(
+            paths.project('test_resources', 'pes_only_test_data.csv')
+        )
+
+        directory = tempfile.mkdtemp()
+        try:
+            saved_path = os.path.join(directory, 'trackways.csv')
+            trackway.save_trackways_file(
+                dict(full=positions, pes=pes_only),
+                saved_path
+            )
+            loaded = trackway.load_trackways_file(saved_path)
+            selected = trackway.load_positions_file(saved_path, 'pes')
+        finally:
+            shutil.rmtree(directory)
+
+        self.assertEqual(list(loaded.keys()), ['full', 'pes'])
+        for key in limb.KEYS:
+            self.assertEqual(
+                [p.uid for p in positions.get(key)],
+                [p.uid for p in loaded['full'].get(key)]
+            )
+            for expected, result in zip(pes_only.get(key), selected.get(key)):
+                self.assertTrue(expected.compare(result))
+                self.assertEqual(expected.name, result.name)
+
 ################################################################################
 ################################################################################
 
@@ -0,0 +1,109 @@
+import multiprocessing
+import unittest
+from concurrent import futures
+
+from tracksim import configs
+from tracksim import limb
+from tracksim import paths
+from tracksim.trial import stages
+from tracksim.trial import trackways
+
+
+def load_settings() -> dict:
+    return configs.load('trial', paths.project(
+        'test_resources',
+        'unit_test_trial_trot_data.json'
+    ))
+
+
+def to_raw_values(definition) -> list:
+    return [
+        [
+            (p.x.raw, p.y.raw, p.x.raw_uncertainty, p.y.raw_uncertainty)
+            for p in definition.limb_positions.get(key)
+        ]
+        for key in limb.KEYS
+    ]
+
+
+def create_shared_trackway() -> tuple:
+    settings = load_settings()
+    return (
+        trackways.find(settings) is not None,
+        to_raw_values(stages.create_trackway(settings))
+    )
+
+
+class test_trackways(unittest.TestCase):
+
+    def test_share(self):
+        """
+            Trials within the context use the shared reoriented positions
+        """
+
+        settings = load_settings()
+        expected = stages.create_trackway(settings)
+
+        with trackways.share([settings, load_settings()]) as shared:
+            self.assertEqual(shared, [])
+            self.assertIsNotNone(trackways.find(settings))
+
+            first = stages.create_trackway(settings)
+            second = stages.create_trackway(settings)
+            first.limb_positions.left_pes[0].x.raw = 100
+
+        self.assertIsNone(trackways.find(settings))
+        self.assertEqual(to_raw_values(expected), to_raw_values(second))
+        self.assertNotEqual(to_raw_values(first), to_raw_values(second))
+
+    def test_shared_memory(self):
+        """
+            Worker processes attach to the positions in shared memory
+        """
+
+        settings = load_settings()
+        expected = to_raw_values(stages.create_trackway(settings))
+
+        with trackways.share([settings], True) as shared:
+            self.assertEqual(len(shared), 1)
+
+            with futures.ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=trackways.attach,
+                initargs=(shared,)
+            ) as executor:
+                found, result = executor.submit(
+                    create_shared_trackway
+                ).result()
+
+        self.assertTrue(found)
+        self.assertEqual(expected, result)
+
+    def test_detach(self):
+        """
+            Detaching closes the attached blocks and removes their positions
+        """
+
+        settings = load_settings()
+
+        with trackways.share([settings], True) as shared:
+            trackways.attach(shared)
+            blocks = list(trackways._blocks.values())
+            self.assertEqual(len(blocks), 1)
+            self.assertIsNotNone(trackways.find(settings))
+
+            trackways.detach()
+            self.assertEqual(trackways._blocks, dict())
+            self.assertIsNone(trackways.find(settings))
+            self.assertIsNone(blocks[0].buf)
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_trackways)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
@@ -0,0 +1,135 @@
+import unittest
+
+import measurement_stats as mstats
+import numpy as np
+
+from tracksim import trackway
+from tracksim import uncertain
+
+
+class test_uncertain(unittest.TestCase):
+
+    def assertSameValue(self, expected, result):
+        self.assertAlmostEqual(expected.raw, result.raw, places=9)
+        self.assertAlmostEqual(
+            expected.raw_uncertainty,
+            result.raw_uncertainty,
+            places=9
+        )
+
+    def test_rounding(self):
+        """
+            Array rounding matches ValueUncertainty value and uncertainty
+        """
+
+        rng = np.random.RandomState(4)
+        values = rng.uniform(-100, 100, 2000)
+        uncertainties = 10 ** rng.uniform(-8, 3, 2000)
+
+        rounded = uncertain.round_values(values, uncertainties)
+        rounded_unc = uncertain.round_uncertainties(uncertainties)
+
+        for i in range(len(values)):
+            v = mstats.ValueUncertainty(values[i], uncertainties[i])
+            self.assertEqual(v.value, rounded[i])
+            self.assertEqual(v.uncertainty, rounded_unc[i])
+
+    def test_distances(self):
+        """
+            Array distances match TrackPosition.distance_between
+        """
+
+        a = [
+            trackway.TrackPosition.from_raw_values(0, 0, 0.02, 0.02),
+            trackway.TrackPosition.from_raw_values(1, 0, 0.02, 0.02),
+            trackway.TrackPosition.from_raw_values(1, 2, 0.02, 0.02),
+            trackway.TrackPosition.from_raw_values(0.3, 2, 0.05, 0.01)
+        ]
+        b = [
+            trackway.TrackPosition.from_raw_values(0, 1, 0.01, 0.02),
+            trackway.TrackPosition.from_raw_values(3, 0.001, 0.02, 0.01),
+            trackway.TrackPosition.from_raw_values(1.5, 2.5, 0.03, 0.02),
+            trackway.TrackPosition.from_raw_values(0.3, 2, 0.05, 0.01)
+        ]
+
+        values, uncertainties = uncertain.distances(
+            uncertain.to_columns(a),
+            uncertain.to_columns(b)
+        )
+
+        for i in range(len(a)):
+            self.assertSameValue(
+                a[i].distance_between(b[i]),
+                mstats.ValueUncertainty(values[i], uncertainties[i])
+            )
+
+    def test_array_arithmetic(self):
+        """
+            UncertainArray arithmetic matches ValueUncertainty arithmetic
+        """
+
+        rng = np.random.RandomState(2)
+        a_values = rng.uniform(-3, 3, 50)
+        a_values[::7] = 0
+        b_values = rng.uniform(0.5, 3, 50)
+        a = uncertain.UncertainArray(a_values, rng.uniform(0, 0.1, 50))
+        b = uncertain.UncertainArray(b_values, rng.uniform(0, 0.1, 50))
+        scalar = mstats.ValueUncertainty(1.5, 0.02)
+
+        operations = [
+            lambda x, y: x + y,
+            lambda x, y: x - y,
+            lambda x, y: x * y,
+            lambda x, y: x / y,
+            lambda x, y: abs(x - scalar) ** 0.5,
+            lambda x, y: 2.0 - x * 3.0 / y,
+            lambda x, y: x * scalar + y ** 2
+        ]
+
+        for operation in operations:
+            result = operation(a, b)
+            for i, (x, y) in enumerate(zip(a, b)):
+                self.assertSameValue(operation(x, y), result[i])
+
+        for i, (x, y) in enumerate(zip(a, b)):
+            self.assertSameValue(
+                mstats.value.minimum(x, y),
+                uncertain.minimum(a, b)[i]
+            )
+            self.assertSameValue(
+                mstats.value.maximum(x, y),
+                uncertain.maximum(a, b)[i]
+            )
+
+    def test_array_extremes(self):
+        """
+            UncertainArray extremes match those of lists of ValueUncertainty
+        """
+
+        values = uncertain.UncertainArray(
+            [1.2, 0.8, 0.8, 1.2, 0.8],
+            [0.1, 0.3, 0.1, 0.1, 0.1]
+        )
+
+        self.assertSameValue(
+            mstats.values.minimum(values.to_values()),
+            values.min()
+        )
+        self.assertSameValue(
+            mstats.values.maximum(values.to_values()),
+            values.max()
+        )
+        self.assertSameValue(
+            values[0].clone() + values[1] + values[2] + values[3] + values[4],
+            values.sum()
+        )
+
+################################################################################
+################################################################################
+
+if __name__ == '__main__':
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_uncertain)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+
+
@@ -276,6 +276,392 @@ class TrackPosition(object):
         )
 
 
+# Enumerated annotations stored by the annotation code column of a
+# TrackPositionArray, where the code is the index within this tuple
+ANNOTATIONS = (None, 'M', 'F')
+
+
+def reserve_uids(count: int) -> np.ndarray:
+    """
+    Reserves the specified number of auto-incremented TrackPosition uids and
+    returns them as an array. This is used when creating positions in bulk so
+    that their uids never collide with those of TrackPosition instances.
+
+    :param count:
+        The number of uids to reserve
+    """
+
+    start = TrackPosition._instance_index + 1
+    TrackPosition._instance_index += count
+    return np.arange(start, start + count).astype(object)
+
+
+class TrackPositionArray(object):
+    """
+    A compact columnar container of track positions that stores the values,
+    uncertainties and metadata of each position in Numpy arrays instead of
+    one TrackPosition instance per position. It supports the read interface
+    of a list of TrackPosition instances, where indexing returns a lazily
+    evaluated TrackPositionView for the position or None if the position is
+    invalid, which is indicated by a NaN x value.
+    """
+
+    __slots__ = (
+        'x', 'y', 'x_uncertainty', 'y_uncertainty',
+        'annotation_code', 'uid', 'name', 'assumed'
+    )
+
+    def __init__(
+            self,
+            x: np.ndarray,
+            y: np.ndarray,
+            x_uncertainty: np.ndarray,
+            y_uncertainty: np.ndarray,
+            annotation_code: np.ndarray = None,
+            uid: np.ndarray = None,
+            name: np.ndarray = None,
+            assumed: np.ndarray = None
+    ):
+        """
+        Initializes the TrackPositionArray with the columns specified in the
+        arguments. Any missing metadata columns are created with default
+        values, and auto-incremented uids are reserved for every position if
+        no uid column is specified.
+        """
+
+        count = len(x)
+
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.x_uncertainty = np.asarray(x_uncertainty, dtype=float)
+        self.y_uncertainty = np.asarray(y_uncertainty, dtype=float)
+
+        self.annotation_code = (
+            np.zeros(count, dtype=np.int8)
+            if annotation_code is None else
+            np.asarray(annotation_code, dtype=np.int8)
+        )
+
+        self.uid = (
+            reserve_uids(count)
+            if uid is None else
+            np.asarray(uid, dtype=object)
+        )
+
+        self.name = (
+            np.full(count, None, dtype=object)
+            if name is None else
+            np.asarray(name, dtype=object)
+        )
+
+        self.assumed = (
+            np.zeros(count, dtype=bool)
+            if assumed is None else
+            np.asarray(assumed, dtype=bool)
+        )
+
+    @classmethod
+    def from_positions(
+            cls,
+            positions: typing.List[typing.Union[TrackPosition, None]]
+    ) -> 'TrackPositionArray':
+        """
+        Creates a TrackPositionArray from a list of TrackPosition instances,
+        where None entries become invalid positions
+
+        :param positions:
+            The list of positions to store in the array
+        """
+
+        count = len(positions)
+        nan = float('nan')
+
+        def column(getter, default):
+            return [default if p is None else getter(p) for p in positions]
+
+        annotation_codes = column(
+            lambda p: ANNOTATIONS.index(p.annotation)
+            if p.annotation in ANNOTATIONS else 0,
+            0
+        )
+
+        uid = np.empty(count, dtype=object)
+        uid[:] = column(lambda p: p.uid, None)
+
+        name = np.empty(count, dtype=object)
+        name[:] = column(lambda p: p.name, None)
+
+        return cls(
+            x=column(lambda p: p.x.raw, nan),
+            y=column(lambda p: p.y.raw, nan),
+            x_uncertainty=column(lambda p: p.x.raw_uncertainty, nan),
+            y_uncertainty=column(lambda p: p.y.raw_uncertainty, nan),
+            annotation_code=annotation_codes,
+            uid=uid,
+            name=name,
+            assumed=column(lambda p: bool(p.assumed), False)
+        )
+
+    @classmethod
+    def where(
+            cls,
+            mask: np.ndarray,
+            a: 'TrackPositionArray',
+            b: 'TrackPositionArray'
+    ) -> 'TrackPositionArray':
+        """
+        Creates a TrackPositionArray with the positions of a where the mask
+        is True and the positions of b elsewhere, including their metadata
+
+        :param mask:
+            Boolean mask with one entry per position
+        :param a:
+            Positions selected where the mask is True
+        :param b:
+            Positions selected where the mask is False
+        """
+
+        return cls(**dict([
+            (key, np.where(mask, getattr(a, key), getattr(b, key)))
+            for key in cls.__slots__
+        ]))
+
+    @property
+    def valid(self) -> np.ndarray:
+        """ A boolean mask that is True for each valid position """
+
+        return ~np.isnan(self.x)
+
+    @property
+    def annotations(self) -> np.ndarray:
+        """ The annotation values of each position """
+
+        return np.array(ANNOTATIONS, dtype=object)[self.annotation_code]
+
+    @property
+    def nbytes(self) -> int:
+        """ The number of bytes used by the column arrays """
+
+        return sum([getattr(self, key).nbytes for key in self.__slots__])
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __iter__(self):
+        for index in range(len(self.x)):
+            yield self[index]
+
+    def __getitem__(
+            self,
+            index: typing.Union[int, slice]
+    ) -> typing.Union['TrackPositionView', 'TrackPositionArray', None]:
+        if isinstance(index, slice):
+            return self.__class__(
+                **dict([(key, getattr(self, key)[index])
+                        for key in self.__slots__])
+            )
+
+        count = len(self.x)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('TrackPositionArray index out of range')
+
+        if math.isnan(self.x[index]):
+            return None
+
+        return TrackPositionView(self, index)
+
+    def __delitem__(self, index: typing.Union[int, slice]):
+        indexes = np.arange(len(self.x))[index]
+        for key in self.__slots__:
+            setattr(self, key, np.delete(getattr(self, key), indexes))
+
+    def take(self, indexes: np.ndarray) -> 'TrackPositionArray':
+        """
+        Returns a new TrackPositionArray containing copies of the positions at
+        the specified indexes, including their metadata
+
+        :param indexes:
+            Integer indexes of the positions to include
+        """
+
+        return self.__class__(
+            **dict([(key, getattr(self, key)[indexes])
+                    for key in self.__slots__])
+        )
+
+    def clone(self) -> 'TrackPositionArray':
+        """ Returns a copy of this TrackPositionArray """
+
+        return self.__class__(
+            **dict([(key, getattr(self, key).copy())
+                    for key in self.__slots__])
+        )
+
+    def subtract(
+            self,
+            x: mstats.value.ValueUncertainty,
+            y: mstats.value.ValueUncertainty
+    ):
+        """
+        Subtracts the specified x and y values from every position in the
+        array in place, propagating their uncertainties in the same fashion
+        as subtracting them from the x and y values of a TrackPosition
+
+        :param x:
+            The value to subtract from each x position
+        :param y:
+            The value to subtract from each y position
+        """
+
+        self.x = self.x - x.raw
+        self.y = self.y - y.raw
+        self.x_uncertainty = np.sqrt(
+            self.x_uncertainty ** 2 + x.raw_uncertainty ** 2
+        )
+        self.y_uncertainty = np.sqrt(
+            self.y_uncertainty ** 2 + y.raw_uncertainty ** 2
+        )
+
+    def rotate(self, angle: float, pivot: TrackPosition = None):
+        """
+        Rotates every position in the array in place by the specified angle
+        using the same formulation as the TrackPosition.rotate method
+
+        :param angle:
+            An angle (in radians) about which each track should be rotated
+        :param pivot:
+            The origin position about which the rotation will be applied. If
+            no value is provided, the global origin (0, 0) will be used.
+        """
+
+        if pivot is None:
+            pivot = TrackPosition(
+                mstats.value.ValueUncertainty(),
+                mstats.value.ValueUncertainty()
+            )
+
+        x = self.x - pivot.x.raw
+        y = self.y - pivot.y.raw
+
+        self.x = x*math.cos(angle) - y*math.sin(angle) + pivot.x.raw
+        self.y = y*math.cos(angle) + x*math.sin(angle) + pivot.y.raw
+
+        self.x_uncertainty = np.sqrt(
+            self.x_uncertainty * self.x_uncertainty +
+            pivot.x.raw_uncertainty * pivot.x.raw_uncertainty
+        )
+        self.y_uncertainty = np.sqrt(
+            self.y_uncertainty * self.y_uncertainty +
+            pivot.y.raw_uncertainty * pivot.y.raw_uncertainty
+        )
+
+    def to_positions(self) -> typing.List[typing.Union[TrackPosition, None]]:
+        """
+        Returns a list of detached TrackPosition instances for each position
+        in the array, with None for invalid positions
+        """
+
+        return [None if p is None else p.clone() for p in self]
+
+    def to_dicts(self) -> typing.List[typing.Union[dict, None]]:
+        """
+        Returns a list of JSON serializable dictionary representations of
+        each position in the array
+        """
+
+        return [None if p is None else p.to_dict() for p in self]
+
+
+class TrackPositionView(TrackPosition):
+    """
+    A lazily evaluated TrackPosition for a single element of a
+    TrackPositionArray. The x and y ValueUncertainty values are created from
+    the array columns when accessed and assigning values writes them back into
+    the array. Because of this, in-place modifications of the x and y
+    ValueUncertainty instances themselves are not stored and values should be
+    reassigned instead.
+    """
+
+    __slots__ = ('_source', '_index')
+
+    def __init__(self, source: TrackPositionArray, index: int):
+        self._source = source
+        self._index = index
+
+    @property
+    def x(self) -> mstats.value.ValueUncertainty:
+        return mstats.value.ValueUncertainty(
+            self._source.x[self._index],
+            self._source.x_uncertainty[self._index]
+        )
+
+    @x.setter
+    def x(self, value: mstats.value.ValueUncertainty):
+        self._source.x[self._index] = value.raw
+        self._source.x_uncertainty[self._index] = abs(value.raw_uncertainty)
+
+    @property
+    def y(self) -> mstats.value.ValueUncertainty:
+        return mstats.value.ValueUncertainty(
+            self._source.y[self._index],
+            self._source.y_uncertainty[self._index]
+        )
+
+    @y.setter
+    def y(self, value: mstats.value.ValueUncertainty):
+        self._source.y[self._index] = value.raw
+        self._source.y_uncertainty[self._index] = abs(value.raw_uncertainty)
+
+    @property
+    def annotation(self) -> typing.Union[str, None]:
+        return ANNOTATIONS[self._source.annotation_code[self._index]]
+
+    @annotation.setter
+    def annotation(self, value: typing.Union[str, None]):
+        self._source.annotation_code[self._index] = ANNOTATIONS.index(value)
+
+    @property
+    def uid(self):
+        return self._source.uid[self._index]
+
+    @uid.setter
+    def uid(self, value):
+        self._source.uid[self._index] = value
+
+    @property
+    def name(self) -> typing.Union[str, None]:
+        return self._source.name[self._index]
+
+    @name.setter
+    def name(self, value: typing.Union[str, None]):
+        self._source.name[self._index] = value
+
+    @property
+    def assumed(self) -> bool:
+        return bool(self._source.assumed[self._index])
+
+    @assumed.setter
+    def assumed(self, value: bool):
+        self._source.assumed[self._index] = bool(value)
+
+    def rotate(
+            self,
+            angle: float,
+            pivot: mstats.value.ValueUncertainty = None
+    ):
+        """
+        Rotates the position value in the source array by the specified angle
+        in the same fashion as TrackPosition.rotate
+        """
+
+        position = self.clone()
+        position.rotate(angle, pivot)
+        self.x = position.x
+        self.y = position.y
+
+
 class TrackwayDefinition(object):
     """
     A data management class that contains the limb phases and positions for the
@@ -307,10 +693,14 @@ class TrackwayDefinition(object):
 
         return TrackwayDefinition(limb_positions, activity_phases)
 
-    def reorient_positions(self, *args):
+    def get_orientation(
+            self
+    ) -> typing.Tuple[TrackPosition, float, TrackPosition]:
         """
-        Reorient the trackway positions so that they begin at the origin and
-        travel toward the +x axis. Returns this instance for method chaining
+        Returns the offset, angle and pivot of the transformation applied by
+        the reorient_positions method, where positions are reoriented by
+        subtracting the offset and then rotating them by the negative of the
+        angle about the pivot
         """
 
         min_x = 1e12
@@ -338,24 +728,178 @@ class TrackwayDefinition(object):
             y=mstats.value.ValueUncertainty(0, 0.0001)
         )
 
-        orientation_angle = sum(angles)/len(angles)
+        return offset, sum(angles)/len(angles), pivot
+
+    def reorient_positions(self, *args):
+        """
+        Reorient the trackway positions so that they begin at the origin and
+        travel toward the +x axis. Returns this instance for method chaining
+        """
+
+        orientation = self.get_orientation()
 
         for key in limb.KEYS:
-            positions = self.limb_positions.get(key)
-            for pos in positions:
-                pos.x -= offset.x
-                pos.y -= offset.y
-                pos.rotate(angle=-orientation_angle, pivot=pivot)
+            apply_orientation(orientation, *self.limb_positions.get(key))
 
-        for pos in args:
-            pos.x -= offset.x
-            pos.y -= offset.y
-            pos.rotate(angle=-orientation_angle, pivot=pivot)
+        apply_orientation(orientation, *args)
 
         return self
 
 
-def load_positions_file(path: str) -> limb.Property:
+def apply_orientation(
+        orientation: typing.Tuple[TrackPosition, float, TrackPosition],
+        *args: typing.Union[TrackPosition, TrackPositionArray]
+):
+    """
+    Applies the orientation returned by TrackwayDefinition.get_orientation
+    to each of the positions or position arrays in place
+
+    :param orientation:
+        The offset, angle and pivot of the orientation
+    :param args:
+        TrackPosition or TrackPositionArray instances to reorient
+    """
+
+    offset, orientation_angle, pivot = orientation
+
+    for pos in args:
+        if isinstance(pos, TrackPositionArray):
+            pos.subtract(offset.x, offset.y)
+            pos.rotate(angle=-orientation_angle, pivot=pivot)
+            continue
+
+        pos.x -= offset.x
+        pos.y -= offset.y
+        pos.rotate(angle=-orientation_angle, pivot=pivot)
+
+
+def clone_positions(limb_positions: limb.Property) -> limb.Property:
+    """
+    Returns a limb Property containing copies of the lists of track positions
+    for each limb, where each track position has been cloned as well so that
+    the result can be modified without changing the source positions
+
+    :param limb_positions:
+        The track positions for each limb to be copied
+    """
+
+    out = limb.Property()
+    for key, positions in limb_positions.items():
+        out.set(key, [p.clone() for p in positions])
+    return out
+
+
+# The column that identifies the trackway of each row within a CSV file that
+# contains the positions of more than one trackway
+TRACKWAY_ID_COLUMN = 'trackway'
+
+# The value, uncertainty and metadata column suffixes for each limb in a
+# positions CSV file, in the order they are written
+POSITION_COLUMNS = ['x', 'dx', 'y', 'dy', 'name', 'uid', 'assumed']
+
+
+def to_assumed_flags(column: pd.Series) -> np.ndarray:
+    """
+    Converts an assumed column of a positions CSV file into boolean flags,
+    where non-empty strings and non-zero numbers are True
+
+    :param column:
+        The assumed column as loaded from the CSV file
+    """
+
+    if pd.api.types.is_numeric_dtype(column):
+        numbers = column.to_numpy(dtype=float)
+        return ~np.isnan(numbers) & (numbers != 0)
+
+    is_string = column.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+    strings = column.where(is_string, '').astype(str).str.strip()
+    numbers = pd.to_numeric(column.where(~is_string), errors='coerce')
+
+    return np.where(
+        is_string,
+        strings.str.len().to_numpy() > 0,
+        numbers.notna().to_numpy() & (numbers.to_numpy() != 0)
+    )
+
+
+def load_positions_frame(df: pd.DataFrame) -> limb.Property:
+    """
+    Creates a limb positions property object from a data frame with the
+    columns of a positions CSV file. Rows with missing or zero uncertainties
+    for a limb are not valid positions for that limb, and limbs with missing
+    value columns have no positions.
+
+    :param df:
+        The data frame with the positions
+    """
+
+    columns = dict()
+    valid = np.zeros((len(df), len(limb.SHORT_KEYS)), dtype=bool)
+
+    for i, prefix in enumerate(limb.SHORT_KEYS):
+        keys = ['{}_{}'.format(prefix, k) for k in POSITION_COLUMNS[:4]]
+        if any([key not in df.columns for key in keys]):
+            continue
+
+        x, dx, y, dy = [df[key].to_numpy(dtype=float) for key in keys]
+        valid[:, i] = (dx != 0) & ~np.isnan(dx) & (dy != 0) & ~np.isnan(dy)
+        columns[prefix] = (x, dx, y, dy)
+
+    # Reserves the auto-incremented uids in row order so that the positions
+    # are numbered as if they were created row by row
+    uids = reserve_uids(int(valid.sum()))
+    uid_indexes = np.cumsum(valid.reshape(-1)).reshape(valid.shape) - 1
+
+    trackway_positions = limb.Property().assign([], [], [], [])
+
+    for i, prefix in enumerate(limb.SHORT_KEYS):
+        if prefix not in columns:
+            continue
+
+        rows = np.flatnonzero(valid[:, i])
+        x, dx, y, dy = [c[rows].tolist() for c in columns[prefix]]
+
+        def metadata(suffix: str) -> typing.Union[list, None]:
+            key = '{}_{}'.format(prefix, suffix)
+            if key not in df.columns:
+                return None
+            if suffix == 'assumed':
+                return to_assumed_flags(df[key])[rows].tolist()
+            return df[key].iloc[rows].tolist()
+
+        names = metadata('name')
+        assigned_uids = metadata('uid')
+        assumed = metadata('assumed')
+
+        positions = trackway_positions.get(limb.LIMB_KEY_LOOKUP[prefix])
+        for j in range(len(rows)):
+            position = TrackPosition.from_raw_values(
+                x=x[j],
+                x_uncertainty=dx[j],
+                y=y[j],
+                y_uncertainty=dy[j],
+                uid=uids[uid_indexes[rows[j], i]]
+            )
+            if names is not None:
+                position.name = names[j]
+            if assigned_uids is not None:
+                position.uid = assigned_uids[j]
+            if assumed is not None:
+                position.assumed = assumed[j]
+            positions.append(position)
+
+    if not trackway_positions.left_manus:
+        for pos in trackway_positions.left_pes:
+            trackway_positions.left_manus.append(pos.clone())
+
+    if not trackway_positions.right_manus:
+        for pos in trackway_positions.right_pes:
+            trackway_positions.right_manus.append(pos.clone())
+
+    return trackway_positions
+
+
+def load_positions_file(path: str, trackway_id=None) -> limb.Property:
     """
     Loads a limb positions property object from the specified path to a CSV
     file with columns:
@@ -367,72 +911,86 @@ def load_positions_file(path: str) -> limb.Property:
 
     :param path:
         The path to the positions file to be loaded
+    :param trackway_id:
+        The id of the trackway to load from a file that contains multiple
+        trackways identified by a trackway column. If None, every row of the
+        file is loaded as a single trackway.
     """
 
     df = pd.read_csv(path)
 
-    trackway_positions = limb.Property().assign([], [], [], [])
+    if trackway_id is not None:
+        df = df[df[TRACKWAY_ID_COLUMN] == trackway_id]
+        if not len(df):
+            raise KeyError('No trackway "{}" in file "{}"'.format(
+                trackway_id,
+                path
+            ))
 
-    def add_track(limb_data, x, dx, y, dy) -> typing.Union[None, TrackPosition]:
-        if not dx or np.isnan(dx) or not dy or np.isnan(dy):
-            # Don't add track if the uncertainty values are invalid, which is
-            # an indicator that the row is not a valid position
-            return None
+    return load_positions_frame(df)
 
-        tp = TrackPosition.from_raw_values(
-            x=x,
-            x_uncertainty=dx,
-            y=y,
-            y_uncertainty=dy
-        )
-        limb_data.append(tp)
-        return tp
-
-    for index, row in df.iterrows():
-
-        for prefix, limb_key in limb.LIMB_KEY_LOOKUP.items():
-            try:
-                track_position = add_track(
-                    limb_data=trackway_positions.get(limb_key),
-                    x=row['{}_x'.format(prefix)],
-                    dx=row['{}_dx'.format(prefix)],
-                    y=row['{}_y'.format(prefix)],
-                    dy=row['{}_dy'.format(prefix)]
-                )
-                if not track_position:
-                    continue
-
-                name_key = '{}_name'.format(prefix)
-                if name_key in df.columns:
-                    track_position.name = row[name_key]
-
-                uid_key = '{}_uid'.format(prefix)
-                if uid_key in df.columns:
-                    track_position.uid = row[uid_key]
-
-                assumed_key = '{}_assumed'.format(prefix)
-                if assumed_key in df.columns:
-                    value = row[assumed_key]
-                    if isinstance(value, str):
-                        value = value.strip()
-                        value = len(value)
-                    else:
-                        value = not np.isnan(value) and bool(value)
-                    track_position.assumed = bool(value)
-
-            except KeyError:
-                # If the key is missing in the csv file, move one
-                continue
 
-    if not trackway_positions.left_manus:
-        for pos in trackway_positions.left_pes:
-            trackway_positions.left_manus.append(pos.clone())
+def load_trackways_file(
+        path: str,
+        id_column: str = TRACKWAY_ID_COLUMN
+) -> typing.Dict[typing.Any, limb.Property]:
+    """
+    Loads the limb positions of every trackway within a CSV file that has the
+    columns of a positions file along with a column that identifies the
+    trackway of each row. The file is parsed once and split by trackway.
 
-    if not trackway_positions.right_manus:
-        for pos in trackway_positions.right_pes:
-            trackway_positions.right_manus.append(pos.clone())
+    :param path:
+        The path to the positions file to be loaded
+    :param id_column:
+        The name of the column that identifies the trackway of each row
+    :return:
+        A dictionary of limb positions property objects by trackway id in
+        the order the trackways first appear in the file
+    """
+
+    df = pd.read_csv(path)
+    return dict([
+        (trackway_id, load_positions_frame(group))
+        for trackway_id, group in df.groupby(id_column, sort=False)
+    ])
 
-    return trackway_positions
+
+def to_positions_frame(trackway_positions: limb.Property) -> pd.DataFrame:
+    """
+    Creates a data frame with the columns of a positions CSV file from a
+    limb positions property object, where the columns of each limb are
+    padded with empty values to the length of the longest limb
+
+    :param trackway_positions:
+        The trackway positions to be converted
+    """
+
+    columns = []
+
+    for prefix in limb.SHORT_KEYS:
+        positions = trackway_positions.get(limb.LIMB_KEY_LOOKUP[prefix])
+        if not positions:
+            continue
+
+        values = dict(
+            x=[p.x.value for p in positions],
+            dx=[p.x.uncertainty for p in positions],
+            y=[p.y.value for p in positions],
+            dy=[p.y.uncertainty for p in positions],
+            name=[p.name for p in positions],
+            uid=[p.uid for p in positions],
+            assumed=['x' if p.assumed else None for p in positions]
+        )
+
+        columns += [
+            (
+                '{}_{}'.format(prefix, suffix),
+                pd.Series(values[suffix], dtype=object)
+            )
+            for suffix in POSITION_COLUMNS
+        ]
+
+    return pd.DataFrame(dict(columns)).infer_objects()
 
 
 def save_positions_file(trackway_positions: limb.Property, path):
@@ -451,23 +1009,36 @@ def save_positions_file(trackway_positions: limb.Property, path):
         The path to the positions file to be saved
     """
 
-    df = []
+    df = to_positions_frame(trackway_positions)
+    df.to_csv(path)
+
+    return df
+
+
+def save_trackways_file(
+        trackways: typing.Dict[typing.Any, limb.Property],
+        path: str,
+        id_column: str = TRACKWAY_ID_COLUMN
+) -> pd.DataFrame:
+    """
+    Saves the limb positions of multiple trackways to the specified path as
+    a single CSV file that can be loaded with load_trackways_file
 
-    for prefix, limb_key in limb.LIMB_KEY_LOOKUP.items():
-        for index, position in enumerate(trackway_positions.get(limb_key)):
-            while index >= len(df):
-                df.append(dict())
+    :param trackways:
+        A dictionary of limb positions property objects by trackway id
+    :param path:
+        The path to the positions file to be saved
+    :param id_column:
+        The name of the column that identifies the trackway of each row
+    """
 
-            row = df[index]
-            row['{}_x'.format(prefix)] = position.x.value
-            row['{}_dx'.format(prefix)] = position.x.uncertainty
-            row['{}_y'.format(prefix)] = position.y.value
-            row['{}_dy'.format(prefix)] = position.y.uncertainty
-            row['{}_name'.format(prefix)] = position.name
-            row['{}_uid'.format(prefix)] = position.uid
-            row['{}_assumed'.format(prefix)] = 'x' if position.assumed else None
+    frames = []
+    for trackway_id, trackway_positions in trackways.items():
+        df = to_positions_frame(trackway_positions)
+        df.insert(0, id_column, trackway_id)
+        frames.append(df)
 
-    df = pd.DataFrame(df)
+    df = pd.concat(frames, ignore_index=True)
     df.to_csv(path)
 
     return df
@@ -1,4 +1,5 @@
 import os
+import shutil
 import typing
 from datetime import datetime
 
@@ -25,7 +26,8 @@ def create(
 ) -> dict:
     """
     Analyzed the simulated trial data and saves and saves that data as well as
-    a report for consumption
+    a report for consumption. Returns a dictionary containing the url of the
+    report and a summary of the coupling data for the trial
 
     :param settings:
         Configuration for the trial being reported
@@ -37,16 +39,81 @@ def create(
         A list of time steps (in cycles) for the simulation
     """
 
-    sim_id = settings['id']
     times = make_time_data(time_steps, settings)
     coupling_data = coupling.calculate(foot_positions, times)
     separation_data = separation.calculate(foot_positions, times)
     advancement_data = advancement.calculate(foot_positions, times)
     tangent_data = tangent.calculate(foot_positions)
 
+    return write_report(
+        settings=settings,
+        track_definition=track_definition,
+        foot_positions=foot_positions,
+        times=times,
+        coupling_data=coupling_data,
+        separation_data=separation_data,
+        advancement_data=advancement_data,
+        tangent_data=tangent_data
+    )
+
+
+def write_report(
+        settings: dict,
+        track_definition: trackway.TrackwayDefinition,
+        foot_positions: limb.Property,
+        times: dict,
+        coupling_data: dict,
+        separation_data: dict,
+        advancement_data: dict,
+        tangent_data: dict,
+        animation: dict = None
+) -> dict:
+    """
+    Writes the report and the results data file for the analyzed trial and
+    returns a dictionary containing the url of the report and a summary of
+    the coupling data for the trial. The animation frames of the report are
+    stored losslessly unless the optional "frame_decimals" setting specifies
+    the number of decimal places to which they are rounded and delta-encoded.
+
+    :param settings:
+        Configuration for the trial being reported
+    :param track_definition:
+        The trackway source that was used by the simulation
+    :param foot_positions:
+        The positions of each foot calculated during the simulation
+    :param times:
+        The time data for the simulation created by make_time_data
+    :param coupling_data:
+        The results of the coupling analysis
+    :param separation_data:
+        The results of the separation analysis
+    :param advancement_data:
+        The results of the advancement analysis
+    :param tangent_data:
+        The results of the tangent analysis
+    :param animation:
+        Optional foot_positions, times, coupling_data and tangent_data used
+        to draw and animate the trackway in place of the analyzed results,
+        which is needed when the analyzed time steps are not uniformly spaced
+    """
+
+    sim_id = settings['id']
+
+    animation = animation or dict(
+        foot_positions=foot_positions,
+        times=times,
+        coupling_data=coupling_data,
+        tangent_data=tangent_data
+    )
+
     report = reporting.Report('trial', sim_id)
     add_header_section(report, settings, track_definition.activity_phases)
-    svg_settings = add_svg(sim_id, report, track_definition, foot_positions)
+    svg_settings = add_svg(
+        sim_id,
+        report,
+        track_definition,
+        animation['foot_positions']
+    )
     add_info(report, settings, coupling_data)
     coupling.add_to_report(report, coupling_data, times)
     tangent.add_to_report(report, tangent_data, times)
@@ -56,18 +123,19 @@ def create(
 
     report.add_data(
         # Used in the header display
-        time=times,
-        cycles=make_cycle_data(foot_positions, times).to_dict(),
+        time=animation['times'],
+        cycles=make_cycle_data(
+            animation['foot_positions'],
+            animation['times']
+        ).to_dict(),
 
         # Used in animating the SVG
         scale=svg_settings['scale'],
         offset=svg_settings['offset'],
         markerIds=limb.KEYS + [],
         frames=make_animation_frame_data(
-            foot_positions,
-            times,
-            coupling_data,
-            tangent_data
+            decimals=settings.get('frame_decimals'),
+            **animation
         )
     )
 
@@ -83,7 +151,68 @@ def create(
         tangent_data=tangent_data
     )
 
-    return url
+    return dict(
+        url=url,
+        couplings=coupling.summarize(coupling_data)
+    )
+
+
+def write_results(
+        settings: dict,
+        track_definition: trackway.TrackwayDefinition,
+        foot_positions: limb.Property,
+        times: dict,
+        coupling_data: dict,
+        advancement_data: dict,
+        tangent_data: dict
+) -> dict:
+    """
+    Writes only the results data file for the analyzed trial, without
+    rendering its report, and returns a dictionary containing the path of the
+    data file as its url and a summary of the coupling data for the trial.
+    The report can be rendered later from the stored stage outputs of the
+    trial by the render module.
+
+    :param settings:
+        Configuration for the trial being written
+    :param track_definition:
+        The trackway source that was used by the simulation
+    :param foot_positions:
+        The positions of each foot calculated during the simulation
+    :param times:
+        The time data for the simulation created by make_time_data
+    :param coupling_data:
+        The results of the coupling analysis
+    :param advancement_data:
+        The results of the advancement analysis
+    :param tangent_data:
+        The results of the tangent analysis
+    """
+
+    sim_id = settings['id']
+    directory = paths.results('reports', 'trial', sim_id)
+
+    # Removes any previously rendered report, which no longer matches the
+    # results data
+    if os.path.exists(directory):
+        shutil.rmtree(directory)
+
+    path = os.path.join(directory, '{}.json'.format(sim_id))
+    write_data(
+        path=path,
+        settings=settings,
+        trackway_definition=track_definition,
+        foot_positions=foot_positions,
+        times=times,
+        coupling_data=coupling_data,
+        advancement_data=advancement_data,
+        tangent_data=tangent_data
+    )
+
+    return dict(
+        url=path,
+        couplings=coupling.summarize(coupling_data)
+    )
 
 
 def write_data(
@@ -98,7 +227,9 @@ def write_data(
 ):
     """
     Writes a JSON serialized data file containing the results of the trial for
-    later analysis
+    later analysis. If the "columnar" setting is enabled, the results are also
+    written in the columnar format alongside the JSON file so that individual
+    sections can be read without loading the entire file.
 
     :param path:
     :param settings:
@@ -119,7 +250,7 @@ def write_data(
     for limb_id, positions in trackway_definition.limb_positions.items():
         track_data[limb_id] = [x.to_dict() for x in positions]
 
-    reporting.write_json_results(path, dict(
+    data = dict(
         settings=settings,
         times=times,
         foot_positions=position_data,
@@ -127,7 +258,12 @@ def write_data(
         couplings=coupling.serialize(coupling_data),
         advancement=advancement.serialize(advancement_data),
         tangent=tangent.serialize(tangent_data)
-    ))
+    )
+
+    reporting.write_json_results(path, data)
+
+    if settings.get('columnar'):
+        reporting.write_columnar_results(path, data)
 
 
 def add_header_section(
@@ -232,19 +368,28 @@ def make_animation_frame_data(
         foot_positions: limb.Property,
         times: dict,
         coupling_data: dict,
-        tangent_data: dict
-) -> typing.List[dict]:
+        tangent_data: dict,
+        decimals: typing.Union[int, None] = None
+) -> dict:
     """
-    Creates a list of animation frame data from the results, which is used by
-    the JavaScript report to animate the feet within the trackway. Each frame
-    in the returned list contains:
+    Creates the animation frame data from the results, which is used by the
+    JavaScript report to animate the feet within the trackway. The frames are
+    stored in the compact columnar layout of the reporting.frames module,
+    where each decoded frame contains:
 
     - time: The simulation time for the frame
+    - support_time: The support cycle time for the frame
     - positions: An ordered list of position dictionaries for each limb, where
         the order is defined by the limb.KEYS order. Each dictionary contains:
-            - x: A list where x[0] is the position and x[1] is the uncertainty
-            - y: A list where y[0] is the position and y[1] is the uncertainty
+            - x: A list of the position value, uncertainty and raw value
+            - y: A list of the position value, uncertainty and raw value
             - f: The enumerated annotation for the position
+            - tx0, ty0, tx1, ty1: Lists of the raw value and uncertainty of
+                the start and end of the limb tangent
+    - rear_coupler, forward_coupler, midpoint: Dictionaries with x and y
+        lists of the value, uncertainty and raw value
+    - rear_support_box, forward_support_box: Lists of the four corners of
+        the support box, each with raw x and y values
 
     :param coupling_data:
     :param tangent_data:
@@ -252,64 +397,65 @@ def make_animation_frame_data(
         The simulation results
     :param times:
         Time step information
+    :param decimals:
+        The number of decimal places to which the numeric columns are
+        rounded and delta-encoded, which makes the report data smaller but
+        changes each decoded value by up to half of 10^-decimals. If None,
+        the default, the columns are stored losslessly as plain floats.
     """
 
-    frames = []
+    count = times['count']
+    columns = dict()
 
-    for i in range(times['count']):
-        positions = []
-        tangents = []
-        for key in limb.KEYS:
-            pos = foot_positions.get(key)[i]
-            tan = tangent_data['tangents'].get(key)[i]
-            positions.append({
-                'x': [pos.x.value, pos.x.uncertainty, pos.x.raw],
-                'y': [pos.y.value, pos.y.uncertainty, pos.y.raw],
-                'f': pos.annotation,
-                'tx0': [tan.start.x.raw, tan.start.x.uncertainty],
-                'ty0': [tan.start.y.raw, tan.start.y.uncertainty],
-                'tx1': [tan.end.x.raw, tan.end.x.uncertainty],
-                'ty1': [tan.end.y.raw, tan.end.y.uncertainty],
-            })
-
-        rear = coupling_data['rear'][i]
-        forward = coupling_data['forward'][i]
-        midpoint = coupling_data['midpoints'][i]
-
-        rear_box = tangent_data['rear_boxes'][i]
-        forward_box = tangent_data['forward_boxes'][i]
-
-        frames.append(dict(
-            time=times['cycles'][i],
-            support_time=times['support_cycles'][i],
-            positions=positions,
-            rear_coupler={
-                'x': [rear.x.value, rear.x.uncertainty, rear.x.raw],
-                'y': [rear.y.value, rear.y.uncertainty, rear.y.raw]
-            },
-            forward_coupler={
-                'x': [forward.x.value, forward.x.uncertainty, forward.x.raw],
-                'y': [forward.y.value, forward.y.uncertainty, forward.y.raw]
-            },
-            midpoint={
-                'x': [midpoint.x.value, midpoint.x.uncertainty, midpoint.x.raw],
-                'y': [midpoint.y.value, midpoint.y.uncertainty, midpoint.y.raw]
-            },
-            rear_support_box=[
-                { 'x': rear_box[0].x.raw, 'y': rear_box[0].y.raw },
-                { 'x': rear_box[1].x.raw, 'y': rear_box[1].y.raw },
-                { 'x': rear_box[2].x.raw, 'y': rear_box[2].y.raw },
-                { 'x': rear_box[3].x.raw, 'y': rear_box[3].y.raw }
-            ],
-            forward_support_box=[
-                { 'x': forward_box[0].x.raw, 'y': forward_box[0].y.raw },
-                { 'x': forward_box[1].x.raw, 'y': forward_box[1].y.raw },
-                { 'x': forward_box[2].x.raw, 'y': forward_box[2].y.raw },
-                { 'x': forward_box[3].x.raw, 'y': forward_box[3].y.raw }
+    def at_frames(values) -> list:
+        return [values[i] for i in range(count)]
+
+    def add_values(prefix: str, values: list):
+        for axis in ['x', 'y']:
+            items = [getattr(v, axis) for v in values]
+            columns['{}.{}.0'.format(prefix, axis)] = [i.value for i in items]
+            columns['{}.{}.1'.format(prefix, axis)] = [
+                i.uncertainty for i in items
+            ]
+            columns['{}.{}.2'.format(prefix, axis)] = [i.raw for i in items]
+
+    columns['time'] = at_frames(times['cycles'])
+    columns['support_time'] = at_frames(times['support_cycles'])
+
+    for limb_index, key in enumerate(limb.KEYS):
+        positions = at_frames(foot_positions.get(key))
+        tangents = at_frames(tangent_data['tangents'].get(key))
+        prefix = 'positions.{}'.format(limb_index)
+
+        add_values(prefix, positions)
+        columns['{}.f'.format(prefix)] = [p.annotation for p in positions]
+
+        for name, getter in [
+            ('tx0', lambda t: t.start.x),
+            ('ty0', lambda t: t.start.y),
+            ('tx1', lambda t: t.end.x),
+            ('ty1', lambda t: t.end.y)
+        ]:
+            values = [getter(t) for t in tangents]
+            columns['{}.{}.0'.format(prefix, name)] = [
+                v.raw for v in values
             ]
-        ))
+            columns['{}.{}.1'.format(prefix, name)] = [
+                v.uncertainty for v in values
+            ]
+
+    add_values('rear_coupler', at_frames(coupling_data['rear']))
+    add_values('forward_coupler', at_frames(coupling_data['forward']))
+    add_values('midpoint', at_frames(coupling_data['midpoints']))
+
+    for name in ['rear', 'forward']:
+        boxes = at_frames(tangent_data['{}_boxes'.format(name)])
+        for corner in range(4):
+            prefix = '{}_support_box.{}'.format(name, corner)
+            columns['{}.x'.format(prefix)] = [b[corner].x.raw for b in boxes]
+            columns['{}.y'.format(prefix)] = [b[corner].y.raw for b in boxes]
 
-    return frames
+    return reporting.frames.encode(columns, decimals)
 
 
 def make_cycle_data(
@@ -353,6 +499,8 @@ def make_time_data(times: list, settings: dict) -> dict:
         - times: A list of floating point time steps in the simulation
         - progress: A list of percent progress for each time step in the
             simulation
+        - sampling: "events" when the simulation is event-driven, in which
+            case the time steps are not uniformly spaced
 
     :param times:
         Simulation time step list
@@ -362,7 +510,7 @@ def make_time_data(times: list, settings: dict) -> dict:
     dc = settings['duty_cycle']
     support_cycles = [configs.time_to_support_time(t, dc) for t in times]
 
-    return dict(
+    out = dict(
         count=len(times),
         cycles=times,
         support_cycles=support_cycles,
@@ -370,3 +518,12 @@ def make_time_data(times: list, settings: dict) -> dict:
         progress=list(mstats.ops.linear_space(0, 100.0, len(times)))
     )
 
+    if settings.get('sampling') == 'events':
+        # Event-driven time steps are irregularly spaced, so progress is
+        # measured by time instead of by time step
+        duration = max(times[-1] - times[0], 1e-12)
+        out['sampling'] = 'events'
+        out['progress'] = [100.0 * (t - times[0]) / duration for t in times]
+
+    return out
+
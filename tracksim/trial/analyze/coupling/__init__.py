@@ -1,26 +1,23 @@
 from tracksim import limb
 from tracksim.reporting import Report
-from tracksim.trial.analyze.coupling import coupling_calculate
+from tracksim.trial.analyze.coupling import coupling_arrays
 from tracksim.trial.analyze.coupling import coupling_report
 
 
 def calculate(foot_positions: limb.Property, times: dict) -> dict:
     """
+    Computes the coupling positions, lengths, statistics and advances for the
+    simulated foot positions using the array-based implementation, which
+    produces the same results as combining the positions, statistics and
+    advance functions of the coupling_calculate module
 
     :param foot_positions:
+        The foot positions for each limb at each simulated time step
     :param times:
-    :return:
+        The times data for the simulated time steps
     """
 
-    positions = coupling_calculate.positions(foot_positions, times)
-    stats = coupling_calculate.statistics(positions)
-    advances = coupling_calculate.advance(foot_positions, positions, times)
-
-    return dict(
-        **positions,
-        **stats,
-        **advances
-    )
+    return coupling_arrays.calculate(foot_positions, times)
 
 
 def add_to_report(report: Report, coupling_data: dict, times: dict):
@@ -64,3 +61,23 @@ def serialize(coupling_data: dict) -> dict:
     out['value'] = coupling_data['value'].serialize()
 
     return out
+
+
+def summarize(coupling_data: dict) -> dict:
+    """
+    Creates a lightweight, serializable summary of the coupling data that
+    contains the values needed by group analysis so that they can be passed
+    between processes without reading back the full trial results
+
+    :param coupling_data:
+        The coupling analysis data for the trial
+    """
+
+    return dict(
+        value=coupling_data['value'].serialize(),
+        distribution_profile=dict(
+            x=list(coupling_data['distribution_profile']['x']),
+            y=list(coupling_data['distribution_profile']['y'])
+        ),
+        population=list(coupling_data['population'])
+    )
@@ -0,0 +1,358 @@
+import math
+import typing
+
+import measurement_stats as mstats
+import numpy as np
+
+from tracksim import events
+from tracksim import limb
+from tracksim import mixture
+from tracksim import trackway
+from tracksim import uncertain
+
+
+def fixed_mask(
+        positions: typing.Union[trackway.TrackPositionArray, list]
+) -> np.ndarray:
+    """
+    Returns a boolean mask that is True for each position that is annotated
+    as a fixed track position
+
+    :param positions:
+        Either a TrackPositionArray or a list of TrackPosition instances
+    """
+
+    if not isinstance(positions, trackway.TrackPositionArray):
+        positions = trackway.TrackPositionArray.from_positions(positions)
+
+    code = trackway.ANNOTATIONS.index('F')
+    return positions.annotation_code == code
+
+
+def sample_indexes(times: np.ndarray) -> np.ndarray:
+    """
+    Returns the indexes of the time steps at which coupling lengths are
+    sampled, which are the whole and half cycle time steps
+
+    :param times:
+        The cycle times of each simulated time step
+    """
+
+    sample_times = 2 * np.asarray(times, dtype=float)
+    fractions = sample_times - np.trunc(sample_times)
+    return np.flatnonzero(np.abs(fractions) < uncertain.EPSILON)
+
+
+def calculate_rmsd(
+        median: float,
+        values: np.ndarray,
+        uncertainties: np.ndarray
+) -> float:
+    """
+    Calculates the root-mean-square deviation of the coupling lengths from
+    the median coupling length as a percentage of the median
+
+    :param median:
+        The median coupling length
+    :param values:
+        The raw coupling length values
+    :param uncertainties:
+        The raw coupling length uncertainties
+    """
+
+    scaled, scaled_unc = uncertain.power(
+        np.abs(values / median - 1),
+        np.abs(uncertainties / median),
+        2
+    )
+
+    total = mstats.ValueUncertainty(
+        np.sum(scaled),
+        math.sqrt(np.sum(scaled_unc ** 2))
+    )
+
+    return 100 * math.sqrt(
+        max(0, total.value - total.uncertainty) / len(values)
+    )
+
+
+def calculate_swing(
+        median: float,
+        values: np.ndarray,
+        uncertainties: np.ndarray
+) -> float:
+    """
+    Calculates the swing between the largest and smallest coupling lengths,
+    where the extremes are selected by their rounded values less or more two
+    rounded uncertainties, as a signal-to-noise ratio of the swing as a
+    percentage of the median
+
+    :param median:
+        The median coupling length
+    :param values:
+        The raw coupling length values
+    :param uncertainties:
+        The raw coupling length uncertainties
+    """
+
+    rounded = uncertain.round_values(values, uncertainties)
+    rounded_unc = uncertain.round_uncertainties(uncertainties)
+
+    def select(thresholds: np.ndarray, rounded_values: np.ndarray) -> int:
+        candidates = np.flatnonzero(thresholds == thresholds.max())
+        best = rounded_values[candidates]
+        return candidates[np.argmax(best == best.max())]
+
+    max_index = select(rounded - 2 * rounded_unc, rounded)
+    min_index = select(-(rounded + 2 * rounded_unc), -rounded)
+
+    def to_value(index: int) -> mstats.ValueUncertainty:
+        return mstats.ValueUncertainty(values[index], uncertainties[index])
+
+    s = 100 * abs(to_value(max_index) - to_value(min_index)) / median
+    return s.value / s.uncertainty
+
+
+def calculate_advance(
+        positions: typing.Tuple[np.ndarray, ...],
+        left_fixed: np.ndarray,
+        right_fixed: np.ndarray,
+        time_delta: float,
+        cycle_times: np.ndarray = None
+) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculates the rate of advance of a coupler position at each interior time
+    step where the associated pair of limbs is moving, using a central
+    difference of the coupler positions
+
+    :param positions:
+        The (x, y, x_uncertainty, y_uncertainty) coupler position columns
+    :param left_fixed:
+        Mask of the time steps where the left limb is fixed
+    :param right_fixed:
+        Mask of the time steps where the right limb is fixed
+    :param time_delta:
+        The cycle time between consecutive time steps
+    :param cycle_times:
+        The cycle times of each time step, which are used for the central
+        difference instead of the time_delta when the time steps are not
+        uniformly spaced
+    :return:
+        The indexes of the time steps where advance was calculated, the
+        advance values and their uncertainties
+    """
+
+    both_fixed = left_fixed & right_fixed
+    indexes = np.flatnonzero(~both_fixed[:-2] & ~both_fixed[2:]) + 1
+
+    if cycle_times is None:
+        c = 0.5 / time_delta
+    else:
+        c = 1.0 / (cycle_times[indexes + 1] - cycle_times[indexes - 1])
+
+    values, uncertainties = uncertain.distances(
+        tuple([column[indexes + 1] for column in positions]),
+        tuple([column[indexes - 1] for column in positions])
+    )
+
+    return indexes, c * values, np.abs(c * uncertainties)
+
+
+def to_position_array(
+        columns: typing.Tuple[np.ndarray, ...]
+) -> trackway.TrackPositionArray:
+    """ Creates a TrackPositionArray from position columns """
+
+    return trackway.TrackPositionArray(*columns)
+
+
+def to_events(
+        indexes: np.ndarray,
+        times: np.ndarray,
+        values: np.ndarray,
+        uncertainties: np.ndarray
+) -> typing.List[events.Event]:
+    """
+    Creates a list of Event instances for the time steps at the specified
+    indexes with the given values and uncertainties
+    """
+
+    return [
+        events.Event(
+            time=times[index],
+            index=int(index),
+            value=mstats.ValueUncertainty(value, uncertainty)
+        )
+        for index, value, uncertainty in zip(
+            indexes,
+            values.tolist(),
+            uncertainties.tolist()
+        )
+    ]
+
+
+def calculate_couplers(
+        foot_positions: limb.Property
+) -> typing.Tuple[typing.Tuple[np.ndarray, ...], typing.Tuple[np.ndarray, ...]]:
+    """
+    Returns the (x, y, x_uncertainty, y_uncertainty) columns of the rear and
+    forward coupler positions, which are the midpoints between the pes and
+    between the manus positions respectively
+
+    :param foot_positions:
+        The foot positions for each limb at each simulated time step
+    """
+
+    rear = uncertain.midpoints(
+        uncertain.to_columns(foot_positions.left_pes),
+        uncertain.to_columns(foot_positions.right_pes)
+    )
+    forward = uncertain.midpoints(
+        uncertain.to_columns(foot_positions.left_manus),
+        uncertain.to_columns(foot_positions.right_manus)
+    )
+    return rear, forward
+
+
+def calculate_positions(
+        foot_positions: limb.Property,
+        rear: typing.Tuple[np.ndarray, ...] = None,
+        forward: typing.Tuple[np.ndarray, ...] = None
+) -> dict:
+    """
+    Returns the rear, forward and midpoints entries of the coupling data as
+    TrackPositionArray instances
+
+    :param foot_positions:
+        The foot positions for each limb at each simulated time step
+    :param rear:
+        The rear coupler columns if they have already been calculated
+    :param forward:
+        The forward coupler columns if they have already been calculated
+    """
+
+    if rear is None or forward is None:
+        rear, forward = calculate_couplers(foot_positions)
+
+    return dict(
+        rear=to_position_array(rear),
+        forward=to_position_array(forward),
+        midpoints=to_position_array(uncertain.midpoints(rear, forward))
+    )
+
+
+def calculate_statistics(
+        lengths: typing.List[events.Event],
+        values: np.ndarray,
+        uncertainties: np.ndarray
+) -> dict:
+    """
+    Computes the coupling length statistics from the sampled coupling
+    lengths, which only requires the sampled lengths and not the positions
+    of the feet at every time step. The returned dictionary contains the
+    lengths, deviations, value, rmsd, swing, fitness, bounds,
+    distribution_profile and population entries of the coupling data.
+
+    :param lengths:
+        The sampled coupling length events
+    :param values:
+        The raw coupling length values of the events
+    :param uncertainties:
+        The raw coupling length uncertainties of the events
+    """
+
+    d = mixture.GaussianMixture.from_raw(values, uncertainties)
+    deviation_median = d.percentile(0.5)
+    deviations = [
+        mstats.ValueUncertainty(value, uncertainty)
+        for value, uncertainty in zip(
+            (values - deviation_median).tolist(),
+            uncertainties.tolist()
+        )
+    ]
+
+    bounds = d.weighted_two()
+    median = bounds[2]
+    mad = d.weighted_median_average_deviation()
+
+    min_value = d.minimum_boundary(3)
+    max_value = d.maximum_boundary(3)
+    x_values = mstats.ops.linear_space(min_value, max_value, 250)
+
+    rmsd = calculate_rmsd(median, values, uncertainties)
+    swing = calculate_swing(median, values, uncertainties)
+
+    return dict(
+        lengths=lengths,
+        deviations=deviations,
+        value=mstats.ValueUncertainty(median, mad),
+        rmsd=rmsd,
+        swing=swing,
+        fitness=math.sqrt(rmsd ** 2 + swing ** 2),
+        bounds=bounds,
+        distribution_profile={
+            'x': x_values,
+            'y': list(d.probabilities_at(x_values))
+        },
+        population=d.population(256)
+    )
+
+
+def calculate(foot_positions: limb.Property, times: dict) -> dict:
+    """
+    Computes the coupler positions, coupling lengths, statistics and coupler
+    advances in a single pass over columnar arrays of the foot positions. The
+    returned dictionary has the same structure and values as the combined
+    results of the positions, statistics and advance functions within the
+    coupling_calculate module.
+
+    :param foot_positions:
+        The foot positions for each limb at each simulated time step, either
+        as TrackPositionArray instances or lists of TrackPosition instances
+    :param times:
+        The times data for the simulated time steps
+    """
+
+    cycles = times['cycles']
+    cycle_times = np.asarray(cycles, dtype=float)
+
+    rear, forward = calculate_couplers(foot_positions)
+
+    indexes = sample_indexes(cycle_times)
+    values, uncertainties = uncertain.distances(
+        tuple([column[indexes] for column in rear]),
+        tuple([column[indexes] for column in forward])
+    )
+    lengths = to_events(indexes, cycles, values, uncertainties)
+    statistics = calculate_statistics(lengths, values, uncertainties)
+
+    # Event-driven simulations sample at irregular intervals
+    time_delta = cycles[1] - cycles[0]
+    if times.get('sampling') != 'events':
+        cycle_times = None
+
+    rear_advance = calculate_advance(
+        rear,
+        fixed_mask(foot_positions.left_pes),
+        fixed_mask(foot_positions.right_pes),
+        time_delta,
+        cycle_times
+    )
+    forward_advance = calculate_advance(
+        forward,
+        fixed_mask(foot_positions.left_manus),
+        fixed_mask(foot_positions.right_manus),
+        time_delta,
+        cycle_times
+    )
+
+    return dict(
+        **calculate_positions(foot_positions, rear, forward),
+        rear_advance=to_events(rear_advance[0], cycles, *rear_advance[1:]),
+        forward_advance=to_events(
+            forward_advance[0],
+            cycles,
+            *forward_advance[1:]
+        ),
+        **statistics
+    )
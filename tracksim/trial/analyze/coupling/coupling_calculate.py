@@ -2,10 +2,10 @@ import math
 import typing
 
 import measurement_stats as mstats
-from measurement_stats.distributions import boxes
 
 from tracksim import limb
 from tracksim import events
+from tracksim import mixture
 
 
 def positions(
@@ -59,8 +59,8 @@ def positions(
         ))
 
     lengths = [v.value for v in coupling_events]
-    d = mstats.create_distribution(lengths)
-    median = mstats.distributions.percentile(d, 0.5)
+    d = mixture.GaussianMixture.from_measurements(lengths)
+    median = d.percentile(0.5)
     median_deviations = []
 
     for cl in lengths:
@@ -85,10 +85,10 @@ def statistics(coupling_positions: typing.Dict[str, list]) -> dict:
     lengths = coupling_positions['lengths']
     lengths = [e.value for e in lengths]
 
-    d = mstats.create_distribution(lengths)
-    bounds = boxes.weighted_two(d)
+    d = mixture.GaussianMixture.from_measurements(lengths)
+    bounds = d.weighted_two()
     median = bounds[2]
-    mad = mstats.distributions.weighted_median_average_deviation(d)
+    mad = d.weighted_median_average_deviation()
 
     min_value = d.minimum_boundary(3)
     max_value = d.maximum_boundary(3)
@@ -107,9 +107,9 @@ def statistics(coupling_positions: typing.Dict[str, list]) -> dict:
         bounds=bounds,
         distribution_profile={
             'x': x_values,
-            'y': d.probabilities_at(x_values)
+            'y': list(d.probabilities_at(x_values))
         },
-        population=mstats.distributions.population(d, 256),
+        population=d.population(256),
     )
 
 
@@ -4,11 +4,15 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import math
+import typing
 
 import measurement_stats as mstats
+import numpy as np
 from measurement_stats.angle import Angle
 
+from tracksim import uncertain
 from tracksim.trackway import TrackPosition
+from tracksim.trackway import TrackPositionArray
 
 
 class LineSegment2D(object):
@@ -455,3 +459,409 @@ class LineSegment2D(object):
             startX + lengthAdjust * math.cos(angle),
             startY + lengthAdjust * math.sin(angle)
         )
+
+
+class LineSegmentSeries(object):
+    """
+    A sequence of line segments in which each distinct line segment is stored
+    only once, as start and end positions within TrackPositionArrays, and
+    every entry of the sequence references its line segment by index.
+    Indexing returns a LineSegment2D that is created once for each distinct
+    line segment and shared by every entry that references it, so it should
+    not be modified.
+    """
+
+    __slots__ = ('start', 'end', 'index', '_lines')
+
+    def __init__(
+            self,
+            start: TrackPositionArray,
+            end: TrackPositionArray,
+            index: np.ndarray
+    ):
+        """
+        :param start:
+            The start positions of each distinct line segment
+        :param end:
+            The end positions of each distinct line segment
+        :param index:
+            The index of the distinct line segment for each entry
+        """
+
+        self.start = start
+        self.end = end
+        self.index = np.asarray(index, dtype=int)
+        self._lines = [None] * len(start)
+
+    @property
+    def distinct_count(self) -> int:
+        """ The number of distinct line segments in the series """
+
+        return len(self._lines)
+
+    def line(self, distinct_index: int) -> LineSegment2D:
+        """
+        Returns the shared LineSegment2D for the distinct line segment at the
+        specified index, creating it the first time it is requested
+
+        :param distinct_index:
+            Index of the distinct line segment
+        """
+
+        line = self._lines[distinct_index]
+        if line is None:
+            line = LineSegment2D(
+                self.start[distinct_index],
+                self.end[distinct_index]
+            )
+            self._lines[distinct_index] = line
+        return line
+
+    def columns(self) -> typing.Tuple[tuple, tuple]:
+        """
+        Returns the start and end position columns with one entry for each
+        entry in the series
+        """
+
+        return (
+            tuple([c[self.index] for c in uncertain.to_columns(self.start)]),
+            tuple([c[self.index] for c in uncertain.to_columns(self.end)])
+        )
+
+    def serialize(self) -> typing.List[dict]:
+        """
+        Returns a list of the serialized line segment of each entry, where
+        entries that share a line segment share its serialized dictionary
+        """
+
+        distinct = [
+            self.line(i).serialize()
+            for i in range(self.distinct_count)
+        ]
+        return [distinct[i] for i in self.index]
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __iter__(self):
+        for i in self.index:
+            yield self.line(i)
+
+    def __getitem__(self, index: int) -> LineSegment2D:
+        return self.line(self.index[index])
+
+
+# The angle by which steep lines are rotated to find their closest points,
+# which matches the rotation applied by LineSegment2D.closest_point_on_line
+STEEP_ROTATION = math.radians(20.0)
+
+# The maximum number of times a steep line will be rotated, which is enough
+# for the rotations to cover a full revolution
+MAX_STEEP_ROTATIONS = 18
+
+
+def line_columns(
+        lines: typing.Union[LineSegmentSeries, typing.List[LineSegment2D]]
+) -> typing.Tuple[tuple, tuple]:
+    """
+    Returns the start and end position columns of a list of line segments,
+    where each is an (x, y, x_uncertainty, y_uncertainty) tuple of arrays for
+    use with the batched line segment functions
+
+    :param lines:
+        The line segments from which to create the columns, either as a
+        LineSegmentSeries or a list of LineSegment2D instances
+    """
+
+    if isinstance(lines, LineSegmentSeries):
+        return lines.columns()
+
+    return (
+        uncertain.to_columns([line.start for line in lines]),
+        uncertain.to_columns([line.end for line in lines])
+    )
+
+
+def angles(
+        start: typing.Tuple[np.ndarray, ...],
+        end: typing.Tuple[np.ndarray, ...]
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the angles of the line segments defined by the start and end
+    position columns, and their uncertainties, in the same way as the
+    LineSegment2D.angle property
+
+    :param start:
+        The start position columns of the line segments
+    :param end:
+        The end position columns of the line segments
+    :return:
+        The angles in radians and their uncertainties
+    """
+
+    vx = end[0] - start[0]
+    vy = end[1] - start[1]
+    vx_unc = (start[2] ** 2 + end[2] ** 2) ** 0.5
+    vy_unc = (start[3] ** 2 + end[3] ** 2) ** 0.5
+
+    length_sqr = vx ** 2 + vy ** 2
+    uncertainties = (
+        np.abs(vy / length_sqr) * vx_unc +
+        np.abs(vx / length_sqr) * vy_unc
+    )
+
+    return np.arctan2(vy, vx), uncertainties
+
+
+def distances_to_points(
+        start: typing.Tuple[np.ndarray, ...],
+        end: typing.Tuple[np.ndarray, ...],
+        points: typing.Tuple[np.ndarray, ...]
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates the smallest distance between each point and the corresponding
+    line segment, along with its uncertainty, in the same way as the
+    LineSegment2D.distance_to_point method
+
+    :param start:
+        The start position columns of the line segments
+    :param end:
+        The end position columns of the line segments
+    :param points:
+        The position columns of the points
+    :return:
+        The distances and their uncertainties
+    """
+
+    lengths = uncertain.distances(start, end)[0]
+    if np.any(lengths == 0):
+        raise ValueError(
+            'Cannot calculate point distance. Invalid line segment.'
+        )
+
+    sx, sy, sx_unc, sy_unc = start
+    ex, ey, ex_unc, ey_unc = end
+    px, py, px_unc, py_unc = points
+
+    delta_x = ex - sx
+    delta_y = ey - sy
+
+    b = delta_y * px - delta_x * py - sx * ey + ex * sy
+    abs_b = np.abs(b)
+    d = (delta_x * delta_x + delta_y * delta_y) ** 0.5
+    d_prime = 1.0 / (delta_x * delta_x + delta_y * delta_y) ** (3.0 / 2.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Points on the line have no defined derivative of the absolute
+        # value, where the positive side is used instead
+        b_bd = np.where(b == 0, 1.0 / d, b / (abs_b * d))
+
+    distances = np.where(
+        delta_x == 0.0,
+        np.abs(sx - px),
+        np.where(delta_y == 0.0, np.abs(sy - py), abs_b / lengths)
+    )
+
+    uncertainties = (
+        px_unc * np.abs(delta_y * b_bd) +
+        py_unc * np.abs(delta_x * b_bd) +
+        sx_unc * np.abs(abs_b * d_prime + b_bd * (py - ey)) +
+        sy_unc * np.abs(abs_b * d_prime + b_bd * (ex - px)) +
+        ex_unc * np.abs(b_bd * (sy - py) - abs_b * d_prime) +
+        ey_unc * np.abs(b_bd * (px - sx) - abs_b * d_prime)
+    )
+
+    return distances, uncertainties
+
+
+def closest_points_on_lines(
+        start: typing.Tuple[np.ndarray, ...],
+        end: typing.Tuple[np.ndarray, ...],
+        points: typing.Tuple[np.ndarray, ...],
+        contained: bool = True
+) -> typing.Tuple[np.ndarray, ...]:
+    """
+    Finds the closest point on each line segment to the corresponding point
+    in the same way as the LineSegment2D.closest_point_on_line method. Steep
+    lines are rotated, along with their points, until their slopes are well
+    defined and the results are rotated back afterwards.
+
+    :param start:
+        The start position columns of the line segments
+    :param end:
+        The end position columns of the line segments
+    :param points:
+        The position columns of the points
+    :param contained:
+        Whether or not the closest points must lie within the line segments.
+        Closest points that do not have NaN values if True.
+    :return:
+        The position columns of the closest points
+    """
+
+    start = tuple([np.array(c, dtype=float) for c in start])
+    end = tuple([np.array(c, dtype=float) for c in end])
+    points = tuple([np.array(c, dtype=float) for c in points])
+
+    rotations = []
+    active = np.arange(len(start[0]))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(MAX_STEEP_ROTATIONS):
+            sx, sy, sx_unc, sy_unc = [c[active] for c in start]
+            ex, ey, ex_unc, ey_unc = [c[active] for c in end]
+
+            delta_x = ex - sx
+            slope = (ey - sy) / delta_x
+            slope_unc = (
+                np.abs(1.0 / delta_x) * (sy_unc + ey_unc) +
+                np.abs(slope / delta_x) * (sx_unc + ex_unc)
+            )
+            steep = (delta_x == 0) | (
+                (np.abs(slope) > 1.0) & (np.abs(slope_unc / slope) > 0.5)
+            )
+
+            active = active[steep]
+            if len(active) < 1:
+                break
+
+            pivot = tuple([c[active] for c in start])
+            rotations.append((active, pivot))
+
+            for columns in [start, end, points]:
+                rotated = uncertain.rotate(
+                    tuple([c[active] for c in columns]),
+                    STEEP_ROTATION,
+                    pivot
+                )
+                for column, values in zip(columns, rotated):
+                    column[active] = values
+
+        lengths = uncertain.distances(start, end)[0]
+        if np.any(lengths == 0):
+            raise ValueError('Cannot calculate point. Invalid line segment.')
+
+        sx, sy, sx_unc, sy_unc = start
+        ex, ey, ex_unc, ey_unc = end
+        px, py, px_unc, py_unc = points
+
+        slope = (ey - sy) / (ex - sx)
+        intercept = sy - slope * sx
+        denominator = slope * slope + 1.0
+        numerator = px + slope * (py - intercept)
+
+        x = numerator / denominator
+        y = (slope * numerator) / denominator + intercept
+
+    if contained:
+        eps = 1e-8
+        outside = (
+            (np.maximum(sx, ex) < x - eps) |
+            (x + eps < np.minimum(sx, ex)) |
+            (np.maximum(sy, ey) < y - eps) |
+            (y + eps < np.minimum(sy, ey))
+        )
+        x = np.where(outside, np.nan, x)
+        y = np.where(outside, np.nan, y)
+
+    def distance_from(from_x: np.ndarray, from_y: np.ndarray) -> np.ndarray:
+        return uncertain.power(
+            uncertain.power(from_x - x, 0, 2)[0] +
+            uncertain.power(from_y - y, 0, 2)[0],
+            0,
+            0.5
+        )[0]
+
+    start_dist = distance_from(sx, sy)
+    end_dist = distance_from(ex, ey)
+
+    def uncertainty(start_unc, end_unc, point_unc) -> np.ndarray:
+        out = start_dist / lengths * start_unc + end_dist / lengths * end_unc
+        return np.abs(uncertain.power(
+            uncertain.power(out, 0, 2)[0] + point_unc ** 2,
+            0,
+            0.5
+        )[0])
+
+    result = (
+        x,
+        y,
+        uncertainty(sx_unc, ex_unc, px_unc),
+        uncertainty(sy_unc, ey_unc, py_unc)
+    )
+
+    for active, pivot in reversed(rotations):
+        rotated = uncertain.rotate(
+            tuple([c[active] for c in result]),
+            -STEEP_ROTATION,
+            pivot
+        )
+        for column, values in zip(result, rotated):
+            column[active] = values
+
+    return result
+
+
+def extrapolate_by_length(
+        start: typing.Tuple[np.ndarray, ...],
+        end: typing.Tuple[np.ndarray, ...],
+        length_adjust: typing.Union[float, np.ndarray],
+        pre: bool = False
+) -> typing.Tuple[np.ndarray, ...]:
+    """
+    Computes the positions that extend each line segment by the specified
+    length beyond its end, or before its start if pre is True, in the same
+    way as the LineSegment2D._extrapolate_by_length method
+
+    :param start:
+        The start position columns of the line segments
+    :param end:
+        The end position columns of the line segments
+    :param length_adjust:
+        The length by which to extend the line segments, either a single
+        value or one value per line segment
+    :param pre:
+        Whether to extend the line segments before their start instead of
+        after their end
+    :return:
+        The position columns of the extrapolated positions, which keep the
+        uncertainties of the positions they extend
+    """
+
+    origin, point = (start, end) if pre else (end, start)
+    ox, oy, ox_unc, oy_unc = origin
+
+    delta_x = ox - point[0]
+    delta_y = oy - point[1]
+
+    dx_zero = np.abs(uncertain.round_values(
+        delta_x,
+        np.sqrt(ox_unc ** 2 + point[2] ** 2)
+    )) < uncertain.EPSILON
+    dy_zero = np.abs(uncertain.round_values(
+        delta_y,
+        np.sqrt(oy_unc ** 2 + point[3] ** 2)
+    )) < uncertain.EPSILON
+
+    angle = np.arctan2(delta_y, delta_x)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_direction = delta_x / np.abs(delta_x)
+        y_direction = delta_y / np.abs(delta_y)
+
+    x = np.where(
+        dx_zero,
+        ox,
+        np.where(
+            dy_zero,
+            ox + x_direction * length_adjust,
+            ox + length_adjust * np.cos(angle)
+        )
+    )
+    y = np.where(
+        dx_zero,
+        np.where(dy_zero, oy, oy + y_direction * length_adjust),
+        np.where(dy_zero, oy, oy + length_adjust * np.sin(angle))
+    )
+
+    return x, y, np.array(ox_unc, dtype=float), np.array(oy_unc, dtype=float)
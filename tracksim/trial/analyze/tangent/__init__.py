@@ -42,10 +42,7 @@ def serialize(tangent_data: dict) -> dict:
 
     tangents = dict()
     for k in limb.KEYS:
-        serialized = []
-        for tan in tangent_data['tangents'].get(k):
-            serialized.append(tan.serialize())
-        tangents[k] = serialized
+        tangents[k] = tangent_data['tangents'].get(k).serialize()
     out['tangents'] = tangents
 
     forward_boxes = []
@@ -1,54 +1,148 @@
 import typing
 
 import measurement_stats as mstats
+import numpy as np
 
 from tracksim import limb
+from tracksim import trackway
+from tracksim import uncertain
 from tracksim.trackway import TrackPosition
 from tracksim.trial.analyze import geometry
 
 
+# Positions closer than this distance along both axes are considered to be
+# identical when finding the next position along which a tangent is directed
+IDENTICAL_TOLERANCE = 0.1
+
+# The length by which tangent lines are extended before and after the
+# positions that define them
+TANGENT_EXTENSION = 4
+
+
+def next_distinct_indexes(
+        positions: typing.Union[trackway.TrackPositionArray, list]
+) -> np.ndarray:
+    """
+    Finds the index of the next position that is not identical to each
+    position, or -1 if there is no such position. Consecutive positions that
+    are exactly equal, such as a planted foot, are collapsed into runs so that
+    the search advances by runs instead of positions, and all of the runs are
+    searched at once, one run offset at a time.
+
+    :param positions:
+        The positions of a limb at each time step
+    """
+
+    x, y, _, _ = uncertain.to_columns(positions)
+    count = len(x)
+    if count < 1:
+        return np.zeros(0, dtype=int)
+
+    changed = np.ones(count, dtype=bool)
+    changed[1:] = (x[1:] != x[:-1]) | (y[1:] != y[:-1])
+    run_starts = np.flatnonzero(changed)
+    run_ids = np.cumsum(changed) - 1
+    run_x = x[run_starts]
+    run_y = y[run_starts]
+    run_count = len(run_starts)
+
+    next_runs = np.full(run_count, -1, dtype=int)
+    pending = np.arange(run_count)
+    offset = 0
+
+    while len(pending):
+        offset += 1
+        pending = pending[pending + offset < run_count]
+        candidates = pending + offset
+
+        distinct = ~(
+            (np.abs(run_x[candidates] - run_x[pending]) < IDENTICAL_TOLERANCE) &
+            (np.abs(run_y[candidates] - run_y[pending]) < IDENTICAL_TOLERANCE)
+        )
+        next_runs[pending[distinct]] = candidates[distinct]
+        pending = pending[~distinct]
+
+    next_runs = next_runs[run_ids]
+    return np.where(next_runs < 0, -1, run_starts[next_runs])
+
+
+def create_limb_tangents(
+        positions: typing.Union[trackway.TrackPositionArray, list]
+) -> geometry.LineSegmentSeries:
+    """
+    Creates the tangent line for each position of a limb, which runs from the
+    position toward the next distinct position and is extended before and
+    after by the TANGENT_EXTENSION. Positions without a next distinct
+    position, and the last position, use the tangent of the position before
+    them. Identical consecutive positions share a single stored tangent.
+
+    :param positions:
+        The positions of a limb at each time step
+    """
+
+    if not isinstance(positions, trackway.TrackPositionArray):
+        positions = trackway.TrackPositionArray.from_positions(positions)
+
+    columns = uncertain.to_columns(positions)
+    count = len(columns[0])
+    next_indexes = next_distinct_indexes(positions)
+
+    steps = np.arange(count)
+    has_tangent = (next_indexes >= 0) & (steps < count - 1)
+
+    # A new tangent starts wherever the defining position, including its
+    # uncertainties and metadata, or the next distinct position changes and
+    # every other step shares the tangent before it
+    changed = np.ones(count, dtype=bool)
+    changed[1:] = (
+        (next_indexes[1:] != next_indexes[:-1]) |
+        ~has_tangent[:-1]
+    )
+    for key in trackway.TrackPositionArray.__slots__:
+        values = getattr(positions, key)
+        changed[1:] |= values[1:] != values[:-1]
+    keys = np.maximum.accumulate(np.where(has_tangent & changed, steps, -1))
+
+    if count and keys[0] < 0:
+        raise IndexError('No tangent exists for the first position')
+
+    distinct_steps, index = np.unique(keys, return_inverse=True)
+    distinct_next = next_indexes[distinct_steps]
+
+    start = tuple([c[distinct_steps] for c in columns])
+    end = tuple([c[distinct_next] for c in columns])
+
+    end = geometry.extrapolate_by_length(start, end, TANGENT_EXTENSION)
+    start = geometry.extrapolate_by_length(
+        start,
+        end,
+        TANGENT_EXTENSION,
+        pre=True
+    )
+
+    # The tangent end points keep the metadata of the positions they extend
+    start_positions = positions.take(distinct_steps)
+    end_positions = positions.take(distinct_next)
+    for target, values in [(start_positions, start), (end_positions, end)]:
+        target.x, target.y, target.x_uncertainty, target.y_uncertainty = values
+
+    return geometry.LineSegmentSeries(start_positions, end_positions, index)
+
+
 def create_tangents(foot_positions: limb.Property) -> limb.Property:
     """
+    Creates the tangent lines for the positions of each limb at each time
+    step
 
     :param foot_positions:
+        The foot positions for each limb at each simulated time step
     :return:
+        A LineSegmentSeries of the tangents for each limb
     """
 
-    def find_next_position(_positions, _i):
-        reference_pos = _positions[_i]
-        for pos in _positions[(i + 1):]:
-            identical = (
-                mstats.value.equivalent(pos.x.raw, reference_pos.x.raw, 0.1),
-                mstats.value.equivalent(pos.y.raw, reference_pos.y.raw, 0.1)
-            )
-            if not identical[0] or not identical[1]:
-                return pos
-        return None
-
-    tangents = limb.Property().assign([], [], [], [])
-
+    tangents = limb.Property()
     for key in limb.KEYS:
-        positions = foot_positions.get(key)
-
-        for i in range(len(positions)):
-            p = positions[i]
-            next_pos = find_next_position(positions, i)
-
-            if not next_pos or i >= (len(positions) - 1):
-                try:
-                    tan = tangents.get(key)[-1]
-                except IndexError as err:
-                    print('Index:', i)
-                    print('Positions:', len(positions))
-                    print('Next:', next_pos)
-                    raise err
-            else:
-                tan = geometry.LineSegment2D(p, next_pos)
-                tan.post_extend_line(4)
-                tan.pre_extend_line(4)
-
-            tangents.get(key).append(tan)
-
+        tangents.set(key, create_limb_tangents(foot_positions.get(key)))
     return tangents
 
 
@@ -103,58 +197,135 @@ def compute_support_box(
     return [box_1, left_position, box_2, right_position]
 
 
+def compute_support_boxes(
+        left_positions: trackway.TrackPositionArray,
+        left_tangents: typing.List[geometry.LineSegment2D],
+        right_positions: trackway.TrackPositionArray,
+        right_tangents: typing.List[geometry.LineSegment2D]
+) -> typing.Tuple[list, list]:
+    """
+    Computes the support box for every time step of a pair of limbs at once
+    using the batched line segment functions. The results are the same as
+    calling compute_support_box for each time step with the positions before
+    and after that time step.
+
+    :param left_positions:
+        The positions of the left limb at each time step
+    :param left_tangents:
+        The tangent lines of the left limb at each time step
+    :param right_positions:
+        The positions of the right limb at each time step
+    :param right_tangents:
+        The tangent lines of the right limb at each time step
+    :return:
+        A list of the four box corner positions for each time step and a list
+        of the support ranges for each time step
+    """
+
+    if not isinstance(left_positions, trackway.TrackPositionArray):
+        left_positions = trackway.TrackPositionArray.from_positions(
+            left_positions
+        )
+    if not isinstance(right_positions, trackway.TrackPositionArray):
+        right_positions = trackway.TrackPositionArray.from_positions(
+            right_positions
+        )
+
+    left = uncertain.to_columns(left_positions)
+    right = uncertain.to_columns(right_positions)
+
+    box_1 = geometry.closest_points_on_lines(
+        *geometry.line_columns(left_tangents),
+        right,
+        contained=False
+    )
+    box_2 = geometry.closest_points_on_lines(
+        *geometry.line_columns(right_tangents),
+        left,
+        contained=False
+    )
+
+    # Compare the distance to the left position with the distance to the
+    # previous left position, or to the next one for the first time step
+    count = len(left_positions)
+    others = np.arange(count) - 1
+    others[0] = min(1, count - 1)
+    first = others > np.arange(count)
+
+    distance = uncertain.distances(box_1, left)
+    other_distance = uncertain.distances(
+        box_1,
+        tuple([column[others] for column in left])
+    )
+
+    def rounded(a: tuple, b: tuple) -> np.ndarray:
+        """ Rounded values of a at the first time step and b elsewhere """
+        return uncertain.round_values(
+            np.where(first, a[0], b[0]),
+            np.where(first, a[1], b[1])
+        )
+
+    step_distance = rounded(other_distance, distance)
+    previous_distance = rounded(distance, other_distance)
+    leading = step_distance < previous_distance
+
+    box_1 = trackway.TrackPositionArray(*box_1)
+    box_2 = trackway.TrackPositionArray(*box_2)
+
+    corners = [
+        trackway.TrackPositionArray.where(leading, left_positions, box_1),
+        trackway.TrackPositionArray.where(leading, box_1, left_positions),
+        trackway.TrackPositionArray.where(leading, right_positions, box_2),
+        trackway.TrackPositionArray.where(leading, box_2, right_positions)
+    ]
+
+    values, uncertainties = uncertain.distances(
+        uncertain.to_columns(corners[0]),
+        uncertain.to_columns(corners[1])
+    )
+
+    boxes = [[corner[i] for corner in corners] for i in range(count)]
+    ranges = [
+        mstats.ValueUncertainty(value, uncertainty)
+        for value, uncertainty in zip(values.tolist(), uncertainties.tolist())
+    ]
+
+    return boxes, ranges
+
+
 def support_boxes(
         foot_positions: limb.Property,
         tangents: limb.Property
 ) -> dict:
     """
+    Computes the support boxes and support ranges of the pes and manus limb
+    pairs at each time step
 
     :param foot_positions:
+        The foot positions for each limb at each simulated time step
     :param tangents:
+        The tangent lines for each limb at each simulated time step
     :return:
+        A dictionary with the boxes and ranges for the rear and forward pairs
     """
 
-    fps = foot_positions
-    rear_support_boxes = []
-    rear_support_ranges = []
-    forward_support_boxes = []
-    forward_support_ranges = []
-
-    count = len(tangents.left_pes)
-
-    for i in range(count):
-        before = fps.left_pes[i - 1] if i > 0 else None
-        after = fps.left_pes[i + 1] if i < (count - 1) else None
-        box = compute_support_box(
-            left_position=foot_positions.left_pes[i],
-            left_tangent=tangents.left_pes[i],
-            right_position=foot_positions.right_pes[i],
-            right_tangent=tangents.right_pes[i],
-            last_left_position=before,
-            next_left_position=after
-        )
-        rear_support_boxes.append(box)
-        rear_support_ranges.append(box[0].distance_between(box[1]))
-
-        before = fps.left_manus[i - 1] if i > 0 else None
-        after = fps.left_manus[i + 1] if i < (count - 1) else None
-        box = compute_support_box(
-            left_position=foot_positions.left_manus[i],
-            left_tangent=tangents.left_manus[i],
-            right_position=foot_positions.right_manus[i],
-            right_tangent=tangents.right_manus[i],
-            last_left_position=before,
-            next_left_position=after
-        )
-        forward_support_boxes.append(box)
-        forward_support_ranges.append(box[0].distance_between(box[1]))
+    rear_boxes, rear_ranges = compute_support_boxes(
+        foot_positions.left_pes,
+        tangents.left_pes,
+        foot_positions.right_pes,
+        tangents.right_pes
+    )
+
+    forward_boxes, forward_ranges = compute_support_boxes(
+        foot_positions.left_manus,
+        tangents.left_manus,
+        foot_positions.right_manus,
+        tangents.right_manus
+    )
 
     return {
-        'forward_boxes': forward_support_boxes,
-        'rear_boxes': rear_support_boxes,
-        'forward_ranges': forward_support_ranges,
-        'rear_ranges': rear_support_ranges
+        'forward_boxes': forward_boxes,
+        'rear_boxes': rear_boxes,
+        'forward_ranges': forward_ranges,
+        'rear_ranges': rear_ranges
     }
-
-
-
@@ -0,0 +1,252 @@
+"""
+A content-addressed cache of trial results stored within the results
+directory. Each entry is keyed by a hash of the normalized trial settings,
+the contents of the trackway data file used by the trial, the tracksim
+version and, optionally, a fingerprint of the source code that runs it. An
+entry holds a copy of the trial's report directory and the result returned
+by the trial, which are restored in place of simulating and analyzing the
+trial again. Entries are evicted in least-recently-used order once the total
+size of the cache exceeds its limit.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import typing
+
+import tracksim
+from tracksim import paths
+
+# The default limit for the total size of the cache in bytes, which can be
+# changed with the "cache_size" setting
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+RESULT_FILENAME = 'result.json'
+REPORT_FOLDER = 'report'
+
+# Settings that control how a trial is run, but do not affect its results
+IGNORED_SETTINGS = [
+    'path',
+    'cache',
+    'cache_size',
+    'rerun',
+    'results_path',
+    'workers'
+]
+
+
+def directory(*args: str) -> str:
+    """
+    Returns the path to the cache directory, or to a location within it
+    specified by the args
+
+    :param args:
+        Zero or more relative path elements within the cache directory
+    """
+
+    return paths.results('cache', 'trials', *args)
+
+
+def is_enabled(settings: dict) -> bool:
+    """
+    Whether or not the cache should be used for the trial, which is disabled
+    with a "cache" setting of False
+
+    :param settings:
+        Configuration for the simulation trial
+    """
+
+    return bool(settings.get('cache', True))
+
+
+def create_key(
+        settings: dict,
+        data_path: str = None,
+        source_fingerprint: str = ''
+) -> str:
+    """
+    Creates the cache key for a trial from its settings, which must have
+    already been normalized by loading them and their activity phases, and
+    from the contents of the trackway data file, if one is used
+
+    :param settings:
+        Configuration for the simulation trial
+    :param data_path:
+        The path to the trackway data file loaded by the trial, or None if
+        the trackway is generated from the settings
+    :param source_fingerprint:
+        An optional fingerprint of the source code used to run the trial
+    """
+
+    normalized = dict([
+        (key, value)
+        for key, value in settings.items()
+        if key not in IGNORED_SETTINGS
+    ])
+
+    digest = hashlib.sha256()
+    digest.update(tracksim.__version__.encode())
+    digest.update(source_fingerprint.encode())
+    digest.update(json.dumps(normalized, sort_keys=True, default=str).encode())
+
+    if data_path:
+        with open(data_path, 'rb') as f:
+            digest.update(f.read())
+
+    return digest.hexdigest()
+
+
+def fetch(key: str, report_directory: str) -> typing.Union[dict, None]:
+    """
+    Restores the cached report for the key into the report directory and
+    returns the cached trial result, or returns None if the key is not in
+    the cache
+
+    :param key:
+        The cache key for the trial
+    :param report_directory:
+        The directory where the trial report is written
+    """
+
+    entry = directory(key)
+    result_path = os.path.join(entry, RESULT_FILENAME)
+
+    try:
+        with open(result_path, 'r') as f:
+            result = json.load(f)
+
+        if os.path.exists(report_directory):
+            shutil.rmtree(report_directory)
+        shutil.copytree(os.path.join(entry, REPORT_FOLDER), report_directory)
+    except (FileNotFoundError, json.JSONDecodeError):
+        # Entries can be evicted by other processes while being read
+        return None
+
+    # Marks the entry as the most recently used
+    os.utime(result_path)
+
+    return result
+
+
+def store(
+        key: str,
+        report_directory: str,
+        result: dict,
+        max_size: int = DEFAULT_MAX_SIZE
+):
+    """
+    Stores a copy of the report directory and the trial result in the cache
+    under the key, and then evicts the least recently used entries until the
+    cache is within its size limit
+
+    :param key:
+        The cache key for the trial
+    :param report_directory:
+        The directory where the trial report was written
+    :param result:
+        The JSON serializable result of the trial
+    :param max_size:
+        The limit for the total size of the cache in bytes
+    """
+
+    entry = directory(key)
+
+    # Entries are assembled in a temporary location and then moved into
+    # place so that other processes never read a partially written entry
+    staging = directory('{}.{}.tmp'.format(key, os.getpid()))
+    if os.path.exists(staging):
+        shutil.rmtree(staging)
+
+    shutil.copytree(report_directory, os.path.join(staging, REPORT_FOLDER))
+    with open(os.path.join(staging, RESULT_FILENAME), 'w+') as f:
+        json.dump(result, f)
+
+    if os.path.exists(entry):
+        shutil.rmtree(entry, ignore_errors=True)
+
+    try:
+        os.rename(staging, entry)
+    except OSError:
+        # Another process stored the same entry first
+        shutil.rmtree(staging, ignore_errors=True)
+
+    prune(max_size)
+
+
+def get_size(path: str) -> int:
+    """
+    Returns the total size in bytes of the files within the directory
+    """
+
+    size = 0
+    for root, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                size += os.path.getsize(os.path.join(root, filename))
+            except OSError:
+                pass
+    return size
+
+
+def list_entries() -> typing.List[dict]:
+    """
+    Returns the key, path, size and last used time of each entry in the
+    cache, ordered from the least to the most recently used
+    """
+
+    root = directory()
+    if not os.path.exists(root):
+        return []
+
+    entries = []
+    for key in os.listdir(root):
+        path = os.path.join(root, key)
+        try:
+            last_used = os.path.getmtime(os.path.join(path, RESULT_FILENAME))
+        except OSError:
+            continue
+
+        entries.append(dict(
+            key=key,
+            path=path,
+            size=get_size(path),
+            last_used=last_used
+        ))
+
+    return sorted(entries, key=lambda e: e['last_used'])
+
+
+def prune(max_size: int = DEFAULT_MAX_SIZE) -> int:
+    """
+    Removes the least recently used entries until the total size of the
+    cache is no larger than the maximum size, always keeping the most
+    recently used entry. Returns the number of entries removed.
+
+    :param max_size:
+        The limit for the total size of the cache in bytes
+    """
+
+    entries = list_entries()
+    total = sum([e['size'] for e in entries])
+
+    removed = 0
+    for entry in entries[:-1]:
+        if total <= max_size:
+            break
+
+        shutil.rmtree(entry['path'], ignore_errors=True)
+        total -= entry['size']
+        removed += 1
+
+    return removed
+
+
+def clear():
+    """
+    Removes all entries from the cache
+    """
+
+    root = directory()
+    if os.path.exists(root):
+        shutil.rmtree(root)
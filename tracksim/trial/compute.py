@@ -1,7 +1,12 @@
+import math
 import typing
 
+import numpy as np
+
+from tracksim import generate
+from tracksim import limb
 from tracksim import trackway
-import measurement_stats as mstats
+from tracksim.trial import series_cache
 
 MOVING_ANNOTATION = 'M'
 FIXED_ANNOTATION = 'F'
@@ -39,51 +44,490 @@ def positions_over_time(
         length of the time_steps argument.
     """
 
-    out = []
+    arrays = positions_over_time_arrays(
+        time_steps=time_steps,
+        limb_positions=limb_positions,
+        activity_phase=activity_phase,
+        settings=settings
+    )
+
+    return to_track_positions(arrays, limb_positions)
+
+
+def positions_over_time_arrays(
+        time_steps: typing.Iterable[float],
+        limb_positions: typing.List[trackway.TrackPosition],
+        activity_phase: float,
+        settings: dict,
+        first_index: int = 0,
+        track_count: int = None
+) -> typing.Dict[str, np.ndarray]:
+    """
+    Array-backed equivalent of positions_over_time that computes the positions
+    of the limb for every time step at once instead of creating a
+    TrackPosition for each one. The result is a structure-of-arrays
+    dictionary where each entry is a Numpy array with one element per time
+    step:
+
+        - valid: True where the position could be computed for the time step
+        - x, y: Raw position values
+        - x_uncertainty, y_uncertainty: Raw position uncertainties
+        - annotation: 'M' while moving, 'F' while fixed and '' when invalid
+        - track_index: Index of the track position within limb_positions
+            where the limb is fixed, otherwise -1
+
+    :param time_steps:
+        The time steps over which to calculate the locations
+    :param limb_positions:
+        A list of TrackPosition instances for each position of the track within
+        the trackway
+    :param activity_phase:
+        The activity phase for the limb
+    :param settings:
+        A dictionary of configuration values for the trial being simulated
+    :param first_index:
+        When limb_positions is a consecutive slice of the track positions of
+        the limb, the index of its first position within all of them. The
+        track_index values returned are relative to the slice, which must
+        contain every track position used by the time steps.
+    :param track_count:
+        The number of track positions of the limb when limb_positions is a
+        slice of them
+    """
+
+    times = np.asarray(time_steps, dtype=float)
     duty_cycle = settings['duty_cycle']
-    track_count = len(limb_positions)
+    moving_ambiguity = settings['moving_ambiguity']
+    if track_count is None:
+        track_count = first_index + len(limb_positions)
+
+    track_x = np.array([p.x.raw for p in limb_positions], dtype=float)
+    track_y = np.array([p.y.raw for p in limb_positions], dtype=float)
+    track_x_unc = np.array(
+        [p.x.raw_uncertainty for p in limb_positions],
+        dtype=float
+    )
+    track_y_unc = np.array(
+        [p.y.raw_uncertainty for p in limb_positions],
+        dtype=float
+    )
 
     first_valid_time = activity_phase - duty_cycle
     last_valid_time = track_count - 1 + activity_phase
 
-    for time in time_steps:
+    # Convert from world "lab" frame time to the time for each limb, which
+    # removes its limb phase. Truncation toward zero matches int()
+    limb_time = times - activity_phase
+    limb_cycle = np.trunc(limb_time).astype(int)
+    cycle_time = limb_time - limb_cycle
 
-        # Convert from world "lab" frame time to the time for this limb, which
-        # removes its limb phase
-        limb_time = time - activity_phase
-        limb_cycle = int(limb_time)
+    valid = (times >= first_valid_time) & (times <= last_valid_time)
+    before_start = valid & ((limb_cycle < 0) | (limb_time < 0))
+    after_end = valid & ~before_start & ((limb_cycle + 1) == track_count)
+    cycling = valid & ~before_start & ~after_end
 
-        if time < first_valid_time or time > last_valid_time:
-            # If the time is out of bounds append None
-            out.append(None)
+    move_time = 1.0 - duty_cycle
+    landed = cycling & (cycle_time >= move_time)
+    moving = cycling & ~landed
+
+    track_index = np.full(times.shape, -1, dtype=int)
+    track_index[before_start] = 0
+    track_index[after_end] = track_count - 1
+    track_index[landed] = limb_cycle[landed] + 1
+    fixed = track_index >= 0
+    track_index[fixed] -= first_index
+
+    x = np.full(times.shape, np.nan)
+    y = np.full(times.shape, np.nan)
+    x_unc = np.full(times.shape, np.nan)
+    y_unc = np.full(times.shape, np.nan)
+
+    indexes = track_index[fixed]
+    x[fixed] = track_x[indexes]
+    y[fixed] = track_y[indexes]
+    x_unc[fixed] = track_x_unc[indexes]
+    y_unc[fixed] = track_y_unc[indexes]
+
+    before = limb_cycle[moving] - first_index
+    after = before + 1
+    progress = np.clip(cycle_time[moving] / move_time, 0.0, 1.0)
+
+    delta_x = track_x[after] - track_x[before]
+    delta_y = track_y[after] - track_y[before]
+
+    x[moving] = track_x[before] + progress * delta_x
+    y[moving] = track_y[before] + progress * delta_y
+    x_unc[moving] = np.maximum(
+        track_x_unc[after],
+        np.abs(moving_ambiguity * delta_x)
+    )
+    y_unc[moving] = np.maximum(
+        track_y_unc[after],
+        np.abs(moving_ambiguity * delta_y)
+    )
+
+    annotation = np.full(times.shape, '', dtype='<U1')
+    annotation[fixed] = FIXED_ANNOTATION
+    annotation[moving] = MOVING_ANNOTATION
+
+    return dict(
+        valid=valid,
+        x=x,
+        y=y,
+        x_uncertainty=x_unc,
+        y_uncertainty=y_unc,
+        annotation=annotation,
+        track_index=track_index
+    )
+
+
+def trackway_positions_over_time_arrays(
+        time_steps: typing.Iterable[float],
+        trackway_definition: trackway.TrackwayDefinition,
+        settings: dict,
+        track_ranges: limb.Property = None,
+        step_offset: int = None
+) -> limb.Property:
+    """
+    Computes the structure-of-arrays positions returned by the
+    positions_over_time_arrays function for each limb in the trackway
+    definition and returns them as a limb Property
+
+    :param time_steps:
+        The time steps over which to calculate the locations
+    :param trackway_definition:
+        The trackway positions and activity phases for the trial
+    :param settings:
+        A dictionary of configuration values for the trial being simulated
+    :param track_ranges:
+        Optional (start, end) index ranges of the track positions used by
+        each limb, as returned by the track_ranges function, in which case
+        only those track positions are loaded and the returned track indexes
+        are relative to the start of each range
+    :param step_offset:
+        When the time steps are a consecutive slice of the uniform time steps
+        of the trackway, the index of the first of them. The position series
+        of each limb are then taken from the series memo when one is enabled.
+    """
+
+    memo = series_cache.active()
+    time_steps = np.asarray(time_steps, dtype=float)
+    out = limb.Property()
+
+    for key in limb.KEYS:
+        limb_positions = trackway_definition.limb_positions.get(key)
+        start, end = (
+            track_ranges.get(key)
+            if track_ranges else
+            (0, len(limb_positions))
+        )
+
+        if memo is not None and step_offset is not None and len(time_steps):
+            out.set(key, memoized_positions_over_time_arrays(
+                memo=memo,
+                step_offset=step_offset,
+                step_count=len(time_steps),
+                limb_positions=limb_positions,
+                activity_phase=trackway_definition.activity_phases.get(key),
+                settings=settings,
+                time_range=generate.time_range(trackway_definition),
+                first_index=start
+            ))
             continue
 
-        if limb_cycle < 0 or limb_time < 0:
-            # While time is valid but the limb hasn't started its first valid
-            # cycle, we can just use the first track position
-            pos = limb_positions[0].clone()
-            pos.annotation = FIXED_ANNOTATION
-            out.append(pos)
+        out.set(key, positions_over_time_arrays(
+            time_steps=time_steps,
+            limb_positions=limb_positions[start:end],
+            activity_phase=trackway_definition.activity_phases.get(key),
+            settings=settings,
+            first_index=start,
+            track_count=len(limb_positions)
+        ))
+
+    return out
+
+
+def memoized_positions_over_time_arrays(
+        memo: series_cache.SeriesCache,
+        step_offset: int,
+        step_count: int,
+        limb_positions: typing.List[trackway.TrackPosition],
+        activity_phase: float,
+        settings: dict,
+        time_range: typing.Tuple[float, float],
+        first_index: int = 0
+) -> typing.Dict[str, np.ndarray]:
+    """
+    Returns the structure-of-arrays positions of the limb for a consecutive
+    slice of the uniform time steps of the trackway from the series memo,
+    computing and storing them if the memo does not already contain them.
+    The values are identical to those returned by the
+    positions_over_time_arrays function for the same time steps.
+
+    :param memo:
+        The series memo in which the positions are stored
+    :param step_offset:
+        The index of the first time step within the uniform time steps
+    :param step_count:
+        The number of time steps in the slice
+    :param limb_positions:
+        All of the track positions of the limb
+    :param activity_phase:
+        The activity phase for the limb
+    :param settings:
+        A dictionary of configuration values for the trial being simulated
+    :param time_range:
+        The minimum and maximum times of the uniform time steps
+    :param first_index:
+        The index of the track position to which the returned track_index
+        values are relative
+    """
+
+    steps_per_cycle = settings['steps_per_cycle']
+    track_count = len(limb_positions)
+
+    def create(start: int, end: int) -> typing.Dict[str, np.ndarray]:
+        times = generate.time_step_slice(
+            steps_per_cycle,
+            time_range[0],
+            time_range[1],
+            start,
+            end
+        )
+
+        # The track positions used by the time steps with the same margin
+        # used by trials that restrict their track ranges
+        first = math.floor(times[0] - activity_phase) - 2
+        last = math.floor(times[-1] - activity_phase) + 4
+        first = min(max(0, first), track_count)
+        last = min(max(0, last), track_count)
+
+        arrays = positions_over_time_arrays(
+            time_steps=times,
+            limb_positions=limb_positions[first:last],
+            activity_phase=activity_phase,
+            settings=settings,
+            first_index=first,
+            track_count=track_count
+        )
+        arrays['track_index'][arrays['track_index'] >= 0] += first
+        return arrays
+
+    arrays = memo.fetch(
+        series_cache.create_key(
+            limb_positions,
+            activity_phase,
+            settings,
+            time_range
+        ),
+        step_offset,
+        step_offset + step_count,
+        create
+    )
+    arrays['track_index'][arrays['track_index'] >= 0] -= first_index
+    return arrays
+
+
+def track_ranges(
+        min_time: float,
+        max_time: float,
+        trackway_definition: trackway.TrackwayDefinition,
+        margin: int = 0
+) -> limb.Property:
+    """
+    Returns a limb Property containing the (start, end) index range of the
+    track positions of each limb that are used by the positions at times
+    between the min and max times, where the end index is exclusive
+
+    :param min_time:
+        The earliest time at which positions will be computed
+    :param max_time:
+        The latest time at which positions will be computed
+    :param trackway_definition:
+        The trackway positions and activity phases for the trial
+    :param margin:
+        The number of additional track positions to include on either side
+        of the range when they exist
+    """
+
+    out = limb.Property()
+
+    for key in limb.KEYS:
+        phase = trackway_definition.activity_phases.get(key)
+        track_count = len(trackway_definition.limb_positions.get(key))
+
+        # A limb is between the track positions at the floor of its limb
+        # time and the one after it
+        start = math.floor(min_time - phase) - margin
+        end = math.floor(max_time - phase) + 2 + margin
+
+        out.set(key, (
+            min(max(0, start), track_count),
+            min(max(0, end), track_count)
+        ))
+
+    return out
+
+
+def to_track_positions(
+        arrays: typing.Dict[str, np.ndarray],
+        limb_positions: typing.List[trackway.TrackPosition]
+) -> typing.List[typing.Union[trackway.TrackPosition, None]]:
+    """
+    Converts the structure-of-arrays positions for a limb, as returned by the
+    positions_over_time_arrays function, into the list of TrackPosition
+    instances (or None for invalid time steps) returned by the
+    positions_over_time function
+
+    :param arrays:
+        The computed position arrays for the limb
+    :param limb_positions:
+        The track positions for the limb from which the arrays were computed
+    """
+
+    out = []
+
+    columns = zip(
+        arrays['valid'].tolist(),
+        arrays['track_index'].tolist(),
+        arrays['x'].tolist(),
+        arrays['y'].tolist(),
+        arrays['x_uncertainty'].tolist(),
+        arrays['y_uncertainty'].tolist()
+    )
+
+    for valid, track_index, x, y, x_unc, y_unc in columns:
+        if not valid:
+            out.append(None)
             continue
 
-        if (limb_cycle + 1) == track_count:
-            # While time is still valid but the limb has finished all of its
-            # active cycles, we just use the last track position
-            pos = limb_positions[-1].clone()
+        if track_index >= 0:
+            pos = limb_positions[track_index].clone()
             pos.annotation = FIXED_ANNOTATION
             out.append(pos)
             continue
 
-        try:
-            out.append(position_at_cycle_time(
-                cycle_time=limb_time - limb_cycle,
-                before_position=limb_positions[limb_cycle],
-                after_position=limb_positions[limb_cycle + 1],
-                duty_cycle=duty_cycle,
-                settings=settings
-            ))
-        except Exception as err:
-            raise
+        out.append(trackway.TrackPosition.from_raw_values(
+            x=x,
+            x_uncertainty=x_unc,
+            y=y,
+            y_uncertainty=y_unc,
+            annotation=MOVING_ANNOTATION
+        ))
+
+    return out
+
+
+def to_track_position_lists(
+        arrays: limb.Property,
+        trackway_definition: trackway.TrackwayDefinition
+) -> limb.Property:
+    """
+    Converts a limb Property of structure-of-arrays positions into a limb
+    Property of TrackPosition lists as expected by the trial analysis
+
+    :param arrays:
+        The computed position arrays for each limb
+    :param trackway_definition:
+        The trackway definition from which the arrays were computed
+    """
+
+    out = limb.Property()
+
+    for key in limb.KEYS:
+        out.set(key, to_track_positions(
+            arrays.get(key),
+            trackway_definition.limb_positions.get(key)
+        ))
+
+    return out
+
+
+def to_track_position_array(
+        arrays: typing.Dict[str, np.ndarray],
+        limb_positions: typing.List[trackway.TrackPosition]
+) -> trackway.TrackPositionArray:
+    """
+    Converts the structure-of-arrays positions for a limb, as returned by the
+    positions_over_time_arrays function, into a TrackPositionArray where
+    fixed positions carry the uid, name and assumed values of the track
+    position they are fixed at
+
+    :param arrays:
+        The computed position arrays for the limb
+    :param limb_positions:
+        The track positions for the limb from which the arrays were computed
+    """
+
+    track_index = arrays['track_index']
+    fixed = track_index >= 0
+    moving = arrays['annotation'] == MOVING_ANNOTATION
+    count = len(track_index)
+
+    track_uids = np.empty(len(limb_positions), dtype=object)
+    track_uids[:] = [p.uid for p in limb_positions]
+    track_names = np.empty(len(limb_positions), dtype=object)
+    track_names[:] = [p.name for p in limb_positions]
+    track_assumed = np.array(
+        [bool(p.assumed) for p in limb_positions],
+        dtype=bool
+    )
+
+    uid = np.full(count, None, dtype=object)
+    uid[fixed] = track_uids[track_index[fixed]]
+    uid[moving] = trackway.reserve_uids(int(np.count_nonzero(moving)))
+
+    name = np.full(count, None, dtype=object)
+    name[fixed] = track_names[track_index[fixed]]
+
+    assumed = np.zeros(count, dtype=bool)
+    assumed[fixed] = track_assumed[track_index[fixed]]
+
+    annotation_code = np.zeros(count, dtype=np.int8)
+    annotation_code[fixed] = trackway.ANNOTATIONS.index(FIXED_ANNOTATION)
+    annotation_code[moving] = trackway.ANNOTATIONS.index(MOVING_ANNOTATION)
+
+    return trackway.TrackPositionArray(
+        x=np.where(arrays['valid'], arrays['x'], np.nan),
+        y=arrays['y'].copy(),
+        x_uncertainty=arrays['x_uncertainty'].copy(),
+        y_uncertainty=arrays['y_uncertainty'].copy(),
+        annotation_code=annotation_code,
+        uid=uid,
+        name=name,
+        assumed=assumed
+    )
+
+
+def to_track_position_arrays(
+        arrays: limb.Property,
+        trackway_definition: trackway.TrackwayDefinition,
+        track_ranges: limb.Property = None
+) -> limb.Property:
+    """
+    Converts a limb Property of structure-of-arrays positions into a limb
+    Property of TrackPositionArray instances
+
+    :param arrays:
+        The computed position arrays for each limb
+    :param trackway_definition:
+        The trackway definition from which the arrays were computed
+    :param track_ranges:
+        The index ranges of the track positions used to compute the arrays,
+        if they were restricted
+    """
+
+    out = limb.Property()
+
+    for key in limb.KEYS:
+        limb_positions = trackway_definition.limb_positions.get(key)
+        if track_ranges:
+            limb_positions = limb_positions[slice(*track_ranges.get(key))]
+
+        out.set(key, to_track_position_array(
+            arrays.get(key),
+            limb_positions
+        ))
 
     return out
 
@@ -1,16 +1,22 @@
+import typing
+
+import numpy as np
+
 from tracksim import limb
+from tracksim import trackway
 
 
-def invalid_positions(
+def valid_window(
         settings: dict,
         time_steps: list,
         foot_positions: limb.Property
-):
+) -> typing.Tuple[int, int]:
     """
-    Iterates through the time_steps and foot_positions lists and removes values
-    at the beginning and end where any invalid data is found. Such invalid data
-    exists when some amount of time at the beginning or end of the simulation
-    is valid for 1 or more of the limbs in the trackway, but not all 4.
+    Finds the start and end indexes of the window of time steps where the
+    positions of all of the limbs are valid and the time is within the start
+    and end times of the settings. Positions are only invalid at the beginning
+    and end of a simulation, when some amount of time is valid for 1 or more
+    of the limbs in the trackway, but not all 4.
 
     :param settings:
         Configuration for the simulation trial
@@ -19,36 +25,94 @@ def invalid_positions(
     :param foot_positions:
         The calculated positions of each foot for each time step in the
         time_steps list
+    :return:
+        The start index and the end index, which is exclusive, of the window.
+        The window is empty if both are equal.
     """
 
-    was_culled = False
+    times = np.asarray(time_steps, dtype=float)
 
-    start_time = settings.get('start_time', 0)
-    end_time = settings.get('end_time', 1e8)
+    mask = (
+        (times >= settings.get('start_time', 0)) &
+        (times <= settings.get('end_time', 1e8))
+    )
 
-    values = list(foot_positions.values())
-    values.append(time_steps)
-    index = 0
+    for positions in foot_positions.values():
+        if isinstance(positions, trackway.TrackPositionArray):
+            mask &= positions.valid
+        else:
+            mask &= np.array([p is not None for p in positions], dtype=bool)
 
-    while index < len(values[0]):
-        entries = []
-        for v in values:
-            entries.append(v[index])
+    indexes = np.flatnonzero(mask)
+    if len(indexes) < 1:
+        return 0, 0
 
-        cull = (
-            None in entries or
-            entries[-1] < start_time or
-            entries[-1] > end_time
-        )
+    return int(indexes[0]), int(indexes[-1]) + 1
 
-        if cull:
-            was_culled = True
-            for v in values:
-                v[index:index + 1] = []
-        else:
-            index += 1
 
-    return was_culled
+def valid_time_range(
+        settings: dict,
+        trackway_definition: trackway.TrackwayDefinition
+) -> typing.Tuple[float, float]:
+    """
+    Returns the earliest and latest times at which the positions of all of
+    the limbs are valid and the time is within the start and end times of the
+    settings, which bound the window found by the valid_window function. The
+    range is empty when the latest time is before the earliest time.
+
+    :param settings:
+        Configuration for the simulation trial
+    :param trackway_definition:
+        The trackway positions and activity phases for the trial
+    """
+
+    first = settings.get('start_time', 0)
+    last = settings.get('end_time', 1e8)
+
+    for key in limb.KEYS:
+        phase = trackway_definition.activity_phases.get(key)
+        track_count = len(trackway_definition.limb_positions.get(key))
+
+        # Matches the valid times of compute.positions_over_time_arrays
+        first = max(first, phase - settings['duty_cycle'])
+        last = min(last, track_count - 1 + phase)
+
+    return first, last
+
+
+def invalid_positions(
+        settings: dict,
+        time_steps: list,
+        foot_positions: limb.Property
+) -> typing.Tuple[int, int]:
+    """
+    Removes the time_steps and foot_positions values at the beginning and end
+    where any invalid data is found, or that are outside of the start and end
+    times of the settings. The time_steps list is trimmed in place and each
+    foot positions entry is replaced by a slice of the valid window, which
+    shares the storage of the original when it is a TrackPositionArray.
+
+    :param settings:
+        Configuration for the simulation trial
+    :param time_steps:
+        A list of times at which the simulation calculated foot positions
+    :param foot_positions:
+        The calculated positions of each foot for each time step in the
+        time_steps list
+    :return:
+        The start and end indexes of the retained window within the original
+        time steps
+    """
+
+    start, end = valid_window(settings, time_steps, foot_positions)
+
+    for key, positions in foot_positions.items():
+        foot_positions.set(key, positions[start:end])
+
+    del time_steps[end:]
+    del time_steps[:start]
+
+    return start, end
 
 
 def unused_foot_prints(
@@ -61,32 +125,67 @@ def unused_foot_prints(
     context
 
     :param print_positions:
+        The trackway positions for each limb, which are trimmed in place
     :param foot_positions:
+        The calculated positions of each foot for each time step
     :return:
+        Whether or not any print positions were removed
     """
 
-    was_pruned = False
+    used_uids = limb.Property()
+
+    for limb_key, positions in foot_positions.items():
+        if isinstance(positions, trackway.TrackPositionArray):
+            uids = set(positions.uid[positions.valid].tolist())
+        else:
+            uids = set([p.uid for p in positions if p is not None])
+        used_uids.set(limb_key, uids)
+
+    return unused_prints(print_positions, used_uids)
 
-    def is_in(uid: str, items: list) -> bool:
-        for item in items:
-            if item.uid == uid:
-                return True
-        return False
+
+def unused_prints(
+        print_positions: limb.Property,
+        used_uids: limb.Property
+):
+    """
+    Trims the print positions lists to include only those positions whose
+    uids are in the used uids of each limb and the positions just before and
+    after to provide context
+
+    :param print_positions:
+        The trackway positions for each limb, which are trimmed in place
+    :param used_uids:
+        The set of uids of the print positions used by each limb
+    :return:
+        Whether or not any print positions were removed
+    """
+
+    was_pruned = False
 
     for limb_key, foot_prints in print_positions.items():
+        uids = used_uids.get(limb_key)
 
-        index = len(foot_prints) - 1
-        while index > 0:
-            index -= 1
-            if is_in(foot_prints[index].uid, foot_positions.get(limb_key)):
-                break
-            foot_prints.pop()
-            was_pruned = True
+        used = np.array(
+            [p.uid in uids for p in foot_prints],
+            dtype=bool
+        )
+        count = len(used)
+        if count < 2:
+            continue
+
+        # Keep one print after the last used print, ignoring whether the
+        # final print itself is used
+        last_indexes = np.flatnonzero(used[:-1])
+        end = int(last_indexes[-1]) + 2 if len(last_indexes) else 1
+
+        # Keep one print before the first used print after the first one
+        first_indexes = np.flatnonzero(used[1:end])
+        start = int(first_indexes[0]) if len(first_indexes) else end - 1
 
-        while len(foot_prints) > 1:
-            if is_in(foot_prints[1].uid, foot_positions.get(limb_key)):
-                break
-            foot_prints.pop(0)
+        if start > 0 or end < count:
             was_pruned = True
+            del foot_prints[end:]
+            del foot_prints[:start]
 
     return was_pruned
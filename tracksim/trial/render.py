@@ -0,0 +1,131 @@
+"""
+Renders the reports of trials that have already been run, such as trials
+that were run with the "report" setting False to write only their results
+data. The settings of each trial are read from its stored results data file
+and the trial is run again with its report enabled. The stored outputs of its
+simulation and analysis stages are reused when they are up to date, so that
+only the report stage is run, and are otherwise computed again. Trials that
+were streamed, or that have no stored stage outputs, e.g. trials run with
+their cache disabled and their report enabled, cannot be rendered.
+"""
+
+import os
+import typing
+from concurrent import futures
+
+from tracksim import paths
+from tracksim import reader
+from tracksim import system
+from tracksim.group import simulate as simulate_group
+from tracksim.trial import simulate
+from tracksim.trial import stages
+
+
+def find_trials(patterns: typing.List[str] = None) -> typing.List[str]:
+    """
+    Returns the sorted identifiers of the stored trials whose identifiers
+    match any of the glob patterns, or of every stored trial if no patterns
+    are specified
+
+    :param patterns:
+        Trial identifiers or glob patterns of trial identifiers
+    """
+
+    out = set()
+    for pattern in patterns or ['*']:
+        listings = reader.listings('trial', matching_glob=pattern)
+        out.update([
+            trial_id
+            for trial_id, path in listings.items()
+            if os.path.exists(path)
+        ])
+
+    return sorted(out)
+
+
+def load_settings(trial_id: str) -> dict:
+    """
+    Returns the settings of the trial stored in its results data file
+
+    :param trial_id:
+        The identifier of the stored trial
+    """
+
+    return reader.trial(trial_id, sections=['settings'])['settings']
+
+
+def validate(trial_id: str) -> dict:
+    """
+    Returns the settings of the stored trial if its report can be rendered,
+    and otherwise raises a ValueError, i.e. if the trial was streamed or if
+    it has no stored stage outputs
+
+    :param trial_id:
+        The identifier of the stored trial
+    """
+
+    settings = load_settings(trial_id)
+
+    if settings.get('stream_window'):
+        raise ValueError(
+            'Trial "{}" was streamed and has no report to render'.format(
+                trial_id
+            )
+        )
+
+    if not stages.has_outputs(trial_id):
+        raise ValueError(' '.join([
+            'Trial "{}" has no stored stage outputs to render its report',
+            'from. Run it again with its report setting False or with its',
+            'cache enabled.'
+        ]).format(trial_id))
+
+    return settings
+
+
+def render_trial(trial_id: str) -> dict:
+    """
+    Renders the report of the stored trial from its stored stage outputs and
+    returns its results
+
+    :param trial_id:
+        The identifier of the stored trial
+    """
+
+    settings = validate(trial_id)
+
+    system.log('[{}]: RENDERING'.format(trial_id))
+    return simulate.execute(settings, stored=True, report=True, rerun=None)
+
+
+def render(
+        trial_ids: typing.List[str],
+        workers: int = None
+) -> typing.List[dict]:
+    """
+    Renders the reports of the stored trials and returns their results in
+    the same order as the trial identifiers. If workers is greater than 1, or
+    less than 1 to use one worker per CPU, the reports are rendered in
+    parallel within a process pool. A ValueError is raised before any report
+    is rendered if a trial cannot be rendered.
+
+    :param trial_ids:
+        The identifiers of the stored trials to render
+    :param workers:
+        The number of worker processes to use when rendering the reports
+    """
+
+    for trial_id in trial_ids:
+        validate(trial_id)
+
+    workers = simulate_group.get_worker_count(len(trial_ids), workers)
+
+    if workers < 2:
+        return [render_trial(trial_id) for trial_id in trial_ids]
+
+    with futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=simulate_group.initialize_worker,
+        initargs=(paths.overrides(),)
+    ) as executor:
+        return list(executor.map(render_trial, trial_ids))
@@ -0,0 +1,161 @@
+"""
+A memo of the per-limb position series computed by trials, which is enabled
+while a group or sweep runs its trials so that each distinct limb series is
+computed once and every trial that shares it reuses the stored arrays. The
+positions of a limb at a time step depend only on the track positions of the
+limb, its activity phase, the duty cycle and moving ambiguity of the trial
+and on the time step itself, and so trials that differ in other settings,
+such as their start and end times, share the same series.
+
+Each entry stores the series over a range of indexes within the full array
+of time steps of the trackway. A trial that requests time steps within that
+range is a hit, and otherwise the series is computed for the union of the
+stored and requested ranges and replaces the entry. Track indexes within the
+stored series are relative to all of the track positions of the limb.
+"""
+
+import contextlib
+import typing
+
+import numpy as np
+
+from tracksim import trackway
+
+# The memo used by the trials run within this process, or None if the trials
+# compute their position series directly
+_active = None
+
+
+class SeriesCache(object):
+    """
+    Stores the position series arrays of limbs by key along with the number
+    of requests that were found within the stored series (hits) and those
+    that had to be computed (misses)
+    """
+
+    def __init__(self):
+        self.entries = dict()
+        self.hits = 0
+        self.misses = 0
+
+    def counts(self) -> dict:
+        """ Returns the hit and miss counts of the memo """
+
+        return dict(hits=self.hits, misses=self.misses)
+
+    def fetch(
+            self,
+            key: tuple,
+            start: int,
+            end: int,
+            create: typing.Callable[[int, int], typing.Dict[str, np.ndarray]]
+    ) -> typing.Dict[str, np.ndarray]:
+        """
+        Returns copies of the series arrays for the time step indexes between
+        start and the exclusive end, computing them with the create function
+        when they are not already stored
+
+        :param key:
+            The key of the series, as returned by the create_key function
+        :param start:
+            The index of the first time step within the full time steps
+        :param end:
+            The index after the last time step
+        :param create:
+            A function that computes the series arrays for a start and
+            exclusive end index, with track indexes relative to all of the
+            track positions of the limb
+        """
+
+        entry = self.entries.get(key)
+
+        if entry and entry['start'] <= start and end <= entry['end']:
+            self.hits += 1
+        else:
+            self.misses += 1
+            first, last = start, end
+            if entry and start <= entry['end'] and entry['start'] <= end:
+                first = min(first, entry['start'])
+                last = max(last, entry['end'])
+
+            entry = dict(start=first, end=last, arrays=create(first, last))
+            self.entries[key] = entry
+
+        offset = start - entry['start']
+        return {
+            name: values[offset:offset + end - start].copy()
+            for name, values in entry['arrays'].items()
+        }
+
+
+def create_key(
+        limb_positions: typing.List[trackway.TrackPosition],
+        activity_phase: float,
+        settings: dict,
+        time_range: typing.Tuple[float, float]
+) -> tuple:
+    """
+    Returns the memo key for the position series of a limb, which includes
+    every input that the positions depend upon
+
+    :param limb_positions:
+        All of the track positions of the limb
+    :param activity_phase:
+        The activity phase for the limb
+    :param settings:
+        Configuration for the simulation trial
+    :param time_range:
+        The minimum and maximum times of the full time steps of the trackway
+    """
+
+    values = np.array(
+        [
+            (p.x.raw, p.y.raw, p.x.raw_uncertainty, p.y.raw_uncertainty)
+            for p in limb_positions
+        ],
+        dtype=float
+    )
+
+    return (
+        values.tobytes(),
+        len(limb_positions),
+        float(activity_phase),
+        float(settings['duty_cycle']),
+        float(settings['moving_ambiguity']),
+        int(settings['steps_per_cycle']),
+        tuple(float(t) for t in time_range)
+    )
+
+
+def active() -> typing.Union[SeriesCache, None]:
+    """ Returns the memo enabled within this process if one exists """
+
+    return _active
+
+
+def enable() -> SeriesCache:
+    """
+    Enables a new, empty memo for the trials run within this process and
+    returns it
+    """
+
+    global _active
+    _active = SeriesCache()
+    return _active
+
+
+@contextlib.contextmanager
+def enabled():
+    """
+    A context within which the trials run in this process share a memo of
+    their position series. The context yields the memo and restores the
+    previously enabled memo, if any, when it exits.
+    """
+
+    global _active
+    previous = _active
+
+    try:
+        yield enable()
+    finally:
+        _active = previous
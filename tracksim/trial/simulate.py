@@ -1,25 +1,79 @@
 import os
 import typing
 
+import numpy as np
+
 from tracksim import configs
 from tracksim import generate
 from tracksim import limb
+from tracksim import paths
 from tracksim import system
 from tracksim import trackway
-from tracksim.trial import analyze
+from tracksim.trial import cache
 from tracksim.trial import compute
 from tracksim.trial import prune
+from tracksim.trial import stages
+from tracksim.trial import streaming
+
+# Trial settings that only change how the results of a trial are written and
+# so are not included in the fingerprints of its stored stage outputs
+OUTPUT_SETTINGS = ['report', 'frame_decimals']
 
 
 def run(
         settings: typing.Union[str, dict],
         trackway_positions: trackway.TrackPosition = None,
         **kwargs
+) -> str:
+    """
+    Runs and analyzes a simulation of the trackway under the conditions
+    specified by the arguments and returns the url of the report for the
+    trial
+
+    :param settings:
+        Either a dictionary containing the configuration values for the trial
+        or an absolute path to a json format file that contains the
+        configuration values for the trial
+    :param trackway_positions:
+        A TrackwayDefinition instance populated with phase and position values
+    """
+
+    return execute(settings, trackway_positions, **kwargs)['url']
+
+
+def execute(
+        settings: typing.Union[str, dict],
+        trackway_positions: trackway.TrackPosition = None,
+        stage_outputs: dict = None,
+        stored: bool = False,
+        **kwargs
 ) -> dict:
     """
     Runs and analyzes a simulation of the trackway under the conditions
     specified by the arguments and returns a dictionary of results for the
-    trial
+    trial that contains:
+
+        - id: The identifier of the trial
+        - url: The url of the report for the trial
+        - couplings: A summary of the coupling analysis for the trial
+
+    The trial is run as the stages defined in the stages module. Unless the
+    "cache" setting is False, the results are restored from the trial cache
+    when the trial has already been run with the same settings, trackway data
+    and source code, and otherwise only the stages whose stored outputs are
+    out of date are run. The optional "rerun" setting lists the names of
+    stages to run again regardless of their stored outputs. When the "cache"
+    setting is False every stage is run, but the stage outputs of a trial
+    whose "report" setting is False are still stored so that its report can
+    be rendered from them later.
+
+    When the "stream_window" setting is specified, the trial is instead run
+    by the streaming module, which simulates and analyzes that many time steps
+    at a time so that very long trackways can be run in bounded memory. In
+    that case the url is the location of the results data file, since no
+    report is rendered. The same is true when the "report" setting is False,
+    which writes only the results data file of the trial so that its report
+    can be rendered later by the render module.
 
     :param settings:
         Either a dictionary containing the configuration values for the trial
@@ -27,9 +81,138 @@ def run(
         configuration values for the trial
     :param trackway_positions:
         A TrackwayDefinition instance populated with phase and position values
+    :param stage_outputs:
+        An optional dictionary of stage outputs by name shared by equivalent
+        trials, i.e. trials that differ only in settings that are used by the
+        report stage. When it contains outputs they are used in place of
+        running those stages, and otherwise it is populated with the outputs
+        of every stage but the report stage once the trial has been run.
+    :param stored:
+        Whether or not the trial is being rendered from its stored stage
+        outputs, which are then reused even if its "cache" setting is False
     """
 
     settings = configs.load('trial', settings, **kwargs)
+    apply_defaults(settings)
+
+    system.log('[{}]: STARTING'.format(settings['id']))
+
+    activity_phases = load_activity_phases(settings)
+
+    # Trackway positions that are specified directly are not part of the
+    # settings and so cannot be included in the cache keys
+    data_path = get_data_path(settings)
+    is_keyed = (
+        not trackway_positions and
+        (data_path is None or os.path.exists(data_path))
+    )
+    use_cache = is_keyed and cache.is_enabled(settings)
+
+    # Trials that only write their results data store their stage outputs so
+    # that their reports can be rendered from them
+    store_stages = is_keyed and (
+        use_cache or
+        stored or
+        not settings.get('report', True)
+    )
+
+    report_directory = paths.results('reports', 'trial', settings['id'])
+    settings_key = None
+    cache_key = None
+    rerun = settings.get('rerun')
+
+    if store_stages:
+        settings_key = cache.create_key(
+            dict([
+                (key, value)
+                for key, value in settings.items()
+                if key not in OUTPUT_SETTINGS
+            ]),
+            data_path
+        )
+
+    if store_stages and not (use_cache or stored):
+        # The stored outputs are replaced, but never reused, when the cache
+        # is disabled
+        rerun = stages.NAMES
+
+    if use_cache:
+        source_fingerprint = stages.fingerprint_sources()
+        if settings.get('stream_window'):
+            source_fingerprint += stages.fingerprint_source(streaming.__file__)
+
+        cache_key = cache.create_key(settings, data_path, source_fingerprint)
+
+    if cache_key and not settings.get('rerun'):
+        cached = cache.fetch(cache_key, report_directory)
+        if cached is not None:
+            system.log('[{}]: RESTORED FROM CACHE'.format(settings['id']))
+            return cached
+
+    outputs = dict()
+    if trackway_positions:
+        trackway_definition = trackway.TrackwayDefinition(
+            load_trackway_positions(settings, trackway_positions),
+            activity_phases
+        )
+        trackway_definition.reorient_positions()
+        outputs['trackway'] = trackway_definition
+
+    if stage_outputs:
+        system.log('[{}]: REUSING EQUIVALENT TRIAL STAGES'.format(
+            settings['id']
+        ))
+        outputs.update(stage_outputs)
+
+        if settings.get('report', True):
+            # The outputs of an equivalent trial are only stored for this
+            # trial when they are needed to render its report later
+            settings_key = None
+
+    if settings.get('stream_window'):
+        report = streaming.run(
+            settings,
+            outputs.get('trackway') or stages.create_trackway(settings)
+        )
+    else:
+        outputs = stages.run(
+            settings,
+            settings_key=settings_key,
+            rerun=rerun,
+            outputs=outputs
+        )
+        report = outputs.pop('report')
+
+        if stage_outputs is not None:
+            stage_outputs.update(outputs)
+
+    system.log('[{}]: COMPLETED'.format(settings['id']))
+
+    result = dict(
+        id=settings['id'],
+        **report
+    )
+
+    if cache_key:
+        cache.store(
+            cache_key,
+            report_directory,
+            result,
+            settings.get('cache_size', cache.DEFAULT_MAX_SIZE)
+        )
+
+    return result
+
+
+def apply_defaults(settings: dict) -> dict:
+    """
+    Adds default values to the trial settings for any simulation
+    configuration values that have not been specified and returns the
+    settings for method chaining
+
+    :param settings:
+        Configuration for the simulation trial
+    """
 
     if 'steps_per_cycle' not in settings:
         settings['steps_per_cycle'] = 20
@@ -39,38 +222,81 @@ def run(
     if 'duty_cycle' not in settings:
         settings['duty_cycle'] = 0.6
 
-    system.log('[{}]: STARTING'.format(settings['id']))
-
-    activity_phases = load_activity_phases(settings)
-    trackway_positions = load_trackway_positions(settings, trackway_positions)
+    return settings
 
-    trackway_definition = trackway.TrackwayDefinition(
-        trackway_positions,
-        activity_phases
-    )
-    trackway_definition.reorient_positions()
 
-    foot_positions = limb.Property()
+def simulate(
+        settings: dict,
+        trackway_definition: trackway.TrackwayDefinition
+) -> dict:
+    """
+    Simulates the foot positions over time for a trackway definition that has
+    already been reoriented and returns a dictionary with the "time_steps"
+    and "foot_positions" of the simulation, as well as the "window" of start
+    and end indexes of those time steps within the full range of generated
+    time steps. Only the time steps and track positions that can be within
+    the window are simulated. Track positions that are not used
+    by the simulation are pruned from the trackway definition, which is
+    reoriented again along with the foot positions when that happens.
+
+    When the trial is event-driven, the time steps are the times at which the
+    motion of any limb changes instead of uniformly spaced time steps, and
+    the dictionary also contains the "source" trackway definition and
+    orientation used by the resample function.
 
-    time_steps = list(generate.time_steps_from_data(
-        settings['steps_per_cycle'],
-        trackway_definition
-    ))
+    :param settings:
+        Configuration for the simulation trial
+    :param trackway_definition:
+        The reoriented trackway positions and activity phases for the trial
+    """
 
-    for key in limb.KEYS:
-        out = compute.positions_over_time(
-            time_steps=time_steps,
-            limb_positions=trackway_definition.limb_positions.get(key),
-            activity_phase=trackway_definition.activity_phases.get(key),
-            settings=settings
+    source = None
+    if is_event_driven(settings):
+        # Positions are resampled uniformly from the unpruned trackway when
+        # the report needs them
+        source = trackway.TrackwayDefinition(
+            trackway.clone_positions(trackway_definition.limb_positions),
+            trackway_definition.activity_phases
         )
-        foot_positions.set(key, out)
+        time_steps = list(generate.event_time_steps(
+            trackway_definition,
+            settings['duty_cycle']
+        ))
+        offset = 0
+        step_offset = None
+        track_ranges = None
+    else:
+        offset, time_steps = restricted_time_steps(
+            settings,
+            trackway_definition
+        )
+        time_steps = list(time_steps)
+        step_offset = offset
+        track_ranges = compute.track_ranges(
+            time_steps[0],
+            time_steps[-1],
+            trackway_definition,
+            margin=2
+        ) if time_steps else None
+
+    foot_positions = compute.to_track_position_arrays(
+        compute.trackway_positions_over_time_arrays(
+            time_steps=time_steps,
+            trackway_definition=trackway_definition,
+            settings=settings,
+            track_ranges=track_ranges,
+            step_offset=step_offset
+        ),
+        trackway_definition,
+        track_ranges
+    )
 
-    prune.invalid_positions(
+    window = prune.invalid_positions(
         settings,
         time_steps,
         foot_positions
     )
+    window = (window[0] + offset, window[1] + offset)
 
     if len(time_steps) < 1:
         system.log(
@@ -83,32 +309,142 @@ def run(
             """.format(settings['id']))
         raise ValueError('Invalid Results')
 
-    system.log('[{}]: ANALYZING'.format(settings['id']))
-
     reorientation_needed = prune.unused_foot_prints(
         trackway_definition.limb_positions,
         foot_positions
     )
 
+    orientation = None
     if reorientation_needed:
         # Reorient positions again now that the trackway has been pruned
-        trackway_definition.reorient_positions(
-            *foot_positions.left_pes,
-            *foot_positions.right_pes,
-            *foot_positions.left_manus,
-            *foot_positions.right_manus
-        )
+        orientation = trackway_definition.get_orientation()
+        trackway_definition.reorient_positions(*foot_positions.values())
 
-    url = analyze.create(
-        track_definition=trackway_definition,
-        settings=settings,
+    out = dict(
         time_steps=time_steps,
-        foot_positions=foot_positions
+        foot_positions=foot_positions,
+        window=window
     )
 
-    system.log('[{}]: COMPLETED'.format(settings['id']))
+    if source:
+        out['source'] = dict(
+            trackway_definition=source,
+            orientation=orientation
+        )
+
+    return out
+
+
+def restricted_time_steps(
+        settings: dict,
+        trackway_definition: trackway.TrackwayDefinition
+) -> typing.Tuple[int, np.ndarray]:
+    """
+    Returns the time steps of the simulation that can be within the valid
+    window of the trial, which is limited by its start and end times and by
+    the times at which the positions of every limb are valid, along with the
+    index of the first of them within the full range of time steps. Only a
+    single time step on either side of the window is included, so that long
+    trackways simulated over a few cycles do not compute positions for every
+    time step of the trackway.
 
-    return url
+    :param settings:
+        Configuration for the simulation trial
+    :param trackway_definition:
+        The reoriented trackway positions and activity phases for the trial
+    """
+
+    steps_per_cycle = settings['steps_per_cycle']
+    min_time, max_time = generate.time_range(trackway_definition)
+    first_time, last_time = prune.valid_time_range(
+        settings,
+        trackway_definition
+    )
+
+    if last_time < first_time:
+        return 0, np.zeros(0)
+
+    start = max(0, generate.time_step_index(
+        steps_per_cycle,
+        min_time,
+        max_time,
+        first_time
+    ) - 1)
+    end = generate.time_step_index(
+        steps_per_cycle,
+        min_time,
+        max_time,
+        last_time
+    ) + 2
+
+    return start, generate.time_step_slice(
+        steps_per_cycle,
+        min_time,
+        max_time,
+        start,
+        end
+    )
+
+
+def is_event_driven(settings: dict) -> bool:
+    """
+    Whether or not the trial is simulated only at the times when the motion
+    of a limb changes, which is enabled by a "sampling" setting of "events",
+    instead of at the uniformly spaced time steps of the steps_per_cycle
+    setting
+
+    :param settings:
+        Configuration for the simulation trial
+    """
+
+    return settings.get('sampling') == 'events'
+
+
+def resample(settings: dict, simulation: dict) -> dict:
+    """
+    Computes the foot positions of an event-driven simulation at uniformly
+    spaced time steps, as they would be computed by a simulation without
+    event-driven sampling, for the times spanned by the simulation. Returns a
+    dictionary with the "time_steps" and "foot_positions" of the resampled
+    simulation.
+
+    :param settings:
+        Configuration for the simulation trial
+    :param simulation:
+        The output of the simulate function for an event-driven trial
+    """
+
+    source = simulation['source']
+    time_steps = generate.time_steps_from_data(
+        settings['steps_per_cycle'],
+        source['trackway_definition']
+    )
+
+    # Small tolerances include uniform steps that match the rounded event
+    # times at the ends of the simulation
+    first = simulation['time_steps'][0] - 1e-12
+    last = simulation['time_steps'][-1] + 1e-12
+    time_steps = time_steps[(time_steps >= first) & (time_steps <= last)]
+
+    foot_positions = compute.to_track_position_arrays(
+        compute.trackway_positions_over_time_arrays(
+            time_steps=time_steps,
+            trackway_definition=source['trackway_definition'],
+            settings=settings
+        ),
+        source['trackway_definition']
+    )
+
+    if source['orientation']:
+        trackway.apply_orientation(
+            source['orientation'],
+            *foot_positions.values()
+        )
+
+    return dict(
+        time_steps=list(time_steps),
+        foot_positions=foot_positions
+    )
 
 
 def load_activity_phases(settings: dict) -> limb.Property:
@@ -154,6 +490,25 @@ def load_activity_phases(settings: dict) -> limb.Property:
     return out.assign(**source)
 
 
+def get_data_path(settings: dict) -> typing.Union[str, None]:
+    """
+    Returns the absolute path to the trackway data file specified by the
+    settings, or None if the trackway positions are generated from the
+    settings instead
+
+    :param settings:
+        Configuration for the simulation trial
+    """
+
+    data = settings.get('data')
+    if not isinstance(data, str):
+        return None
+
+    if not data.startswith('/'):
+        data = os.path.join(settings['path'], data)
+    return data
+
+
 def load_trackway_positions(
         settings: dict,
         existing: limb.Property = None,
@@ -181,8 +536,7 @@ def load_trackway_positions(
 
     if isinstance(data, str):
         # Load from a specified file
-        if not data.startswith('/'):
-            data = os.path.join(settings['path'], data)
+        data = get_data_path(settings)
         if not os.path.exists(data):
             system.log(
                 """
@@ -0,0 +1,599 @@
+"""
+The trial pipeline expressed as a graph of named stages. Each stage declares
+the names of the stages whose outputs it uses as inputs, along with the
+source modules that implement it. The output of a persisted stage is stored
+within the results directory along with a fingerprint of the trial settings,
+the stage's source code and the fingerprints of its inputs, where the source
+code includes every tracksim module that its sources import directly or
+indirectly, and is reused whenever a later run of the trial produces the same
+fingerprint. The report stage writes files instead of producing reusable data
+and so it is always run, which means that changing a report template or a
+single analysis module only runs the report and the analysis stages that
+changed. When the "report" setting of a trial is False, the report stage
+writes only the results data file, and the report can be rendered later by
+the render module from the stored outputs of the other stages, which are
+stored for such trials even when their cache is disabled.
+"""
+
+import ast
+import collections
+import functools
+import hashlib
+import os
+import pickle
+import shutil
+import types
+import typing
+
+import tracksim
+from tracksim import configs
+from tracksim import generate
+from tracksim import limb
+from tracksim import mixture
+from tracksim import paths
+from tracksim import reporting
+from tracksim import svg
+from tracksim import system
+from tracksim import trackway
+from tracksim.trial import analyze
+from tracksim.trial import compute
+from tracksim.trial import prune
+from tracksim.trial import series_cache
+from tracksim.trial import simulate
+from tracksim.trial import trackways
+from tracksim.trial.analyze import advancement
+from tracksim.trial.analyze import coupling
+from tracksim.trial.analyze.coupling import coupling_arrays
+from tracksim.trial.analyze import separation
+from tracksim.trial.analyze import tangent
+
+Stage = collections.namedtuple(
+    'Stage',
+    ['name', 'inputs', 'sources', 'run', 'persist']
+)
+
+
+def create_trackway(settings: dict) -> trackway.TrackwayDefinition:
+    shared = trackways.find(settings)
+    if shared is not None:
+        # Shared positions have already been reoriented
+        return trackway.TrackwayDefinition(
+            shared,
+            simulate.load_activity_phases(settings)
+        )
+
+    definition = trackway.TrackwayDefinition(
+        simulate.load_trackway_positions(settings),
+        simulate.load_activity_phases(settings)
+    )
+    definition.reorient_positions()
+    return definition
+
+
+def create_simulation(
+        settings: dict,
+        track_definition: trackway.TrackwayDefinition
+) -> dict:
+    out = simulate.simulate(settings, track_definition)
+    out['track_definition'] = track_definition
+    out['times'] = analyze.make_time_data(out['time_steps'], settings)
+    return out
+
+
+def create_report(
+        settings: dict,
+        simulation: dict,
+        coupling_data: dict,
+        separation_data: dict,
+        advancement_data: dict,
+        tangent_data: dict
+) -> dict:
+    if not settings.get('report', True):
+        return analyze.write_results(
+            settings=settings,
+            track_definition=simulation['track_definition'],
+            foot_positions=simulation['foot_positions'],
+            times=simulation['times'],
+            coupling_data=coupling_data,
+            advancement_data=advancement_data,
+            tangent_data=tangent_data
+        )
+
+    return analyze.write_report(
+        settings=settings,
+        track_definition=simulation['track_definition'],
+        foot_positions=simulation['foot_positions'],
+        times=simulation['times'],
+        coupling_data=coupling_data,
+        separation_data=separation_data,
+        advancement_data=advancement_data,
+        tangent_data=tangent_data,
+        animation=create_animation(settings, simulation)
+    )
+
+
+def create_animation(settings: dict, simulation: dict) -> dict:
+    """
+    Creates the uniformly sampled data used to animate the report of an
+    event-driven trial, or returns None for trials that are already sampled
+    uniformly
+    """
+
+    if 'source' not in simulation:
+        return None
+
+    resampled = simulate.resample(settings, simulation)
+    foot_positions = resampled['foot_positions']
+
+    # The resampled time steps are uniformly spaced
+    uniform_settings = dict(settings, sampling=None)
+
+    return dict(
+        foot_positions=foot_positions,
+        times=analyze.make_time_data(
+            resampled['time_steps'],
+            uniform_settings
+        ),
+        coupling_data=coupling_arrays.calculate_positions(foot_positions),
+        tangent_data=tangent.calculate(foot_positions)
+    )
+
+
+STAGES = [
+    Stage(
+        name='trackway',
+        inputs=[],
+        sources=[configs, generate, trackway, trackways],
+        run=create_trackway,
+        persist=True
+    ),
+    Stage(
+        name='simulation',
+        inputs=['trackway'],
+        sources=[simulate, compute, series_cache, prune, limb],
+        run=create_simulation,
+        persist=True
+    ),
+    Stage(
+        name='coupling',
+        inputs=['simulation'],
+        sources=[coupling, mixture],
+        run=lambda settings, simulation: coupling.calculate(
+            simulation['foot_positions'],
+            simulation['times']
+        ),
+        persist=True
+    ),
+    Stage(
+        name='separation',
+        inputs=['simulation'],
+        sources=[separation],
+        run=lambda settings, simulation: separation.calculate(
+            simulation['foot_positions'],
+            simulation['times']
+        ),
+        persist=True
+    ),
+    Stage(
+        name='advancement',
+        inputs=['simulation'],
+        sources=[advancement],
+        run=lambda settings, simulation: advancement.calculate(
+            simulation['foot_positions'],
+            simulation['times']
+        ),
+        persist=True
+    ),
+    Stage(
+        name='tangent',
+        inputs=['simulation'],
+        sources=[tangent],
+        run=lambda settings, simulation: tangent.calculate(
+            simulation['foot_positions']
+        ),
+        persist=True
+    ),
+    Stage(
+        name='report',
+        inputs=[
+            'simulation',
+            'coupling',
+            'separation',
+            'advancement',
+            'tangent'
+        ],
+        sources=[
+            analyze.__file__,
+            reporting,
+            svg,
+            paths.resource('reports')
+        ],
+        run=create_report,
+        persist=False
+    )
+]
+
+NAMES = [stage.name for stage in STAGES]
+
+# Modules that run trials instead of computing the outputs of stages, which
+# are never treated as the imported sources of a stage. This module is part
+# of every stage's sources instead, since it defines several of the stages.
+RUNNER_MODULES = [
+    'tracksim.trial.stages',
+    'tracksim.trial.cache',
+    'tracksim.trial.streaming'
+]
+
+
+@functools.lru_cache(maxsize=None)
+def fingerprint_source(source: str) -> str:
+    """
+    Returns a hash of the contents of the source file, or of every file
+    within the source directory
+
+    :param source:
+        The path to a source file or directory
+    """
+
+    digest = hashlib.sha256()
+
+    if os.path.isdir(source):
+        filenames = []
+        for root, _, names in os.walk(source):
+            if '__pycache__' in root:
+                continue
+            filenames += [os.path.join(root, n) for n in names]
+    else:
+        filenames = [source]
+
+    for filename in sorted(filenames):
+        if filename.endswith('.pyc'):
+            continue
+        digest.update(os.path.relpath(filename, source).encode())
+        with open(filename, 'rb') as f:
+            digest.update(f.read())
+
+    return digest.hexdigest()
+
+
+def get_source_path(source: typing.Union[str, types.ModuleType]) -> str:
+    """
+    Returns the path to the source of a stage, which is the directory of a
+    package, the file of a module or the source itself if it is a path
+    """
+
+    if isinstance(source, str):
+        return source
+
+    if hasattr(source, '__path__'):
+        return os.path.dirname(source.__file__)
+    return source.__file__
+
+
+@functools.lru_cache(maxsize=None)
+def find_imports(path: str) -> typing.Tuple[str, ...]:
+    """
+    Returns the names of the tracksim modules, or of the attributes within
+    them, that are imported by the Python source file. Attribute names are
+    returned along with the name of their module, since "from a import b"
+    may import either a module or an attribute.
+
+    :param path:
+        The path to a Python source file
+    """
+
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.append(node.module)
+            names += [
+                '{}.{}'.format(node.module, alias.name)
+                for alias in node.names
+            ]
+
+    return tuple([
+        name for name in names
+        if name == 'tracksim' or name.startswith('tracksim.')
+    ])
+
+
+def find_module_path(name: str) -> typing.Union[str, None]:
+    """
+    Returns the path to the source file of the tracksim module with the
+    specified name, or None if the name is not a module, without importing it
+
+    :param name:
+        The full name of the module, e.g. "tracksim.trial.compute"
+    """
+
+    root = os.path.dirname(tracksim.__file__)
+    location = os.path.join(root, *name.split('.')[1:])
+
+    for path in [os.path.join(location, '__init__.py'), location + '.py']:
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_sources(stage_name: str) -> typing.Tuple[str, ...]:
+    """
+    Returns the sorted paths of every source of the stage, which are its
+    declared sources, this module and every tracksim module imported by them
+    directly or indirectly, other than the RUNNER_MODULES. Helper modules
+    therefore change the fingerprint of each stage that uses them without
+    having to be declared.
+
+    :param stage_name:
+        The name of the stage
+    """
+
+    stage = STAGES[NAMES.index(stage_name)]
+    declared = [get_source_path(source) for source in stage.sources]
+    out = set(declared + [__file__])
+
+    pending = []
+    for path in declared:
+        if os.path.isdir(path):
+            for root, _, filenames in os.walk(path):
+                pending += [
+                    os.path.join(root, n)
+                    for n in filenames
+                    if n.endswith('.py')
+                ]
+        elif path.endswith('.py'):
+            pending.append(path)
+
+    visited = set()
+    while pending:
+        path = pending.pop()
+        if path in visited:
+            continue
+        visited.add(path)
+
+        for name in find_imports(path):
+            module_path = find_module_path(name)
+            if not module_path or name in RUNNER_MODULES:
+                continue
+
+            pending.append(module_path)
+            if not any([
+                module_path.startswith(d + os.sep)
+                for d in declared
+                if os.path.isdir(d)
+            ]):
+                out.add(module_path)
+
+    return tuple(sorted(out))
+
+
+def create_fingerprint(
+        stage: Stage,
+        settings_key: str,
+        input_fingerprints: typing.List[str]
+) -> str:
+    """
+    Creates the fingerprint for a stage's output from the fingerprints of
+    everything that can change it
+
+    :param stage:
+        The stage for which to create the fingerprint
+    :param settings_key:
+        The cache key of the trial's settings and trackway data
+    :param input_fingerprints:
+        The fingerprints of the stage's inputs in order
+    """
+
+    digest = hashlib.sha256()
+    digest.update(stage.name.encode())
+    digest.update(settings_key.encode())
+
+    for path in get_sources(stage.name):
+        digest.update(fingerprint_source(path).encode())
+
+    for value in input_fingerprints:
+        digest.update(value.encode())
+
+    return digest.hexdigest()
+
+
+def fingerprint_sources() -> str:
+    """
+    Returns a hash of the source code of every stage, which changes whenever
+    the code used to produce a trial's results changes
+    """
+
+    digest = hashlib.sha256()
+    for stage in STAGES:
+        for path in get_sources(stage.name):
+            digest.update(fingerprint_source(path).encode())
+    return digest.hexdigest()
+
+
+def directory(trial_id: str, *args: str) -> str:
+    """
+    Returns the path to the directory where the stage outputs of the trial
+    are stored, or to a location within it specified by the args
+    """
+
+    return paths.results('cache', 'stages', trial_id, *args)
+
+
+def has_outputs(trial_id: str) -> bool:
+    """
+    Whether or not an output is stored for every persisted stage of the
+    trial, whatever the fingerprints that they were stored with
+
+    :param trial_id:
+        The identifier of the trial
+    """
+
+    return all([
+        os.path.exists(directory(trial_id, '{}.pickle'.format(stage.name)))
+        for stage in STAGES
+        if stage.persist
+    ])
+
+
+def load_output(
+        trial_id: str,
+        stage: Stage,
+        fingerprint: str
+) -> typing.Tuple[bool, typing.Any]:
+    """
+    Loads the stored output of the stage for the trial if it was stored with
+    the same fingerprint. Returns whether or not the output was found, and
+    the output itself.
+    """
+
+    path = directory(trial_id, '{}.pickle'.format(stage.name))
+
+    try:
+        with open(path, 'rb') as f:
+            stored = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return False, None
+
+    if stored.get('fingerprint') != fingerprint:
+        return False, None
+
+    return True, stored['output']
+
+
+def save_output(
+        trial_id: str,
+        stage: Stage,
+        fingerprint: str,
+        output: typing.Any
+):
+    """
+    Stores the output of the stage for the trial along with its fingerprint,
+    replacing any output previously stored for the stage
+    """
+
+    path = directory(trial_id, '{}.pickle'.format(stage.name))
+    folder = os.path.dirname(path)
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+
+    staging = '{}.{}.tmp'.format(path, os.getpid())
+    with open(staging, 'wb') as f:
+        pickle.dump(
+            dict(fingerprint=fingerprint, output=output),
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+    os.replace(staging, path)
+
+
+def get_dependents(names: typing.Iterable[str]) -> typing.Set[str]:
+    """
+    Returns the names of the specified stages and of every stage that
+    depends on them, directly or indirectly
+
+    :param names:
+        Names of the stages
+    """
+
+    out = set(names)
+    for stage in STAGES:
+        if out.intersection(stage.inputs):
+            out.add(stage.name)
+    return out
+
+
+def run(
+        settings: dict,
+        settings_key: str = None,
+        rerun: typing.Iterable[str] = None,
+        outputs: dict = None
+) -> dict:
+    """
+    Runs the stages of the trial pipeline in order and returns a dictionary
+    with the output of each stage by name. Stage outputs are memoized when a
+    settings key is specified, so that only the stages whose fingerprints
+    have changed since the trial was last run are executed.
+
+    :param settings:
+        Configuration for the simulation trial, which must have already been
+        loaded and had its defaults applied
+    :param settings_key:
+        The cache key for the trial's settings and trackway data, which is
+        used in each stage's fingerprint. When None, the stage outputs are
+        neither loaded nor stored.
+    :param rerun:
+        Names of stages that should be run again even if they have stored
+        outputs with matching fingerprints, along with the stages that depend
+        on them
+    :param outputs:
+        Outputs that have already been created for stages by name, e.g. a
+        trackway definition created from positions that were not loaded from
+        the settings. These stages are not run. When a settings key is
+        specified the outputs must be those that the settings describe, such
+        as the outputs of an equivalent trial, and they are stored for this
+        trial.
+    """
+
+    unknown = [name for name in (rerun or []) if name not in NAMES]
+    if unknown:
+        raise ValueError('Unknown trial stages "{}"'.format(
+            '", "'.join(unknown)
+        ))
+
+    forced = get_dependents(rerun or [])
+    trial_id = settings['id']
+
+    outputs = dict(outputs or dict())
+    fingerprints = dict()
+
+    for stage in STAGES:
+        if settings_key is None or not stage.persist:
+            if stage.name not in outputs:
+                inputs = [outputs[name] for name in stage.inputs]
+                outputs[stage.name] = stage.run(settings, *inputs)
+            continue
+
+        fingerprint = create_fingerprint(
+            stage,
+            settings_key,
+            [fingerprints[name] for name in stage.inputs]
+        )
+        fingerprints[stage.name] = fingerprint
+
+        if stage.name in outputs:
+            save_output(trial_id, stage, fingerprint, outputs[stage.name])
+            continue
+
+        inputs = [outputs[name] for name in stage.inputs]
+
+        found = False
+        if stage.name not in forced:
+            found, output = load_output(trial_id, stage, fingerprint)
+
+        if found:
+            system.log('[{}]: REUSING {} STAGE'.format(
+                trial_id,
+                stage.name.upper()
+            ))
+        else:
+            output = stage.run(settings, *inputs)
+            save_output(trial_id, stage, fingerprint, output)
+
+        outputs[stage.name] = output
+
+    return outputs
+
+
+def clear():
+    """
+    Removes the stored stage outputs of every trial
+    """
+
+    root = paths.results('cache', 'stages')
+    if os.path.exists(root):
+        shutil.rmtree(root)
@@ -0,0 +1,611 @@
+"""
+Bounded-memory simulation and analysis of trials over very long trackways.
+Instead of computing the foot positions for every time step at once, the
+time steps are generated in fixed-size windows that flow through a pipeline
+of generators. The foot positions of each window are fed to accumulators for
+the coupling, stride and separation analyses and are then written to a
+chunk file within the trial's report directory and discarded, so that the
+memory used by a trial depends on the window size and the number of track
+positions rather than the number of time steps.
+
+The results match those of the staged trial pipeline. A first pass over the
+windows finds the valid window of time steps and the track positions that
+are used, which determines the orientation that the full pipeline applies
+after pruning the unused track positions. The second pass then computes the
+foot positions of each window and applies that orientation to them.
+"""
+
+import os
+import shutil
+import typing
+
+import numpy as np
+
+from tracksim import events
+from tracksim import generate
+from tracksim import limb
+from tracksim import paths
+from tracksim import reader
+from tracksim import reporting
+from tracksim import system
+from tracksim import trackway
+from tracksim import uncertain
+from tracksim.trial import compute
+from tracksim.trial import prune
+from tracksim.trial.analyze import advancement
+from tracksim.trial.analyze import coupling
+from tracksim.trial.analyze.coupling import coupling_arrays
+
+CHUNK_FOLDER = 'chunks'
+
+SEPARATION_PAIRS = [
+    ('left_lengths', limb.LEFT_PES, limb.LEFT_MANUS),
+    ('right_lengths', limb.RIGHT_PES, limb.RIGHT_MANUS),
+    ('forward_lengths', limb.LEFT_MANUS, limb.RIGHT_MANUS),
+    ('rear_lengths', limb.LEFT_PES, limb.RIGHT_PES)
+]
+
+
+def get_window_size(settings: dict) -> int:
+    """
+    Returns the number of time steps in each window of a streamed trial,
+    which is specified by the "stream_window" setting
+
+    :param settings:
+        Configuration for the simulation trial
+    """
+
+    window_size = int(settings['stream_window'])
+    if window_size < 2:
+        raise ValueError('The stream window must contain at least 2 steps')
+    return window_size
+
+
+def array_windows(
+        settings: dict,
+        trackway_definition: trackway.TrackwayDefinition,
+        start: int = 0,
+        end: int = None
+) -> typing.Iterator[typing.Tuple[int, np.ndarray, limb.Property]]:
+    """
+    Generates the structure-of-arrays foot positions for each limb, as
+    returned by compute.positions_over_time_arrays, one window of time steps
+    at a time. Each window is yielded as a tuple containing the index of its
+    first time step, the time steps and the limb Property of position arrays.
+
+    :param settings:
+        Configuration for the simulation trial
+    :param trackway_definition:
+        The reoriented trackway positions and activity phases for the trial
+    :param start:
+        The index of the first time step to simulate
+    :param end:
+        The index after the last time step to simulate
+    """
+
+    windows = generate.time_step_windows(
+        settings['steps_per_cycle'],
+        *generate.time_range(trackway_definition),
+        window_size=get_window_size(settings),
+        start=start,
+        end=end
+    )
+
+    for offset, time_steps in windows:
+        yield offset, time_steps, compute.trackway_positions_over_time_arrays(
+            time_steps=time_steps,
+            trackway_definition=trackway_definition,
+            settings=settings
+        )
+
+
+def find_valid_window(
+        settings: dict,
+        trackway_definition: trackway.TrackwayDefinition
+) -> typing.Tuple[int, int, limb.Property]:
+    """
+    Makes a pass over every time step of the simulation to find the start
+    and end indexes of the valid window of time steps, as defined by the
+    prune.valid_window function, along with the uids of the track positions
+    used by each limb within that window
+
+    :param settings:
+        Configuration for the simulation trial
+    :param trackway_definition:
+        The reoriented trackway positions and activity phases for the trial
+    :return:
+        The start index, the exclusive end index and a limb Property that
+        contains the set of used track position uids for each limb
+    """
+
+    start = None
+    end = 0
+    used_indexes = dict([(key, set()) for key in limb.KEYS])
+
+    for offset, time_steps, arrays in array_windows(
+            settings,
+            trackway_definition
+    ):
+        mask = (
+            (time_steps >= settings.get('start_time', 0)) &
+            (time_steps <= settings.get('end_time', 1e8))
+        )
+        for key in limb.KEYS:
+            mask &= arrays.get(key)['valid']
+
+        indexes = np.flatnonzero(mask)
+        if len(indexes) < 1:
+            continue
+
+        if start is None:
+            start = offset + int(indexes[0])
+        end = offset + int(indexes[-1]) + 1
+
+        # The valid positions of every limb form a single continuous range of
+        # time steps, so the mask covers the same steps as the final window
+        for key in limb.KEYS:
+            track_index = arrays.get(key)['track_index'][mask]
+            used_indexes[key].update(track_index[track_index >= 0].tolist())
+
+    used_uids = limb.Property()
+    for key in limb.KEYS:
+        prints = trackway_definition.limb_positions.get(key)
+        used_uids.set(key, set([prints[i].uid for i in used_indexes[key]]))
+
+    return (start or 0), end, used_uids
+
+
+def position_windows(
+        settings: dict,
+        trackway_definition: trackway.TrackwayDefinition,
+        start: int,
+        end: int,
+        orientation: tuple = None
+) -> typing.Iterator[typing.Tuple[int, np.ndarray, limb.Property]]:
+    """
+    Generates the foot positions of each limb as TrackPositionArray instances
+    one window of time steps at a time, in the same fashion as the
+    array_windows function
+
+    :param settings:
+        Configuration for the simulation trial
+    :param trackway_definition:
+        The trackway definition from which the positions are computed
+    :param start:
+        The index of the first time step to simulate
+    :param end:
+        The index after the last time step to simulate
+    :param orientation:
+        An optional orientation, as returned by the get_orientation method of
+        a TrackwayDefinition, that is applied to the positions
+    """
+
+    for offset, time_steps, arrays in array_windows(
+            settings,
+            trackway_definition,
+            start,
+            end
+    ):
+        foot_positions = compute.to_track_position_arrays(
+            arrays,
+            trackway_definition
+        )
+
+        if orientation:
+            trackway.apply_orientation(orientation, *foot_positions.values())
+
+        yield offset - start, time_steps, foot_positions
+
+
+class CouplingAccumulator(object):
+    """
+    Accumulates the coupling analysis over windows of foot positions. Only
+    the sampled coupling lengths are retained between windows, along with
+    the last two coupler positions of the previous window, which are needed
+    to calculate the advance at the boundary between windows using a central
+    difference.
+    """
+
+    def __init__(self):
+        self.indexes = []
+        self.cycles = []
+        self.values = []
+        self.uncertainties = []
+        self.time_delta = None
+        self.tail = None
+
+    def add(
+            self,
+            offset: int,
+            time_steps: np.ndarray,
+            foot_positions: limb.Property
+    ) -> typing.Dict[str, np.ndarray]:
+        """
+        Adds the window of foot positions to the coupling analysis and returns
+        the columns of the coupler advance values calculated for the window
+
+        :param offset:
+            The index of the first time step of the window
+        :param time_steps:
+            The cycle times of the time steps in the window
+        :param foot_positions:
+            The foot positions of each limb within the window
+        """
+
+        rear, forward = coupling_arrays.calculate_couplers(foot_positions)
+
+        indexes = coupling_arrays.sample_indexes(time_steps)
+        values, uncertainties = uncertain.distances(
+            tuple([column[indexes] for column in rear]),
+            tuple([column[indexes] for column in forward])
+        )
+        self.indexes.append(indexes + offset)
+        self.cycles.append(time_steps[indexes])
+        self.values.append(values)
+        self.uncertainties.append(uncertainties)
+
+        if self.time_delta is None:
+            self.time_delta = time_steps[1] - time_steps[0]
+
+        current = dict(
+            offset=offset,
+            cycles=time_steps,
+            rear=rear,
+            forward=forward,
+            fixed=dict([
+                (key, coupling_arrays.fixed_mask(foot_positions.get(key)))
+                for key in limb.KEYS
+            ])
+        )
+        combined = join_windows(self.tail, current)
+        self.tail = slice_window(combined, -2)
+
+        out = dict()
+        pairs = [
+            ('rear_advance', limb.LEFT_PES, limb.RIGHT_PES),
+            ('forward_advance', limb.LEFT_MANUS, limb.RIGHT_MANUS)
+        ]
+        for name, left_key, right_key in pairs:
+            advance = coupling_arrays.calculate_advance(
+                combined[name.split('_')[0]],
+                combined['fixed'][left_key],
+                combined['fixed'][right_key],
+                self.time_delta
+            )
+            out[name + '.index'] = advance[0] + combined['offset']
+            out[name + '.value'] = advance[1]
+            out[name + '.uncertainty'] = advance[2]
+
+        return out
+
+    def finish(self) -> dict:
+        """
+        Returns the coupling data for the accumulated windows, which contains
+        the lengths and statistics entries of the coupling data created by
+        the coupling_arrays.calculate function
+        """
+
+        indexes = np.concatenate(self.indexes)
+        cycles = np.concatenate(self.cycles)
+        values = np.concatenate(self.values)
+        uncertainties = np.concatenate(self.uncertainties)
+
+        lengths = coupling_arrays.to_events(
+            indexes,
+            dict(zip(indexes.tolist(), cycles)),
+            values,
+            uncertainties
+        )
+
+        return coupling_arrays.calculate_statistics(
+            lengths,
+            values,
+            uncertainties
+        )
+
+
+def join_windows(previous: typing.Union[dict, None], current: dict) -> dict:
+    """
+    Joins the coupler columns of the previous and current windows used by the
+    CouplingAccumulator into a single window
+    """
+
+    if previous is None:
+        return current
+
+    def join(a, b):
+        return tuple([np.concatenate([x, y]) for x, y in zip(a, b)])
+
+    return dict(
+        offset=previous['offset'],
+        cycles=np.concatenate([previous['cycles'], current['cycles']]),
+        rear=join(previous['rear'], current['rear']),
+        forward=join(previous['forward'], current['forward']),
+        fixed=dict([
+            (key, np.concatenate([value, current['fixed'][key]]))
+            for key, value in previous['fixed'].items()
+        ])
+    )
+
+
+def slice_window(window: dict, start: int) -> dict:
+    """
+    Returns the time steps of the window used by the CouplingAccumulator
+    from the start index onward, where a negative start counts from the end
+    """
+
+    count = len(window['cycles'])
+    start = max(0, count + start if start < 0 else start)
+
+    return dict(
+        offset=window['offset'] + start,
+        cycles=window['cycles'][start:],
+        rear=tuple([column[start:] for column in window['rear']]),
+        forward=tuple([column[start:] for column in window['forward']]),
+        fixed=dict([
+            (key, value[start:])
+            for key, value in window['fixed'].items()
+        ])
+    )
+
+
+class StrideAccumulator(object):
+    """
+    Accumulates the stride events of each limb over windows of foot
+    positions, producing the same events as the
+    advancement_calculate.strides function by carrying the last fixed
+    position of each limb from one window to the next
+    """
+
+    def __init__(self):
+        self.last_fixed = dict()
+        self.strides = dict([(key, []) for key in limb.KEYS])
+
+    def add(
+            self,
+            offset: int,
+            time_steps: np.ndarray,
+            foot_positions: limb.Property
+    ):
+        """
+        Adds the window of foot positions to the stride analysis
+
+        :param offset:
+            The index of the first time step of the window
+        :param time_steps:
+            The cycle times of the time steps in the window
+        :param foot_positions:
+            The foot positions of each limb within the window
+        """
+
+        for key, positions in foot_positions.items():
+            fixed = np.flatnonzero(coupling_arrays.fixed_mask(positions))
+
+            # Only fixed positions that differ from the fixed position before
+            # them can start a new stride
+            columns = np.array(uncertain.to_columns(positions))[:, fixed]
+            changed = np.ones(len(fixed), dtype=bool)
+            changed[1:] = np.any(columns[:, 1:] != columns[:, :-1], axis=0)
+
+            for index in fixed[changed].tolist():
+                p = positions[index]
+                last_fixed = self.last_fixed.get(key)
+
+                if last_fixed is None:
+                    self.last_fixed[key] = p
+                    continue
+
+                if not last_fixed.compare(p):
+                    self.strides[key].append(events.Event(
+                        time=time_steps[index],
+                        index=offset + index,
+                        value=last_fixed.distance_between(p)
+                    ))
+                    self.last_fixed[key] = p
+
+    def finish(self) -> dict:
+        """
+        Returns the advancement data for the accumulated windows
+        """
+
+        return dict([
+            ('{}_strides'.format(key), self.strides[key])
+            for key in limb.KEYS
+        ])
+
+
+def separation_columns(
+        foot_positions: limb.Property
+) -> typing.Dict[str, np.ndarray]:
+    """
+    Returns the columns of the separation lengths between pairs of feet for
+    a window of foot positions, which match the lengths calculated by the
+    separation_calculate.lengths function
+    """
+
+    out = dict()
+
+    for name, a, b in SEPARATION_PAIRS:
+        values, uncertainties = uncertain.distances(
+            uncertain.to_columns(foot_positions.get(a)),
+            uncertain.to_columns(foot_positions.get(b))
+        )
+        out[name + '.value'] = values
+        out[name + '.uncertainty'] = uncertainties
+
+    return out
+
+
+def position_columns(
+        foot_positions: limb.Property
+) -> typing.Dict[str, np.ndarray]:
+    """
+    Returns the value, uncertainty and annotation columns of the foot
+    positions of each limb for a window
+    """
+
+    out = dict()
+
+    for key, positions in foot_positions.items():
+        for name in ['x', 'y', 'x_uncertainty', 'y_uncertainty']:
+            out['{}.{}'.format(key, name)] = getattr(positions, name)
+        out['{}.annotation_code'.format(key)] = positions.annotation_code
+
+    return out
+
+
+def write_chunk(
+        directory: str,
+        index: int,
+        columns: typing.Dict[str, np.ndarray]
+) -> str:
+    """
+    Writes the columns of a window to a chunk file in the directory and
+    returns the filename of the chunk
+    """
+
+    filename = 'chunk-{:06d}.npz'.format(index)
+    np.savez(os.path.join(directory, filename), **columns)
+    return filename
+
+
+def read_chunks(
+        trial_id: str,
+        results_path: str = None
+) -> typing.Iterator[typing.Dict[str, np.ndarray]]:
+    """
+    Generates the columns of each chunk written by a streamed trial in order
+
+    :param trial_id:
+        The identifier of the streamed trial
+    :param results_path:
+        The results directory where the trial was written, which defaults to
+        the configured results directory
+    """
+
+    directory = os.path.join(
+        results_path or paths.results(),
+        'reports',
+        'trial',
+        trial_id
+    )
+
+    path = os.path.join(directory, '{}.json'.format(trial_id))
+    data = reader.read_fields(path, ['stream.chunks'])
+
+    for filename in data['stream']['chunks']:
+        with np.load(os.path.join(directory, CHUNK_FOLDER, filename)) as f:
+            yield dict(f.items())
+
+
+def run(
+        settings: dict,
+        trackway_definition: trackway.TrackwayDefinition
+) -> dict:
+    """
+    Simulates and analyzes the trial one window of time steps at a time and
+    writes the results to the trial's report directory. The results data file
+    contains the settings, a summary of the time steps, the pruned track
+    positions, the coupling lengths and statistics, the strides and the
+    filenames of the chunk files. Each chunk file holds the time steps, foot
+    positions, separation lengths and coupler advances for one window.
+    Returns a dictionary containing the url of the results data file and a
+    summary of the coupling data for the trial.
+
+    :param settings:
+        Configuration for the simulation trial, which must contain a
+        "stream_window" setting with the number of time steps in each window
+    :param trackway_definition:
+        The reoriented trackway positions and activity phases for the trial,
+        which are pruned and reoriented in place as they would be by the
+        simulate.simulate function
+    """
+
+    sim_id = settings['id']
+
+    start, end, used_uids = find_valid_window(settings, trackway_definition)
+
+    if end <= start:
+        system.log(
+            """
+            [{}]: INVALID RESULTS
+                There are no simulated results to analyze. Either the
+                simulation is not valid, or you have set a start and end time
+                that is not within the range of valid values. Please check your
+                settings file.
+            """.format(sim_id))
+        raise ValueError('Invalid Results')
+
+    # Positions are computed from the unpruned track positions, which the
+    # track indexes of the computed arrays refer to
+    source = trackway.TrackwayDefinition(
+        trackway.clone_positions(trackway_definition.limb_positions),
+        trackway_definition.activity_phases
+    )
+
+    orientation = None
+    if prune.unused_prints(trackway_definition.limb_positions, used_uids):
+        orientation = trackway_definition.get_orientation()
+        trackway_definition.reorient_positions()
+
+    directory = paths.results('reports', 'trial', sim_id)
+    chunk_directory = os.path.join(directory, CHUNK_FOLDER)
+    if os.path.exists(directory):
+        shutil.rmtree(directory)
+    os.makedirs(chunk_directory)
+
+    couplings = CouplingAccumulator()
+    strides = StrideAccumulator()
+    chunks = []
+    first_cycle = None
+    last_cycle = None
+
+    for offset, time_steps, foot_positions in position_windows(
+            settings,
+            source,
+            start,
+            end,
+            orientation
+    ):
+        columns = dict(cycles=time_steps)
+        columns.update(position_columns(foot_positions))
+        columns.update(separation_columns(foot_positions))
+        columns.update(couplings.add(offset, time_steps, foot_positions))
+        strides.add(offset, time_steps, foot_positions)
+
+        chunks.append(write_chunk(chunk_directory, len(chunks), columns))
+
+        if first_cycle is None:
+            first_cycle = float(time_steps[0])
+        last_cycle = float(time_steps[-1])
+
+    coupling_data = couplings.finish()
+    advancement_data = strides.finish()
+
+    track_data = dict()
+    for limb_id, positions in trackway_definition.limb_positions.items():
+        track_data[limb_id] = [x.to_dict() for x in positions]
+
+    path = os.path.join(directory, '{}.json'.format(sim_id))
+    reporting.write_json_results(path, dict(
+        settings=settings,
+        times=dict(
+            count=end - start,
+            window=[start, end],
+            start=first_cycle,
+            end=last_cycle,
+            steps_per_cycle=settings['steps_per_cycle']
+        ),
+        track_positions=track_data,
+        couplings=coupling.serialize(coupling_data),
+        advancement=advancement.serialize(advancement_data),
+        stream=dict(
+            window_size=get_window_size(settings),
+            chunks=chunks
+        )
+    ))
+
+    return dict(
+        url='file://{}'.format(path),
+        couplings=coupling.summarize(coupling_data)
+    )
@@ -0,0 +1,287 @@
+"""
+A cache of the reoriented trackway positions loaded from data files, which is
+shared by the trials of a group so that each data file is parsed and
+reoriented once per group run instead of once per trial. Entries are keyed
+by the absolute path, modification time and size of the data file, and so a
+file that changes while the group is running is loaded by its trials as
+usual. The positions are stored in read-only TrackPositionArray columns and
+each trial receives its own TrackPosition instances created from them.
+
+When the trials of a group are run in worker processes, the numeric columns
+of the cached positions are placed in shared memory blocks that the workers
+attach to instead of loading the data files themselves.
+"""
+
+import contextlib
+import os
+import typing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from tracksim import limb
+from tracksim import trackway
+from tracksim.trial import simulate
+
+# The TrackPositionArray columns that are stored in shared memory, all of
+# which are stored as floats
+NUMERIC_COLUMNS = [
+    'x',
+    'y',
+    'x_uncertainty',
+    'y_uncertainty',
+    'annotation_code',
+    'assumed'
+]
+
+# The shared positions of each data file by key within this process
+_entries = dict()
+
+# The shared memory blocks attached to by this process, which must remain
+# open while their positions are in use and are closed by the detach function
+_blocks = dict()
+
+
+def create_key(path: str) -> tuple:
+    """
+    Returns the cache key for the data file at the specified path
+
+    :param path:
+        The path to the trackway data file
+    """
+
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def freeze(positions: trackway.TrackPositionArray):
+    """
+    Makes the columns of the positions read-only so that a trial cannot
+    modify the shared positions in place
+    """
+
+    for key in trackway.TrackPositionArray.__slots__:
+        getattr(positions, key).flags.writeable = False
+    return positions
+
+
+def load_reoriented(path: str) -> typing.Union[limb.Property, None]:
+    """
+    Loads the positions within the data file and reorients them in the same
+    way as a trial does, returning a limb Property of read-only
+    TrackPositionArray instances or None if the positions cannot be
+    reoriented
+
+    :param path:
+        The path to the trackway data file
+    """
+
+    definition = trackway.TrackwayDefinition(
+        trackway.load_positions_file(path)
+    )
+
+    try:
+        definition.reorient_positions()
+    except (IndexError, TypeError, ZeroDivisionError):
+        # Trials that use the file raise the error themselves when loading it
+        return None
+
+    out = limb.Property()
+    for key, positions in definition.limb_positions.items():
+        out.set(key, freeze(trackway.TrackPositionArray.from_positions(
+            positions
+        )))
+    return out
+
+
+def find(settings: dict) -> typing.Union[limb.Property, None]:
+    """
+    Returns copies of the shared reoriented positions for the data file used
+    by the trial, or None if they are not shared within this process
+
+    :param settings:
+        Configuration for the simulation trial
+    """
+
+    path = simulate.get_data_path(settings)
+    if not path or not _entries:
+        return None
+
+    try:
+        entry = _entries.get(create_key(path))
+    except OSError:
+        return None
+
+    if entry is None:
+        return None
+
+    out = limb.Property()
+    for key, positions in entry.items():
+        out.set(key, positions.to_positions())
+    return out
+
+
+def export(
+        key: tuple,
+        positions: limb.Property
+) -> typing.Tuple[shared_memory.SharedMemory, dict]:
+    """
+    Copies the numeric columns of the positions into a new shared memory
+    block and returns the block along with a picklable descriptor that other
+    processes use to attach to it
+
+    :param key:
+        The cache key of the positions
+    :param positions:
+        A limb Property of TrackPositionArray instances
+    """
+
+    total = sum([len(p) for _, p in positions.items()])
+    block = shared_memory.SharedMemory(
+        create=True,
+        size=max(1, total * len(NUMERIC_COLUMNS) * 8)
+    )
+    data = np.ndarray(
+        (len(NUMERIC_COLUMNS), total),
+        dtype=float,
+        buffer=block.buf
+    )
+
+    limbs = []
+    offset = 0
+    for limb_key, array in positions.items():
+        count = len(array)
+        for index, column in enumerate(NUMERIC_COLUMNS):
+            data[index, offset:offset + count] = getattr(array, column)
+
+        limbs.append(dict(
+            key=limb_key,
+            offset=offset,
+            count=count,
+            uid=array.uid.tolist(),
+            name=array.name.tolist()
+        ))
+        offset += count
+
+    del data
+    return block, dict(key=key, block=block.name, total=total, limbs=limbs)
+
+
+def attach(descriptors: typing.List[dict]):
+    """
+    Attaches to the shared memory blocks described by the descriptors and
+    shares their positions with the trials run in this process
+
+    :param descriptors:
+        Descriptors returned by the export function in another process
+    """
+
+    # Blocks attached for an earlier group run are no longer needed
+    detach()
+
+    for descriptor in descriptors:
+        block = shared_memory.SharedMemory(name=descriptor['block'])
+        _blocks[descriptor['key']] = block
+
+        data = np.ndarray(
+            (len(NUMERIC_COLUMNS), descriptor['total']),
+            dtype=float,
+            buffer=block.buf
+        )
+        data.flags.writeable = False
+
+        positions = limb.Property()
+        for item in descriptor['limbs']:
+            columns = data[:, item['offset']:item['offset'] + item['count']]
+            uid = np.empty(item['count'], dtype=object)
+            uid[:] = item['uid']
+            name = np.empty(item['count'], dtype=object)
+            name[:] = item['name']
+
+            positions.set(item['key'], freeze(trackway.TrackPositionArray(
+                x=columns[0],
+                y=columns[1],
+                x_uncertainty=columns[2],
+                y_uncertainty=columns[3],
+                annotation_code=columns[4],
+                assumed=columns[5],
+                uid=uid,
+                name=name
+            )))
+
+        _entries[descriptor['key']] = positions
+
+
+def detach():
+    """
+    Removes the positions that this process attached to with the attach
+    function and closes their shared memory blocks. Worker processes call
+    this when they exit so that they do not keep the blocks of the group
+    run that started them mapped.
+    """
+
+    for key, block in list(_blocks.items()):
+        _entries.pop(key, None)
+        del _blocks[key]
+
+        try:
+            block.close()
+        except BufferError:
+            # Positions created from the block are still in use and the
+            # block is closed once they are garbage collected
+            pass
+
+
+@contextlib.contextmanager
+def share(trials_settings: typing.List[dict], export_blocks: bool = False):
+    """
+    A context within which the reoriented positions of each data file used
+    by the trials are loaded once and shared by the trials run in this
+    process. The context yields a list of descriptors for the shared memory
+    blocks holding the positions, which worker processes pass to the attach
+    function, and removes the shared positions and blocks when it exits.
+
+    :param trials_settings:
+        The loaded configuration for each trial of the group
+    :param export_blocks:
+        Whether or not to place the positions in shared memory blocks for
+        worker processes. If False, the yielded list is empty.
+    """
+
+    data_paths = []
+    for settings in trials_settings:
+        path = simulate.get_data_path(settings)
+        if path and os.path.exists(path) and path not in data_paths:
+            data_paths.append(path)
+
+    keys = []
+    blocks = []
+    descriptors = []
+
+    try:
+        for path in data_paths:
+            key = create_key(path)
+            if key in _entries:
+                continue
+
+            positions = load_reoriented(path)
+            if positions is None:
+                continue
+
+            _entries[key] = positions
+            keys.append(key)
+
+            if export_blocks:
+                block, descriptor = export(key, positions)
+                blocks.append(block)
+                descriptors.append(descriptor)
+
+        yield descriptors
+
+    finally:
+        for key in keys:
+            _entries.pop(key, None)
+
+        for block in blocks:
+            block.close()
+            block.unlink()
@@ -0,0 +1,728 @@
+"""
+Element-wise array versions of the ValueUncertainty and TrackPosition
+operations used by the analysis stages. Positions are represented by
+"columns", which are (x, y, x_uncertainty, y_uncertainty) tuples of arrays
+that hold the raw values and raw uncertainties of each position. The
+functions reproduce the rounding and special cases of the scalar operations
+so that their results match.
+
+The UncertainArray type wraps a pair of value and uncertainty arrays and
+supports the arithmetic of ValueUncertainty element-wise, so that analyses
+written in terms of ValueUncertainty can be moved onto arrays one at a time.
+"""
+
+import math
+import sys
+import typing
+
+import measurement_stats as mstats
+import numpy as np
+
+from tracksim import trackway
+
+# The tolerance used by mstats.value.equivalent when no epsilon is specified
+EPSILON = 100.0 * sys.float_info.epsilon
+
+# Values smaller than this magnitude are passed through unchanged when raised
+# to a power, matching ValueUncertainty.__pow__
+POWER_EPSILON = 1e-5
+
+
+def to_columns(
+        positions: typing.Union[trackway.TrackPositionArray, list]
+) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the x, y, x uncertainty and y uncertainty columns of the positions
+    as arrays, converting lists of TrackPosition instances if necessary
+
+    :param positions:
+        Either a TrackPositionArray or a list of TrackPosition instances
+    """
+
+    if not isinstance(positions, trackway.TrackPositionArray):
+        positions = trackway.TrackPositionArray.from_positions(positions)
+
+    return (
+        positions.x,
+        positions.y,
+        positions.x_uncertainty,
+        positions.y_uncertainty
+    )
+
+
+def powers_of_ten(exponents: np.ndarray) -> np.ndarray:
+    """
+    Computes 10 raised to each of the integer exponents with math.pow, which
+    is used by mstats when rounding and can differ in the last bit from the
+    numpy power function for some exponents
+
+    :param exponents:
+        Integer-valued exponents
+    """
+
+    unique, inverse = np.unique(exponents, return_inverse=True)
+    table = np.array([math.pow(10, int(e)) for e in unique], dtype=float)
+    return table[inverse].reshape(np.shape(exponents))
+
+
+def round_uncertainties(uncertainties: np.ndarray) -> np.ndarray:
+    """
+    Rounds each uncertainty to a single significant digit in the same way as
+    the uncertainty property of a ValueUncertainty
+
+    :param uncertainties:
+        The raw uncertainty values to round
+    """
+
+    uncertainties = np.abs(np.asarray(uncertainties, dtype=float))
+    out = np.zeros_like(uncertainties)
+    nonzero = uncertainties != 0
+
+    if not np.any(nonzero):
+        return out
+
+    values = uncertainties[nonzero]
+    power = 1 - np.ceil(np.log10(values))
+    magnitude = powers_of_ten(power)
+    out[nonzero] = np.round(values * magnitude) / magnitude
+    return out
+
+
+def least_significant_orders(values: np.ndarray) -> np.ndarray:
+    """
+    Computes the least significant order of each value in the same way as the
+    mstats.value.least_significant_order function, which is used to round a
+    value to the precision of its rounded uncertainty
+
+    :param values:
+        Rounded uncertainty values for which to find the order
+    """
+
+    values = np.asarray(values, dtype=float)
+    orders = np.zeros(values.shape, dtype=int)
+    integral = np.trunc(values) == values
+
+    # Integer values count their trailing zero orders
+    pending = np.flatnonzero(integral & (values != 0))
+    om = 0
+    while len(pending) and om < 10000:
+        om += 1
+        test = values[pending] * math.pow(10, -om)
+        done = np.trunc(test) != test
+        orders[pending[done]] = om - 1
+        pending = pending[~done]
+
+    # Fractional values find the first order at which they become integers
+    pending = np.flatnonzero(~integral)
+    om = 0
+    while len(pending) and om > -10000:
+        om -= 1
+        test = values[pending] * math.pow(10, -om)
+        done = np.abs(test - np.trunc(test)) < EPSILON
+        orders[pending[done]] = om
+        pending = pending[~done]
+
+    return orders
+
+
+def round_values(
+        values: np.ndarray,
+        uncertainties: np.ndarray
+) -> np.ndarray:
+    """
+    Rounds each value according to its uncertainty in the same way as the
+    value property of a ValueUncertainty
+
+    :param values:
+        The raw values to round
+    :param uncertainties:
+        The raw uncertainties of each of the values
+    """
+
+    values = np.asarray(values, dtype=float)
+    orders = least_significant_orders(round_uncertainties(uncertainties))
+    scale = powers_of_ten(orders)
+    return scale * np.round(values / scale)
+
+
+def power(
+        values: np.ndarray,
+        uncertainties: np.ndarray,
+        exponent: float
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Raises each value to the specified exponent and propagates the
+    uncertainties as ValueUncertainty.__pow__ does, including passing values
+    that are effectively zero through unchanged
+
+    :param values:
+        The raw values to raise to the exponent
+    :param uncertainties:
+        The raw uncertainties of each of the values
+    :param exponent:
+        The power to which each value is raised
+    """
+
+    small = np.abs(values) < POWER_EPSILON
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = values ** exponent
+        result_uncertainties = np.abs(
+            result * float(exponent) * uncertainties / values
+        )
+
+    return (
+        np.where(small, values, result),
+        np.where(small, uncertainties, result_uncertainties)
+    )
+
+
+def midpoints(
+        a: typing.Tuple[np.ndarray, ...],
+        b: typing.Tuple[np.ndarray, ...]
+) -> typing.Tuple[np.ndarray, ...]:
+    """
+    Computes the midpoints between two sets of position columns, which are
+    each (x, y, x_uncertainty, y_uncertainty) tuples of arrays, in the same
+    way as TrackPosition.midpoint_between
+
+    :param a:
+        The columns of the first positions
+    :param b:
+        The columns of the second positions
+    """
+
+    return (
+        0.5 * (a[0] + b[0]),
+        0.5 * (a[1] + b[1]),
+        0.5 * np.sqrt(a[2] ** 2 + b[2] ** 2),
+        0.5 * np.sqrt(a[3] ** 2 + b[3] ** 2)
+    )
+
+
+def distances(
+        a: typing.Tuple[np.ndarray, ...],
+        b: typing.Tuple[np.ndarray, ...]
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the distances and their uncertainties between two sets of
+    position columns in the same way as TrackPosition.distance_between, where
+    a holds the positions on which the method would be called
+
+    :param a:
+        The (x, y, x_uncertainty, y_uncertainty) columns of the positions
+        from which the distances are measured
+    :param b:
+        The (x, y, x_uncertainty, y_uncertainty) columns of the positions
+        to which the distances are measured
+    """
+
+    dx = b[0] - a[0]
+    dx_unc = np.sqrt(b[2] ** 2 + a[2] ** 2)
+    dy = b[1] - a[1]
+    dy_unc = np.sqrt(b[3] ** 2 + a[3] ** 2)
+
+    dx_zero = np.abs(round_values(dx, dx_unc)) < EPSILON
+    dy_zero = ~dx_zero & (np.abs(round_values(dy, dy_unc)) < EPSILON)
+    axis_uncertainties = np.sqrt(dx_unc ** 2 + dy_unc ** 2)
+
+    dx2, dx2_unc = power(dx, dx_unc, 2)
+    dy2, dy2_unc = power(dy, dy_unc, 2)
+    values, uncertainties = power(
+        dx2 + dy2,
+        np.sqrt(dx2_unc ** 2 + dy2_unc ** 2),
+        0.5
+    )
+
+    values = np.where(
+        dx_zero,
+        np.abs(dy),
+        np.where(dy_zero, np.abs(dx), values)
+    )
+    uncertainties = np.where(
+        dx_zero | dy_zero,
+        axis_uncertainties,
+        uncertainties
+    )
+
+    return values, uncertainties
+
+
+def rotate(
+        columns: typing.Tuple[np.ndarray, ...],
+        angle: float,
+        pivot: typing.Tuple[np.ndarray, ...]
+) -> typing.Tuple[np.ndarray, ...]:
+    """
+    Rotates each position by the specified angle about the corresponding pivot
+    position in the same way as TrackPosition.rotate, where the uncertainty of
+    the pivot is propagated into the rotated result
+
+    :param columns:
+        The (x, y, x_uncertainty, y_uncertainty) columns of the positions
+    :param angle:
+        An angle (in radians) about which each position should be rotated
+    :param pivot:
+        The (x, y, x_uncertainty, y_uncertainty) columns of the pivot
+        positions about which each position is rotated
+    """
+
+    x = columns[0] - pivot[0]
+    y = columns[1] - pivot[1]
+
+    return (
+        x * math.cos(angle) - y * math.sin(angle) + pivot[0],
+        y * math.cos(angle) + x * math.sin(angle) + pivot[1],
+        np.sqrt(columns[2] * columns[2] + pivot[2] * pivot[2]),
+        np.sqrt(columns[3] * columns[3] + pivot[3] * pivot[3])
+    )
+
+
+
+class UncertainArray(object):
+    """
+    An array of values with uncertainties that supports the arithmetic of
+    ValueUncertainty element-wise, propagating the raw uncertainties with
+    the same first-order rules. Operands can be other UncertainArrays of the
+    same or a broadcastable shape, ValueUncertainty instances, which apply to
+    every element, or numbers and numeric arrays without uncertainty.
+    ValueUncertainty operands must appear on the right-hand side of an
+    operation, since ValueUncertainty does not defer unsupported operands.
+    """
+
+    # Prevents numpy arrays on the left-hand side of an operation from
+    # treating the instance as an element and defers to its operators instead
+    __array_ufunc__ = None
+
+    def __init__(
+            self,
+            values: typing.Union[np.ndarray, list, float] = 0.0,
+            uncertainties: typing.Union[np.ndarray, list, float] = 0.0
+    ):
+        """
+        :param values:
+            The raw values of the array
+        :param uncertainties:
+            The raw uncertainties of each of the values, or a single
+            uncertainty that applies to all of them
+        """
+
+        values = np.asarray(values, dtype=float)
+        self.raw = values
+        self.raw_uncertainty = np.abs(np.broadcast_to(
+            np.asarray(uncertainties, dtype=float),
+            values.shape
+        )).copy()
+
+    @classmethod
+    def from_values(
+            cls,
+            values: typing.Iterable[mstats.ValueUncertainty]
+    ) -> 'UncertainArray':
+        """
+        Creates an array from the raw values and uncertainties of the
+        ValueUncertainty instances
+
+        :param values:
+            The ValueUncertainty instances to convert
+        """
+
+        values = list(values)
+        return cls(
+            [v.raw for v in values],
+            [v.raw_uncertainty for v in values]
+        )
+
+    @classmethod
+    def from_serialized(
+            cls,
+            serialized: typing.List[dict]
+    ) -> 'UncertainArray':
+        """
+        Creates an array from serialized ValueUncertainty dictionaries, which
+        must contain raw and raw_uncertainty entries
+
+        :param serialized:
+            The serialized values to convert
+        """
+
+        return cls(
+            [s['raw'] for s in serialized],
+            [s['raw_uncertainty'] for s in serialized]
+        )
+
+    @property
+    def value(self) -> np.ndarray:
+        """
+        The values rounded according to their uncertainties in the same way
+        as the value property of a ValueUncertainty
+        """
+
+        return round_values(self.raw, self.raw_uncertainty)
+
+    @property
+    def uncertainty(self) -> np.ndarray:
+        """
+        The uncertainties rounded to a single significant digit in the same
+        way as the uncertainty property of a ValueUncertainty
+        """
+
+        return round_uncertainties(self.raw_uncertainty)
+
+    @property
+    def shape(self) -> tuple:
+        return self.raw.shape
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        values = self.raw[index]
+        uncertainties = self.raw_uncertainty[index]
+
+        if np.ndim(values) == 0:
+            return mstats.ValueUncertainty(
+                float(values),
+                float(uncertainties)
+            )
+        return UncertainArray(values, uncertainties)
+
+    def to_values(self) -> typing.List[mstats.ValueUncertainty]:
+        """
+        Returns the elements of a one-dimensional array as a list of
+        ValueUncertainty instances
+        """
+
+        return [
+            mstats.ValueUncertainty(value, uncertainty)
+            for value, uncertainty in zip(
+                self.raw.tolist(),
+                self.raw_uncertainty.tolist()
+            )
+        ]
+
+    def clone(self) -> 'UncertainArray':
+        return UncertainArray(self.raw.copy(), self.raw_uncertainty.copy())
+
+    def __repr__(self):
+        return '<{} {} +/- {}>'.format(
+            self.__class__.__name__,
+            self.value,
+            self.uncertainty
+        )
+
+    def __add__(self, other):
+        values, uncertainties = split_operand(other)
+        if uncertainties is None:
+            return UncertainArray(self.raw + values, self.raw_uncertainty)
+
+        return UncertainArray(
+            self.raw + values,
+            np.sqrt(self.raw_uncertainty ** 2 + uncertainties ** 2)
+        )
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        values, uncertainties = split_operand(other)
+        if uncertainties is None:
+            return UncertainArray(self.raw - values, self.raw_uncertainty)
+
+        return UncertainArray(
+            self.raw - values,
+            np.sqrt(self.raw_uncertainty ** 2 + uncertainties ** 2)
+        )
+
+    def __rsub__(self, other):
+        values, uncertainties = split_operand(other)
+        if uncertainties is None:
+            return UncertainArray(values - self.raw, self.raw_uncertainty)
+
+        return UncertainArray(
+            values - self.raw,
+            np.sqrt(self.raw_uncertainty ** 2 + uncertainties ** 2)
+        )
+
+    def __neg__(self):
+        return UncertainArray(-self.raw, self.raw_uncertainty)
+
+    def __abs__(self):
+        return UncertainArray(np.abs(self.raw), self.raw_uncertainty)
+
+    def __mul__(self, other):
+        values, uncertainties = split_operand(other)
+        if uncertainties is None:
+            return UncertainArray(
+                values * self.raw,
+                np.abs(values * self.raw_uncertainty)
+            )
+
+        result = self.raw * values
+        combined = np.sqrt(self.raw_uncertainty ** 2 + uncertainties ** 2)
+
+        # A zero factor has no relative uncertainty, in which case
+        # ValueUncertainty falls back to combining the absolute uncertainties
+        zero = (self.raw == 0) | (values == 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relative = np.abs(result) * np.sqrt(
+                (self.raw_uncertainty / self.raw) ** 2 +
+                (uncertainties / values) ** 2
+            )
+
+        return UncertainArray(
+            np.where(zero, 0.0, result),
+            np.where(zero, combined, relative)
+        )
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        values, uncertainties = split_operand(other)
+        if uncertainties is None:
+            if np.any(np.asarray(values) == 0):
+                raise ZeroDivisionError('float division by zero')
+            return UncertainArray(
+                self.raw / values,
+                np.abs(self.raw_uncertainty / values)
+            )
+
+        numerator_zero = np.abs(self.raw) < 1e-6
+        if np.any((values == 0) & ~numerator_zero):
+            raise ZeroDivisionError('float division by zero')
+
+        zero = (self.raw == 0) | (values == 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = self.raw / values
+            relative = np.abs(result) * np.sqrt(
+                (self.raw_uncertainty / self.raw) ** 2 +
+                (uncertainties / values) ** 2
+            )
+
+        return UncertainArray(
+            np.where(zero, 0.0, result),
+            np.where(
+                zero,
+                np.sqrt(self.raw_uncertainty ** 2 + uncertainties ** 2),
+                relative
+            )
+        )
+
+    def __rtruediv__(self, other):
+        # Unlike ValueUncertainty.__rtruediv__, which divides the operands in
+        # the reverse order, this divides the number by the array
+        values, _ = split_operand(other)
+        if np.any(self.raw == 0):
+            raise ZeroDivisionError('float division by zero')
+
+        result = values / self.raw
+        return UncertainArray(
+            result,
+            np.abs(result * self.raw_uncertainty / self.raw)
+        )
+
+    def __pow__(self, exponent: float, modulo=None):
+        return UncertainArray(*power(
+            self.raw,
+            self.raw_uncertainty,
+            exponent
+        ))
+
+    def sqrt(self) -> 'UncertainArray':
+        return self ** 0.5
+
+    def sum(self) -> mstats.ValueUncertainty:
+        """
+        Returns the sum of all of the elements, with the uncertainties
+        combined in quadrature as repeated addition would
+        """
+
+        return mstats.ValueUncertainty(
+            float(np.sum(self.raw)),
+            float(np.sqrt(np.sum(self.raw_uncertainty ** 2)))
+        )
+
+    def min(self) -> mstats.ValueUncertainty:
+        """
+        Returns the element with the smallest value, choosing the one with
+        the smallest uncertainty among equal values, in the same way as
+        mstats.values.minimum
+        """
+
+        values = self.value.reshape(-1)
+        uncertainties = self.uncertainty.reshape(-1)
+        candidates = np.flatnonzero(values == np.min(values))
+        best = candidates[uncertainties[candidates] == np.min(
+            uncertainties[candidates]
+        )]
+        return self.reshape(-1)[int(best[0])]
+
+    def max(self) -> mstats.ValueUncertainty:
+        """
+        Returns the element with the largest value, choosing the one with
+        the smallest uncertainty among equal values, in the same way as
+        mstats.values.maximum
+        """
+
+        values = self.value.reshape(-1)
+        uncertainties = self.uncertainty.reshape(-1)
+        candidates = np.flatnonzero(values == np.max(values))
+        best = candidates[uncertainties[candidates] == np.min(
+            uncertainties[candidates]
+        )]
+        return self.reshape(-1)[int(best[-1])]
+
+    def reshape(self, *shape) -> 'UncertainArray':
+        return UncertainArray(
+            self.raw.reshape(*shape),
+            self.raw_uncertainty.reshape(*shape)
+        )
+
+
+def split_operand(
+        other: typing.Any
+) -> typing.Tuple[np.ndarray, typing.Union[np.ndarray, None]]:
+    """
+    Returns the raw values and raw uncertainties of an operand, where the
+    uncertainties are None if the operand is a number or numeric array that
+    has no uncertainty
+
+    :param other:
+        An UncertainArray, ValueUncertainty, number or numeric array
+    """
+
+    if hasattr(other, 'raw') and hasattr(other, 'raw_uncertainty'):
+        return (
+            np.asarray(other.raw, dtype=float),
+            np.asarray(other.raw_uncertainty, dtype=float)
+        )
+    return np.asarray(other, dtype=float), None
+
+
+def to_array(
+        value: typing.Union[UncertainArray, mstats.ValueUncertainty]
+) -> UncertainArray:
+    """
+    Returns the value as an UncertainArray, converting a ValueUncertainty
+    into a zero-dimensional array
+
+    :param value:
+        An UncertainArray or ValueUncertainty
+    """
+
+    if isinstance(value, UncertainArray):
+        return value
+    return UncertainArray(value.raw, value.raw_uncertainty)
+
+
+def sqrt(value: UncertainArray) -> UncertainArray:
+    """
+    Returns the square root of each element, propagating the uncertainties
+    as ValueUncertainty raised to the power of 0.5 does
+    """
+
+    return to_array(value) ** 0.5
+
+
+def hypot(a: UncertainArray, b: UncertainArray) -> UncertainArray:
+    """
+    Returns the square root of the sum of the squares of the elements of the
+    two arrays, propagating the uncertainties of each operation
+
+    :param a:
+        The first array of side lengths
+    :param b:
+        The second array of side lengths
+    """
+
+    return (to_array(a) ** 2 + to_array(b) ** 2) ** 0.5
+
+
+def distance(
+        x_a: UncertainArray,
+        y_a: UncertainArray,
+        x_b: UncertainArray,
+        y_b: UncertainArray
+) -> UncertainArray:
+    """
+    Returns the distances between the points a and the points b in the same
+    way as TrackPosition.distance_between, where a holds the positions on
+    which the method would be called
+
+    :param x_a:
+        The x coordinates of the points from which the distances are measured
+    :param y_a:
+        The y coordinates of the points from which the distances are measured
+    :param x_b:
+        The x coordinates of the points to which the distances are measured
+    :param y_b:
+        The y coordinates of the points to which the distances are measured
+    """
+
+    x_a, y_a, x_b, y_b = [to_array(v) for v in (x_a, y_a, x_b, y_b)]
+    shape = np.broadcast(x_a.raw, y_a.raw, x_b.raw, y_b.raw).shape
+
+    def columns(x: UncertainArray, y: UncertainArray) -> tuple:
+        return tuple(
+            np.broadcast_to(c, shape).reshape(-1)
+            for c in (x.raw, y.raw, x.raw_uncertainty, y.raw_uncertainty)
+        )
+
+    values, uncertainties = distances(columns(x_a, y_a), columns(x_b, y_b))
+    return UncertainArray(
+        values.reshape(shape),
+        uncertainties.reshape(shape)
+    )
+
+
+def minimum(a: UncertainArray, b: UncertainArray) -> UncertainArray:
+    """
+    Returns the smaller element of each pair, choosing the one with the
+    larger uncertainty among equal values, in the same way as
+    mstats.value.minimum
+
+    :param a:
+        The first array of values
+    :param b:
+        The second array of values
+    """
+
+    a = to_array(a)
+    b = to_array(b)
+    value_a, value_b = a.value, b.value
+    use_b = (value_b < value_a) | (
+        (value_a == value_b) & (b.uncertainty > a.uncertainty)
+    )
+    return UncertainArray(
+        np.where(use_b, b.raw, a.raw),
+        np.where(use_b, b.raw_uncertainty, a.raw_uncertainty)
+    )
+
+
+def maximum(a: UncertainArray, b: UncertainArray) -> UncertainArray:
+    """
+    Returns the larger element of each pair, choosing the one with the
+    larger uncertainty among equal values, in the same way as
+    mstats.value.maximum
+
+    :param a:
+        The first array of values
+    :param b:
+        The second array of values
+    """
+
+    a = to_array(a)
+    b = to_array(b)
+    value_a, value_b = a.value, b.value
+    use_b = (value_b > value_a) | (
+        (value_a == value_b) & (b.uncertainty > a.uncertainty)
+    )
+    return UncertainArray(
+        np.where(use_b, b.raw, a.raw),
+        np.where(use_b, b.raw_uncertainty, a.raw_uncertainty)
+    )